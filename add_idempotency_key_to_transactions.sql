@@ -0,0 +1,4 @@
+-- Add idempotency keys to transactions so retried credit batches are not charged twice
+ALTER TABLE transactions 
+ADD COLUMN idempotency_key varchar(100) DEFAULT NULL COMMENT 'Unique key of the charge within its job batch',
+ADD UNIQUE KEY `uniq_idempotency_key` (`idempotency_key`);
@@ -74,6 +74,17 @@ from components.Space import Space
 from components.Ad import Ad
 from components.LoggingCursor import wrap_cursor
 from components.Affiliate import Affiliate
+from components.SearchIndex import search_index, update_transcript_index
+from components.KeywordIndex import update_keyword_index
+from components.TranslationMemory import translation_memory
+from components.AIGateway import ai_gateway
+from components.SummaryJobs import summary_jobs
+from components.TranslationQueue import PRIORITY_NORMAL, PRIORITY_PAID, translation_queue
+from components.AssetPipeline import asset_pipeline, IMMUTABLE_CACHE_CONTROL
+from components.TranscriptionQueue import transcription_queue
+from components.StreamingTranscriber import load_live_transcript
+from components.PricingRegistry import pricing_registry
+from components.CreditLedger import credit_ledger
 # Import SpeechToText component if available
 try:
     from components.SpeechToText import SpeechToText
@@ -106,6 +117,8 @@ except ImportError:
     logger = logging.getLogger('webapp')
 
 # Import SQLLogger and SystemStatus components
+from components.LogReader import log_reader
+
 try:
     from components.SQLLogger import sql_logger
     SQL_LOGGER_AVAILABLE = True
@@ -142,6 +155,34 @@ __version__ = "1.1.1"
 app = Flask(__name__, static_folder='static', static_url_path='/static')
 CORS(app)
 
+# Build fingerprinted static bundles (no-op when static/dist is up to date)
+try:
+    asset_pipeline.build()
+except Exception as e:
+    logger.warning(f"Could not build static assets, serving sources instead: {e}")
+
+@app.context_processor
+def inject_asset_helpers():
+    """Expose asset_url() so templates can reference fingerprinted bundles."""
+    def asset_url(name):
+        return url_for('static', filename=asset_pipeline.url_path(name))
+    return {'asset_url': asset_url}
+
+@app.route('/static/dist/<path:filename>')
+def serve_built_asset(filename):
+    """Serve a fingerprinted asset, preferring a precompressed variant, with a one-year immutable cache."""
+    path, encoding = asset_pipeline.resolve_precompressed(filename, request.headers.get('Accept-Encoding', ''))
+    if path is None:
+        return jsonify({'error': 'Not found'}), 404
+    
+    mimetype = 'text/css' if filename.endswith('.css') else 'application/javascript'
+    response = send_file(str(path), mimetype=mimetype, conditional=True)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    return response
+
 # Add context processor to inject user info into all templates
 @app.context_processor
 def inject_user_info():
@@ -154,6 +195,12 @@ def inject_user_info():
         }
     
     if session.get('user_id'):
+        # Email is kept in the session at login; the balance comes from the ledger's short-lived cache
+        if session.get('user_email'):
+            return {
+                'user_email': session['user_email'],
+                'user_credits': credit_ledger.get_balance(session['user_id'])
+            }
         try:
             space = get_space_component()
             if not space:
@@ -239,47 +286,36 @@ index_cache = {
     'ttl': 600  # 600 seconds (10 minutes)
 }
 
-def invalidate_spaces_cache():
-    """Invalidate the spaces cache."""
-    global spaces_cache
-    spaces_cache['data'] = None
-    spaces_cache['timestamp'] = 0
-    logger.info("Spaces cache invalidated")
+# Per-section cache for the space page bootstrap endpoint; invalidations are
+# shared with the other worker processes (see components/BootstrapCache.py).
+from components.BootstrapCache import bootstrap_cache
 
-def trigger_cache_invalidation():
-    """Create a trigger file to signal cache invalidation from background processes."""
-    try:
-        trigger_file = Path('./temp/cache_invalidate.trigger')
-        trigger_file.parent.mkdir(exist_ok=True)
-        trigger_file.touch()
-        logger.info("Created cache invalidation trigger file")
-    except Exception as e:
-        logger.warning(f"Could not create cache invalidation trigger: {e}")
 
-def check_cache_invalidation_trigger():
-    """Check if background processes have signaled cache invalidation."""
-    trigger_file = Path('./temp/cache_invalidate.trigger')
-    if trigger_file.exists():
-        try:
-            invalidate_spaces_cache()
-            trigger_file.unlink()  # Remove the trigger file
-            logger.info("Processed cache invalidation trigger from background process")
-            return True
-        except Exception as e:
-            logger.warning(f"Error processing cache invalidation trigger: {e}")
-    return False
+def invalidate_bootstrap_cache(space_id=None, *sections):
+    """
+    Invalidate bootstrap cache entries in every worker process.
 
-def invalidate_index_cache():
-    """Invalidate the index cache."""
-    global index_cache
-    index_cache['data'] = None
-    index_cache['timestamp'] = 0
-    logger.info("Index cache invalidated")
+    With no arguments every entry is dropped. With a space_id only that
+    space's entries are dropped, optionally limited to the given sections.
+    """
+    bootstrap_cache.invalidate(space_id, *sections)
+
+def get_bootstrap_section(space_id, section, loader):
+    """
+    Return a cached bootstrap section, calling loader() on a miss.
+
+    Args:
+        space_id (str): The space ID
+        section (str): Section name used in the cache key
+        loader (callable): Builds the section value when not cached
+    """
+    return bootstrap_cache.get(space_id, section, loader)
 
 def invalidate_all_caches():
     """Invalidate all caches."""
     invalidate_spaces_cache()
     invalidate_index_cache()
+    invalidate_bootstrap_cache()
 
 def get_cached_spaces_data():
     """Get cached spaces data if valid, otherwise return None."""
@@ -852,109 +888,92 @@ def view_queue():
             Path('/var/www/production/xspacedownload.com/website/htdocs/transcript_jobs')  # New location
         ]
         
-        for transcript_jobs_dir in transcript_jobs_dirs:
-            if not transcript_jobs_dir.exists():
-                continue
-                
-            for job_file in transcript_jobs_dir.glob('*.json'):
-                try:
-                    with open(job_file, 'r') as f:
-                        job_data = json.load(f)
-                        # Only include pending, in_progress, or processing transcription jobs
-                        if job_data.get('status') in ['pending', 'in_progress', 'processing']:
-                            # Get space details for title
-                            space_details = space.get_space(job_data.get('space_id'))
-                            if space_details:
-                                job_data['title'] = space_details.get('title', f"Space {job_data.get('space_id')}")
-                            else:
-                                job_data['title'] = f"Space {job_data.get('space_id')}"
-                            
-                            if job_data.get('status') == 'pending':
-                                job_data['status_label'] = 'Pending Transcription'
-                                job_data['status_class'] = 'warning'
-                            elif job_data.get('status') == 'processing':
-                                job_data['status_label'] = 'Processing'
-                                job_data['status_class'] = 'info'
-                                job_data['progress_percent'] = job_data.get('progress', 0)
+        try:
+            for job_data in transcription_queue.list_jobs(statuses=['pending', 'processing'], limit=500):
+                job_data.setdefault('id', job_data['job_id'])
+                # Get space details for title
+                space_details = space.get_space(job_data.get('space_id'))
+                if space_details:
+                    job_data['title'] = space_details.get('title', f"Space {job_data.get('space_id')}")
+                else:
+                    job_data['title'] = f"Space {job_data.get('space_id')}"
+
+                if job_data.get('status') == 'pending':
+                    job_data['status_label'] = 'Pending Transcription'
+                    job_data['status_class'] = 'warning'
+                elif job_data.get('status') == 'processing':
+                    job_data['status_label'] = 'Processing'
+                    job_data['status_class'] = 'info'
+                    job_data['progress_percent'] = job_data.get('progress', 0)
+                else:
+                    job_data['status_label'] = 'Transcribing'
+                    job_data['status_class'] = 'success'
+                    job_data['progress_percent'] = job_data.get('progress', 0)
+
+                # Check if this is a translation job
+                if job_data.get('translate_to') or (job_data.get('options', {}).get('translate_to')):
+                    target_lang = job_data.get('translate_to') or job_data.get('options', {}).get('translate_to')
+                    job_data['is_translation'] = True
+                    job_data['target_language'] = target_lang
+                    if job_data.get('status') == 'pending':
+                        job_data['status_label'] = 'Pending Translation'
+                    elif job_data.get('status') == 'processing':
+                        job_data['status_label'] = f'Translating to {target_lang}'
+
+                # Calculate ETA for transcription/translation jobs
+                if job_data.get('status') == 'processing' and job_data.get('progress', 0) > 0:
+                    result = job_data.get('result') or {}
+                    if result.get('processing_elapsed_seconds') and result.get('estimated_audio_minutes'):
+                        elapsed_seconds = result['processing_elapsed_seconds']
+                        progress = job_data.get('progress', 0)
+
+                        # Calculate remaining time based on current progress
+                        if progress > 0:
+                            total_estimated_seconds = (elapsed_seconds / progress) * 100
+                            remaining_seconds = total_estimated_seconds - elapsed_seconds
+
+                            # Convert to human-readable format
+                            if remaining_seconds > 0:
+                                minutes = int(remaining_seconds // 60)
+                                seconds = int(remaining_seconds % 60)
+                                if minutes > 0:
+                                    job_data['eta'] = f"{minutes}m {seconds}s"
+                                else:
+                                    job_data['eta'] = f"{seconds}s"
                             else:
-                                job_data['status_label'] = 'Transcribing'
-                                job_data['status_class'] = 'success'
-                                job_data['progress_percent'] = job_data.get('progress', 0)
-                            
-                            # Check if this is a translation job
-                            if job_data.get('translate_to') or (job_data.get('options', {}).get('translate_to')):
-                                target_lang = job_data.get('translate_to') or job_data.get('options', {}).get('translate_to')
-                                job_data['is_translation'] = True
-                                job_data['target_language'] = target_lang
-                                if job_data.get('status') == 'pending':
-                                    job_data['status_label'] = 'Pending Translation'
-                                elif job_data.get('status') == 'processing':
-                                    job_data['status_label'] = f'Translating to {target_lang}'
-                            
-                            # Calculate ETA for transcription/translation jobs
-                            if job_data.get('status') == 'processing' and job_data.get('progress', 0) > 0:
-                                result = job_data.get('result', {})
-                                if result.get('processing_elapsed_seconds') and result.get('estimated_audio_minutes'):
-                                    elapsed_seconds = result['processing_elapsed_seconds']
-                                    progress = job_data.get('progress', 0)
-                                    
-                                    # Calculate remaining time based on current progress
-                                    if progress > 0:
-                                        total_estimated_seconds = (elapsed_seconds / progress) * 100
-                                        remaining_seconds = total_estimated_seconds - elapsed_seconds
-                                        
-                                        # Convert to human-readable format
-                                        if remaining_seconds > 0:
-                                            minutes = int(remaining_seconds // 60)
-                                            seconds = int(remaining_seconds % 60)
-                                            if minutes > 0:
-                                                job_data['eta'] = f"{minutes}m {seconds}s"
-                                            else:
-                                                job_data['eta'] = f"{seconds}s"
-                                        else:
-                                            job_data['eta'] = "Almost done"
-                            
-                            transcript_jobs.append(job_data)
-                except Exception as e:
-                    logger.error(f"Error reading transcript job file {job_file}: {e}")
+                                job_data['eta'] = "Almost done"
+
+                transcript_jobs.append(job_data)
+        except Exception as e:
+            logger.error(f"Error reading transcription jobs: {e}")
         
         # Sort transcript jobs by created_at
         transcript_jobs.sort(key=lambda x: x.get('created_at', ''))
         
-        # Also get standalone translation jobs from translation_jobs directory
-        translation_jobs_dir = Path('/var/www/production/xspacedownload.com/website/htdocs/translation_jobs')
-        if translation_jobs_dir.exists():
-            for job_file in translation_jobs_dir.glob('*.json'):
-                try:
-                    with open(job_file, 'r') as f:
-                        job_data = json.load(f)
-                        # Only include pending, in_progress, or processing translation jobs
-                        if job_data.get('status') in ['pending', 'in_progress', 'processing']:
-                            # Get space details for title
-                            space_details = space.get_space(job_data.get('space_id'))
-                            if space_details:
-                                job_data['title'] = space_details.get('title', f"Space {job_data.get('space_id')}")
-                            else:
-                                job_data['title'] = f"Space {job_data.get('space_id')}"
-                            
-                            job_data['is_translation'] = True
-                            job_data['target_language'] = job_data.get('target_lang')
-                            
-                            if job_data.get('status') == 'pending':
-                                job_data['status_label'] = 'Pending Translation'
-                                job_data['status_class'] = 'warning'
-                            elif job_data.get('status') == 'processing':
-                                job_data['status_label'] = f'Translating to {job_data.get("target_lang")}'
-                                job_data['status_class'] = 'info'
-                                job_data['progress_percent'] = job_data.get('progress', 0)
-                            else:
-                                job_data['status_label'] = 'Translating'
-                                job_data['status_class'] = 'success'
-                                job_data['progress_percent'] = job_data.get('progress', 0)
-                            
-                            transcript_jobs.append(job_data)
-                except Exception as e:
-                    logger.error(f"Error reading translation job file {job_file}: {e}")
+        # Also get standalone translation jobs from the translation job table
+        try:
+            for job_data in translation_queue.list_jobs():
+                # Get space details for title
+                space_details = space.get_space(job_data.get('space_id'))
+                if space_details:
+                    job_data['title'] = space_details.get('title', f"Space {job_data.get('space_id')}")
+                else:
+                    job_data['title'] = f"Space {job_data.get('space_id')}"
+                
+                job_data['is_translation'] = True
+                job_data['target_language'] = job_data.get('target_lang')
+                
+                if job_data.get('status') == 'pending':
+                    job_data['status_label'] = 'Pending Translation'
+                    job_data['status_class'] = 'warning'
+                else:
+                    job_data['status_label'] = 'Translating'
+                    job_data['status_class'] = 'success'
+                    job_data['progress_percent'] = job_data.get('progress', 0)
+                
+                transcript_jobs.append(job_data)
+        except Exception as e:
+            logger.error(f"Error reading translation jobs: {e}")
         
         # Separate transcription and translation jobs  
         transcription_only_jobs = [job for job in transcript_jobs if not job.get('is_translation')]
@@ -1786,8 +1805,8 @@ def get_space_clips(space_id):
     """Get all clips for a space."""
     try:
         space = get_space_component()
-        clips = space.list_clips(space_id)
-        return jsonify({'success': True, 'clips': clips})
+        payload, status_code = build_clips_payload(space, space_id)
+        return jsonify(payload), status_code
     except Exception as e:
         logger.error(f"Error getting clips: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -1887,6 +1906,8 @@ def create_space_clip(space_id):
                 pass
             return jsonify({'success': False, 'error': 'Failed to save clip'}), 500
         
+        invalidate_bootstrap_cache(space_id, 'clips')
+        
         return jsonify({
             'success': True,
             'clip_id': clip_id,
@@ -1941,6 +1962,8 @@ def delete_clip(clip_id):
         if not result['success']:
             return jsonify(result), 404
         
+        invalidate_bootstrap_cache(result.get('space_id'), 'clips')
+        
         # Delete the physical file
         if result.get('filename'):
             download_dir = app.config['DOWNLOAD_DIR']
@@ -2190,6 +2213,329 @@ def get_country_code(ip):
         logger.error(f"Failed to get country code for IP {ip}: {e}", exc_info=True)
         return None
 
+# Payload builders shared by the individual space page APIs and the bootstrap endpoint.
+# Each returns a (payload, status_code) tuple so both paths produce identical responses.
+
+def build_available_formats_payload(space_id):
+    """Build the available download formats payload for a space."""
+    download_dir = app.config['DOWNLOAD_DIR']
+    available_formats = []
+
+    # Check for different file formats
+    formats_to_check = {
+        'mp3': {'type': 'audio', 'name': 'MP3 Audio', 'icon': 'bi-music-note'},
+        'm4a': {'type': 'audio', 'name': 'M4A Audio', 'icon': 'bi-music-note'},
+        'wav': {'type': 'audio', 'name': 'WAV Audio', 'icon': 'bi-music-note'},
+        'mp4': {'type': 'video', 'name': 'MP4 Video', 'icon': 'bi-camera-video'}
+    }
+
+    for ext, format_info in formats_to_check.items():
+        file_path = os.path.join(download_dir, f"{space_id}.{ext}")
+        if os.path.exists(file_path) and os.path.getsize(file_path) > 1024*1024:  # > 1MB
+            file_size = os.path.getsize(file_path)
+            available_formats.append({
+                'format': ext,
+                'type': format_info['type'],
+                'name': format_info['name'],
+                'icon': format_info['icon'],
+                'size': file_size,
+                'size_formatted': format_file_size(file_size)
+            })
+
+    return {
+        'success': True,
+        'formats': available_formats
+    }, 200
+
+def build_transcripts_payload(space, space_id, language=None):
+    """Build the transcripts payload for a space, optionally for one language."""
+    if language:
+        # Get specific language transcript
+        cursor = space.connection.cursor(dictionary=True)
+        query = "SELECT * FROM space_transcripts WHERE space_id = %s AND language = %s"
+        cursor.execute(query, (space_id, language))
+        transcripts = cursor.fetchall()
+        cursor.close()
+    else:
+        # Get all transcripts for the space
+        transcripts = space.get_transcripts_for_space(space_id)
+
+    # Convert datetime objects to strings for JSON serialization
+    safe_transcripts = []
+    for transcript in transcripts:
+        safe_transcript = {}
+        for key, value in transcript.items():
+            if hasattr(value, 'isoformat'):
+                safe_transcript[key] = value.isoformat()
+            else:
+                safe_transcript[key] = value
+        safe_transcripts.append(safe_transcript)
+
+    return {
+        'space_id': space_id,
+        'transcripts': safe_transcripts,
+        'count': len(safe_transcripts)
+    }, 200
+
+def build_clips_payload(space, space_id):
+    """Build the clips payload for a space."""
+    clips = space.list_clips(space_id)
+    return {'success': True, 'clips': clips}, 200
+
+def build_metadata_payload(space, space_id):
+    """Build the stored metadata payload for a space."""
+    metadata = space.get_metadata(space_id)
+
+    if metadata:
+        return {
+            'success': True,
+            'space_id': space_id,
+            'metadata': metadata
+        }, 200
+    return {
+        'success': False,
+        'error': 'No metadata found for this space'
+    }, 404
+
+def build_silence_offset_payload(space_id):
+    """Build the silence offset payload used to correct transcription timecodes."""
+    # Look for video generation job files for this space
+    import glob
+    job_files = glob.glob(f"transcript_jobs/*_video.json")
+
+    silence_offset = 0  # Default to no offset
+
+    for job_file in job_files:
+        try:
+            with open(job_file, 'r') as f:
+                job_data = json.load(f)
+
+            # Check if this job is for the requested space
+            if job_data.get('space_id') == space_id and 'silence_offset' in job_data:
+                silence_offset = job_data['silence_offset']
+                break
+
+        except Exception as e:
+            logger.warning(f"Error reading job file {job_file}: {e}")
+            continue
+
+    return {
+        'space_id': space_id,
+        'silence_offset': silence_offset
+    }, 200
+
+def build_transcription_status_payload(space_id):
+    """Build the pending transcription job payload for a space."""
+    try:
+        job_data = transcription_queue.find_active(space_id)
+    except Exception as e:
+        logger.error(f"Error checking transcription queue for {space_id}: {e}")
+        job_data = None
+
+    if job_data:
+        return {
+            'has_pending_job': True,
+            'status': job_data.get('status'),
+            'job_id': job_data.get('job_id'),
+            'created_at': job_data.get('created_at'),
+            'language': job_data.get('language', 'en')
+        }, 200
+
+    return {
+        'has_pending_job': False,
+        'status': None,
+        'job_id': None
+    }, 200
+
+def build_translate_info_payload():
+    """Build the translation service availability payload."""
+    if not TRANSLATE_AVAILABLE:
+        return {
+            'available': False,
+            'error': 'Translation service is not available. Please configure an AI provider (OpenAI or Claude) in mainconfig.json'
+        }, 503
+
+    # Get Translate component
+    translator = get_translate_component()
+    if not translator:
+        return {
+            'available': False,
+            'error': 'Could not initialize translation service. Please check your AI provider configuration.'
+        }, 503
+
+    # Check if AI component is available
+    ai_available = hasattr(translator, 'ai') and translator.ai is not None
+
+    return {
+        'available': ai_available,
+        'self_hosted': translator.self_hosted,
+        'api_key_configured': ai_available,
+        'api_url': translator.api_url,
+        'provider': translator.ai.get_provider_name() if ai_available else "None",
+        'error': None if ai_available else "AI component not initialized - check API keys"
+    }, 200
+
+def load_space_notes(space, space_id):
+    """Load all notes for a space with author names in a single query."""
+    cursor = space.connection.cursor(dictionary=True)
+    query = """
+        SELECT n.id, n.space_id, n.notes, n.user_id, n.cookie_id, n.created_at, n.updated_at,
+               u.email AS user_email
+        FROM space_notes n
+        LEFT JOIN users u ON n.user_id = u.id AND n.user_id > 0
+        WHERE n.space_id = %s
+        ORDER BY n.updated_at DESC
+    """
+    cursor.execute(query, (space_id,))
+    notes = cursor.fetchall()
+    cursor.close()
+
+    for note in notes:
+        # Convert datetime objects to strings
+        if note['created_at']:
+            note['created_at'] = note['created_at'].isoformat()
+        if note['updated_at']:
+            note['updated_at'] = note['updated_at'].isoformat()
+
+        # Add author info
+        user_email = note.pop('user_email', None)
+        if note['user_id'] > 0:
+            note['author'] = user_email.split('@')[0] if user_email else 'User'
+        else:
+            note['author'] = 'Anonymous'
+
+    return notes
+
+def build_notes_payload(notes, user_id, cookie_id):
+    """Mark which of the loaded notes the current user can edit."""
+    marked_notes = []
+    for note in notes:
+        note = dict(note)
+        # User can edit if:
+        # 1. They are logged in and it's their note (user_id matches)
+        # 2. They are not logged in but have the cookie_id (anonymous note)
+        if user_id > 0:
+            note['can_edit'] = (note['user_id'] == user_id)
+        else:
+            note['can_edit'] = (note['cookie_id'] == cookie_id and note['user_id'] == 0)
+        marked_notes.append(note)
+
+    return {'notes': marked_notes}, 200
+
+def load_space_reviews(space, space_id):
+    """Load reviews plus the space ownership record needed to mark them."""
+    result = space.get_reviews(space_id)
+    if not result['success']:
+        return result
+
+    cursor = space.connection.cursor(dictionary=True)
+    cursor.execute("SELECT user_id, cookie_id FROM spaces WHERE space_id = %s", (space_id,))
+    result['space_record'] = cursor.fetchone()
+    cursor.close()
+    return result
+
+def build_reviews_payload(result, user_id, cookie_id):
+    """Mark which of the loaded reviews the current user can edit or delete."""
+    if not result['success']:
+        return result, 500
+
+    # Check if user owns this space
+    space_record = result.get('space_record')
+    is_space_owner = False
+    if space_record:
+        if user_id > 0:
+            is_space_owner = (space_record['user_id'] == user_id)
+        else:
+            is_space_owner = (space_record['cookie_id'] == cookie_id and space_record['user_id'] == 0)
+
+    # Mark which reviews can be edited/deleted
+    reviews = []
+    for review in result['reviews']:
+        review = dict(review)
+        # User can edit/delete their own review
+        can_edit = False
+        if user_id > 0:
+            can_edit = (review['user_id'] == user_id)
+        else:
+            can_edit = (review['cookie_id'] == cookie_id and review['user_id'] == 0)
+
+        review['can_edit'] = can_edit
+        review['can_delete'] = can_edit or is_space_owner
+        reviews.append(review)
+
+    return {
+        'success': True,
+        'average_rating': result['average_rating'],
+        'total_reviews': result['total_reviews'],
+        'reviews': reviews,
+        'is_space_owner': is_space_owner
+    }, 200
+
+@app.route('/api/spaces/<space_id>/bootstrap', methods=['GET'])
+def get_space_bootstrap(space_id):
+    """
+    Return initial state for the space page in one response.
+
+    Each section mirrors the body and status code of its standalone API so the
+    page can serve its first-paint requests from here. Only the sections named
+    in ?sections= (comma separated; all if not given) are loaded.
+    User-independent sections are served from the per-section bootstrap cache.
+    """
+    try:
+        # One Space component (and DB connection) for the whole page
+        space = get_space_component()
+        if not space:
+            return jsonify({'error': 'Database connection unavailable'}), 503
+
+        user_id = session.get('user_id', 0)
+        cookie_id = request.args.get('cookie_id', '')
+
+        # Pick up invalidations signalled by the background workers
+        check_cache_invalidation_trigger()
+
+        def section(payload_and_status):
+            payload, status_code = payload_and_status
+            return {'status': status_code, 'body': payload}
+
+        def cached(name, build):
+            return lambda: get_bootstrap_section(space_id, name, lambda: section(build()))
+
+        builders = {
+            'transcripts': cached('transcripts', lambda: build_transcripts_payload(space, space_id)),
+            'formats': cached('formats', lambda: build_available_formats_payload(space_id)),
+            'clips': cached('clips', lambda: build_clips_payload(space, space_id)),
+            'metadata': cached('metadata', lambda: build_metadata_payload(space, space_id)),
+            'silence_offset': cached('silence_offset', lambda: build_silence_offset_payload(space_id)),
+            # Built from the in-process Translate component, so there is nothing to cache
+            'translate_info': lambda: section(build_translate_info_payload()),
+            # Job status changes independently of any write we can observe, so never cache it
+            'transcription_status': lambda: section(build_transcription_status_payload(space_id)),
+            'notes': lambda: section(build_notes_payload(
+                get_bootstrap_section(space_id, 'notes', lambda: load_space_notes(space, space_id)),
+                user_id, cookie_id)),
+            'reviews': lambda: section(build_reviews_payload(
+                get_bootstrap_section(space_id, 'reviews', lambda: load_space_reviews(space, space_id)),
+                user_id, cookie_id)),
+            'favorite': lambda: section(({
+                'success': True,
+                'is_favorite': space.is_favorite(space_id, user_id, cookie_id)
+            }, 200))
+        }
+
+        requested = request.args.get('sections')
+        names = [name.strip() for name in requested.split(',')] if requested else list(builders)
+        sections = {name: builders[name]() for name in names if name in builders}
+
+        return jsonify({
+            'success': True,
+            'space_id': space_id,
+            'sections': sections
+        })
+
+    except Exception as e:
+        logger.error(f"Error building bootstrap data for space {space_id}: {e}", exc_info=True)
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @app.route('/spaces/<space_id>')
 def space_page(space_id):
     """Display a space page with audio player and download options."""
@@ -2344,19 +2690,13 @@ def space_page(space_id):
         
         # Check for pending transcription job
         has_pending_transcript_job = False
-        transcript_jobs_dir = Path('./transcript_jobs')
-        if transcript_jobs_dir.exists():
-            for job_file in transcript_jobs_dir.glob('*.json'):
-                try:
-                    with open(job_file, 'r') as f:
-                        job_data = json.load(f)
-                        if (job_data.get('space_id') == space_id and 
-                            job_data.get('status') in ['pending', 'in_progress', 'processing']):
-                            has_pending_transcript_job = True
-                            logger.info(f"Found pending transcription job {job_data.get('id')} for space {space_id} with status {job_data.get('status')}")
-                            break
-                except Exception as e:
-                    logger.error(f"Error reading transcript job file {job_file}: {e}")
+        try:
+            active_job = transcription_queue.find_active(space_id)
+            if active_job:
+                has_pending_transcript_job = True
+                logger.info(f"Found pending transcription job {active_job['job_id']} for space {space_id} with status {active_job['status']}")
+        except Exception as e:
+            logger.error(f"Error checking transcription queue for space {space_id}: {e}")
         
         logger.info(f"Space {space_id}: has_pending_transcript_job = {has_pending_transcript_job}")
         
@@ -2533,72 +2873,61 @@ def api_queue_status():
         
         # Get transcription jobs
         transcript_jobs = []
-        transcript_jobs_dir = Path('transcript_jobs')
-        if transcript_jobs_dir.exists():
-            for job_file in transcript_jobs_dir.glob('*.json'):
-                try:
-                    with open(job_file, 'r') as f:
-                        job_data = json.load(f)
-                        # Only include pending or in_progress transcription jobs
-                        if job_data.get('status') in ['pending', 'in_progress']:
-                            # Get space details for title
-                            space_details = space.get_space(job_data.get('space_id'))
-                            if space_details:
-                                title = space_details.get('title', f"Space {job_data.get('space_id')}")
-                            else:
-                                title = f"Space {job_data.get('space_id')}"
-                            
-                            transcript_jobs.append({
-                                'id': job_data.get('id'),
-                                'space_id': job_data.get('space_id'),
-                                'title': title,
-                                'status': job_data.get('status'),
-                                'status_label': 'Pending Transcription' if job_data.get('status') == 'pending' else 'Transcribing',
-                                'status_class': 'warning' if job_data.get('status') == 'pending' else 'success',
-                                'created_at': job_data.get('created_at', ''),
-                                'progress_percent': job_data.get('progress', 0),
-                                'type': 'transcription'
-                            })
-                except Exception as e:
-                    logger.error(f"Error reading transcript job file {job_file}: {e}")
+        try:
+            for job_data in transcription_queue.list_jobs(statuses=['pending', 'processing'], limit=500):
+                # Get space details for title
+                space_details = space.get_space(job_data.get('space_id'))
+                if space_details:
+                    title = space_details.get('title', f"Space {job_data.get('space_id')}")
+                else:
+                    title = f"Space {job_data.get('space_id')}"
+                
+                transcript_jobs.append({
+                    'id': job_data['job_id'],
+                    'space_id': job_data.get('space_id'),
+                    'title': title,
+                    'status': job_data.get('status'),
+                    'status_label': 'Pending Transcription' if job_data.get('status') == 'pending' else 'Transcribing',
+                    'status_class': 'warning' if job_data.get('status') == 'pending' else 'success',
+                    'created_at': job_data.get('created_at', ''),
+                    'progress_percent': job_data.get('progress', 0),
+                    'type': 'transcription'
+                })
+        except Exception as e:
+            logger.error(f"Error reading transcription jobs: {e}")
         
         # Sort transcript jobs by created_at
         transcript_jobs.sort(key=lambda x: x.get('created_at', ''))
         
         # Get translation jobs
         translation_jobs = []
-        translation_jobs_dir = Path('/var/www/production/xspacedownload.com/website/htdocs/translation_jobs')
-        if translation_jobs_dir.exists():
-            for job_file in translation_jobs_dir.glob('*.json'):
-                try:
-                    with open(job_file, 'r') as f:
-                        job_data = json.load(f)
-                        # Only include pending or in_progress translation jobs
-                        if job_data.get('status') in ['pending', 'in_progress']:
-                            # Get space details for title
-                            space_details = space.get_space(job_data.get('space_id'))
-                            if space_details:
-                                title = space_details.get('title', f"Space {job_data.get('space_id')}")
-                            else:
-                                title = f"Space {job_data.get('space_id')}"
-                            
-                            # Get target language name
-                            target_lang = job_data.get('target_lang', 'Unknown')
-                            
-                            translation_jobs.append({
-                                'id': job_data.get('id'),
-                                'space_id': job_data.get('space_id'),
-                                'title': title,
-                                'status': job_data.get('status'),
-                                'status_label': f'Pending Translation to {target_lang}' if job_data.get('status') == 'pending' else f'Translating to {target_lang}',
-                                'status_class': 'info' if job_data.get('status') == 'pending' else 'primary',
-                                'created_at': job_data.get('created_at', ''),
-                                'progress_percent': job_data.get('progress', 0),
-                                'target_lang': target_lang,
-                                'type': 'translation'
-                            })
-                except Exception as e:
-                    logger.error(f"Error reading translation job file {job_file}: {e}")
+        try:
+            for job_data in translation_queue.list_jobs():
+                # Get space details for title
+                space_details = space.get_space(job_data.get('space_id'))
+                if space_details:
+                    title = space_details.get('title', f"Space {job_data.get('space_id')}")
+                else:
+                    title = f"Space {job_data.get('space_id')}"
+                
+                # Get target language name
+                target_lang = job_data.get('target_lang', 'Unknown')
+                
+                translation_jobs.append({
+                    'id': job_data.get('id'),
+                    'space_id': job_data.get('space_id'),
+                    'title': title,
+                    'status': job_data.get('status'),
+                    'status_label': f'Pending Translation to {target_lang}' if job_data.get('status') == 'pending' else f'Translating to {target_lang}',
+                    'status_class': 'info' if job_data.get('status') == 'pending' else 'primary',
+                    'created_at': job_data.get('created_at', ''),
+                    'progress_percent': job_data.get('progress', 0),
+                    'target_lang': target_lang,
+                    'priority': job_data.get('priority'),
+                    'type': 'translation'
+                })
+        except Exception as e:
+            logger.error(f"Error reading translation jobs: {e}")
         
         # Sort translation jobs by created_at
         translation_jobs.sort(key=lambda x: x.get('created_at', ''))
@@ -2773,6 +3102,7 @@ def fetch_space_metadata(space_id):
         result = space.fetch_and_save_metadata(space_id)
         
         if result['success']:
+            invalidate_bootstrap_cache(space_id, 'metadata')
             return jsonify({
                 'success': True,
                 'space_id': space_id,
@@ -2796,19 +3126,8 @@ def get_space_metadata(space_id):
         space = get_space_component()
         
         # Get metadata from database
-        metadata = space.get_metadata(space_id)
-        
-        if metadata:
-            return jsonify({
-                'success': True,
-                'space_id': space_id,
-                'metadata': metadata
-            })
-        else:
-            return jsonify({
-                'success': False,
-                'error': 'No metadata found for this space'
-            }), 404
+        payload, status_code = build_metadata_payload(space, space_id)
+        return jsonify(payload), status_code
             
     except Exception as e:
         logger.error(f"Error getting space metadata: {e}", exc_info=True)
@@ -2889,45 +3208,9 @@ def get_space_notes(space_id):
         user_id = session.get('user_id', 0)  # Default to 0 for non-logged-in users
         
         # Get ALL notes for this space, marking which ones belong to current user
-        cursor = space.connection.cursor(dictionary=True)
-        query = """
-            SELECT id, space_id, notes, user_id, cookie_id, created_at, updated_at
-            FROM space_notes
-            WHERE space_id = %s
-            ORDER BY updated_at DESC
-        """
-        cursor.execute(query, (space_id,))
-        notes = cursor.fetchall()
-        cursor.close()
-        
-        # Mark which notes can be edited by the current user
-        for note in notes:
-            # User can edit if:
-            # 1. They are logged in and it's their note (user_id matches)
-            # 2. They are not logged in but have the cookie_id (anonymous note)
-            if user_id > 0:
-                note['can_edit'] = (note['user_id'] == user_id)
-            else:
-                note['can_edit'] = (note['cookie_id'] == cookie_id and note['user_id'] == 0)
-            
-            # Convert datetime objects to strings
-            if note['created_at']:
-                note['created_at'] = note['created_at'].isoformat()
-            if note['updated_at']:
-                note['updated_at'] = note['updated_at'].isoformat()
-            
-            # Add author info
-            if note['user_id'] > 0:
-                # Get user email for display
-                cursor = space.connection.cursor(dictionary=True)
-                cursor.execute("SELECT email FROM users WHERE id = %s", (note['user_id'],))
-                user = cursor.fetchone()
-                cursor.close()
-                note['author'] = user['email'].split('@')[0] if user else 'User'
-            else:
-                note['author'] = 'Anonymous'
-        
-        return jsonify({'notes': notes})
+        notes = load_space_notes(space, space_id)
+        payload, status_code = build_notes_payload(notes, user_id, cookie_id)
+        return jsonify(payload), status_code
         
     except Exception as e:
         logger.error(f"Error getting notes: {e}", exc_info=True)
@@ -2960,6 +3243,7 @@ def create_space_note(space_id):
         
         note_id = cursor.lastrowid
         cursor.close()
+        invalidate_bootstrap_cache(space_id, 'notes')
         
         return jsonify({
             'success': True,
@@ -3009,6 +3293,7 @@ def update_space_note(space_id, note_id):
         cursor.close()
         
         if affected_rows > 0:
+            invalidate_bootstrap_cache(space_id, 'notes')
             return jsonify({
                 'success': True,
                 'message': 'Note updated successfully'
@@ -3051,6 +3336,7 @@ def delete_space_note(space_id, note_id):
         cursor.close()
         
         if affected_rows > 0:
+            invalidate_bootstrap_cache(space_id, 'notes')
             return jsonify({
                 'success': True,
                 'message': 'Note deleted successfully'
@@ -3069,48 +3355,14 @@ def get_space_reviews(space_id):
         # Get Space component
         space = get_space_component()
         
-        # Get reviews
-        result = space.get_reviews(space_id)
+        # Get current user info to mark editable reviews
+        user_id = session.get('user_id', 0)
+        cookie_id = request.args.get('cookie_id', '')
         
-        if result['success']:
-            # Get current user info to mark editable reviews
-            user_id = session.get('user_id', 0)
-            cookie_id = request.args.get('cookie_id', '')
-            
-            # Check if user owns this space
-            cursor = space.connection.cursor(dictionary=True)
-            cursor.execute("SELECT user_id, cookie_id FROM spaces WHERE space_id = %s", (space_id,))
-            space_record = cursor.fetchone()
-            cursor.close()
-            
-            is_space_owner = False
-            if space_record:
-                if user_id > 0:
-                    is_space_owner = (space_record['user_id'] == user_id)
-                else:
-                    is_space_owner = (space_record['cookie_id'] == cookie_id and space_record['user_id'] == 0)
-            
-            # Mark which reviews can be edited/deleted
-            for review in result['reviews']:
-                # User can edit/delete their own review
-                can_edit = False
-                if user_id > 0:
-                    can_edit = (review['user_id'] == user_id)
-                else:
-                    can_edit = (review['cookie_id'] == cookie_id and review['user_id'] == 0)
-                
-                review['can_edit'] = can_edit
-                review['can_delete'] = can_edit or is_space_owner
-            
-            return jsonify({
-                'success': True,
-                'average_rating': result['average_rating'],
-                'total_reviews': result['total_reviews'],
-                'reviews': result['reviews'],
-                'is_space_owner': is_space_owner
-            })
-        else:
-            return jsonify(result), 500
+        # Get reviews
+        result = load_space_reviews(space, space_id)
+        payload, status_code = build_reviews_payload(result, user_id, cookie_id)
+        return jsonify(payload), status_code
             
     except Exception as e:
         logger.error(f"Error getting reviews: {e}", exc_info=True)
@@ -3146,6 +3398,7 @@ def create_space_review(space_id):
         result = space.add_review(space_id, user_id, cookie_id, rating, review_text)
         
         if result['success']:
+            invalidate_bootstrap_cache(space_id, 'reviews')
             return jsonify(result)
         else:
             return jsonify(result), 400
@@ -3184,6 +3437,7 @@ def update_space_review(space_id, review_id):
         result = space.update_review(review_id, user_id, cookie_id, rating, review_text)
         
         if result['success']:
+            invalidate_bootstrap_cache(space_id, 'reviews')
             return jsonify(result)
         else:
             return jsonify(result), 404
@@ -3207,6 +3461,7 @@ def delete_space_review(space_id, review_id):
         result = space.delete_review(review_id, user_id, cookie_id, space_id)
         
         if result['success']:
+            invalidate_bootstrap_cache(space_id, 'reviews')
             return jsonify(result)
         else:
             return jsonify(result), 404
@@ -3421,22 +3676,31 @@ def spaces_by_tag(tag_slug):
         flash('An error occurred while loading spaces', 'error')
         return redirect(url_for('all_spaces'))
 
+@app.route('/api/live_transcript/<space_id>', methods=['GET'])
+def api_get_live_transcript(space_id):
+    """API endpoint to get the transcript streamed while a space downloads."""
+    try:
+        live_transcript = load_live_transcript(space_id)
+        if not live_transcript:
+            return jsonify({'error': 'No live transcript for this space'}), 404
+        
+        # The final raw result is only needed by the transcription worker
+        live_transcript.pop('result', None)
+        return jsonify(live_transcript)
+        
+    except Exception as e:
+        logger.error(f"Error getting live transcript for {space_id}: {e}", exc_info=True)
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/transcript_job/<job_id>', methods=['GET'])
 def api_get_transcript_job(job_id):
     """API endpoint to get transcript job status."""
     try:
-        from pathlib import Path
-        import json
-        
         # Check if job exists
-        job_file = Path(f'./transcript_jobs/{job_id}.json')
-        if not job_file.exists():
+        job_data = transcription_queue.get(job_id)
+        if not job_data:
             return jsonify({'error': 'Job not found'}), 404
         
-        # Read job data
-        with open(job_file, 'r') as f:
-            job_data = json.load(f)
-        
         # Get space details
         space = get_space_component()
         
@@ -3614,34 +3878,8 @@ def download_space(space_id):
 def get_available_formats(space_id):
     """Get available download formats for a space."""
     try:
-        download_dir = app.config['DOWNLOAD_DIR']
-        available_formats = []
-        
-        # Check for different file formats
-        formats_to_check = {
-            'mp3': {'type': 'audio', 'name': 'MP3 Audio', 'icon': 'bi-music-note'},
-            'm4a': {'type': 'audio', 'name': 'M4A Audio', 'icon': 'bi-music-note'},
-            'wav': {'type': 'audio', 'name': 'WAV Audio', 'icon': 'bi-music-note'},
-            'mp4': {'type': 'video', 'name': 'MP4 Video', 'icon': 'bi-camera-video'}
-        }
-        
-        for ext, format_info in formats_to_check.items():
-            file_path = os.path.join(download_dir, f"{space_id}.{ext}")
-            if os.path.exists(file_path) and os.path.getsize(file_path) > 1024*1024:  # > 1MB
-                file_size = os.path.getsize(file_path)
-                available_formats.append({
-                    'format': ext,
-                    'type': format_info['type'],
-                    'name': format_info['name'],
-                    'icon': format_info['icon'],
-                    'size': file_size,
-                    'size_formatted': format_file_size(file_size)
-                })
-        
-        return jsonify({
-            'success': True,
-            'formats': available_formats
-        })
+        payload, status_code = build_available_formats_payload(space_id)
+        return jsonify(payload), status_code
         
     except Exception as e:
         logger.error(f"Error getting available formats for space {space_id}: {e}", exc_info=True)
@@ -3934,13 +4172,10 @@ def check_user_credits(required_amount=0.0):
     if not session.get('user_id'):
         return False, 0.0, "Please log in to use this feature"
     
-    tracker = get_cost_tracker()
-    if not tracker:
-        # If cost tracking is disabled, allow operation
-        return True, float('inf'), "Cost tracking disabled"
-    
     user_id = session['user_id']
-    current_balance = tracker.check_user_credits(user_id)
+    tracker = get_cost_tracker()
+    # Bypass the balance cache: a purchase made via another worker process must count here
+    current_balance = tracker.check_user_credits(user_id) if tracker else credit_ledger.get_balance(user_id, max_age=0)
     
     if current_balance < required_amount:
         return False, current_balance, f"Insufficient credits. Required: ${required_amount:.2f}, Available: ${current_balance:.2f}"
@@ -3959,7 +4194,10 @@ def get_user_info_for_template():
         'user_credits': None
     }
     
-    if session.get('user_id'):
+    if session.get('user_id') and session.get('user_email'):
+        user_info['user_email'] = session['user_email']
+        user_info['user_credits'] = credit_ledger.get_balance(session['user_id'])
+    elif session.get('user_id'):
         try:
             space = get_space_component()
             cursor = space.connection.cursor(dictionary=True)
@@ -4001,32 +4239,8 @@ def get_translate_component():
 @app.route('/api/translate/info', methods=['GET'])
 def api_translate_info():
     """API endpoint to check translation service availability."""
-    if not TRANSLATE_AVAILABLE:
-        return jsonify({
-            'available': False,
-            'error': 'Translation service is not available. Please configure an AI provider (OpenAI or Claude) in mainconfig.json'
-        }), 503
-        
-    # Get Translate component
-    translator = get_translate_component()
-    if not translator:
-        return jsonify({
-            'available': False,
-            'error': 'Could not initialize translation service. Please check your AI provider configuration.'
-        }), 503
-    
-    # Check if AI component is available
-    ai_available = hasattr(translator, 'ai') and translator.ai is not None
-    
-    # Return service info
-    return jsonify({
-        'available': ai_available,
-        'self_hosted': translator.self_hosted,
-        'api_key_configured': ai_available,
-        'api_url': translator.api_url,
-        'provider': translator.ai.get_provider_name() if ai_available else "None",
-        'error': None if ai_available else "AI component not initialized - check API keys"
-    })
+    payload, status_code = build_translate_info_payload()
+    return jsonify(payload), status_code
 
 @app.route('/api/translate/languages', methods=['GET'])
 def api_translate_languages():
@@ -4237,6 +4451,9 @@ def api_translate():
                 cursor.execute(insert_query, (space_id, target_lang_formatted, result))
                 space.connection.commit()
                 cursor.close()
+                invalidate_bootstrap_cache(space_id, 'transcripts')
+                update_transcript_index(space_id, target_lang_formatted, result)
+                update_keyword_index(space_id, target_lang_formatted, result)
                 
                 logger.info(f"Stored translation for space {space_id} in {target_lang_formatted}")
                 
@@ -4419,42 +4636,100 @@ def api_transcript_summary(transcript_id):
         if not translator:
             return jsonify({'error': 'Could not initialize AI service'}), 500
             
-        # Generate summary with cost tracking
         space_id = transcript_record['space_id']
-        success, result = translator.summary(transcript_text, max_length, space_id=space_id)
         
-        if not success:
-            return jsonify({'error': 'Summary generation failed', 'details': result}), 400
+        def generate_summary(on_progress=None):
+            """Generate the summary with cost tracking, store it and build the response."""
+            success, result = translator.summary(transcript_text, max_length, space_id=space_id,
+                                                 on_progress=on_progress)
+            if not success:
+                return False, result
+            
+            # STEP 3: Store summary in database
+            # Background jobs outlive the request, so they use (and close) their own connection
+            store_space = space if on_progress is None else None
+            try:
+                if store_space is None:
+                    store_space = get_space_component()
+                cursor = store_space.connection.cursor()
+                update_query = "UPDATE space_transcripts SET summary = %s, updated_at = NOW() WHERE id = %s"
+                cursor.execute(update_query, (result, transcript_id))
+                store_space.connection.commit()
+                cursor.close()
+                invalidate_bootstrap_cache(space_id, 'transcripts')
+                logger.info(f"Stored summary for transcript {transcript_id}")
+            except Exception as db_err:
+                logger.warning(f"Error storing summary in database: {db_err}")
+                # Continue even if database storage fails
+            finally:
+                if on_progress is not None and store_space is not None and store_space.connection:
+                    try:
+                        store_space.connection.close()
+                    except Exception:
+                        pass
+            
+            return True, {
+                'success': True,
+                'summary': result,
+                'from_database': False,
+                'transcript_id': transcript_id,
+                'space_id': space_id,
+                'language': transcript_record['language'],
+                'original_length': len(transcript_text),
+                'summary_length': len(result),
+                'max_length': max_length
+            }
         
-        # STEP 3: Store summary in database
-        try:
-            cursor = space.connection.cursor()
-            update_query = "UPDATE space_transcripts SET summary = %s, updated_at = NOW() WHERE id = %s"
-            cursor.execute(update_query, (result, transcript_id))
-            space.connection.commit()
-            cursor.close()
-            logger.info(f"Stored summary for transcript {transcript_id}")
-        except Exception as db_err:
-            logger.warning(f"Error storing summary in database: {db_err}")
-            # Continue even if database storage fails
+        # Long transcripts can be summarized in the background; the page polls the job
+        if data.get('background'):
+            def run_job(on_progress):
+                success, payload = generate_summary(on_progress)
+                if not success:
+                    raise RuntimeError(payload.get('error') if isinstance(payload, dict) else payload)
+                return payload
             
+            job = summary_jobs.submit(f"transcript:{transcript_id}:{max_length}", run_job,
+                                      {'transcript_id': transcript_id, 'space_id': space_id})
+            return jsonify({
+                'success': True,
+                'job_id': job['job_id'],
+                'status': job['status'],
+                'progress': job['progress'],
+                'status_url': url_for('api_summary_job_status', job_id=job['job_id'])
+            }), 202
+        
+        # Generate summary with cost tracking
+        success, payload = generate_summary()
+        if not success:
+            return jsonify({'error': 'Summary generation failed', 'details': payload}), 400
+        
         # Return summary
-        return jsonify({
-            'success': True,
-            'summary': result,
-            'from_database': False,
-            'transcript_id': transcript_id,
-            'space_id': transcript_record['space_id'],
-            'language': transcript_record['language'],
-            'original_length': len(transcript_text),
-            'summary_length': len(result),
-            'max_length': max_length
-        })
+        return jsonify(payload)
         
     except Exception as e:
         logger.error(f"Error generating transcript summary: {e}", exc_info=True)
         return jsonify({'error': 'An unexpected error occurred'}), 500
 
+@app.route('/api/summary_jobs/<job_id>', methods=['GET'])
+def api_summary_job_status(job_id):
+    """API endpoint to get the progress or result of a background summary job."""
+    job = summary_jobs.get(job_id)
+    if not job:
+        return jsonify({'error': 'Summary job not found'}), 404
+    
+    response = {
+        'success': job['status'] != 'failed',
+        'job_id': job['job_id'],
+        'status': job['status'],
+        'progress': job.get('progress', 0),
+        'stage': job.get('stage')
+    }
+    if job['status'] == 'completed':
+        response.update(job.get('result') or {})
+    elif job['status'] == 'failed':
+        response['error'] = job.get('error', 'Summary generation failed')
+    return jsonify(response)
+
 @app.route('/api/transcript/<transcript_id>', methods=['GET'])
 def api_get_transcript(transcript_id):
     """API endpoint to get transcript content."""
@@ -4543,39 +4818,41 @@ def api_get_transcripts_for_space(space_id):
         # Get Space component
         space = get_space_component()
         
-        # Get transcripts for the space
-        if language:
-            # Get specific language transcript
-            cursor = space.connection.cursor(dictionary=True)
-            query = "SELECT * FROM space_transcripts WHERE space_id = %s AND language = %s"
-            cursor.execute(query, (space_id, language))
-            transcripts = cursor.fetchall()
-            cursor.close()
-        else:
-            # Get all transcripts for the space
-            transcripts = space.get_transcripts_for_space(space_id)
-        
-        # Convert datetime objects to strings for JSON serialization
-        safe_transcripts = []
-        for transcript in transcripts:
-            safe_transcript = {}
-            for key, value in transcript.items():
-                if hasattr(value, 'isoformat'):
-                    safe_transcript[key] = value.isoformat()
-                else:
-                    safe_transcript[key] = value
-            safe_transcripts.append(safe_transcript)
-        
-        return jsonify({
-            'space_id': space_id,
-            'transcripts': safe_transcripts,
-            'count': len(safe_transcripts)
-        })
+        payload, status_code = build_transcripts_payload(space, space_id, language)
+        return jsonify(payload), status_code
         
     except Exception as e:
         logger.error(f"Error getting transcripts for space {space_id}: {e}", exc_info=True)
         return jsonify({'error': 'An unexpected error occurred'}), 500
 
+@app.route('/api/search', methods=['GET'])
+def api_search():
+    """
+    Search space titles, hosts, tags and transcripts.
+
+    Query parameters:
+        q: Search terms; words are ANDed, "quoted phrases" are matched exactly
+        page, per_page: Pagination (per_page is capped at 100)
+        language: Only search transcripts in this language
+    """
+    try:
+        query = request.args.get('q', '').strip()
+        page = request.args.get('page', 1, type=int)
+        per_page = request.args.get('per_page', 20, type=int)
+        language = request.args.get('language') or None
+
+        if not query:
+            return jsonify({'error': 'Search query is required'}), 400
+        if len(query) > 200:
+            return jsonify({'error': 'Search query is too long'}), 400
+
+        results = search_index.search(query, page=page, per_page=per_page, language=language)
+        return jsonify(results)
+
+    except Exception as e:
+        logger.error(f"Error searching for '{request.args.get('q', '')}': {e}", exc_info=True)
+        return jsonify({'error': 'An unexpected error occurred'}), 500
+
 @app.route('/api/top_stats/<stat_type>')
 def api_top_stats(stat_type):
     """Get top 10 spaces by plays, downloads, or top hosts."""
@@ -5927,6 +6204,8 @@ def admin_update_user(user_id):
             params.append(user_id)
             cursor.execute(query, params)
             space.connection.commit()
+            if 'credits' in data:
+                credit_ledger.invalidate_balance(user_id)
         
         cursor.close()
         return jsonify({'success': True})
@@ -6222,11 +6501,9 @@ def generate_video(space_id):
         
         # Check user credits before starting expensive video generation
         try:
-            from components.AICost import AICost
-            ai_cost = AICost()
-            
-            # Check if user has sufficient credits (estimate $0.10 minimum for video generation)
-            user_credits = ai_cost.get_user_balance(user_id)
+            # Check if user has sufficient credits (estimate $0.10 minimum for video generation);
+            # bypass the balance cache so a purchase made via another worker process counts
+            user_credits = credit_ledger.get_balance(user_id, max_age=0)
             min_required_credits = 0.10  # Minimum estimated cost
             
             if user_credits < min_required_credits:
@@ -6359,30 +6636,8 @@ def download_video(space_id, job_id):
 def get_space_silence_offset(space_id):
     """Get silence offset for a space to correct transcription timecodes."""
     try:
-        # Look for video generation job files for this space
-        import glob
-        job_files = glob.glob(f"transcript_jobs/*_video.json")
-        
-        silence_offset = 0  # Default to no offset
-        
-        for job_file in job_files:
-            try:
-                with open(job_file, 'r') as f:
-                    job_data = json.load(f)
-                
-                # Check if this job is for the requested space
-                if job_data.get('space_id') == space_id and 'silence_offset' in job_data:
-                    silence_offset = job_data['silence_offset']
-                    break
-                    
-            except Exception as e:
-                logger.warning(f"Error reading job file {job_file}: {e}")
-                continue
-        
-        return jsonify({
-            'space_id': space_id,
-            'silence_offset': silence_offset
-        })
+        payload, status_code = build_silence_offset_payload(space_id)
+        return jsonify(payload), status_code
         
     except Exception as e:
         logger.error(f"Error getting silence offset for space {space_id}: {e}", exc_info=True)
@@ -6456,6 +6711,7 @@ def admin_re_transcribe(space_id):
         data = request.get_json() or {}
         model = data.get('model', 'base')
         overwrite = data.get('overwrite', True)
+        use_cache = data.get('use_cache', True)
         
         # Validate model
         valid_models = ['tiny', 'base', 'small', 'medium', 'large']
@@ -6503,17 +6759,14 @@ def admin_re_transcribe(space_id):
             'language': 'en',
             'model': model,
             'overwrite': overwrite,
+            'use_cache': use_cache,
             'created_at': datetime.now().isoformat(),
             'status': 'pending',
             'admin_requested': True,
             'user_id': session.get('user_id', 0)  # Include admin user_id for cost tracking
         }
         
-        # Save job file
-        os.makedirs('transcript_jobs', exist_ok=True)
-        job_file = f'transcript_jobs/{job_id}.json'
-        with open(job_file, 'w') as f:
-            json.dump(job_data, f, indent=2)
+        transcription_queue.enqueue(job_data)
         
         return jsonify({
             'success': True,
@@ -7075,58 +7328,42 @@ def admin_get_logs():
         offset = int(request.args.get('offset', 0))
         limit = int(request.args.get('limit', 100))
         
+        levels = [level for level in request.args.get('level', '').split(',') if level.strip()]
+        component = request.args.get('component', '').strip() or None
+        
         all_log_entries = []
+        has_more = False
+        total = None
         
         # Try to read from log files first
         logs_dir = Path('/var/www/production/xspacedownload.com/website/htdocs/logs')
-        logger.info(f"DEBUG: Starting admin_get_logs, offset={offset}, limit={limit}")
-        logger.info(f"DEBUG: Logs directory path: {logs_dir}")
         log_files = []
         
         # Find all log files, prioritizing the main app log
-        logger.info(f"DEBUG: Checking logs directory: {logs_dir}, exists: {logs_dir.exists()}")
         if logs_dir.exists():
-            found_files = list(logs_dir.glob('*.log'))
-            logger.info(f"DEBUG: Found {len(found_files)} log files: {[f.name for f in found_files]}")
-            for log_file in found_files:
+            for log_file in logs_dir.glob('*.log'):
                 if log_file.name in ['app.log', 'xspacedownloader.log']:
                     log_files.insert(0, log_file)  # Main logs first
                 else:
                     log_files.append(log_file)
         else:
-            logger.warning(f"DEBUG: Logs directory does not exist: {logs_dir}")
+            logger.warning(f"Logs directory does not exist: {logs_dir}")
         
-        # Read logs from files if available
-        logger.info(f"DEBUG: Processing {len(log_files)} log files: {[f.name for f in log_files]}")
-        for log_file in log_files:
+        # Read only the requested page, newest first, merged across files by timestamp
+        if log_files:
             try:
-                logger.info(f"DEBUG: Reading log file: {log_file}")
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    # Get recent lines (last 500 to avoid memory issues)
-                    recent_lines = lines[-500:] if len(lines) > 500 else lines
-                    
-                    logger.info(f"DEBUG: Read {len(lines)} total lines, using {len(recent_lines)} recent lines from {log_file.name}")
-                    
-                    for line in recent_lines:
-                        line = line.strip()
-                        if line:  # Skip empty lines
-                            all_log_entries.append({
-                                'message': line,
-                                'source': log_file.stem,
-                                'level': 'INFO',
-                                'timestamp': None
-                            })
-                    
-                    logger.info(f"DEBUG: Added {len([l for l in recent_lines if l.strip()])} log entries from {log_file.name}")
+                page = log_reader.read_merged(
+                    [str(log_file) for log_file in log_files],
+                    offset=offset, limit=limit, levels=levels, component=component
+                )
+                all_log_entries = page['entries']
+                has_more = page['has_more']
+                total = page['total']
             except Exception as e:
-                logger.warning(f"Error reading log file {log_file}: {e}")
-                continue
-        
-        logger.info(f"DEBUG: Total log entries collected: {len(all_log_entries)}")
+                logger.warning(f"Error reading log files: {e}")
         
         # If no log files found, try to read from systemd journal
-        if not all_log_entries:
+        if not log_files:
             try:
                 import subprocess
                 # Get recent logs from gunicorn service
@@ -7187,26 +7424,31 @@ def admin_get_logs():
                     'timestamp': datetime.datetime.now().isoformat()
                 })
         
-        # Sort by most recent (reverse chronological)
-        all_log_entries.reverse()
-        
-        # Apply offset and limit
-        start_idx = offset
-        end_idx = offset + limit
-        logs_slice = all_log_entries[start_idx:end_idx]
+        if log_files:
+            # File entries are already the requested page
+            logs_slice = all_log_entries
+            end_idx = offset + len(logs_slice)
+        else:
+            # Journal fallback returns oldest first
+            all_log_entries.reverse()
+            logs_slice = all_log_entries[offset:offset + limit]
+            end_idx = offset + len(logs_slice)
+            has_more = end_idx < len(all_log_entries)
+            total = len(all_log_entries)
         
         return jsonify({
             'success': True,
             'logs': logs_slice,
-            'total': len(all_log_entries),
+            # Known once the log index has reached the start of the files; None until then
+            'total': total,
             'offset': offset,
-            'next_offset': end_idx if end_idx < len(all_log_entries) else None,
-            'has_more': end_idx < len(all_log_entries),
+            'next_offset': end_idx if has_more else None,
+            'has_more': has_more,
             'debug_info': {
                 'logs_dir_exists': logs_dir.exists(),
-                'log_files_found': [f.name for f in logs_dir.glob('*.log')] if logs_dir.exists() else [],
-                'total_entries_collected': len(all_log_entries),
-                'slice_start': start_idx,
+                'log_files_found': [f.name for f in log_files],
+                'filters': {'level': levels, 'component': component},
+                'slice_start': offset,
                 'slice_end': end_idx,
                 'slice_length': len(logs_slice)
             }
@@ -7457,10 +7699,12 @@ def admin_dev_clear_spaces_data():
                     except Exception as e:
                         logger.warning(f"[DEV] Error deleting file {file_path}: {e}")
         
-        # Clear transcript job files
+        # Clear transcription jobs (queue rows and their mirror files) and video job files
+        jobs_cleared = transcription_queue.clear()
+        tables_cleared.append(f"transcription queue ({jobs_cleared} jobs)")
         transcript_jobs_dir = Path('/var/www/production/xspacedownload.com/website/xspacedownloader/transcript_jobs')
         if transcript_jobs_dir.exists():
-            for file_path in transcript_jobs_dir.glob('*.json'):
+            for file_path in transcript_jobs_dir.glob('*_video.json'):
                 try:
                     file_path.unlink()
                     files_deleted.append(f"transcript_jobs/{file_path.name}")
@@ -7636,84 +7880,32 @@ def admin_get_transcription_queue():
         return jsonify({'error': 'Unauthorized'}), 403
     
     try:
-        import os
-        import json
-        from pathlib import Path
         from datetime import datetime, timedelta
         
-        # Check both old and new locations for transcript jobs
-        transcript_jobs_dir_old = Path('/var/www/production/xspacedownload.com/website/xspacedownloader/transcript_jobs')
-        transcript_jobs_dir_new = Path('/var/www/production/xspacedownload.com/website/htdocs/transcript_jobs')
-        
-        if not transcript_jobs_dir_old.exists() and not transcript_jobs_dir_new.exists():
-            return jsonify({
-                'pending': [],
-                'processing': [],
-                'completed': [],
-                'failed': []
-            })
-        
-        yesterday = datetime.now() - timedelta(days=1)
-        
-        pending_jobs = []
-        processing_jobs = []
-        completed_jobs = []
-        failed_jobs = []
+        def job_info(job_data):
+            return {
+                'job_id': job_data.get('job_id'),
+                'space_id': job_data.get('space_id'),
+                'status': job_data.get('status'),
+                'progress': job_data.get('progress', 0),
+                'created_at': job_data.get('created_at'),
+                'updated_at': job_data.get('updated_at'),
+                'model': job_data.get('model'),
+                'language': job_data.get('language'),
+                'options': job_data.get('options', {}),
+                'error': job_data.get('error')
+            }
         
-        # Read all job files from both directories
-        job_files = []
-        if transcript_jobs_dir_old.exists():
-            job_files.extend(transcript_jobs_dir_old.glob('*.json'))
-        if transcript_jobs_dir_new.exists():
-            job_files.extend(transcript_jobs_dir_new.glob('*.json'))
-            
-        for job_file in job_files:
-            try:
-                with open(job_file, 'r') as f:
-                    job_data = json.load(f)
-                
-                # Skip video jobs (they have '_video' in filename)
-                if '_video' in job_file.name:
-                    continue
-                    
-                status = job_data.get('status', 'unknown')
-                created_at = datetime.fromisoformat(job_data.get('created_at', '2020-01-01'))
-                
-                # Only include recent completed/failed jobs
-                if status in ['completed', 'failed'] and created_at < yesterday:
-                    continue
-                
-                job_info = {
-                    'job_id': job_data.get('job_id', job_data.get('id')),
-                    'space_id': job_data.get('space_id'),
-                    'status': status,
-                    'progress': job_data.get('progress', 0),
-                    'created_at': job_data.get('created_at'),
-                    'updated_at': job_data.get('updated_at'),
-                    'model': job_data.get('model'),
-                    'language': job_data.get('language'),
-                    'options': job_data.get('options', {}),
-                    'error': job_data.get('error')
-                }
-                
-                if status == 'pending':
-                    pending_jobs.append(job_info)
-                elif status == 'processing':
-                    processing_jobs.append(job_info)
-                elif status == 'completed':
-                    completed_jobs.append(job_info)
-                elif status == 'failed':
-                    failed_jobs.append(job_info)
-                    
-            except Exception as e:
-                logger.warning(f"Error reading transcription job file {job_file}: {e}")
-                continue
+        # Only recent completed/failed jobs are shown
+        yesterday = (datetime.now() - timedelta(days=1)).timestamp()
         
         return jsonify({
-            'pending': sorted(pending_jobs, key=lambda x: x.get('created_at', '')),
-            'processing': sorted(processing_jobs, key=lambda x: x.get('created_at', '')),
-            'completed': sorted(completed_jobs, key=lambda x: x.get('updated_at', ''), reverse=True)[:10],
-            'failed': sorted(failed_jobs, key=lambda x: x.get('updated_at', ''), reverse=True)[:5]
+            'pending': [job_info(job) for job in transcription_queue.list_jobs(['pending'], limit=500)],
+            'processing': [job_info(job) for job in transcription_queue.list_jobs(['processing'], limit=500)],
+            'completed': [job_info(job) for job in transcription_queue.list_jobs(
+                ['completed'], since=yesterday, limit=10, newest_first=True)],
+            'failed': [job_info(job) for job in transcription_queue.list_jobs(
+                ['failed'], since=yesterday, limit=5, newest_first=True)]
         })
         
     except Exception as e:
@@ -7727,105 +7919,73 @@ def admin_get_translation_queue():
         return jsonify({'error': 'Unauthorized'}), 403
     
     try:
-        import os
-        import json
-        from pathlib import Path
         from datetime import datetime, timedelta
         
-        # Translation jobs are part of transcription jobs with translate_to option
-        transcript_jobs_dir = Path('/var/www/production/xspacedownload.com/website/xspacedownloader/transcript_jobs')
-        # Also check the new translation_jobs directory
-        translation_jobs_dir = Path('/var/www/production/xspacedownload.com/website/htdocs/translation_jobs')
-        
-        if not transcript_jobs_dir.exists() and not translation_jobs_dir.exists():
-            return jsonify({
-                'pending': [],
-                'processing': [],
-                'completed': []
-            })
-        
         yesterday = datetime.now() - timedelta(days=1)
         
         pending_jobs = []
         processing_jobs = []
         completed_jobs = []
         
-        # Read all job files and filter for translation jobs from both directories
-        job_files = []
-        if transcript_jobs_dir.exists():
-            job_files.extend(transcript_jobs_dir.glob('*.json'))
-        if translation_jobs_dir.exists():
-            job_files.extend(translation_jobs_dir.glob('*.json'))
-            
-        for job_file in job_files:
-            try:
-                with open(job_file, 'r') as f:
-                    job_data = json.load(f)
-                
-                # Skip video jobs
-                if '_video' in job_file.name:
-                    continue
-                
-                # Check if this is a new-style translation job (from translation_jobs dir)
-                is_new_translation_job = str(job_file.parent).endswith('translation_jobs')
-                
-                # For old-style transcription jobs, check if they have translate_to option
-                options = job_data.get('options', {})
-                if not is_new_translation_job and not options.get('translate_to'):
-                    continue
-                    
-                status = job_data.get('status', 'unknown')
-                created_at = datetime.fromisoformat(job_data.get('created_at', '2020-01-01'))
-                
-                # Only include recent completed jobs
-                if status == 'completed' and created_at < yesterday:
-                    continue
-                
-                # Handle different job formats
-                if is_new_translation_job:
-                    # New translation job format
-                    job_info = {
-                        'job_id': job_data.get('id'),
-                        'space_id': job_data.get('space_id'),
-                        'status': status,
-                        'progress': job_data.get('progress', 0),
-                        'created_at': job_data.get('created_at'),
-                        'updated_at': job_data.get('updated_at'),
-                        'source_language': job_data.get('source_lang', 'auto'),
-                        'target_language': job_data.get('target_lang'),
-                        'options': {},
-                        'error': job_data.get('error')
-                    }
-                else:
-                    # Old transcription job format with translate_to option
-                    job_info = {
-                        'job_id': job_data.get('job_id', job_data.get('id')),
-                        'space_id': job_data.get('space_id'),
-                        'status': status,
-                        'progress': job_data.get('progress', 0),
-                        'created_at': job_data.get('created_at'),
-                        'updated_at': job_data.get('updated_at'),
-                        'source_language': job_data.get('language', 'auto'),
-                        'target_language': options.get('translate_to'),
-                        'options': options,
-                        'error': job_data.get('error')
-                    }
-                
-                if status == 'pending':
-                    pending_jobs.append(job_info)
-                elif status == 'processing':
-                    processing_jobs.append(job_info)
-                elif status == 'completed':
-                    completed_jobs.append(job_info)
-                    
-            except Exception as e:
-                logger.warning(f"Error reading translation job file {job_file}: {e}")
+        # Standalone translation jobs from the job table
+        for job_data in translation_queue.list_jobs(statuses=('pending', 'in_progress', 'completed'),
+                                                    since=yesterday.timestamp()):
+            job_info = {
+                'job_id': job_data['id'],
+                'space_id': job_data['space_id'],
+                'status': job_data['status'],
+                'progress': job_data['progress'],
+                'priority': job_data['priority'],
+                'provider': job_data['provider'],
+                'created_at': job_data['created_at'],
+                'updated_at': job_data['updated_at'],
+                'source_language': job_data['source_lang'],
+                'target_language': job_data['target_lang'],
+                'options': {},
+                'error': job_data['error']
+            }
+            if job_data['status'] == 'pending':
+                pending_jobs.append(job_info)
+            elif job_data['status'] == 'in_progress':
+                processing_jobs.append(job_info)
+            else:
+                completed_jobs.append(job_info)
+        
+        # Transcription jobs with a translate_to option
+        transcription_jobs = transcription_queue.list_jobs(['pending', 'processing'], limit=500)
+        transcription_jobs += transcription_queue.list_jobs(['completed'], since=yesterday.timestamp(),
+                                                            limit=100, newest_first=True)
+        for job_data in transcription_jobs:
+            options = job_data.get('options') or {}
+            if not options.get('translate_to'):
                 continue
-        
+
+            status = job_data['status']
+            job_info = {
+                'job_id': job_data['job_id'],
+                'space_id': job_data.get('space_id'),
+                'status': status,
+                'progress': job_data.get('progress', 0),
+                'created_at': job_data.get('created_at'),
+                'updated_at': job_data.get('updated_at'),
+                'source_language': job_data.get('language', 'auto'),
+                'target_language': options.get('translate_to'),
+                'options': options,
+                'error': job_data.get('error')
+            }
+
+            if status == 'pending':
+                pending_jobs.append(job_info)
+            elif status == 'processing':
+                processing_jobs.append(job_info)
+            else:
+                completed_jobs.append(job_info)
+
         return jsonify({
-            'pending': sorted(pending_jobs, key=lambda x: x.get('created_at', '')),
-            'processing': sorted(processing_jobs, key=lambda x: x.get('created_at', '')),
-            'completed': sorted(completed_jobs, key=lambda x: x.get('updated_at', ''), reverse=True)[:10]
+            'pending': sorted(pending_jobs, key=lambda x: (x.get('priority') or 3, x.get('created_at') or '')),
+            'processing': sorted(processing_jobs, key=lambda x: x.get('created_at') or ''),
+            'completed': sorted(completed_jobs, key=lambda x: x.get('updated_at') or '', reverse=True)[:10],
+            'stats': translation_queue.get_stats()
         })
         
     except Exception as e:
@@ -8761,19 +8921,10 @@ def admin_get_transcription_job(job_id):
         return jsonify({'error': 'Unauthorized'}), 403
     
     try:
-        import os
-        import json
-        from pathlib import Path
-        
-        transcript_jobs_dir = Path('./transcript_jobs')
-        job_file = transcript_jobs_dir / f"{job_id}.json"
-        
-        if not job_file.exists():
+        job_data = transcription_queue.get(job_id)
+        if not job_data:
             return jsonify({'error': 'Job not found'}), 404
         
-        with open(job_file, 'r') as f:
-            job_data = json.load(f)
-        
         return jsonify({
             'success': True,
             'job': job_data
@@ -8790,39 +8941,14 @@ def admin_cancel_transcription_job(job_id):
         return jsonify({'error': 'Unauthorized'}), 403
     
     try:
-        import os
-        import json
-        from pathlib import Path
-        
-        transcript_jobs_dir = Path('./transcript_jobs')
-        job_file = transcript_jobs_dir / f"{job_id}.json"
-        
-        if not job_file.exists():
+        job_data = transcription_queue.get(job_id)
+        if not job_data:
             return jsonify({'error': 'Job not found'}), 404
         
-        # Load job data
-        with open(job_file, 'r') as f:
-            job_data = json.load(f)
-        
-        # Check if job can be cancelled
-        if job_data.get('status') not in ['pending', 'processing']:
+        # Cancel in the queue; a running worker sees the flag at its next check
+        if not transcription_queue.request_cancel(job_id, 'Cancelled by admin'):
             return jsonify({'error': 'Job cannot be cancelled in its current state'}), 400
         
-        # Update job status to cancelled
-        from datetime import datetime
-        job_data['status'] = 'cancelled'
-        job_data['updated_at'] = datetime.now().isoformat()
-        job_data['error'] = 'Cancelled by admin'
-        
-        # Save updated job data
-        with open(job_file, 'w') as f:
-            json.dump(job_data, f, indent=4)
-        
-        # Create a signal file for background processes to check
-        signal_file = Path(f'./temp/cancel_{job_id}.signal')
-        signal_file.parent.mkdir(exist_ok=True)
-        signal_file.touch()
-        
         logger.info(f"Admin user {session.get('user_id')} cancelled transcription job {job_id}")
         
         return jsonify({
@@ -8908,37 +9034,19 @@ def admin_cancel_translation_job(job_id):
         import json
         from pathlib import Path
         
-        transcript_jobs_dir = Path('./transcript_jobs')
-        job_file = transcript_jobs_dir / f"{job_id}.json"
-        
-        if not job_file.exists():
+        job_data = transcription_queue.get(job_id)
+        if not job_data:
             return jsonify({'error': 'Translation job not found'}), 404
         
-        with open(job_file, 'r') as f:
-            job_data = json.load(f)
-        
         # Verify this is a translation job
         if not job_data.get('options', {}).get('translate_to'):
             return jsonify({'error': 'This is not a translation job'}), 400
         
         # Check if job can be cancelled
         current_status = job_data.get('status', '')
-        if current_status not in ['pending', 'processing']:
+        if not transcription_queue.request_cancel(job_id, 'Job cancelled by admin'):
             return jsonify({'error': f'Cannot cancel job with status: {current_status}'}), 400
         
-        # Update job status to cancelled
-        job_data['status'] = 'cancelled'
-        job_data['updated_at'] = datetime.datetime.now().isoformat()
-        job_data['error'] = 'Job cancelled by admin'
-        
-        with open(job_file, 'w') as f:
-            json.dump(job_data, f, indent=2)
-        
-        # Create a signal file for background processes to check
-        signal_file = Path(f'./temp/cancel_{job_id}.signal')
-        signal_file.parent.mkdir(exist_ok=True)
-        signal_file.touch()
-        
         logger.info(f"Translation job {job_id} cancelled by admin")
         
         return jsonify({
@@ -9139,21 +9247,16 @@ def admin_remove_transcription_job(job_id):
         from pathlib import Path
         
         transcript_jobs_dir = Path('./transcript_jobs')
-        job_file = transcript_jobs_dir / f"{job_id}.json"
-        
-        if not job_file.exists():
+        job_data = transcription_queue.get(job_id)
+        if not job_data:
             return jsonify({'error': 'Transcription job not found'}), 404
         
-        # Read job data to check status
-        with open(job_file, 'r') as f:
-            job_data = json.load(f)
-        
         # Only allow removal of completed, failed, or cancelled jobs
         if job_data.get('status') not in ['completed', 'failed', 'cancelled']:
             return jsonify({'error': 'Can only remove completed, failed, or cancelled jobs'}), 400
         
-        # Remove the job file
-        job_file.unlink()
+        # Remove the job and its file
+        transcription_queue.remove(job_id)
         
         # Also remove any associated video job file if it exists
         video_job_file = transcript_jobs_dir / f"{job_id}_video.json"
@@ -9182,16 +9285,10 @@ def admin_remove_translation_job(job_id):
         import json
         from pathlib import Path
         
-        transcript_jobs_dir = Path('./transcript_jobs')
-        job_file = transcript_jobs_dir / f"{job_id}.json"
-        
-        if not job_file.exists():
+        job_data = transcription_queue.get(job_id)
+        if not job_data:
             return jsonify({'error': 'Translation job not found'}), 404
         
-        # Read job data to verify it's a translation job and check status
-        with open(job_file, 'r') as f:
-            job_data = json.load(f)
-        
         # Verify this is a translation job
         if not job_data.get('options', {}).get('translate_to'):
             return jsonify({'error': 'This is not a translation job'}), 400
@@ -9200,8 +9297,8 @@ def admin_remove_translation_job(job_id):
         if job_data.get('status') not in ['completed', 'failed', 'cancelled']:
             return jsonify({'error': 'Can only remove completed, failed, or cancelled jobs'}), 400
         
-        # Remove the job file
-        job_file.unlink()
+        # Remove the job and its file
+        transcription_queue.remove(job_id)
         
         logger.info(f"Translation job {job_id} removed by admin")
         
@@ -9496,6 +9593,30 @@ def admin_get_sql_logs():
         logger.error(f"Error getting SQL logs: {e}", exc_info=True)
         return jsonify({'error': str(e), 'logs': []}), 200
 
+@app.route('/admin/api/translation_memory')
+def admin_get_translation_memory_stats():
+    """Get translation memory size and hit rate (admin only)."""
+    if not session.get('user_id') or not session.get('is_admin'):
+        return jsonify({'error': 'Unauthorized'}), 403
+    
+    try:
+        return jsonify({'success': True, 'stats': translation_memory.get_stats()})
+    except Exception as e:
+        logger.error(f"Error getting translation memory stats: {e}", exc_info=True)
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/admin/api/ai_gateway')
+def admin_get_ai_gateway_metrics():
+    """Get per-provider AI call latency, error rate and circuit state (admin only)."""
+    if not session.get('user_id') or not session.get('is_admin'):
+        return jsonify({'error': 'Unauthorized'}), 403
+    
+    try:
+        return jsonify({'success': True, 'metrics': ai_gateway.get_metrics()})
+    except Exception as e:
+        logger.error(f"Error getting AI gateway metrics: {e}", exc_info=True)
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @app.route('/admin/api/clear_sql_logs', methods=['POST'])
 def admin_clear_sql_logs():
     """Clear SQL query logs (admin only)."""
@@ -9515,6 +9636,44 @@ def admin_clear_sql_logs():
         logger.error(f"Error clearing SQL logs: {e}", exc_info=True)
         return jsonify({'error': str(e)}), 500
 
+@app.route('/admin/api/sql-logging')
+def admin_sql_logging_stats():
+    """Get per-query latency histograms for this worker (admin only)."""
+    if not session.get('user_id') or not session.get('is_admin'):
+        return jsonify({'error': 'Unauthorized'}), 403
+    
+    try:
+        if not SQL_LOGGER_AVAILABLE:
+            return jsonify({'error': 'SQL Logger not available'}), 500
+        
+        sort = request.args.get('sort', 'total_ms')
+        limit = min(int(request.args.get('limit', 50)), 500)
+        
+        stats = sql_logger.get_query_stats(sort=sort, limit=limit)
+        return jsonify({'success': True, **stats})
+        
+    except Exception as e:
+        logger.error(f"Error getting SQL query stats: {e}", exc_info=True)
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/admin/api/sql-logging/reset', methods=['POST'])
+def admin_reset_sql_logging_stats():
+    """Reset per-query latency histograms for this worker (admin only)."""
+    if not session.get('user_id') or not session.get('is_admin'):
+        return jsonify({'error': 'Unauthorized'}), 403
+    
+    try:
+        if not SQL_LOGGER_AVAILABLE:
+            return jsonify({'error': 'SQL Logger not available'}), 500
+        
+        sql_logger.reset_query_stats()
+        logger.info(f"Admin user {session.get('user_id')} reset SQL query stats")
+        return jsonify({'success': True, 'message': 'SQL query stats reset'})
+        
+    except Exception as e:
+        logger.error(f"Error resetting SQL query stats: {e}", exc_info=True)
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/admin/api/sql-logging/enable', methods=['POST'])
 def admin_enable_sql_logging():
     """Enable SQL query logging (admin only)."""
@@ -9677,9 +9836,11 @@ def admin_compute_cost():
                     VALUES ('compute_cost_per_second', %s, 'decimal', 'Cost per second for compute operations')
                     ON DUPLICATE KEY UPDATE setting_value = VALUES(setting_value)
                 """, (str(cost_per_second),))
+                pricing_registry.bump_version(cursor)
                 
                 connection.commit()
                 cursor.close()
+            pricing_registry.invalidate()
             
             logger.info(f"Admin updated compute cost to ${cost_per_second}/second")
             
@@ -9762,9 +9923,11 @@ def admin_add_ai_cost():
                 output_token_cost_per_million_tokens = VALUES(output_token_cost_per_million_tokens),
                 updated_at = NOW()
             """, (vendor, model, input_cost, output_cost))
+            pricing_registry.bump_version(cursor)
             
             connection.commit()
             cursor.close()
+        pricing_registry.invalidate()
         
         logger.info(f"Admin added/updated AI cost: {vendor}/{model}")
         
@@ -9862,9 +10025,11 @@ def update_ai_cost(cost_id):
                     updated_at = NOW()
                 WHERE id = %s
             """, (vendor, model, input_cost, output_cost, cost_id))
+            pricing_registry.bump_version(cursor)
             
             connection.commit()
             cursor.close()
+            pricing_registry.invalidate()
             
             logger.info(f"Admin updated AI cost ID {cost_id}: {vendor}/{model}")
             
@@ -9908,8 +10073,10 @@ def delete_ai_cost(cost_id):
             
             # Delete the entry
             cursor.execute("DELETE FROM ai_api_cost WHERE id = %s", (cost_id,))
+            pricing_registry.bump_version(cursor)
             connection.commit()
             cursor.close()
+            pricing_registry.invalidate()
             
             logger.info(f"Admin deleted AI cost ID {cost_id}: {vendor}/{model}")
             
@@ -10037,6 +10204,7 @@ def admin_add_weekly_credits():
             users_updated = cursor.rowcount
             connection.commit()
             cursor.close()
+        credit_ledger.invalidate_balance()
         
         logger.info(f"Admin added $5 credits to {users_updated} users")
         
@@ -10331,40 +10499,8 @@ def about():
 def check_transcription_status(space_id):
     """Check if there's a pending/in-progress transcription job for a space."""
     try:
-        from pathlib import Path
-        import json
-        
-        transcript_jobs_dir = Path('./transcript_jobs')
-        
-        if not transcript_jobs_dir.exists():
-            return jsonify({
-                'has_pending_job': False,
-                'status': None,
-                'job_id': None
-            })
-        
-        # Check for existing job
-        for job_file in transcript_jobs_dir.glob('*.json'):
-            try:
-                with open(job_file, 'r') as f:
-                    job_data = json.load(f)
-                    if (job_data.get('space_id') == space_id and 
-                        job_data.get('status') in ['pending', 'in_progress', 'processing']):
-                        return jsonify({
-                            'has_pending_job': True,
-                            'status': job_data.get('status'),
-                            'job_id': job_data.get('id'),
-                            'created_at': job_data.get('created_at'),
-                            'language': job_data.get('language', 'en')
-                        })
-            except Exception as e:
-                logger.error(f"Error reading transcript job file {job_file}: {e}")
-        
-        return jsonify({
-            'has_pending_job': False,
-            'status': None,
-            'job_id': None
-        })
+        payload, status_code = build_transcription_status_payload(space_id)
+        return jsonify(payload), status_code
         
     except Exception as e:
         logger.error(f"Error checking transcription status for space {space_id}: {e}")
@@ -10501,34 +10637,16 @@ def transcribe_space(space_id):
         from pathlib import Path
         import datetime
         
-        # Create transcript_jobs directory if it doesn't exist
-        os.makedirs('./transcript_jobs', exist_ok=True)
-        
         # Check for existing pending or in-progress jobs for this space
-        transcript_jobs_dir = Path('./transcript_jobs')
-        existing_job = None
-        
-        if transcript_jobs_dir.exists():
-            for job_file in transcript_jobs_dir.glob('*.json'):
-                try:
-                    with open(job_file, 'r') as f:
-                        job_data = json.load(f)
-                        # Check if this job is for the same space and is still pending/in_progress/processing
-                        if (job_data.get('space_id') == space_id and 
-                            job_data.get('status') in ['pending', 'in_progress', 'processing']):
-                            existing_job = job_data
-                            logger.warning(f"Found existing job {job_data.get('id')} for space {space_id} with status {job_data.get('status')}")
-                            break
-                except Exception as e:
-                    logger.error(f"Error reading job file {job_file}: {e}")
+        existing_job = transcription_queue.find_active(space_id)
         
         # If there's already a pending/in_progress job, don't create a new one
         if existing_job:
-            logger.warning(f"Rejecting duplicate transcription request for space {space_id} - existing job: {existing_job.get('id')}")
+            logger.warning(f"Rejecting duplicate transcription request for space {space_id} - existing job: {existing_job.get('job_id')}")
             if request.is_json:
                 return jsonify({
                     'error': 'A transcription job is already in progress for this space',
-                    'existing_job_id': existing_job.get('id'),
+                    'existing_job_id': existing_job.get('job_id'),
                     'status': existing_job.get('status')
                 }), 409  # Conflict
             flash('A transcription job is already pending or in progress for this space. Please wait for it to complete.', 'warning')
@@ -10554,10 +10672,15 @@ def transcribe_space(space_id):
             'user_id': user_id  # Include user_id for cost tracking in background process
         }
         
-        # Save job data to file
-        job_file = Path(f'./transcript_jobs/{job_id}.json')
-        with open(job_file, 'w') as f:
-            json.dump(job_data, f)
+        # Reuse the transcript streamed during the download when its language fits
+        live_transcript = load_live_transcript(space_id)
+        if live_transcript and live_transcript.get('status') == 'completed':
+            streamed_language = live_transcript.get('language') or ''
+            if detect_language or streamed_language == language.split('-')[0].lower():
+                job_data['use_streamed_transcript'] = True
+        
+        # Queue the job for the transcription worker
+        transcription_queue.enqueue(job_data)
             
         # API response or redirect based on request type
         if request.is_json:
@@ -10649,61 +10772,40 @@ def queue_translation():
                 'existing_language': existing_translation['language']
             }), 409
         
-        # Create translation jobs directory if it doesn't exist
-        os.makedirs('/var/www/production/xspacedownload.com/website/htdocs/translation_jobs', exist_ok=True)
+        # Paid users' jobs are claimed first
+        priority = PRIORITY_NORMAL
+        try:
+            cursor = space.connection.cursor()
+            try:
+                cursor.execute(
+                    "SELECT 1 FROM credit_txn WHERE user_id = %s AND payment_status = 'completed' LIMIT 1",
+                    (user_id,)
+                )
+                if cursor.fetchone():
+                    priority = PRIORITY_PAID
+            finally:
+                cursor.close()
+        except Exception as e:
+            logger.warning(f"Could not check purchases for translation priority: {e}")
         
-        # Check for existing pending jobs
-        from pathlib import Path
-        translation_jobs_dir = Path('/var/www/production/xspacedownload.com/website/htdocs/translation_jobs')
-        existing_job = None
+        translator = get_translate_component()
+        provider = translator.ai.get_provider_name().lower() if translator and translator.ai else ''
         
-        if translation_jobs_dir.exists():
-            for job_file in translation_jobs_dir.glob('*.json'):
-                try:
-                    with open(job_file, 'r') as f:
-                        job_data = json.load(f)
-                        if (job_data.get('space_id') == space_id and 
-                            job_data.get('target_lang') == target_lang_formatted and
-                            job_data.get('status') in ['pending', 'in_progress']):
-                            existing_job = job_data
-                            break
-                except Exception as e:
-                    logger.error(f"Error reading translation job file {job_file}: {e}")
+        # Queue the job; an identical job already queued or running is returned instead
+        job, created = translation_queue.enqueue(space_id, user_id, source_lang, target_lang_formatted,
+                                                 transcript['transcript'], priority=priority, provider=provider)
         
-        if existing_job:
+        if not created:
             return jsonify({
                 'error': 'Translation job already in progress',
-                'job_id': existing_job.get('id'),
-                'status': existing_job.get('status')
+                'job_id': job['id'],
+                'status': job['status']
             }), 409
         
-        # Create translation job
-        import uuid
-        import datetime
-        
-        job_id = str(uuid.uuid4())
-        job_data = {
-            'id': job_id,
-            'space_id': space_id,
-            'user_id': user_id,
-            'source_lang': source_lang,
-            'target_lang': target_lang_formatted,
-            'transcript_text': transcript['transcript'],
-            'status': 'pending',
-            'progress': 0,
-            'created_at': datetime.datetime.now().isoformat(),
-            'updated_at': datetime.datetime.now().isoformat()
-        }
-        
-        # Save job file
-        job_file = Path(f'/var/www/production/xspacedownload.com/website/htdocs/translation_jobs/{job_id}.json')
-        with open(job_file, 'w') as f:
-            json.dump(job_data, f)
-        
-        logger.info(f"Created translation job {job_id} for space {space_id} to {target_lang_formatted}")
+        logger.info(f"Created translation job {job['id']} for space {space_id} to {target_lang_formatted}")
         
         return jsonify({
-            'job_id': job_id,
+            'job_id': job['id'],
             'status': 'pending',
             'message': 'Translation job queued for background processing'
         })
@@ -10,6 +10,7 @@ import logging
 import argparse
 import traceback
 import threading
+import socket
 from pathlib import Path
 from datetime import datetime
 
@@ -40,11 +41,18 @@ except Exception as e:
 # Import components
 try:
     from components.SpeechToText import SpeechToText
+    from components.SpeechModelCache import SpeechModelCache
+    from components.TranscriptionQueue import TranscriptionQueue, job_model
+    from components.StreamingTranscriber import load_live_transcript
     from components.AICost import AICost
+    from components.AudioChunker import ffmpeg_available
 except ImportError as e:
     logger.error(f"Failed to import required components: {e}")
     sys.exit(1)
 
+from components.SearchIndex import update_transcript_index
+from components.KeywordIndex import keyword_index, update_keyword_index
+
 def check_existing_transcript(space_id, language):
     """
     Check if a transcript already exists for the given space and language.
@@ -328,183 +336,31 @@ def save_tags_to_database(space_id, tags):
 
 def generate_and_save_tags(space_id, transcript_text):
     """
-    Generate topic-focused tags from transcript using improved keyword extraction.
+    Generate topic-focused tags from transcript without AI calls.
+    
+    Terms are scored by TF-IDF against the keyword index, so subjects that
+    set this Space apart from the rest of the corpus become tags.
     
     Args:
         space_id (str): The space ID
         transcript_text (str): The transcript text
     """
     try:
-        import re
-        from collections import Counter
-        
-        logger.info(f"Generating tags for space {space_id} using topic-focused extraction")
-        
-        # Topic-focused tag extraction 
-        # Focus on: business terms, technology, concepts, subjects, NOT conversation
-        
-        # Step 1: Extract potential topic phrases and compound terms
-        text = transcript_text.lower()
-        
-        # Common business/technology/subject terms (these are GOOD for tags)
-        topic_keywords = {
-            # Business terms
-            'business', 'sales', 'marketing', 'strategy', 'revenue', 'profit', 'growth',
-            'customer', 'client', 'service', 'product', 'brand', 'market', 'industry',
-            'company', 'startup', 'entrepreneur', 'investment', 'finance', 'budget',
-            'leadership', 'management', 'team', 'project', 'development', 'innovation',
-            'competition', 'analysis', 'planning', 'operations', 'logistics',
-            
-            # Technology terms
-            'technology', 'software', 'hardware', 'platform', 'system', 'application',
-            'digital', 'online', 'internet', 'website', 'mobile', 'cloud', 'data',
-            'analytics', 'algorithm', 'automation', 'programming', 'coding', 'development',
-            'artificial', 'intelligence', 'machine', 'learning', 'cybersecurity', 'security',
-            'blockchain', 'cryptocurrency', 'bitcoin', 'ethereum', 'nft', 'metaverse',
-            
-            # Subject areas
-            'education', 'health', 'medicine', 'science', 'research', 'psychology',
-            'philosophy', 'politics', 'economics', 'finance', 'environment', 'climate',
-            'energy', 'sustainability', 'transportation', 'communication', 'media',
-            'entertainment', 'sports', 'fitness', 'nutrition', 'travel', 'culture',
-            'art', 'music', 'literature', 'history', 'geography', 'language'
-        }
-        
-        # Book/Product titles and proper nouns (keep capitalization)
-        proper_nouns = re.findall(r'\b[A-Z][a-z]*(?:\s+[A-Z][a-z]*){0,3}\b', transcript_text)
-        
-        # Filter proper nouns to likely be topics (not just names)
-        topic_proper_nouns = []
-        for noun in proper_nouns:
-            noun_lower = noun.lower()
-            # Include if it contains topic keywords or seems like a title/concept
-            if (any(keyword in noun_lower for keyword in topic_keywords) or
-                len(noun.split()) > 1 or  # Multi-word terms likely topics
-                any(word in noun_lower for word in ['edge', 'guide', 'system', 'method', 'strategy', 'solution'])):
-                topic_proper_nouns.append(noun)
-        
-        # Step 2: Extract compound terms (e.g., "artificial intelligence", "machine learning")
-        compound_terms = []
-        words = text.split()
-        
-        for i in range(len(words) - 1):
-            word1, word2 = words[i], words[i + 1]
-            compound = f"{word1} {word2}"
-            
-            # Include if both words are topic-related
-            if (word1 in topic_keywords and word2 in topic_keywords) or \
-               (any(keyword in compound for keyword in ['artificial intelligence', 'machine learning', 
-                    'cyber security', 'data science', 'digital marketing', 'social media',
-                    'user experience', 'content marketing', 'email marketing', 'search engine'])):
-                compound_terms.append(compound)
+        logger.info(f"Generating tags for space {space_id} using the corpus keyword index")
         
-        # Step 3: Extract single topic words that appear frequently
-        topic_words = []
-        word_freq = Counter(re.findall(r'\b[a-z]{4,}\b', text))
-        
-        for word, count in word_freq.most_common(50):
-            if count >= 2 and word in topic_keywords:
-                topic_words.append(word)
-        
-        # Step 4: Look for book/product mentions specifically 
-        book_patterns = [
-            r'book\s+called\s+([A-Z][A-Za-z\s]{5,25})',  # "book called The AI Edge"
-            r'called\s+([A-Z][A-Za-z\s]{5,25})',  # "called The Sales Strategy"
-            r'\bthe\s+([A-Z][A-Z\s]{2,15})\b',  # "the AI EDGE" (all caps titles)
-        ]
-        
-        book_mentions = []
-        for pattern in book_patterns:
-            matches = re.findall(pattern, transcript_text)
-            for match in matches:
-                match = match.strip()
-                # Clean up the match - remove trailing words that don't belong
-                words = match.split()
-                clean_words = []
-                for word in words:
-                    # Stop at common non-title words
-                    if word.lower() in ['and', 'the', 'is', 'are', 'was', 'were', 'on', 'at', 'by', 'to', 'of', 'that', 'this', 'we', 'it']:
-                        if len(clean_words) == 0:  # Skip leading articles
-                            continue
-                        else:  # Stop at trailing articles/connectors
-                            break
-                    clean_words.append(word)
-                
-                if len(clean_words) >= 2 and len(clean_words) <= 4:  # 2-4 word titles
-                    clean_match = ' '.join(clean_words)
-                    if clean_match not in book_mentions:
-                        book_mentions.append(clean_match)
-        
-        # Step 5: Combine and rank all candidates
-        all_candidates = []
-        
-        # Add proper nouns (high priority)
-        for noun in topic_proper_nouns[:5]:
-            all_candidates.append((noun, 3))
-        
-        # Add compound terms (high priority)
-        compound_freq = Counter(compound_terms)
-        for term, count in compound_freq.most_common(5):
-            all_candidates.append((term, count * 2))
-        
-        # Add book mentions (high priority)
-        for book in book_mentions[:3]:
-            all_candidates.append((book, 4))
-        
-        # Add single topic words (medium priority)
-        for word in topic_words[:8]:
-            all_candidates.append((word, word_freq[word]))
-        
-        # Step 6: Final selection and cleanup
-        seen = set()
-        final_tags = []
-        
-        # Sort by priority score
-        all_candidates.sort(key=lambda x: x[1], reverse=True)
-        
-        for candidate, score in all_candidates:
-            candidate_clean = candidate.strip().lower()
-            
-            # Skip duplicates and very short terms
-            if candidate_clean in seen or len(candidate_clean) < 3:
-                continue
-            
-            # Skip low-quality phrases (those containing too many stop words)
-            words_in_candidate = candidate_clean.split()
-            stop_word_ratio = sum(1 for word in words_in_candidate if word in ['the', 'and', 'of', 'to', 'that', 'this', 'we', 'are', 'is', 'was', 'were', 'actually']) / len(words_in_candidate)
-            if stop_word_ratio > 0.5:  # More than half stop words
-                continue
-            
-            # Skip phrases that end with common connecting words
-            if candidate_clean.endswith((' and', ' of', ' to', ' that', ' this', ' we', ' are', ' is', ' was', ' were', ' actually')):
-                continue
-            
-            # Skip if it's just a subset of existing tag
-            is_subset = False
-            for existing in final_tags:
-                if candidate_clean in existing.lower() or existing.lower() in candidate_clean:
-                    is_subset = True
-                    break
-            
-            if not is_subset:
-                final_tags.append(candidate)
-                seen.add(candidate_clean)
-                
-            if len(final_tags) >= 8:  # Limit to 8 high-quality tags
-                break
+        tags = keyword_index.suggest_tags(transcript_text, max_tags=8)
         
         # If we have very few tags, this might be a very conversational transcript
-        if len(final_tags) < 3:
-            logger.warning(f"Only found {len(final_tags)} topic tags for space {space_id}, transcript may be too conversational")
+        if len(tags) < 3:
+            logger.warning(f"Only found {len(tags)} topic tags for space {space_id}, transcript may be too conversational")
+            text = transcript_text.lower()
             # Add a generic tag based on any business terms found
             if any(word in text for word in ['sales', 'business', 'market']):
-                final_tags.append('business discussion')
+                tags.append('business discussion')
             elif any(word in text for word in ['technology', 'tech', 'software', 'digital']):
-                final_tags.append('technology discussion')
+                tags.append('technology discussion')
             else:
-                final_tags.append('general discussion')
-        
-        tags = final_tags
+                tags.append('general discussion')
         
         if tags:
             logger.info(f"Generated {len(tags)} topic-focused tags for space {space_id}: {tags}")
@@ -574,6 +430,8 @@ def save_transcript_to_db(space_id, transcript_text, language="en-US"):
             """
             cursor.execute(update_query, (transcript_text, existing[0]))
             connection.commit()
+            update_transcript_index(space_id, language, transcript_text)
+            update_keyword_index(space_id, language, transcript_text)
             return existing[0]
         else:
             # Insert new
@@ -584,7 +442,10 @@ def save_transcript_to_db(space_id, transcript_text, language="en-US"):
             """
             cursor.execute(insert_query, (space_id, language, transcript_text))
             connection.commit()
-            return cursor.lastrowid
+            transcript_id = cursor.lastrowid
+            update_transcript_index(space_id, language, transcript_text)
+            update_keyword_index(space_id, language, transcript_text)
+            return transcript_id
             
     except Exception as e:
         logger.error(f"Error saving transcript to database: {e}")
@@ -623,6 +484,25 @@ class TranscriptionWorker:
         self.stt = None
         self.running = True
         
+        # Jobs live in the SQLite queue; the JSON files in status_dir are mirrors
+        self.queue = TranscriptionQueue(mirror_dir=self.status_dir)
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.stale_job_seconds = 600
+        self.archive_after_seconds = 7 * 86400
+        self.last_maintenance = 0
+        
+        # Keep recently used models loaded so alternating jobs do not reload weights
+        transcription_config = self._load_transcription_config()
+        self.default_model = transcription_config.get('default_model', 'tiny')
+        self.model_cache = SpeechModelCache(
+            factory=SpeechToText,
+            max_models=int(transcription_config.get('model_cache_size', 2)),
+            memory_budget_mb=transcription_config.get('model_cache_memory_mb')
+        )
+        # Consecutive jobs run on the current model before the oldest job goes next
+        self.model_batch_limit = int(transcription_config.get('model_batch_limit', 10))
+        self.model_streak = 0
+        
         # Set up signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self.handle_shutdown)
         signal.signal(signal.SIGTERM, self.handle_shutdown)
@@ -636,7 +516,7 @@ class TranscriptionWorker:
     
     def check_job_cancellation(self, job_id):
         """
-        Check if a job has been cancelled by reading its status file.
+        Check if a job has been cancelled, refreshing this worker's heartbeat.
         
         Args:
             job_id (str): The job ID to check
@@ -645,57 +525,77 @@ class TranscriptionWorker:
             bool: True if job is cancelled, False otherwise
         """
         try:
-            job_file = self.status_dir / f"{job_id}.json"
-            if not job_file.exists():
-                return False
-                
-            with open(job_file, 'r') as f:
-                job_data = json.load(f)
-                
-            status = job_data.get('status', '')
-            if status == 'cancelled':
+            if self.queue.heartbeat(job_id, self.worker_id):
                 logger.info(f"Job {job_id} detected as cancelled")
                 return True
-                
-            # Also check for cancellation signal files created by admin
-            signal_file = Path(f'./temp/cancel_{job_id}.signal')
-            if signal_file.exists():
-                logger.info(f"Job {job_id} cancellation signal file detected")
-                # Update job status to cancelled
-                self.update_job_status(job_id, 'cancelled', error='Job cancelled by admin')
-                # Remove signal file
-                try:
-                    signal_file.unlink()
-                except:
-                    pass
-                return True
-                
             return False
             
         except Exception as e:
             logger.warning(f"Error checking cancellation for job {job_id}: {e}")
             return False
     
+    def _load_transcription_config(self):
+        """Load transcription_config.json, returning {} if it is missing or invalid."""
+        try:
+            with open('transcription_config.json', 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Failed to load transcription_config.json: {e}")
+            return {}
+    
     def load_speech_to_text(self, model_name='tiny'):
         """
         Load the SpeechToText component with the specified model.
         
+        Models come from the worker's LRU model cache, so switching back to a
+        recently used model does not reload its weights.
+        
         Args:
             model_name (str): The Whisper model to load (tiny, base, small, medium, large)
             
         Returns:
             bool: True if loaded successfully, False otherwise
         """
-        if self.stt is None or self.stt.model_name != model_name:
-            try:
-                logger.info(f"Loading SpeechToText model: {model_name}")
-                self.stt = SpeechToText(model_name=model_name)
-                return True
-            except Exception as e:
-                logger.error(f"Failed to load SpeechToText: {e}")
-                return False
+        stt = self.model_cache.get(model_name)
+        if stt is None:
+            logger.error(f"Failed to load SpeechToText model: {model_name}")
+            return False
+        self.stt = stt
         return True
     
+    @staticmethod
+    def get_job_model(job_data):
+        """Get the model a job asked for (direct 'model' field or nested in 'options')."""
+        return job_model(job_data)
+    
+    def claim_next_job(self):
+        """
+        Claim the next job from the queue, grouping jobs for the loaded model.
+        
+        Jobs for the most recently used model run back to back, up to
+        model_batch_limit in a row; otherwise the oldest job goes next. The
+        claim is atomic in the queue, so several workers never take the same job.
+        
+        Returns:
+            dict: Claimed job, or None if the queue is empty
+        """
+        current_model = self.model_cache.most_recent()
+        prefer_model = current_model if self.model_streak < self.model_batch_limit else None
+        
+        job = self.queue.claim(self.worker_id, prefer_model=prefer_model)
+        if job is None:
+            return None
+        
+        if self.get_job_model(job) != current_model:
+            self.model_streak = 0
+        elif prefer_model:
+            self.model_streak += 1
+        else:
+            self.model_streak = 1
+        return job
+    
     def create_job(self, space_id, language='en-US', model='base', detect_language=False, 
                   translate_to=None, callback_url=None):
         """
@@ -732,11 +632,7 @@ class TranscriptionWorker:
             'error': None
         }
         
-        # Save job data to file
-        job_file_path = self.status_dir / f"{job_id}.json"
-        
-        with open(job_file_path, 'w') as f:
-            json.dump(job_data, f, indent=4)
+        self.queue.enqueue(job_data)
         
         logger.info(f"Created transcription job {job_id} for space {space_id}")
             
@@ -753,31 +649,11 @@ class TranscriptionWorker:
             result (dict, optional): Result data if completed
             error (str, optional): Error message if failed
         """
-        job_file = self.status_dir / f"{job_id}.json"
-        
-        if not job_file.exists():
-            logger.error(f"Job file not found: {job_file}")
-            return False
-        
         try:
-            with open(job_file, 'r') as f:
-                job_data = json.load(f)
-            
-            job_data['status'] = status
-            job_data['updated_at'] = datetime.now().isoformat()
-            
-            if progress is not None:
-                job_data['progress'] = progress
-            
-            if result is not None:
-                job_data['result'] = result
-            
-            if error is not None:
-                job_data['error'] = error
-            
-            with open(job_file, 'w') as f:
-                json.dump(job_data, f, indent=4)
-            
+            if not self.queue.update(job_id, status, progress=progress, result=result, error=error,
+                                     worker_id=self.worker_id):
+                logger.warning(f"Job {job_id} not updated to {status} (cancelled or no longer held by this worker)")
+                return False
             return True
         except Exception as e:
             logger.error(f"Error updating job status: {e}")
@@ -793,15 +669,11 @@ class TranscriptionWorker:
         Returns:
             dict: Job status data or None if not found
         """
-        job_file = self.status_dir / f"{job_id}.json"
-        
-        if not job_file.exists():
-            logger.error(f"Job file not found: {job_file}")
-            return None
-        
         try:
-            with open(job_file, 'r') as f:
-                return json.load(f)
+            job = self.queue.get(job_id)
+            if job is None:
+                logger.error(f"Job not found: {job_id}")
+            return job
         except Exception as e:
             logger.error(f"Error reading job status: {e}")
             return None
@@ -813,28 +685,20 @@ class TranscriptionWorker:
         Returns:
             list: List of pending job data
         """
-        pending_jobs = []
-        
         try:
-            json_files = list(self.status_dir.glob('*.json'))
-            
-            for job_file in json_files:
-                try:
-                    with open(job_file, 'r') as f:
-                        job_data = json.load(f)
-                        
-                    status = job_data.get('status', 'unknown')
-                    
-                    if status == 'pending':
-                        pending_jobs.append(job_data)
-                        
-                except Exception as e:
-                    logger.error(f"Error reading job file {job_file}: {e}")
-                    
+            return self.queue.list_jobs(statuses=['pending'], limit=1000)
         except Exception as e:
-            logger.error(f"Error listing directory: {e}")
-        
-        return pending_jobs
+            logger.error(f"Error listing pending jobs: {e}")
+            return []
+    
+    def run_maintenance(self):
+        """Requeue jobs from dead workers and archive old finished jobs."""
+        try:
+            self.queue.requeue_stale(self.stale_job_seconds)
+            self.queue.archive_finished(self.archive_after_seconds)
+        except Exception as e:
+            logger.error(f"Error during queue maintenance: {e}")
+        self.last_maintenance = time.time()
     
     def process_job(self, job_data):
         """
@@ -869,7 +733,7 @@ class TranscriptionWorker:
             
             # Load the right model
             # Handle both direct 'model' field and nested in 'options'
-            model = job_data.get('model') or job_data.get('options', {}).get('model', 'tiny')
+            model = self.get_job_model(job_data)
             
             if not self.load_speech_to_text(model_name=model):
                 logger.error(f"Failed to load model: {model}")
@@ -921,12 +785,23 @@ class TranscriptionWorker:
                 'language': language,
                 'detect_language': detect_language,
                 'verbose': True,
-                'include_timecodes': include_timecodes
+                'include_timecodes': include_timecodes,
+                # Reuse an earlier transcription of identical audio unless the job opts out
+                'use_cache': job_data.get('use_cache', job_options.get('use_cache', True))
             }
             
             if translate_to:
                 options['translate_to'] = translate_to
             
+            # Use the transcript streamed while the Space downloaded, if the job points to one
+            if job_data.get('use_streamed_transcript'):
+                live_transcript = load_live_transcript(space_id)
+                if live_transcript and live_transcript.get('status') == 'completed' and live_transcript.get('result'):
+                    logger.info(f"Using streamed transcript for space {space_id}")
+                    options['prepared_result'] = live_transcript['result']
+                else:
+                    logger.warning(f"Streamed transcript for space {space_id} is not available, transcribing audio")
+            
             # Check if transcript already exists in database before processing
             target_language = translate_to if translate_to else language
             if target_language and len(target_language) == 2:
@@ -983,11 +858,31 @@ class TranscriptionWorker:
             
             # Start progress tracking thread
             transcription_complete = threading.Event()
+            # Set once chunked transcription reports real progress; the time-based
+            # estimate stops overwriting it from then on
+            chunk_progress_reported = threading.Event()
+            
+            def update_chunk_progress(completed_chunks, total_chunks):
+                """Report progress as chunks of a large file complete."""
+                chunk_progress_reported.set()
+                progress = int(15 + (completed_chunks / max(total_chunks, 1)) * 65)  # 15% to 80%
+                self.update_job_status(job_id, 'processing', progress=progress, result={
+                    'estimated_audio_minutes': estimated_audio_minutes,
+                    'chunks_completed': completed_chunks,
+                    'chunks_total': total_chunks
+                })
+                logger.info(f"Transcription progress: {progress}% ({completed_chunks}/{total_chunks} chunks)")
             
             def update_progress_during_transcription():
                 """Update progress periodically during transcription."""
                 start_time = time.time()
                 while not transcription_complete.is_set():
+                    if chunk_progress_reported.is_set():
+                        # Chunk callbacks report progress; keep the job's heartbeat fresh
+                        self.queue.heartbeat(job_id, self.worker_id)
+                        if transcription_complete.wait(30):
+                            break
+                        continue
                     elapsed = time.time() - start_time
                     progress_ratio = min(elapsed / estimated_seconds, 0.9)  # Cap at 90%
                     progress = int(15 + (progress_ratio * 65))  # 15% to 80%
@@ -1025,7 +920,11 @@ class TranscriptionWorker:
                     return False
                 
                 # Perform the actual transcription - NO DATABASE CONNECTION NEEDED
-                result = self.stt.transcribe(audio_path, **options)
+                self.stt.progress_callback = update_chunk_progress
+                try:
+                    result = self.stt.transcribe(audio_path, **options)
+                finally:
+                    self.stt.progress_callback = None
                 
                 transcription_end_time = time.time()
                 transcription_duration = transcription_end_time - transcription_start_time
@@ -1036,7 +935,9 @@ class TranscriptionWorker:
                     user_id = job_data.get('user_id')
                     
                     # Track costs if user_id is available
-                    if user_id and user_id > 0:
+                    if isinstance(result, dict) and result.get('cached'):
+                        logger.info("Skipping cost tracking - transcription served from cache")
+                    elif user_id and user_id > 0:
                         # Check if this was an OpenAI transcription
                         model_used = job_data.get('model', 'tiny')
                         stt_provider = getattr(self.stt, 'provider', 'local')
@@ -1059,10 +960,20 @@ class TranscriptionWorker:
                             
                             # Add language detection cost to transcription if it was performed
                             language_detection_tokens = 0
-                            if job_data.get('detect_language', False):
-                                # Add estimated language detection cost (roughly 200 input tokens + 5 output tokens)
-                                language_detection_tokens = 205
-                                input_tokens += language_detection_tokens
+                            language_id = result.get('language_identification') or {}
+                            for clip in language_id.get('api_clips', []):
+                                # Each clip transcribed to identify the language is a billed request
+                                clip_input, clip_output = ai_cost.estimate_transcription_tokens(
+                                    clip['seconds'], clip['characters']
+                                )
+                                input_tokens += clip_input
+                                output_tokens += clip_output
+                                language_detection_tokens += clip_input + clip_output
+                            if job_data.get('detect_language', False) and not language_id.get('language'):
+                                # Add estimated text language detection cost (roughly 200 input tokens + 5 output tokens)
+                                language_detection_tokens += 205
+                                input_tokens += 205
+                            if language_detection_tokens:
                                 logger.info(f"Including language detection cost in transcription: ~{language_detection_tokens} tokens")
                             
                             # Track cost using unified AICost component
@@ -1075,7 +986,9 @@ class TranscriptionWorker:
                                 output_tokens=output_tokens,
                                 user_id=user_id,
                                 cookie_id=None,
-                                deduct_credits=True
+                                deduct_credits=True,
+                                # A requeued job keeps its id, so its charge is applied once
+                                idempotency_key=f"transcription-job:{job_id}"
                             )
                             
                             if success:
@@ -1156,9 +1069,9 @@ class TranscriptionWorker:
                                           result={"text_sample": transcript_text[:500] + "..."})
                     return False
                 
-                # Always run AI language detection on the transcript text for accuracy
-                # This ensures we get the correct language even if Whisper misdetected it
-                logger.info(f"Running AI language detection on transcript for space {space_id}")
+                # Run AI language detection on the transcript text unless the language was
+                # already identified from the audio; this catches a Whisper misdetection
+                identified = (result.get("language_identification") or {}).get("language")
                 try:
                     # Use AI to detect language from a sample of the transcript
                     sample_text = transcript_text[:1000]  # Use first 1000 chars for detection
@@ -1167,19 +1080,23 @@ class TranscriptionWorker:
                     ai_config_exists = False
                     ai_provider = None
                     
-                    try:
-                        with open("mainconfig.json", 'r') as f:
-                            main_config = json.load(f)
-                            
-                        # Check if AI is configured
-                        ai_config = main_config.get('ai', {})
-                        if ai_config.get('provider'):
-                            ai_config_exists = True
-                            ai_provider = ai_config['provider']
-                    except:
-                        pass
+                    if not identified:
+                        logger.info(f"Running AI language detection on transcript for space {space_id}")
+                        try:
+                            with open("mainconfig.json", 'r') as f:
+                                main_config = json.load(f)
+                                
+                            # Check if AI is configured
+                            ai_config = main_config.get('ai', {})
+                            if ai_config.get('provider'):
+                                ai_config_exists = True
+                                ai_provider = ai_config['provider']
+                        except:
+                            pass
                     
-                    if ai_config_exists and ai_provider == 'openai':
+                    if identified:
+                        logger.info(f"Language {identified} was identified from the audio, skipping transcript language detection")
+                    elif ai_config_exists and ai_provider == 'openai':
                         from components.OpenAI import OpenAI
                         api_key = os.environ.get('OPENAI_API_KEY') or ai_config.get('openai', {}).get('api_key')
                         model = ai_config.get('openai', {}).get('model', 'gpt-4o-mini')
@@ -1360,8 +1277,9 @@ Language code:"""
                 if "detected_language" in result:
                     result_data["detected_language"] = result["detected_language"]
                 
-                # Mark job as completed
-                self.update_job_status(job_id, 'completed', progress=100, result=result_data)
+                # Mark job as completed; a worker that lost the job does not notify the user again
+                if not self.update_job_status(job_id, 'completed', progress=100, result=result_data):
+                    return False
                 logger.info(f"Transcription job {job_id} completed successfully")
                 
                 # Send email notification
@@ -1445,25 +1363,39 @@ Language code:"""
         """Run the worker loop."""
         logger.info("Transcription worker starting")
         
+        # Chunking, language identification and voice activity detection all run ffmpeg
+        if not ffmpeg_available():
+            logger.error("ffmpeg/ffprobe not found on PATH: long recordings cannot be chunked "
+                         "for the OpenAI API; install ffmpeg before processing jobs")
+        
+        # Load the default model now so the first job does not wait for it
+        if self.model_cache.preload(self.default_model):
+            logger.info(f"Preloaded default model: {self.default_model}")
+        
+        # Pick up job files written before the queue database existed
+        try:
+            self.queue.import_job_files(self.status_dir)
+        except Exception as e:
+            logger.error(f"Error importing job files: {e}")
+        
         while self.running:
             try:
-                # Get pending jobs
-                pending_jobs = self.get_pending_jobs()
+                if time.time() - self.last_maintenance > 300:
+                    self.run_maintenance()
                 
-                if pending_jobs:
-                    # Process the first pending job
-                    job = pending_jobs[0]
+                # Prefer jobs for the model that is already loaded
+                job = self.claim_next_job()
+                
+                if job:
                     job_id = job.get('job_id') or job.get('id')
                     space_id = job.get('space_id', 'unknown')
                     logger.info(f"Processing transcription job {job_id} for space {space_id}")
                     
-                    # Check if job was cancelled before processing
-                    if self.check_job_cancellation(job_id):
-                        logger.info(f"Skipping cancelled job {job_id}")
-                        continue
-                    
-                    # Process the job
-                    self.process_job(job)
+                    # Process the job, then look for the next one straight away. Heartbeats
+                    # cover the whole job, including tagging and translation after transcription.
+                    with self.queue.keep_alive(job_id, self.worker_id):
+                        self.process_job(job)
+                    continue
                 
                 # Wait before checking for more jobs
                 time.sleep(5)
@@ -1472,6 +1404,7 @@ Language code:"""
                 logger.error(f"Error in worker loop: {e}")
                 time.sleep(10)  # Wait longer if there was an error
         
+        self.model_cache.clear()
         logger.info("Transcription worker stopped")
 
 def main():
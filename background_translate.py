@@ -2,15 +2,18 @@
 """
 Background Translation Worker
 
-Processes translation jobs from the translation_jobs directory.
+Processes queued translation jobs from the translation job table
+(components/TranslationQueue.py) on a pool of concurrent workers, with a
+cap per AI provider (see "translation_worker" in mainconfig.json).
 """
 
 import os
 import sys
 import json
-import time
+import signal
 import logging
 import datetime
+import threading
 from pathlib import Path
 
 # Load environment variables
@@ -24,6 +27,8 @@ sys.path.insert(0, project_dir)
 # Import components
 from components.Translate import Translate
 from components.DatabaseManager import DatabaseManager
+from components.TranslationQueue import translation_queue
+from components.TranslationWorkerPool import TranslationWorkerPool
 
 # Configure logging
 logging.basicConfig(
@@ -36,224 +41,194 @@ logging.basicConfig(
 )
 logger = logging.getLogger('background_translate')
 
+# Job files written by the web app before the job table existed
+LEGACY_JOBS_DIR = Path('/var/www/production/xspacedownload.com/website/htdocs/translation_jobs')
+
 class BackgroundTranslate:
     """Background translation job processor."""
     
-    def __init__(self):
+    def __init__(self, config_file="mainconfig.json"):
         """Initialize the background translation worker."""
-        self.running = True
-        self.jobs_dir = Path('/var/www/production/xspacedownload.com/website/htdocs/translation_jobs')
-        self.jobs_dir.mkdir(exist_ok=True)
+        self.queue = translation_queue
+        self._local = threading.local()
+        
+        worker_config = {}
+        try:
+            with open(config_file, 'r') as f:
+                worker_config = json.load(f).get('translation_worker', {})
+        except Exception as e:
+            logger.warning(f"Could not read {config_file}, using default worker settings: {e}")
         
         # Initialize components
         try:
             self.db_manager = DatabaseManager()
-            self.translator = Translate()
+            self.pool = TranslationWorkerPool(
+                self.queue,
+                self.process_job,
+                max_workers=worker_config.get('workers', 4),
+                provider_limits=worker_config.get('provider_limits', {'openai': 4, 'claude': 2})
+            )
             logger.info("Background translation worker initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize components: {e}")
             raise
     
-    def process_job(self, job_file: Path):
-        """Process a single translation job."""
-        try:
-            # Load job data
-            with open(job_file, 'r') as f:
-                job_data = json.load(f)
-            
-            job_id = job_data.get('id')
-            space_id = job_data.get('space_id')
-            user_id = job_data.get('user_id')
-            source_lang = job_data.get('source_lang', 'auto')
-            target_lang = job_data.get('target_lang')
-            transcript_text = job_data.get('transcript_text')
-            
-            logger.info(f"Processing translation job {job_id}: {space_id} -> {target_lang}")
-            
-            # Update job status to in_progress
-            job_data['status'] = 'in_progress'
-            job_data['progress'] = 10
-            job_data['updated_at'] = datetime.datetime.now().isoformat()
-            
-            with open(job_file, 'w') as f:
-                json.dump(job_data, f)
-            
-            # Perform translation with cost tracking
-            logger.info(f"Starting translation from {source_lang} to {target_lang}")
-            success, result = self.translator.translate(
-                text=transcript_text,
-                source_lang=source_lang,
-                target_lang=target_lang,
-                space_id=space_id,
-                user_id=user_id
-            )
-            
-            if not success:
-                # Translation failed
-                logger.error(f"Translation failed for job {job_id}: {result}")
-                job_data['status'] = 'failed'
-                job_data['error'] = str(result)
-                job_data['progress'] = 0
-                job_data['updated_at'] = datetime.datetime.now().isoformat()
-                
-                with open(job_file, 'w') as f:
-                    json.dump(job_data, f)
-                return
-            
-            # Translation successful - update progress
-            job_data['progress'] = 80
-            job_data['updated_at'] = datetime.datetime.now().isoformat()
-            
-            with open(job_file, 'w') as f:
-                json.dump(job_data, f)
-            
-            logger.info(f"Translation completed, saving to database for job {job_id}")
-            
-            # Save translation to database using context manager
+    def get_translator(self):
+        """Get this worker thread's Translate component."""
+        translator = getattr(self._local, 'translator', None)
+        if translator is None:
+            translator = Translate()
+            self._local.translator = translator
+        return translator
+    
+    def import_job_files(self):
+        """Move pending jobs from the old job file directory into the job table."""
+        if not LEGACY_JOBS_DIR.exists():
+            return
+        
+        for job_file in LEGACY_JOBS_DIR.glob('*.json'):
             try:
-                with self.db_manager.get_connection() as connection:
-                    cursor = connection.cursor()
-                    
-                    # Insert the translated transcript
-                    query = """
-                    INSERT INTO space_transcripts (space_id, transcript, language, created_at)
-                    VALUES (%s, %s, %s, %s)
-                    """
-                    cursor.execute(query, (
-                        space_id,
-                        result,
-                        target_lang,
-                        datetime.datetime.now()
-                    ))
-                    
-                    connection.commit()
-                    logger.info(f"Translation saved to database for space {space_id} in {target_lang}")
-                
-                # Update job status to completed
-                job_data['status'] = 'completed'
-                job_data['progress'] = 100
-                job_data['updated_at'] = datetime.datetime.now().isoformat()
-                job_data['result'] = {
-                    'space_id': space_id,
-                    'language': target_lang,
-                    'text_sample': result[:200] + '...' if len(result) > 200 else result
-                }
-                
-                with open(job_file, 'w') as f:
-                    json.dump(job_data, f)
-                
-                logger.info(f"Translation job {job_id} completed successfully")
-                
-                # Send email notification
-                try:
-                    from components.NotificationHelper import NotificationHelper
-                    
-                    # Get space title from database if needed
-                    space_title = None
-                    try:
-                        with self.db_manager.get_connection() as connection:
-                            cursor = connection.cursor(dictionary=True)
-                            cursor.execute(
-                                "SELECT title FROM spaces WHERE space_id = %s",
-                                (space_id,)
-                            )
-                            space_info = cursor.fetchone()
-                            if space_info:
-                                space_title = space_info['title']
-                    except Exception as title_err:
-                        logger.warning(f"Could not get space title: {title_err}")
-                    
-                    helper = NotificationHelper()
-                    success = helper.send_job_completion_email(
-                        user_id=user_id,
-                        job_type='translation',
-                        space_id=space_id,
-                        space_title=space_title,
-                        additional_info={'target_lang': target_lang}
-                    )
-                    if success:
-                        logger.info(f"Email notification sent to user {user_id}")
-                    else:
-                        logger.error("Failed to send email notification")
-                        
-                except Exception as email_err:
-                    logger.error(f"Error sending email notification: {email_err}")
+                with open(job_file, 'r') as f:
+                    job_data = json.load(f)
                 
-            except Exception as db_error:
-                logger.error(f"Database error for job {job_id}: {db_error}")
+                if job_data.get('status') not in ('pending', 'in_progress'):
+                    continue
                 
-                job_data['status'] = 'failed'
-                job_data['error'] = f"Database error: {str(db_error)}"
-                job_data['progress'] = 0
-                job_data['updated_at'] = datetime.datetime.now().isoformat()
+                job, created = self.queue.enqueue(
+                    job_data.get('space_id'),
+                    job_data.get('user_id'),
+                    job_data.get('source_lang', 'auto'),
+                    job_data.get('target_lang'),
+                    job_data.get('transcript_text', ''),
+                    provider=job_data.get('provider', ''),
+                    job_id=job_data.get('id')
+                )
+                job_file.unlink()
+                logger.info(f"Imported translation job file {job_file.name} (new job: {created})")
+            except Exception as e:
+                logger.error(f"Error importing job file {job_file}: {e}")
+    
+    def process_job(self, job: dict):
+        """Process a single claimed translation job."""
+        job_id = job['id']
+        claim_token = job['claim_token']
+        space_id = job['space_id']
+        user_id = job.get('user_id')
+        source_lang = job.get('source_lang', 'auto')
+        target_lang = job['target_lang']
+        
+        logger.info(f"Processing translation job {job_id}: {space_id} -> {target_lang}")
+        
+        # Perform translation with cost tracking
+        logger.info(f"Starting translation from {source_lang} to {target_lang}")
+        success, result = self.get_translator().translate(
+            text=job['transcript_text'],
+            source_lang=source_lang,
+            target_lang=target_lang,
+            space_id=space_id,
+            user_id=user_id,
+            # A requeued job keeps its id, so its charge is applied once
+            idempotency_key=f"translation-job:{job_id}"
+        )
+        
+        if not success:
+            # Translation failed
+            logger.error(f"Translation failed for job {job_id}: {result}")
+            self.queue.fail(job_id, claim_token, str(result))
+            return
+        
+        # Translation successful - update progress. If the job was requeued while it
+        # ran, another worker owns it now: drop this result instead of saving it twice.
+        if not self.queue.heartbeat(job_id, claim_token, progress=80):
+            logger.warning(f"Translation job {job_id} was taken over by another worker; discarding result")
+            return
+        logger.info(f"Translation completed, saving to database for job {job_id}")
+        
+        # Save translation to database using context manager
+        try:
+            with self.db_manager.get_connection() as connection:
+                cursor = connection.cursor()
                 
-                with open(job_file, 'w') as f:
-                    json.dump(job_data, f)
+                # Insert the translated transcript
+                query = """
+                INSERT INTO space_transcripts (space_id, transcript, language, created_at)
+                VALUES (%s, %s, %s, %s)
+                """
+                cursor.execute(query, (
+                    space_id,
+                    result,
+                    target_lang,
+                    datetime.datetime.now()
+                ))
                 
-        except Exception as e:
-            logger.error(f"Error processing translation job {job_file}: {e}")
+                connection.commit()
+                logger.info(f"Translation saved to database for space {space_id} in {target_lang}")
+        except Exception as db_error:
+            logger.error(f"Database error for job {job_id}: {db_error}")
+            self.queue.fail(job_id, claim_token, f"Database error: {str(db_error)}")
+            return
+        
+        # Update job status to completed; only the worker holding the job sends the email
+        if not self.queue.complete(job_id, claim_token, {
+            'space_id': space_id,
+            'language': target_lang,
+            'text_sample': result[:200] + '...' if len(result) > 200 else result
+        }):
+            return
+        logger.info(f"Translation job {job_id} completed successfully")
+        
+        # Send email notification
+        try:
+            from components.NotificationHelper import NotificationHelper
             
-            # Update job status to failed
+            # Get space title from database if needed
+            space_title = None
             try:
-                with open(job_file, 'r') as f:
-                    job_data = json.load(f)
-                
-                job_data['status'] = 'failed'
-                job_data['error'] = str(e)
-                job_data['progress'] = 0
-                job_data['updated_at'] = datetime.datetime.now().isoformat()
+                with self.db_manager.get_connection() as connection:
+                    cursor = connection.cursor(dictionary=True)
+                    cursor.execute(
+                        "SELECT title FROM spaces WHERE space_id = %s",
+                        (space_id,)
+                    )
+                    space_info = cursor.fetchone()
+                    if space_info:
+                        space_title = space_info['title']
+            except Exception as title_err:
+                logger.warning(f"Could not get space title: {title_err}")
+            
+            helper = NotificationHelper()
+            sent = helper.send_job_completion_email(
+                user_id=user_id,
+                job_type='translation',
+                space_id=space_id,
+                space_title=space_title,
+                additional_info={'target_lang': target_lang}
+            )
+            if sent:
+                logger.info(f"Email notification sent to user {user_id}")
+            else:
+                logger.error("Failed to send email notification")
                 
-                with open(job_file, 'w') as f:
-                    json.dump(job_data, f)
-                    
-            except Exception as file_error:
-                logger.error(f"Failed to update job file after error: {file_error}")
+        except Exception as email_err:
+            logger.error(f"Error sending email notification: {email_err}")
     
     def run(self):
         """Main worker loop."""
         logger.info("Starting background translation worker")
-        
-        while self.running:
-            try:
-                # Look for pending translation jobs
-                pending_jobs = []
-                
-                if self.jobs_dir.exists():
-                    for job_file in self.jobs_dir.glob('*.json'):
-                        try:
-                            with open(job_file, 'r') as f:
-                                job_data = json.load(f)
-                            
-                            if job_data.get('status') == 'pending':
-                                pending_jobs.append((job_file, job_data.get('created_at', '')))
-                                
-                        except Exception as e:
-                            logger.error(f"Error reading job file {job_file}: {e}")
-                
-                # Sort jobs by creation time (oldest first)
-                pending_jobs.sort(key=lambda x: x[1])
-                
-                if pending_jobs:
-                    # Process the oldest pending job
-                    job_file, _ = pending_jobs[0]
-                    self.process_job(job_file)
-                else:
-                    # No pending jobs, sleep for a bit
-                    time.sleep(5)
-                    
-            except Exception as e:
-                logger.error(f"Error in main loop: {e}")
-                time.sleep(10)  # Wait longer on error
+        self.import_job_files()
+        self.pool.run()
     
     def stop(self):
         """Stop the worker."""
         logger.info("Stopping background translation worker")
-        self.running = False
+        self.pool.stop()
 
 def main():
     """Main entry point."""
     try:
         worker = BackgroundTranslate()
+        # Let running translations finish on SIGTERM (pkill, service stop)
+        signal.signal(signal.SIGTERM, lambda signum, frame: worker.stop())
         worker.run()
     except KeyboardInterrupt:
         logger.info("Received interrupt signal, shutting down")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Script to benchmark parallel local Whisper transcription.
+
+Transcribes the same recording with several worker/thread layouts and
+reports the real-time factor (processing time / audio duration; lower is
+faster) for each, so local_workers and local_threads_per_worker in
+transcription_config.json can be tuned for the machine.
+
+Usage:
+    python benchmark_transcription.py downloads/abc.mp3 --model base --workers 1,2,4,8
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for importing components
+sys.path.append(str(Path(__file__).parent))
+
+from components.AudioChunker import AudioChunker, probe_duration, ffmpeg_available
+from components.WhisperPool import WhisperPool, WHISPER_AVAILABLE, default_worker_layout
+
+def benchmark(audio_file, model_name, worker_counts, threads_per_worker, chunk_seconds, max_seconds):
+    """Run the benchmark and print one line per layout."""
+    if not WHISPER_AVAILABLE or not ffmpeg_available():
+        print("Error: whisper and ffmpeg/ffprobe are required for the benchmark")
+        return False
+
+    duration = probe_duration(audio_file)
+    if not duration:
+        print(f"Error: could not read duration of {audio_file}")
+        return False
+    if max_seconds:
+        duration = min(duration, max_seconds)
+
+    chunks = AudioChunker().plan_chunks(audio_file, chunk_seconds, min_chunk_seconds=0,
+                                        duration=duration, find_breaks=False)
+    cores = os.cpu_count() or 1
+    print(f"{audio_file}: {duration:.1f}s audio, {len(chunks)} chunks of {chunk_seconds:.0f}s, "
+          f"model {model_name}, {cores} cores")
+    print(f"{'workers':>8} {'threads':>8} {'cores used':>11} {'seconds':>9} {'RTF':>7} {'speedup':>8}")
+
+    baseline = None
+    for workers in worker_counts:
+        workers, threads = default_worker_layout(cores, workers, threads_per_worker)
+        pool = WhisperPool(model_name, device='cpu', workers=workers, threads_per_worker=threads)
+        try:
+            pool.start()
+            # Warm up every worker so model loading is not timed
+            list(pool.map_chunks(audio_file, [dict(chunks[0], index=-i - 1) for i in range(workers)],
+                                 {'fp16': False}))
+
+            started = time.perf_counter()
+            for _ in pool.map_chunks(audio_file, chunks, {'fp16': False, 'language': 'en'}):
+                pass
+            elapsed = time.perf_counter() - started
+        finally:
+            pool.close()
+
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {threads:>8} {workers * threads:>11} {elapsed:>9.1f} "
+              f"{elapsed / duration:>7.3f} {baseline / elapsed:>7.2f}x")
+    return True
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark parallel local Whisper transcription")
+    parser.add_argument("audio_file", help="Recording to transcribe")
+    parser.add_argument("--model", default="base", help="Whisper model name (default: base)")
+    parser.add_argument("--workers", default=None,
+                        help="Comma-separated worker counts (default: 1,2,4,... up to the core count)")
+    parser.add_argument("--threads", type=int, default=0,
+                        help="Torch threads per worker (default: cores / workers)")
+    parser.add_argument("--chunk-seconds", type=float, default=30.0, help="Chunk length (default: 30)")
+    parser.add_argument("--max-seconds", type=float, default=600.0,
+                        help="Only transcribe the first N seconds (default: 600, 0 for all)")
+    args = parser.parse_args()
+
+    if args.workers:
+        worker_counts = [int(count) for count in args.workers.split(',')]
+    else:
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= (os.cpu_count() or 1):
+            worker_counts.append(worker_counts[-1] * 2)
+
+    success = benchmark(args.audio_file, args.model, worker_counts, args.threads,
+                        args.chunk_seconds, args.max_seconds)
+    sys.exit(0 if success else 1)
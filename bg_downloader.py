@@ -367,7 +367,7 @@ def claim_download_job(space: Space, job_id: int) -> bool:
         return False
 
 
-def trim_leading_silence(audio_file_path: str, silence_threshold: float = 0.01, max_trim_seconds: int = 300) -> bool:
+def trim_leading_silence(audio_file_path: str, silence_threshold: float = 0.01, max_trim_seconds: int = 300) -> float:
     """
     Trim leading silence from an audio file using ffmpeg.
     
@@ -377,13 +377,13 @@ def trim_leading_silence(audio_file_path: str, silence_threshold: float = 0.01,
         max_trim_seconds (int): Maximum seconds to trim from start (safety limit)
         
     Returns:
-        bool: True if file was trimmed, False if no trimming was needed
+        float: Seconds trimmed from the start (0 if no trimming was needed)
     """
     try:
         # Check if ffmpeg is available
         if not shutil.which('ffmpeg'):
             print("ffmpeg not found, skipping silence trimming")
-            return False
+            return 0.0
         
         # First, detect silence at the beginning
         print(f"Analyzing audio for leading silence: {audio_file_path}")
@@ -415,7 +415,7 @@ def trim_leading_silence(audio_file_path: str, silence_threshold: float = 0.01,
         # If no silence detected or silence is too short, don't trim
         if silence_end is None or silence_end < 2.0:  # Less than 2 seconds of leading silence
             print(f"No significant leading silence detected (silence_end: {silence_end})")
-            return False
+            return 0.0
         
         # Apply safety limit - don't trim more than max_trim_seconds
         if silence_end > max_trim_seconds:
@@ -442,18 +442,58 @@ def trim_leading_silence(audio_file_path: str, silence_threshold: float = 0.01,
             # Replace original file with trimmed version
             shutil.move(str(temp_output), audio_file_path)
             print(f"Successfully trimmed {silence_end:.2f} seconds of leading silence")
-            return True
+            return silence_end
         else:
             print(f"ffmpeg trim failed: {result.stderr}")
             # Clean up temp file if it exists
             if temp_output.exists():
                 temp_output.unlink()
-            return False
+            return 0.0
             
     except Exception as e:
         print(f"Error in trim_leading_silence: {e}")
-        return False
+        return 0.0
+
 
+def start_streaming_transcription(space_id: str, output_file: Path):
+    """
+    Start transcribing a download while it runs, if enabled in transcription_config.json.
+    
+    Args:
+        space_id (str): Space being downloaded
+        output_file (Path): Final output path; yt-dlp's .part files are followed
+        
+    Returns:
+        StreamingTranscriber: Running streamer, or None if streaming is off or unavailable
+    """
+    try:
+        with open('transcription_config.json', 'r') as f:
+            transcription_config = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not transcription_config.get('stream_transcription', False):
+        return None
+    
+    try:
+        from components.StreamingTranscriber import StreamingTranscriber
+        
+        output_base = str(output_file).rsplit('.', 1)[0]
+        candidates = [str(output_file) + ".part"] + [
+            f"{output_base}.{ext}.part" for ext in ('m4a', 'aac', 'mp4', 'webm')
+        ]
+        streamer = StreamingTranscriber(
+            space_id,
+            candidates,
+            segment_seconds=float(transcription_config.get('stream_segment_seconds', 60)),
+            max_workers=int(transcription_config.get('openai_max_concurrency', 2)),
+            finalise_timeout=float(transcription_config.get('stream_finalise_timeout', 300))
+        )
+        if streamer.start():
+            print(f"Streaming transcription started for space {space_id}")
+            return streamer
+    except Exception as e:
+        print(f"Could not start streaming transcription: {e}")
+    return None
 
 def fork_download_process(job_id: int, space_id: str, file_type: str = 'mp3') -> Optional[int]:
     """
@@ -1798,6 +1838,9 @@ def fork_download_process(job_id: int, space_id: str, file_type: str = 'mp3') ->
                 download_start_time = time.time()
                 print(f"[DEBUG DOWNLOAD] Starting download at {datetime.datetime.now()}")
                 
+                # Optionally transcribe the audio as it arrives
+                streamer = start_streaming_transcription(space_id, output_file)
+                
                 # Run yt-dlp as a subprocess and capture output
                 print(f"[DEBUG DOWNLOAD] Executing yt-dlp command...")
                 print(f"[DEBUG DOWNLOAD] Command: {' '.join(yt_dlp_cmd)}")
@@ -2372,6 +2415,12 @@ def fork_download_process(job_id: int, space_id: str, file_type: str = 'mp3') ->
                 process.wait()
                 process_returncode = process.returncode
                 
+                if streamer:
+                    if process_returncode == 0:
+                        streamer.finish_input()
+                    else:
+                        streamer.stop(f"Download failed (yt-dlp exit code {process_returncode})")
+                
                 # Check if download was successful
                 if process_returncode == 0:
                     print("Download completed successfully")
@@ -2583,6 +2632,7 @@ def fork_download_process(job_id: int, space_id: str, file_type: str = 'mp3') ->
                         
                         # 2. Automatic MP3 trimming for leading silence
                         print("Trimming leading silence from audio...")
+                        trimmed = 0.0
                         try:
                             trimmed = trim_leading_silence(output_file)
                             if trimmed:
@@ -2592,6 +2642,18 @@ def fork_download_process(job_id: int, space_id: str, file_type: str = 'mp3') ->
                         except Exception as trim_err:
                             print(f"Error trimming audio: {trim_err}")
                         
+                        # 3. Finish the streamed transcript, aligned to the trimmed file
+                        if streamer:
+                            # Bounded by stream_finalise_timeout; without a streamed result the
+                            # queued transcription job transcribes the whole file
+                            streamed = streamer.finalise(offset_seconds=trimmed)
+                            if streamed:
+                                print(f"Streamed transcript ready for space {space_id} "
+                                      f"({len(streamed['segments'])} segments)")
+                            else:
+                                print(f"No streamed transcript for space {space_id} ({streamer.error}); "
+                                      f"the transcription queue will transcribe the file")
+                        
                         print("Post-download processing completed")
                         
                     except Exception as post_err:
@@ -2726,6 +2788,10 @@ def fork_download_process(job_id: int, space_id: str, file_type: str = 'mp3') ->
                 if 'space_availability_check' in locals() and space_availability_check:
                     error_message = f"{space_availability_check}. {error_message}"
                 
+                # Abandon any streamed transcript of the failed download
+                if 'streamer' in locals() and streamer:
+                    streamer.stop(error_message)
+                
                 # Update job as failed with the enhanced error message
                 try:
                     space = Space()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Script to build fingerprinted static bundles from static/src into static/dist.
+
+The web app also builds missing bundles at startup; run this during deploys
+so the first request after a restart does not pay for compression.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for importing components
+sys.path.append(str(Path(__file__).parent))
+
+from components.AssetPipeline import asset_pipeline, BROTLI_AVAILABLE
+
+def build_assets():
+    """Build all static bundles and print the manifest."""
+    try:
+        manifest = asset_pipeline.build()
+        for logical_name, hashed_name in sorted(manifest.items()):
+            print(f"{logical_name} -> dist/{hashed_name}")
+        print(f"Built {len(manifest)} assets (brotli: {'yes' if BROTLI_AVAILABLE else 'not installed'})")
+        return True
+    except Exception as e:
+        print(f"Error building assets: {e}")
+        return False
+
+if __name__ == "__main__":
+    sys.exit(0 if build_assets() else 1)
@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 """
 Clean up common word tags from the database
+
+Only tags on the fixed word list are removed. Tags for words that appear in
+most transcripts according to the keyword index are listed for review; pass
+--include-corpus-common to remove those as well.
 """
 
+import sys
 import mysql.connector
 import json
 import logging
+from components.KeywordIndex import keyword_index
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -23,8 +29,15 @@ COMMON_WORDS = [
     'allowing', 'adding', 'including', 'continuing', 'setting', 'showing'
 ]
 
-def cleanup_common_tags():
-    """Remove common word tags from the database."""
+def cleanup_common_tags(include_corpus_common=False):
+    """
+    Remove common word tags from the database.
+
+    Args:
+        include_corpus_common (bool): Also remove tags for words the keyword index
+                                      finds in most transcripts; otherwise they are
+                                      only reported
+    """
     
     # Load database config
     with open('db_config.json', 'r') as f:
@@ -50,10 +63,25 @@ def cleanup_common_tags():
     cursor = connection.cursor()
     
     try:
+        # Words frequent in the corpus can still be real topics, so they are only
+        # removed when asked for
+        corpus_words = sorted(set(keyword_index.common_terms()) - set(COMMON_WORDS))
+        if corpus_words and not include_corpus_common:
+            placeholders = ', '.join(['%s'] * len(corpus_words))
+            cursor.execute(f"SELECT id, name FROM tags WHERE LOWER(name) IN ({placeholders})", corpus_words)
+            candidates = cursor.fetchall()
+            if candidates:
+                logger.info(f"{len(candidates)} tags are common in the corpus but were kept "
+                            f"(use --include-corpus-common to remove them):")
+                for tag_id, tag_name in candidates:
+                    logger.info(f"  - {tag_name} (ID: {tag_id})")
+        
         # Find all common word tags
-        placeholders = ', '.join(['%s'] * len(COMMON_WORDS))
+        common_words = sorted(set(COMMON_WORDS) | (set(corpus_words) if include_corpus_common else set()))
+        logger.info(f"Checking {len(common_words)} common words")
+        placeholders = ', '.join(['%s'] * len(common_words))
         query = f"SELECT id, name FROM tags WHERE LOWER(name) IN ({placeholders})"
-        cursor.execute(query, COMMON_WORDS)
+        cursor.execute(query, common_words)
         
         bad_tags = cursor.fetchall()
         logger.info(f"Found {len(bad_tags)} common word tags to remove")
@@ -92,4 +120,4 @@ def cleanup_common_tags():
         connection.close()
 
 if __name__ == "__main__":
-    cleanup_common_tags()
\ No newline at end of file
+    cleanup_common_tags(include_corpus_common='--include-corpus-common' in sys.argv)
\ No newline at end of file
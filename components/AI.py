@@ -5,6 +5,7 @@
 import os
 import json
 import logging
+import threading
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Union, Tuple
 
@@ -76,6 +77,38 @@ class AIProvider(ABC):
         """
         pass
 
+# Provider instances shared by every AI() in the process, keyed by settings
+_shared_providers = {}
+_shared_providers_lock = threading.Lock()
+
+def get_shared_provider(provider_name: str, api_key: str, endpoint: str = None, model: str = None) -> AIProvider:
+    """
+    Get the process-wide provider instance for a set of settings.
+    
+    Args:
+        provider_name (str): 'openai' or 'claude'
+        api_key (str): API key for the provider
+        endpoint (str, optional): Custom endpoint URL
+        model (str, optional): Model name
+        
+    Returns:
+        AIProvider: Shared provider instance (its HTTP session is shared too)
+    """
+    key = (provider_name.lower(), api_key, endpoint, model)
+    with _shared_providers_lock:
+        provider = _shared_providers.get(key)
+        if provider is None:
+            if key[0] == 'openai':
+                from .OpenAI import OpenAI
+                provider = OpenAI(api_key=api_key, endpoint=endpoint, model=model)
+            elif key[0] == 'claude':
+                from .Claude import Claude
+                provider = Claude(api_key=api_key, endpoint=endpoint, model=model)
+            else:
+                raise ValueError(f"Unsupported AI provider: {provider_name}")
+            _shared_providers[key] = provider
+        return provider
+
 class AI:
     """Main AI component that manages different AI providers."""
     
@@ -122,8 +155,12 @@ class AI:
             
         provider_name = self.config.get('provider', '').lower()
         
+        # Optional per-provider gateway limits, e.g. {"openai": {"requests_per_minute": 300}}
+        for gateway_provider, limits in self.config.get('gateway', {}).items():
+            from .AIGateway import ai_gateway
+            ai_gateway.configure(gateway_provider, **limits)
+        
         if provider_name == 'openai':
-            from .OpenAI import OpenAI
             openai_config = self.config.get('openai', {})
             # Get API key from environment variable
             api_key = os.getenv('OPENAI_API_KEY')
@@ -131,13 +168,13 @@ class AI:
                 logger.error("OPENAI_API_KEY environment variable not set")
                 raise ValueError("OPENAI_API_KEY environment variable not set")
             
-            self.provider = OpenAI(
+            self.provider = get_shared_provider(
+                'openai',
                 api_key=api_key,
                 endpoint=openai_config.get('endpoint'),
                 model=openai_config.get('model', 'gpt-4o-mini')  # Default to GPT-4o-mini for better translation
             )
         elif provider_name == 'claude':
-            from .Claude import Claude
             claude_config = self.config.get('claude', {})
             # Get API key from environment variable
             api_key = os.getenv('ANTHROPIC_API_KEY')
@@ -145,7 +182,8 @@ class AI:
                 logger.error("ANTHROPIC_API_KEY environment variable not set")
                 raise ValueError("ANTHROPIC_API_KEY environment variable not set")
             
-            self.provider = Claude(
+            self.provider = get_shared_provider(
+                'claude',
                 api_key=api_key,
                 endpoint=claude_config.get('endpoint'),
                 model=claude_config.get('model', 'claude-3-sonnet-20240229')
@@ -19,9 +19,11 @@ import logging
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 import mysql.connector
 from .DatabaseManager import DatabaseManager
+from .PricingRegistry import pricing_registry
+from .CreditLedger import credit_ledger
 
 # Optional Flask import (for session management)
 try:
@@ -96,43 +98,24 @@ class AICost:
     
     def get_model_costs(self, vendor: str, model: str) -> Dict[str, float]:
         """
-        Get AI model costs from database or defaults.
+        Get AI model costs from the pricing registry or defaults.
         
         Returns:
             dict: {'input_cost_per_million': float, 'output_cost_per_million': float}
         """
-        try:
-            with self.db.get_connection() as connection:
-                cursor = connection.cursor(dictionary=True)
-                
-                cursor.execute("""
-                    SELECT input_token_cost_per_million_tokens, output_token_cost_per_million_tokens
-                    FROM ai_api_cost 
-                    WHERE vendor = %s AND model = %s
-                """, (vendor, model))
-                
-                result = cursor.fetchone()
-                
-                if result:
-                    return {
-                        'input_cost_per_million': float(result['input_token_cost_per_million_tokens']),
-                        'output_cost_per_million': float(result['output_token_cost_per_million_tokens'])
-                    }
-                
-                # Fall back to defaults
-                vendor_defaults = self.DEFAULT_COSTS.get(vendor.lower(), {})
-                model_defaults = vendor_defaults.get(model, {'input': 0.15, 'output': 0.60})
-                
-                self.cost_logger.warning(f"No costs found for {vendor}/{model}, using defaults")
-                return {
-                    'input_cost_per_million': model_defaults['input'],
-                    'output_cost_per_million': model_defaults['output']
-                }
-            
-        except Exception as e:
-            self.cost_logger.error(f"Error getting model costs: {e}")
-            # Return safe defaults
-            return {'input_cost_per_million': 0.15, 'output_cost_per_million': 0.60}
+        costs = pricing_registry.get_model_costs(vendor, model)
+        if costs:
+            return costs
+        
+        # Fall back to defaults
+        vendor_defaults = self.DEFAULT_COSTS.get(vendor.lower(), {})
+        model_defaults = vendor_defaults.get(model, {'input': 0.15, 'output': 0.60})
+        
+        self.cost_logger.warning(f"No costs found for {vendor}/{model}, using defaults")
+        return {
+            'input_cost_per_million': model_defaults['input'],
+            'output_cost_per_million': model_defaults['output']
+        }
     
     def calculate_cost(self, vendor: str, model: str, input_tokens: int, output_tokens: int) -> float:
         """
@@ -164,7 +147,8 @@ class AICost:
                    cookie_id: Optional[str] = None,
                    deduct_credits: bool = True,
                    source_language: Optional[str] = None,
-                   target_language: Optional[str] = None) -> Tuple[bool, str, float]:
+                   target_language: Optional[str] = None,
+                   idempotency_key: Optional[str] = None) -> Tuple[bool, str, float]:
         """
         Track AI operation cost and optionally deduct credits.
         
@@ -178,113 +162,91 @@ class AICost:
             user_id: User ID (optional, will get from session if not provided)
             cookie_id: Cookie ID (optional, will get from session if not provided)
             deduct_credits: Whether to deduct credits from user balance
+            idempotency_key: Unique key for this charge, so a retried call is not charged twice
             
         Returns:
             tuple: (success, message, cost)
         """
+        return self.track_costs(
+            [{'space_id': space_id, 'action': action, 'vendor': vendor, 'model': model,
+              'input_tokens': input_tokens, 'output_tokens': output_tokens,
+              'source_language': source_language, 'target_language': target_language,
+              'idempotency_key': idempotency_key}],
+            user_id=user_id, cookie_id=cookie_id, deduct_credits=deduct_credits
+        )
+    
+    def track_costs(self,
+                    operations: List[Dict[str, Any]],
+                    user_id: Optional[int] = None,
+                    cookie_id: Optional[str] = None,
+                    deduct_credits: bool = True,
+                    job_key: Optional[str] = None) -> Tuple[bool, str, float]:
+        """
+        Track the costs of several AI operations of one job in a single ledger batch.
+        
+        Chunked jobs collect one operation per AI call and track them together, so
+        the whole job costs one balance update and one insert.
+        
+        Args:
+            operations: Dicts with space_id, action, vendor, model, input_tokens, output_tokens
+                        and optionally source_language, target_language, idempotency_key
+            user_id: User ID (optional, will get from session if not provided)
+            cookie_id: Cookie ID (optional, will get from session if not provided)
+            deduct_credits: Whether to deduct credits from user balance
+            job_key: Identifies the job; charges without a key are keyed "<job_key>:<index>"
+            
+        Returns:
+            tuple: (success, message, total cost)
+        """
         # Get user info
         if user_id is None or cookie_id is None:
             session_user_id, session_cookie_id = self.get_user_info()
             user_id = user_id or session_user_id
             cookie_id = cookie_id or session_cookie_id
         
-        # Calculate cost
-        cost = self.calculate_cost(vendor, model, input_tokens, output_tokens)
+        # Calculate costs
+        charges = []
+        for operation in operations:
+            cost = self.calculate_cost(operation['vendor'], operation['model'],
+                                       operation['input_tokens'], operation['output_tokens'])
+            charges.append(credit_ledger.make_charge(
+                operation['space_id'], operation['action'], f"{operation['vendor']}/{operation['model']}",
+                operation['input_tokens'], operation['output_tokens'], cost,
+                source_language=operation.get('source_language'),
+                target_language=operation.get('target_language'),
+                idempotency_key=operation.get('idempotency_key')
+            ))
+        total_cost = sum(charge['cost'] for charge in charges)
         
-        balance_before = None
-        balance_after = None
+        if not user_id:
+            return False, "AI operations require user login", total_cost
         
         try:
-            with self.db.get_connection() as connection:
-                cursor = connection.cursor()
-                
-                # Check user balance and deduct if requested
-                if user_id and deduct_credits:
-                    # Get current balance
-                    cursor.execute("SELECT credits FROM users WHERE id = %s", (user_id,))
-                    result = cursor.fetchone()
-                    
-                    if not result:
-                        return False, "User not found", cost
-                    
-                    balance_before = float(result[0])
-                    
-                    if balance_before < cost:
-                        message = f"Insufficient credits. Required: {cost:.2f}, Available: {balance_before:.2f}"
-                        self.cost_logger.warning(f"User {user_id} - {message}")
-                        return False, message, cost
-                    
-                    # Deduct credits (ensure credits never go below 0)
-                    cursor.execute("""
-                        UPDATE users 
-                        SET credits = GREATEST(0, credits - %s)
-                        WHERE id = %s AND credits >= %s
-                    """, (cost, user_id, cost))
-                    
-                    if cursor.rowcount == 0:
-                        return False, "Failed to deduct credits", cost
-                    
-                    balance_after = balance_before - cost
-                elif user_id and not deduct_credits:
-                    # Just get the balance for logging
-                    cursor.execute("SELECT credits FROM users WHERE id = %s", (user_id,))
-                    result = cursor.fetchone()
-                    balance_before = float(result[0]) if result else 0.0
-                    balance_after = balance_before  # No deduction
-                elif not user_id:
-                    return False, "AI operations require user login", cost
-                
-                # Record transaction
-                cursor.execute("""
-                    INSERT INTO transactions 
-                    (user_id, cookie_id, space_id, action, ai_model, input_tokens, 
-                     output_tokens, cost, balance_before, balance_after, source_language, target_language)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (user_id, cookie_id, space_id, action, f"{vendor}/{model}", 
-                      input_tokens, output_tokens, cost, balance_before, balance_after, 
-                      source_language, target_language))
-                
-                # Update space_cost table based on action type
-                cost_column = self._get_cost_column_for_action(action)
-                if cost_column:
-                    cursor.execute(f"""
-                        INSERT INTO space_cost (space_id, {cost_column}) 
-                        VALUES (%s, %s) 
-                        ON DUPLICATE KEY UPDATE 
-                        {cost_column} = {cost_column} + %s
-                    """, (space_id, cost, cost))
-                
-                connection.commit()
-                
-                # Log to cost.log
-                user_identifier = f"user_id:{user_id}" if user_id else f"cookie_id:{cookie_id}"
-                self.cost_logger.info(
-                    f"{user_identifier} | space_id:{space_id} | action:{action} | "
-                    f"model:{vendor}/{model} | input_tokens:{input_tokens} | output_tokens:{output_tokens} | "
-                    f"cost:{cost:.2f} | balance_before:{balance_before} | balance_after:{balance_after} | "
-                    f"deducted:{deduct_credits}"
-                )
-                
-                return True, "Cost tracked successfully", cost
-            
+            success, message, result = credit_ledger.apply(user_id, cookie_id, charges,
+                                                           deduct=deduct_credits, job_key=job_key)
         except Exception as e:
             self.cost_logger.error(f"Error tracking AI cost: {e}")
-            return False, f"Error tracking cost: {str(e)}", cost
-    
-    def _get_cost_column_for_action(self, action: str) -> Optional[str]:
-        """Map action type to space_cost table column."""
-        mapping = {
-            'transcription': 'transcription_cost',
-            'translation': 'translation_cost',
-            'summary': 'summary_cost',
-            'language_detection': 'transcription_cost',  # Group with transcription
-            'tag_generation': 'transcription_cost',  # Group with transcription
-            'text_generation': 'summary_cost'  # Group with summary
-        }
+            return False, f"Error tracking cost: {str(e)}", total_cost
+        
+        if not success:
+            self.cost_logger.warning(f"User {user_id} - {message}")
+            return False, message, total_cost
+        
+        # Log to cost.log
+        user_identifier = f"user_id:{user_id}"
+        for charge in charges:
+            self.cost_logger.info(
+                f"{user_identifier} | space_id:{charge['space_id']} | action:{charge['action']} | "
+                f"model:{charge['ai_model']} | input_tokens:{charge['input_tokens']} | output_tokens:{charge['output_tokens']} | "
+                f"cost:{charge['cost']:.2f} | deducted:{deduct_credits}"
+            )
+        self.cost_logger.info(
+            f"{user_identifier} | batch of {len(charges)} ({result.get('duplicates', 0)} already applied) | "
+            f"cost:{result.get('cost', 0.0):.2f} | balance_before:{result.get('balance_before')} | "
+            f"balance_after:{result.get('balance_after')} | deducted:{deduct_credits}"
+        )
         
-        # Handle complex action names like "translation (en -> es)"
-        base_action = action.split(' ')[0].lower()
-        return mapping.get(base_action)
+        return True, "Cost tracked successfully", total_cost
     
     def estimate_tokens(self, text: str, is_input: bool = True) -> int:
         """
@@ -325,7 +287,7 @@ class AICost:
     
     def get_user_balance(self, user_id: int) -> float:
         """
-        Get user credit balance.
+        Get user credit balance (cached for a few seconds by the credit ledger).
         
         Args:
             user_id: User ID
@@ -333,18 +295,4 @@ class AICost:
         Returns:
             float: User credit balance
         """
-        try:
-            with self.db.get_connection() as connection:
-                cursor = connection.cursor()
-                
-                cursor.execute("SELECT credits FROM users WHERE id = %s", (user_id,))
-                result = cursor.fetchone()
-                
-                if result:
-                    return float(result[0])
-                else:
-                    return 0.0
-                    
-        except Exception as e:
-            self.cost_logger.error(f"Error getting user balance: {e}")
-            return 0.0
\ No newline at end of file
+        return credit_ledger.get_balance(user_id)
@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+# components/AIGateway.py
+"""
+AI Gateway Component for XSpace Downloader
+
+One process-wide gateway for calls to the AI providers (OpenAI, Claude):
+
+- Keep-alive HTTP sessions shared by every provider instance with the same
+  credentials, instead of a new connection pool per AI() object
+- Per provider and model: a token-bucket request limiter, a cap on calls in
+  flight, and a circuit breaker that stops calling a provider after repeated
+  failures and lets a single trial call through once it has cooled down
+- Transient failures (network errors, 429, 5xx) are retried with jittered
+  exponential backoff; other errors are returned at once
+- Waits for a free slot are bounded, so a slow or failing provider turns into
+  a quick error rather than a stalled request
+- Per-route call, latency and token metrics
+
+Provider classes send their HTTP request through call(); the function they pass
+returns (success, result, usage) where an error result may carry 'status_code'
+or 'network_error' so the gateway can tell transient failures apart.
+
+Usage Examples:
+
+    from components.AIGateway import ai_gateway
+
+    session = ai_gateway.get_session('openai', {'Authorization': f'Bearer {key}'})
+    success, result = ai_gateway.call('openai', 'gpt-4o-mini', send_request)
+    metrics = ai_gateway.get_metrics()
+"""
+
+import hashlib
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from components.RateLimiter import TokenBucket, retry_with_backoff
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    requests = None
+    HTTPAdapter = None
+    REQUESTS_AVAILABLE = False
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('ai_gateway')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# Limits per provider; 'default' applies to providers not listed
+ROUTE_LIMITS = {
+    'openai': {'requests_per_minute': 500, 'max_concurrent': 16},
+    'claude': {'requests_per_minute': 50, 'max_concurrent': 4},
+    'default': {'requests_per_minute': 60, 'max_concurrent': 4},
+}
+
+# Retry and circuit breaker settings
+MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 20.0
+FAILURE_THRESHOLD = 5
+RESET_TIMEOUT = 60.0
+
+# Longest wait for a free slot or rate limit token before giving up
+QUEUE_TIMEOUT = 30.0
+
+# HTTP status codes worth retrying
+TRANSIENT_STATUS_CODES = {408, 409, 425, 429}
+
+# Latency samples kept per route for percentiles
+LATENCY_SAMPLES = 200
+
+CallResult = Tuple[bool, Union[str, Dict], Optional[Dict]]
+
+
+class TransientAIError(Exception):
+    """A provider call failed in a way worth retrying; carries the error result."""
+
+    def __init__(self, result):
+        super().__init__(result.get('error', result) if isinstance(result, dict) else result)
+        self.result = result
+
+
+def is_transient(result) -> bool:
+    """
+    Check whether a failed call's error result is worth retrying.
+
+    Args:
+        result: Error result returned by the provider request function
+
+    Returns:
+        bool: True for network errors, 408/409/425/429 and 5xx responses
+    """
+    if not isinstance(result, dict):
+        return False
+    if result.get('network_error'):
+        return True
+    status = result.get('status_code')
+    return isinstance(status, int) and (status in TRANSIENT_STATUS_CODES or status >= 500)
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures; allows one trial call after a cooldown."""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD, reset_timeout: float = RESET_TIMEOUT):
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold (int): Consecutive failures that open the circuit
+            reset_timeout (float): Seconds before an open circuit allows a trial call
+        """
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = float(reset_timeout)
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Check whether a call may go out now."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def is_open(self) -> bool:
+        """Check whether calls are currently being refused (without taking the trial slot)."""
+        with self._lock:
+            if self.state == self.OPEN:
+                return time.monotonic() - self.opened_at < self.reset_timeout
+            return self.state == self.HALF_OPEN and self._trial_in_flight
+
+    def release_trial(self):
+        """Give back a half-open trial slot that was taken but not used."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self):
+        """Close the circuit after a successful call."""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Count a failed call, opening the circuit at the threshold or after a failed trial."""
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"Circuit opened after {self.failures} consecutive failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class _Route:
+    """Limiter, concurrency cap, breaker and metrics for one provider and model."""
+
+    def __init__(self, provider: str, model: str, requests_per_minute: float, max_concurrent: int):
+        self.provider = provider
+        self.model = model
+        self.limiter = TokenBucket(rate_per_minute=requests_per_minute, burst=max_concurrent)
+        self.slots = threading.BoundedSemaphore(max_concurrent)
+        self.max_concurrent = max_concurrent
+        self.breaker = CircuitBreaker()
+        self.lock = threading.Lock()
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.counters = {'calls': 0, 'successes': 0, 'failures': 0, 'retries': 0, 'rejected': 0,
+                         'in_flight': 0, 'input_tokens': 0, 'output_tokens': 0, 'latency_total_ms': 0.0}
+
+    def count(self, **deltas):
+        """Add to this route's counters."""
+        with self.lock:
+            for name, delta in deltas.items():
+                self.counters[name] += delta
+
+    def snapshot(self) -> Dict:
+        """Metrics for this route."""
+        with self.lock:
+            counters = dict(self.counters)
+            latencies = sorted(self.latencies)
+        finished = counters['successes'] + counters['failures']
+        counters['avg_latency_ms'] = round(counters.pop('latency_total_ms') / finished, 1) if finished else 0.0
+        counters['p95_latency_ms'] = round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 1) \
+            if latencies else 0.0
+        counters['circuit'] = self.breaker.state
+        counters['max_concurrent'] = self.max_concurrent
+        return counters
+
+
+class AIGateway:
+    """Process-wide access point for AI provider calls."""
+
+    def __init__(self, limits: Optional[Dict[str, Dict]] = None):
+        """
+        Initialize the gateway.
+
+        Args:
+            limits (dict, optional): Per-provider limits overriding ROUTE_LIMITS
+        """
+        self.limits = {name: dict(values) for name, values in ROUTE_LIMITS.items()}
+        for name, values in (limits or {}).items():
+            self.limits.setdefault(name, {}).update(values)
+        self._routes = {}
+        self._sessions = {}
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def configure(self, provider: str, **limits):
+        """
+        Change a provider's limits; applies to routes created afterwards.
+
+        Args:
+            provider (str): Provider name
+            **limits: requests_per_minute and/or max_concurrent
+        """
+        with self._lock:
+            self.limits.setdefault(provider.lower(), {}).update(
+                {name: value for name, value in limits.items() if name in ('requests_per_minute', 'max_concurrent')}
+            )
+
+    def _route(self, provider: str, model: str) -> _Route:
+        """Get or create the route for a provider and model."""
+        key = (provider.lower(), model or '')
+        with self._lock:
+            route = self._routes.get(key)
+            if route is None:
+                limits = dict(self.limits['default'])
+                limits.update(self.limits.get(key[0], {}))
+                route = _Route(key[0], key[1], float(limits['requests_per_minute']),
+                               max(1, int(limits['max_concurrent'])))
+                self._routes[key] = route
+            return route
+
+    def get_session(self, provider: str, headers: Dict[str, str]):
+        """
+        Get a shared keep-alive session for a provider and set of credentials.
+
+        Args:
+            provider (str): Provider name
+            headers (dict): Headers every request carries (including the API key)
+
+        Returns:
+            requests.Session: Shared session with a connection pool sized for the provider
+        """
+        fingerprint = hashlib.sha256(repr(sorted(headers.items())).encode('utf-8')).hexdigest()
+        key = (provider.lower(), fingerprint)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                limits = dict(self.limits['default'])
+                limits.update(self.limits.get(key[0], {}))
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(10, int(limits['max_concurrent'])))
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers.update(headers)
+                self._sessions[key] = session
+            return session
+
+    def openai_client(self, api_key: str):
+        """
+        Get a shared OpenAI SDK client (used for the audio transcription API).
+
+        Args:
+            api_key (str): OpenAI API key
+
+        Returns:
+            openai.OpenAI: One client per key, reusing its connection pool across calls
+        """
+        key = ('openai-sdk', hashlib.sha256((api_key or '').encode('utf-8')).hexdigest())
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                from openai import OpenAI
+                client = OpenAI(api_key=api_key)
+                self._clients[key] = client
+            return client
+
+    def is_available(self, provider: str, model: str = '') -> bool:
+        """
+        Check whether a provider's circuit is letting calls through.
+
+        Args:
+            provider (str): Provider name
+            model (str): Model name
+
+        Returns:
+            bool: False while the circuit is open
+        """
+        return not self._route(provider, model).breaker.is_open()
+
+    def call(self, provider: str, model: str, send: Callable[[], CallResult],
+             attempts: int = MAX_ATTEMPTS, queue_timeout: float = QUEUE_TIMEOUT) -> Tuple[bool, Union[str, Dict]]:
+        """
+        Make one provider call through the route's limiter, cap and breaker.
+
+        Args:
+            provider (str): Provider name ('openai', 'claude')
+            model (str): Model name
+            send (callable): send() -> (success, result, usage or None); one HTTP request
+            attempts (int): Attempts for transient failures
+            queue_timeout (float): Longest wait for a rate limit token or free slot
+
+        Returns:
+            Tuple[bool, Union[str, Dict]]: send()'s success flag and result; errors from the
+                gateway itself carry 'circuit_open' or 'busy', and retried errors carry 'attempts'
+        """
+        route = self._route(provider, model)
+        if route.breaker.is_open():
+            route.count(rejected=1)
+            return False, {"error": f"{provider} is temporarily unavailable (circuit open)", "circuit_open": True}
+
+        if not route.slots.acquire(timeout=queue_timeout):
+            route.count(rejected=1)
+            return False, {"error": f"{provider} is busy, try again shortly", "busy": True}
+
+        if not route.breaker.allow():
+            route.slots.release()
+            route.count(rejected=1)
+            return False, {"error": f"{provider} is temporarily unavailable (circuit open)", "circuit_open": True}
+
+        tries = {'count': 0}
+
+        def attempt():
+            if not route.limiter.acquire(timeout=queue_timeout):
+                return False, {"error": f"{provider} rate limit queue is full, try again shortly", "busy": True}
+            tries['count'] += 1
+            if tries['count'] > 1:
+                route.count(retries=1)
+            started = time.monotonic()
+            try:
+                success, result, usage = send()
+            except Exception as e:
+                success, result, usage = False, {"error": f"Unexpected error: {str(e)}", "network_error": True}, None
+            elapsed_ms = (time.monotonic() - started) * 1000
+            with route.lock:
+                route.latencies.append(elapsed_ms)
+                route.counters['latency_total_ms'] += elapsed_ms
+            if usage:
+                route.count(input_tokens=int(usage.get('input_tokens', 0) or 0),
+                            output_tokens=int(usage.get('output_tokens', 0) or 0))
+            if not success and is_transient(result):
+                raise TransientAIError(result)
+            return success, result
+
+        route.count(calls=1, in_flight=1)
+        try:
+            success, result = retry_with_backoff(attempt, attempts=max(1, attempts), base_delay=RETRY_BASE_DELAY,
+                                                 max_delay=RETRY_MAX_DELAY, retry_on=(TransientAIError,),
+                                                 description=f"{provider}/{model} request")
+        except TransientAIError as e:
+            success, result = False, e.result
+        finally:
+            route.count(in_flight=-1)
+            route.slots.release()
+
+        if success:
+            route.count(successes=1)
+            route.breaker.record_success()
+        elif isinstance(result, dict) and result.get('busy'):
+            # Waiting on our own rate limit says nothing about the provider
+            route.count(rejected=1)
+            route.breaker.release_trial()
+        else:
+            route.count(failures=1)
+            if is_transient(result):
+                # Only provider-side trouble counts towards opening the circuit
+                route.breaker.record_failure()
+                if isinstance(result, dict):
+                    result = dict(result, attempts=tries['count'])
+            else:
+                # The provider answered (e.g. 400 or 401); it is up
+                route.breaker.record_success()
+        return success, result
+
+    def get_metrics(self) -> Dict[str, Dict]:
+        """
+        Get per-route metrics.
+
+        Returns:
+            dict: {"provider/model": {calls, successes, failures, retries, rejected, in_flight,
+                   input_tokens, output_tokens, avg_latency_ms, p95_latency_ms, circuit, max_concurrent}}
+        """
+        with self._lock:
+            routes = list(self._routes.values())
+        return {f"{route.provider}/{route.model}": route.snapshot() for route in routes}
+
+
+# Global gateway instance
+ai_gateway = AIGateway()
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# components/AssetPipeline.py
+"""
+Asset Pipeline Component for XSpace Downloader
+
+Builds fingerprinted copies of the page scripts and stylesheets kept in
+static/src so browsers can cache them forever.
+
+Features:
+- Content-hash file names (static/dist/js/space-main.3f9c2a1b7e4d.js)
+- Precompressed .gz (and .br when the brotli package is installed) variants
+- manifest.json mapping logical names to fingerprinted paths
+- Outputs of the last few builds are kept, so pages cached before a deploy
+  still load their scripts and stylesheets
+- Atomic writes so several gunicorn workers can build at startup
+- Falls back to the unhashed source file when no build exists
+
+Usage Examples:
+
+    from components.AssetPipeline import asset_pipeline
+
+    asset_pipeline.build()
+    asset_pipeline.url_path('js/space-main.js')  # 'dist/js/space-main.<hash>.js'
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('asset_pipeline')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+ASSET_EXTENSIONS = ('.js', '.css')
+
+# Cache-Control for fingerprinted files; the name changes whenever the content does
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+HASH_LENGTH = 12
+
+# Builds whose outputs are kept (the current one included)
+KEEP_BUILDS = 3
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write a file via a temporary file and rename so readers never see partial content."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=str(path.parent), prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+class AssetPipeline:
+    """Builds and resolves fingerprinted static assets."""
+
+    def __init__(self, static_dir: str = 'static', source_dir: str = 'src', output_dir: str = 'dist',
+                 keep_builds: int = KEEP_BUILDS):
+        """
+        Initialize the asset pipeline.
+
+        Args:
+            static_dir (str): Flask static folder
+            source_dir (str): Folder under static_dir holding asset sources
+            output_dir (str): Folder under static_dir receiving built assets
+            keep_builds (int): Number of builds whose outputs are kept
+        """
+        self.static_dir = Path(static_dir)
+        self.source_dir = source_dir
+        self.output_dir = output_dir
+        self.keep_builds = max(1, int(keep_builds))
+        self.manifest_path = self.static_dir / output_dir / 'manifest.json'
+        self.history_path = self.static_dir / output_dir / 'history.json'
+        self._manifest = None
+        self._manifest_mtime = None
+        self._lock = threading.Lock()
+
+    def _source_files(self):
+        """Yield (logical_name, path) for every asset source file."""
+        root = self.static_dir / self.source_dir
+        if not root.exists():
+            return
+        for path in sorted(root.rglob('*')):
+            if path.is_file() and path.suffix in ASSET_EXTENSIONS:
+                yield path.relative_to(root).as_posix(), path
+
+    @staticmethod
+    def fingerprint_name(logical_name: str, content: bytes) -> str:
+        """
+        Build the fingerprinted file name for an asset.
+
+        Args:
+            logical_name (str): Name relative to the source folder, e.g. 'js/space-main.js'
+            content (bytes): File content
+
+        Returns:
+            str: Name with the content hash before the extension
+        """
+        digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+        stem, extension = os.path.splitext(logical_name)
+        return f"{stem}.{digest}{extension}"
+
+    def build(self) -> Dict[str, str]:
+        """
+        Build fingerprinted and precompressed copies of all asset sources.
+
+        Files whose fingerprinted output already exists are skipped, so this
+        is cheap to call at every startup. Once the new manifest is written,
+        outputs referenced by none of the last keep_builds manifests are removed.
+
+        Returns:
+            dict: Manifest mapping logical names to fingerprinted names
+        """
+        manifest = {}
+        output_root = self.static_dir / self.output_dir
+
+        for logical_name, path in self._source_files():
+            content = path.read_bytes()
+            hashed_name = self.fingerprint_name(logical_name, content)
+            target = output_root / hashed_name
+            manifest[logical_name] = hashed_name
+
+            if not target.exists():
+                _write_atomic(target, content)
+                logger.info(f"Built asset {logical_name} -> {hashed_name}")
+
+            gz_target = target.with_name(target.name + '.gz')
+            if not gz_target.exists():
+                # mtime=0 keeps the .gz byte-identical across builds
+                _write_atomic(gz_target, gzip.compress(content, compresslevel=9, mtime=0))
+
+            br_target = target.with_name(target.name + '.br')
+            if BROTLI_AVAILABLE and not br_target.exists():
+                _write_atomic(br_target, brotli.compress(content, quality=11))
+
+        # Manifests of earlier builds, newest first; a tree built before the history
+        # existed starts it from the manifest being replaced
+        history = self._read_json(self.history_path, [])
+        if not history:
+            previous = self._read_json(self.manifest_path, None)
+            history = [previous] if previous else []
+        if not history or history[0] != manifest:
+            history = ([manifest] + history)[:self.keep_builds]
+            _write_atomic(self.history_path, json.dumps(history, indent=2, sort_keys=True).encode('utf-8'))
+
+        current = json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8')
+        if not self.manifest_path.exists() or self.manifest_path.read_bytes() != current:
+            _write_atomic(self.manifest_path, current)
+
+        self._remove_stale_outputs(output_root, history)
+
+        with self._lock:
+            self._manifest = manifest
+            self._manifest_mtime = self.manifest_path.stat().st_mtime
+        return manifest
+
+    @staticmethod
+    def _read_json(path: Path, default):
+        """Load a JSON file written by build(), or return default if it is missing or unreadable."""
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return default
+
+    def _remove_stale_outputs(self, output_root: Path, manifests: List[Dict[str, str]]):
+        """Delete built files that none of the given manifests reference."""
+        keep = set()
+        for manifest in manifests:
+            for hashed_name in manifest.values():
+                keep.update({hashed_name, hashed_name + '.gz', hashed_name + '.br'})
+
+        for path in output_root.rglob('*'):
+            if (not path.is_file() or path in (self.manifest_path, self.history_path)
+                    or path.name.startswith('.tmp-')):
+                continue
+            if path.relative_to(output_root).as_posix() not in keep:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def get_manifest(self) -> Dict[str, str]:
+        """
+        Get the current manifest, reloading it if another process rebuilt it.
+
+        Returns:
+            dict: Manifest mapping logical names to fingerprinted names
+        """
+        try:
+            mtime = self.manifest_path.stat().st_mtime
+        except OSError:
+            return {}
+
+        with self._lock:
+            if self._manifest is not None and self._manifest_mtime == mtime:
+                return self._manifest
+
+        try:
+            with open(self.manifest_path, 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read asset manifest: {e}")
+            return {}
+
+        with self._lock:
+            self._manifest = manifest
+            self._manifest_mtime = mtime
+        return manifest
+
+    def url_path(self, logical_name: str) -> str:
+        """
+        Resolve an asset to a path under the static folder.
+
+        Args:
+            logical_name (str): Name relative to the source folder, e.g. 'css/space.css'
+
+        Returns:
+            str: Fingerprinted path when built, otherwise the source path
+        """
+        hashed_name = self.get_manifest().get(logical_name)
+        if hashed_name:
+            return f"{self.output_dir}/{hashed_name}"
+        return f"{self.source_dir}/{logical_name}"
+
+    def resolve_precompressed(self, filename: str, accept_encoding: str) -> Tuple[Optional[Path], Optional[str]]:
+        """
+        Pick the best precompressed variant of a built asset for a request.
+
+        Args:
+            filename (str): Path relative to the output folder
+            accept_encoding (str): Request Accept-Encoding header
+
+        Returns:
+            tuple: (path, content_encoding); the encoding is None for the
+                   uncompressed file and path is None if the asset is unknown
+        """
+        output_root = (self.static_dir / self.output_dir).resolve()
+        path = (output_root / filename).resolve()
+        if output_root not in path.parents or not path.is_file():
+            return None, None
+
+        accepted = {part.split(';')[0].strip().lower() for part in (accept_encoding or '').split(',')}
+        for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+            if encoding in accepted:
+                variant = path.with_name(path.name + suffix)
+                if variant.is_file():
+                    return variant, encoding
+        return path, None
+
+
+# Global asset pipeline instance
+asset_pipeline = AssetPipeline()
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+# components/AudioChunker.py
+"""
+Streaming Audio Chunker Component for XSpace Downloader
+
+Splits long recordings into transcription chunks without decoding the whole
+file into memory. ffprobe supplies the duration, ffmpeg decodes only the
+short windows searched for break points, and each chunk is encoded
+straight from the source file into its own temp file. Peak memory depends
+on the search window and chunk size, not on the length of the Space.
+
+Features:
+- Duration probing with ffprobe
+- Windowed 16-bit mono PCM decodes piped from ffmpeg into NumPy
+- Vectorised frame RMS and silence-run detection for break points
+- Chunk plans that prefer silences near each boundary
+- Per-chunk ffmpeg export to mp3/wav with optional resampling
+
+Usage Examples:
+
+    from components.AudioChunker import AudioChunker
+
+    chunker = AudioChunker()
+    for chunk in chunker.iter_chunks('downloads/abc.mp3', chunk_seconds=600, format='mp3', bitrate='64k'):
+        transcribe(chunk['path'], offset=chunk['start_seconds'])
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('audio_chunker')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# Sample rate used for energy analysis; speech energy is well represented at 8 kHz
+ANALYSIS_SAMPLE_RATE = 8000
+
+
+def ffmpeg_available() -> bool:
+    """Check whether ffmpeg and ffprobe are on PATH."""
+    return bool(shutil.which('ffmpeg') and shutil.which('ffprobe'))
+
+
+def probe_duration(audio_file: str) -> Optional[float]:
+    """
+    Get the duration of a media file with ffprobe.
+
+    Args:
+        audio_file (str): Path to the audio file
+
+    Returns:
+        float: Duration in seconds, or None if it could not be determined
+    """
+    try:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+             '-of', 'default=noprint_wrappers=1:nokey=1', audio_file],
+            capture_output=True, text=True, timeout=60
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return float(result.stdout.strip())
+    except (OSError, ValueError, subprocess.TimeoutExpired) as e:
+        logger.warning(f"ffprobe could not read duration of {audio_file}: {e}")
+    return None
+
+
+def decode_pcm(audio_file: str, start: float = 0.0, duration: Optional[float] = None,
+               sample_rate: int = ANALYSIS_SAMPLE_RATE):
+    """
+    Decode a window of audio to 16-bit mono PCM.
+
+    Args:
+        audio_file (str): Path to the audio file
+        start (float): Window start in seconds
+        duration (float, optional): Window length in seconds (default: to the end)
+        sample_rate (int): Output sample rate
+
+    Returns:
+        numpy.ndarray: int16 samples (empty if decoding failed)
+    """
+    command = ['ffmpeg', '-v', 'error', '-nostdin']
+    if start > 0:
+        command += ['-ss', f'{start:.3f}']
+    if duration is not None:
+        command += ['-t', f'{duration:.3f}']
+    command += ['-i', audio_file, '-vn', '-ac', '1', '-ar', str(sample_rate), '-f', 's16le', '-']
+
+    result = subprocess.run(command, capture_output=True, timeout=600)
+    if result.returncode != 0:
+        logger.warning(f"ffmpeg decode failed for {audio_file}: {result.stderr.decode(errors='replace')[-300:]}")
+        return np.zeros(0, dtype=np.int16)
+    return np.frombuffer(result.stdout, dtype=np.int16)
+
+
+def frame_rms(samples, frame_length: int):
+    """
+    Compute RMS per non-overlapping frame.
+
+    Args:
+        samples (numpy.ndarray): int16 samples
+        frame_length (int): Samples per frame
+
+    Returns:
+        numpy.ndarray: float32 RMS per frame (a trailing partial frame is dropped)
+    """
+    frame_count = len(samples) // frame_length
+    if frame_count == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = samples[:frame_count * frame_length].astype(np.float32).reshape(frame_count, frame_length)
+    return np.sqrt(np.mean(frames * frames, axis=1))
+
+
+def find_silence_runs(rms, threshold: float, min_frames: int) -> List[Tuple[int, int]]:
+    """
+    Find runs of consecutive frames below a threshold.
+
+    Args:
+        rms (numpy.ndarray): RMS per frame
+        threshold (float): Frames with RMS below this are silent
+        min_frames (int): Minimum run length in frames
+
+    Returns:
+        list: (start_frame, end_frame) pairs, end exclusive
+    """
+    if len(rms) == 0:
+        return []
+    silent = np.concatenate(([0], (rms < threshold).astype(np.int8), [0]))
+    edges = np.diff(silent)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    keep = (ends - starts) >= min_frames
+    return list(zip(starts[keep].tolist(), ends[keep].tolist()))
+
+
+class AudioChunker:
+    """Plans and exports transcription chunks using ffmpeg and NumPy."""
+
+    def __init__(self, search_seconds: float = 30.0, min_silence_ms: int = 500,
+                 silence_offset_db: float = 16.0, frame_ms: int = 20):
+        """
+        Initialize the chunker.
+
+        Args:
+            search_seconds (float): Seconds before each boundary searched for silence
+            min_silence_ms (int): Minimum silence length for a break point
+            silence_offset_db (float): Silence threshold in dB below the window's level
+            frame_ms (int): Analysis frame length in milliseconds
+        """
+        self.search_seconds = search_seconds
+        self.min_silence_ms = min_silence_ms
+        self.silence_offset_db = silence_offset_db
+        self.frame_ms = frame_ms
+
+    def find_break_point(self, audio_file: str, window_start: float, window_end: float) -> Optional[float]:
+        """
+        Find a silence to cut at inside a window.
+
+        Args:
+            audio_file (str): Path to the audio file
+            window_start (float): Window start in seconds
+            window_end (float): Window end in seconds
+
+        Returns:
+            float: Middle of the last long-enough silence, in seconds, or None
+        """
+        if not NUMPY_AVAILABLE or window_end <= window_start:
+            return None
+
+        samples = decode_pcm(audio_file, window_start, window_end - window_start)
+        frame_length = ANALYSIS_SAMPLE_RATE * self.frame_ms // 1000
+        rms = frame_rms(samples, frame_length)
+        if len(rms) == 0:
+            return None
+
+        # Same rule as pydub's detect_silence(silence_thresh=dBFS - 16): relative to the window level
+        window_rms = float(np.sqrt(np.mean(rms * rms)))
+        if window_rms <= 0:
+            return (window_start + window_end) / 2
+        threshold = window_rms * (10 ** (-self.silence_offset_db / 20))
+
+        runs = find_silence_runs(rms, threshold, max(1, self.min_silence_ms // self.frame_ms))
+        if not runs:
+            return None
+
+        start_frame, end_frame = runs[-1]
+        return window_start + ((start_frame + end_frame) / 2) * self.frame_ms / 1000.0
+
+    def plan_chunks(self, audio_file: str, chunk_seconds: float,
+                    min_chunk_seconds: float = 30.0, duration: Optional[float] = None,
+                    find_breaks: bool = True) -> List[Dict]:
+        """
+        Work out chunk boundaries, preferring silences near each cut.
+
+        Args:
+            audio_file (str): Path to the audio file
+            chunk_seconds (float): Target chunk length
+            min_chunk_seconds (float): Shortest chunk allowed before the last one
+            duration (float, optional): Known duration (probed if omitted)
+            find_breaks (bool): Search for silences; otherwise cut at fixed times
+
+        Returns:
+            list: Dicts with index, start_seconds, end_seconds and duration_seconds
+        """
+        if duration is None:
+            duration = probe_duration(audio_file)
+        if not duration:
+            return []
+
+        chunks = []
+        start = 0.0
+        while start < duration - 0.01:
+            end = min(start + chunk_seconds, duration)
+
+            if end < duration and find_breaks:
+                window_start = max(start + min_chunk_seconds, end - self.search_seconds)
+                break_point = self.find_break_point(audio_file, window_start, end)
+                if break_point and break_point - start >= min_chunk_seconds:
+                    logger.debug(f"Found silence break at {break_point:.1f}s for chunk {len(chunks) + 1}")
+                    end = break_point
+
+            # Avoid a tiny trailing chunk by folding it into this one
+            if duration - end < min_chunk_seconds / 2:
+                end = duration
+
+            chunks.append({
+                'index': len(chunks),
+                'start_seconds': start,
+                'end_seconds': end,
+                'duration_seconds': end - start
+            })
+            start = end
+
+        return chunks
+
+    @staticmethod
+    def export_chunk(audio_file: str, start: float, end: Optional[float], output_path: str,
+                     format: str = 'mp3', bitrate: Optional[str] = None,
+                     sample_rate: Optional[int] = None, channels: Optional[int] = 1) -> bool:
+        """
+        Encode one slice of the source file straight to disk with ffmpeg.
+
+        Args:
+            audio_file (str): Path to the audio file
+            start (float): Slice start in seconds
+            end (float, optional): Slice end in seconds (default: end of file)
+            output_path (str): Destination file
+            format (str): Output format ('mp3', 'wav', ...)
+            bitrate (str, optional): Audio bitrate, e.g. '64k'
+            sample_rate (int, optional): Output sample rate
+            channels (int, optional): Output channel count
+
+        Returns:
+            bool: True if the chunk was written
+        """
+        command = ['ffmpeg', '-v', 'error', '-nostdin', '-y']
+        if start > 0:
+            command += ['-ss', f'{start:.3f}']
+        if end is not None:
+            command += ['-t', f'{end - start:.3f}']
+        command += ['-i', audio_file, '-vn']
+        if channels:
+            command += ['-ac', str(channels)]
+        if sample_rate:
+            command += ['-ar', str(sample_rate)]
+        if bitrate:
+            command += ['-b:a', bitrate]
+        if format == 'wav':
+            command += ['-c:a', 'pcm_s16le']
+        command += ['-f', format, output_path]
+
+        try:
+            result = subprocess.run(command, capture_output=True, timeout=1800)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.error(f"ffmpeg export failed for {audio_file} [{start:.1f}s-{end}]: {e}")
+            return False
+        if result.returncode != 0:
+            logger.error(f"ffmpeg export failed for {audio_file}: {result.stderr.decode(errors='replace')[-300:]}")
+            return False
+        return os.path.exists(output_path) and os.path.getsize(output_path) > 0
+
+    def iter_chunks(self, audio_file: str, chunk_seconds: float, format: str = 'mp3',
+                    bitrate: Optional[str] = None, sample_rate: Optional[int] = None,
+                    channels: Optional[int] = 1, min_chunk_seconds: float = 30.0,
+                    find_breaks: bool = True, chunks: Optional[List[Dict]] = None) -> Iterator[Dict]:
+        """
+        Export chunks one at a time into a temp directory.
+
+        Each chunk file is deleted when the caller advances to the next one,
+        so at most one chunk is on disk at a time.
+
+        Args:
+            audio_file (str): Path to the audio file
+            chunk_seconds (float): Target chunk length
+            format (str): Output format for chunk files
+            bitrate (str, optional): Audio bitrate for chunk files
+            sample_rate (int, optional): Sample rate for chunk files
+            channels (int, optional): Channel count for chunk files
+            min_chunk_seconds (float): Shortest chunk allowed before the last one
+            find_breaks (bool): Search for silences near each cut
+            chunks (list, optional): Precomputed plan from plan_chunks()
+
+        Returns:
+            iterator: Chunk dicts from plan_chunks() with an added 'path'
+        """
+        if chunks is None:
+            chunks = self.plan_chunks(audio_file, chunk_seconds, min_chunk_seconds, find_breaks=find_breaks)
+
+        with tempfile.TemporaryDirectory(prefix='chunks_') as temp_dir:
+            for chunk in chunks:
+                path = os.path.join(temp_dir, f"chunk_{chunk['index']:04d}.{format}")
+                if not self.export_chunk(audio_file, chunk['start_seconds'], chunk['end_seconds'], path,
+                                         format=format, bitrate=bitrate,
+                                         sample_rate=sample_rate, channels=channels):
+                    raise RuntimeError(f"Could not export chunk {chunk['index']} of {audio_file}")
+                try:
+                    yield dict(chunk, path=path)
+                finally:
+                    if os.path.exists(path):
+                        os.unlink(path)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# components/BootstrapCache.py
+"""
+Bootstrap Cache Component for XSpace Downloader
+
+Caches the user-independent sections of the space page bootstrap
+(transcripts, formats, notes, reviews, ...) in each web worker, while keeping
+invalidation shared between all workers:
+
+- Entries live in a bounded in-process LRU keyed by (space_id, section)
+- Every invalidation bumps a version row in a small SQLite sidecar; an entry
+  is only served while the versions it was built under are still current, so
+  a note saved through one gunicorn worker is visible on every worker's next
+  request instead of after the TTL
+- The TTL still bounds staleness for changes nobody invalidates
+
+Usage Examples:
+
+    from components.BootstrapCache import bootstrap_cache
+
+    notes = bootstrap_cache.get(space_id, 'notes', lambda: load_space_notes(space, space_id))
+    bootstrap_cache.invalidate(space_id, 'notes')
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+from components.SQLiteStore import SQLiteStore
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('bootstrap_cache')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# Default location of the sidecar database holding the versions
+DEFAULT_VERSIONS_PATH = './data/bootstrap_cache.db'
+
+# Seconds an entry is served at most
+DEFAULT_TTL = 60.0
+
+# Entries kept per process
+DEFAULT_MAX_ENTRIES = 2000
+
+# Stands for "every space" or "every section" in a version row
+ALL = '*'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS versions (
+    space_id TEXT NOT NULL,
+    section TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (space_id, section)
+);
+"""
+
+
+class BootstrapCache:
+    """Per-process LRU of bootstrap sections with invalidation shared through SQLite."""
+
+    def __init__(self, db_path=DEFAULT_VERSIONS_PATH, ttl: float = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path (str): Path to the SQLite sidecar shared by the web workers
+            ttl (float): Seconds an entry is served at most
+            max_entries (int): Entries kept before the least recently used are dropped
+        """
+        self.db_path = str(db_path)
+        self.ttl = ttl
+        self.max_entries = max(1, int(max_entries))
+        self._store = SQLiteStore(self.db_path, _SCHEMA, autocommit=True)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _versions(self, space_id: str, section: str) -> Optional[Tuple[int, int, int]]:
+        """Current (section, whole space, everything) versions, or None if they cannot be read."""
+        try:
+            rows = self._store.connection().execute(
+                "SELECT space_id, section, version FROM versions "
+                "WHERE (space_id = ? AND section IN (?, ?)) OR (space_id = ? AND section = ?)",
+                (space_id, section, ALL, ALL, ALL)
+            ).fetchall()
+        except Exception as e:
+            logger.warning(f"Could not read bootstrap cache versions: {e}")
+            return None
+        found = {(row['space_id'], row['section']): row['version'] for row in rows}
+        return (found.get((space_id, section), 0), found.get((space_id, ALL), 0), found.get((ALL, ALL), 0))
+
+    def get(self, space_id: str, section: str, loader: Callable[[], object]):
+        """
+        Return a cached section, calling loader() when it is missing, expired or invalidated.
+
+        Args:
+            space_id (str): The space ID
+            section (str): Section name
+            loader (callable): Builds the section value
+
+        Returns:
+            The section value
+        """
+        key = (space_id, section)
+        versions = self._versions(space_id, section)
+        now = time.monotonic()
+        if versions is not None:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry and entry[2] == versions and now - entry[1] < self.ttl:
+                    self._entries.move_to_end(key)
+                    return entry[0]
+
+        # Load outside the lock so a slow query does not hold up other requests
+        data = loader()
+        if versions is not None:
+            with self._lock:
+                self._entries[key] = (data, now, versions)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return data
+
+    def invalidate(self, space_id: Optional[str] = None, *sections: str):
+        """
+        Invalidate entries in every process sharing the versions database.
+
+        Args:
+            space_id (str, optional): Space to invalidate; everything if not given
+            *sections (str): Sections to invalidate; the whole space if none are given
+        """
+        keys = [(ALL, ALL)] if space_id is None else [(space_id, section) for section in (sections or (ALL,))]
+        with self._lock:
+            for key in list(self._entries):
+                if space_id is None or (key[0] == space_id and (not sections or key[1] in sections)):
+                    self._entries.pop(key, None)
+        try:
+            self._store.connection().executemany(
+                "INSERT INTO versions (space_id, section, version) VALUES (?, ?, 1) "
+                "ON CONFLICT(space_id, section) DO UPDATE SET version = version + 1",
+                keys
+            )
+        except Exception as e:
+            logger.warning(f"Could not share bootstrap cache invalidation for {space_id}: {e}")
+
+    def get_stats(self) -> dict:
+        """Entries held by this process."""
+        with self._lock:
+            return {'entries': len(self._entries), 'max_entries': self.max_entries, 'path': self.db_path}
+
+
+# Global bootstrap cache
+bootstrap_cache = BootstrapCache()
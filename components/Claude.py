@@ -7,6 +7,9 @@ import json
 import logging
 from typing import Dict, List, Optional, Union, Tuple
 from .AI import AIProvider
+from .AIGateway import ai_gateway
+from .TranslationExecutor import (CHARS_PER_TOKEN, get_translation_executor, merge_usage, response_text,
+                                  translate_timecoded)
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +30,8 @@ class Claude(AIProvider):
         self.endpoint = endpoint or "https://api.anthropic.com/v1/messages"
         self.model = model or "claude-3-sonnet-20240229"
         
-        # Initialize session with headers
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Shared keep-alive session for this API key
+        self.session = ai_gateway.get_session('claude', {
             'x-api-key': self.api_key,
             'Content-Type': 'application/json',
             'anthropic-version': '2023-06-01'
@@ -41,6 +43,9 @@ class Claude(AIProvider):
         """
         Make a request to Claude API.
         
+        The request goes through the shared AI gateway, which rate limits it, retries
+        transient failures and refuses calls while Claude is failing.
+        
         Args:
             system_prompt (str): System prompt
             user_prompt (str): User prompt
@@ -49,52 +54,56 @@ class Claude(AIProvider):
         Returns:
             Tuple[bool, Union[str, Dict]]: Success flag and response or error
         """
-        try:
-            payload = {
-                "model": self.model,
-                "max_tokens": max_tokens,
-                "temperature": temperature,
-                "system": system_prompt,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": user_prompt
-                    }
-                ]
-            }
-            
-            logger.info(f"Making request to Claude API with model {self.model}")
-            response = self.session.post(self.endpoint, json=payload, timeout=60)
-            
-            if response.status_code != 200:
-                logger.error(f"Claude API error: {response.status_code} - {response.text}")
-                return False, {
-                    "error": f"Claude API error: {response.status_code}",
-                    "details": response.text
-                }
-            
-            result = response.json()
-            
-            if 'content' in result and len(result['content']) > 0:
-                content = result['content'][0]['text'].strip()
-                logger.info("Successfully received response from Claude")
-                return True, content
-            else:
-                logger.error(f"Unexpected Claude response format: {result}")
-                return False, {
-                    "error": "Unexpected response format",
-                    "details": result
+        payload = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system": system_prompt,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": user_prompt
                 }
+            ]
+        }
+        
+        def send():
+            try:
+                logger.info(f"Making request to Claude API with model {self.model}")
+                response = self.session.post(self.endpoint, json=payload, timeout=60)
                 
-        except requests.RequestException as e:
-            logger.error(f"Request error: {e}")
-            return False, {"error": f"Network error: {str(e)}"}
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error: {e}")
-            return False, {"error": f"Invalid response format: {str(e)}"}
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return False, {"error": f"Unexpected error: {str(e)}"}
+                if response.status_code != 200:
+                    logger.error(f"Claude API error: {response.status_code} - {response.text}")
+                    return False, {
+                        "error": f"Claude API error: {response.status_code}",
+                        "details": response.text,
+                        "status_code": response.status_code
+                    }, None
+                
+                result = response.json()
+                
+                if 'content' in result and len(result['content']) > 0:
+                    content = result['content'][0]['text'].strip()
+                    logger.info("Successfully received response from Claude")
+                    return True, content, result.get('usage')
+                else:
+                    logger.error(f"Unexpected Claude response format: {result}")
+                    return False, {
+                        "error": "Unexpected response format",
+                        "details": result
+                    }, None
+                    
+            except requests.RequestException as e:
+                logger.error(f"Request error: {e}")
+                return False, {"error": f"Network error: {str(e)}", "network_error": True}, None
+            except json.JSONDecodeError as e:
+                logger.error(f"JSON decode error: {e}")
+                return False, {"error": f"Invalid response format: {str(e)}"}, None
+            except Exception as e:
+                logger.error(f"Unexpected error: {e}")
+                return False, {"error": f"Unexpected error: {str(e)}"}, None
+        
+        return ai_gateway.call('claude', self.model, send)
     
     def translate(self, from_lang: str, to_lang: str, content: str) -> Tuple[bool, Union[str, Dict]]:
         """
@@ -130,8 +139,9 @@ class Claude(AIProvider):
             result = self._translate_with_timecodes(from_lang, to_lang, content)
             logger.info(f"========== TRANSLATION RESULT ==========")
             if result[0]:  # Success
-                logger.info(f"Translation successful, length: {len(result[1]) if result[1] else 0}")
-                logger.info(f"Result preview: {result[1][:300] if result[1] else 'None'}...")
+                translated = response_text(result[1])
+                logger.info(f"Translation successful, length: {len(translated)}")
+                logger.info(f"Result preview: {translated[:300] if translated else 'None'}...")
             else:
                 logger.error(f"Translation failed: {result[1]}")
             logger.info(f"======================================")
@@ -179,8 +189,6 @@ class Claude(AIProvider):
         Returns:
             Tuple[bool, Union[str, Dict]]: Success flag and translated text or error dict
         """
-        import re
-        
         logger.info(f"STARTING CLAUDE TIMECODE-PRESERVING TRANSLATION: {from_lang} -> {to_lang}")
         
         # Map language codes to full names for better results
@@ -196,27 +204,7 @@ class Claude(AIProvider):
         
         logger.info(f"Language mapping: {from_lang} -> {from_language}, {to_lang} -> {to_language}")
         
-        # Split content into lines with timecodes
-        lines = content.strip().split('\n')
-        translated_lines = []
-        
-        logger.info(f"Processing {len(lines)} lines of content")
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Match timecode pattern [HH:MM:SS] followed by text
-            timecode_match = re.match(r'^(\[\d{2}:\d{2}:\d{2}\])\s*(.*)$', line)
-            
-            if timecode_match:
-                timecode = timecode_match.group(1)
-                text_to_translate = timecode_match.group(2).strip()
-                
-                if text_to_translate:
-                    # Translate just the text part, preserving the timecode
-                    system_prompt = f"""You are a professional translator. Your task is to translate text while preserving timecodes.
+        system_prompt = f"""You are a professional translator. Your task is to translate text while preserving timecodes.
 
 CRITICAL RULES:
 - Translate ONLY the text content to {to_language}
@@ -224,8 +212,29 @@ CRITICAL RULES:
 - Do NOT add segment markers or any formatting
 - Return ONLY the translated text without any additional content
 - Preserve the original tone and meaning"""
+        
+        def translate_batch(lines):
+            """Translate a block of whole lines in one request."""
+            text = '\n'.join(lines)
+            user_prompt = f"""Translate the following transcript lines from {from_language} to {to_language}.
 
-                    user_prompt = f"""Translate the following text from {from_language} to {to_language}.
+CRITICAL INSTRUCTIONS:
+- Return exactly {len(lines)} lines, one translated line for each line below, in the same order
+- Keep the timecode [HH:MM:SS] at the start of each line exactly as it is
+- Translate ONLY the text after the timecode
+- Do NOT merge, split, skip or add lines
+- Do NOT add any formatting or markers
+- Return ONLY the translated lines, nothing else
+
+Lines to translate:
+{text}"""
+            
+            max_tokens = max(500, min(int(len(text) / CHARS_PER_TOKEN * 2.5), 8000))
+            return self._make_request(system_prompt, user_prompt, max_tokens=max_tokens, temperature=0.1)
+        
+        def translate_line(text_to_translate):
+            """Translate the text of a single line (used when a batch loses its timecodes)."""
+            user_prompt = f"""Translate the following text from {from_language} to {to_language}.
 
 CRITICAL INSTRUCTIONS:
 - Translate ONLY the text content
@@ -235,59 +244,15 @@ CRITICAL INSTRUCTIONS:
 - Preserve the original meaning and tone
 
 Text to translate: {text_to_translate}"""
-                    
-                    # LOG THE EXACT REQUEST BEING SENT TO AI
-                    logger.info(f"========== SENDING TO CLAUDE (Line with timecode {timecode}) ==========")
-                    logger.info(f"System prompt: {system_prompt}")
-                    logger.info(f"User prompt: {user_prompt}")
-                    logger.info(f"Original text to translate: '{text_to_translate}'")
-                    logger.info(f"Max tokens: 200, temperature: 0.1")
-                    logger.info(f"====================================================================")
-                    
-                    success, translated_text = self._make_request(system_prompt, user_prompt, max_tokens=200, temperature=0.1)
-                    
-                    # LOG THE AI RESPONSE
-                    logger.info(f"========== CLAUDE RESPONSE (Line with timecode {timecode}) ==========")
-                    if success:
-                        logger.info(f"Translation successful: '{translated_text}'")
-                    else:
-                        logger.error(f"Translation failed: {translated_text}")
-                    logger.info(f"=================================================================")
-                    
-                    if success:
-                        # Clean up the translated text to remove any unwanted formatting
-                        translated_text = translated_text.strip()
-                        # Remove any segment markers that might have been added
-                        translated_text = re.sub(r'###SEGMENT_\d+###\s*', '', translated_text)
-                        translated_text = re.sub(r'\*+.*?\*+', '', translated_text)  # Remove markdown formatting
-                        translated_text = translated_text.strip()
-                        
-                        # Combine timecode with translated text
-                        translated_lines.append(f"{timecode} {translated_text}")
-                    else:
-                        logger.warning(f"Failed to translate line: {line}")
-                        # Keep original line if translation fails
-                        translated_lines.append(line)
-                else:
-                    # Empty text after timecode, keep timecode only
-                    translated_lines.append(timecode)
-            else:
-                # Line without timecode, translate directly
-                if line:
-                    system_prompt = f"Translate to {to_language} only. No additional formatting."
-                    user_prompt = f"Translate this text from {from_language} to {to_language}: {line}"
-                    
-                    success, translated_text = self._make_request(system_prompt, user_prompt, max_tokens=200, temperature=0.1)
-                    
-                    if success:
-                        translated_lines.append(translated_text.strip())
-                    else:
-                        translated_lines.append(line)
+            
+            return self._make_request(system_prompt, user_prompt, max_tokens=200, temperature=0.1)
         
-        # Join all translated lines
-        final_translation = '\n'.join(translated_lines)
+        # Batches run concurrently; lines of a failed batch are retried one by one
+        # and keep their original text if they still fail
+        final_translation, responses, failed_lines = translate_timecoded(get_translation_executor('claude'), content,
+                                                                         translate_batch, translate_line)
         
-        logger.info(f"Claude timecode-preserving translation completed: {len(translated_lines)} lines")
+        logger.info(f"Claude timecode-preserving translation completed: {final_translation.count(chr(10)) + 1} lines")
         logger.info(f"Final translation preview: {final_translation[:300]}...")
         
         # Verify no segment markers were generated
@@ -296,7 +261,8 @@ Text to translate: {text_to_translate}"""
         else:
             logger.info("SUCCESS: No ###SEGMENT markers found in final translation")
         
-        return True, final_translation
+        # Lines that kept their source text are reported, so they are not mistaken for translations
+        return True, {'content': final_translation, 'usage': merge_usage(responses), 'failed_lines': failed_lines}
     
     def summary(self, content: str, max_length: int = None, language: str = None) -> Tuple[bool, Union[str, Dict]]:
         """
@@ -12,6 +12,8 @@ from pathlib import Path
 from typing import Optional, Tuple, Dict, Any
 from flask import session
 from .DatabaseManager import DatabaseManager
+from .PricingRegistry import pricing_registry
+from .CreditLedger import credit_ledger
 
 class CostLogger:
     """Handles AI cost tracking and credit deduction."""
@@ -71,7 +73,7 @@ class CostLogger:
     
     def get_ai_model_costs(self, vendor: str, model: str) -> Optional[Dict[str, float]]:
         """
-        Get AI model costs from database.
+        Get AI model costs from the in-memory pricing registry.
         
         Args:
             vendor (str): AI vendor (e.g., 'openai', 'anthropic')
@@ -80,35 +82,7 @@ class CostLogger:
         Returns:
             dict: Model costs or None if not found
         """
-        try:
-            connection = self.db.pool.get_connection()
-            
-            try:
-                cursor = connection.cursor(dictionary=True)
-                
-                cursor.execute("""
-                    SELECT input_token_cost_per_million_tokens, output_token_cost_per_million_tokens
-                    FROM ai_api_cost 
-                    WHERE vendor = %s AND model = %s
-                """, (vendor, model))
-                
-                result = cursor.fetchone()
-                cursor.close()
-                
-                if result:
-                    return {
-                        'input_cost_per_million': float(result['input_token_cost_per_million_tokens']),
-                        'output_cost_per_million': float(result['output_token_cost_per_million_tokens'])
-                    }
-                    
-                return None
-                
-            finally:
-                connection.close()
-                
-        except Exception as e:
-            self.cost_logger.error(f"Error getting AI model costs: {e}")
-            return None
+        return pricing_registry.get_model_costs(vendor, model)
     
     def calculate_cost(self, vendor: str, model: str, input_tokens: int, output_tokens: int) -> float:
         """
@@ -141,7 +115,7 @@ class CostLogger:
     
     def get_user_balance(self, user_id: int) -> float:
         """
-        Get user's current credit balance.
+        Get user's current credit balance (cached for a few seconds by the credit ledger).
         
         Args:
             user_id (int): User ID
@@ -149,27 +123,7 @@ class CostLogger:
         Returns:
             float: Current balance
         """
-        try:
-            connection = self.db.pool.get_connection()
-            
-            try:
-                cursor = connection.cursor(dictionary=True)
-                
-                cursor.execute("SELECT credits FROM users WHERE id = %s", (user_id,))
-                result = cursor.fetchone()
-                cursor.close()
-                
-                if result:
-                    return float(result['credits'])
-                    
-                return 0.0
-                
-            finally:
-                connection.close()
-                
-        except Exception as e:
-            self.cost_logger.error(f"Error getting user balance: {e}")
-            return 0.0
+        return credit_ledger.get_balance(user_id)
     
     def deduct_credits(self, user_id: int, amount: float) -> bool:
         """
@@ -254,6 +208,57 @@ class CostLogger:
             self.cost_logger.error(f"Error recording transaction: {e}")
             return False
     
+    def _charge(self, user_id: int, amount: float, insert_query: str, build_params) -> Tuple[bool, str, Optional[float], Optional[float]]:
+        """
+        Deduct credits and record the charge in one database transaction.
+        
+        The balance row is locked while the charge is written, so concurrent
+        charges for the same user cannot both spend the same credits, and a
+        debit is never committed without its transaction row.
+        
+        Args:
+            user_id: User ID
+            amount: Amount to deduct
+            insert_query: INSERT statement for the charge record
+            build_params: build_params(balance_before, balance_after) -> query parameters
+            
+        Returns:
+            tuple: (success, message, balance_before, balance_after)
+        """
+        try:
+            connection = self.db.pool.get_connection()
+            
+            try:
+                cursor = connection.cursor()
+                
+                cursor.execute("SELECT credits FROM users WHERE id = %s FOR UPDATE", (user_id,))
+                result = cursor.fetchone()
+                balance_before = float(result[0]) if result else 0.0
+                
+                if balance_before < amount:
+                    connection.rollback()
+                    cursor.close()
+                    return False, f"Insufficient credits. Required: {amount:.6f}, Available: {balance_before:.2f}", balance_before, None
+                
+                balance_after = balance_before - amount
+                cursor.execute("UPDATE users SET credits = credits - %s WHERE id = %s", (amount, user_id))
+                cursor.execute(insert_query, build_params(balance_before, balance_after))
+                
+                connection.commit()
+                cursor.close()
+                
+                return True, "Charged", balance_before, balance_after
+                
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                connection.close()
+                
+        except Exception as e:
+            self.cost_logger.error(f"Error charging credits: {e}")
+            return False, "Failed to deduct credits from user balance", None, None
+    
     def track_ai_operation(self, space_id: str, action: str, vendor: str, model: str, 
                           input_tokens: int, output_tokens: int) -> Tuple[bool, str, float]:
         """
@@ -273,38 +278,24 @@ class CostLogger:
         user_id, cookie_id = self.get_user_info()
         cost = self.calculate_cost(vendor, model, input_tokens, output_tokens)
         
-        # Get user balance if logged in
-        balance_before = None
-        balance_after = None
-        
-        if user_id:
-            balance_before = self.get_user_balance(user_id)
-            
-            # Check if user has sufficient credits
-            if balance_before < cost:
-                message = f"Insufficient credits. Required: {cost:.6f}, Available: {balance_before:.2f}"
-                self.cost_logger.warning(f"User {user_id} - {message}")
-                return False, message, cost
-            
-            # Deduct credits
-            if self.deduct_credits(user_id, cost):
-                balance_after = balance_before - cost
-                self.cost_logger.info(f"User {user_id} - Deducted {cost:.6f} credits. Balance: {balance_before:.2f} -> {balance_after:.2f}")
-            else:
-                message = "Failed to deduct credits from user balance"
-                self.cost_logger.error(f"User {user_id} - {message}")
-                return False, message, cost
-        else:
+        if not user_id:
             # Visitor - block AI operations
             message = "AI operations require user login"
             self.cost_logger.warning(f"Visitor {cookie_id} - {message}")
             return False, message, cost
         
-        # Record transaction
-        self.record_transaction(
-            user_id, cookie_id, space_id, action, f"{vendor}/{model}",
-            input_tokens, output_tokens, cost, balance_before, balance_after
-        )
+        # Deduct credits and record the transaction in one ledger batch
+        charge = credit_ledger.make_charge(space_id, action, f"{vendor}/{model}", input_tokens, output_tokens, cost)
+        try:
+            success, message, result = credit_ledger.apply(user_id, cookie_id, [charge])
+        except Exception as e:
+            self.cost_logger.error(f"Error charging credits: {e}")
+            success, message, result = False, "Failed to deduct credits from user balance", {}
+        if not success:
+            self.cost_logger.warning(f"User {user_id} - {message}")
+            return False, message, cost
+        balance_before, balance_after = result['balance_before'], result['balance_after']
+        self.cost_logger.info(f"User {user_id} - Deducted {cost:.6f} credits. Balance: {balance_before:.2f} -> {balance_after:.2f}")
         
         # Log to cost.log
         user_identifier = f"user_id:{user_id}" if user_id else f"cookie_id:{cookie_id}"
@@ -322,36 +313,12 @@ class CostLogger:
     
     def get_compute_cost_per_second(self) -> float:
         """
-        Get compute cost per second from app settings.
+        Get compute cost per second from the in-memory pricing registry.
         
         Returns:
             float: Cost per second
         """
-        try:
-            connection = self.db.pool.get_connection()
-            
-            try:
-                cursor = connection.cursor(dictionary=True)
-                
-                cursor.execute("""
-                    SELECT setting_value FROM app_settings 
-                    WHERE setting_name = 'compute_cost_per_second'
-                """)
-                result = cursor.fetchone()
-                cursor.close()
-                
-                if result:
-                    return float(result['setting_value'])
-                    
-                # Default fallback
-                return 0.001
-                
-            finally:
-                connection.close()
-                
-        except Exception as e:
-            self.cost_logger.error(f"Error getting compute cost per second: {e}")
-            return 0.001
+        return pricing_registry.get_compute_cost_per_second()
     
     def record_compute_transaction(self, user_id: Optional[int], cookie_id: str, space_id: str, 
                                   action: str, compute_time_seconds: float, cost_per_second: float,
@@ -422,38 +389,28 @@ class CostLogger:
         cost_per_second = self.get_compute_cost_per_second()
         total_cost = round(compute_time_seconds * cost_per_second, 6)
         
-        # Get user balance if logged in
-        balance_before = None
-        balance_after = None
-        
-        if user_id:
-            balance_before = self.get_user_balance(user_id)
-            
-            # Check if user has sufficient credits
-            if balance_before < total_cost:
-                message = f"Insufficient credits. Required: {total_cost:.6f}, Available: {balance_before:.2f}"
-                self.cost_logger.warning(f"User {user_id} - {message}")
-                return False, message, total_cost
-            
-            # Deduct credits
-            if self.deduct_credits(user_id, total_cost):
-                balance_after = balance_before - total_cost
-                self.cost_logger.info(f"User {user_id} - Deducted {total_cost:.6f} credits for {action}. Balance: {balance_before:.2f} -> {balance_after:.2f}")
-            else:
-                message = "Failed to deduct credits from user balance"
-                self.cost_logger.error(f"User {user_id} - {message}")
-                return False, message, total_cost
-        else:
+        if not user_id:
             # Visitor - block compute operations  
             message = "Compute operations require user login"
             self.cost_logger.warning(f"Visitor {cookie_id} - {message}")
             return False, message, total_cost
         
-        # Record compute transaction
-        self.record_compute_transaction(
-            user_id, cookie_id, space_id, action, compute_time_seconds,
-            cost_per_second, total_cost, balance_before, balance_after
+        # Deduct credits and record the compute transaction together
+        success, message, balance_before, balance_after = self._charge(
+            user_id, total_cost,
+            """
+                INSERT INTO computes 
+                (user_id, cookie_id, space_id, action, compute_time_seconds, 
+                 cost_per_second, total_cost, balance_before, balance_after)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """,
+            lambda before, after: (user_id, cookie_id, space_id, action, compute_time_seconds,
+                                   cost_per_second, total_cost, before, after)
         )
+        if not success:
+            self.cost_logger.warning(f"User {user_id} - {message}")
+            return False, message, total_cost
+        self.cost_logger.info(f"User {user_id} - Deducted {total_cost:.6f} credits for {action}. Balance: {balance_before:.2f} -> {balance_after:.2f}")
         
         # Log to cost.log
         user_identifier = f"user_id:{user_id}" if user_id else f"cookie_id:{cookie_id}"
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# components/CreditLedger.py
+"""
+Credit Ledger Component for XSpace Downloader
+
+Applies AI charges to user balances in batches:
+
+- A job collects its charges (one per AI call or chunk) and applies them at
+  once: one locked balance read, one UPDATE of users.credits for the total,
+  one multi-row INSERT into transactions and one space_cost update per cost
+  column, all in a single database transaction
+- transactions rows are append-only; each carries an idempotency key, so a
+  batch retried after a lost commit acknowledgement is not charged twice
+- Balances read for page rendering are cached for a few seconds per process
+  and updated in place after every batch this process applies; a change made
+  in another process (a purchase, an admin reset) shows on pages within
+  BALANCE_TTL seconds, so credit checks read with max_age=0
+- Callers pass a stable job_key (job id plus step), so a requeued or retried
+  job reuses its idempotency keys instead of being charged again
+
+Usage Examples:
+
+    from components.CreditLedger import credit_ledger
+
+    charges = [credit_ledger.make_charge(space_id, 'translation', 'openai/gpt-4o-mini', 1200, 300, 1.0)]
+    success, message, result = credit_ledger.apply(user_id, cookie_id, charges,
+                                                   job_key=f"translation-job:{job_id}")
+
+    balance = credit_ledger.get_balance(user_id)
+"""
+
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+from .RateLimiter import retry_with_backoff
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('credit_ledger')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# Seconds a cached balance is served before it is read again
+BALANCE_TTL = 15.0
+
+# Seconds before transactions is checked again for the idempotency_key column
+KEY_COLUMN_CHECK_INTERVAL = 300.0
+
+# Cost column in space_cost for each action
+SPACE_COST_COLUMNS = {
+    'transcription': 'transcription_cost',
+    'translation': 'translation_cost',
+    'summary': 'summary_cost',
+    'language_detection': 'transcription_cost',  # Group with transcription
+    'tag_generation': 'transcription_cost',  # Group with transcription
+    'text_generation': 'summary_cost'  # Group with summary
+}
+
+TRANSACTION_COLUMNS = ('user_id', 'cookie_id', 'space_id', 'action', 'ai_model', 'input_tokens',
+                       'output_tokens', 'cost', 'balance_before', 'balance_after',
+                       'source_language', 'target_language')
+
+
+def space_cost_column(action: str) -> Optional[str]:
+    """
+    Map an action to its space_cost column.
+
+    Args:
+        action (str): Action name, e.g. 'translation' or 'translation (en -> es)'
+
+    Returns:
+        str: Column name, or None if the action is not tracked per space
+    """
+    return SPACE_COST_COLUMNS.get((action or '').split(' ')[0].lower())
+
+
+class CreditLedger:
+    """Batched, idempotent credit charges with a cached balance read path."""
+
+    def __init__(self, db=None, balance_ttl: float = BALANCE_TTL, attempts: int = 3):
+        """
+        Initialize the ledger.
+
+        Args:
+            db (DatabaseManager, optional): Database to write to; the shared
+                                            DatabaseManager is used if not given
+            balance_ttl (float): Seconds a cached balance stays valid
+            attempts (int): Attempts per batch when the database fails (e.g. deadlocks)
+        """
+        self._db = db
+        self.balance_ttl = balance_ttl
+        self.attempts = max(1, int(attempts))
+        self._balances = {}
+        self._has_key_column = None
+        self._key_column_checked_at = 0.0
+        self.key_column_check_interval = KEY_COLUMN_CHECK_INTERVAL
+        self._lock = threading.Lock()
+        self._stats = {'batches': 0, 'charges': 0, 'duplicates': 0, 'rejected': 0,
+                       'balance_hits': 0, 'balance_reads': 0}
+
+    @property
+    def db(self):
+        """Database used for charges, created on first use."""
+        if self._db is None:
+            from .DatabaseManager import DatabaseManager
+            self._db = DatabaseManager()
+        return self._db
+
+    @staticmethod
+    def make_charge(space_id: str, action: str, ai_model: str, input_tokens: int, output_tokens: int,
+                    cost: float, source_language: Optional[str] = None, target_language: Optional[str] = None,
+                    idempotency_key: Optional[str] = None) -> Dict:
+        """
+        Build one charge for apply().
+
+        Args:
+            space_id (str): Space the charge belongs to
+            action (str): Action type (transcription, translation, summary, etc.)
+            ai_model (str): "vendor/model"
+            input_tokens (int): Input tokens used
+            output_tokens (int): Output tokens generated
+            cost (float): Cost in credits
+            source_language (str, optional): Source language for translations
+            target_language (str, optional): Target language for translations
+            idempotency_key (str, optional): Unique key; derived from the batch if not given
+
+        Returns:
+            dict: The charge
+        """
+        return {'space_id': space_id, 'action': action, 'ai_model': ai_model,
+                'input_tokens': int(input_tokens or 0), 'output_tokens': int(output_tokens or 0),
+                'cost': float(cost), 'source_language': source_language,
+                'target_language': target_language, 'idempotency_key': idempotency_key}
+
+    def _key_column_available(self, cursor) -> bool:
+        """Whether transactions has the idempotency_key column (re-checked every few minutes)."""
+        if (self._has_key_column is None
+                or time.monotonic() - self._key_column_checked_at >= self.key_column_check_interval):
+            cursor.execute("SHOW COLUMNS FROM transactions LIKE 'idempotency_key'")
+            had_key_column = self._has_key_column
+            self._has_key_column = cursor.fetchone() is not None
+            self._key_column_checked_at = time.monotonic()
+            if self._has_key_column and had_key_column is False:
+                logger.info("transactions.idempotency_key is now present; charges are keyed again")
+            elif not self._has_key_column and had_key_column is not False:
+                logger.warning("transactions.idempotency_key is missing; run add_idempotency_key_to_transactions.sql "
+                               "to protect retried charges from being applied twice")
+        return self._has_key_column
+
+    def _apply_once(self, user_id: int, cookie_id: Optional[str], charges: List[Dict],
+                    deduct: bool) -> Tuple[bool, str, Dict]:
+        """Apply a batch in one transaction (see apply())."""
+        with self.db.get_connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute("SELECT credits FROM users WHERE id = %s FOR UPDATE", (user_id,))
+                row = cursor.fetchone()
+                if row is None and deduct:
+                    connection.rollback()
+                    return False, "User not found", {}
+                balance = float(row[0]) if row else 0.0
+
+                use_keys = self._key_column_available(cursor)
+                pending = charges
+                if use_keys:
+                    keys = [charge['idempotency_key'] for charge in charges]
+                    cursor.execute(f"""
+                        SELECT idempotency_key FROM transactions
+                        WHERE idempotency_key IN ({', '.join(['%s'] * len(keys))})
+                    """, keys)
+                    applied = {applied_key for (applied_key,) in cursor.fetchall()}
+                    pending = [charge for charge in charges if charge['idempotency_key'] not in applied]
+
+                result = {'balance_before': balance, 'balance_after': balance, 'cost': 0.0,
+                          'charges': len(pending), 'duplicates': len(charges) - len(pending)}
+                if not pending:
+                    connection.rollback()
+                    return True, "Charges already applied", result
+
+                total = sum(charge['cost'] for charge in pending)
+                result['cost'] = total
+                if deduct and balance < total:
+                    connection.rollback()
+                    return False, f"Insufficient credits. Required: {total:.2f}, Available: {balance:.2f}", result
+
+                if deduct:
+                    cursor.execute("UPDATE users SET credits = GREATEST(0, credits - %s) WHERE id = %s",
+                                   (total, user_id))
+
+                # Append one row per charge, each showing the running balance
+                columns = TRANSACTION_COLUMNS + (('idempotency_key',) if use_keys else ())
+                rows = []
+                running = balance
+                for charge in pending:
+                    after = max(0.0, running - charge['cost']) if deduct else running
+                    values = [user_id, cookie_id, charge['space_id'], charge['action'], charge['ai_model'],
+                              charge['input_tokens'], charge['output_tokens'], charge['cost'], running, after,
+                              charge['source_language'], charge['target_language']]
+                    if use_keys:
+                        values.append(charge['idempotency_key'])
+                    rows.append(values)
+                    running = after
+                placeholders = '(' + ', '.join(['%s'] * len(columns)) + ')'
+                cursor.execute(f"""
+                    INSERT INTO transactions ({', '.join(columns)})
+                    VALUES {', '.join([placeholders] * len(rows))}
+                """, [value for values in rows for value in values])
+
+                # One space_cost statement per cost column, covering every space in the batch
+                space_costs = {}
+                for charge in pending:
+                    column = space_cost_column(charge['action'])
+                    if column and charge['space_id']:
+                        per_space = space_costs.setdefault(column, {})
+                        per_space[charge['space_id']] = per_space.get(charge['space_id'], 0.0) + charge['cost']
+                for column, per_space in space_costs.items():
+                    cursor.execute(f"""
+                        INSERT INTO space_cost (space_id, {column})
+                        VALUES {', '.join(['(%s, %s)'] * len(per_space))}
+                        ON DUPLICATE KEY UPDATE {column} = {column} + VALUES({column})
+                    """, [value for item in per_space.items() for value in item])
+
+                connection.commit()
+                result['balance_after'] = running
+                return True, "Charges applied", result
+
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    def apply(self, user_id: int, cookie_id: Optional[str], charges: List[Dict], deduct: bool = True,
+              job_key: Optional[str] = None) -> Tuple[bool, str, Dict]:
+        """
+        Apply a job's charges in one transaction.
+
+        Either every new charge is recorded (and the total deducted), or none is.
+        Charges whose idempotency key is already in transactions are skipped.
+
+        Args:
+            user_id (int): User to charge
+            cookie_id (str, optional): Visitor cookie stored with the rows
+            charges (list): Charges from make_charge()
+            deduct (bool): Deduct the total from the balance; when False the charges
+                           are only recorded
+            job_key (str, optional): Prefix for charges without an idempotency key,
+                                     e.g. "translation-job:<id>"; it must stay the same
+                                     when the job is retried. A new one is generated if
+                                     not given, which protects only this call's retries
+
+        Returns:
+            tuple: (success, message, {'cost', 'balance_before', 'balance_after',
+                    'charges', 'duplicates'})
+        """
+        if not charges:
+            return True, "No charges", {'cost': 0.0, 'charges': 0, 'duplicates': 0}
+
+        job_key = job_key or uuid.uuid4().hex
+        charges = [dict(charge, idempotency_key=charge.get('idempotency_key') or f"{job_key}:{index}")
+                   for index, charge in enumerate(charges)]
+
+        # Keys make retries safe: a batch that did commit is skipped on the next attempt
+        success, message, result = retry_with_backoff(
+            lambda: self._apply_once(user_id, cookie_id, charges, deduct),
+            attempts=self.attempts, base_delay=0.2, description=f"credit batch {job_key}")
+
+        with self._lock:
+            self._stats['batches'] += 1
+            self._stats['charges'] += result.get('charges', 0) if success else 0
+            self._stats['duplicates'] += result.get('duplicates', 0)
+            self._stats['rejected'] += 0 if success else 1
+            if 'balance_after' in result:
+                self._balances[user_id] = (result['balance_after'], time.monotonic())
+        return success, message, result
+
+    def get_balance(self, user_id: int, max_age: Optional[float] = None) -> float:
+        """
+        Get a user's credit balance, served from the cache when fresh.
+
+        Use this for display; pass max_age=0 for checks that gate an operation,
+        since a cached value does not see changes made by other processes.
+        apply() re-reads the balance under a lock before charging.
+
+        Args:
+            user_id (int): User ID
+            max_age (float, optional): Oldest acceptable cached value in seconds;
+                                       defaults to the ledger's balance_ttl
+
+        Returns:
+            float: Current balance (0.0 if the user is unknown or the read fails)
+        """
+        max_age = self.balance_ttl if max_age is None else max_age
+        with self._lock:
+            cached = self._balances.get(user_id)
+            if cached and time.monotonic() - cached[1] < max_age:
+                self._stats['balance_hits'] += 1
+                return cached[0]
+
+        try:
+            with self.db.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute("SELECT credits FROM users WHERE id = %s", (user_id,))
+                row = cursor.fetchone()
+                cursor.close()
+        except Exception as e:
+            logger.error(f"Error getting balance for user {user_id}: {e}")
+            return cached[0] if cached else 0.0
+
+        balance = float(row[0]) if row else 0.0
+        with self._lock:
+            self._stats['balance_reads'] += 1
+            self._balances[user_id] = (balance, time.monotonic())
+        return balance
+
+    def invalidate_balance(self, user_id: Optional[int] = None):
+        """
+        Drop a cached balance after credits change outside the ledger (purchases, resets).
+
+        Only this process's cache is cleared; other processes keep serving their
+        cached value for up to balance_ttl seconds.
+
+        Args:
+            user_id (int, optional): User to drop; all users if not given
+        """
+        with self._lock:
+            if user_id is None:
+                self._balances.clear()
+            else:
+                self._balances.pop(user_id, None)
+
+    def get_stats(self) -> Dict:
+        """Batch counters and balance cache size."""
+        with self._lock:
+            return dict(self._stats, cached_balances=len(self._balances))
+
+
+# Global credit ledger
+credit_ledger = CreditLedger()
@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+# components/KeywordIndex.py
+"""
+Keyword index for XSpace Downloader.
+
+Keeps an SQLite sidecar database with term statistics for every transcript:
+
+- per transcript: counts of its words and two-word phrases, and how proper
+  nouns are spelled
+- across the corpus: how many transcripts contain each term
+
+Tags are the terms with the highest TF-IDF score, so words every Space uses
+("community", "question") sink and the subjects that set a Space apart rise,
+without any AI calls. The index is updated incrementally whenever a
+transcript is saved; tagging the whole archive reads only this database.
+
+Usage:
+    from components.KeywordIndex import keyword_index
+
+    keyword_index.index_document(space_id, 'en-US', transcript_text)
+    tags = keyword_index.suggest_tags(transcript_text, max_tags=8)
+    for space_id, language, tags in keyword_index.tag_documents(max_tags=8):
+        ...
+"""
+
+import re
+import json
+import math
+import time
+import logging
+from collections import Counter
+
+from components.SQLiteStore import SQLiteStore
+from components.TagExtractor import COMMON_WORDS
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('keyword_index')
+except ImportError:
+    logger = logging.getLogger(__name__)
+
+# Default location of the sidecar database
+DEFAULT_INDEX_PATH = './data/keyword_index.db'
+
+# Words never used as tags or inside tag phrases
+STOP_WORDS = COMMON_WORDS | {
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'any', 'can', 'had', 'her',
+    'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'man', 'new',
+    'now', 'old', 'see', 'two', 'way', 'who', 'boy', 'did', 'its', 'let', 'put', 'say',
+    'she', 'too', 'use', 'that', 'this', 'with', 'have', 'from', 'they', 'will', 'what',
+    'when', 'your', 'their', 'them', 'then', 'than', 'were', 'which', 'while', 'where',
+    'into', 'also', 'some', 'more', 'most', 'much', 'many', 'only', 'other', 'over',
+    'such', 'even', 'still', 'these', 'those', 'each', 'every', 'both', 'again', 'ever',
+    'been', 'does', 'done', 'said', 'make', 'made', 'take', 'come', 'came', 'give',
+    'gave', 'goes', 'went', 'gonna', 'wanna', 'kind', 'sort', 'lot', 'lots', 'yes',
+    'yeah', 'hey', 'hello', 'thanks', 'guys', 'everyone', 'everybody', 'someone',
+    'somebody', 'anyone', 'anything', 'everything', 'nothing', 'today', 'tomorrow',
+    'yesterday', 'year', 'years', 'week', 'month', 'times', 'things', 'point', 'part',
+    'able', 'sure', 'great', 'okay', 'alright', 'little', 'first', 'last', 'next',
+    'back', 'down', 'just', 'like', 'know', 'want', 'need', 'there', 'here', 'about',
+    'would', 'could', 'should', 'because', 'really', 'actually', 'basically', 'right',
+    "don't", "can't", "it's", "that's", "i'm", "we're", "you're", "they're", "i've",
+    "we've", "there's", "let's", "didn't", "isn't", "wasn't", "won't", "doesn't"
+}
+
+# Strips "[HH:MM:SS]" transcript timecodes
+_TIMECODE = re.compile(r'\[\d{1,2}:\d{2}:\d{2}\]')
+
+# Phrases never span a sentence or line break
+_SENTENCE_BREAK = re.compile(r'[.!?;:\n]+')
+
+# Words: letters first, then letters, digits, apostrophes or hyphens
+_WORD = re.compile(r"[^\W\d_][\w'’-]*", re.UNICODE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS keyword_docs (
+    space_id TEXT NOT NULL,
+    language TEXT NOT NULL,
+    stats TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (space_id, language)
+);
+
+CREATE TABLE IF NOT EXISTS term_df (
+    term TEXT PRIMARY KEY,
+    df INTEGER NOT NULL
+);
+"""
+
+
+def extract_terms(text):
+    """
+    Count the candidate tag terms in a transcript.
+
+    Words shorter than three letters and stop words are skipped. Two-word
+    phrases are kept when they occur at least twice. A term is spelled with
+    capitals when most of its occurrences away from sentence starts are
+    capitalised (proper nouns).
+
+    Args:
+        text (str): Transcript text (timecodes are ignored)
+
+    Returns:
+        tuple: (Counter of terms, {term: display spelling} for proper nouns)
+    """
+    counts = Counter()
+    phrases = Counter()
+    capitalised = Counter()
+    spellings = {}
+
+    for sentence in _SENTENCE_BREAK.split(_TIMECODE.sub(' ', text or '')):
+        words = [word.strip("'’-") for word in _WORD.findall(sentence)]
+        previous = None
+        for position, word in enumerate(words):
+            lowered = word.lower()
+            if len(lowered) < 3 or lowered in STOP_WORDS:
+                previous = None
+                continue
+
+            counts[lowered] += 1
+            if position > 0 and word[0].isupper():
+                capitalised[lowered] += 1
+                spellings.setdefault(lowered, Counter())[word] += 1
+            if previous:
+                phrases[f"{previous} {lowered}"] += 1
+            previous = lowered
+
+    display = {}
+    for term, capital_count in capitalised.items():
+        if capital_count * 2 >= counts[term]:
+            display[term] = spellings[term].most_common(1)[0][0]
+
+    # Phrases seen once are noise and would bloat the index
+    for phrase, count in phrases.items():
+        if count < 2:
+            continue
+        counts[phrase] = count
+        first, second = phrase.split(' ')
+        if first in display and second in display:
+            display[phrase] = f"{display[first]} {display[second]}"
+
+    return counts, display
+
+
+def _select_tags(ranked, max_tags):
+    """Take the best tags, skipping terms that overlap a tag already chosen."""
+    chosen = []
+    chosen_words = []
+    for term, label in ranked:
+        words = set(term.split())
+        if any(words <= existing or existing <= words for existing in chosen_words):
+            continue
+        chosen.append(label)
+        chosen_words.append(words)
+        if len(chosen) >= max_tags:
+            break
+    return chosen
+
+
+def score_terms(counts, display, frequencies, total_documents, max_tags=8,
+                min_count=2, max_document_ratio=0.5):
+    """
+    Rank a transcript's terms by TF-IDF and return the best as tags.
+
+    Args:
+        counts (Counter): Term counts for the transcript
+        display (dict): Display spellings for proper nouns
+        frequencies (dict): Corpus document frequency of each term
+        total_documents (int): Number of documents in the corpus
+        max_tags (int): Number of tags to return
+        min_count (int): Minimum occurrences in the transcript
+        max_document_ratio (float): Terms in more than this share of a corpus of
+                                    at least 10 documents are treated as common
+
+    Returns:
+        list: Tags, best first
+    """
+    terms = [term for term, count in counts.items() if count >= min_count]
+    if not terms:
+        return []
+
+    documents = max(1, total_documents)
+    tf = [counts[term] for term in terms]
+    df = [max(1, frequencies.get(term, 0)) for term in terms]
+    boost = [(1.5 if ' ' in term else 1.0) * (1.5 if term in display else 1.0) for term in terms]
+
+    if NUMPY_AVAILABLE:
+        tf_array = np.asarray(tf, dtype=np.float64)
+        df_array = np.asarray(df, dtype=np.float64)
+        scores = (1.0 + np.log(tf_array)) * (np.log((1.0 + documents) / (1.0 + df_array)) + 1.0)
+        scores *= np.asarray(boost)
+        if documents >= 10:
+            scores[df_array / documents > max_document_ratio] = 0.0
+        order = [index for index in np.argsort(-scores, kind='stable') if scores[index] > 0]
+    else:
+        scores = []
+        for count, frequency, weight in zip(tf, df, boost):
+            score = (1.0 + math.log(count)) * (math.log((1.0 + documents) / (1.0 + frequency)) + 1.0) * weight
+            if documents >= 10 and frequency / documents > max_document_ratio:
+                score = 0.0
+            scores.append(score)
+        order = [index for index in sorted(range(len(terms)), key=lambda index: -scores[index])
+                 if scores[index] > 0]
+
+    ranked = [(terms[index], display.get(terms[index], terms[index])) for index in order]
+    return _select_tags(ranked, max_tags)
+
+
+class KeywordIndex:
+    """Corpus term statistics for tagging transcripts without AI calls."""
+
+    def __init__(self, db_path=DEFAULT_INDEX_PATH):
+        """
+        Initialize the keyword index.
+
+        Args:
+            db_path (str): Path to the SQLite sidecar database
+        """
+        self.db_path = str(db_path)
+        self._store = SQLiteStore(self.db_path, _SCHEMA)
+
+    def _get_connection(self):
+        """Get this thread's SQLite connection."""
+        return self._store.connection()
+
+    def _adjust_frequencies(self, connection, terms, delta):
+        """Add delta to the document frequency of each term."""
+        connection.executemany(
+            """
+            INSERT INTO term_df (term, df) VALUES (?, ?)
+            ON CONFLICT(term) DO UPDATE SET df = df + excluded.df
+            """,
+            [(term, delta) for term in terms]
+        )
+
+    def _remove_rows(self, connection, rows):
+        """Remove documents and take their terms out of the frequencies."""
+        for row in rows:
+            terms = json.loads(row['stats']).get('counts', {})
+            self._adjust_frequencies(connection, terms, -1)
+            connection.execute(
+                "DELETE FROM keyword_docs WHERE space_id = ? AND language = ?",
+                (row['space_id'], row['language'])
+            )
+        if rows:
+            connection.execute("DELETE FROM term_df WHERE df <= 0")
+
+    def index_document(self, space_id, language, transcript_text):
+        """
+        Add or replace one transcript's term statistics.
+
+        Args:
+            space_id (str): The space ID
+            language (str): Transcript language code
+            transcript_text (str): Transcript content
+
+        Returns:
+            int: Number of distinct terms indexed
+        """
+        counts, display = extract_terms(transcript_text)
+        connection = self._get_connection()
+        with connection:
+            old_rows = connection.execute(
+                "SELECT space_id, language, stats FROM keyword_docs WHERE space_id = ? AND language = ?",
+                (space_id, language)
+            ).fetchall()
+            self._remove_rows(connection, old_rows)
+            if counts:
+                connection.execute(
+                    "INSERT INTO keyword_docs (space_id, language, stats, updated_at) VALUES (?, ?, ?, ?)",
+                    (space_id, language,
+                     json.dumps({'counts': counts, 'display': display}, ensure_ascii=False),
+                     time.time())
+                )
+                self._adjust_frequencies(connection, counts, 1)
+        return len(counts)
+
+    def remove_document(self, space_id, language=None):
+        """
+        Remove a space's transcripts, or one of them, from the index.
+
+        Args:
+            space_id (str): The space ID
+            language (str, optional): Only remove the transcript in this language
+        """
+        connection = self._get_connection()
+        with connection:
+            if language:
+                rows = connection.execute(
+                    "SELECT space_id, language, stats FROM keyword_docs WHERE space_id = ? AND language = ?",
+                    (space_id, language)
+                ).fetchall()
+            else:
+                rows = connection.execute(
+                    "SELECT space_id, language, stats FROM keyword_docs WHERE space_id = ?",
+                    (space_id,)
+                ).fetchall()
+            self._remove_rows(connection, rows)
+
+    def document_count(self):
+        """Get the number of indexed transcripts."""
+        return self._get_connection().execute("SELECT COUNT(*) FROM keyword_docs").fetchone()[0]
+
+    def get_frequencies(self, terms=None):
+        """
+        Get corpus document frequencies.
+
+        Args:
+            terms (iterable, optional): Only these terms (default: every term)
+
+        Returns:
+            dict: {term: number of transcripts containing it}
+        """
+        connection = self._get_connection()
+        if terms is None:
+            return {row['term']: row['df'] for row in connection.execute("SELECT term, df FROM term_df")}
+
+        terms = list(terms)
+        frequencies = {}
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(terms), 500):
+            batch = terms[start:start + 500]
+            placeholders = ', '.join('?' * len(batch))
+            for row in connection.execute(
+                f"SELECT term, df FROM term_df WHERE term IN ({placeholders})", batch
+            ):
+                frequencies[row['term']] = row['df']
+        return frequencies
+
+    def suggest_tags(self, transcript_text, max_tags=8, space_id=None, language=None):
+        """
+        Suggest tags for a transcript from the corpus statistics.
+
+        The transcript does not have to be indexed; unless space_id and
+        language name an indexed transcript, it is counted as one more
+        document containing each of its terms.
+
+        Args:
+            transcript_text (str): Transcript content
+            max_tags (int): Number of tags to return
+            space_id (str, optional): The space ID, if the transcript is indexed
+            language (str, optional): Transcript language code
+
+        Returns:
+            list: Tags, best first
+        """
+        counts, display = extract_terms(transcript_text)
+        candidates = [term for term, count in counts.items() if count >= 2]
+        if not candidates:
+            return []
+
+        frequencies = self.get_frequencies(candidates)
+        documents = self.document_count()
+        indexed = space_id is not None and self._get_connection().execute(
+            "SELECT 1 FROM keyword_docs WHERE space_id = ? AND language = ?",
+            (space_id, language)
+        ).fetchone() is not None
+        if not indexed:
+            documents += 1
+            frequencies = {term: frequencies.get(term, 0) + 1 for term in candidates}
+        return score_terms(counts, display, frequencies, documents, max_tags)
+
+    def tag_documents(self, max_tags=8, space_ids=None):
+        """
+        Suggest tags for every indexed transcript in one pass.
+
+        Frequencies are loaded once, so the whole archive is scored without
+        touching MySQL or an AI provider.
+
+        Args:
+            max_tags (int): Tags per transcript
+            space_ids (iterable, optional): Only these spaces
+
+        Yields:
+            tuple: (space_id, language, tags)
+        """
+        connection = self._get_connection()
+        frequencies = self.get_frequencies()
+        documents = self.document_count()
+        wanted = set(space_ids) if space_ids is not None else None
+
+        for row in connection.execute("SELECT space_id, language, stats FROM keyword_docs ORDER BY space_id"):
+            if wanted is not None and row['space_id'] not in wanted:
+                continue
+            stats = json.loads(row['stats'])
+            yield row['space_id'], row['language'], score_terms(
+                Counter(stats.get('counts', {})), stats.get('display', {}),
+                frequencies, documents, max_tags
+            )
+
+    def common_terms(self, min_ratio=0.5, min_documents=10):
+        """
+        Get single words that appear in most transcripts.
+
+        Args:
+            min_ratio (float): Minimum share of transcripts containing the word
+            min_documents (int): Corpus size below which nothing is reported
+
+        Returns:
+            list: Words, most widespread first
+        """
+        documents = self.document_count()
+        if documents < min_documents:
+            return []
+        rows = self._get_connection().execute(
+            "SELECT term FROM term_df WHERE df >= ? AND term NOT LIKE '% %' ORDER BY df DESC",
+            (math.ceil(documents * min_ratio),)
+        ).fetchall()
+        return [row['term'] for row in rows]
+
+    def rebuild(self, db_connection, batch_size=200):
+        """
+        Rebuild the whole index from MySQL.
+
+        Args:
+            db_connection: MySQL connection
+            batch_size (int): Number of transcripts fetched per round-trip
+
+        Returns:
+            int: Number of transcripts indexed
+        """
+        connection = self._get_connection()
+        with connection:
+            connection.execute("DELETE FROM keyword_docs")
+            connection.execute("DELETE FROM term_df")
+
+        transcript_count = 0
+        last_id = 0
+        while True:
+            cursor = db_connection.cursor(dictionary=True)
+            try:
+                cursor.execute(
+                    """
+                    SELECT id, space_id, language, transcript
+                    FROM space_transcripts
+                    WHERE id > %s
+                    ORDER BY id
+                    LIMIT %s
+                    """,
+                    (last_id, batch_size)
+                )
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+
+            if not rows:
+                break
+
+            for row in rows:
+                self.index_document(row['space_id'], row['language'], row['transcript'] or '')
+                transcript_count += 1
+            last_id = rows[-1]['id']
+
+        logger.info(f"Keyword index rebuilt: {transcript_count} transcripts")
+        return transcript_count
+
+    def get_stats(self):
+        """Get the number of indexed transcripts and distinct terms."""
+        connection = self._get_connection()
+        terms = connection.execute("SELECT COUNT(*) FROM term_df").fetchone()[0]
+        return {'documents': self.document_count(), 'terms': terms, 'path': self.db_path}
+
+
+# Global keyword index instance
+keyword_index = KeywordIndex()
+
+
+def update_keyword_index(space_id, language, transcript_text):
+    """
+    Index a saved transcript's terms without letting indexing errors reach the caller.
+
+    Args:
+        space_id (str): The space ID
+        language (str): Transcript language code
+        transcript_text (str): Transcript content
+    """
+    try:
+        keyword_index.index_document(space_id, language, transcript_text)
+    except Exception as e:
+        logger.warning(f"Could not update keyword index for transcript {space_id}/{language}: {e}")
+
+
+def remove_from_keyword_index(space_id, language=None):
+    """
+    Remove a space, or one of its transcripts, from the keyword index without raising.
+
+    Args:
+        space_id (str): The space ID
+        language (str, optional): Only remove the transcript in this language
+    """
+    try:
+        keyword_index.remove_document(space_id, language)
+    except Exception as e:
+        logger.warning(f"Could not remove {space_id} from keyword index: {e}")
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# components/LanguageIdentifier.py
+"""
+Language Identifier Component for XSpace Downloader
+
+Identifies the spoken language of a recording once, from a few short windows
+sampled across the file, instead of transcribing the whole file (or its
+first chunk) just to read the language back.
+
+- Windows are spread through the recording, skipping the intro, so music or
+  silence at the start does not decide the language
+- Per-window language probabilities are summed and the best code wins
+- Results are cached by the audio fingerprint, so later stages and
+  re-transcriptions of the same audio reuse the answer
+
+The engine-specific work (Whisper's detect_language on a log-mel window, or
+an API call on a short clip) is passed in as a function.
+
+Usage Examples:
+
+    from components.LanguageIdentifier import LanguageIdentifier
+
+    identifier = LanguageIdentifier(windows=3)
+    language, confidence = identifier.identify('downloads/abc.mp3', duration, detect_window,
+                                               method='whisper-base')
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('language_identifier')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+
+def sample_window_starts(duration: Optional[float], windows: int = 3,
+                         window_seconds: float = 30.0) -> List[float]:
+    """
+    Choose where to sample language windows in a recording.
+
+    Args:
+        duration (float, optional): Recording length in seconds (None if unknown)
+        windows (int): Number of windows
+        window_seconds (float): Length of each window
+
+    Returns:
+        list: Window start times in seconds
+    """
+    if not duration or duration <= window_seconds or windows <= 1:
+        if duration and duration > window_seconds and windows == 1:
+            return [round(max(0.0, duration / 2 - window_seconds / 2), 3)]
+        return [0.0]
+
+    starts = []
+    for index in range(windows):
+        centre = duration * (index + 1) / (windows + 1)
+        start = min(max(0.0, centre - window_seconds / 2), duration - window_seconds)
+        starts.append(round(start, 3))
+    return sorted(set(starts))
+
+
+def combine_votes(votes: List[Dict[str, float]]) -> Tuple[Optional[str], float]:
+    """
+    Combine per-window language probabilities.
+
+    Args:
+        votes (list): One {language_code: probability} dict per window
+
+    Returns:
+        tuple: (best language code or None, its mean probability)
+    """
+    totals = {}
+    counted = 0
+    for vote in votes:
+        if not vote:
+            continue
+        counted += 1
+        for code, probability in vote.items():
+            totals[code] = totals.get(code, 0.0) + float(probability)
+    if not totals:
+        return None, 0.0
+    code = max(totals, key=totals.get)
+    return code, totals[code] / counted
+
+
+class LanguageIdentifier:
+    """Identifies a recording's language from a few sampled windows."""
+
+    def __init__(self, windows: int = 3, window_seconds: float = 30.0, cache=None):
+        """
+        Initialize the identifier.
+
+        Args:
+            windows (int): Number of windows sampled per recording
+            window_seconds (float): Length of each window
+            cache (TranscriptCache, optional): Cache for identified languages
+        """
+        self.windows = max(1, int(windows))
+        self.window_seconds = float(window_seconds)
+        self.cache = cache
+
+    def identify(self, audio_file: str, duration: Optional[float],
+                 detect_window: Callable[[str, float, float], Optional[Dict[str, float]]],
+                 method: str = 'default', use_cache: bool = True) -> Tuple[Optional[str], float]:
+        """
+        Identify the language of a recording.
+
+        Args:
+            audio_file (str): Path to the audio file
+            duration (float, optional): Recording length in seconds
+            detect_window (callable): detect_window(audio_file, start, seconds) ->
+                                      {language_code: probability} or None
+            method (str): Names the engine; part of the cache key
+            use_cache (bool): Whether to reuse a cached answer
+
+        Returns:
+            tuple: (language code or None, confidence 0-1)
+        """
+        key = None
+        if self.cache is not None:
+            try:
+                key = self.cache.make_key(audio_file, 'language-id', method, None,
+                                          {'windows': self.windows, 'window_seconds': self.window_seconds})
+                entry = self.cache.get_entry(key) if use_cache else None
+                cached = (entry or {}).get('result') or {}
+                if cached.get('language') not in (None, 'unknown'):
+                    logger.info(f"[LANGUAGE_ID] Using cached language {cached['language']} for {audio_file}")
+                    return cached['language'], float((entry.get('metadata') or {}).get('confidence') or 0)
+            except Exception as e:
+                logger.warning(f"Language cache lookup failed: {e}")
+
+        votes = []
+        for start in sample_window_starts(duration, self.windows, self.window_seconds):
+            try:
+                votes.append(detect_window(audio_file, start, self.window_seconds))
+            except Exception as e:
+                logger.warning(f"[LANGUAGE_ID] Window at {start:.0f}s failed: {e}")
+        language, confidence = combine_votes(votes)
+
+        if language:
+            logger.info(f"[LANGUAGE_ID] {audio_file}: {language} ({confidence:.0%} over {len(votes)} windows)")
+            if key:
+                self.cache.put(key, {'text': '', 'language': language},
+                               metadata={'kind': 'language-id', 'method': method, 'confidence': confidence})
+        else:
+            logger.warning(f"[LANGUAGE_ID] Could not identify the language of {audio_file}")
+        return language, confidence
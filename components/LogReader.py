@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+# components/LogReader.py
+"""
+Log Reader Component for XSpace Downloader
+
+Reads log files newest-first without loading them into memory. Files are read
+backwards from EOF in fixed-size blocks, so the cost of a page depends on the
+page size and depth rather than on the size of the file.
+
+Features:
+- Reverse block reader that yields lines from EOF towards the start of a file
+- Parsing of the logging formats used across the project
+  ("ts - name - LEVEL - message", "ts - LEVEL - message")
+- Multi-line entries (tracebacks) are folded into the entry that precedes them
+- Level, component and message pattern filters applied while streaming
+- Sparse offset index per file and filter so deep pages seek instead of rescanning
+- Timestamp-ordered merge of several files using a heap, with its own sparse
+  index of per-file positions for deep merged pages
+- Entry totals once a read has reached the start of the file(s), kept current
+  as files grow; unknown totals are reported as None rather than estimated
+
+Usage Examples:
+
+    from components.LogReader import log_reader
+
+    page = log_reader.read_entries('logs/app.log', offset=0, limit=100, levels=['ERROR'])
+    merged = log_reader.read_merged(['logs/app.log', 'logs/space.log'], offset=100, limit=100)
+"""
+
+import heapq
+import os
+import re
+import threading
+from typing import Dict, Iterable, Iterator, Optional, Pattern, Tuple
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('log_reader')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+
+# "2025-01-31 12:00:00" optionally followed by ",123" / ".123"
+_HEADER_RE = re.compile(r'^(\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:[,.]\d+)?) - (.*)$')
+
+
+def parse_log_line(line: str, source: str) -> Optional[Dict]:
+    """
+    Parse a single log line into an entry.
+
+    Args:
+        line (str): Raw log line without trailing newline
+        source (str): Name of the file the line came from (used as default component)
+
+    Returns:
+        dict: Entry with timestamp, level, component, source and message,
+              or None if the line does not start a new log record
+    """
+    match = _HEADER_RE.match(line)
+    if not match:
+        return None
+
+    timestamp, rest = match.groups()
+    parts = rest.split(' - ', 3)
+
+    # "LEVEL - message" or "name - LEVEL - message[ - ...]"
+    if parts[0] in LOG_LEVELS:
+        level = parts[0]
+        component = source
+        message = rest[len(parts[0]) + 3:]
+    elif len(parts) > 1 and parts[1] in LOG_LEVELS:
+        level = parts[1]
+        component = parts[0]
+        message = rest[len(parts[0]) + len(parts[1]) + 6:]
+    else:
+        level = 'INFO'
+        component = source
+        message = rest
+
+    return {
+        'timestamp': timestamp,
+        'level': level,
+        'component': component,
+        'source': source,
+        'message': message
+    }
+
+
+def iter_lines_reverse(handle, end: int, start: int = 0,
+                       block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yield lines from a binary file handle from ``end`` back to ``start``.
+
+    Args:
+        handle: File object opened in binary mode
+        end (int): Byte offset to start reading backwards from
+        start (int): Byte offset to stop at
+        block_size (int): Number of bytes read per seek
+
+    Returns:
+        iterator: (byte_offset, line) tuples, newest line first
+    """
+    position = end
+    remainder = b''
+
+    while position > start:
+        read_size = min(block_size, position - start)
+        position -= read_size
+        handle.seek(position)
+        block = handle.read(read_size) + remainder
+
+        lines = block.split(b'\n')
+        # The first piece may continue in the previous block
+        remainder = lines[0]
+
+        offsets = []
+        line_offset = position + len(lines[0]) + 1
+        for line in lines[1:]:
+            offsets.append((line_offset, line))
+            line_offset += len(line) + 1
+
+        for line_offset, line in reversed(offsets):
+            yield line_offset, line
+
+    yield start, remainder
+
+
+class LogReader:
+    """Reads log entries newest-first with paging, filtering and merging."""
+
+    def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE,
+                 checkpoint_interval: int = 500, max_checkpoints: int = 1000):
+        """
+        Initialize the log reader.
+
+        Args:
+            block_size (int): Bytes read per backwards seek
+            checkpoint_interval (int): Entries between sparse index checkpoints
+            max_checkpoints (int): Maximum checkpoints kept per file and filter
+        """
+        self.block_size = block_size
+        self.checkpoint_interval = checkpoint_interval
+        self.max_checkpoints = max_checkpoints
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize_filters(levels, component, message_pattern=None) -> Tuple[Optional[frozenset], Optional[str],
+                                                                              Optional[Pattern]]:
+        """Normalize level, component and message filters into a hashable form."""
+        if isinstance(levels, str):
+            levels = [levels]
+        level_set = frozenset(level.upper() for level in levels if level) if levels else None
+        component = component.lower() if component else None
+        if isinstance(message_pattern, str):
+            message_pattern = re.compile(message_pattern)
+        return level_set or None, component, message_pattern or None
+
+    @staticmethod
+    def _matches(entry: Dict, level_set, component, message_pattern=None) -> bool:
+        """Check an entry against normalized filters."""
+        if level_set and entry['level'] not in level_set:
+            return False
+        if message_pattern and not message_pattern.match(entry['message']):
+            return False
+        if component:
+            return component in entry['component'].lower() or component in entry['source'].lower()
+        return True
+
+    def iter_entries(self, path: str, end: Optional[int] = None, start: int = 0,
+                     levels=None, component: Optional[str] = None,
+                     source: Optional[str] = None, message_pattern=None) -> Iterator[Tuple[int, Dict]]:
+        """
+        Stream entries from a log file, newest first.
+
+        Args:
+            path (str): Path to the log file
+            end (int, optional): Byte offset to read backwards from (default: EOF)
+            start (int): Byte offset to stop at
+            levels (list, optional): Only yield entries with these levels
+            component (str, optional): Only yield entries whose component or
+                                       source contains this string
+            source (str, optional): Source name for entries (default: file stem)
+            message_pattern (str or re.Pattern, optional): Only yield entries whose
+                                                           message matches this pattern
+
+        Returns:
+            iterator: (byte_offset, entry) tuples, where byte_offset is where
+                      the entry's first line starts
+        """
+        level_set, component, message_pattern = self._normalize_filters(levels, component, message_pattern)
+        if source is None:
+            source = os.path.splitext(os.path.basename(path))[0]
+
+        with open(path, 'rb') as handle:
+            if end is None:
+                handle.seek(0, os.SEEK_END)
+                end = handle.tell()
+
+            continuation = []
+            for offset, raw in iter_lines_reverse(handle, end, start, self.block_size):
+                line = raw.decode('utf-8', errors='replace').rstrip('\r')
+                if not line.strip():
+                    continue
+
+                entry = parse_log_line(line, source)
+                if entry is None:
+                    continuation.append(line)
+                    continue
+
+                if continuation:
+                    entry['message'] += '\n' + '\n'.join(reversed(continuation))
+                    continuation = []
+
+                if self._matches(entry, level_set, component, message_pattern):
+                    yield offset, entry
+
+            # Lines before the first record in the file (e.g. a cut rotated log)
+            if continuation:
+                entry = {
+                    'timestamp': None,
+                    'level': 'INFO',
+                    'component': source,
+                    'source': source,
+                    'message': '\n'.join(reversed(continuation))
+                }
+                if self._matches(entry, level_set, component, message_pattern):
+                    yield start, entry
+
+    def _get_index(self, path: str, stat_result, filter_key) -> Dict:
+        """
+        Return the sparse index for a file and filter, adjusted to the current file.
+
+        Checkpoints map an entry number (counted from EOF) to the byte offset
+        to read backwards from to reach it. When the file has grown since the
+        index was built, only the appended bytes are scanned and the
+        checkpoints are shifted by the number of new entries. A truncated or
+        rotated file discards the index.
+        """
+        key = (path, filter_key)
+        with self._lock:
+            index = self._indexes.get(key)
+
+        if index and (index['inode'] != stat_result.st_ino or index['size'] > stat_result.st_size):
+            index = None
+
+        if index is None:
+            index = {'inode': stat_result.st_ino, 'size': stat_result.st_size, 'checkpoints': {}, 'total': None}
+        elif index['size'] < stat_result.st_size and (index['checkpoints'] or index['total'] is not None):
+            levels, component, message_pattern = filter_key
+            appended = self._count_entries_since(path, index['size'], stat_result.st_size,
+                                                 levels, component, message_pattern)
+            index = {
+                'inode': stat_result.st_ino,
+                'size': stat_result.st_size,
+                'checkpoints': {number + appended: offset for number, offset in index['checkpoints'].items()},
+                'total': index['total'] + appended if index['total'] is not None else None
+            }
+        else:
+            index['size'] = stat_result.st_size
+
+        with self._lock:
+            self._indexes[key] = index
+        return index
+
+    def _count_entries_since(self, path: str, old_size: int, new_size: int, levels, component,
+                             message_pattern=None) -> int:
+        """Count matching entries whose first line starts at or after ``old_size``."""
+        count = 0
+        for offset, _ in self.iter_entries(path, end=new_size, levels=levels, component=component,
+                                           message_pattern=message_pattern):
+            if offset < old_size:
+                break
+            count += 1
+        return count
+
+    def _record_checkpoint(self, index: Dict, number: int, offset: int):
+        """Store a checkpoint, dropping the shallowest ones beyond the cap."""
+        checkpoints = index['checkpoints']
+        checkpoints[number] = offset
+        if len(checkpoints) > self.max_checkpoints:
+            del checkpoints[min(checkpoints)]
+
+    def read_entries(self, path: str, offset: int = 0, limit: int = 100,
+                     levels=None, component: Optional[str] = None, message_pattern=None) -> Dict:
+        """
+        Read one page of entries from a single log file, newest first.
+
+        Args:
+            path (str): Path to the log file
+            offset (int): Number of matching entries to skip
+            limit (int): Maximum number of entries to return
+            levels (list, optional): Level filter
+            component (str, optional): Component filter
+            message_pattern (str or re.Pattern, optional): Message filter
+
+        Returns:
+            dict: entries, offset, next_offset, has_more and total (matching entries
+                  in the file, or None until a read has reached its start)
+        """
+        offset = max(0, int(offset))
+        limit = max(0, int(limit))
+        result = {'entries': [], 'offset': offset, 'next_offset': None, 'has_more': False, 'total': None}
+
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return result
+
+        filter_key = self._normalize_filters(levels, component, message_pattern)
+        index = self._get_index(path, stat_result, filter_key)
+
+        # Start from the deepest checkpoint at or before the requested offset
+        number, end = 0, stat_result.st_size
+        usable = [checkpoint for checkpoint in index['checkpoints'] if checkpoint <= offset]
+        if usable:
+            number = max(usable)
+            end = index['checkpoints'][number]
+
+        entries = []
+        for entry_offset, entry in self.iter_entries(
+            path, end=end, levels=filter_key[0], component=filter_key[1], message_pattern=filter_key[2]
+        ):
+            if number >= offset + limit:
+                result['has_more'] = True
+                break
+            if number >= offset:
+                entries.append(entry)
+            number += 1
+            # Reading backwards from the start of this entry yields entry ``number``
+            if number % self.checkpoint_interval == 0:
+                self._record_checkpoint(index, number, entry_offset)
+        else:
+            # Reached the start of the file, so every matching entry has been counted
+            index['total'] = number
+
+        result['entries'] = entries
+        result['total'] = index['total']
+        if result['has_more']:
+            result['next_offset'] = offset + limit
+        return result
+
+    def _merge_key(self, entry: Dict) -> str:
+        """Sort key for merging; entries without a timestamp sort oldest."""
+        timestamp = entry.get('timestamp') or ''
+        return timestamp.replace('T', ' ').replace(',', '.')
+
+    def _iter_tagged(self, path: str, end: int, levels, component,
+                     message_pattern=None) -> Iterator[Tuple[Dict, str, int]]:
+        """Entries of one file for merging, tagged with their file and byte offset."""
+        for entry_offset, entry in self.iter_entries(path, end=end, levels=levels, component=component,
+                                                     message_pattern=message_pattern):
+            yield entry, path, entry_offset
+
+    def iter_merged(self, paths: Iterable[str], levels=None,
+                    component: Optional[str] = None, message_pattern=None) -> Iterator[Dict]:
+        """
+        Stream entries from several files merged by timestamp, newest first.
+
+        Args:
+            paths (list): Paths to log files
+            levels (list, optional): Level filter
+            component (str, optional): Component filter
+            message_pattern (str or re.Pattern, optional): Message filter
+
+        Returns:
+            iterator: Entries in descending timestamp order
+        """
+        streams = []
+        for path in paths:
+            if os.path.isfile(path):
+                streams.append(
+                    entry for _, entry in self.iter_entries(path, levels=levels, component=component,
+                                                            message_pattern=message_pattern)
+                )
+        return heapq.merge(*streams, key=self._merge_key, reverse=True)
+
+    def _get_merged_index(self, paths: Tuple[str, ...], stats: Dict, filter_key) -> Dict:
+        """
+        Return the sparse index for merged reads of a set of files, adjusted to the files.
+
+        Checkpoints map a merged entry number to the byte offset each file is read
+        backwards from to reach it. Log files only grow at the end, so entries
+        appended since the index was built are newer than every indexed one; the
+        checkpoints shift by their count. A file that was truncated, rotated,
+        created or removed discards the index.
+        """
+        key = (paths, filter_key)
+        files = {path: (stat_result.st_ino, stat_result.st_size) for path, stat_result in stats.items()}
+        with self._lock:
+            index = self._indexes.get(key)
+
+        if index and (set(index['files']) != set(files) or any(
+                index['files'][path][0] != inode or index['files'][path][1] > size
+                for path, (inode, size) in files.items())):
+            index = None
+
+        if index is None:
+            index = {'files': files, 'checkpoints': {}, 'total': None}
+        elif index['files'] != files and (index['checkpoints'] or index['total'] is not None):
+            levels, component, message_pattern = filter_key
+            appended = sum(self._count_entries_since(path, index['files'][path][1], size,
+                                                     levels, component, message_pattern)
+                           for path, (_, size) in files.items() if size > index['files'][path][1])
+            index = {
+                'files': files,
+                'checkpoints': {number + appended: ends for number, ends in index['checkpoints'].items()},
+                'total': index['total'] + appended if index['total'] is not None else None
+            }
+        else:
+            index['files'] = files
+
+        with self._lock:
+            self._indexes[key] = index
+        return index
+
+    def read_merged(self, paths: Iterable[str], offset: int = 0, limit: int = 100,
+                    levels=None, component: Optional[str] = None, message_pattern=None) -> Dict:
+        """
+        Read one page of entries merged across several files, newest first.
+
+        Args:
+            paths (list): Paths to log files
+            offset (int): Number of matching entries to skip
+            limit (int): Maximum number of entries to return
+            levels (list, optional): Level filter
+            component (str, optional): Component filter
+            message_pattern (str or re.Pattern, optional): Message filter
+
+        Returns:
+            dict: entries, offset, next_offset, has_more and total (matching entries
+                  across the files, or None until a read has reached their start)
+        """
+        paths = list(paths)
+        if len(paths) == 1:
+            return self.read_entries(paths[0], offset, limit, levels, component, message_pattern)
+
+        offset = max(0, int(offset))
+        limit = max(0, int(limit))
+        result = {'entries': [], 'offset': offset, 'next_offset': None, 'has_more': False, 'total': None}
+
+        stats = {}
+        for path in paths:
+            try:
+                stats[path] = os.stat(path)
+            except OSError:
+                continue
+        if not stats:
+            return result
+
+        filter_key = self._normalize_filters(levels, component, message_pattern)
+        index = self._get_merged_index(tuple(paths), stats, filter_key)
+
+        # Resume every file from the deepest checkpoint at or before the requested offset
+        number = 0
+        ends = {path: stat_result.st_size for path, stat_result in stats.items()}
+        usable = [checkpoint for checkpoint in index['checkpoints'] if checkpoint <= offset]
+        if usable:
+            number = max(usable)
+            ends = dict(index['checkpoints'][number])
+
+        streams = [self._iter_tagged(path, ends[path], *filter_key)
+                   for path in paths if path in ends]
+        entries = []
+        for entry, path, entry_offset in heapq.merge(*streams, key=lambda item: self._merge_key(item[0]),
+                                                     reverse=True):
+            if number >= offset + limit:
+                result['has_more'] = True
+                break
+            if number >= offset:
+                entries.append(entry)
+            number += 1
+            # Reading each file backwards from these positions yields merged entry ``number``
+            ends[path] = entry_offset
+            if number % self.checkpoint_interval == 0:
+                self._record_checkpoint(index, number, dict(ends))
+        else:
+            index['total'] = number
+
+        result['entries'] = entries
+        result['total'] = index['total']
+        if result['has_more']:
+            result['next_offset'] = offset + limit
+        return result
+
+    def clear_index(self, path: Optional[str] = None):
+        """
+        Drop cached offset indexes.
+
+        Args:
+            path (str, optional): Only drop indexes for this file
+        """
+        with self._lock:
+            if path is None:
+                self._indexes.clear()
+            else:
+                # Merged indexes are keyed by every file they cover
+                for key in [key for key in self._indexes
+                            if key[0] == path or (isinstance(key[0], tuple) and path in key[0])]:
+                    del self._indexes[key]
+
+
+# Global log reader instance
+log_reader = LogReader()
@@ -4,7 +4,7 @@ LoggingCursor.py - A wrapper for MySQL cursor that logs all SQL queries
 """
 
 import time
-from .SQLLogger import sql_logger
+from .SQLLogger import sql_logger, cursor_row_count
 
 
 class LoggingCursor:
@@ -28,17 +28,18 @@ class LoggingCursor:
             return self._cursor.execute(query, params)
         
         # Execute with timing and logging
-        start_time = time.time()
+        start_time = time.perf_counter()
         error = None
         
         try:
             result = self._cursor.execute(query, params)
-            execution_time = time.time() - start_time
-            sql_logger.log_query(query, params, execution_time, self._component_name)
+            execution_time = time.perf_counter() - start_time
+            sql_logger.log_query(query, params, execution_time, self._component_name,
+                                 rows=cursor_row_count(self._cursor))
             return result
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             error = str(e)
             sql_logger.log_query(query, params, execution_time, self._component_name, error)
             raise  # Re-raise the exception
@@ -48,19 +49,20 @@ class LoggingCursor:
         if not sql_logger.is_enabled():
             return self._cursor.executemany(query, seq_of_params)
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         error = None
         
         try:
             result = self._cursor.executemany(query, seq_of_params)
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             sql_logger.log_query(f"{query} (executemany with {len(seq_of_params)} params)", 
                                str(seq_of_params)[:100] + "..." if len(str(seq_of_params)) > 100 else seq_of_params,
-                               execution_time, self._component_name)
+                               execution_time, self._component_name,
+                               rows=cursor_row_count(self._cursor))
             return result
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             error = str(e)
             sql_logger.log_query(f"{query} (executemany)", str(seq_of_params)[:100] + "...", 
                                execution_time, self._component_name, error)
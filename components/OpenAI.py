@@ -7,6 +7,9 @@ import json
 import logging
 from typing import Dict, List, Optional, Union, Tuple
 from .AI import AIProvider
+from .AIGateway import ai_gateway
+from .TranslationExecutor import (CHARS_PER_TOKEN, get_translation_executor, merge_usage, response_text,
+                                  split_sentence_chunks, translate_timecoded)
 
 logger = logging.getLogger(__name__)
 
@@ -28,9 +31,8 @@ class OpenAI(AIProvider):
         # Use GPT-4o as default - latest GPT-4 model with excellent performance and 128K context
         self.model = model or "gpt-4o"
         
-        # Initialize session with headers
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Shared keep-alive session for this API key
+        self.session = ai_gateway.get_session('openai', {
             'Authorization': f'Bearer {self.api_key}',
             'Content-Type': 'application/json'
         })
@@ -41,6 +43,9 @@ class OpenAI(AIProvider):
         """
         Make a request to OpenAI API.
         
+        The request goes through the shared AI gateway, which rate limits it, retries
+        transient failures and refuses calls while OpenAI is failing.
+        
         Args:
             messages (List[Dict]): List of message objects
             max_tokens (int): Maximum tokens to generate
@@ -49,91 +54,115 @@ class OpenAI(AIProvider):
         Returns:
             Tuple[bool, Union[str, Dict]]: Success flag and response or error
         """
-        try:
-            payload = {
-                "model": self.model,
-                "messages": messages,
-                "max_tokens": max_tokens,
-                "temperature": temperature,
-                "frequency_penalty": frequency_penalty,
-                "presence_penalty": presence_penalty
-            }
-            
-            # Calculate timeout based on expected response size
-            # Base timeout of 120 seconds, plus additional time for larger responses
-            timeout = max(120, 120 + (max_tokens / 100))  # Add 1 second per 100 tokens
-            
-            logger.info(f"Making request to OpenAI API with model {self.model}, timeout={timeout}s")
-            logger.info(f"========== OPENAI API PAYLOAD ==========")
-            logger.info(f"Model: {payload['model']}")
-            logger.info(f"Max tokens: {payload['max_tokens']}")
-            logger.info(f"Temperature: {payload['temperature']}")
-            logger.info(f"Messages count: {len(payload['messages'])}")
-            for i, msg in enumerate(payload['messages']):
-                logger.info(f"Message {i+1} ({msg['role']}): {msg['content'][:200]}{'...' if len(msg['content']) > 200 else ''}")
-            logger.info(f"=======================================")
-            
-            response = self.session.post(self.endpoint, json=payload, timeout=timeout)
-            
-            if response.status_code != 200:
-                logger.error(f"OpenAI API error: {response.status_code} - {response.text}")
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "frequency_penalty": frequency_penalty,
+            "presence_penalty": presence_penalty
+        }
+        
+        # Calculate timeout based on expected response size
+        # Base timeout of 120 seconds, plus additional time for larger responses
+        timeout = max(120, 120 + (max_tokens / 100))  # Add 1 second per 100 tokens
+        
+        logger.info(f"Making request to OpenAI API with model {self.model}, timeout={timeout}s")
+        logger.info(f"========== OPENAI API PAYLOAD ==========")
+        logger.info(f"Model: {payload['model']}")
+        logger.info(f"Max tokens: {payload['max_tokens']}")
+        logger.info(f"Temperature: {payload['temperature']}")
+        logger.info(f"Messages count: {len(payload['messages'])}")
+        for i, msg in enumerate(payload['messages']):
+            logger.info(f"Message {i+1} ({msg['role']}): {msg['content'][:200]}{'...' if len(msg['content']) > 200 else ''}")
+        logger.info(f"=======================================")
+        
+        def send():
+            try:
+                response = self.session.post(self.endpoint, json=payload, timeout=timeout)
                 
-                # Check for specific error types
-                if response.status_code == 400 and 'max_tokens is too large' in response.text:
+                if response.status_code != 200:
+                    logger.error(f"OpenAI API error: {response.status_code} - {response.text}")
+                    
+                    # Check for specific error types
+                    if response.status_code == 400 and 'max_tokens is too large' in response.text:
+                        return False, {
+                            "error": "Content too long for OpenAI model - using chunked translation",
+                            "details": "The text is too long for a single API call, will be processed in chunks",
+                            "should_chunk": True
+                        }, None
+                    
                     return False, {
-                        "error": "Content too long for OpenAI model - using chunked translation",
-                        "details": "The text is too long for a single API call, will be processed in chunks",
-                        "should_chunk": True
-                    }
+                        "error": f"OpenAI API error: {response.status_code}",
+                        "details": response.text,
+                        "status_code": response.status_code
+                    }, None
                 
-                return False, {
-                    "error": f"OpenAI API error: {response.status_code}",
-                    "details": response.text
-                }
-            
-            result = response.json()
-            
-            if 'choices' in result and len(result['choices']) > 0:
-                content = result['choices'][0]['message']['content'].strip()
+                result = response.json()
                 
-                # Extract token usage information
-                usage_info = result.get('usage', {})
-                prompt_tokens = usage_info.get('prompt_tokens', 0)
-                completion_tokens = usage_info.get('completion_tokens', 0)
-                total_tokens = usage_info.get('total_tokens', 0)
-                
-                logger.info("Successfully received response from OpenAI")
-                logger.info(f"========== OPENAI API RESPONSE ==========")
-                logger.info(f"Response content: {content}")
-                logger.info(f"Response length: {len(content)} characters")
-                logger.info(f"Token usage - Prompt: {prompt_tokens}, Completion: {completion_tokens}, Total: {total_tokens}")
-                logger.info(f"========================================")
-                
-                # Return content with token usage information
-                return True, {
-                    'content': content,
-                    'usage': {
+                if 'choices' in result and len(result['choices']) > 0:
+                    content = result['choices'][0]['message']['content'].strip()
+                    
+                    # Extract token usage information
+                    usage_info = result.get('usage', {})
+                    prompt_tokens = usage_info.get('prompt_tokens', 0)
+                    completion_tokens = usage_info.get('completion_tokens', 0)
+                    total_tokens = usage_info.get('total_tokens', 0)
+                    
+                    logger.info("Successfully received response from OpenAI")
+                    logger.info(f"========== OPENAI API RESPONSE ==========")
+                    logger.info(f"Response content: {content}")
+                    logger.info(f"Response length: {len(content)} characters")
+                    logger.info(f"Token usage - Prompt: {prompt_tokens}, Completion: {completion_tokens}, Total: {total_tokens}")
+                    logger.info(f"========================================")
+                    
+                    usage = {
                         'input_tokens': prompt_tokens,
                         'output_tokens': completion_tokens,
                         'total_tokens': total_tokens
                     }
-                }
-            else:
-                logger.error(f"Unexpected OpenAI response format: {result}")
-                return False, {
-                    "error": "Unexpected response format",
-                    "details": result
-                }
-                
-        except requests.RequestException as e:
-            logger.error(f"Request error: {e}")
-            return False, {"error": f"Network error: {str(e)}"}
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error: {e}")
-            return False, {"error": f"Invalid response format: {str(e)}"}
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return False, {"error": f"Unexpected error: {str(e)}"}
+                    
+                    # Return content with token usage information
+                    return True, {'content': content, 'usage': usage}, usage
+                else:
+                    logger.error(f"Unexpected OpenAI response format: {result}")
+                    return False, {
+                        "error": "Unexpected response format",
+                        "details": result
+                    }, None
+                    
+            except requests.RequestException as e:
+                logger.error(f"Request error: {e}")
+                return False, {"error": f"Network error: {str(e)}", "network_error": True}, None
+            except json.JSONDecodeError as e:
+                logger.error(f"JSON decode error: {e}")
+                return False, {"error": f"Invalid response format: {str(e)}"}, None
+            except Exception as e:
+                logger.error(f"Unexpected error: {e}")
+                return False, {"error": f"Unexpected error: {str(e)}"}, None
+        
+        return ai_gateway.call('openai', self.model, send)
+    
+    def generate_text(self, prompt: str, max_tokens: int = 150, temperature: float = 0.3) -> Dict:
+        """
+        Generate text for a single user prompt.
+        
+        Args:
+            prompt (str): The prompt to generate text from
+            max_tokens (int): Maximum tokens to generate
+            temperature (float): Sampling temperature
+            
+        Returns:
+            Dict: 'success' and 'text' plus the token 'usage', or 'success' and 'error'
+        """
+        success, result = self._make_request(
+            [{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=temperature
+        )
+        if not success:
+            return {"success": False, "error": result.get('error') if isinstance(result, dict) else result}
+        return {"success": True, "text": response_text(result), "usage": result.get('usage') or {}}
     
     def translate(self, from_lang: str, to_lang: str, content: str) -> Tuple[bool, Union[str, Dict]]:
         """
@@ -169,8 +198,9 @@ class OpenAI(AIProvider):
             result = self._translate_with_timecodes(from_lang, to_lang, content)
             logger.info(f"========== TRANSLATION RESULT ==========")
             if result[0]:  # Success
-                logger.info(f"Translation successful, length: {len(result[1]) if result[1] else 0}")
-                logger.info(f"Result preview: {result[1][:300] if result[1] else 'None'}...")
+                translated = response_text(result[1])
+                logger.info(f"Translation successful, length: {len(translated)}")
+                logger.info(f"Result preview: {translated[:300] if translated else 'None'}...")
             else:
                 logger.error(f"Translation failed: {result[1]}")
             logger.info(f"======================================")
@@ -282,33 +312,17 @@ class OpenAI(AIProvider):
         Returns:
             Tuple[bool, Union[str, Dict]]: Success flag and translated text or error dict
         """
-        # Split content into sentences to avoid breaking mid-sentence
-        sentences = content.replace('\n', ' ').split('. ')
-        chunks = []
-        current_chunk = ""
-        
         # Group sentences into chunks - larger chunks for GPT-4 models
         if "gpt-4" in self.model.lower():
             chunk_size = 3000 if is_complex else 5000  # Much larger chunks for GPT-4
         else:
             chunk_size = 1000 if is_complex else 2000  # Conservative for other models
-        for sentence in sentences:
-            if len(current_chunk.split()) + len(sentence.split()) > chunk_size:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = sentence
-            else:
-                current_chunk += (". " if current_chunk else "") + sentence
+        chunks = split_sentence_chunks(content, chunk_size)
         
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        # Use larger max_tokens for GPT-4 models in chunking
+        chunk_max_tokens = 8000 if "gpt-4" in self.model.lower() else 3000
         
-        logger.info(f"Translating in {len(chunks)} chunks")
-        
-        translated_chunks = []
-        for i, chunk in enumerate(chunks):
-            logger.info(f"Translating chunk {i+1}/{len(chunks)}")
-            
+        def translate_chunk(i, chunk):
             if is_complex:
                 prompt = f"Translate the following text from {from_language} to {to_language}. This is part {i+1} of {len(chunks)} of a longer text. You must translate ALL content - do not leave any part in {from_language}. Every single word must be in {to_language}:\n\n{chunk}"
                 system_content = f"You are a professional translator specializing in {to_language}. Translate ALL text completely - every word must be in {to_language}. Do NOT mix languages. This is part of a longer translation."
@@ -333,18 +347,30 @@ class OpenAI(AIProvider):
                 }
             ]
             
-            # Use larger max_tokens for GPT-4 models in chunking
-            chunk_max_tokens = 8000 if "gpt-4" in self.model.lower() else 3000
-            success, result = self._make_request(messages, max_tokens=chunk_max_tokens, temperature=temp, frequency_penalty=freq_pen, presence_penalty=pres_pen)
-            
+            return self._make_request(messages, max_tokens=chunk_max_tokens, temperature=temp, frequency_penalty=freq_pen, presence_penalty=pres_pen)
+        
+        # Chunks run concurrently under the shared OpenAI budgets and come back in order
+        results = get_translation_executor('openai').run(
+            chunks, translate_chunk,
+            estimate_tokens=lambda chunk: len(chunk) // CHARS_PER_TOKEN + chunk_max_tokens
+        )
+        
+        translated_chunks = []
+        responses = []
+        for i, (chunk, (success, result)) in enumerate(zip(chunks, results)):
             if not success:
-                return False, result
+                # Retry just this chunk, in smaller pieces with strict prompts
+                logger.warning(f"Chunk {i+1}/{len(chunks)} failed, retrying it with strict prompts")
+                success, result = self._retry_translation_with_strict_prompts(chunk, from_language, to_language)
+                if not success:
+                    return False, result
             
-            translated_chunks.append(result)
+            translated_chunks.append(response_text(result))
+            responses.append(result)
         
         # Join all translated chunks
         full_translation = " ".join(translated_chunks)
-        logger.info(f"Chunked translation completed - Total length: {len(full_translation)}")
+        logger.info(f"Chunked translation completed - {len(chunks)} chunks, total length: {len(full_translation)}")
         
         # Validate translation for complex languages
         if is_complex:
@@ -354,7 +380,7 @@ class OpenAI(AIProvider):
                 # Retry with even stronger prompts
                 return self._retry_translation_with_strict_prompts(content, from_language, to_language)
         
-        return True, full_translation
+        return True, {'content': full_translation, 'usage': merge_usage(responses)}
     
     def _translate_with_timecodes(self, from_lang: str, to_lang: str, content: str) -> Tuple[bool, Union[str, Dict]]:
         """
@@ -368,8 +394,6 @@ class OpenAI(AIProvider):
         Returns:
             Tuple[bool, Union[str, Dict]]: Success flag and translated text or error dict
         """
-        import re
-        
         logger.info(f"STARTING TIMECODE-PRESERVING TRANSLATION: {from_lang} -> {to_lang}")
         
         # Map language codes to full names for better results
@@ -385,27 +409,44 @@ class OpenAI(AIProvider):
         
         logger.info(f"Language mapping: {from_lang} -> {from_language}, {to_lang} -> {to_language}")
         
-        # Split content into lines with timecodes
-        lines = content.strip().split('\n')
-        translated_lines = []
-        
-        logger.info(f"Processing {len(lines)} lines of content")
+        line_system_content = f"""You are a professional translator. Your task is to translate text while preserving timecodes.
+
+CRITICAL RULES:
+- Translate ONLY the text content to {to_language}
+- Do NOT modify, translate, or remove timecodes [HH:MM:SS]
+- Do NOT add segment markers like ###SEGMENT_X###
+- Do NOT add any formatting or bullet points
+- Return ONLY the translated text without any additional content
+- Preserve the original tone and meaning"""
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Match timecode pattern [HH:MM:SS] followed by text
-            timecode_match = re.match(r'^(\[\d{2}:\d{2}:\d{2}\])\s*(.*)$', line)
+        def translate_batch(lines):
+            """Translate a block of whole lines in one request."""
+            text = '\n'.join(lines)
+            prompt = f"""Translate the following transcript lines from {from_language} to {to_language}.
+
+CRITICAL INSTRUCTIONS:
+- Return exactly {len(lines)} lines, one translated line for each line below, in the same order
+- Keep the timecode [HH:MM:SS] at the start of each line exactly as it is
+- Translate ONLY the text after the timecode
+- Do NOT merge, split, skip or add lines
+- Do NOT add any formatting, markers, or segment numbers
+- Do NOT use ###SEGMENT_X### or any other markers
+- Return ONLY the translated lines, nothing else
+
+Lines to translate:
+{text}"""
             
-            if timecode_match:
-                timecode = timecode_match.group(1)
-                text_to_translate = timecode_match.group(2).strip()
-                
-                if text_to_translate:
-                    # Translate just the text part, preserving the timecode
-                    prompt = f"""Translate the following text from {from_language} to {to_language}.
+            messages = [
+                {"role": "system", "content": line_system_content},
+                {"role": "user", "content": prompt}
+            ]
+            
+            max_tokens = max(500, min(int(len(text) / CHARS_PER_TOKEN * 2.5), 8000))
+            return self._make_request(messages, max_tokens=max_tokens, temperature=0.1)
+        
+        def translate_line(text_to_translate):
+            """Translate the text of a single line (used when a batch loses its timecodes)."""
+            prompt = f"""Translate the following text from {from_language} to {to_language}.
                     
 CRITICAL INSTRUCTIONS:
 - Translate ONLY the text content
@@ -416,97 +457,22 @@ CRITICAL INSTRUCTIONS:
 - Preserve the original meaning and tone
 
 Text to translate: {text_to_translate}"""
-
-                    system_content = f"""You are a professional translator. Your task is to translate text while preserving timecodes.
-
-CRITICAL RULES:
-- Translate ONLY the text content to {to_language}
-- Do NOT modify, translate, or remove timecodes [HH:MM:SS]
-- Do NOT add segment markers like ###SEGMENT_X###
-- Do NOT add any formatting or bullet points
-- Return ONLY the translated text without any additional content
-- Preserve the original tone and meaning"""
-
-                    messages = [
-                        {
-                            "role": "system",
-                            "content": system_content
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ]
-                    
-                    # LOG THE EXACT REQUEST BEING SENT TO AI
-                    logger.info(f"========== SENDING TO AI (Line with timecode {timecode}) ==========")
-                    logger.info(f"System prompt: {system_content}")
-                    logger.info(f"User prompt: {prompt}")
-                    logger.info(f"Original text to translate: '{text_to_translate}'")
-                    logger.info(f"Max tokens: 200, temperature: 0.1")
-                    logger.info(f"====================================================================")
-                    
-                    success, response = self._make_request(messages, max_tokens=200, temperature=0.1)
-                    
-                    # Extract the actual text content from the response
-                    if success and isinstance(response, dict):
-                        translated_text = response.get('content', '')
-                    else:
-                        translated_text = response if isinstance(response, str) else str(response)
-                    
-                    # LOG THE AI RESPONSE
-                    logger.info(f"========== AI RESPONSE (Line with timecode {timecode}) ==========")
-                    if success:
-                        logger.info(f"Translation successful: '{translated_text}'")
-                    else:
-                        logger.error(f"Translation failed: {translated_text}")
-                    logger.info(f"=================================================================")
-                    
-                    if success:
-                        # Clean up the translated text to remove any unwanted formatting
-                        translated_text = translated_text.strip()
-                        # Remove any segment markers that might have been added
-                        translated_text = re.sub(r'###SEGMENT_\d+###\s*', '', translated_text)
-                        translated_text = re.sub(r'\*+.*?\*+', '', translated_text)  # Remove markdown formatting
-                        translated_text = translated_text.strip()
-                        
-                        # Combine timecode with translated text
-                        translated_lines.append(f"{timecode} {translated_text}")
-                    else:
-                        logger.warning(f"Failed to translate line: {line}")
-                        # Keep original line if translation fails
-                        translated_lines.append(line)
-                else:
-                    # Empty text after timecode, keep timecode only
-                    translated_lines.append(timecode)
-            else:
-                # Line without timecode, translate directly
-                if line:
-                    prompt = f"Translate this text from {from_language} to {to_language}: {line}"
-                    system_content = f"Translate to {to_language} only. No additional formatting."
-                    
-                    messages = [
-                        {"role": "system", "content": system_content},
-                        {"role": "user", "content": prompt}
-                    ]
-                    
-                    success, response = self._make_request(messages, max_tokens=200, temperature=0.1)
-                    
-                    # Extract the actual text content from the response
-                    if success and isinstance(response, dict):
-                        translated_text = response.get('content', '')
-                    else:
-                        translated_text = response if isinstance(response, str) else str(response)
-                    
-                    if success:
-                        translated_lines.append(translated_text.strip())
-                    else:
-                        translated_lines.append(line)
+            
+            messages = [
+                {"role": "system", "content": line_system_content},
+                {"role": "user", "content": prompt}
+            ]
+            
+            return self._make_request(messages, max_tokens=200, temperature=0.1)
         
-        # Join all translated lines
-        final_translation = '\n'.join(translated_lines)
+        # Batches run concurrently; lines of a failed batch are retried one by one,
+        # and a line that still fails gets the strict-prompt retry
+        final_translation, responses, failed_lines = translate_timecoded(
+            get_translation_executor('openai'), content, translate_batch, translate_line,
+            recover_line=lambda text: self._retry_translation_with_strict_prompts(text, from_language, to_language)
+        )
         
-        logger.info(f"Timecode-preserving translation completed: {len(translated_lines)} lines")
+        logger.info(f"Timecode-preserving translation completed: {final_translation.count(chr(10)) + 1} lines")
         logger.info(f"Final translation preview: {final_translation[:300]}...")
         
         # Verify no segment markers were generated
@@ -515,7 +481,8 @@ CRITICAL RULES:
         else:
             logger.info("SUCCESS: No ###SEGMENT markers found in final translation")
         
-        return True, final_translation
+        # Lines that kept their source text are reported, so they are not mistaken for translations
+        return True, {'content': final_translation, 'usage': merge_usage(responses), 'failed_lines': failed_lines}
     
     def _retry_translation_with_strict_prompts(self, content: str, from_language: str, to_language: str) -> Tuple[bool, Union[str, Dict]]:
         """
@@ -531,29 +498,12 @@ CRITICAL RULES:
         """
         logger.info(f"Retrying translation with strict prompts for {to_language}")
         
-        # Split into smaller chunks for better control
-        sentences = content.replace('\n', ' ').split('. ')
-        chunks = []
-        current_chunk = ""
-        
-        # Use very small chunks for strict mode
-        for sentence in sentences:
-            if len(current_chunk.split()) + len(sentence.split()) > 300:  # Very small chunks
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = sentence
-            else:
-                current_chunk += (". " if current_chunk else "") + sentence
-        
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        # Split into smaller chunks for better control (very small chunks for strict mode)
+        chunks = split_sentence_chunks(content, 300)
         
         logger.info(f"Strict retry: translating in {len(chunks)} small chunks")
         
-        translated_chunks = []
-        for i, chunk in enumerate(chunks):
-            logger.info(f"Strict retry chunk {i+1}/{len(chunks)}")
-            
+        def translate_chunk(i, chunk):
             # Extremely strict prompt
             prompt = f"""
 CRITICAL INSTRUCTION: You MUST translate EVERY SINGLE WORD to {to_language}. 
@@ -595,7 +545,8 @@ If you use ANY English words, you have FAILED."""
                 return False, result
             
             # Validate each chunk
-            english_count = sum(1 for phrase in ['Hello', 'I\'m', 'You', 'the', 'and', 'or', 'but', 'said', '*'] if phrase.lower() in result.lower())
+            translated = response_text(result)
+            english_count = sum(1 for phrase in ['Hello', 'I\'m', 'You', 'the', 'and', 'or', 'but', 'said', '*'] if phrase.lower() in translated.lower())
             if english_count > 0:
                 logger.warning(f"Chunk {i+1} still contains English words, retrying once more")
                 # One more try with even stricter prompt
@@ -605,16 +556,24 @@ If you use ANY English words, you have FAILED."""
                     {"role": "user", "content": stricter_prompt}
                 ]
                 success, result = self._make_request(stricter_messages, max_tokens=1000, temperature=0.0, frequency_penalty=0.9, presence_penalty=0.7)
-                if not success:
-                    return False, result
             
-            translated_chunks.append(result)
+            return success, result
+        
+        results = get_translation_executor('openai').run(
+            chunks, translate_chunk,
+            estimate_tokens=lambda chunk: len(chunk) // CHARS_PER_TOKEN + 1500,
+            description='[TRANSLATE] Strict retry chunk'
+        )
+        
+        for success, result in results:
+            if not success:
+                return False, result
         
         # Join all translated chunks
-        full_translation = " ".join(translated_chunks)
+        full_translation = " ".join(response_text(result) for _, result in results)
         logger.info(f"Strict retry completed - Total length: {len(full_translation)}")
         
-        return True, full_translation
+        return True, {'content': full_translation, 'usage': merge_usage([result for _, result in results])}
     
     def _validate_translation(self, translation: str, target_lang: str) -> bool:
         """
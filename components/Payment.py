@@ -9,6 +9,8 @@ import stripe
 from datetime import datetime
 from decimal import Decimal
 
+from .CreditLedger import credit_ledger
+
 logger = logging.getLogger('webapp')
 
 class Payment:
@@ -274,6 +276,7 @@ class Payment:
             # No need to duplicate in transactions table which is for AI usage tracking
             
             connection.commit()
+            credit_ledger.invalidate_balance(txn['user_id'])
             
             # Get user email for receipt
             cursor.execute("SELECT email FROM users WHERE id = %s", (txn['user_id'],))
@@ -366,6 +369,7 @@ class Payment:
                 # No need to use transactions table which is for AI usage tracking
                 
                 connection.commit()
+                credit_ledger.invalidate_balance(txn['user_id'])
                 
                 logger.info(f"Recurring credits added for user {txn['user_id']}: {txn['credits']} credits")
             
@@ -502,6 +506,7 @@ class Payment:
             connection.commit()
             cursor.close()
             connection.close()
+            credit_ledger.invalidate_balance(txn['user_id'])
             
             logger.info(f"Payment processed immediately for transaction {txn_id}: {txn['credits']} credits added to user {txn['user_id']}")
             
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# components/PricingRegistry.py
+"""
+Pricing Registry Component for XSpace Downloader
+
+Keeps the AI pricing table (ai_api_cost) and the compute cost per second in
+memory, so cost tracking does not query the database on every AI operation.
+
+- The whole table is loaded once per process, on first use
+- Writers (update_openai_pricing.py, the admin cost pages) bump the
+  'ai_pricing_version' row in app_settings in the same transaction as their
+  change; each process compares that version at most every CHECK_INTERVAL
+  seconds and reloads the table when it has moved
+- If the database is unavailable the last loaded prices stay in use
+
+Usage Examples:
+
+    from components.PricingRegistry import pricing_registry
+
+    costs = pricing_registry.get_model_costs('openai', 'gpt-4o-mini')
+    cost_per_second = pricing_registry.get_compute_cost_per_second()
+
+    # In a writer: bump in the same transaction, then reload locally
+    pricing_registry.bump_version(cursor)
+    connection.commit()
+    pricing_registry.invalidate()
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('pricing_registry')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# Seconds between checks of the pricing version
+CHECK_INTERVAL = 30.0
+
+VERSION_SETTING = 'ai_pricing_version'
+COMPUTE_COST_SETTING = 'compute_cost_per_second'
+DEFAULT_COMPUTE_COST_PER_SECOND = 0.001
+
+
+class PricingRegistry:
+    """In-memory AI model prices and compute cost, reloaded when the pricing version changes."""
+
+    def __init__(self, db=None, check_interval: float = CHECK_INTERVAL):
+        """
+        Initialize the registry.
+
+        Args:
+            db (DatabaseManager, optional): Database to load from; the shared
+                                            DatabaseManager is used if not given
+            check_interval (float): Seconds between pricing version checks
+        """
+        self._db = db
+        self.check_interval = check_interval
+        self._models = {}
+        self._compute_cost_per_second = None
+        self._version = None
+        self._loaded = False
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+        self._stats = {'loads': 0, 'version_checks': 0, 'errors': 0}
+
+    @property
+    def db(self):
+        """Database used for loading, created on first use."""
+        if self._db is None:
+            from .DatabaseManager import DatabaseManager
+            self._db = DatabaseManager()
+        return self._db
+
+    def _read_version(self, cursor) -> Optional[str]:
+        """Current pricing version from app_settings."""
+        cursor.execute("SELECT setting_value FROM app_settings WHERE setting_name = %s", (VERSION_SETTING,))
+        row = cursor.fetchone()
+        return str(row[0]) if row else None
+
+    def _load(self, cursor, version: Optional[str]):
+        """Load the pricing table and compute cost (call with the lock held)."""
+        cursor.execute("""
+            SELECT vendor, model, input_token_cost_per_million_tokens, output_token_cost_per_million_tokens
+            FROM ai_api_cost
+        """)
+        models = {}
+        for vendor, model, input_cost, output_cost in cursor.fetchall():
+            models[(str(vendor).lower(), str(model).lower())] = {
+                'input_cost_per_million': float(input_cost or 0),
+                'output_cost_per_million': float(output_cost or 0)
+            }
+
+        cursor.execute("SELECT setting_value FROM app_settings WHERE setting_name = %s", (COMPUTE_COST_SETTING,))
+        row = cursor.fetchone()
+        compute_cost = float(row[0]) if row and row[0] is not None else None
+
+        self._models = models
+        self._compute_cost_per_second = compute_cost
+        self._version = version
+        self._loaded = True
+        self._stats['loads'] += 1
+        logger.info(f"Loaded {len(models)} AI model prices (pricing version {version})")
+
+    def _refresh(self):
+        """Reload the table if it was never loaded or its version changed."""
+        if time.monotonic() < self._next_check:
+            return
+
+        with self._lock:
+            # Another thread may have refreshed while this one waited
+            if time.monotonic() < self._next_check:
+                return
+            try:
+                with self.db.get_connection() as connection:
+                    cursor = connection.cursor()
+                    try:
+                        version = self._read_version(cursor)
+                        self._stats['version_checks'] += 1
+                        if not self._loaded or version != self._version:
+                            self._load(cursor, version)
+                    finally:
+                        cursor.close()
+            except Exception as e:
+                self._stats['errors'] += 1
+                logger.warning(f"Could not refresh AI pricing, keeping {'loaded' if self._loaded else 'default'} prices: {e}")
+            # Failed refreshes also wait for the next interval, so an outage is not hammered
+            self._next_check = time.monotonic() + self.check_interval
+
+    def get_model_costs(self, vendor: str, model: str) -> Optional[Dict[str, float]]:
+        """
+        Get a model's prices.
+
+        Args:
+            vendor (str): AI vendor (e.g. 'openai', 'anthropic')
+            model (str): Model name
+
+        Returns:
+            dict: {'input_cost_per_million': float, 'output_cost_per_million': float},
+                  or None if the model has no price
+        """
+        self._refresh()
+        costs = self._models.get(((vendor or '').lower(), (model or '').lower()))
+        return dict(costs) if costs else None
+
+    def get_compute_cost_per_second(self, default: float = DEFAULT_COMPUTE_COST_PER_SECOND) -> float:
+        """
+        Get the compute cost per second.
+
+        Args:
+            default (float): Value used when the setting is missing
+
+        Returns:
+            float: Cost per second of compute time
+        """
+        self._refresh()
+        return self._compute_cost_per_second if self._compute_cost_per_second is not None else default
+
+    def invalidate(self):
+        """Reload on the next read in this process."""
+        with self._lock:
+            self._loaded = False
+            self._next_check = 0.0
+
+    def bump_version(self, cursor):
+        """
+        Bump the pricing version so every process reloads its prices.
+
+        Run this with the writer's cursor before it commits, so the new prices
+        and the new version become visible together. Other processes reload
+        within CHECK_INTERVAL seconds; call invalidate() after the commit to
+        reload this one at once.
+
+        Args:
+            cursor: Cursor of the transaction that changed ai_api_cost or the compute cost
+        """
+        cursor.execute("""
+            INSERT INTO app_settings (setting_name, setting_value, setting_type, description)
+            VALUES (%s, '1', 'integer', 'Incremented whenever AI or compute pricing changes')
+            ON DUPLICATE KEY UPDATE setting_value = CAST(setting_value AS UNSIGNED) + 1
+        """, (VERSION_SETTING,))
+
+    def get_stats(self) -> Dict:
+        """Registry state and load counters."""
+        with self._lock:
+            return {
+                'models': len(self._models),
+                'version': self._version,
+                'loaded': self._loaded,
+                'compute_cost_per_second': self._compute_cost_per_second,
+                **self._stats
+            }
+
+
+# Global pricing registry
+pricing_registry = PricingRegistry()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# components/QueryStats.py
+"""
+Query Statistics Component for XSpace Downloader
+
+Aggregates SQL timings per query fingerprint. A fingerprint is the query text
+with literals, placeholders and IN-lists normalised, so that
+"SELECT * FROM spaces WHERE id = 'abc'" and "... WHERE id = 'xyz'" are
+counted together.
+
+Latencies go into fixed log-spaced buckets, so memory per fingerprint is
+constant and p50/p95/p99 can be estimated without keeping samples.
+Statistics are per process; each gunicorn worker keeps its own.
+"""
+
+import bisect
+import re
+import threading
+from typing import Dict, List, Optional
+
+# Bucket upper bounds in milliseconds: 0.05ms doubling up to ~107s
+BUCKET_BOUNDS_MS = [0.05 * (2 ** i) for i in range(22)]
+
+MAX_FINGERPRINTS = 500
+OTHER_FINGERPRINT = '(other)'
+
+_STRING_RE = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_RE = re.compile(r'(?<![\w.])-?\d+(?:\.\d+)?(?:e[+-]?\d+)?\b', re.IGNORECASE)
+_PLACEHOLDER_RE = re.compile(r'%\(\w+\)s|%s|\?')
+_IN_LIST_RE = re.compile(r'\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)', re.IGNORECASE)
+_VALUES_RE = re.compile(r'\bVALUES\s*\(\s*\?(?:\s*,\s*\?)*\s*\)(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))*', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def fingerprint_query(query: str) -> str:
+    """
+    Normalise a SQL statement into a fingerprint.
+
+    Args:
+        query (str): SQL statement, with or without bound literals
+
+    Returns:
+        str: Statement with literals replaced by "?" and lists collapsed
+    """
+    text = _STRING_RE.sub('?', query)
+    text = _NUMBER_RE.sub('?', text)
+    text = _PLACEHOLDER_RE.sub('?', text)
+    text = _WHITESPACE_RE.sub(' ', text).strip()
+    text = _IN_LIST_RE.sub('IN (?+)', text)
+    text = _VALUES_RE.sub('VALUES (?+)', text)
+    return text
+
+
+class QueryStats:
+    """Per-fingerprint latency histograms, row counts and error counts."""
+
+    def __init__(self, max_fingerprints: int = MAX_FINGERPRINTS):
+        """
+        Initialize the statistics store.
+
+        Args:
+            max_fingerprints (int): Distinct fingerprints tracked before new
+                                    ones are folded into "(other)"
+        """
+        self.max_fingerprints = max_fingerprints
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, fingerprint: str, duration_ms: float, rows: Optional[int] = None,
+               error: bool = False, component: Optional[str] = None):
+        """
+        Record one query execution.
+
+        Args:
+            fingerprint (str): Query fingerprint
+            duration_ms (float): Execution time in milliseconds
+            rows (int, optional): Rows affected or returned, if known
+            error (bool): Whether the query failed
+            component (str, optional): Component that ran the query
+        """
+        bucket = bisect.bisect_left(BUCKET_BOUNDS_MS, duration_ms)
+
+        with self._lock:
+            stat = self._stats.get(fingerprint)
+            if stat is None:
+                if len(self._stats) >= self.max_fingerprints:
+                    fingerprint = OTHER_FINGERPRINT
+                    stat = self._stats.get(fingerprint)
+                if stat is None:
+                    stat = {
+                        'count': 0,
+                        'errors': 0,
+                        'total_ms': 0.0,
+                        'max_ms': 0.0,
+                        'rows': 0,
+                        'max_rows': 0,
+                        'buckets': [0] * (len(BUCKET_BOUNDS_MS) + 1),
+                        'components': set()
+                    }
+                    self._stats[fingerprint] = stat
+
+            stat['count'] += 1
+            stat['total_ms'] += duration_ms
+            stat['buckets'][bucket] += 1
+            if duration_ms > stat['max_ms']:
+                stat['max_ms'] = duration_ms
+            if error:
+                stat['errors'] += 1
+            if rows is not None and rows > 0:
+                stat['rows'] += rows
+                if rows > stat['max_rows']:
+                    stat['max_rows'] = rows
+            if component and len(stat['components']) < 10:
+                stat['components'].add(component)
+
+    @staticmethod
+    def _percentile(buckets: List[int], count: int, max_ms: float, percentile: float) -> float:
+        """Estimate a percentile as the upper bound of the bucket containing it."""
+        if not count:
+            return 0.0
+        target = percentile * count
+        seen = 0
+        for index, bucket_count in enumerate(buckets):
+            seen += bucket_count
+            if seen >= target:
+                if index >= len(BUCKET_BOUNDS_MS):
+                    return max_ms
+                return min(BUCKET_BOUNDS_MS[index], max_ms)
+        return max_ms
+
+    def snapshot(self, sort: str = 'total_ms', limit: int = 50) -> List[Dict]:
+        """
+        Summarise the recorded statistics.
+
+        Args:
+            sort (str): Field to sort by (total_ms, count, p95_ms, p99_ms, max_ms, errors, rows)
+            limit (int): Maximum number of fingerprints to return
+
+        Returns:
+            list: One dict per fingerprint with count, p50/p95/p99, rows and errors
+        """
+        with self._lock:
+            items = [
+                (fingerprint, dict(stat, buckets=list(stat['buckets']), components=set(stat['components'])))
+                for fingerprint, stat in self._stats.items()
+            ]
+
+        summaries = []
+        for fingerprint, stat in items:
+            count = stat['count']
+            summaries.append({
+                'fingerprint': fingerprint,
+                'count': count,
+                'errors': stat['errors'],
+                'total_ms': round(stat['total_ms'], 2),
+                'avg_ms': round(stat['total_ms'] / count, 3) if count else 0,
+                'p50_ms': round(self._percentile(stat['buckets'], count, stat['max_ms'], 0.50), 3),
+                'p95_ms': round(self._percentile(stat['buckets'], count, stat['max_ms'], 0.95), 3),
+                'p99_ms': round(self._percentile(stat['buckets'], count, stat['max_ms'], 0.99), 3),
+                'max_ms': round(stat['max_ms'], 3),
+                'rows': stat['rows'],
+                'avg_rows': round(stat['rows'] / count, 2) if count else 0,
+                'max_rows': stat['max_rows'],
+                'components': sorted(stat['components'])
+            })
+
+        if sort not in ('total_ms', 'count', 'p95_ms', 'p99_ms', 'max_ms', 'errors', 'rows', 'avg_ms'):
+            sort = 'total_ms'
+        summaries.sort(key=lambda summary: summary[sort], reverse=True)
+        return summaries[:limit] if limit else summaries
+
+    def reset(self):
+        """Discard all recorded statistics."""
+        with self._lock:
+            self._stats.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._stats)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# components/RateLimiter.py
+"""
+Rate Limiting and Retry Helpers for XSpace Downloader
+
+Thread-safe helpers for calling external APIs from worker pools:
+
+- TokenBucket: smooths request rate (e.g. requests per minute) across threads
+- retry_with_backoff: retries a call with exponential backoff and jitter
+
+Usage Examples:
+
+    from components.RateLimiter import TokenBucket, retry_with_backoff
+
+    bucket = TokenBucket(rate_per_minute=50, burst=5)
+    result = retry_with_backoff(lambda: call_api(), attempts=3, before_attempt=bucket.acquire)
+"""
+
+import random
+import threading
+import time
+from typing import Callable, Optional, Tuple, Type
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('rate_limiter')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket shared by threads; acquire() blocks until a token is available."""
+
+    def __init__(self, rate_per_minute: float, burst: Optional[int] = None):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate_per_minute (float): Sustained number of acquisitions per minute
+            burst (int, optional): Bucket capacity (default: one second's worth, at least 1)
+        """
+        self.rate = max(rate_per_minute, 0.001) / 60.0
+        self.capacity = float(burst if burst is not None else max(1, int(self.rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add tokens for the time elapsed since the last refill."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        Take tokens without waiting.
+
+        Args:
+            tokens (float): Tokens to take
+
+        Returns:
+            bool: True if the tokens were taken
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """
+        Take tokens, waiting for the bucket to refill if needed.
+
+        Args:
+            tokens (float): Tokens to take
+            timeout (float, optional): Maximum seconds to wait
+
+        Returns:
+            bool: True if the tokens were taken, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+
+def retry_with_backoff(func: Callable, attempts: int = 3, base_delay: float = 1.0,
+                       max_delay: float = 30.0, retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+                       before_attempt: Optional[Callable] = None, description: str = 'call'):
+    """
+    Call a function, retrying failures with exponential backoff and jitter.
+
+    Args:
+        func (callable): Zero-argument function to call
+        attempts (int): Total attempts including the first
+        base_delay (float): Delay before the first retry in seconds
+        max_delay (float): Upper bound for a single delay
+        retry_on (tuple): Exception types that trigger a retry
+        before_attempt (callable, optional): Called before every attempt (e.g. TokenBucket.acquire)
+        description (str): Label used in log messages
+
+    Returns:
+        The function's return value
+
+    Raises:
+        The last exception if every attempt fails
+    """
+    for attempt in range(1, attempts + 1):
+        if before_attempt:
+            before_attempt()
+        try:
+            return func()
+        except retry_on as e:
+            if attempt >= attempts:
+                raise
+            # Jitter keeps concurrent workers from retrying in lockstep
+            delay = min(max_delay, base_delay * (2 ** (attempt - 1)))
+            delay = delay / 2 + random.uniform(0, delay / 2)
+            logger.warning(f"{description} failed (attempt {attempt}/{attempts}): {e}; retrying in {delay:.1f}s")
+            time.sleep(delay)
@@ -2,28 +2,61 @@
 """
 SQL Query Logger Component for XSpace Downloader
 Logs SQL queries with execution time when enabled by admin settings.
+
+Queries are timed on the calling thread and handed to a background writer
+through a deque, so request threads never format or write log lines. The
+enable flag is cached and only re-read from mainconfig.json when the file
+changes. Settings in mainconfig.json:
+
+- sql_logging_enabled (bool): Master switch
+- sql_logging_sample_rate (float): Fraction of successful, fast queries
+  written to the log (errors and slow queries are always written); every
+  query is counted in the latency histograms
+- sql_logging_slow_ms (float): Queries at or above this are always kept
 """
 
 import os
 import json
 import time
+import re
+import random
+import atexit
 import logging
+import threading
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+from components.LogReader import log_reader
+from components.QueryStats import QueryStats, fingerprint_query
+
+CONFIG_FILE = Path('/var/www/production/xspacedownload.com/website/xspacedownloader/mainconfig.json')
+
+# How often the config file's mtime is checked for cross-process toggles
+SETTINGS_CHECK_INTERVAL = 5.0
+
+# Events held for the writer before new ones are dropped
+MAX_QUEUE_SIZE = 10000
+
+# "[component] STATUS (1.23ms) - query | Params: ... | Error: ..."
+_QUERY_MESSAGE_RE = re.compile(r'^\[([^\]]*)\] (SUCCESS|ERROR) (?:\(([\d.]+)ms\))?\s*- (.*)$', re.DOTALL)
+
 class SQLLogger:
     """Handles SQL query logging with performance metrics."""
     
-    def __init__(self, log_dir='/var/www/production/xspacedownload.com/website/htdocs/logs'):
+    def __init__(self, log_dir='/var/www/production/xspacedownload.com/website/htdocs/logs',
+                 config_file=CONFIG_FILE):
         """
         Initialize SQL Logger.
         
         Args:
             log_dir (str): Directory to store SQL logs
+            config_file (str): Path to mainconfig.json
         """
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
+        self.config_file = Path(config_file)
         
         # Set up dedicated SQL logger
         self.logger = logging.getLogger('sql_queries')
@@ -42,40 +75,68 @@ class SQLLogger:
             self.logger.addHandler(handler)
         
         self._enabled = False
+        self.sample_rate = 1.0
+        self.slow_ms = 500.0
+        self._config_mtime = None
+        self._next_settings_check = 0.0
+        
+        # deque.append/popleft are atomic, so producers never take a lock
+        self._queue = deque()
+        self._dropped = 0
+        self._wakeup = threading.Event()
+        self._writer = None
+        self._writer_lock = threading.Lock()
+        self.stats = QueryStats()
+        
         self._load_settings()
     
     def _load_settings(self):
         """Load SQL logging settings from config."""
         try:
-            config_file = Path('/var/www/production/xspacedownload.com/website/xspacedownloader/mainconfig.json')
-            if config_file.exists():
-                with open(config_file, 'r') as f:
+            if self.config_file.exists():
+                self._config_mtime = self.config_file.stat().st_mtime
+                with open(self.config_file, 'r') as f:
                     config = json.load(f)
-                    self._enabled = config.get('sql_logging_enabled', False)
+                    self._enabled = bool(config.get('sql_logging_enabled', False))
+                    self.sample_rate = min(1.0, max(0.0, float(config.get('sql_logging_sample_rate', 1.0))))
+                    self.slow_ms = float(config.get('sql_logging_slow_ms', 500))
         except Exception:
             self._enabled = False
     
     def is_enabled(self) -> bool:
         """Check if SQL logging is currently enabled."""
-        self._load_settings()  # Reload settings each time
+        now = time.monotonic()
+        if now >= self._next_settings_check:
+            # Another worker may have toggled logging; reload only if the file changed
+            self._next_settings_check = now + SETTINGS_CHECK_INTERVAL
+            try:
+                mtime = self.config_file.stat().st_mtime
+            except OSError:
+                mtime = None
+            if mtime != self._config_mtime:
+                self._load_settings()
         return self._enabled
     
+    def _write_config(self, enabled: bool):
+        """Persist the enable flag to mainconfig.json."""
+        config = {}
+        
+        if self.config_file.exists():
+            with open(self.config_file, 'r') as f:
+                config = json.load(f)
+        
+        config['sql_logging_enabled'] = enabled
+        
+        with open(self.config_file, 'w') as f:
+            json.dump(config, f, indent=2)
+        
+        self._enabled = enabled
+        self._config_mtime = self.config_file.stat().st_mtime
+    
     def enable_logging(self) -> bool:
         """Enable SQL query logging."""
         try:
-            config_file = Path('/var/www/production/xspacedownload.com/website/xspacedownloader/mainconfig.json')
-            config = {}
-            
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-            
-            config['sql_logging_enabled'] = True
-            
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-            
-            self._enabled = True
+            self._write_config(True)
             self.logger.info("SQL query logging enabled")
             return True
         except Exception as e:
@@ -85,19 +146,7 @@ class SQLLogger:
     def disable_logging(self) -> bool:
         """Disable SQL query logging."""
         try:
-            config_file = Path('/var/www/production/xspacedownload.com/website/xspacedownloader/mainconfig.json')
-            config = {}
-            
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-            
-            config['sql_logging_enabled'] = False
-            
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-            
-            self._enabled = False
+            self._write_config(False)
             self.logger.info("SQL query logging disabled")
             return True
         except Exception as e:
@@ -107,37 +156,82 @@ class SQLLogger:
     def log_query(self, query: str, params: Optional[tuple] = None, 
                   execution_time: Optional[float] = None, 
                   component: str = "Unknown", 
-                  error: Optional[str] = None):
+                  error: Optional[str] = None,
+                  rows: Optional[int] = None):
         """
         Log a SQL query with execution details.
         
+        Only the raw values are queued here; formatting, fingerprinting and
+        writing happen on the background writer thread.
+        
         Args:
             query (str): The SQL query
             params (tuple, optional): Query parameters
             execution_time (float, optional): Execution time in seconds
             component (str): Component that executed the query
             error (str, optional): Error message if query failed
+            rows (int, optional): Rows affected or returned
         """
         if not self.is_enabled():
             return
         
+        # Every query is counted; only the log line is sampled. Errors and slow
+        # queries are always written.
+        write = (bool(error) or self.sample_rate >= 1.0
+                 or (execution_time or 0) * 1000 >= self.slow_ms
+                 or random.random() < self.sample_rate)
+        
+        if len(self._queue) >= MAX_QUEUE_SIZE:
+            self._dropped += 1
+            return
+        
+        self._queue.append((time.time(), query, params, execution_time, component, error, rows, write))
+        self._ensure_writer()
+        if len(self._queue) >= 100:
+            self._wakeup.set()
+    
+    def _ensure_writer(self):
+        """Start the background writer thread if it is not running."""
+        if self._writer is not None and self._writer.is_alive():
+            return
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._writer_loop, name='sql-log-writer', daemon=True)
+                self._writer.start()
+    
+    def _writer_loop(self):
+        """Drain the queue periodically until the process exits."""
+        while True:
+            self._wakeup.wait(0.5)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logging.getLogger(__name__).error(f"SQL log writer failed: {e}")
+    
+    def flush(self):
+        """Write out and aggregate every queued query."""
+        while True:
+            try:
+                event = self._queue.popleft()
+            except IndexError:
+                break
+            self._write_event(*event)
+    
+    def _write_event(self, logged_at, query, params, execution_time, component, error, rows, write=True):
+        """Record one queued query's statistics and, unless it was sampled out, write it to the log."""
         # Clean up query for logging
         clean_query = ' '.join(query.split())
+        duration_ms = (execution_time or 0) * 1000
         
-        # Prepare log entry
-        log_data = {
-            'component': component,
-            'query': clean_query,
-            'params': str(params) if params else None,
-            'execution_time_ms': round(execution_time * 1000, 2) if execution_time else None,
-            'status': 'ERROR' if error else 'SUCCESS',
-            'error': error,
-            'timestamp': datetime.now().isoformat()
-        }
+        self.stats.record(fingerprint_query(clean_query), duration_ms, rows=rows,
+                          error=bool(error), component=component)
+        if not write:
+            return
         
         # Format log message
         if execution_time:
-            time_str = f"({execution_time * 1000:.2f}ms)"
+            time_str = f"({duration_ms:.2f}ms)"
         else:
             time_str = ""
         
@@ -149,11 +243,41 @@ class SQLLogger:
         if error:
             log_message += f" | Error: {error}"
         
-        # Log the query
-        if error:
-            self.logger.error(log_message)
-        else:
-            self.logger.info(log_message)
+        # Keep the time the query ran rather than when it was written
+        record = self.logger.makeRecord(
+            self.logger.name, logging.ERROR if error else logging.INFO,
+            __file__, 0, log_message, None, None
+        )
+        record.created = logged_at
+        self.logger.handle(record)
+    
+    def get_query_stats(self, sort: str = 'total_ms', limit: int = 50) -> Dict[str, Any]:
+        """
+        Get per-fingerprint latency histograms for this process.
+        
+        Args:
+            sort (str): Field to sort fingerprints by
+            limit (int): Maximum number of fingerprints to return
+            
+        Returns:
+            dict: Settings, queue state and per-fingerprint statistics
+        """
+        self.flush()
+        return {
+            'enabled': self.is_enabled(),
+            'sample_rate': self.sample_rate,
+            'slow_ms': self.slow_ms,
+            'queue_depth': len(self._queue),
+            'dropped': self._dropped,
+            'pid': os.getpid(),
+            'fingerprint_count': len(self.stats),
+            'fingerprints': self.stats.snapshot(sort=sort, limit=limit)
+        }
+    
+    def reset_query_stats(self):
+        """Discard per-fingerprint statistics for this process."""
+        self.stats.reset()
+        self._dropped = 0
     
     def get_recent_logs(self, limit: int = 100) -> list:
         """
@@ -172,70 +296,77 @@ class SQLLogger:
             return logs
         
         try:
-            with open(sql_log_file, 'r') as f:
-                lines = f.readlines()
-            
-            # Get the last 'limit' lines
-            recent_lines = lines[-limit:] if len(lines) > limit else lines
-            
-            for line in reversed(recent_lines):
-                line = line.strip()
-                if line:
-                    # Parse log line
-                    try:
-                        parts = line.split(' - ', 2)
-                        if len(parts) >= 3:
-                            timestamp = parts[0]
-                            level = parts[1]
-                            message = parts[2]
-                            
-                            logs.append({
-                                'timestamp': timestamp,
-                                'level': level,
-                                'message': message
-                            })
-                    except Exception:
-                        # If parsing fails, include raw line
-                        logs.append({
-                            'timestamp': '',
-                            'level': 'INFO',
-                            'message': line
-                        })
+            # Read backwards from EOF so the cost does not grow with the file
+            page = log_reader.read_entries(str(sql_log_file), offset=0, limit=limit)
+            for entry in page['entries']:
+                logs.append({
+                    'timestamp': entry['timestamp'] or '',
+                    'level': entry['level'],
+                    'message': entry['message']
+                })
         except Exception as e:
             self.logger.error(f"Error reading SQL logs: {e}")
         
         return logs
     
-    def get_logs(self, limit: int = 100) -> list:
-        """Get SQL query logs with proper format for frontend."""
+    @staticmethod
+    def parse_query_message(message: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse a message written by log_query() back into its fields.
+        
+        Args:
+            message (str): Log message, e.g. "[Space] SUCCESS (1.23ms) - SELECT ... | Params: (1,)"
+            
+        Returns:
+            dict: component, query, params, execution_time, status and error,
+                  or None if the message is not a query log line
+        """
+        match = _QUERY_MESSAGE_RE.match(message)
+        if not match:
+            return None
+        
+        component, status, execution_time, rest = match.groups()
+        error = ''
+        params = None
+        if ' | Error: ' in rest:
+            rest, error = rest.split(' | Error: ', 1)
+        if ' | Params: ' in rest:
+            rest, params = rest.split(' | Params: ', 1)
+        
+        return {
+            'component': component,
+            'query': rest,
+            'params': params,
+            'execution_time': float(execution_time) if execution_time else 0,
+            'status': status,
+            'error': error
+        }
+    
+    def get_logs(self, limit: int = 100, offset: int = 0) -> list:
+        """
+        Get SQL query logs with proper format for frontend.
+        
+        Args:
+            limit (int): Maximum number of logs to return
+            offset (int): Number of newest logs to skip
+            
+        Returns:
+            list: Parsed query logs, newest first
+        """
         logs = []
         try:
             sql_log_file = self.log_dir / 'sql_queries.log'
             if not sql_log_file.exists():
                 return logs
             
-            with open(sql_log_file, 'r') as f:
-                lines = f.readlines()
-                
-            # Get last 'limit' lines
-            for line in lines[-limit:]:
-                try:
-                    # Parse JSON log entry
-                    log_entry = json.loads(line.strip())
-                    logs.append({
-                        'timestamp': log_entry.get('timestamp', ''),
-                        'component': log_entry.get('component', 'Unknown'),
-                        'query': log_entry.get('query', ''),
-                        'execution_time': log_entry.get('execution_time', 0),
-                        'status': log_entry.get('status', 'SUCCESS'),
-                        'error': log_entry.get('error', '')
-                    })
-                except json.JSONDecodeError:
-                    # Handle non-JSON log lines
-                    continue
-                    
-            # Reverse to show newest first
-            logs.reverse()
+            # Enable/disable notices share the file; only query lines start with "[component]".
+            # Filtering in the reader lets deep pages seek from its sparse index of query lines.
+            page = log_reader.read_entries(str(sql_log_file), offset=offset, limit=limit,
+                                           message_pattern=_QUERY_MESSAGE_RE)
+            for entry in page['entries']:
+                parsed = self.parse_query_message(entry['message'])
+                parsed['timestamp'] = entry['timestamp'] or ''
+                logs.append(parsed)
             
         except Exception as e:
             self.logger.error(f"Error reading SQL logs: {e}")
@@ -294,6 +425,7 @@ class SQLLogger:
 
 # Global SQL logger instance
 sql_logger = SQLLogger()
+atexit.register(sql_logger.flush)
 
 def execute_with_logging(cursor, query: str, params: Optional[tuple] = None, 
                         component: str = "Database") -> Any:
@@ -318,7 +450,7 @@ def execute_with_logging(cursor, query: str, params: Optional[tuple] = None,
         return cursor
     
     # Execute with timing and logging
-    start_time = time.time()
+    start_time = time.perf_counter()
     error = None
     
     try:
@@ -327,16 +459,32 @@ def execute_with_logging(cursor, query: str, params: Optional[tuple] = None,
         else:
             cursor.execute(query)
         
-        execution_time = time.time() - start_time
-        sql_logger.log_query(query, params, execution_time, component)
+        execution_time = time.perf_counter() - start_time
+        sql_logger.log_query(query, params, execution_time, component, rows=cursor_row_count(cursor))
         return cursor
         
     except Exception as e:
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         error = str(e)
         sql_logger.log_query(query, params, execution_time, component, error)
         raise  # Re-raise the exception
 
+def cursor_row_count(cursor) -> Optional[int]:
+    """
+    Get the row count of a cursor after execute, if the driver knows it.
+    
+    Args:
+        cursor: Database cursor
+        
+    Returns:
+        int: Rows affected or returned, or None when unknown
+    """
+    try:
+        rows = cursor.rowcount
+    except Exception:
+        return None
+    return rows if isinstance(rows, int) and rows >= 0 else None
+
 def log_query_manual(query: str, execution_time: float, 
                     component: str = "Manual", params: Optional[tuple] = None, 
                     error: Optional[str] = None):
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# components/SQLiteStore.py
+"""
+SQLite Store Component for XSpace Downloader
+
+Opens the SQLite sidecar databases (search and keyword indexes, translation
+memory, transcription and translation queues) the same way everywhere:
+
+- One connection per thread, opened on first use
+- WAL journal, NORMAL sync and a 10 second busy timeout, so the web app and
+  the workers can share one file
+- The schema script runs once per store; ':memory:' databases are separate
+  per connection, so there it runs on every new connection
+
+Usage Examples:
+
+    from components.SQLiteStore import SQLiteStore
+
+    store = SQLiteStore('data/translation_queue.db', _SCHEMA, autocommit=True)
+    connection = store.connection()
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+
+
+class SQLiteStore:
+    """Thread-local connections to one SQLite database with its schema applied."""
+
+    def __init__(self, db_path, schema: str, autocommit: bool = False, row_factory: bool = True):
+        """
+        Initialize the store; nothing is opened until connection() is called.
+
+        Args:
+            db_path (str): Path to the database file, or ':memory:'
+            schema (str): SQL script creating the tables (must be idempotent)
+            autocommit (bool): Open connections in autocommit mode; callers then
+                               begin their own transactions
+            row_factory (bool): Return sqlite3.Row rows instead of tuples
+        """
+        self.db_path = str(db_path)
+        self.schema = schema
+        self.autocommit = autocommit
+        self.row_factory = row_factory
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, creating the schema if needed."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            return connection
+
+        if self.db_path != ':memory:':
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        if self.autocommit:
+            connection = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+        else:
+            connection = sqlite3.connect(self.db_path, timeout=10)
+        if self.row_factory:
+            connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA busy_timeout=10000")
+
+        with self._schema_lock:
+            if not self._schema_ready or self.db_path == ':memory:':
+                connection.executescript(self.schema)
+                self._schema_ready = True
+
+        self._local.connection = connection
+        return connection
@@ -0,0 +1,666 @@
+#!/usr/bin/env python3
+# components/SearchIndex.py
+"""
+Full-text search index for XSpace Downloader.
+
+Keeps an SQLite FTS5 sidecar database next to the application with two kinds of
+documents:
+
+- one document per space (title, host and tags)
+- one document per transcript passage (a few timecoded lines of a transcript)
+
+The index is updated incrementally whenever a transcript or a space's tags are
+written, so searches never scan MySQL. Passages remember the timecode they start
+at, which lets search results link straight to the matching point in the audio.
+
+Usage:
+    from components.SearchIndex import search_index
+
+    search_index.index_transcript(space_id, 'en-US', transcript_text)
+    search_index.refresh_space(connection, space_id)
+    results = search_index.search('bitcoin etf', page=1, per_page=20)
+"""
+
+import re
+import html
+import time
+import logging
+
+from components.SQLiteStore import SQLiteStore
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('search_index')
+except ImportError:
+    logger = logging.getLogger(__name__)
+
+# Default location of the sidecar database
+DEFAULT_INDEX_PATH = './data/search_index.db'
+
+# Target size of a transcript passage in characters
+PASSAGE_TARGET_CHARS = 600
+
+# Markers used by snippet()/highlight(); replaced with <mark> after HTML escaping
+_MARK_START = '\x02'
+_MARK_END = '\x03'
+
+# Matches "[HH:MM:SS] text" transcript lines
+_TIMECODE_LINE = re.compile(r'^\s*\[(\d{1,2}):(\d{2}):(\d{2})\]\s*(.*)$')
+
+# Query tokens: quoted phrases or single words
+_QUERY_TOKEN = re.compile(r'"([^"]+)"|(\w+)', re.UNICODE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS space_docs (
+    rowid INTEGER PRIMARY KEY,
+    space_id TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL DEFAULT '',
+    host TEXT NOT NULL DEFAULT '',
+    tags TEXT NOT NULL DEFAULT ''
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS space_fts USING fts5(
+    title, host, tags,
+    content='space_docs', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS space_docs_ai AFTER INSERT ON space_docs BEGIN
+    INSERT INTO space_fts(rowid, title, host, tags)
+    VALUES (new.rowid, new.title, new.host, new.tags);
+END;
+
+CREATE TRIGGER IF NOT EXISTS space_docs_ad AFTER DELETE ON space_docs BEGIN
+    INSERT INTO space_fts(space_fts, rowid, title, host, tags)
+    VALUES ('delete', old.rowid, old.title, old.host, old.tags);
+END;
+
+CREATE TRIGGER IF NOT EXISTS space_docs_au AFTER UPDATE ON space_docs BEGIN
+    INSERT INTO space_fts(space_fts, rowid, title, host, tags)
+    VALUES ('delete', old.rowid, old.title, old.host, old.tags);
+    INSERT INTO space_fts(rowid, title, host, tags)
+    VALUES (new.rowid, new.title, new.host, new.tags);
+END;
+
+CREATE TABLE IF NOT EXISTS transcript_passages (
+    id INTEGER PRIMARY KEY,
+    space_id TEXT NOT NULL,
+    language TEXT NOT NULL,
+    start_seconds INTEGER,
+    text TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_passages_space_language
+    ON transcript_passages(space_id, language);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS passage_fts USING fts5(
+    text,
+    content='transcript_passages', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS transcript_passages_ai AFTER INSERT ON transcript_passages BEGIN
+    INSERT INTO passage_fts(rowid, text) VALUES (new.id, new.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS transcript_passages_ad AFTER DELETE ON transcript_passages BEGIN
+    INSERT INTO passage_fts(passage_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+
+def build_match_query(query):
+    """
+    Convert free text from a search box into a safe FTS5 MATCH expression.
+
+    Words and "quoted phrases" are ANDed together. The last bare word is used
+    as a prefix so results appear while the user is still typing.
+
+    Args:
+        query (str): Raw user query
+
+    Returns:
+        str: FTS5 MATCH expression, or None if the query has no searchable terms
+    """
+    terms = []
+    last_is_word = False
+    for match in _QUERY_TOKEN.finditer(query or ''):
+        phrase, word = match.groups()
+        if phrase:
+            words = re.findall(r'\w+', phrase, re.UNICODE)
+            if words:
+                terms.append('"' + ' '.join(words) + '"')
+                last_is_word = False
+        elif word:
+            terms.append(f'"{word}"')
+            last_is_word = True
+
+    if not terms:
+        return None
+
+    # Prefix-match the trailing word unless the user already finished typing it
+    if last_is_word and not query[-1:].isspace():
+        terms[-1] = terms[-1] + '*'
+
+    return ' '.join(terms)
+
+
+def split_transcript_into_passages(transcript_text, target_chars=PASSAGE_TARGET_CHARS):
+    """
+    Split a transcript into passages of roughly target_chars characters.
+
+    Timecoded transcripts are split on line boundaries and each passage keeps the
+    timecode of its first line. Plain transcripts are split on whitespace.
+
+    Args:
+        transcript_text (str): Transcript text, optionally with [HH:MM:SS] lines
+        target_chars (int): Approximate passage size
+
+    Returns:
+        list: (start_seconds or None, text) tuples
+    """
+    passages = []
+    if not transcript_text:
+        return passages
+
+    current_lines = []
+    current_start = None
+    current_length = 0
+
+    def flush():
+        if current_lines:
+            passages.append((current_start, ' '.join(current_lines)))
+
+    for line in transcript_text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+
+        match = _TIMECODE_LINE.match(line)
+        if match:
+            hours, minutes, seconds, text = match.groups()
+            line_start = int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+        else:
+            line_start = None
+            text = line
+
+        # Long untimed lines are split into several passages
+        pieces = [text]
+        if len(text) > target_chars * 2:
+            pieces = _split_long_text(text, target_chars)
+
+        for piece in pieces:
+            if current_length >= target_chars:
+                flush()
+                current_lines = []
+                current_start = None
+                current_length = 0
+            if not current_lines:
+                current_start = line_start
+            current_lines.append(piece)
+            current_length += len(piece) + 1
+            # Only the first piece of a line carries its timecode
+            line_start = None
+
+    flush()
+    return passages
+
+
+def _split_long_text(text, target_chars):
+    """Split text on whitespace into pieces of about target_chars characters."""
+    pieces = []
+    start = 0
+    while start < len(text):
+        end = start + target_chars
+        if end < len(text):
+            space = text.rfind(' ', start, end)
+            if space > start:
+                end = space
+        pieces.append(text[start:end].strip())
+        start = end
+    return [piece for piece in pieces if piece]
+
+
+def _render_marked(text):
+    """HTML-escape marked FTS output and turn the markers into <mark> tags."""
+    escaped = html.escape(text or '')
+    return escaped.replace(_MARK_START, '<mark>').replace(_MARK_END, '</mark>')
+
+
+def format_timecode(seconds):
+    """Format seconds as HH:MM:SS."""
+    seconds = int(seconds or 0)
+    return f"{seconds // 3600:02d}:{(seconds % 3600) // 60:02d}:{seconds % 60:02d}"
+
+
+class SearchIndex:
+    """Inverted index over space titles, hosts, tags and transcripts."""
+
+    def __init__(self, db_path=DEFAULT_INDEX_PATH):
+        """
+        Initialize the search index.
+
+        Args:
+            db_path (str): Path to the SQLite sidecar database
+        """
+        self.db_path = str(db_path)
+        self._store = SQLiteStore(self.db_path, _SCHEMA)
+
+    def _get_connection(self):
+        """Get this thread's SQLite connection."""
+        return self._store.connection()
+
+    def index_space(self, space_id, title='', host='', tags=None):
+        """
+        Add or replace the metadata document for a space.
+
+        Args:
+            space_id (str): The space ID
+            title (str): Space title
+            host (str): Host name and/or handle
+            tags (list): Tag names
+        """
+        tags_text = ' '.join(tag for tag in (tags or []) if tag)
+        connection = self._get_connection()
+        with connection:
+            connection.execute(
+                """
+                INSERT INTO space_docs (space_id, title, host, tags)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(space_id) DO UPDATE SET
+                    title = excluded.title,
+                    host = excluded.host,
+                    tags = excluded.tags
+                """,
+                (space_id, title or '', host or '', tags_text)
+            )
+
+    def index_transcript(self, space_id, language, transcript_text):
+        """
+        Replace the indexed passages of one transcript.
+
+        Args:
+            space_id (str): The space ID
+            language (str): Transcript language code
+            transcript_text (str): Transcript content
+
+        Returns:
+            int: Number of passages indexed
+        """
+        passages = split_transcript_into_passages(transcript_text)
+        connection = self._get_connection()
+        with connection:
+            connection.execute(
+                "DELETE FROM transcript_passages WHERE space_id = ? AND language = ?",
+                (space_id, language)
+            )
+            connection.executemany(
+                """
+                INSERT INTO transcript_passages (space_id, language, start_seconds, text)
+                VALUES (?, ?, ?, ?)
+                """,
+                [(space_id, language, start, text) for start, text in passages]
+            )
+            # Make sure the space can be found even before its metadata is indexed
+            connection.execute(
+                "INSERT OR IGNORE INTO space_docs (space_id) VALUES (?)",
+                (space_id,)
+            )
+        return len(passages)
+
+    def remove_transcript(self, space_id, language):
+        """Remove one transcript's passages from the index."""
+        connection = self._get_connection()
+        with connection:
+            connection.execute(
+                "DELETE FROM transcript_passages WHERE space_id = ? AND language = ?",
+                (space_id, language)
+            )
+
+    def remove_space(self, space_id):
+        """Remove a space and all of its transcripts from the index."""
+        connection = self._get_connection()
+        with connection:
+            connection.execute("DELETE FROM transcript_passages WHERE space_id = ?", (space_id,))
+            connection.execute("DELETE FROM space_docs WHERE space_id = ?", (space_id,))
+
+    def refresh_space(self, db_connection, space_id):
+        """
+        Re-read a space's title, host and tags from MySQL and re-index them.
+
+        Args:
+            db_connection: MySQL connection
+            space_id (str): The space ID
+
+        Returns:
+            bool: True if the space was found and indexed
+        """
+        cursor = db_connection.cursor(dictionary=True)
+        try:
+            cursor.execute(
+                """
+                SELECT s.space_id, s.title, sm.host, sm.host_handle,
+                       GROUP_CONCAT(DISTINCT t.name SEPARATOR '\n') AS tag_names
+                FROM spaces s
+                LEFT JOIN space_metadata sm ON sm.space_id = s.space_id
+                LEFT JOIN space_tags st ON st.space_id = s.space_id
+                LEFT JOIN tags t ON t.id = st.tag_id
+                WHERE s.space_id = %s
+                GROUP BY s.space_id, s.title, sm.host, sm.host_handle
+                """,
+                (space_id,)
+            )
+            row = cursor.fetchone()
+        finally:
+            cursor.close()
+
+        if not row:
+            return False
+
+        host = ' '.join(part for part in (row.get('host'), row.get('host_handle')) if part)
+        tags = row['tag_names'].split('\n') if row.get('tag_names') else []
+        self.index_space(space_id, row.get('title') or '', host, tags)
+        return True
+
+    def rebuild(self, db_connection, batch_size=200):
+        """
+        Rebuild the whole index from MySQL.
+
+        Args:
+            db_connection: MySQL connection
+            batch_size (int): Number of transcripts fetched per round-trip
+
+        Returns:
+            dict: Counts of indexed spaces and transcripts
+        """
+        connection = self._get_connection()
+        with connection:
+            connection.execute("DELETE FROM transcript_passages")
+            connection.execute("DELETE FROM space_docs")
+
+        cursor = db_connection.cursor(dictionary=True)
+        try:
+            cursor.execute(
+                """
+                SELECT s.space_id, s.title, sm.host, sm.host_handle,
+                       GROUP_CONCAT(DISTINCT t.name SEPARATOR '\n') AS tag_names
+                FROM spaces s
+                LEFT JOIN space_metadata sm ON sm.space_id = s.space_id
+                LEFT JOIN space_tags st ON st.space_id = s.space_id
+                LEFT JOIN tags t ON t.id = st.tag_id
+                GROUP BY s.space_id, s.title, sm.host, sm.host_handle
+                """
+            )
+            spaces = cursor.fetchall()
+        finally:
+            cursor.close()
+
+        for row in spaces:
+            host = ' '.join(part for part in (row.get('host'), row.get('host_handle')) if part)
+            tags = row['tag_names'].split('\n') if row.get('tag_names') else []
+            self.index_space(row['space_id'], row.get('title') or '', host, tags)
+
+        transcript_count = 0
+        last_id = 0
+        while True:
+            cursor = db_connection.cursor(dictionary=True)
+            try:
+                cursor.execute(
+                    """
+                    SELECT id, space_id, language, transcript
+                    FROM space_transcripts
+                    WHERE id > %s
+                    ORDER BY id
+                    LIMIT %s
+                    """,
+                    (last_id, batch_size)
+                )
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+
+            if not rows:
+                break
+
+            for row in rows:
+                self.index_transcript(row['space_id'], row['language'], row['transcript'] or '')
+                transcript_count += 1
+            last_id = rows[-1]['id']
+
+        connection.execute("INSERT INTO space_fts(space_fts) VALUES ('optimize')")
+        connection.execute("INSERT INTO passage_fts(passage_fts) VALUES ('optimize')")
+        connection.commit()
+
+        logger.info(f"Search index rebuilt: {len(spaces)} spaces, {transcript_count} transcripts")
+        return {'spaces': len(spaces), 'transcripts': transcript_count}
+
+    def search(self, query, page=1, per_page=20, language=None, hits_per_space=3):
+        """
+        Run a ranked, paginated search.
+
+        Spaces are ranked by BM25 over their title, host and tags plus the score
+        of their best-matching transcript passage. Each result carries highlighted
+        fields and up to hits_per_space timecoded transcript hits.
+
+        Args:
+            query (str): Raw user query
+            page (int): 1-based page number
+            per_page (int): Results per page
+            language (str, optional): Only search transcripts in this language
+            hits_per_space (int): Maximum transcript hits returned per space
+
+        Returns:
+            dict: Results with total count, pagination info and timing
+        """
+        start_time = time.time()
+        page = max(1, int(page or 1))
+        per_page = max(1, min(int(per_page or 20), 100))
+        match = build_match_query(query)
+
+        response = {
+            'query': query,
+            'results': [],
+            'total': 0,
+            'page': page,
+            'per_page': per_page,
+            'pages': 0
+        }
+        if not match:
+            response['took_ms'] = round((time.time() - start_time) * 1000, 2)
+            return response
+
+        connection = self._get_connection()
+
+        language_clause = ""
+        params = [match, match]
+        if language:
+            language_clause = "AND p.language = ?"
+            params.append(language)
+        params.extend([per_page, (page - 1) * per_page])
+
+        # Title matches weigh most, then tags, then host; transcript passages
+        # contribute their single best score so long transcripts are not favoured.
+        ranked = connection.execute(
+            f"""
+            SELECT space_id, SUM(score) AS score, SUM(hits) AS hits,
+                   COUNT(*) OVER () AS total
+            FROM (
+                SELECT d.space_id AS space_id, -space_fts.rank AS score, 0 AS hits
+                FROM space_fts
+                JOIN space_docs d ON d.rowid = space_fts.rowid
+                WHERE space_fts MATCH ? AND space_fts.rank MATCH 'bm25(10.0, 4.0, 6.0)'
+                UNION ALL
+                SELECT space_id, MAX(score), COUNT(*)
+                FROM (
+                    SELECT p.space_id AS space_id, -passage_fts.rank AS score
+                    FROM passage_fts
+                    JOIN transcript_passages p ON p.id = passage_fts.rowid
+                    WHERE passage_fts MATCH ? {language_clause}
+                )
+                GROUP BY space_id
+            )
+            GROUP BY space_id
+            ORDER BY score DESC
+            LIMIT ? OFFSET ?
+            """,
+            params
+        ).fetchall()
+
+        if not ranked:
+            response['took_ms'] = round((time.time() - start_time) * 1000, 2)
+            return response
+
+        space_ids = [row['space_id'] for row in ranked]
+        placeholders = ', '.join('?' for _ in space_ids)
+
+        # Highlighted metadata for spaces that matched on title/host/tags
+        docs = {}
+        for row in connection.execute(
+            f"""
+            SELECT d.space_id,
+                   highlight(space_fts, 0, ?, ?) AS title,
+                   highlight(space_fts, 1, ?, ?) AS host,
+                   highlight(space_fts, 2, ?, ?) AS tags
+            FROM space_fts
+            JOIN space_docs d ON d.rowid = space_fts.rowid
+            WHERE space_fts MATCH ? AND d.space_id IN ({placeholders})
+            """,
+            [_MARK_START, _MARK_END] * 3 + [match] + space_ids
+        ):
+            docs[row['space_id']] = row
+
+        # Plain metadata for spaces that only matched in their transcripts
+        missing = [space_id for space_id in space_ids if space_id not in docs]
+        if missing:
+            missing_placeholders = ', '.join('?' for _ in missing)
+            for row in connection.execute(
+                f"SELECT space_id, title, host, tags FROM space_docs WHERE space_id IN ({missing_placeholders})",
+                missing
+            ):
+                docs[row['space_id']] = row
+
+        hits = self._get_passage_hits(connection, match, space_ids, language, hits_per_space)
+
+        for row in ranked:
+            space_id = row['space_id']
+            doc = docs.get(space_id)
+            response['results'].append({
+                'space_id': space_id,
+                'score': row['score'],
+                'title': _render_marked(doc['title']) if doc else '',
+                'host': _render_marked(doc['host']) if doc else '',
+                'tags': _render_marked(doc['tags']) if doc else '',
+                'transcript_hit_count': row['hits'],
+                'transcript_hits': hits.get(space_id, [])
+            })
+
+        total = ranked[0]['total']
+        response['total'] = total
+        response['pages'] = (total + per_page - 1) // per_page
+        response['took_ms'] = round((time.time() - start_time) * 1000, 2)
+        return response
+
+    def _get_passage_hits(self, connection, match, space_ids, language, hits_per_space):
+        """Get the best transcript passages with snippets for the given spaces."""
+        if hits_per_space <= 0:
+            return {}
+
+        placeholders = ', '.join('?' for _ in space_ids)
+        language_clause = "AND p.language = ?" if language else ""
+        params = [match] + space_ids + ([language] if language else []) + [hits_per_space]
+
+        # Pick the best passages per space first so snippets are only built for those
+        best_ids = [row['id'] for row in connection.execute(
+            f"""
+            SELECT id FROM (
+                SELECT p.id AS id,
+                       ROW_NUMBER() OVER (PARTITION BY p.space_id ORDER BY passage_fts.rank) AS position
+                FROM passage_fts
+                JOIN transcript_passages p ON p.id = passage_fts.rowid
+                WHERE passage_fts MATCH ? AND p.space_id IN ({placeholders}) {language_clause}
+            )
+            WHERE position <= ?
+            """,
+            params
+        )]
+        if not best_ids:
+            return {}
+
+        id_placeholders = ', '.join('?' for _ in best_ids)
+        hits = {}
+        for row in connection.execute(
+            f"""
+            SELECT p.space_id, p.language, p.start_seconds,
+                   snippet(passage_fts, 0, ?, ?, '…', 24) AS snippet
+            FROM passage_fts
+            JOIN transcript_passages p ON p.id = passage_fts.rowid
+            WHERE passage_fts MATCH ? AND passage_fts.rowid IN ({id_placeholders})
+            ORDER BY passage_fts.rank
+            """,
+            [_MARK_START, _MARK_END, match] + best_ids
+        ):
+            start_seconds = row['start_seconds']
+            hits.setdefault(row['space_id'], []).append({
+                'language': row['language'],
+                'start_seconds': start_seconds,
+                'timecode': format_timecode(start_seconds) if start_seconds is not None else None,
+                'snippet': _render_marked(row['snippet'])
+            })
+        return hits
+
+    def get_stats(self):
+        """Get the number of indexed spaces and passages."""
+        connection = self._get_connection()
+        spaces = connection.execute("SELECT COUNT(*) FROM space_docs").fetchone()[0]
+        passages = connection.execute("SELECT COUNT(*) FROM transcript_passages").fetchone()[0]
+        return {'spaces': spaces, 'passages': passages, 'path': self.db_path}
+
+
+# Global search index instance
+search_index = SearchIndex()
+
+
+def update_transcript_index(space_id, language, transcript_text):
+    """
+    Index a saved transcript without letting indexing errors reach the caller.
+
+    Args:
+        space_id (str): The space ID
+        language (str): Transcript language code
+        transcript_text (str): Transcript content
+    """
+    try:
+        search_index.index_transcript(space_id, language, transcript_text)
+    except Exception as e:
+        logger.warning(f"Could not update search index for transcript {space_id}/{language}: {e}")
+
+
+def update_space_index(db_connection, space_id):
+    """
+    Re-index a space's title, host and tags without raising.
+
+    Args:
+        db_connection: MySQL connection
+        space_id (str): The space ID
+    """
+    try:
+        search_index.refresh_space(db_connection, space_id)
+    except Exception as e:
+        logger.warning(f"Could not update search index for space {space_id}: {e}")
+
+
+def remove_from_index(space_id, language=None):
+    """
+    Remove a space, or one of its transcripts, from the index without raising.
+
+    Args:
+        space_id (str): The space ID
+        language (str, optional): Only remove the transcript in this language
+    """
+    try:
+        if language:
+            search_index.remove_transcript(space_id, language)
+        else:
+            search_index.remove_space(space_id)
+    except Exception as e:
+        logger.warning(f"Could not remove {space_id} from search index: {e}")
@@ -8,6 +8,7 @@ import json
 import time
 import shutil
 import logging
+import threading
 import whisper
 import subprocess
 from pathlib import Path
@@ -20,6 +21,14 @@ try:
     from components.DatabaseManager import db_manager
 except ImportError:
     db_manager = None
+try:
+    from components.SearchIndex import update_transcript_index, update_space_index, remove_from_index
+except ImportError:
+    update_transcript_index = update_space_index = remove_from_index = None
+try:
+    from components.KeywordIndex import update_keyword_index, remove_from_keyword_index
+except ImportError:
+    update_keyword_index = remove_from_keyword_index = None
 
 # Global cache invalidation callback
 _cache_invalidation_callback = None
@@ -61,6 +70,49 @@ except ImportError:
     )
     logger = logging.getLogger(__name__)
 
+# Map-reduce AI tag generation
+from components.TagExtractor import TagExtractor
+try:
+    from components.TranscriptCache import TranscriptCache, transcript_cache
+except ImportError:
+    TranscriptCache = None
+    transcript_cache = None
+
+# AI clients, tag cache and extractors for tag generation, created once per process and shared
+_tag_ai_clients = None
+_tag_cache = None
+_tag_extractors = {}
+_tag_ai_lock = threading.Lock()
+
+def _get_tag_ai_clients():
+    """Return the shared (AI, AICost) pair used for tag generation."""
+    global _tag_ai_clients
+    with _tag_ai_lock:
+        if _tag_ai_clients is None:
+            from components.AI import AI
+            from components.AICost import AICost
+            _tag_ai_clients = (AI(), AICost())
+        return _tag_ai_clients
+
+def _get_tag_cache():
+    """Cache for per-chunk candidate tags, next to the transcript cache (call with _tag_ai_lock held)."""
+    global _tag_cache
+    if transcript_cache is None:
+        return None
+    if _tag_cache is None:
+        _tag_cache = TranscriptCache(cache_dir=str(transcript_cache.cache_dir / 'tags'),
+                                     max_bytes=64 * 1024 * 1024)
+    return _tag_cache
+
+def _get_tag_extractor(ai, model):
+    """Return the shared TagExtractor for a model, so its rate limit spans every space."""
+    with _tag_ai_lock:
+        extractor = _tag_extractors.get(model)
+        if extractor is None:
+            extractor = TagExtractor(ai.generate_text, model=model, cache=_get_tag_cache())
+            _tag_extractors[model] = extractor
+        return extractor
+
 class Space:
     """Class for managing space data and operations."""
     
@@ -443,6 +495,10 @@ class Space:
                 """
                 db_manager.execute_query(update_query, (transcript_text, existing['id']))
                 logger.info(f"[DEBUG] Updated existing transcript id: {existing['id']}")
+                if update_transcript_index:
+                    update_transcript_index(space_id, language, transcript_text)
+                if update_keyword_index:
+                    update_keyword_index(space_id, language, transcript_text)
                 return existing['id']
             else:
                 # Insert new transcript
@@ -453,6 +509,10 @@ class Space:
                 """
                 transcript_id = db_manager.execute_query(insert_query, (space_id, language, transcript_text))
                 logger.info(f"[DEBUG] Inserted new transcript with id: {transcript_id}")
+                if update_transcript_index:
+                    update_transcript_index(space_id, language, transcript_text)
+                if update_keyword_index:
+                    update_keyword_index(space_id, language, transcript_text)
                 
                 # Generate and save tags for all transcripts
                 try:
@@ -523,6 +583,10 @@ class Space:
                 """
                 cursor.execute(update_query, (transcript_text, existing[0]))
                 self.connection.commit()
+                if update_transcript_index:
+                    update_transcript_index(space_id, language, transcript_text)
+                if update_keyword_index:
+                    update_keyword_index(space_id, language, transcript_text)
                 return existing[0]
             else:
                 # Insert new transcript
@@ -537,6 +601,10 @@ class Space:
                 self.connection.commit()
                 transcript_id = cursor.lastrowid
                 logger.info(f"[DEBUG] Insert successful, transcript_id: {transcript_id}")
+                if update_transcript_index:
+                    update_transcript_index(space_id, language, transcript_text)
+                if update_keyword_index:
+                    update_keyword_index(space_id, language, transcript_text)
                 
                 # Generate and save tags for all transcripts
                 try:
@@ -592,6 +660,10 @@ class Space:
                             cursor.execute(update_query, (transcript_text, existing[0]))
                             self.connection.commit()
                             cursor.close()
+                            if update_transcript_index:
+                                update_transcript_index(space_id, language, transcript_text)
+                            if update_keyword_index:
+                                update_keyword_index(space_id, language, transcript_text)
                             logger.info(f"Successfully saved transcript on retry for space {space_id}")
                             return existing[0]
                         else:
@@ -605,6 +677,10 @@ class Space:
                             self.connection.commit()
                             transcript_id = cursor.lastrowid
                             cursor.close()
+                            if update_transcript_index:
+                                update_transcript_index(space_id, language, transcript_text)
+                            if update_keyword_index:
+                                update_keyword_index(space_id, language, transcript_text)
                             
                             # Generate tags if needed
                             try:
@@ -646,13 +722,22 @@ class Space:
         try:
             cursor = self.connection.cursor()
             
+            # Look up the transcript so it can be dropped from the search index
+            cursor.execute("SELECT space_id, language FROM space_transcripts WHERE id = %s", (transcript_id,))
+            transcript = cursor.fetchone()
+            
             query = """
             DELETE FROM space_transcripts WHERE id = %s
             """
             cursor.execute(query, (transcript_id,))
             self.connection.commit()
             
-            return cursor.rowcount > 0
+            deleted = cursor.rowcount > 0
+            if deleted and transcript and remove_from_index:
+                remove_from_index(transcript[0], transcript[1])
+            if deleted and transcript and remove_from_keyword_index:
+                remove_from_keyword_index(transcript[0], transcript[1])
+            return deleted
             
         except Exception as e:
             logger.error(f"Error deleting transcript: {e}")
@@ -846,6 +931,8 @@ class Space:
             
             if rows_affected > 0:
                 logger.info(f"Updated title for space {space_id}: {title}")
+                if update_space_index:
+                    update_space_index(self.connection, space_id)
                 return True
             else:
                 logger.warning(f"No space found with ID: {space_id}")
@@ -992,6 +1079,10 @@ class Space:
             result = cursor.rowcount > 0
             if result:
                 invalidate_spaces_cache()
+                if remove_from_index:
+                    remove_from_index(space_id)
+                if remove_from_keyword_index:
+                    remove_from_keyword_index(space_id)
             
             return result
             
@@ -2135,6 +2226,9 @@ class Space:
             self.connection.commit()
             cursor.close()
             
+            if update_space_index:
+                update_space_index(self.connection, space_id)
+            
             logger.info(f"Saved metadata for space {space_id}")
             return True
             
@@ -2757,26 +2851,11 @@ class Space:
             return self.create_or_get_tag(tag_name)
         
         try:
-            # Normalize tag name (lowercase)
-            normalized_name = tag_name.lower().strip()
-            
-            # Check if tag exists
-            result = db_manager.execute_query(
-                "SELECT id FROM tags WHERE name = %s", 
-                (normalized_name,), 
-                fetch_one=True
-            )
-            
-            if result:
-                return result['id']
-            
-            # Create new tag
-            tag_id = db_manager.execute_query(
-                "INSERT INTO tags (name) VALUES (%s)",
-                (normalized_name,)
-            )
-            
-            return tag_id
+            from components.Tag import resolve_tag_ids, normalize_tag_name
+            with db_manager.get_connection() as connection:
+                tag_ids = resolve_tag_ids(connection, [tag_name])
+                connection.commit()
+            return tag_ids.get(normalize_tag_name(tag_name))
             
         except Exception as e:
             logger.error(f"Error creating/getting tag: {e}")
@@ -2798,29 +2877,10 @@ class Space:
                 logger.error("Failed to establish database connection")
                 return None
             
-            cursor = self.connection.cursor()
-            # Normalize tag name (lowercase)
-            normalized_name = tag_name.lower().strip()
-            
-            # Check if tag exists
-            cursor.execute("SELECT id FROM tags WHERE name = %s", (normalized_name,))
-            result = cursor.fetchone()
-            
-            if result:
-                cursor.close()
-                return result[0]
-            
-            # Create new tag
-            cursor.execute(
-                "INSERT INTO tags (name) VALUES (%s)",
-                (normalized_name,)
-            )
-            tag_id = cursor.lastrowid
+            from components.Tag import resolve_tag_ids, normalize_tag_name
+            tag_ids = resolve_tag_ids(self.connection, [tag_name])
             self.connection.commit()
-            cursor.close()
-            
-            logger.info(f"Created new tag: {normalized_name}")
-            return tag_id
+            return tag_ids.get(normalize_tag_name(tag_name))
             
         except Exception as e:
             logger.error(f"Error creating/getting tag: {e}")
@@ -2843,31 +2903,16 @@ class Space:
             return self.add_tags_to_space(space_id, tag_names)
         
         try:
-            added_tags = []
-            
-            for tag_name in tag_names:
-                if not tag_name or not tag_name.strip():
-                    continue
-                    
-                # Get or create tag
-                tag_id = self.create_or_get_tag_pooled(tag_name)
-                if not tag_id:
-                    continue
-                
-                try:
-                    # Add space-tag relationship
-                    db_manager.execute_query(
-                        "INSERT INTO space_tags (space_id, tag_id) VALUES (%s, %s)",
-                        (space_id, tag_id)
-                    )
-                    added_tags.append({
-                        'id': tag_id,
-                        'name': tag_name.strip(),
-                        'slug': self.normalize_tag_slug(tag_name)
-                    })
-                except mysql.connector.IntegrityError:
-                    # Tag already associated with space
-                    pass
+            from components.Tag import bulk_add_tags
+            with db_manager.get_connection() as connection:
+                added = bulk_add_tags(connection, space_id, [name for name in tag_names if name])
+                connection.commit()
+                if added and update_space_index:
+                    update_space_index(connection, space_id)
+            added_tags = [
+                {'id': tag_id, 'name': original, 'slug': self.normalize_tag_slug(original)}
+                for original, _, tag_id in added
+            ]
             
             return {'success': True, 'tags': added_tags}
             
@@ -2892,35 +2937,16 @@ class Space:
                 logger.error("Failed to establish database connection")
                 return {'success': False, 'error': 'Database connection failed', 'tags': []}
             
-            added_tags = []
-            cursor = self.connection.cursor()
-            
-            for tag_name in tag_names:
-                if not tag_name or not tag_name.strip():
-                    continue
-                    
-                # Get or create tag
-                tag_id = self.create_or_get_tag(tag_name)
-                if not tag_id:
-                    continue
-                
-                try:
-                    # Add space-tag relationship
-                    cursor.execute(
-                        "INSERT INTO space_tags (space_id, tag_id) VALUES (%s, %s)",
-                        (space_id, tag_id)
-                    )
-                    added_tags.append({
-                        'id': tag_id,
-                        'name': tag_name.strip(),
-                        'slug': self.normalize_tag_slug(tag_name)
-                    })
-                except mysql.connector.IntegrityError:
-                    # Tag already associated with space
-                    pass
-            
+            from components.Tag import bulk_add_tags
+            added = bulk_add_tags(self.connection, space_id, [name for name in tag_names if name])
             self.connection.commit()
-            cursor.close()
+            added_tags = [
+                {'id': tag_id, 'name': original, 'slug': self.normalize_tag_slug(original)}
+                for original, _, tag_id in added
+            ]
+            
+            if added_tags and update_space_index:
+                update_space_index(self.connection, space_id)
             
             logger.info(f"Added {len(added_tags)} tags to space {space_id}")
             return {
@@ -3091,215 +3117,53 @@ class Space:
             
             # Try AI-based tag generation first
             try:
-                from components.AI import AI
-                from components.AICost import AICost
-                ai = AI()
-                ai_cost = AICost()
+                ai, ai_cost = _get_tag_ai_clients()
+                provider = ai.get_provider_name().lower()
+                model = getattr(ai.provider, 'model', 'unknown') if hasattr(ai, 'provider') else 'unknown'
                 
-                # Import regex module
-                import re
-                
-                # Define chunk size (approximately 2500 chars to leave room for prompt)
-                chunk_size = 2500
-                transcript_length = len(transcript_text)
-                
-                # Common words to filter out
-                common_words = {
-                    'going', 'because', 'think', 'about', 'would', 'doesn\'t', 'really', 
-                    'maybe', 'probably', 'something', 'could', 'should', 'might', 'actually', 
-                    'basically', 'thing', 'stuff', 'people', 'good', 'nice', 'very', 'thank', 
-                    'there', 'here', 'prompt', 'getting', 'saying', 'having', 'being', 
-                    'doing', 'making', 'taking', 'coming', 'looking', 'using', 'working',
-                    'trying', 'talking', 'thinking', 'feeling', 'knowing', 'seeing',
-                    'right', 'just', 'like', 'want', 'need', 'time', 'know', 'yeah',
-                    'okay', 'well', 'mean', 'said', 'says', 'tell', 'told', 'talk'
-                }
-                
-                all_tags = []
-                chunks_processed = 0
+                tag_logger.info("="*80)
+                tag_logger.info("AI TAG GENERATION REQUEST")
+                tag_logger.info("="*80)
+                tag_logger.info(f"Max tags requested: {max_tags}")
+                tag_logger.info(f"Total transcript length: {len(transcript_text)} characters")
+                tag_logger.info(f"AI Provider: {ai.get_provider_name()}")
+                tag_logger.info("-"*80)
+                
+                tag_operations = []
+                
+                def track_response(prompt, response_text):
+                    """Log each AI call and collect its cost for the space."""
+                    tag_logger.info(f"AI RESPONSE: {response_text}")
+                    if not (hasattr(self, 'id') and self.id):
+                        return
+                    tag_operations.append({
+                        'space_id': self.id,
+                        'action': 'tag_generation',
+                        'vendor': provider,
+                        'model': model,
+                        'input_tokens': ai_cost.estimate_tokens(prompt, is_input=True),
+                        'output_tokens': ai_cost.estimate_tokens(response_text, is_input=False)
+                    })
                 
-                # Process transcript in chunks
-                for i in range(0, transcript_length, chunk_size):
-                    chunk = transcript_text[i:i + chunk_size]
-                    chunks_processed += 1
-                    
-                    # Prepare prompt for tag generation
-                    prompt = f"""Analyze this transcript excerpt and extract up to {max_tags} **highly relevant** and **searchable** tags.
-
-STRICT GUIDELINES:
-1. DO NOT use **common or vague words**, including: going, because, think, about, would, doesn't, really, maybe, probably, something, could, should, might, actually, basically, thing, stuff, people, good, nice, very, thank, there, here, prompt.
-2. PRIORITIZE the following:
-   - **Proper nouns**: Countries, cities, regions, places (e.g., Bangladesh, Silicon Valley)
-   - **Organizations**: Companies, institutions, political groups (e.g., Google, NATO)
-   - **Topics or disciplines**: Fields or subjects (e.g., artificial intelligence, biotechnology)
-   - **Technical terms or jargon**: Industry- or domain-specific keywords (e.g., zero-day exploit, blockchain)
-   - **Public figures**: Full names or distinct identifiers (e.g., Elon Musk, Sheikh Hasina)
-3. All tags must be **specific**, **meaningful**, and suitable for categorization or search indexing.
-4. AVOID:
-   - Single generic words (e.g., about, nice, people, would)
-   - Standalone numbers (e.g., 2024, 10, 5)
-   - Overly broad tags (e.g., technology, news) unless critical to topic
-   - Words without strong connection to topic
-
-FORMAT:
-- Return tags ONLY as a **comma-separated list**
-- NO extra text, no bullet points, no numbers
-
-EXAMPLES:
-Good tags: "Bangladesh", "OpenAI", "machine learning", "climate finance", "Elon Musk", "Dhaka", "data privacy", "nuclear submarine"
-Bad tags: "thing", "nice", "about", "because", "there", "prompt", "2024"
-
-Transcript excerpt (chunk {chunks_processed} of {((transcript_length - 1) // chunk_size) + 1}):
-{chunk}
-"""
-                    
-                    # Log the prompt being sent
-                    tag_logger.info("="*80)
-                    tag_logger.info(f"AI TAG GENERATION REQUEST - Chunk {chunks_processed}")
-                    tag_logger.info("="*80)
-                    tag_logger.info(f"Max tags requested per chunk: {max_tags}")
-                    tag_logger.info(f"Chunk size: {len(chunk)} characters")
-                    tag_logger.info(f"Total transcript length: {transcript_length} characters")
-                    tag_logger.info(f"AI Provider: {ai.get_provider_name()}")
-                    tag_logger.info("-"*80)
-                    
-                    # Generate tags using AI
-                    result = ai.generate_text(prompt, max_tokens=100)
-                    
-                    # Track cost if we have a space_id (which we can get from self.id)
-                    if hasattr(self, 'id') and self.id:
+                extractor = _get_tag_extractor(ai, f"{provider}:{model}")
+                try:
+                    final_tags = extractor.extract(transcript_text, max_tags=max_tags, on_response=track_response)
+                finally:
+                    if tag_operations:
                         try:
-                            # Estimate tokens for cost tracking
-                            input_tokens = ai_cost.estimate_tokens(prompt, is_input=True)
-                            output_tokens = ai_cost.estimate_tokens(result.get('text', ''), is_input=False) if result.get('success') else 0
-                            
-                            # Get provider and model info
-                            provider = ai.get_provider_name().lower()
-                            model = getattr(ai.provider, 'model', 'unknown') if hasattr(ai, 'provider') else 'unknown'
-                            
-                            # Track cost (without deducting credits since this is called from background process)
-                            cost_success, cost_message, cost = ai_cost.track_cost(
-                                space_id=self.id,
-                                action='tag_generation',
-                                vendor=provider,
-                                model=model,
-                                input_tokens=input_tokens,
-                                output_tokens=output_tokens,
+                            # Track every chunk's cost in one batch (without deducting credits
+                            # since this is called from background process)
+                            cost_success, cost_message, cost = ai_cost.track_costs(
+                                tag_operations,
                                 user_id=getattr(self, 'user_id', None),
                                 deduct_credits=False  # Don't deduct for background tag generation
                             )
-                            
                             if not cost_success:
                                 tag_logger.warning(f"Cost tracking failed for tag generation: {cost_message}")
                         except Exception as cost_err:
                             tag_logger.warning(f"Error tracking cost for tag generation: {cost_err}")
-                    
-                    tag_logger.info(f"AI RESPONSE for chunk {chunks_processed}:")
-                    tag_logger.info("-"*80)
-                    tag_logger.info(f"Success: {result.get('success', False)}")
-                    if result.get('success'):
-                        tag_logger.info(f"Response: {result.get('text', '')}")
-                    else:
-                        tag_logger.error(f"AI Error: {result.get('error', 'Unknown error')}")
-                    tag_logger.info("-"*80)
-                    
-                    if result.get('success') and result.get('text'):
-                        # Parse tags from response
-                        tags_text = result.get('text', '').strip()
-                        chunk_tags = [tag.strip() for tag in tags_text.split(',') if tag.strip()]
-                        
-                        # Add to all_tags
-                        all_tags.extend(chunk_tags)
-                        tag_logger.info(f"Tags from chunk {chunks_processed}: {chunk_tags}")
-                
-                # After processing all chunks, consolidate and filter tags
-                tag_logger.info("="*80)
-                tag_logger.info("CONSOLIDATING TAGS FROM ALL CHUNKS")
-                tag_logger.info("="*80)
-                tag_logger.info(f"Total tags collected: {len(all_tags)}")
-                tag_logger.info(f"Raw tags: {all_tags}")
-                
-                # Count tag frequency and remove duplicates
-                from collections import Counter
-                tag_counts = Counter(all_tags)
-                
-                # Filter and score tags
-                scored_tags = []
-                for tag, count in tag_counts.items():
-                    # Skip if tag is just a number
-                    if re.match(r'^\d+$', tag):
-                        tag_logger.info(f"Filtered out standalone number tag: {tag}")
-                        continue
-                    
-                    # Skip very short tags
-                    if len(tag) < 2:
-                        tag_logger.info(f"Filtered out too short tag: {tag}")
-                        continue
-                    
-                    # Skip common words
-                    if tag.lower() in common_words:
-                        tag_logger.info(f"Filtered out common word: {tag}")
-                        continue
-                    
-                    # Score based on frequency and quality
-                    score = count  # Base score is frequency
-                    
-                    # Bonus for proper nouns (capitalized)
-                    if tag[0].isupper():
-                        score += 2
-                    
-                    # Bonus for multi-word tags (likely more specific)
-                    if ' ' in tag:
-                        score += 3
-                    
-                    # Bonus for technical terms (contains numbers or special chars)
-                    if any(c.isdigit() for c in tag) and not tag.isdigit():
-                        score += 2
-                    
-                    scored_tags.append((tag, score))
-                
-                # Sort by score and take top tags
-                scored_tags.sort(key=lambda x: x[1], reverse=True)
-                
-                # Use AI to further refine the top tags
-                if len(scored_tags) > max_tags:
-                    top_tags = [tag for tag, score in scored_tags[:max_tags * 2]]  # Get 2x candidates
-                    
-                    refine_prompt = f"""From these candidate tags, select the {max_tags} MOST relevant and high-quality tags for categorizing the transcript.
-
-SELECTION CRITERIA:
-1. Prefer specific over generic (e.g., "OpenAI" over "technology")
-2. Prefer proper nouns and named entities
-3. Prefer technical/domain-specific terms
-4. Avoid common words and phrases
-5. Ensure diversity - don't select multiple variants of the same concept
-
-Candidate tags: {', '.join(top_tags)}
-
-Return ONLY the selected tags as a comma-separated list, nothing else."""
-                    
-                    tag_logger.info("REFINING TAGS WITH AI")
-                    tag_logger.info(f"Candidates for refinement: {top_tags}")
-                    
-                    refine_result = ai.generate_text(refine_prompt, max_tokens=100)
-                    
-                    if refine_result.get('success') and refine_result.get('text'):
-                        refined_tags = [tag.strip() for tag in refine_result.get('text', '').split(',') if tag.strip()]
-                        tag_logger.info(f"AI refined tags: {refined_tags}")
-                        
-                        # Final filtering
-                        final_tags = []
-                        for tag in refined_tags:
-                            if tag and len(tag) >= 2 and tag.lower() not in common_words:
-                                final_tags.append(tag)
-                        
-                        final_tags = final_tags[:max_tags]
-                    else:
-                        # Fallback to top scored tags
-                        final_tags = [tag for tag, score in scored_tags[:max_tags]]
-                else:
-                    # Use all tags if we have fewer than max_tags
-                    final_tags = [tag for tag, score in scored_tags]
+                if final_tags is None:
+                    raise RuntimeError("every tag extraction request failed")
                 
                 tag_logger.info(f"FINAL TAGS GENERATED: {final_tags}")
                 tag_logger.info("="*80 + "\n")
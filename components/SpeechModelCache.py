@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# components/SpeechModelCache.py
+"""
+Speech Model Cache Component for XSpace Downloader
+
+Keeps several loaded SpeechToText instances in memory so transcription jobs
+that alternate between models do not pay for reloading weights each time.
+
+Features:
+- Up to max_models loaded models with least-recently-used eviction
+- Optional memory budget using measured parameter sizes (or a per-model estimate)
+- Evicted models shut down their local Whisper process pools
+- Preloading of the configured default model at worker start
+
+Usage Examples:
+
+    from components.SpeechModelCache import SpeechModelCache
+
+    cache = SpeechModelCache(max_models=2, memory_budget_mb=4096)
+    cache.preload('base')
+    stt = cache.get('small')
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('speech_model_cache')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# Approximate resident size of fp32 Whisper weights, used when the loaded
+# model cannot be measured
+MODEL_MEMORY_MB = {
+    'tiny': 150,
+    'base': 290,
+    'small': 970,
+    'medium': 3050,
+    'large': 6200,
+    'turbo': 3200
+}
+
+
+def estimate_model_memory_mb(stt) -> float:
+    """
+    Estimate how much memory a loaded SpeechToText holds.
+
+    Args:
+        stt (SpeechToText): Loaded instance
+
+    Returns:
+        float: Megabytes (0 for API providers)
+    """
+    if getattr(stt, 'provider', 'local') != 'local':
+        return 0.0
+
+    model = getattr(stt, 'model', None)
+    parameters = getattr(model, 'parameters', None)
+    if callable(parameters):
+        try:
+            return sum(p.numel() * p.element_size() for p in parameters()) / (1024 * 1024)
+        except Exception:
+            pass
+
+    base_name = str(getattr(stt, 'model_name', '')).split('.')[0].split('-')[0]
+    return float(MODEL_MEMORY_MB.get(base_name, MODEL_MEMORY_MB['large']))
+
+
+class SpeechModelCache:
+    """LRU cache of loaded SpeechToText instances keyed by requested model name."""
+
+    def __init__(self, factory: Optional[Callable] = None, max_models: int = 2,
+                 memory_budget_mb: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            factory (callable, optional): Builds an instance from model_name=...
+                                          (default: SpeechToText)
+            max_models (int): Maximum number of models kept loaded
+            memory_budget_mb (float, optional): Maximum total model memory; the
+                                                most recent model is always kept
+        """
+        if factory is None:
+            from components.SpeechToText import SpeechToText
+            factory = SpeechToText
+        self.factory = factory
+        self.max_models = max(1, max_models)
+        self.memory_budget_mb = memory_budget_mb
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, model_name: str):
+        """
+        Get a loaded instance for a model, loading it if needed.
+
+        Args:
+            model_name (str): Requested model name
+
+        Returns:
+            SpeechToText: Loaded instance, or None if loading failed
+        """
+        with self._lock:
+            entry = self._models.get(model_name)
+            if entry is not None:
+                self._models.move_to_end(model_name)
+                entry['hits'] += 1
+                entry['last_used'] = time.time()
+                return entry['stt']
+
+            logger.info(f"Loading speech model {model_name}")
+            started = time.time()
+            try:
+                stt = self.factory(model_name=model_name)
+                if not stt.load_model():
+                    logger.error(f"Speech model {model_name} failed to load")
+                    return None
+            except Exception as e:
+                logger.error(f"Failed to load speech model {model_name}: {e}")
+                return None
+
+            load_seconds = time.time() - started
+            self._models[model_name] = {
+                'stt': stt,
+                'memory_mb': estimate_model_memory_mb(stt),
+                'load_seconds': load_seconds,
+                'hits': 0,
+                'last_used': time.time()
+            }
+            logger.info(f"Loaded speech model {model_name} in {load_seconds:.1f}s")
+            self._evict()
+            return stt
+
+    def preload(self, model_name: str) -> bool:
+        """
+        Load a model ahead of the first job that needs it.
+
+        Args:
+            model_name (str): Model name
+
+        Returns:
+            bool: True if the model is loaded
+        """
+        return self.get(model_name) is not None
+
+    def _evict(self):
+        """Drop least recently used models until the limits are met (lock held)."""
+        while len(self._models) > 1 and (
+            len(self._models) > self.max_models or
+            (self.memory_budget_mb and self.memory_mb() > self.memory_budget_mb)
+        ):
+            model_name, entry = self._models.popitem(last=False)
+            logger.info(f"Evicting speech model {model_name} ({entry['memory_mb']:.0f}MB)")
+            self._close(entry['stt'])
+
+    @staticmethod
+    def _close(stt):
+        """Release resources held by an instance."""
+        close = getattr(stt, 'close', None)
+        if callable(close):
+            try:
+                close()
+            except Exception as e:
+                logger.warning(f"Error closing speech model: {e}")
+
+    def memory_mb(self) -> float:
+        """Total estimated memory of loaded models."""
+        return sum(entry['memory_mb'] for entry in self._models.values())
+
+    def most_recent(self) -> Optional[str]:
+        """Name of the most recently used model, if any."""
+        with self._lock:
+            return next(reversed(self._models), None)
+
+    def loaded_models(self) -> List[Dict]:
+        """
+        Describe the loaded models, most recently used first.
+
+        Returns:
+            list: Dicts with model, memory_mb, load_seconds, hits and last_used
+        """
+        with self._lock:
+            return [
+                {
+                    'model': model_name,
+                    'memory_mb': round(entry['memory_mb'], 1),
+                    'load_seconds': round(entry['load_seconds'], 2),
+                    'hits': entry['hits'],
+                    'last_used': entry['last_used']
+                }
+                for model_name, entry in reversed(self._models.items())
+            ]
+
+    def __contains__(self, model_name):
+        with self._lock:
+            return model_name in self._models
+
+    def clear(self):
+        """Unload every model."""
+        with self._lock:
+            while self._models:
+                _, entry = self._models.popitem(last=False)
+                self._close(entry['stt'])
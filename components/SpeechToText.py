@@ -8,6 +8,8 @@ import warnings
 from datetime import datetime
 from pathlib import Path
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Optional pydub import (for audio processing)
 try:
@@ -35,6 +37,49 @@ except ImportError:
     OPENAI_AVAILABLE = False
     openai = None
 
+# Streaming ffmpeg-based chunker (keeps long Spaces out of memory)
+try:
+    from components.AudioChunker import AudioChunker, decode_pcm, probe_duration, ffmpeg_available
+    AUDIO_CHUNKER_AVAILABLE = ffmpeg_available()
+except ImportError:
+    AUDIO_CHUNKER_AVAILABLE = False
+    AudioChunker = None
+    decode_pcm = None
+    probe_duration = None
+
+# Voice activity detection to skip dead air (needs ffmpeg and NumPy)
+try:
+    from components.VoiceActivity import VoiceActivityDetector
+    from components.AudioChunker import NUMPY_AVAILABLE
+    VAD_AVAILABLE = AUDIO_CHUNKER_AVAILABLE and NUMPY_AVAILABLE
+except ImportError:
+    VAD_AVAILABLE = False
+    VoiceActivityDetector = None
+
+# Content-addressed cache of raw transcription results
+try:
+    from components.TranscriptCache import TranscriptCache, transcript_cache
+except ImportError:
+    TranscriptCache = None
+    transcript_cache = None
+
+# Cache for corrected transcript chunks, created on first use and shared by every instance
+_correction_cache = None
+_correction_cache_lock = threading.Lock()
+
+# Process pool for local Whisper across CPU cores
+try:
+    from components.WhisperPool import WhisperPool
+    WHISPER_POOL_AVAILABLE = True
+except ImportError:
+    WHISPER_POOL_AVAILABLE = False
+    WhisperPool = None
+
+from components.RateLimiter import TokenBucket, retry_with_backoff
+from components.AIGateway import ai_gateway
+from components.TranscriptCorrector import TranscriptCorrector
+from components.LanguageIdentifier import LanguageIdentifier
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -59,6 +104,17 @@ class SpeechToText:
         self.model = None
         self.chunk_length_ms = chunk_length_ms
         
+        # Optional callable(completed_chunks, total_chunks) for chunked transcription
+        self.progress_callback = None
+        
+        # Local Whisper process pool, started on first local transcription
+        self._whisper_pool = None
+        self._whisper_pool_lock = threading.Lock()
+        
+        # Transcript corrector, created on first use so its rate limit spans every transcript
+        self._corrector = None
+        self._corrector_lock = threading.Lock()
+        
         # Load transcription configuration
         self.config = self._load_transcription_config()
         
@@ -89,6 +145,10 @@ class SpeechToText:
         # Set appropriate model name for provider
         if self.provider == 'openai':
             self.model_name = self.config.get('openai_model', 'gpt-4o-mini-transcribe')
+            # Large files are cut by ffmpeg; there is no in-memory fallback for the API path
+            if not AUDIO_CHUNKER_AVAILABLE:
+                logger.error("ffmpeg/ffprobe not found: OpenAI transcription of files over 25MB will fail "
+                             "and language identification is disabled until ffmpeg is installed")
         else:
             # For local, use provided model_name or default from config
             if model_name == 'tiny':  # If using default, check config
@@ -113,7 +173,18 @@ class SpeechToText:
             'device': 'auto',
             'openai_model': 'gpt-4o-mini-transcribe',
             'enable_corrective_filter': False,
-            'correction_model': 'gpt-4o-mini'
+            'correction_model': 'gpt-4o-mini',
+            'correction_chunk_chars': 8000,
+            'openai_max_concurrency': 4,
+            'openai_requests_per_minute': 50,
+            'openai_max_retries': 3,
+            'local_workers': 0,
+            'local_threads_per_worker': 0,
+            'enable_vad': False,
+            'vad_min_savings': 0.05,
+            'enable_transcript_cache': True,
+            'enable_language_id': True,
+            'language_id_windows': 3
         }
         
         try:
@@ -148,8 +219,7 @@ class SpeechToText:
                         return False
                     
                     # Test client creation (new API >= 1.0.0)
-                    from openai import OpenAI
-                    test_client = OpenAI(api_key=api_key)
+                    test_client = ai_gateway.openai_client(api_key)
                     
                     logger.info(f"[TRANSCRIPTION] OpenAI API client ready")
                     self.model = "openai_client_ready"  # Mark as ready
@@ -273,11 +343,13 @@ class SpeechToText:
                 logger.error("Audio file is empty")
                 return None
             
-            # Validate audio file format using pydub
+            # Validate audio file format (ffprobe reads the header instead of decoding the file)
             try:
-                audio_segment = AudioSegment.from_file(audio_file)
-                duration = len(audio_segment) / 1000.0
-                logger.info(f"[TRANSCRIPTION] Audio validation: {duration:.1f}s duration, {audio_segment.frame_rate}Hz, {audio_segment.channels} channels")
+                duration = self._get_audio_duration(audio_file)
+                if duration is None:
+                    logger.error("Audio file validation failed: could not read duration")
+                    return None
+                logger.info(f"[TRANSCRIPTION] Audio validation: {duration:.1f}s duration")
                 
                 # Check for very short audio (OpenAI requires at least some content)
                 if duration < 0.1:
@@ -288,9 +360,8 @@ class SpeechToText:
                 logger.error(f"Audio file validation failed: {e}")
                 return None
             
-            # Create OpenAI client (new API >= 1.0.0)
-            from openai import OpenAI
-            client = OpenAI(api_key=self.config.get('openai_api_key'))
+            # Shared OpenAI client (new API >= 1.0.0), reusing its connection pool
+            client = ai_gateway.openai_client(self.config.get('openai_api_key'))
             
             # Determine response format
             if self.model_name == "gpt-4o-mini-transcribe":
@@ -319,13 +390,18 @@ class SpeechToText:
                 
                 # Try converting to a more compatible format (WAV, 16-bit, mono)
                 try:
-                    # Convert audio to WAV format for better compatibility
-                    converted_audio = audio_segment.set_frame_rate(16000).set_channels(1).set_sample_width(2)
-                    
                     # Create temporary file
                     import tempfile
                     with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
                         temp_file_path = temp_file.name
+                    
+                    # Convert audio to WAV format for better compatibility
+                    if AUDIO_CHUNKER_AVAILABLE:
+                        if not AudioChunker.export_chunk(audio_file, 0, None, temp_file_path,
+                                                         format='wav', sample_rate=16000, channels=1):
+                            raise RuntimeError("ffmpeg conversion failed")
+                    else:
+                        converted_audio = AudioSegment.from_file(audio_file).set_frame_rate(16000).set_channels(1).set_sample_width(2)
                         converted_audio.export(temp_file_path, format='wav')
                     
                     logger.info(f"[TRANSCRIPTION] Converted audio to {temp_file_path} (16kHz, mono, 16-bit WAV)")
@@ -416,6 +492,10 @@ class SpeechToText:
         """
         Transcribe large audio files (>25MB) by chunking them for OpenAI API.
         
+        Chunks are cut by ffmpeg straight from the source file; this path needs
+        ffmpeg and ffprobe (checked when the component is created) and has no
+        pydub fallback.
+        
         Args:
             audio_file (str): Path to the audio file
             language (str, optional): Language code for transcription
@@ -427,81 +507,34 @@ class SpeechToText:
         try:
             logger.info(f"[TRANSCRIPTION] Starting chunked OpenAI transcription")
             
-            # Load the audio file using pydub
-            audio_segment = AudioSegment.from_file(audio_file)
-            total_duration = len(audio_segment) / 1000.0  # Convert to seconds
+            if not AUDIO_CHUNKER_AVAILABLE:
+                raise RuntimeError("ffmpeg/ffprobe are required for chunked transcription")
             
-            logger.info(f"[TRANSCRIPTION] Audio duration: {total_duration:.1f}s")
+            # Probe the duration instead of decoding the whole recording
+            total_duration = probe_duration(audio_file)
+            if not total_duration:
+                raise RuntimeError(f"Could not determine duration of {audio_file}")
             
-            # Calculate chunk size based on file size and bitrate to stay under 25MB
-            # Be more conservative and aim for ~20MB chunks
-            file_size_bytes = os.path.getsize(audio_file)
-            bitrate_bps = (file_size_bytes * 8) / total_duration  # bits per second
+            logger.info(f"[TRANSCRIPTION] Audio duration: {total_duration:.1f}s")
             
-            # Calculate safe chunk duration to stay under 20MB (leaving 5MB buffer)
-            target_chunk_bytes = 20 * 1024 * 1024  # 20MB
-            safe_chunk_duration = (target_chunk_bytes * 8) / bitrate_bps  # seconds
+            max_workers = max(1, int(self.config.get('openai_max_concurrency', 4)))
             
-            # Convert to milliseconds and ensure reasonable bounds (5-20 minutes)
-            chunk_duration_ms = int(max(5 * 60, min(20 * 60, safe_chunk_duration)) * 1000)
+            # Chunks are re-encoded at 64 kbps mono, so 20 minutes is ~9.6MB, well under
+            # the 25MB limit. Shorter chunks (down to 5 minutes) let more run in parallel.
+            chunk_duration_seconds = max(5 * 60, min(20 * 60, total_duration / max_workers))
             
-            logger.info(f"[TRANSCRIPTION] Calculated chunk duration: {chunk_duration_ms/60000:.1f} minutes based on bitrate")
+            logger.info(f"[TRANSCRIPTION] Calculated chunk duration: {chunk_duration_seconds/60:.1f} minutes for {max_workers} workers")
             
-            # Split audio into chunks
-            chunks = []
-            current_start = 0
-            
-            while current_start < len(audio_segment):
-                # Calculate this chunk's end
-                chunk_end = min(current_start + chunk_duration_ms, len(audio_segment))
-                chunk = audio_segment[current_start:chunk_end]
-                
-                # For all chunks except the last one, try to find a good break point
-                if chunk_end < len(audio_segment):
-                    # Look for silence in the last 30 seconds of the chunk to avoid mid-sentence breaks
-                    silence_search_start = max(0, len(chunk) - 30000)  # Last 30 seconds
-                    
-                    try:
-                        from pydub.silence import detect_silence
-                        
-                        # Search for silence in the last portion of the chunk
-                        search_segment = chunk[silence_search_start:]
-                        silence_ranges = detect_silence(
-                            search_segment,
-                            min_silence_len=500,  # At least 0.5 seconds of silence
-                            silence_thresh=search_segment.dBFS - 16  # 16dB below average volume
-                        )
-                        
-                        if silence_ranges:
-                            # Use the last silence point found for a cleaner break
-                            last_silence = silence_ranges[-1]
-                            silence_end = silence_search_start + last_silence[1]
-                            chunk = chunk[:silence_end]
-                            chunk_end = current_start + silence_end
-                            logger.debug(f"Found silence break at {silence_end/1000:.1f}s for chunk {len(chunks)+1}")
-                    except Exception as silence_error:
-                        logger.debug(f"Silence detection failed for chunk, using time-based split: {silence_error}")
-                
-                # Verify chunk isn't too small (at least 30 seconds)
-                if len(chunk) >= 30000 or chunk_end >= len(audio_segment):  # 30 seconds or final chunk
-                    chunks.append({
-                        'audio': chunk,
-                        'start_ms': current_start,
-                        'end_ms': chunk_end,
-                        'start_seconds': current_start / 1000.0,
-                        'end_seconds': chunk_end / 1000.0,
-                        'duration_seconds': len(chunk) / 1000.0
-                    })
-                    current_start = chunk_end
-                else:
-                    # Chunk too small, extend it
-                    current_start = min(current_start + chunk_duration_ms, len(audio_segment))
+            # Plan chunk boundaries, looking for silence in the last 30 seconds of each
+            # chunk to avoid mid-sentence breaks; only those windows are decoded
+            chunker = AudioChunker(search_seconds=30.0, min_silence_ms=500)
+            chunks = chunker.plan_chunks(audio_file, chunk_duration_seconds,
+                                         min_chunk_seconds=30.0, duration=total_duration)
             
             logger.info(f"[TRANSCRIPTION] Split audio into {len(chunks)} chunks")
             
-            # Create OpenAI client
-            from openai import OpenAI
-            client = OpenAI(api_key=self.config.get('openai_api_key'))
+            # Create OpenAI client (thread-safe, shared by all workers)
+            client = ai_gateway.openai_client(self.config.get('openai_api_key'))
             
             # Determine response format
             if self.model_name == "gpt-4o-mini-transcribe":
@@ -509,108 +542,56 @@ class SpeechToText:
             else:
                 response_format = "verbose_json"
             
-            # Transcribe each chunk
-            all_text = []
-            all_segments = []
+            rate_limiter = TokenBucket(
+                rate_per_minute=float(self.config.get('openai_requests_per_minute', 50)),
+                burst=max_workers
+            )
             detected_language = language if language else "unknown"  # Track detected language
-            import tempfile
-            
-            for i, chunk_info in enumerate(chunks):
-                chunk_start = chunk_info['start_seconds']
-                chunk_end = chunk_info['end_seconds']
-                chunk_duration = chunk_info['duration_seconds']
+            results = [None] * len(chunks)
+            completed = 0
+            
+            with tempfile.TemporaryDirectory(prefix='openai_chunks_') as temp_dir:
+                def run_chunk(chunk_info, chunk_language):
+                    return self._transcribe_openai_chunk(
+                        client, audio_file, chunk_info, len(chunks), chunk_language,
+                        response_format, temp_dir, rate_limiter
+                    )
                 
-                logger.info(f"[TRANSCRIPTION] Processing chunk {i+1}/{len(chunks)} ({chunk_start:.1f}s - {chunk_end:.1f}s, {chunk_duration:.1f}s)")
+                pending = list(chunks)
                 
-                # Export chunk to temporary file with optimized settings for size
-                with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
-                    temp_path = temp_file.name
-                    # Use a low bitrate to ensure we stay under 25MB
-                    chunk_info['audio'].export(temp_path, format='mp3', bitrate='64k')
-                    
-                    # Check the actual file size
-                    chunk_size_mb = os.path.getsize(temp_path) / (1024 * 1024)
-                    logger.info(f"[TRANSCRIPTION] Chunk {i+1} exported: {chunk_size_mb:.1f}MB")
+                # Without a requested language, transcribe chunk 0 first and carry its
+                # detected language forward so every chunk is transcribed consistently
+                if not language and pending:
+                    first = pending.pop(0)
+                    results[0] = run_chunk(first, None)
+                    completed += 1
+                    self._report_progress(completed, len(chunks))
+                    if results[0] and results[0]['language'] not in (None, 'unknown'):
+                        detected_language = results[0]['language']
                 
-                try:
-                    # Transcribe chunk
-                    with open(temp_path, 'rb') as audio:
-                        response = client.audio.transcriptions.create(
-                            model=self.model_name,
-                            file=audio,
-                            language=language if language else None,
-                            response_format=response_format
-                        )
-                    
-                    # Process response based on format
-                    if response_format == "json":
-                        chunk_text = getattr(response, "text", "")
-                        # Detect language from the first chunk's text if no language specified
-                        if i == 0 and not language and chunk_text.strip():
-                            detected_language = self._detect_language_from_text(chunk_text)
-                        chunk_language = detected_language
-                        chunk_segments = []
-                        
-                        # For JSON format (gpt-4o-mini-transcribe), create artificial segments
-                        # since OpenAI doesn't provide them, but we need them for timecodes
-                        if chunk_text.strip():
-                            # Split text into sentences for better timecode distribution
-                            sentences = self._split_text_into_sentences(chunk_text.strip())
-                            if sentences:
-                                segment_duration = chunk_duration / len(sentences)
-                                chunk_segments = []
-                                
-                                for j, sentence in enumerate(sentences):
-                                    if sentence.strip():
-                                        segment_start = chunk_start + (j * segment_duration)
-                                        segment_end = chunk_start + ((j + 1) * segment_duration)
-                                        
-                                        # Don't exceed chunk boundary
-                                        segment_end = min(segment_end, chunk_end)
-                                        
-                                        artificial_segment = {
-                                            "start": segment_start,
-                                            "end": segment_end,
-                                            "text": sentence.strip()
-                                        }
-                                        chunk_segments.append(artificial_segment)
-                            else:
-                                # Fallback to single segment
-                                artificial_segment = {
-                                    "start": chunk_start,
-                                    "end": chunk_end,
-                                    "text": chunk_text.strip()
-                                }
-                                chunk_segments = [artificial_segment]
-                    else:
-                        chunk_text = getattr(response, "text", "")
-                        chunk_language = getattr(response, "language", "unknown")
-                        chunk_segments = getattr(response, "segments", [])
-                        
-                        # Adjust segment timestamps to account for chunk position
-                        for segment in chunk_segments:
-                            segment["start"] = segment.get("start", 0) + chunk_start
-                            segment["end"] = segment.get("end", 0) + chunk_start
-                    
-                    # Add chunk text
-                    if chunk_text.strip():
-                        all_text.append(chunk_text.strip())
-                    
-                    # Add all segments (either real or artificial)
-                    all_segments.extend(chunk_segments)
-                    
-                    logger.info(f"[TRANSCRIPTION] Chunk {i+1} completed: {len(chunk_text)} chars")
-                    
-                except Exception as chunk_error:
-                    logger.error(f"Error transcribing chunk {i+1}: {chunk_error}")
-                    # Continue with other chunks
-                    
-                finally:
-                    # Clean up temporary file
-                    try:
-                        os.unlink(temp_path)
-                    except:
-                        pass
+                # Only pass ISO codes (verbose_json reports language names)
+                carried_language = language or (detected_language if len(detected_language) == 2 else None)
+                
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='openai-chunk') as executor:
+                    futures = {executor.submit(run_chunk, chunk_info, carried_language): chunk_info['index']
+                               for chunk_info in pending}
+                    for future in as_completed(futures):
+                        results[futures[future]] = future.result()
+                        completed += 1
+                        self._report_progress(completed, len(chunks))
+            
+            # Stitch chunks back together in timeline order
+            all_text = []
+            all_segments = []
+            for chunk_result in results:
+                if not chunk_result:
+                    continue
+                if chunk_result['text'].strip():
+                    all_text.append(chunk_result['text'].strip())
+                all_segments.extend(chunk_result['segments'])
+            
+            if not all_text:
+                raise RuntimeError("Every chunk failed to transcribe")
             
             # Combine all results
             combined_text = " ".join(all_text)
@@ -633,6 +614,137 @@ class SpeechToText:
             logger.error(f"Chunked transcription traceback: {traceback.format_exc()}")
             return None
     
+    def _transcribe_openai_chunk(self, client, audio_file, chunk_info, chunk_count, language,
+                                 response_format, temp_dir, rate_limiter):
+        """
+        Export and transcribe one chunk of a large file with the OpenAI API.
+        
+        Args:
+            client: OpenAI client
+            audio_file (str): Path to the source audio file
+            chunk_info (dict): Chunk from AudioChunker.plan_chunks()
+            chunk_count (int): Total number of chunks (for logging)
+            language (str, optional): Language code to request
+            response_format (str): 'json' or 'verbose_json'
+            temp_dir (str): Directory for the exported chunk
+            rate_limiter (TokenBucket): Shared request rate limiter
+            
+        Returns:
+            dict: index, text, language and segments with absolute timestamps,
+                  or None if the chunk failed after retries
+        """
+        i = chunk_info['index']
+        chunk_start = chunk_info['start_seconds']
+        chunk_end = chunk_info['end_seconds']
+        chunk_duration = chunk_info['duration_seconds']
+        temp_path = os.path.join(temp_dir, f"chunk_{i:04d}.mp3")
+        
+        logger.info(f"[TRANSCRIPTION] Processing chunk {i+1}/{chunk_count} ({chunk_start:.1f}s - {chunk_end:.1f}s, {chunk_duration:.1f}s)")
+        
+        try:
+            # Encode straight from the source file; a low bitrate ensures we stay under 25MB
+            if not AudioChunker.export_chunk(audio_file, chunk_start, chunk_end, temp_path,
+                                             format='mp3', bitrate='64k', channels=1):
+                raise RuntimeError("ffmpeg could not export chunk")
+            
+            chunk_size_mb = os.path.getsize(temp_path) / (1024 * 1024)
+            logger.info(f"[TRANSCRIPTION] Chunk {i+1} exported: {chunk_size_mb:.1f}MB")
+            
+            def upload():
+                with open(temp_path, 'rb') as audio:
+                    return client.audio.transcriptions.create(
+                        model=self.model_name,
+                        file=audio,
+                        language=language if language else None,
+                        response_format=response_format
+                    )
+            
+            response = retry_with_backoff(
+                upload,
+                attempts=max(1, int(self.config.get('openai_max_retries', 3))),
+                base_delay=2.0,
+                before_attempt=rate_limiter.acquire,
+                description=f"[TRANSCRIPTION] Chunk {i+1} upload"
+            )
+            
+            # Process response based on format
+            if response_format == "json":
+                chunk_text = getattr(response, "text", "")
+                chunk_language = language
+                # Detect language from the text if no language was requested
+                if not chunk_language and chunk_text.strip():
+                    chunk_language = self._detect_language_from_text(chunk_text)
+                chunk_segments = []
+                
+                # For JSON format (gpt-4o-mini-transcribe), create artificial segments
+                # since OpenAI doesn't provide them, but we need them for timecodes
+                if chunk_text.strip():
+                    # Split text into sentences for better timecode distribution
+                    sentences = self._split_text_into_sentences(chunk_text.strip())
+                    if sentences:
+                        segment_duration = chunk_duration / len(sentences)
+                        
+                        for j, sentence in enumerate(sentences):
+                            if sentence.strip():
+                                segment_start = chunk_start + (j * segment_duration)
+                                segment_end = chunk_start + ((j + 1) * segment_duration)
+                                
+                                chunk_segments.append({
+                                    "start": segment_start,
+                                    # Don't exceed chunk boundary
+                                    "end": min(segment_end, chunk_end),
+                                    "text": sentence.strip()
+                                })
+                    else:
+                        # Fallback to single segment
+                        chunk_segments = [{
+                            "start": chunk_start,
+                            "end": chunk_end,
+                            "text": chunk_text.strip()
+                        }]
+            else:
+                chunk_text = getattr(response, "text", "")
+                chunk_language = getattr(response, "language", "unknown")
+                chunk_segments = getattr(response, "segments", []) or []
+                
+                # Adjust segment timestamps to account for chunk position
+                adjusted_segments = []
+                for segment in chunk_segments:
+                    if not isinstance(segment, dict):
+                        segment = segment.model_dump() if hasattr(segment, 'model_dump') else dict(segment)
+                    segment["start"] = segment.get("start", 0) + chunk_start
+                    segment["end"] = segment.get("end", 0) + chunk_start
+                    adjusted_segments.append(segment)
+                chunk_segments = adjusted_segments
+            
+            logger.info(f"[TRANSCRIPTION] Chunk {i+1} completed: {len(chunk_text)} chars")
+            return {
+                'index': i,
+                'text': chunk_text,
+                'language': chunk_language or 'unknown',
+                'segments': chunk_segments
+            }
+            
+        except Exception as chunk_error:
+            logger.error(f"Error transcribing chunk {i+1}: {chunk_error}")
+            return None
+            
+        finally:
+            # Clean up temporary file
+            if os.path.exists(temp_path):
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+    
+    def _report_progress(self, completed, total):
+        """Pass chunk progress to the progress callback, if one is set."""
+        if self.progress_callback:
+            try:
+                self.progress_callback(completed, total)
+            except Exception as e:
+                logger.warning(f"Progress callback failed: {e}")
+    
     def _translate_with_openai(self, text, source_lang, target_lang, segments=None, include_timecodes=False):
         """
         Translate text using OpenAI API while preserving timecodes.
@@ -653,8 +765,7 @@ class SpeechToText:
                 logger.warning("OpenAI API not available for translation")
                 return None
             
-            from openai import OpenAI
-            client = OpenAI(api_key=self.config.get('openai_api_key'))
+            client = ai_gateway.openai_client(self.config.get('openai_api_key'))
             
             # Get language names for better prompts
             source_name = self._get_language_name(source_lang) if source_lang else source_lang
@@ -800,6 +911,9 @@ Text to translate:
         """
         Apply corrective filter to improve transcript accuracy using GPT.
         
+        Long transcripts are split on line or sentence boundaries and the
+        chunks corrected concurrently; [HH:MM:SS] timecodes are preserved.
+        
         Args:
             raw_transcript (str): The raw transcript text to correct
             language (str): Language code for the transcript
@@ -819,66 +933,7 @@ Text to translate:
             
             logger.info("[TRANSCRIPTION] Applying corrective filter")
             
-            # Create system prompt for transcript correction
-            system_prompt = """You are a helpful assistant that corrects transcription errors. Your task is to:
-
-1. Fix spelling mistakes and typos in the transcribed text
-2. Add proper punctuation (periods, commas, capitalization) where needed
-3. Correct obvious word misrecognitions (e.g., "their" vs "there", "two" vs "to")
-4. Fix common transcription errors (homophones, similar-sounding words)
-5. Ensure proper capitalization of names, places, and proper nouns
-6. Remove filler words like "um", "uh", "like" when excessive
-7. Fix grammar issues while preserving the original meaning and speaker's intent
-
-CRITICAL RULES:
-- Preserve ALL timecodes exactly as they appear [HH:MM:SS]
-- Do NOT add any segment markers, dividers, or formatting
-- Do NOT truncate or shorten the text
-- Return the COMPLETE corrected transcript
-- Only make corrections that are clearly needed
-- Preserve the original meaning and tone
-- Don't add information that wasn't in the original
-- Don't change technical terms unless clearly wrong
-- Keep the same speaking style and natural flow
-- If unsure about a correction, leave the original text
-
-Return ONLY the corrected transcript text without any additional commentary, formatting, or segment markers."""
-
-            # Call OpenAI API for correction using new interface
-            from openai import OpenAI
-            client = OpenAI(api_key=self.config.get('openai_api_key'))
-            
-            # Check if transcript is too long for a single API call
-            # GPT-4o-mini has ~128k token limit, but let's be conservative
-            # Roughly 4 chars per token, so ~50k chars should be safe
-            max_chars = 50000
-            
-            if len(raw_transcript) > max_chars:
-                logger.warning(f"Transcript too long ({len(raw_transcript)} chars) for corrective filter, skipping correction")
-                return raw_transcript
-            
-            response = client.chat.completions.create(
-                model=self.config.get('correction_model', 'gpt-4o-mini'),
-                temperature=0.1,  # Low temperature for consistent corrections
-                max_tokens=None,  # Let the model use as many tokens as needed
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": system_prompt
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Please correct this transcript:\n\n{raw_transcript}"
-                    }
-                ]
-            )
-            
-            corrected_text = response.choices[0].message.content.strip()
-            
-            # Basic validation to ensure the corrected text isn't truncated
-            if len(corrected_text) < len(raw_transcript) * 0.8:
-                logger.warning(f"Corrected text appears truncated (original: {len(raw_transcript)}, corrected: {len(corrected_text)}), using raw transcript")
-                return raw_transcript
+            corrected_text = self._get_corrector().correct(raw_transcript, language)
             
             logger.info(f"[TRANSCRIPTION] Corrective filter applied")
             
@@ -889,9 +944,52 @@ Return ONLY the corrected transcript text without any additional commentary, for
             logger.warning("Using raw transcript due to correction failure")
             return raw_transcript
     
+    def _get_corrector(self):
+        """Get this instance's TranscriptCorrector, creating it on first use."""
+        with self._corrector_lock:
+            if self._corrector is not None:
+                return self._corrector
+            
+            # Call OpenAI API for correction using new interface
+            client = ai_gateway.openai_client(self.config.get('openai_api_key'))
+            correction_model = self.config.get('correction_model', 'gpt-4o-mini')
+            
+            def complete(system_prompt, user_message):
+                response = client.chat.completions.create(
+                    model=correction_model,
+                    temperature=0.1,  # Low temperature for consistent corrections
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_message}
+                    ]
+                )
+                return response.choices[0].message.content
+            
+            self._corrector = TranscriptCorrector(
+                complete,
+                model=correction_model,
+                max_chars=int(self.config.get('correction_chunk_chars', 8000)),
+                max_workers=int(self.config.get('openai_max_concurrency', 4)),
+                requests_per_minute=float(self.config.get('openai_requests_per_minute', 50)),
+                max_retries=int(self.config.get('openai_max_retries', 3)),
+                cache=self._get_correction_cache()
+            )
+            return self._corrector
+    
+    def _get_correction_cache(self):
+        """Cache for corrected transcript chunks, or None if caching is disabled."""
+        global _correction_cache
+        if transcript_cache is None or not self.config.get('enable_transcript_cache', True):
+            return None
+        with _correction_cache_lock:
+            if _correction_cache is None:
+                _correction_cache = TranscriptCache(cache_dir=str(transcript_cache.cache_dir / 'corrections'),
+                                                    max_bytes=256 * 1024 * 1024)
+            return _correction_cache
+    
     def transcribe(self, audio_file, language=None, task="transcribe", verbose=False, 
                    output_file=None, output_format='txt', detect_language=False,
-                   translate_to=None, include_timecodes=False):
+                   translate_to=None, include_timecodes=False, use_cache=True, prepared_result=None):
         """
         Transcribe an audio file to text, with options for language detection and translation.
         
@@ -913,6 +1011,11 @@ Return ONLY the corrected transcript text without any additional commentary, for
             include_timecodes (bool, optional): Whether to include timecodes in the transcript text.
                                               Default is False. When True, each segment will be prefixed
                                               with its timestamp in [HH:MM:SS] format.
+            use_cache (bool, optional): Whether to reuse a cached raw transcription. Default is True.
+            prepared_result (dict, optional): Raw result already produced for this audio (for example
+                                              by streaming transcription during the download). The
+                                              speech engine is skipped; correction, timecodes and
+                                              translation still apply.
                                          
         Returns:
             dict: Transcription result with transcript text, detected language, and translation if requested.
@@ -935,25 +1038,39 @@ Return ONLY the corrected transcript text without any additional commentary, for
         if self.provider == 'openai':
             # For OpenAI API, we have simpler processing
             try:
-                result = self._transcribe_with_openai(str(audio_path), language, verbose)
+                language_id = {}
+                if prepared_result:
+                    logger.info("[TRANSCRIPTION] Using prepared transcription result")
+                    result = dict(prepared_result)
+                else:
+                    # Identify the language up front from one short clip, so every chunk
+                    # is transcribed in it and none waits on the first chunk's detection
+                    if detect_language or not language:
+                        language = self.identify_language(str(audio_path), use_cache, language_id) or language
+                    result = self._transcribe_cached(
+                        str(audio_path), language, {},
+                        lambda: self._transcribe_speech_only(
+                            str(audio_path),
+                            lambda path: self._transcribe_with_openai(path, language, verbose),
+                            format='mp3', bitrate='64k'
+                        ),
+                        use_cache
+                    )
                 if not result:
                     return None
                 
                 # Apply corrective filter to improve transcript accuracy
                 raw_text = result["text"]
                 
-                # Apply corrective filter to the full text once (much more efficient than per-segment)
-                corrected_text = self._apply_corrective_filter(raw_text, result["language"])
-                logger.info("[CORRECTIVE_FILTER] Applied to full text (1 API call) instead of per-segment (avoiding %d API calls)", 
-                           len(result.get("segments", [])))
-                
                 # Update the result with corrected text
                 if include_timecodes and "segments" in result and result["segments"]:
-                    # For timecoded transcripts, format with timecodes but use corrected content
-                    # We'll use the original segments for timing but note that text has been corrected
-                    result["text"] = self._format_transcript_with_timecodes(result["segments"])
-                    result["corrected_text"] = corrected_text  # Store the corrected version too
+                    # Correct the timecoded transcript; chunks keep their [HH:MM:SS] markers
+                    corrected_text = self._apply_corrective_filter(
+                        self._format_transcript_with_timecodes(result["segments"]), result["language"])
+                    result["text"] = corrected_text
+                    result["corrected_text"] = corrected_text
                 else:
+                    corrected_text = self._apply_corrective_filter(raw_text, result["language"])
                     # For non-timecoded transcripts, use the corrected text directly
                     result["text"] = corrected_text
                 
@@ -1029,8 +1146,11 @@ Return ONLY the corrected transcript text without any additional commentary, for
                         "name": self._get_language_name(result["language"]) if result["language"] != "unknown" else "Unknown"
                     },
                     "segments": result.get("segments", []),
-                    "duration": result.get("duration", 0)
+                    "duration": result.get("duration", 0),
+                    "cached": result.get("cached", False)
                 }
+                if language_id.get("language") or language_id.get("api_clips"):
+                    final_result["language_identification"] = language_id
                 
                 # Add translation info if present
                 if "original_text" in result:
@@ -1060,35 +1180,33 @@ Return ONLY the corrected transcript text without any additional commentary, for
             detected_language_code = None
             original_transcript = None
 
-            # STEP 1: Detect language if requested
-            if detect_language:
-                logger.info("First pass: Detecting language from audio")
-                # Run initial transcription with language detection only
-                detect_options = {
-                    "fp16": False,
-                    "verbose": verbose
-                }
-                detection_result = self.model.transcribe(str(audio_path), **detect_options)
-                detected_language_code = detection_result.get("language")
-                
+            # STEP 1: Identify the language from a few sampled windows when it was not
+            # given (a prepared result already has it); every later stage reuses it
+            if (detect_language or not language) and not prepared_result:
+                logger.info("First pass: Identifying language from sampled audio windows")
+                language_id = {}
+                detected_language_code = self.identify_language(str(audio_path), use_cache, language_id)
                 if detected_language_code:
+                    final_result["language_identification"] = language_id
+
+                if detected_language_code and detect_language:
                     logger.info(f"Detected language: {detected_language_code}")
                     final_result["detected_language"] = {
                         "code": detected_language_code,
                         "name": self._get_language_name(detected_language_code)
                     }
-                else:
+                elif not detected_language_code:
                     logger.warning("Language detection failed, will use auto-detection in transcription")
-            
+
             # STEP 2: Main transcription
             # For Whisper, language code must be a simple code like 'en', not 'en-US'
             whisper_language = None
-            
+
             # Priority for language selection:
-            # 1. Use detected language if detect_language is True
+            # 1. Use identified language if detect_language is True or none was given
             # 2. Use provided language if specified
             # 3. Otherwise, let Whisper auto-detect
-            if detect_language and detected_language_code:
+            if detected_language_code:
                 whisper_language = detected_language_code
             elif language:
                 # Check if language has a hyphen and extract just the primary language code
@@ -1119,29 +1237,41 @@ Return ONLY the corrected transcript text without any additional commentary, for
             
             transcribe_options["task"] = current_task
             
-            # Check if we should chunk the audio file
-            audio_duration = self._get_audio_duration(str(audio_path))
-            if audio_duration and audio_duration > 600:  # 10 minutes threshold for chunking
-                logger.info(f"Audio duration {audio_duration:.1f}s exceeds threshold, using chunked transcription")
-                result = self._transcribe_chunked(str(audio_path), transcribe_options, include_timecodes)
-            else:
+            def transcribe_local(path):
+                # Check if we should chunk the audio file
+                audio_duration = self._get_audio_duration(path)
+                if audio_duration and audio_duration > 600:  # 10 minutes threshold for chunking
+                    logger.info(f"Audio duration {audio_duration:.1f}s exceeds threshold, using chunked transcription")
+                    return self._transcribe_chunked(path, transcribe_options, include_timecodes)
                 # Perform single transcription for shorter files
-                result = self.model.transcribe(str(audio_path), **transcribe_options)
+                return self._whisper_transcribe(path, transcribe_options)
+            
+            if prepared_result:
+                logger.info("[TRANSCRIPTION] Using prepared transcription result")
+                result = dict(prepared_result)
+            else:
+                result = self._transcribe_cached(
+                    str(audio_path), transcribe_options.get("language"),
+                    # Chunked local transcription writes timecodes into the text, so they are part of the key
+                    {"task": transcribe_options.get("task"), "chunk_length_ms": self.chunk_length_ms,
+                     "include_timecodes": bool(include_timecodes)},
+                    lambda: self._transcribe_speech_only(str(audio_path), transcribe_local),
+                    use_cache
+                )
             
             # Store the original transcript
             raw_transcript = result["text"]
             
-            # Apply corrective filter to improve transcript accuracy
-            corrected_transcript = self._apply_corrective_filter(raw_transcript, result.get("language", "unknown"))
-            original_transcript = corrected_transcript
-            
-            # Generate timecoded transcript if requested
+            # Generate timecoded transcript if requested, then apply the corrective
+            # filter to improve transcript accuracy (timecodes are preserved)
+            original_transcript = raw_transcript
             if include_timecodes and "segments" in result:
                 original_transcript = self._format_transcript_with_timecodes(result["segments"])
+            original_transcript = self._apply_corrective_filter(original_transcript, result.get("language", "unknown"))
             
             # Update result with detected language if not already set
-            if not detected_language_code:
-                detected_language_code = result.get("language", "unknown")
+            if "detected_language" not in final_result:
+                detected_language_code = result.get("language") or detected_language_code or "unknown"
                 final_result["detected_language"] = {
                     "code": detected_language_code,
                     "name": self._get_language_name(detected_language_code)
@@ -1151,6 +1281,7 @@ Return ONLY the corrected transcript text without any additional commentary, for
             final_result["text"] = original_transcript
             final_result["original_text"] = original_transcript
             final_result["raw_text"] = raw_transcript  # Store raw transcript before correction
+            final_result["cached"] = result.get("cached", False)
             final_result["original_language"] = detected_language_code
             
             # Log some stats about the transcription
@@ -1181,7 +1312,7 @@ Return ONLY the corrected transcript text without any additional commentary, for
                                 "task": "translate",  # Translate to English
                                 "verbose": verbose
                             }
-                            translate_result = self.model.transcribe(str(audio_path), **translate_options)
+                            translate_result = self._whisper_transcribe(str(audio_path), translate_options)
                             translated_text = translate_result["text"]
                             
                             # Apply timecodes to translated text if requested
@@ -1323,8 +1454,7 @@ Return ONLY the corrected transcript text without any additional commentary, for
                 logger.warning("OpenAI API not available for language detection, using fallback")
                 return self._detect_language_fallback(text)
             
-            from openai import OpenAI
-            client = OpenAI(api_key=self.config.get('openai_api_key'))
+            client = ai_gateway.openai_client(self.config.get('openai_api_key'))
             
             # Take a sample of the text for analysis (first 500 characters)
             sample_text = text[:500].strip()
@@ -1625,21 +1755,19 @@ Language code:"""
             logger.error("Failed to load Whisper model, cannot transcribe")
             return {}
             
-        # Process each audio file
-        results = {}
-        for audio_file in audio_files:
+        def transcribe_one(audio_file):
             logger.info(f"Processing: {audio_file}")
             
             # Determine output file path
             if output_directory:
                 rel_path = audio_file.relative_to(audio_dir) if recursive else audio_file.name
-                output_file = Path(output_directory) / rel_path.with_suffix('.txt')
+                output_file = Path(output_directory) / Path(rel_path).with_suffix('.txt')
                 output_file.parent.mkdir(parents=True, exist_ok=True)
             else:
                 output_file = audio_file.with_suffix('.txt')
                 
             # Transcribe the audio file
-            result = self.transcribe(
+            return self.transcribe(
                 str(audio_file),
                 language=language,
                 output_file=str(output_file),
@@ -1649,20 +1777,29 @@ Language code:"""
                 translate_to=translate_to,
                 include_timecodes=include_timecodes
             )
-            
-            if result:
-                # For backward compatibility, use the text field as string result
-                if isinstance(result, dict) and "text" in result:
-                    results[str(audio_file)] = result["text"]
-                else:
-                    results[str(audio_file)] = result
+        
+        # With a local Whisper pool, keep every worker busy by running several
+        # files at once; the threads here only wait on the pool and the API calls
+        pool = self._get_whisper_pool()
+        file_workers = pool.workers if pool else 1
+        
+        # Process each audio file
+        results = {}
+        with ThreadPoolExecutor(max_workers=file_workers, thread_name_prefix='batch-transcribe') as executor:
+            for audio_file, result in zip(audio_files, executor.map(transcribe_one, audio_files)):
+                if result:
+                    # For backward compatibility, use the text field as string result
+                    if isinstance(result, dict) and "text" in result:
+                        results[str(audio_file)] = result["text"]
+                    else:
+                        results[str(audio_file)] = result
                 
         logger.info(f"Batch transcription completed. Processed {len(results)} files.")
         return results
     
     def _get_audio_duration(self, audio_file):
         """
-        Get the duration of an audio file using pydub.
+        Get the duration of an audio file using ffprobe, falling back to pydub.
         
         Args:
             audio_file (str): Path to the audio file
@@ -1670,6 +1807,11 @@ Language code:"""
         Returns:
             float: Duration in seconds, or None if unable to determine
         """
+        if AUDIO_CHUNKER_AVAILABLE:
+            duration = probe_duration(audio_file)
+            if duration is not None:
+                return duration
+        
         try:
             audio = AudioSegment.from_file(audio_file)
             return len(audio) / 1000.0  # Convert milliseconds to seconds
@@ -1677,11 +1819,312 @@ Language code:"""
             logger.warning(f"Could not determine audio duration for {audio_file}: {e}")
             return None
     
+    def identify_language(self, audio_file, use_cache=True, details=None):
+        """
+        Identify the spoken language from a few short windows of the audio.
+
+        Local Whisper runs detect_language on the log-mel spectrogram of each
+        window (no decoding pass); the OpenAI API transcribes a single 30 s
+        clip, since every window is a billed request. The answer is cached by
+        the audio fingerprint.
+
+        Args:
+            audio_file (str): Path to the audio file
+            use_cache (bool): Whether to reuse a cached answer
+            details (dict, optional): Filled with language, confidence, method and
+                                      'api_clips' (seconds and characters of each
+                                      billed API clip, for cost tracking)
+
+        Returns:
+            str: Language code, or None if it could not be identified
+        """
+        if not self.config.get('enable_language_id', True) or not AUDIO_CHUNKER_AVAILABLE:
+            return None
+        if not self.load_model():
+            return None
+
+        api_clips = []
+        if self.provider == 'openai':
+            windows = 1
+            detect_window = lambda path, start, seconds: self._detect_window_language_openai(
+                path, start, seconds, api_clips)
+        else:
+            windows = int(self.config.get('language_id_windows', 3))
+            detect_window = self._detect_window_language_whisper
+
+        cache = transcript_cache if self.config.get('enable_transcript_cache', True) else None
+        identifier = LanguageIdentifier(windows=windows, window_seconds=30.0, cache=cache)
+        method = f"{self.provider}:{self.model_name}"
+        try:
+            language, confidence = identifier.identify(
+                audio_file, self._get_audio_duration(audio_file), detect_window,
+                method=method, use_cache=use_cache
+            )
+        except Exception as e:
+            logger.warning(f"Language identification failed for {audio_file}: {e}")
+            return None
+        finally:
+            # Clips are billed even when identification fails
+            if details is not None:
+                details['api_clips'] = api_clips
+
+        # Only pass ISO codes on (verbose_json and text detection can report names)
+        if language and len(language) != 2:
+            logger.warning(f"Identified language {language} is not a language code, ignoring it")
+            return None
+        if details is not None and language:
+            details.update(language=language, confidence=confidence, method=method)
+        return language
+
+    def _detect_window_language_whisper(self, audio_file, start, seconds):
+        """Language probabilities for one window from Whisper's language head."""
+        samples = decode_pcm(audio_file, start, seconds, 16000)
+        if not len(samples):
+            return None
+        audio = whisper.pad_or_trim(samples.astype('float32') / 32768.0)
+        mel = whisper.log_mel_spectrogram(audio, n_mels=self.model.dims.n_mels).to(self.model.device)
+        _, probabilities = self.model.detect_language(mel)
+        return probabilities
+
+    def _detect_window_language_openai(self, audio_file, start, seconds, api_clips=None):
+        """
+        Language of one window, from an API transcription of a short clip.
+
+        Each request is appended to api_clips as {'seconds', 'characters'} so
+        the caller can bill it.
+        """
+        with tempfile.TemporaryDirectory(prefix='language_id_') as temp_dir:
+            clip_path = os.path.join(temp_dir, 'window.mp3')
+            if not AudioChunker.export_chunk(audio_file, start, start + seconds, clip_path,
+                                             format='mp3', bitrate='64k'):
+                return None
+            result = self._transcribe_with_openai(clip_path)
+        if api_clips is not None:
+            api_clips.append({'seconds': seconds, 'characters': len((result or {}).get('text', ''))})
+        if not result or not result.get('text', '').strip():
+            return None
+
+        # verbose_json reports language names rather than codes
+        language = result.get('language') or 'unknown'
+        if len(language) != 2:
+            language = self._detect_language_from_text(result['text'])
+        return {language: 1.0} if language and language != 'unknown' else None
+
+    def transcribe_segment(self, audio_file, language=None):
+        """
+        Transcribe a short audio file with the configured engine only.
+        
+        No caching, voice activity detection, chunking or correction; used
+        for segments of a download that is still in progress.
+        
+        Args:
+            audio_file (str): Path to the audio segment
+            language (str, optional): Language code (None to auto-detect)
+            
+        Returns:
+            dict: Raw result (text, language, duration, segments as dicts), or None
+        """
+        if not self.load_model():
+            return None
+        
+        if self.provider == 'openai':
+            result = self._transcribe_with_openai(audio_file, language)
+        else:
+            transcribe_options = {"fp16": False, "task": "transcribe"}
+            if language:
+                transcribe_options["language"] = language
+            result = self._whisper_transcribe(audio_file, transcribe_options)
+        if not result:
+            return None
+        
+        result = dict(result)
+        result["segments"] = [
+            segment if isinstance(segment, dict) else
+            (segment.model_dump() if hasattr(segment, 'model_dump') else dict(segment))
+            for segment in (result.get("segments") or [])
+        ]
+        return result
+    
+    def _transcribe_cached(self, audio_file, language, options, transcribe_func, use_cache=True):
+        """
+        Return a cached raw transcription of the audio, or run and cache one.
+        
+        The key covers the audio contents, provider, model, language, options
+        and voice activity settings, so identical audio under another Space
+        ID or a re-upload reuses the earlier result. Cached results are raw
+        engine output; corrective filtering is applied after. Anything that
+        changes the raw text (such as timecodes written by chunked local
+        transcription) must be part of options.
+        
+        Args:
+            audio_file (str): Path to the audio file
+            language (str, optional): Requested language
+            options (dict): Other settings that change the output
+            transcribe_func (callable): Runs the transcription, returns a result
+            use_cache (bool): Whether to read from the cache (results are still stored)
+            
+        Returns:
+            dict: Raw transcription result; 'cached' is True on a cache hit
+        """
+        if transcript_cache is None or not self.config.get('enable_transcript_cache', True):
+            return transcribe_func()
+        
+        key = None
+        try:
+            key_options = dict(options)
+            if VAD_AVAILABLE and self.config.get('enable_vad', False):
+                key_options['vad_min_savings'] = self.config.get('vad_min_savings', 0.05)
+            key = transcript_cache.make_key(audio_file, self.provider, self.model_name, language, key_options)
+            
+            if use_cache:
+                cached = transcript_cache.get(key)
+                if cached:
+                    logger.info(f"[TRANSCRIPTION] Using cached transcription for {audio_file} "
+                                f"({len(cached.get('segments', []))} segments)")
+                    cached["cached"] = True
+                    return cached
+        except Exception as e:
+            logger.warning(f"Transcript cache lookup failed: {e}")
+        
+        result = transcribe_func()
+        
+        if key and result and result.get("text"):
+            transcript_cache.put(key, result, metadata={
+                'provider': self.provider,
+                'model': self.model_name,
+                'language': language,
+                'audio_file': os.path.basename(audio_file)
+            })
+        return result
+    
+    def _transcribe_speech_only(self, audio_file, transcribe_func, format='wav', bitrate=None):
+        """
+        Run a transcription on only the speech in a recording.
+        
+        When enable_vad is set, silence and other dead air are cut out before
+        transcribe_func runs, and the result's segments are mapped back to
+        times in the original recording. If nothing worth skipping is found,
+        or detection fails, the original file is transcribed.
+        
+        Args:
+            audio_file (str): Path to the audio file
+            transcribe_func (callable): Takes a path, returns a transcription result
+            format (str): Format for the condensed file ('wav' for Whisper, 'mp3' for the API)
+            bitrate (str, optional): Bitrate for the condensed file
+            
+        Returns:
+            dict: Transcription result with original-recording timestamps
+        """
+        if not VAD_AVAILABLE or not self.config.get('enable_vad', False):
+            return transcribe_func(audio_file)
+        
+        with tempfile.TemporaryDirectory(prefix='vad_') as temp_dir:
+            try:
+                prepared = VoiceActivityDetector().condense_speech(
+                    audio_file, temp_dir, format=format, bitrate=bitrate,
+                    min_savings=float(self.config.get('vad_min_savings', 0.05))
+                )
+            except Exception as e:
+                logger.warning(f"Voice activity detection failed, transcribing the whole file: {e}")
+                prepared = None
+            
+            if not prepared:
+                return transcribe_func(audio_file)
+            
+            condensed_path, time_map = prepared
+            logger.info(f"[TRANSCRIPTION] Skipping {time_map.removed_seconds:.1f}s of non-speech "
+                        f"({time_map.removed_seconds / time_map.original_duration:.0%})")
+            result = transcribe_func(condensed_path)
+        
+        if not result:
+            return result
+        
+        # verbose_json responses carry segment objects rather than dicts
+        segments = [segment.model_dump() if hasattr(segment, 'model_dump') else segment
+                    for segment in result.get("segments") or []]
+        # Timecoded text was built from condensed times; rebuild it from the mapped segments
+        timecoded = bool(segments) and result.get("text") == self._format_transcript_with_timecodes(segments)
+        result["segments"] = time_map.remap_segments(segments)
+        if result.get("words"):
+            # verbose_json with word granularity lists words beside the segments
+            result["words"] = time_map.remap_words(result["words"])
+        if timecoded:
+            result["text"] = self._format_transcript_with_timecodes(result["segments"])
+        result["duration"] = time_map.original_duration
+        result["speech_duration"] = time_map.speech_seconds
+        return result
+    
+    def _get_whisper_pool(self):
+        """
+        Get the local Whisper process pool, starting it on first use.
+        
+        The pool is only used for CPU transcription with more than one
+        worker; GPU runs and single-core machines keep using self.model.
+        
+        Returns:
+            WhisperPool: Running pool, or None to transcribe in-process
+        """
+        if self.provider != 'local' or not WHISPER_POOL_AVAILABLE or not AUDIO_CHUNKER_AVAILABLE:
+            return None
+        
+        with self._whisper_pool_lock:
+            if self._whisper_pool is not None:
+                return self._whisper_pool if self._whisper_pool.running else None
+            
+            device = self.device or getattr(getattr(self.model, 'device', None), 'type', None)
+            if device not in (None, 'cpu'):
+                self._whisper_pool = WhisperPool(self.model_name, self.device, workers=1)
+                return None
+            
+            pool = WhisperPool(
+                self.model_name,
+                device='cpu',
+                workers=int(self.config.get('local_workers', 0)),
+                threads_per_worker=int(self.config.get('local_threads_per_worker', 0))
+            )
+            self._whisper_pool = pool
+            if pool.workers < 2:
+                return None
+            
+            # Workers inherit the already-loaded model when fork is available
+            model = self.model if self.model is not None and not isinstance(self.model, str) else None
+            if not pool.start(model=model):
+                return None
+            return pool
+    
+    def _whisper_transcribe(self, audio_file, transcribe_options):
+        """
+        Run one local Whisper transcription, on the process pool if there is one.
+        
+        Args:
+            audio_file (str): Path to the audio file
+            transcribe_options (dict): Options for whisper's transcribe()
+            
+        Returns:
+            dict: Whisper result
+        """
+        pool = self._get_whisper_pool()
+        if pool:
+            return pool.transcribe_file(audio_file, transcribe_options)
+        return self.model.transcribe(audio_file, **transcribe_options)
+    
+    def close(self):
+        """Shut down the local Whisper process pool, if one was started."""
+        with self._whisper_pool_lock:
+            if self._whisper_pool is not None:
+                self._whisper_pool.close()
+                self._whisper_pool = None
+    
     def _transcribe_chunked(self, audio_file, transcribe_options, include_timecodes=False):
         """
-        Transcribe a large audio file by splitting it into chunks using pydub.
+        Transcribe a large audio file by splitting it into chunks.
         This prevents context loss that can occur with simple text chunking.
         
+        Chunks are cut by ffmpeg straight from the source file. With a local
+        Whisper pool they are transcribed in parallel and merged back in
+        order; otherwise one chunk is decoded and transcribed at a time.
+        Without ffmpeg the local path falls back to decoding the file with pydub.
+        
         Args:
             audio_file (str): Path to the audio file
             transcribe_options (dict): Options for transcription
@@ -1691,43 +2134,32 @@ Language code:"""
             dict: Combined transcription result
         """
         try:
-            logger.info(f"Loading audio file for chunking: {audio_file}")
-            audio = AudioSegment.from_file(audio_file)
-            
-            # Create chunks using pydub - this preserves audio boundaries
-            chunks = make_chunks(audio, self.chunk_length_ms)
-            logger.info(f"Split audio into {len(chunks)} chunks of {self.chunk_length_ms/1000:.1f}s each")
-            
             all_segments = []
             full_text_parts = []
             total_duration = 0
+            first_chunk_language = None
             
-            # Process each chunk
-            with tempfile.TemporaryDirectory() as temp_dir:
-                for i, chunk in enumerate(chunks):
-                    chunk_start_time = i * (self.chunk_length_ms / 1000.0)
-                    
-                    # Export chunk to temporary file
-                    chunk_file = os.path.join(temp_dir, f"chunk_{i:03d}.wav")
-                    chunk.export(chunk_file, format="wav")
-                    
-                    logger.info(f"Transcribing chunk {i+1}/{len(chunks)} (start: {chunk_start_time:.1f}s)")
-                    
-                    # Transcribe the chunk
-                    chunk_result = self.model.transcribe(chunk_file, **transcribe_options)
-                    
-                    # Adjust segment timestamps to account for chunk position
-                    if "segments" in chunk_result:
-                        for segment in chunk_result["segments"]:
-                            segment["start"] += chunk_start_time
-                            segment["end"] += chunk_start_time
-                            all_segments.append(segment)
-                    
-                    # Collect text
-                    if "text" in chunk_result and chunk_result["text"].strip():
-                        full_text_parts.append(chunk_result["text"].strip())
-                    
-                    total_duration += len(chunk) / 1000.0
+            for chunk, chunk_result in self._iter_local_chunk_results(audio_file, transcribe_options):
+                i = chunk['index']
+                chunk_start_time = chunk['start_seconds']
+                
+                # Whisper detects the language per call; keep the first chunk's
+                if i == 0:
+                    first_chunk_language = chunk_result.get("language")
+                
+                # Adjust segment timestamps to account for chunk position
+                if "segments" in chunk_result:
+                    for segment in chunk_result["segments"]:
+                        segment["start"] += chunk_start_time
+                        segment["end"] += chunk_start_time
+                        all_segments.append(segment)
+                
+                # Collect text
+                if "text" in chunk_result and chunk_result["text"].strip():
+                    full_text_parts.append(chunk_result["text"].strip())
+                
+                total_duration += chunk['duration_seconds']
+                self._report_progress(i + 1, chunk['count'])
             
             # Combine results
             text_output = " ".join(full_text_parts)
@@ -1743,13 +2175,9 @@ Language code:"""
                 "language": transcribe_options.get("language", "unknown")
             }
             
-            # Try to get language from first chunk if not specified
-            if combined_result["language"] == "unknown" and all_segments:
-                # Use the language detected in the first chunk
-                first_chunk_file = os.path.join(temp_dir, "chunk_000.wav")
-                if os.path.exists(first_chunk_file):
-                    detection_result = self.model.transcribe(first_chunk_file, task="transcribe")
-                    combined_result["language"] = detection_result.get("language", "unknown")
+            # Use the language detected in the first chunk if not specified
+            if combined_result["language"] in (None, "unknown") and first_chunk_language:
+                combined_result["language"] = first_chunk_language
             
             logger.info(f"Chunked transcription completed: {len(all_segments)} segments, {total_duration:.1f}s total")
             return combined_result
@@ -1758,4 +2186,73 @@ Language code:"""
             logger.error(f"Error in chunked transcription: {e}")
             # Fallback to regular transcription
             logger.info("Falling back to regular transcription")
-            return self.model.transcribe(audio_file, **transcribe_options)
\ No newline at end of file
+            return self._whisper_transcribe(audio_file, transcribe_options)
+    
+    def _iter_local_chunk_results(self, audio_file, transcribe_options):
+        """
+        Transcribe fixed-length chunks with local Whisper, in timeline order.
+        
+        Args:
+            audio_file (str): Path to the audio file
+            transcribe_options (dict): Options for transcription
+            
+        Returns:
+            iterator: (chunk, result) pairs; chunks carry index, count,
+                      start_seconds and duration_seconds
+        """
+        pool = self._get_whisper_pool()
+        if pool:
+            chunk_seconds = self.chunk_length_ms / 1000.0
+            # Fixed cuts keep chunk starts on the chunk grid like make_chunks did
+            chunks = AudioChunker().plan_chunks(audio_file, chunk_seconds, min_chunk_seconds=0, find_breaks=False)
+            logger.info(f"Transcribing {len(chunks)} chunks of {chunk_seconds:.1f}s on {pool.workers} workers")
+            for chunk, chunk_result in pool.map_chunks(audio_file, chunks, transcribe_options):
+                yield dict(chunk, count=len(chunks)), chunk_result
+            return
+        
+        for chunk in self._iter_local_chunks(audio_file):
+            logger.info(f"Transcribing chunk {chunk['index']+1}/{chunk['count']} (start: {chunk['start_seconds']:.1f}s)")
+            yield chunk, self.model.transcribe(chunk['path'], **transcribe_options)
+    
+    def _iter_local_chunks(self, audio_file):
+        """
+        Yield fixed-length WAV chunks of an audio file for local Whisper.
+        
+        Args:
+            audio_file (str): Path to the audio file
+            
+        Returns:
+            iterator: Dicts with index, count, path, start_seconds and duration_seconds
+        """
+        chunk_seconds = self.chunk_length_ms / 1000.0
+        
+        if AUDIO_CHUNKER_AVAILABLE:
+            chunker = AudioChunker()
+            # Fixed cuts keep chunk starts on the chunk grid like make_chunks did
+            chunks = chunker.plan_chunks(audio_file, chunk_seconds, min_chunk_seconds=0, find_breaks=False)
+            logger.info(f"Split audio into {len(chunks)} chunks of {chunk_seconds:.1f}s each")
+            # Whisper resamples to 16 kHz mono anyway, so write that directly
+            for chunk in chunker.iter_chunks(audio_file, chunk_seconds, format='wav', sample_rate=16000,
+                                             channels=1, chunks=chunks):
+                yield dict(chunk, count=len(chunks))
+            return
+        
+        logger.info(f"Loading audio file for chunking: {audio_file}")
+        audio = AudioSegment.from_file(audio_file)
+        
+        # Create chunks using pydub - this preserves audio boundaries
+        chunks = make_chunks(audio, self.chunk_length_ms)
+        logger.info(f"Split audio into {len(chunks)} chunks of {chunk_seconds:.1f}s each")
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for i, chunk in enumerate(chunks):
+                chunk_file = os.path.join(temp_dir, f"chunk_{i:03d}.wav")
+                chunk.export(chunk_file, format="wav")
+                yield {
+                    'index': i,
+                    'count': len(chunks),
+                    'path': chunk_file,
+                    'start_seconds': i * chunk_seconds,
+                    'duration_seconds': len(chunk) / 1000.0
+                }
+                os.unlink(chunk_file)
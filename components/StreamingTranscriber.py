@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+# components/StreamingTranscriber.py
+"""
+Streaming Transcriber Component for XSpace Downloader
+
+Transcribes a Space while it is still downloading. The downloader's growing
+.part file is tailed into a single ffmpeg process that decodes it and cuts
+16 kHz mono WAV segments of a fixed length. Each completed segment is
+transcribed as soon as it exists, and the partial transcript (with absolute
+[HH:MM:SS] timecodes) is published to live_transcripts/<space_id>.json.
+
+When the download finishes, finalise() transcribes the remaining audio,
+retries any segment that failed while streaming, shifts timestamps by the
+leading silence the downloader trimmed, and stores the complete raw
+result. A later transcription job for the Space uses it instead of
+transcribing the file again. If a segment still fails, or finalise() runs
+out of time, there is no streamed result and the job transcribes the whole
+file as usual.
+
+Usage Examples:
+
+    from components.StreamingTranscriber import StreamingTranscriber
+
+    streamer = StreamingTranscriber('1lDxLnrWjwkGm', ['downloads/1lDxLnrWjwkGm.m4a.part'])
+    streamer.start()
+    ...                                  # download runs
+    streamer.finish_input()              # yt-dlp exited
+    result = streamer.finalise(offset_seconds=trimmed_seconds)
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('streaming_transcriber')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+DEFAULT_LIVE_DIR = './live_transcripts'
+
+READ_BLOCK_SIZE = 256 * 1024
+
+
+def format_timecoded(segments: List[Dict]) -> str:
+    """Format segments as "[HH:MM:SS] text" lines."""
+    lines = []
+    for segment in segments:
+        text = (segment.get('text') or '').strip()
+        if not text:
+            continue
+        start = max(0.0, float(segment.get('start') or 0))
+        lines.append(f"[{int(start // 3600):02d}:{int(start % 3600 // 60):02d}:{int(start % 60):02d}] {text}")
+    return '\n'.join(lines)
+
+
+def load_live_transcript(space_id: str, live_dir: str = DEFAULT_LIVE_DIR) -> Optional[Dict]:
+    """
+    Read the published live transcript for a Space.
+
+    Args:
+        space_id (str): Space ID
+        live_dir (str): Directory of live transcripts
+
+    Returns:
+        dict: Live transcript data, or None if there is none
+    """
+    path = Path(live_dir) / f"{space_id}.json"
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _wav_seconds(path: str) -> float:
+    """Duration of a finished WAV segment."""
+    with wave.open(path, 'rb') as wav:
+        return wav.getnframes() / float(wav.getframerate() or 1)
+
+
+class StreamingTranscriber:
+    """Transcribes a growing download in fixed-length segments as they arrive."""
+
+    def __init__(self, space_id: str, source_candidates: List[str],
+                 transcribe_func: Optional[Callable] = None, segment_seconds: float = 60.0,
+                 language: Optional[str] = None, max_workers: int = 2,
+                 live_dir: str = DEFAULT_LIVE_DIR, poll_interval: float = 1.0,
+                 start_timeout: float = 600.0, finalise_timeout: Optional[float] = 300.0):
+        """
+        Initialize the streaming transcriber.
+
+        Args:
+            space_id (str): Space being downloaded
+            source_candidates (list): Paths the growing download may appear at;
+                                      the first one that exists is followed
+            transcribe_func (callable, optional): transcribe_func(path, language) -> raw
+                                                  result dict (default: SpeechToText.transcribe_segment)
+            segment_seconds (float): Length of each transcribed segment
+            language (str, optional): Language code; detected from the first segment if None
+            max_workers (int): Segments transcribed at the same time
+            live_dir (str): Directory for published live transcripts
+            poll_interval (float): Seconds between checks for new data
+            start_timeout (float): Give up if no download file appears within this time
+            finalise_timeout (float, optional): Default limit on the seconds finalise()
+                                                waits for remaining segments (None: no limit)
+        """
+        self.space_id = space_id
+        self.source_candidates = [str(path) for path in source_candidates]
+        self.transcribe_func = transcribe_func
+        self.segment_seconds = float(segment_seconds)
+        self.language = language
+        self.max_workers = max(1, int(max_workers))
+        self.live_dir = Path(live_dir)
+        self.poll_interval = poll_interval
+        self.start_timeout = start_timeout
+        self.finalise_timeout = finalise_timeout
+
+        self.segments = []
+        self.status = 'pending'
+        self.error = None
+        self.audio_seconds = 0.0
+        self._failed = []
+        self._segment_dir = None
+        self._ffmpeg = None
+        self._input_finished = threading.Event()
+        self._stopped = threading.Event()
+        self._feed_thread = None
+        self._transcribe_thread = None
+        self._lock = threading.Lock()
+
+    def _default_transcribe_func(self):
+        """Build a transcribe function from the configured SpeechToText engine."""
+        from components.SpeechToText import SpeechToText
+        stt = SpeechToText()
+        if not stt.load_model():
+            raise RuntimeError(f"Could not load {stt.provider} transcription model")
+        return stt.transcribe_segment
+
+    def start(self) -> bool:
+        """
+        Start following the download in background threads.
+
+        Returns:
+            bool: True if streaming started
+        """
+        if not shutil.which('ffmpeg'):
+            logger.warning("ffmpeg not found, streaming transcription disabled")
+            return False
+        try:
+            if self.transcribe_func is None:
+                self.transcribe_func = self._default_transcribe_func()
+        except Exception as e:
+            logger.error(f"Streaming transcription unavailable for {self.space_id}: {e}")
+            return False
+
+        self._segment_dir = tempfile.mkdtemp(prefix=f'stream_{self.space_id}_')
+        self.status = 'streaming'
+        self._publish()
+
+        self._feed_thread = threading.Thread(target=self._feed, name=f'stream-feed-{self.space_id}', daemon=True)
+        self._transcribe_thread = threading.Thread(target=self._transcribe_segments,
+                                                   name=f'stream-stt-{self.space_id}', daemon=True)
+        self._feed_thread.start()
+        self._transcribe_thread.start()
+        logger.info(f"Streaming transcription started for {self.space_id} ({self.segment_seconds:.0f}s segments)")
+        return True
+
+    def finish_input(self):
+        """Signal that the download is complete; the rest of the file is read and the input closed."""
+        self._input_finished.set()
+
+    def stop(self, error: Optional[str] = None):
+        """Abandon streaming (for example when the download fails)."""
+        self._stopped.set()
+        self._input_finished.set()
+        if self._ffmpeg and self._ffmpeg.poll() is None:
+            self._ffmpeg.kill()
+        self.status = 'failed'
+        self.error = error or 'Streaming transcription stopped'
+        self._publish()
+        if not (self._transcribe_thread and self._transcribe_thread.is_alive()):
+            self._cleanup()
+
+    def _find_source(self) -> Optional[str]:
+        """Wait for one of the candidate download paths to appear."""
+        deadline = time.time() + self.start_timeout
+        while not self._stopped.is_set() and time.time() < deadline:
+            for candidate in self.source_candidates:
+                if os.path.exists(candidate):
+                    return candidate
+            if self._input_finished.is_set():
+                return None
+            time.sleep(self.poll_interval)
+        return None
+
+    def _feed(self):
+        """Tail the growing download into ffmpeg, which cuts WAV segments."""
+        source = self._find_source()
+        if not source:
+            self.error = 'Download file never appeared'
+            logger.warning(f"Streaming transcription for {self.space_id}: no download file appeared")
+            return
+
+        command = [
+            'ffmpeg', '-v', 'error', '-nostdin', '-i', 'pipe:0', '-vn', '-ac', '1', '-ar', '16000',
+            '-f', 'segment', '-segment_time', str(self.segment_seconds), '-reset_timestamps', '1',
+            os.path.join(self._segment_dir, 'segment_%05d.wav')
+        ]
+        self._ffmpeg = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.PIPE)
+        try:
+            # The open handle keeps reading even after yt-dlp renames the .part file
+            with open(source, 'rb') as f:
+                while not self._stopped.is_set():
+                    block = f.read(READ_BLOCK_SIZE)
+                    if block:
+                        self._ffmpeg.stdin.write(block)
+                        continue
+                    if self._input_finished.is_set():
+                        # One more read catches data written just before the signal
+                        block = f.read()
+                        if block:
+                            self._ffmpeg.stdin.write(block)
+                        break
+                    time.sleep(self.poll_interval)
+        except (BrokenPipeError, OSError) as e:
+            stderr = self._ffmpeg.stderr.read().decode('utf-8', 'replace') if self._ffmpeg.stderr else ''
+            self.error = f"Could not decode download while streaming: {stderr.strip() or e}"
+            logger.warning(f"Streaming transcription for {self.space_id}: {self.error}")
+        finally:
+            try:
+                self._ffmpeg.stdin.close()
+            except OSError:
+                pass
+            self._ffmpeg.wait()
+
+    def _ready_segments(self, done: int) -> List[str]:
+        """Segment files numbered `done` and up that ffmpeg has finished writing."""
+        files = sorted(Path(self._segment_dir).glob('segment_*.wav'))
+        # The newest file is still being written until the feed (and ffmpeg) has exited
+        feed_done = self._feed_thread is not None and not self._feed_thread.is_alive()
+        complete = files if feed_done else files[:-1]
+        return [str(path) for path in complete if int(path.stem.split('_')[1]) >= done]
+
+    def _transcribe_one(self, path: str, offset: float, language: Optional[str]) -> List[Dict]:
+        """Transcribe one segment and shift its timestamps to the whole recording."""
+        result = self.transcribe_func(path, language)
+        if not result:
+            raise RuntimeError(f"No result for {os.path.basename(path)}")
+        if not self.language and len(str(result.get('language', ''))) == 2:
+            self.language = result['language']
+
+        segments = []
+        for segment in result.get('segments') or []:
+            if not isinstance(segment, dict):
+                segment = segment.model_dump() if hasattr(segment, 'model_dump') else dict(segment)
+            segments.append({
+                'start': float(segment.get('start') or 0) + offset,
+                'end': float(segment.get('end') or 0) + offset,
+                'text': (segment.get('text') or '').strip()
+            })
+        if not segments and (result.get('text') or '').strip():
+            segments = [{'start': offset, 'end': offset + _wav_seconds(path), 'text': result['text'].strip()}]
+        return segments
+
+    def _transcribe_segments(self):
+        """Transcribe finished segments in order as they appear, publishing progress."""
+        done = 0
+        offset = 0.0
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while not self._stopped.is_set():
+                ready = self._ready_segments(done)
+                if not ready:
+                    if not self._feed_thread.is_alive() and not self._ready_segments(done):
+                        break
+                    time.sleep(self.poll_interval)
+                    continue
+
+                # Until the language is known, transcribe one segment at a time
+                batch = ready if self.language else ready[:1]
+                batch = batch[:self.max_workers * 2]
+                offsets = []
+                for path in batch:
+                    offsets.append(offset)
+                    offset += _wav_seconds(path)
+                futures = [executor.submit(self._transcribe_one, path, start, self.language)
+                           for path, start in zip(batch, offsets)]
+
+                for path, start, future in zip(batch, offsets, futures):
+                    try:
+                        segments = future.result()
+                    except Exception as e:
+                        # Keep the file; finalise() retries it so the transcript has no gap
+                        logger.error(f"Streaming transcription of {os.path.basename(path)} failed: {e}")
+                        with self._lock:
+                            self._failed.append((path, start))
+                            self.audio_seconds = start + _wav_seconds(path)
+                        done += 1
+                        continue
+                    with self._lock:
+                        self.segments.extend(segments)
+                        self.audio_seconds = start + _wav_seconds(path)
+                    done += 1
+                    try:
+                        os.unlink(path)
+                    except OSError:
+                        pass
+                self._publish()
+        finally:
+            executor.shutdown(wait=True)
+            if self._stopped.is_set():
+                self._cleanup()
+
+    def _retry_failed(self, deadline: Optional[float] = None) -> bool:
+        """Transcribe segments that failed while streaming once more; False if any still fails."""
+        for path, start in self._failed:
+            if deadline is not None and time.monotonic() >= deadline:
+                self.error = f"No time left to retry {os.path.basename(path)}"
+                return False
+            try:
+                segments = self._transcribe_one(path, start, self.language)
+            except Exception as e:
+                self.error = f"Segment {os.path.basename(path)} could not be transcribed: {e}"
+                logger.error(f"Streaming transcription for {self.space_id}: {self.error}")
+                return False
+            with self._lock:
+                self.segments.extend(segments)
+        with self._lock:
+            self.segments.sort(key=lambda segment: segment['start'])
+            self._failed = []
+        return True
+
+    def finalise(self, offset_seconds: float = 0.0, timeout: Optional[float] = None) -> Optional[Dict]:
+        """
+        Finish transcribing and publish the complete result.
+
+        Args:
+            offset_seconds (float): Leading audio trimmed from the final file;
+                                    timestamps move back by this much
+            timeout (float, optional): Maximum seconds to wait for remaining segments
+                                       (default: finalise_timeout)
+
+        Returns:
+            dict: Raw result (text, language, duration, segments), or None if streaming
+                  failed, a segment could not be transcribed, or the timeout expired
+        """
+        self.finish_input()
+        timeout = self.finalise_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        for thread in (self._feed_thread, self._transcribe_thread):
+            if thread:
+                thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+        timed_out = bool(self._transcribe_thread and self._transcribe_thread.is_alive())
+        if timed_out:
+            self.error = f"Streaming transcription did not finish within {timeout:.0f}s"
+        if timed_out or self._stopped.is_set() or not self._retry_failed(deadline) or not self.segments:
+            self.status = 'failed'
+            self.error = self.error or 'Streaming transcription produced no result'
+            self._publish()
+            if timed_out:
+                # The transcribe thread removes the segment files once it sees the stop
+                self._stopped.set()
+                if self._ffmpeg and self._ffmpeg.poll() is None:
+                    self._ffmpeg.kill()
+            else:
+                self._cleanup()
+            return None
+
+        segments = []
+        for segment in self.segments:
+            if segment['end'] <= offset_seconds:
+                continue
+            segments.append({
+                'start': max(0.0, segment['start'] - offset_seconds),
+                'end': segment['end'] - offset_seconds,
+                'text': segment['text']
+            })
+
+        result = {
+            'text': ' '.join(segment['text'] for segment in segments if segment['text']),
+            'language': self.language or 'unknown',
+            'duration': max(0.0, self.audio_seconds - offset_seconds),
+            'segments': segments
+        }
+        with self._lock:
+            self.segments = segments
+        self.status = 'completed'
+        self._publish(result)
+        self._cleanup()
+        logger.info(f"Streaming transcription finalised for {self.space_id}: "
+                    f"{len(segments)} segments, {result['duration']:.0f}s, {result['language']}")
+        return result
+
+    def _publish(self, result: Optional[Dict] = None):
+        """Atomically write the live transcript file."""
+        with self._lock:
+            data = {
+                'space_id': self.space_id,
+                'status': self.status,
+                'language': self.language,
+                'audio_seconds': round(self.audio_seconds, 1),
+                'segment_count': len(self.segments),
+                'text': format_timecoded(self.segments),
+                'error': self.error,
+                'updated_at': datetime.now().isoformat()
+            }
+        if result is not None:
+            data['result'] = result
+        try:
+            self.live_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=str(self.live_dir), prefix='.tmp-')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.live_dir / f"{self.space_id}.json")
+        except OSError as e:
+            logger.warning(f"Could not publish live transcript for {self.space_id}: {e}")
+
+    def _cleanup(self):
+        """Remove the temporary segment directory."""
+        if self._segment_dir:
+            shutil.rmtree(self._segment_dir, ignore_errors=True)
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# components/Summarizer.py
+"""
+Summarizer Component for XSpace Downloader
+
+Summarizes long transcripts with a map-reduce over the AI provider:
+
+- Map: the transcript is cut into sections sized by a token budget, at line
+  boundaries, and every section is summarized concurrently under the
+  provider's shared request and token budgets (see TranslationExecutor)
+- Reduce: section summaries are grouped into prompts of the same budget and
+  summarized again, level by level, until they fit into one final prompt
+  that is summarized to the requested length and language
+
+Section and intermediate summaries are cached by a hash of their input, so a
+re-summary of the same transcript at another length or in another language
+only pays for the final call. Transcripts that fit into one section are
+summarized with a single call, as before.
+
+The provider call is passed in as a function with the provider summary()
+signature.
+
+Usage Examples:
+
+    from components.Summarizer import Summarizer
+    from components.TranslationExecutor import get_translation_executor
+
+    summarizer = Summarizer(provider.summary, model='openai/gpt-4o-mini',
+                            executor=get_translation_executor('openai'))
+    success, result = summarizer.summarize(transcript_text, max_length=200)
+"""
+
+import hashlib
+import threading
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from components.TranslationExecutor import CHARS_PER_TOKEN, TranslationExecutor, merge_usage, response_text
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('summarizer')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# Bump when the sectioning or section summary length changes so cached summaries are not reused
+SUMMARY_VERSION = 1
+
+# Approximate transcript tokens per map section (and per reduce prompt)
+SECTION_TOKENS = 3000
+
+# Words per section and intermediate summary
+SECTION_WORDS = 150
+
+# Share of the progress bar taken by the map step; reduce levels take it to 95 and the final call to 100
+MAP_PROGRESS = 80
+
+SummaryResult = Tuple[bool, Union[str, Dict]]
+
+
+def split_sections(text: str, section_chars: int) -> List[str]:
+    """
+    Cut a transcript into sections of about section_chars characters.
+
+    Sections end at line breaks; a single line longer than a section is cut at
+    whitespace.
+
+    Args:
+        text (str): Transcript text
+        section_chars (int): Target maximum characters per section
+
+    Returns:
+        list: Section texts in transcript order
+    """
+    pieces = []
+    for line in (text or '').split('\n'):
+        line = line.strip()
+        while len(line) > section_chars:
+            cut = line.rfind(' ', section_chars // 2, section_chars)
+            cut = cut if cut > 0 else section_chars
+            pieces.append(line[:cut].strip())
+            line = line[cut:].strip()
+        if line:
+            pieces.append(line)
+
+    sections = []
+    current = []
+    length = 0
+    for piece in pieces:
+        if current and length + len(piece) + 1 > section_chars:
+            sections.append('\n'.join(current))
+            current = []
+            length = 0
+        current.append(piece)
+        length += len(piece) + 1
+    if current:
+        sections.append('\n'.join(current))
+    return sections
+
+
+def _usage(prompt: str, result: Union[str, Dict]) -> Dict[str, int]:
+    """Token usage of one call, estimated from the text when the provider did not report it."""
+    usage = merge_usage([result])
+    if not usage['total_tokens']:
+        usage['input_tokens'] = len(prompt) // CHARS_PER_TOKEN
+        usage['output_tokens'] = len(response_text(result)) // CHARS_PER_TOKEN
+        usage['total_tokens'] = usage['input_tokens'] + usage['output_tokens']
+    return usage
+
+
+class Summarizer:
+    """Map-reduce summarization with concurrent, cached section summaries."""
+
+    def __init__(self, summarize: Callable[..., SummaryResult], model: str = '',
+                 executor: Optional[TranslationExecutor] = None, section_tokens: int = SECTION_TOKENS,
+                 section_words: int = SECTION_WORDS, cache=None):
+        """
+        Initialize the summarizer.
+
+        Args:
+            summarize (callable): summarize(content, max_length, language) -> (success, result),
+                                  one provider call
+            model (str): Provider and model (part of the cache key)
+            executor (TranslationExecutor, optional): Provider executor for concurrent calls
+            section_tokens (int): Approximate tokens per section and per reduce prompt
+            section_words (int): Words per section and intermediate summary
+            cache (TranscriptCache, optional): Cache for section and intermediate summaries
+        """
+        self.summarize_call = summarize
+        self.model = model
+        self.executor = executor or TranslationExecutor(name='summary')
+        self.section_chars = max(2000, int(section_tokens) * CHARS_PER_TOKEN)
+        self.section_words = max(20, int(section_words))
+        self.cache = cache
+
+    def _cache_key(self, text: str) -> str:
+        """Hash everything that affects a section summary."""
+        material = '\x00'.join([str(SUMMARY_VERSION), self.model, str(self.section_words), text])
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _summarize_all(self, texts: List[str], description: str,
+                       on_done: Callable[[], None]) -> Tuple[Optional[List[str]], Dict[str, int], int]:
+        """
+        Summarize texts concurrently to section_words each, using the cache.
+
+        Returns:
+            tuple: (summaries in order or None if any failed, usage of the calls made, cache hits)
+        """
+        keys = [self._cache_key(text) for text in texts]
+        summaries = [None] * len(texts)
+        if self.cache is not None:
+            for index, key in enumerate(keys):
+                cached = self.cache.get(key)
+                if cached and cached.get('text'):
+                    summaries[index] = cached['text']
+                    on_done()
+
+        missing = [index for index, summary in enumerate(summaries) if summary is None]
+
+        def summarize_one(_, index):
+            result = self.summarize_call(texts[index], self.section_words, None)
+            on_done()
+            return result
+
+        results = self.executor.run(missing, summarize_one,
+                                    estimate_tokens=lambda index: len(texts[index]) // CHARS_PER_TOKEN
+                                    + self.section_words * 2,
+                                    description=description)
+
+        usages = []
+        failed = 0
+        for index, (success, result) in zip(missing, results):
+            text = response_text(result).strip() if success else ''
+            if not text:
+                failed += 1
+                continue
+            summaries[index] = text
+            usages.append(_usage(texts[index], result))
+            if self.cache is not None:
+                self.cache.put(keys[index], {'text': text}, metadata={'model': self.model, 'kind': 'summary'})
+
+        usage = merge_usage([{'usage': usage} for usage in usages])
+        if failed:
+            logger.error(f"{description}: {failed} of {len(texts)} summaries failed")
+            return None, usage, len(texts) - len(missing)
+        return summaries, usage, len(texts) - len(missing)
+
+    def _group(self, summaries: List[str]) -> List[str]:
+        """Pack summaries into reduce prompts of at most section_chars characters."""
+        return split_sections('\n'.join(summary.replace('\n', ' ') for summary in summaries), self.section_chars)
+
+    def summarize(self, text: str, max_length: Optional[int] = None, language: Optional[str] = None,
+                  on_progress: Optional[Callable[[int, str], None]] = None) -> SummaryResult:
+        """
+        Summarize a transcript.
+
+        Args:
+            text (str): Transcript text
+            max_length (int, optional): Summary length in words
+            language (str, optional): Language for the summary output
+            on_progress (callable, optional): on_progress(percent, stage), called from worker threads
+
+        Returns:
+            Tuple[bool, Union[str, Dict]]: Success flag and {'content', 'usage', 'sections',
+                'cached_sections'} or an error dict
+        """
+        if not text or not text.strip():
+            return False, {"error": "No content provided for summarization"}
+
+        def report(percent, stage):
+            if on_progress:
+                try:
+                    on_progress(int(percent), stage)
+                except Exception as e:
+                    logger.warning(f"Summary progress callback failed: {e}")
+
+        sections = split_sections(text, self.section_chars)
+        if len(sections) <= 1:
+            report(0, 'summarizing')
+            success, result = self.summarize_call(text, max_length, language)
+            if not success:
+                return success, result
+            report(100, 'completed')
+            return True, {'content': response_text(result), 'usage': _usage(text, result),
+                          'sections': 1, 'cached_sections': 0}
+
+        lock = threading.Lock()
+        done = {'count': 0}
+
+        def section_done():
+            with lock:
+                done['count'] += 1
+                count = done['count']
+            report(MAP_PROGRESS * min(count, len(sections)) / len(sections), 'sections')
+
+        logger.info(f"[SUMMARY] Summarizing {len(text)} chars in {len(sections)} sections")
+        summaries, usage, cached = self._summarize_all(sections, '[SUMMARY] Section', section_done)
+        if summaries is None:
+            return False, {"error": "Summarization failed for part of the transcript"}
+        usages = [usage]
+
+        # Reduce level by level until the summaries fit into one prompt
+        level = 0
+        groups = self._group(summaries)
+        while 1 < len(groups) < len(summaries):
+            level += 1
+            report(MAP_PROGRESS + (95 - MAP_PROGRESS) * level / (level + 1), f'reduce {level}')
+            summaries, usage, _ = self._summarize_all(groups, f'[SUMMARY] Reduce {level} group', lambda: None)
+            if summaries is None:
+                return False, {"error": "Summarization failed while combining section summaries"}
+            usages.append(usage)
+            groups = self._group(summaries)
+
+        report(95, 'final')
+        combined = '\n\n'.join(summaries)
+        success, result = self.summarize_call(combined, max_length, language)
+        if not success:
+            return success, result
+        usages.append(_usage(combined, result))
+
+        logger.info(f"[SUMMARY] Done: {len(sections)} sections ({cached} cached), {level} reduce levels")
+        report(100, 'completed')
+        return True, {'content': response_text(result), 'usage': merge_usage([{'usage': u} for u in usages]),
+                      'sections': len(sections), 'cached_sections': cached}
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# components/SummaryJobs.py
+"""
+Summary Jobs Component for XSpace Downloader
+
+Runs transcript summaries in background threads so a web request returns at
+once with a job ID, and the page polls for progress.
+
+- Job state is a small JSON file per job (written atomically), so any web
+  worker process can answer a status request, like the transcript and
+  translation job files
+- A request for a summary that is already queued or running returns the
+  existing job instead of starting another one, whichever worker process
+  started it: a per-key pointer file, checked and replaced under a file
+  lock, names the job in flight
+- The process running a job rewrites its heartbeat every HEARTBEAT_INTERVAL
+  seconds; a queued or running job whose heartbeat is older than
+  STALE_AFTER_SECONDS (its worker was recycled or killed) is reported as
+  failed, so pages stop polling and the next request starts a new job
+- Finished job files are removed after a day
+
+Usage Examples:
+
+    from components.SummaryJobs import summary_jobs
+
+    job = summary_jobs.submit(f"transcript:{transcript_id}:200", run, {'transcript_id': transcript_id})
+    status = summary_jobs.get(job['job_id'])
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('summary_jobs')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# Finished jobs are kept this long for status polling
+JOB_RETENTION_SECONDS = 24 * 3600
+
+# Seconds between heartbeats of the jobs a process holds
+HEARTBEAT_INTERVAL = 15.0
+
+# Queued or running jobs without a heartbeat for this long have lost their worker
+STALE_AFTER_SECONDS = 120.0
+
+ACTIVE_STATUSES = ('pending', 'processing')
+
+_JOB_ID = re.compile(r'^[0-9a-f]{32}$')
+
+
+class SummaryJobs:
+    """Background summary jobs with file-backed status."""
+
+    def __init__(self, jobs_dir: str = 'summary_jobs', max_workers: int = 2,
+                 heartbeat_interval: float = HEARTBEAT_INTERVAL, stale_after: float = STALE_AFTER_SECONDS):
+        """
+        Initialize the job runner.
+
+        Args:
+            jobs_dir (str): Directory holding one JSON status file per job
+            max_workers (int): Summaries running at the same time in this process
+            heartbeat_interval (float): Seconds between heartbeats of this process's jobs
+            stale_after (float): Heartbeat age after which a job counts as abandoned
+        """
+        self.jobs_dir = Path(jobs_dir)
+        self.max_workers = max(1, int(max_workers))
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after
+        self._pool = None
+        self._jobs = {}
+        self._heartbeat = None
+        self._lock = threading.Lock()
+
+    def _path(self, job_id: str) -> Path:
+        """Path of a job's status file."""
+        return self.jobs_dir / f"{job_id}.json"
+
+    def _key_path(self, key: str) -> Path:
+        """Path of the file naming the job in flight for a key."""
+        return self.jobs_dir / f"key-{hashlib.sha1(key.encode('utf-8')).hexdigest()}"
+
+    def _write(self, job: Dict):
+        """Write a job's status file atomically."""
+        job['updated_at'] = time.time()
+        try:
+            self.jobs_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=str(self.jobs_dir), prefix='.tmp-')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(job, f, ensure_ascii=False)
+            os.replace(temp_path, self._path(job['job_id']))
+        except OSError as e:
+            logger.warning(f"Could not write summary job {job['job_id']}: {e}")
+
+    def _read(self, job_id: str) -> Optional[Dict]:
+        """Read a job's status file as written."""
+        try:
+            with open(self._path(job_id), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _fail_if_stale(self, job: Dict) -> Dict:
+        """Mark a queued or running job failed when its worker stopped sending heartbeats."""
+        if job.get('status') not in ACTIVE_STATUSES:
+            return job
+        heartbeat = job.get('heartbeat_at') or job.get('updated_at') or 0
+        if time.time() - heartbeat < self.stale_after:
+            return job
+        with self._lock:
+            if job['job_id'] in self._jobs:
+                # This process holds the job; its heartbeat is only late
+                return job
+        job.update({'status': 'failed', 'stage': 'failed',
+                    'error': 'Summary worker stopped responding; please try again'})
+        self._write(job)
+        logger.warning(f"Summary job {job['job_id']} lost its worker")
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """
+        Get a job's status.
+
+        Args:
+            job_id (str): Job ID from submit()
+
+        Returns:
+            dict: job_id, status ('pending', 'processing', 'completed', 'failed'), progress,
+                  stage, result or error, and the metadata given to submit(); None if unknown
+        """
+        if not job_id or not _JOB_ID.match(job_id):
+            return None
+        job = self._read(job_id)
+        return self._fail_if_stale(job) if job else None
+
+    def submit(self, key: str, run: Callable[[Callable[[int, str], None]], Dict],
+               metadata: Optional[Dict] = None) -> Dict:
+        """
+        Start a summary job, or return the one already running for the same key.
+
+        Args:
+            key (str): Identifies the summary (e.g. transcript and length) for deduplication
+            run (callable): run(on_progress) -> result dict; raises on failure
+            metadata (dict, optional): Extra fields stored in the status file
+
+        Returns:
+            dict: The job's status
+        """
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        key_path = self._key_path(key)
+
+        # Other worker processes submit too; the lock file makes check-and-claim atomic
+        with open(self.jobs_dir / '.submit.lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                try:
+                    job_id = key_path.read_text().strip()
+                except OSError:
+                    job_id = None
+                if job_id:
+                    job = self.get(job_id)
+                    if job and job.get('status') in ACTIVE_STATUSES:
+                        return job
+
+                now = time.time()
+                job = dict(metadata or {})
+                job.update({'job_id': uuid.uuid4().hex, 'status': 'pending', 'progress': 0, 'stage': 'queued',
+                            'created_at': now, 'heartbeat_at': now, 'pid': os.getpid()})
+                self._write(job)
+                key_path.write_text(job['job_id'])
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+        status = dict(job)
+        with self._lock:
+            self._jobs[job['job_id']] = (job, threading.Lock())
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='summary-job')
+            if self._heartbeat is None or not self._heartbeat.is_alive():
+                self._heartbeat = threading.Thread(target=self._send_heartbeats, name='summary-heartbeat',
+                                                   daemon=True)
+                self._heartbeat.start()
+            self._pool.submit(self._run, job, run)
+
+        self.prune()
+        return status
+
+    def _send_heartbeats(self):
+        """Refresh the heartbeat of every job this process holds, queued or running."""
+        while True:
+            time.sleep(self.heartbeat_interval)
+            with self._lock:
+                held = list(self._jobs.values())
+                if not held:
+                    self._heartbeat = None
+                    return
+            for job, state_lock in held:
+                with state_lock:
+                    if job['status'] in ACTIVE_STATUSES:
+                        job['heartbeat_at'] = time.time()
+                        self._write(job)
+
+    def _run(self, job: Dict, run: Callable):
+        """Run one job, keeping its status file up to date."""
+        with self._lock:
+            _, state_lock = self._jobs[job['job_id']]
+
+        def on_progress(percent, stage):
+            with state_lock:
+                # Progress only moves forward, whichever worker thread reports it
+                if percent >= job['progress']:
+                    job.update({'progress': percent, 'stage': stage, 'heartbeat_at': time.time()})
+                    self._write(job)
+
+        with state_lock:
+            job.update({'status': 'processing', 'stage': 'started', 'heartbeat_at': time.time()})
+            self._write(job)
+        try:
+            result = run(on_progress)
+            with state_lock:
+                job.update({'status': 'completed', 'progress': 100, 'stage': 'completed', 'result': result})
+                self._write(job)
+            logger.info(f"Summary job {job['job_id']} completed")
+        except Exception as e:
+            logger.error(f"Summary job {job['job_id']} failed: {e}", exc_info=True)
+            with state_lock:
+                job.update({'status': 'failed', 'stage': 'failed', 'error': str(e)})
+                self._write(job)
+        finally:
+            with self._lock:
+                self._jobs.pop(job['job_id'], None)
+
+    def prune(self):
+        """Delete status and key files of jobs finished more than JOB_RETENTION_SECONDS ago."""
+        cutoff = time.time() - JOB_RETENTION_SECONDS
+        try:
+            paths = list(self.jobs_dir.glob('*.json')) + list(self.jobs_dir.glob('key-*'))
+        except OSError:
+            return
+        for path in paths:
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+
+
+# Global summary job runner
+summary_jobs = SummaryJobs()
@@ -2,6 +2,7 @@
 # components/Tag.py
 
 import json
+import threading
 import mysql.connector
 from mysql.connector import Error
 
@@ -13,6 +14,177 @@ except ImportError:
     def invalidate_spaces_cache():
         pass
 
+try:
+    from components.SearchIndex import update_space_index
+except ImportError:
+    update_space_index = None
+
+# Longest tag name the tags.name column holds
+MAX_TAG_NAME_LENGTH = 100
+
+# In-process tag name -> id cache shared by every Tag and Space instance
+TAG_ID_CACHE_SIZE = 20000
+_tag_id_cache = {}
+_tag_id_cache_lock = threading.Lock()
+
+
+def normalize_tag_name(tag_name):
+    """
+    Normalize a tag name the way it is stored (lowercase, single spaces).
+    
+    Args:
+        tag_name (str): Tag name
+        
+    Returns:
+        str: Normalized name ('' if nothing is left)
+    """
+    return ' '.join((tag_name or '').split()).lower()[:MAX_TAG_NAME_LENGTH].strip()
+
+
+def forget_tag_ids(names=None):
+    """
+    Drop tag ids from the in-process cache.
+    
+    Args:
+        names (iterable, optional): Normalized names to drop (default: all)
+    """
+    with _tag_id_cache_lock:
+        if names is None:
+            _tag_id_cache.clear()
+        else:
+            for name in names:
+                _tag_id_cache.pop(name, None)
+
+
+def resolve_tag_ids(connection, tag_names):
+    """
+    Get the ids of tags by name, creating any that do not exist.
+    
+    Names already in the in-process cache cost nothing; the rest take one
+    multi-row INSERT IGNORE and one SELECT ... IN. The caller commits.
+    
+    Args:
+        connection: MySQL connection
+        tag_names (iterable): Tag names (normalized here)
+        
+    Returns:
+        dict: {normalized name: tag id}
+    """
+    names = []
+    for tag_name in tag_names:
+        name = normalize_tag_name(tag_name)
+        if name and name not in names:
+            names.append(name)
+    
+    with _tag_id_cache_lock:
+        resolved = {name: _tag_id_cache[name] for name in names if name in _tag_id_cache}
+    missing = [name for name in names if name not in resolved]
+    if not missing:
+        return resolved
+    
+    fetched = {}
+    cursor = connection.cursor()
+    try:
+        placeholders = ', '.join(['(%s)'] * len(missing))
+        cursor.execute(f"INSERT IGNORE INTO tags (name) VALUES {placeholders}", missing)
+        
+        placeholders = ', '.join(['%s'] * len(missing))
+        cursor.execute(f"SELECT id, name FROM tags WHERE name IN ({placeholders})", missing)
+        found = {name.lower(): tag_id for tag_id, name in cursor.fetchall()}
+        
+        for name in missing:
+            if name in found:
+                fetched[name] = found[name]
+                continue
+            # Stored under a spelling the accent-insensitive collation treats as equal
+            cursor.execute("SELECT id FROM tags WHERE name = %s", (name,))
+            row = cursor.fetchone()
+            if row:
+                fetched[name] = row[0]
+    finally:
+        cursor.close()
+    
+    with _tag_id_cache_lock:
+        if len(_tag_id_cache) + len(fetched) > TAG_ID_CACHE_SIZE:
+            _tag_id_cache.clear()
+        _tag_id_cache.update(fetched)
+    resolved.update(fetched)
+    return resolved
+
+
+def bulk_add_tags(connection, space_id, tag_names, user_id=0):
+    """
+    Link tags to a space in a handful of round-trips, creating missing tags.
+    
+    Tag ids come from resolve_tag_ids(); links the space already has are
+    skipped and the rest go in with one multi-row INSERT IGNORE. The caller
+    commits.
+    
+    Args:
+        connection: MySQL connection
+        space_id (str): The unique space identifier
+        tag_names (list): Tag names
+        user_id (int, optional): User ID. Defaults to 0 for visitors.
+        
+    Returns:
+        list: (original name, normalized name, tag id) for each newly linked tag
+    """
+    originals = {}
+    for tag_name in tag_names:
+        name = normalize_tag_name(tag_name)
+        if name and name not in originals:
+            originals[name] = tag_name.strip()
+    if not originals:
+        return []
+    
+    added = []
+    for attempt in range(2):
+        tag_ids = resolve_tag_ids(connection, originals)
+        if not tag_ids:
+            break
+        
+        cursor = connection.cursor()
+        try:
+            placeholders = ', '.join(['%s'] * len(tag_ids))
+            cursor.execute(
+                f"""
+                SELECT tag_id FROM space_tags
+                WHERE space_id = %s AND user_id = %s AND tag_id IN ({placeholders})
+                """,
+                [space_id, user_id] + list(tag_ids.values())
+            )
+            linked = {row[0] for row in cursor.fetchall()}
+            new_links = [(name, tag_id) for name, tag_id in tag_ids.items() if tag_id not in linked]
+            if not new_links:
+                break
+            
+            placeholders = ', '.join(['(%s, %s, %s)'] * len(new_links))
+            params = []
+            for _, tag_id in new_links:
+                params.extend([space_id, tag_id, user_id])
+            cursor.execute(
+                f"INSERT IGNORE INTO space_tags (space_id, tag_id, user_id) VALUES {placeholders}",
+                params
+            )
+            stale = []
+            if cursor.rowcount < len(new_links) and not attempt:
+                # Fewer rows than expected: some cached ids may belong to deleted tags
+                placeholders = ', '.join(['%s'] * len(new_links))
+                cursor.execute(f"SELECT id FROM tags WHERE id IN ({placeholders})",
+                               [tag_id for _, tag_id in new_links])
+                existing = {row[0] for row in cursor.fetchall()}
+                stale = [name for name, tag_id in new_links if tag_id not in existing]
+        finally:
+            cursor.close()
+        
+        added.extend((originals[name], name, tag_id) for name, tag_id in new_links if name not in stale)
+        if not stale:
+            break
+        forget_tag_ids(stale)
+        originals = {name: originals[name] for name in stale}
+    return added
+
+
 class Tag:
     """
     Class to manage database actions on tags.
@@ -55,32 +227,14 @@ class Tag:
             int: Tag ID
         """
         try:
-            cursor = self.connection.cursor()
-            
-            # Normalize tag name (lowercase)
-            normalized_tag = tag_name.lower().strip()
-            
-            # Check if tag already exists
-            cursor.execute("SELECT id FROM tags WHERE name = %s", (normalized_tag,))
-            result = cursor.fetchone()
-            
-            if result:
-                return result[0]
-            
-            # Create the tag
-            cursor.execute("INSERT INTO tags (name) VALUES (%s)", (normalized_tag,))
-            tag_id = cursor.lastrowid
-            
+            tag_ids = resolve_tag_ids(self.connection, [tag_name])
             self.connection.commit()
-            return tag_id
+            return tag_ids.get(normalize_tag_name(tag_name))
             
         except Error as e:
             print(f"Error creating tag: {e}")
             self.connection.rollback()
             return None
-        finally:
-            if cursor:
-                cursor.close()
     
     def get_tag(self, tag_id=None, tag_name=None):
         """
@@ -247,40 +401,14 @@ class Tag:
             int: Number of tags added
         """
         try:
-            cursor = self.connection.cursor()
-            count = 0
-            
-            for tag_name in tags:
-                if not tag_name.strip():
-                    continue
-                    
-                # Create or get tag ID
-                tag_id = self.create_tag(tag_name)
-                if not tag_id:
-                    continue
-                
-                # Add relationship between space and tag
-                try:
-                    cursor.execute(
-                        """
-                        INSERT INTO space_tags (space_id, tag_id, user_id)
-                        VALUES (%s, %s, %s)
-                        """,
-                        (space_id, tag_id, user_id)
-                    )
-                    count += 1
-                except Error as e:
-                    # Silently ignore duplicate key errors (code 1062)
-                    if not (isinstance(e, mysql.connector.errors.IntegrityError) and "1062" in str(e)):
-                        print(f"Error adding tag to space: {e}")
-                    # Tag might already be associated with this space
-                    pass
-            
+            count = len(bulk_add_tags(self.connection, space_id, tags, user_id))
             self.connection.commit()
             
             # Invalidate cache if tags were added
             if count > 0:
                 invalidate_spaces_cache()
+                if update_space_index:
+                    update_space_index(self.connection, space_id)
             
             return count
             
@@ -288,9 +416,6 @@ class Tag:
             print(f"Error adding tags to space: {e}")
             self.connection.rollback()
             return 0
-        finally:
-            if cursor:
-                cursor.close()
     
     def remove_tag_from_space(self, space_id, tag_id, user_id=None, visitor_id=None, force_remove=False):
         """
@@ -335,6 +460,8 @@ class Tag:
             result = cursor.rowcount > 0
             if result:
                 invalidate_spaces_cache()
+                if update_space_index:
+                    update_space_index(self.connection, space_id)
             
             return result
             
@@ -438,6 +565,8 @@ class Tag:
                     (space_id, tag_id, user_id)
                 )
                 self.connection.commit()
+                if update_space_index:
+                    update_space_index(self.connection, space_id)
                 return True
             except Error as e:
                 # Silently ignore duplicate key errors (code 1062)
@@ -474,6 +603,8 @@ class Tag:
             # Invalidate cache if any tags were removed
             if cursor.rowcount > 0:
                 invalidate_spaces_cache()
+                if update_space_index:
+                    update_space_index(self.connection, space_id)
             
             return True
             
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# components/TagExtractor.py
+"""
+Tag Extractor Component for XSpace Downloader
+
+Generates tags for a transcript with a map-reduce over the AI provider:
+
+- Map: the transcript is cut into large chunks (sized by a token budget, not
+  a fixed 2,500 characters); very long transcripts are sampled evenly down
+  to a fixed number of chunks. Chunks are sent concurrently under a rate
+  limiter shared by every extract() call (retrying failed calls is left to
+  the AI gateway), and each chunk's candidate tags are cached by a hash of
+  the chunk, so re-tagging an unchanged transcript costs nothing.
+- Reduce: candidates are scored by frequency and specificity, and a single
+  call picks the final tags.
+
+The provider call is passed in as a function with the AI component's
+generate_text() signature.
+
+Usage Examples:
+
+    from components.AI import AI
+    from components.TagExtractor import TagExtractor
+
+    ai = AI()
+    extractor = TagExtractor(ai.generate_text, model='gpt-4o-mini')
+    tags = extractor.extract(transcript_text, max_tags=8)
+"""
+
+import hashlib
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from components.RateLimiter import TokenBucket
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('tag_extractor')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# Bump when the prompts or chunking change so cached chunk tags are not reused
+TAG_EXTRACTION_VERSION = 1
+
+# Rough characters per token for sizing chunks
+CHARS_PER_TOKEN = 4
+
+COMMON_WORDS = {
+    'going', 'because', 'think', 'about', 'would', 'doesn\'t', 'really',
+    'maybe', 'probably', 'something', 'could', 'should', 'might', 'actually',
+    'basically', 'thing', 'stuff', 'people', 'good', 'nice', 'very', 'thank',
+    'there', 'here', 'prompt', 'getting', 'saying', 'having', 'being',
+    'doing', 'making', 'taking', 'coming', 'looking', 'using', 'working',
+    'trying', 'talking', 'thinking', 'feeling', 'knowing', 'seeing',
+    'right', 'just', 'like', 'want', 'need', 'time', 'know', 'yeah',
+    'okay', 'well', 'mean', 'said', 'says', 'tell', 'told', 'talk'
+}
+
+MAP_PROMPT = """Analyze this transcript excerpt and extract up to {max_tags} **highly relevant** and **searchable** tags.
+
+STRICT GUIDELINES:
+1. DO NOT use **common or vague words**, including: going, because, think, about, would, doesn't, really, maybe, probably, something, could, should, might, actually, basically, thing, stuff, people, good, nice, very, thank, there, here, prompt.
+2. PRIORITIZE the following:
+   - **Proper nouns**: Countries, cities, regions, places (e.g., Bangladesh, Silicon Valley)
+   - **Organizations**: Companies, institutions, political groups (e.g., Google, NATO)
+   - **Topics or disciplines**: Fields or subjects (e.g., artificial intelligence, biotechnology)
+   - **Technical terms or jargon**: Industry- or domain-specific keywords (e.g., zero-day exploit, blockchain)
+   - **Public figures**: Full names or distinct identifiers (e.g., Elon Musk, Sheikh Hasina)
+3. All tags must be **specific**, **meaningful**, and suitable for categorization or search indexing.
+4. AVOID:
+   - Single generic words (e.g., about, nice, people, would)
+   - Standalone numbers (e.g., 2024, 10, 5)
+   - Overly broad tags (e.g., technology, news) unless critical to topic
+   - Words without strong connection to topic
+
+FORMAT:
+- Return tags ONLY as a **comma-separated list**
+- NO extra text, no bullet points, no numbers
+
+EXAMPLES:
+Good tags: "Bangladesh", "OpenAI", "machine learning", "climate finance", "Elon Musk", "Dhaka", "data privacy", "nuclear submarine"
+Bad tags: "thing", "nice", "about", "because", "there", "prompt", "2024"
+
+Transcript excerpt (chunk {index} of {count}):
+{chunk}
+"""
+
+REDUCE_PROMPT = """From these candidate tags, select the {max_tags} MOST relevant and high-quality tags for categorizing the transcript.
+
+SELECTION CRITERIA:
+1. Prefer specific over generic (e.g., "OpenAI" over "technology")
+2. Prefer proper nouns and named entities
+3. Prefer technical/domain-specific terms
+4. Avoid common words and phrases
+5. Ensure diversity - don't select multiple variants of the same concept
+
+Candidate tags (most frequent first): {candidates}
+
+Return ONLY the selected tags as a comma-separated list, nothing else."""
+
+
+def parse_tags(text: str) -> List[str]:
+    """
+    Parse a comma-separated AI reply into tags.
+
+    Args:
+        text (str): Reply text
+
+    Returns:
+        list: Tags with surrounding quotes and whitespace removed
+    """
+    return [tag.strip().strip('"\'').strip() for tag in (text or '').split(',') if tag.strip().strip('"\'').strip()]
+
+
+def score_tags(tags: List[str]) -> List[Tuple[str, int]]:
+    """
+    Score candidate tags by frequency and specificity.
+
+    Tags differing only in case are merged under their most common spelling.
+
+    Args:
+        tags (list): Candidate tags from every chunk (duplicates count as votes)
+
+    Returns:
+        list: (tag, score) pairs, best first
+    """
+    spellings = {}
+    for tag in tags:
+        spellings.setdefault(tag.lower(), Counter())[tag] += 1
+
+    scored = []
+    for lowered, variants in spellings.items():
+        tag = variants.most_common(1)[0][0]
+        if re.match(r'^\d+$', tag) or len(tag) < 2 or lowered in COMMON_WORDS:
+            continue
+
+        score = sum(variants.values())
+        if tag[0].isupper():
+            score += 2
+        if ' ' in tag:
+            score += 3
+        if any(c.isdigit() for c in tag) and not tag.isdigit():
+            score += 2
+        scored.append((tag, score))
+
+    scored.sort(key=lambda item: item[1], reverse=True)
+    return scored
+
+
+def plan_chunks(text: str, chunk_chars: int, max_chunks: int) -> List[str]:
+    """
+    Cut a transcript into chunks, sampling evenly if there are too many.
+
+    Chunks end on whitespace where possible. Beyond max_chunks, chunks are
+    taken at even intervals so the whole recording is still represented.
+
+    Args:
+        text (str): Transcript text
+        chunk_chars (int): Target characters per chunk
+        max_chunks (int): Maximum chunks to send
+
+    Returns:
+        list: Chunk texts in transcript order
+    """
+    chunks = []
+    position = 0
+    while position < len(text):
+        end = min(len(text), position + chunk_chars)
+        if end < len(text):
+            cut = text.rfind(' ', position + chunk_chars // 2, end)
+            end = cut if cut > 0 else end
+        chunk = text[position:end].strip()
+        if chunk:
+            chunks.append(chunk)
+        position = end
+
+    if len(chunks) > max_chunks:
+        step = len(chunks) / max_chunks
+        chunks = [chunks[int(index * step + step / 2)] for index in range(max_chunks)]
+    return chunks
+
+
+class TagExtractor:
+    """Map-reduce tag generation with concurrent, cached map calls."""
+
+    def __init__(self, generate: Callable[[str, int], Dict], model: str = '',
+                 chunk_tokens: int = 3000, max_chunks: int = 8, max_workers: int = 4,
+                 requests_per_minute: float = 50, cache=None):
+        """
+        Initialize the extractor.
+
+        Args:
+            generate (callable): generate(prompt, max_tokens) -> {'success', 'text' or 'error'}
+            model (str): Model name (part of the cache key)
+            chunk_tokens (int): Approximate transcript tokens per map chunk
+            max_chunks (int): Maximum map calls per transcript
+            max_workers (int): Map calls in flight at the same time
+            requests_per_minute (float): Request rate limit shared by every extract() call
+            cache (TranscriptCache, optional): Cache for per-chunk candidate tags
+        """
+        self.generate = generate
+        self.model = model
+        self.chunk_chars = max(2000, int(chunk_tokens) * CHARS_PER_TOKEN)
+        self.max_chunks = max(1, int(max_chunks))
+        self.max_workers = max(1, int(max_workers))
+        self.requests_per_minute = requests_per_minute
+        self.cache = cache
+        self.rate_limiter = TokenBucket(rate_per_minute=requests_per_minute, burst=self.max_workers)
+
+    def _call(self, prompt: str, max_tokens: int) -> str:
+        """Send one prompt once the rate limiter allows it; returns the reply text."""
+        self.rate_limiter.acquire()
+        result = self.generate(prompt, max_tokens)
+        if not result.get('success'):
+            raise RuntimeError(result.get('error', 'Unknown error'))
+        return result.get('text', '')
+
+    def _cache_key(self, chunk: str, max_tags: int) -> str:
+        """Hash everything that affects a chunk's candidate tags."""
+        material = '\x00'.join([str(TAG_EXTRACTION_VERSION), self.model, str(max_tags), chunk])
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _map_chunk(self, index: int, count: int, chunk: str,
+                   max_tags: int) -> Tuple[List[str], Optional[Tuple[str, str]]]:
+        """
+        Extract candidate tags from one chunk.
+
+        Returns:
+            tuple: (tags, (prompt, reply) if the provider was called, else None)
+        """
+        key = self._cache_key(chunk, max_tags)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached and cached.get('text'):
+                return parse_tags(cached['text']), None
+
+        prompt = MAP_PROMPT.format(max_tags=max_tags, index=index + 1, count=count, chunk=chunk)
+        try:
+            reply = self._call(prompt, 100)
+        except Exception as e:
+            logger.error(f"Tag extraction failed for chunk {index + 1}/{count}: {e}")
+            return [], None
+
+        tags = parse_tags(reply)
+        if tags and self.cache is not None:
+            self.cache.put(key, {'text': ', '.join(tags)}, metadata={'model': self.model, 'kind': 'tags'})
+        return tags, (prompt, reply)
+
+    def extract(self, text: str, max_tags: int = 5,
+                on_response: Optional[Callable[[str, str], None]] = None) -> Optional[List[str]]:
+        """
+        Generate tags for a transcript.
+
+        Args:
+            text (str): Transcript text
+            max_tags (int): Number of tags to return
+            on_response (callable, optional): on_response(prompt, reply) for every provider
+                                              call made (cached chunks are skipped), called
+                                              in this thread; used for cost tracking
+
+        Returns:
+            list: Final tags, or None if every map call failed
+        """
+        if not text or not text.strip():
+            return []
+
+        chunks = plan_chunks(text, self.chunk_chars, self.max_chunks)
+        logger.info(f"[TAGS] Extracting tags from {len(text)} chars in {len(chunks)} chunks "
+                    f"({min(self.max_workers, len(chunks))} concurrent)")
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+            futures = [executor.submit(self._map_chunk, index, len(chunks), chunk, max_tags)
+                       for index, chunk in enumerate(chunks)]
+            outputs = [future.result() for future in futures]
+
+        candidates = []
+        answered = 0
+        for tags, call in outputs:
+            candidates.extend(tags)
+            answered += 1 if tags or call else 0
+            if call and on_response:
+                on_response(*call)
+        if not answered:
+            return None
+
+        scored = score_tags(candidates)
+        logger.info(f"[TAGS] {len(candidates)} candidates, {len(scored)} after filtering")
+        if len(scored) <= max_tags:
+            return [tag for tag, _ in scored]
+
+        top_tags = [tag for tag, _ in scored[:max_tags * 2]]
+        prompt = REDUCE_PROMPT.format(max_tags=max_tags, candidates=', '.join(top_tags))
+        try:
+            reply = self._call(prompt, 100)
+        except Exception as e:
+            logger.warning(f"Tag refinement failed, using top scored tags: {e}")
+            return top_tags[:max_tags]
+        if on_response:
+            on_response(prompt, reply)
+
+        final_tags = [tag for tag in parse_tags(reply) if len(tag) >= 2 and tag.lower() not in COMMON_WORDS]
+        return final_tags[:max_tags] or top_tags[:max_tags]
@@ -3,7 +3,6 @@ import json
 import datetime
 from typing import List, Dict, Optional, Any
 import hashlib
-import openai
 import os
 from .Email import Email
 
@@ -130,16 +129,15 @@ Respond in JSON format:
             if not api_key:
                 return {"priority": 0, "response": "Your ticket has been received and will be reviewed by support staff."}
             
-            openai.api_key = api_key
+            # Shared provider, so the call is rate limited and circuit broken with the rest
+            from .AI import get_shared_provider
+            openai_provider = get_shared_provider('openai', api_key, model="gpt-4")
             
-            response = openai.ChatCompletion.create(
-                model="gpt-4",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3,
-                max_tokens=500
-            )
+            response = openai_provider.generate_text(prompt, max_tokens=500, temperature=0.3)
+            if not response['success']:
+                raise RuntimeError(response['error'])
             
-            ai_response = json.loads(response.choices[0].message.content)
+            ai_response = json.loads(response['text'])
             return ai_response
             
         except Exception as e:
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# components/TranscriptCache.py
+"""
+Transcript Cache Component for XSpace Downloader
+
+Content-addressed cache of raw transcription results. Entries are keyed by
+a SHA-256 fingerprint of the audio bytes plus the provider, model, language
+and options that affect the output. Re-transcribing a Space, re-uploading the
+same file, or the same audio under another Space ID therefore reuses the
+earlier result instead of paying for transcription again.
+
+Entries hold the raw engine output (text, language, duration and slim
+segments) as gzipped compact JSON. Corrective filtering, timecode formatting
+and translation run again on the cached segments without reading the audio.
+
+Usage Examples:
+
+    from components.TranscriptCache import transcript_cache
+
+    key = transcript_cache.make_key('downloads/abc.mp3', 'openai', 'gpt-4o-mini-transcribe', 'en')
+    result = transcript_cache.get(key)
+    if result is None:
+        result = transcribe(...)
+        transcript_cache.put(key, result)
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('transcript_cache')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# Bump when the stored format or the transcription pipeline changes output
+CACHE_VERSION = 1
+
+# Segment fields kept in the cache; Whisper's tokens and probabilities are dropped
+SEGMENT_FIELDS = ('start', 'end', 'text')
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class TranscriptCache:
+    """Gzipped JSON transcription results keyed by audio fingerprint and options."""
+
+    def __init__(self, cache_dir: str = 'transcript_cache', max_bytes: int = 2 * 1024 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir (str): Directory holding cache entries
+            max_bytes (int): Size limit; least recently used entries are pruned past it
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._fingerprints = {}
+        self._lock = threading.Lock()
+
+    def fingerprint_file(self, audio_file: str) -> str:
+        """
+        Hash the contents of an audio file.
+
+        Hashes are remembered per (path, size, mtime) so a file is read once
+        per process unless it changes.
+
+        Args:
+            audio_file (str): Path to the audio file
+
+        Returns:
+            str: Hex SHA-256 digest of the file contents
+        """
+        stat = os.stat(audio_file)
+        memo_key = (os.path.abspath(audio_file), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            digest = self._fingerprints.get(memo_key)
+        if digest:
+            return digest
+
+        sha = hashlib.sha256()
+        with open(audio_file, 'rb') as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+                sha.update(block)
+        digest = sha.hexdigest()
+
+        with self._lock:
+            self._fingerprints[memo_key] = digest
+        return digest
+
+    def make_key(self, audio_file: str, provider: str, model: str,
+                 language: Optional[str] = None, options: Optional[Dict] = None) -> str:
+        """
+        Build the cache key for transcribing a file with given settings.
+
+        Args:
+            audio_file (str): Path to the audio file
+            provider (str): Transcription provider ('local' or 'openai')
+            model (str): Model name
+            language (str, optional): Requested language (None for auto-detect)
+            options (dict, optional): Other settings that change the output
+
+        Returns:
+            str: Hex cache key
+        """
+        material = json.dumps({
+            'version': CACHE_VERSION,
+            'audio': self.fingerprint_file(audio_file),
+            'provider': provider,
+            'model': model,
+            'language': language or None,
+            'options': options or {}
+        }, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Path of a cache entry, sharded by the first two key characters."""
+        return self.cache_dir / key[:2] / f"{key}.json.gz"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached result.
+
+        Args:
+            key (str): Cache key from make_key()
+
+        Returns:
+            dict: Raw result (text, language, duration, segments), or None
+        """
+        entry = self.get_entry(key)
+        return entry.get('result') if entry else None
+
+    def get_entry(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached entry with the metadata it was stored with.
+
+        Args:
+            key (str): Cache key from make_key()
+
+        Returns:
+            dict: {'result', 'created_at', 'metadata'}, or None
+        """
+        path = self._entry_path(key)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable transcript cache entry {key}: {e}")
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+
+        try:
+            # Pruning goes by modification time, so touch the entry on every hit
+            os.utime(path, None)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key: str, result: Dict, metadata: Optional[Dict] = None):
+        """
+        Store a raw transcription result.
+
+        Args:
+            key (str): Cache key from make_key()
+            result (dict): Engine result with text, language, duration and segments
+            metadata (dict, optional): Extra details stored alongside (provider, model, ...)
+        """
+        if not result or not isinstance(result, dict):
+            return
+
+        slim = {
+            'text': result.get('text', ''),
+            'language': result.get('language', 'unknown'),
+            'duration': result.get('duration', 0),
+            'segments': [
+                {field: getattr(segment, field, None) if not isinstance(segment, dict) else segment.get(field)
+                 for field in SEGMENT_FIELDS}
+                for segment in (result.get('segments') or [])
+            ]
+        }
+        if 'speech_duration' in result:
+            slim['speech_duration'] = result['speech_duration']
+
+        entry = {'result': slim, 'created_at': time.time(), 'metadata': metadata or {}}
+        data = gzip.compress(json.dumps(entry, separators=(',', ':'), ensure_ascii=False).encode('utf-8'), mtime=0)
+
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=str(path.parent), prefix='.tmp-')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write transcript cache entry {key}: {e}")
+            return
+
+        self.prune()
+
+    def prune(self):
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        if not self.max_bytes or not self.cache_dir.exists():
+            return
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob('*/*.json.gz'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def get_stats(self) -> Dict:
+        """
+        Summarise the cache contents.
+
+        Returns:
+            dict: entries and bytes
+        """
+        entries = 0
+        total = 0
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob('*/*.json.gz'):
+                try:
+                    total += path.stat().st_size
+                    entries += 1
+                except OSError:
+                    continue
+        return {'entries': entries, 'bytes': total, 'max_bytes': self.max_bytes}
+
+
+# Global transcript cache instance
+transcript_cache = TranscriptCache()
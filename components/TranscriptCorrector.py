@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# components/TranscriptCorrector.py
+"""
+Transcript Corrector Component for XSpace Downloader
+
+Runs the GPT corrective filter over transcripts of any length. The transcript
+is split on line boundaries (one "[HH:MM:SS] text" line per segment) or, for
+plain text, on sentence boundaries. Chunks are corrected concurrently under a
+shared rate limiter and stitched back in order, so latency follows the slowest
+chunk rather than the transcript length.
+
+- Each request also carries a little text either side of the chunk as
+  read-only context, so words at chunk edges are corrected consistently
+- A chunk whose correction loses or changes timecodes, or shrinks or grows
+  suspiciously, keeps its original text
+- Corrected chunks are cached by a hash of model, prompt, language and text,
+  so re-running the filter on an unchanged transcript costs nothing
+
+Usage Examples:
+
+    from components.TranscriptCorrector import TranscriptCorrector
+
+    corrector = TranscriptCorrector(complete=lambda system, user: call_gpt(system, user))
+    corrected = corrector.correct(transcript, language='en')
+"""
+
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+from components.RateLimiter import TokenBucket, retry_with_backoff
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('transcript_corrector')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# Bump when the prompt or chunking changes so cached corrections are not reused
+CORRECTION_VERSION = 1
+
+TIMECODE_PATTERN = re.compile(r'\[\d{2}:\d{2}:\d{2}\]')
+SENTENCE_BREAK_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+SYSTEM_PROMPT = """You are a helpful assistant that corrects transcription errors. Your task is to:
+
+1. Fix spelling mistakes and typos in the transcribed text
+2. Add proper punctuation (periods, commas, capitalization) where needed
+3. Correct obvious word misrecognitions (e.g., "their" vs "there", "two" vs "to")
+4. Fix common transcription errors (homophones, similar-sounding words)
+5. Ensure proper capitalization of names, places, and proper nouns
+6. Remove filler words like "um", "uh", "like" when excessive
+7. Fix grammar issues while preserving the original meaning and speaker's intent
+
+CRITICAL RULES:
+- Preserve ALL timecodes exactly as they appear [HH:MM:SS]
+- Keep every line on its own line, in the same order
+- Do NOT add any segment markers, dividers, or formatting
+- Do NOT truncate or shorten the text
+- Return the COMPLETE corrected transcript
+- Only make corrections that are clearly needed
+- Preserve the original meaning and tone
+- Don't add information that wasn't in the original
+- Don't change technical terms unless clearly wrong
+- Keep the same speaking style and natural flow
+- If unsure about a correction, leave the original text
+
+You may be given text from before and after the part to correct. Use it only to understand
+the context; never include it in your answer.
+
+Return ONLY the corrected transcript text without any additional commentary, formatting, or segment markers."""
+
+
+def split_transcript(text: str, max_chars: int) -> Tuple[List[List[str]], str]:
+    """
+    Split a transcript into chunks of whole lines or sentences.
+
+    Args:
+        text (str): Transcript, timecoded (one line per segment) or plain
+        max_chars (int): Target maximum characters per chunk
+
+    Returns:
+        tuple: (chunks as lists of units, separator that joins units back)
+    """
+    if '\n' in text.strip():
+        units = [line for line in text.split('\n') if line.strip()]
+        separator = '\n'
+    else:
+        units = [sentence for sentence in SENTENCE_BREAK_PATTERN.split(text.strip()) if sentence]
+        separator = ' '
+
+    # Break up units that are longer than a chunk on their own (unpunctuated text)
+    sized_units = []
+    for unit in units:
+        while len(unit) > max_chars:
+            cut = unit.rfind(' ', 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            sized_units.append(unit[:cut])
+            unit = unit[cut:].lstrip()
+        if unit:
+            sized_units.append(unit)
+
+    chunks = []
+    current = []
+    current_length = 0
+    for unit in sized_units:
+        if current and current_length + len(unit) + len(separator) > max_chars:
+            chunks.append(current)
+            current = []
+            current_length = 0
+        current.append(unit)
+        current_length += len(unit) + len(separator)
+    if current:
+        chunks.append(current)
+    return chunks, separator
+
+
+class TranscriptCorrector:
+    """Chunked, concurrent GPT correction of transcripts with per-chunk caching."""
+
+    def __init__(self, complete: Callable[[str, str], str], model: str = 'gpt-4o-mini',
+                 max_chars: int = 8000, context_chars: int = 300, max_workers: int = 4,
+                 requests_per_minute: float = 50, max_retries: int = 3, cache=None):
+        """
+        Initialize the corrector.
+
+        Args:
+            complete (callable): complete(system_prompt, user_message) -> reply text
+            model (str): Correction model name (part of the cache key)
+            max_chars (int): Target maximum characters per chunk
+            context_chars (int): Characters of neighbouring text sent as context
+            max_workers (int): Chunks corrected at the same time
+            requests_per_minute (float): Request rate limit shared by every correct() call
+            max_retries (int): Attempts per chunk
+            cache (TranscriptCache, optional): Cache for corrected chunks
+        """
+        self.complete = complete
+        self.model = model
+        self.max_chars = max(500, int(max_chars))
+        self.context_chars = max(0, int(context_chars))
+        self.max_workers = max(1, int(max_workers))
+        self.requests_per_minute = requests_per_minute
+        self.max_retries = max(1, int(max_retries))
+        self.cache = cache
+        self.rate_limiter = TokenBucket(rate_per_minute=requests_per_minute, burst=self.max_workers)
+
+    def _cache_key(self, language: str, before: str, body: str, after: str) -> str:
+        """Hash everything that affects a chunk's correction."""
+        material = '\x00'.join([str(CORRECTION_VERSION), self.model, language or '', before, body, after])
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def is_valid_correction(original: str, corrected: str) -> bool:
+        """
+        Check that a corrected chunk can replace the original.
+
+        Args:
+            original (str): Chunk sent for correction
+            corrected (str): Model reply
+
+        Returns:
+            bool: True if timecodes are unchanged and the length is plausible
+        """
+        if not corrected:
+            return False
+        if TIMECODE_PATTERN.findall(original) != TIMECODE_PATTERN.findall(corrected):
+            return False
+        return len(original) * 0.8 <= len(corrected) <= len(original) * 1.5 + 50
+
+    def _build_message(self, language: str, before: str, body: str, after: str) -> str:
+        """Build the user message for one chunk."""
+        parts = []
+        if language and language != 'unknown':
+            parts.append(f"Transcript language: {language}")
+        if before:
+            parts.append(f"Context before (do not return):\n{before}")
+        parts.append(f"Please correct this transcript:\n\n{body}")
+        if after:
+            parts.append(f"Context after (do not return):\n{after}")
+        return '\n\n'.join(parts)
+
+    def _correct_chunk(self, index: int, count: int, language: str, before: str, body: str,
+                       after: str) -> str:
+        """Correct one chunk, falling back to the original text on any failure."""
+        key = self._cache_key(language, before, body, after)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached and cached.get('text'):
+                return cached['text']
+
+        try:
+            corrected = retry_with_backoff(
+                lambda: self.complete(SYSTEM_PROMPT, self._build_message(language, before, body, after)),
+                attempts=self.max_retries,
+                base_delay=2.0,
+                before_attempt=self.rate_limiter.acquire,
+                description=f"[CORRECTIVE_FILTER] Chunk {index + 1}/{count}"
+            )
+        except Exception as e:
+            logger.error(f"Corrective filter failed for chunk {index + 1}/{count}: {e}")
+            return body
+
+        corrected = (corrected or '').strip()
+        if not self.is_valid_correction(body, corrected):
+            logger.warning(f"Corrected chunk {index + 1}/{count} failed validation "
+                           f"(original: {len(body)}, corrected: {len(corrected)} chars), keeping original")
+            return body
+
+        if self.cache is not None:
+            self.cache.put(key, {'text': corrected}, metadata={'model': self.model, 'kind': 'correction'})
+        return corrected
+
+    def correct(self, text: str, language: Optional[str] = None) -> str:
+        """
+        Correct a transcript of any length.
+
+        Args:
+            text (str): Transcript text (timecoded lines or plain text)
+            language (str, optional): Language code passed to the model as a hint
+
+        Returns:
+            str: Corrected transcript; chunks that could not be corrected keep their original text
+        """
+        if not text or not text.strip():
+            return text
+
+        chunks, separator = split_transcript(text, self.max_chars)
+        bodies = [separator.join(units) for units in chunks]
+        def chunk_args(index):
+            before = bodies[index - 1][-self.context_chars:] if index > 0 and self.context_chars else ''
+            after = bodies[index + 1][:self.context_chars] if index + 1 < len(bodies) and self.context_chars else ''
+            return index, len(bodies), language, before, bodies[index], after
+
+        logger.info(f"[CORRECTIVE_FILTER] Correcting {len(text)} chars in {len(bodies)} chunks "
+                    f"({min(self.max_workers, len(bodies))} concurrent)")
+
+        if len(bodies) == 1:
+            corrected = [self._correct_chunk(*chunk_args(0))]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(bodies))) as executor:
+                futures = [executor.submit(self._correct_chunk, *chunk_args(index))
+                           for index in range(len(bodies))]
+                corrected = [future.result() for future in futures]
+
+        return separator.join(corrected)
@@ -0,0 +1,592 @@
+#!/usr/bin/env python3
+# components/TranscriptionQueue.py
+"""
+Transcription Queue Component for XSpace Downloader
+
+Keeps transcription jobs in an SQLite WAL database with an index on status,
+so finding the next job costs the same however many finished jobs exist.
+
+- enqueue() stores a job created by the web app
+- claim() hands the oldest pending job (optionally preferring a model that
+  is already loaded) to exactly one worker, inside an IMMEDIATE transaction
+- heartbeat() records that a worker is still alive and reports cancellation;
+  keep_alive() sends heartbeats from a thread for the length of a job
+- update() with a worker_id only applies while that worker holds the job
+- requeue_stale() returns jobs from dead workers to the queue
+- archive_finished() moves old finished jobs to an archive table
+
+Each job is also mirrored to transcript_jobs/<job_id>.json, written
+atomically, so pages that still read the job files keep working. Archived
+jobs' files move to transcript_jobs/archive/.
+
+Usage:
+    from components.TranscriptionQueue import transcription_queue
+
+    transcription_queue.enqueue(job_data)
+    job = transcription_queue.claim('host:1234')
+    transcription_queue.update(job['job_id'], 'completed', progress=100)
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from components.SQLiteStore import SQLiteStore
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('transcription_queue')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# Default location of the queue database and the job file mirror
+DEFAULT_QUEUE_PATH = './data/transcription_queue.db'
+DEFAULT_MIRROR_DIR = './transcript_jobs'
+
+ACTIVE_STATUSES = ('pending', 'processing')
+FINISHED_STATUSES = ('completed', 'failed', 'cancelled')
+
+_COLUMNS = """
+    job_id TEXT PRIMARY KEY,
+    space_id TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    model TEXT,
+    progress REAL NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    claimed_by TEXT,
+    heartbeat_at REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL,
+    result TEXT,
+    error TEXT
+"""
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS jobs ({_COLUMNS});
+
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs(status, created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_space_status ON jobs(space_id, status);
+
+CREATE TABLE IF NOT EXISTS jobs_archive ({_COLUMNS}, archived_at REAL NOT NULL);
+"""
+
+
+def job_model(job_data):
+    """Get the model a job asked for (direct 'model' field or nested in 'options')."""
+    return job_data.get('model') or (job_data.get('options') or {}).get('model', 'tiny')
+
+
+def _parse_time(value):
+    """Convert an ISO timestamp from a job file to epoch seconds."""
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return time.time()
+
+
+class TranscriptionQueue:
+    """SQLite-backed transcription job queue shared by the web app and workers."""
+
+    def __init__(self, db_path=DEFAULT_QUEUE_PATH, mirror_dir=DEFAULT_MIRROR_DIR):
+        """
+        Initialize the queue.
+
+        Args:
+            db_path (str): Path to the SQLite database
+            mirror_dir (str): Directory for <job_id>.json mirrors (None to disable)
+        """
+        self.db_path = str(db_path)
+        self.mirror_dir = Path(mirror_dir) if mirror_dir else None
+        self._store = SQLiteStore(self.db_path, _SCHEMA, autocommit=True)
+
+    def _get_connection(self):
+        """Get this thread's SQLite connection."""
+        return self._store.connection()
+
+    @staticmethod
+    def _row_to_job(row):
+        """Merge a database row back into the job dict the rest of the app uses."""
+        job = json.loads(row['data'])
+        job.update({
+            'job_id': row['job_id'],
+            'space_id': row['space_id'],
+            'status': row['status'],
+            'progress': row['progress'],
+            'updated_at': datetime.fromtimestamp(row['updated_at']).isoformat(),
+            'result': json.loads(row['result']) if row['result'] else job.get('result'),
+            'error': row['error'] if row['error'] is not None else job.get('error'),
+            'attempts': row['attempts'],
+            'claimed_by': row['claimed_by'],
+            'cancel_requested': bool(row['cancel_requested'])
+        })
+        return job
+
+    def _write_mirror(self, job, directory=None):
+        """Atomically write a job's JSON mirror file."""
+        if not self.mirror_dir:
+            return
+        directory = Path(directory) if directory else self.mirror_dir
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=str(directory), prefix='.tmp-', suffix='.part')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(job, f, indent=2)
+            os.replace(temp_path, directory / f"{job['job_id']}.json")
+        except OSError as e:
+            logger.warning(f"Could not write job file for {job.get('job_id')}: {e}")
+
+    def _refresh_mirror(self, job_id):
+        """Rewrite a job's mirror from the database."""
+        job = self.get(job_id)
+        if job:
+            self._write_mirror(job)
+        return job
+
+    def enqueue(self, job_data):
+        """
+        Add a job to the queue.
+
+        Args:
+            job_data (dict): Job created by the web app; needs 'job_id' or 'id' and 'space_id'
+
+        Returns:
+            str: The job ID
+        """
+        job_id = job_data.get('job_id') or job_data.get('id')
+        now = time.time()
+        created_at = _parse_time(job_data['created_at']) if job_data.get('created_at') else now
+        data = dict(job_data, job_id=job_id, status=job_data.get('status', 'pending'))
+
+        connection = self._get_connection()
+        connection.execute(
+            """
+            INSERT OR IGNORE INTO jobs
+                (job_id, space_id, status, model, progress, created_at, updated_at, data)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (job_id, data['space_id'], data['status'], job_model(data),
+             data.get('progress', 0) or 0, created_at, now, json.dumps(data))
+        )
+        self._refresh_mirror(job_id)
+        return job_id
+
+    def claim(self, worker_id, prefer_model=None):
+        """
+        Atomically take the next pending job.
+
+        Args:
+            worker_id (str): Identifies the claiming worker
+            prefer_model (str, optional): Take the oldest job for this model
+                                          first, if there is one
+
+        Returns:
+            dict: The claimed job, or None if the queue is empty
+        """
+        connection = self._get_connection()
+        now = time.time()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = None
+            if prefer_model:
+                row = connection.execute(
+                    "SELECT job_id FROM jobs WHERE status = 'pending' AND model = ? "
+                    "ORDER BY created_at LIMIT 1", (prefer_model,)
+                ).fetchone()
+            if row is None:
+                row = connection.execute(
+                    "SELECT job_id FROM jobs WHERE status = 'pending' ORDER BY created_at LIMIT 1"
+                ).fetchone()
+            if row is None:
+                connection.execute("COMMIT")
+                return None
+
+            connection.execute(
+                """
+                UPDATE jobs SET status = 'processing', claimed_by = ?, heartbeat_at = ?,
+                    updated_at = ?, attempts = attempts + 1
+                WHERE job_id = ?
+                """,
+                (worker_id, now, now, row['job_id'])
+            )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+        return self._refresh_mirror(row['job_id'])
+
+    def heartbeat(self, job_id, worker_id):
+        """
+        Record that a worker is still processing a job.
+
+        Args:
+            job_id (str): The job ID
+            worker_id (str): The worker holding the job
+
+        Returns:
+            bool: True if the job has been cancelled or is no longer held by this
+                  worker, and the worker should stop
+        """
+        connection = self._get_connection()
+        now = time.time()
+        cursor = connection.execute(
+            "UPDATE jobs SET heartbeat_at = ? WHERE job_id = ? AND claimed_by = ? AND status = 'processing'",
+            (now, job_id, worker_id)
+        )
+        if cursor.rowcount == 0:
+            # Cancelled, or requeued and claimed elsewhere after this worker went quiet
+            return True
+        return self.is_cancel_requested(job_id)
+
+    @contextmanager
+    def keep_alive(self, job_id, worker_id, interval=60):
+        """
+        Send heartbeats for a job from a background thread while the block runs.
+
+        Args:
+            job_id (str): The job ID
+            worker_id (str): The worker holding the job
+            interval (float): Seconds between heartbeats; keep well under
+                              requeue_stale()'s timeout
+        """
+        done = threading.Event()
+
+        def beat():
+            while not done.wait(interval):
+                try:
+                    if self.heartbeat(job_id, worker_id):
+                        return
+                except Exception as e:
+                    logger.warning(f"Heartbeat failed for job {job_id}: {e}")
+
+        thread = threading.Thread(target=beat, name=f"heartbeat-{job_id}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            done.set()
+
+    def update(self, job_id, status, progress=None, result=None, error=None, worker_id=None):
+        """
+        Update a job's status.
+
+        Args:
+            job_id (str): The job ID
+            status (str): New status (pending, processing, completed, failed, cancelled)
+            progress (float, optional): Progress percentage (0-100)
+            result (dict, optional): Result data
+            error (str, optional): Error message
+            worker_id (str, optional): When given, only update the job while this
+                                       worker holds it and it is still processing
+
+        Returns:
+            bool: True if the job was updated
+        """
+        connection = self._get_connection()
+        assignments = ['status = ?', 'updated_at = ?']
+        params = [status, time.time()]
+        if progress is not None:
+            assignments.append('progress = ?')
+            params.append(progress)
+        if result is not None:
+            assignments.append('result = ?')
+            params.append(json.dumps(result))
+        if error is not None:
+            assignments.append('error = ?')
+            params.append(error)
+        if status == 'processing':
+            assignments.append('heartbeat_at = ?')
+            params.append(time.time())
+        params.append(job_id)
+
+        # A cancelled job stays cancelled even if its worker reports progress late
+        conditions = "AND (status != 'cancelled' OR ? = 'cancelled')"
+        params.append(status)
+        if worker_id is not None:
+            # A worker whose job was requeued and claimed elsewhere cannot overwrite it
+            conditions += " AND claimed_by = ? AND status = 'processing'"
+            params.append(worker_id)
+        cursor = connection.execute(
+            f"UPDATE jobs SET {', '.join(assignments)} WHERE job_id = ? {conditions}", params
+        )
+        if cursor.rowcount:
+            self._refresh_mirror(job_id)
+        return cursor.rowcount > 0
+
+    def request_cancel(self, job_id, error='Cancelled by admin'):
+        """
+        Cancel a job. Pending jobs stop immediately; running jobs are flagged
+        and their worker stops at its next check.
+
+        Args:
+            job_id (str): The job ID
+            error (str): Message recorded on the job
+
+        Returns:
+            bool: True if the job was pending or processing
+        """
+        connection = self._get_connection()
+        cursor = connection.execute(
+            """
+            UPDATE jobs SET cancel_requested = 1, status = 'cancelled', error = ?, updated_at = ?
+            WHERE job_id = ? AND status IN ('pending', 'processing')
+            """,
+            (error, time.time(), job_id)
+        )
+        if cursor.rowcount:
+            self._refresh_mirror(job_id)
+        return cursor.rowcount > 0
+
+    def is_cancel_requested(self, job_id):
+        """Check whether a job has been cancelled."""
+        row = self._get_connection().execute(
+            "SELECT cancel_requested, status FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return bool(row and (row['cancel_requested'] or row['status'] == 'cancelled'))
+
+    def get(self, job_id):
+        """
+        Get a job, including archived ones.
+
+        Args:
+            job_id (str): The job ID
+
+        Returns:
+            dict: Job data, or None if unknown
+        """
+        connection = self._get_connection()
+        row = connection.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            row = connection.execute("SELECT * FROM jobs_archive WHERE job_id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def find_active(self, space_id):
+        """
+        Get the pending or processing job for a space, if any.
+
+        Args:
+            space_id (str): The space ID
+
+        Returns:
+            dict: Job data, or None
+        """
+        row = self._get_connection().execute(
+            "SELECT * FROM jobs WHERE space_id = ? AND status IN ('pending', 'processing') "
+            "ORDER BY created_at LIMIT 1", (space_id,)
+        ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def list_jobs(self, statuses=None, since=None, limit=100, newest_first=False):
+        """
+        List jobs by status.
+
+        Args:
+            statuses (list, optional): Statuses to include (default: all)
+            since (float, optional): Only jobs updated after this epoch time
+            limit (int): Maximum number of jobs
+            newest_first (bool): Order by last update, newest first, instead of creation
+
+        Returns:
+            list: Job dicts
+        """
+        query = "SELECT * FROM jobs"
+        conditions = []
+        params = []
+        if statuses:
+            conditions.append(f"status IN ({', '.join('?' for _ in statuses)})")
+            params.extend(statuses)
+        if since is not None:
+            conditions.append("updated_at >= ?")
+            params.append(since)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY updated_at DESC" if newest_first else " ORDER BY created_at"
+        query += " LIMIT ?"
+        params.append(limit)
+
+        rows = self._get_connection().execute(query, params).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def counts(self):
+        """Count jobs per status."""
+        rows = self._get_connection().execute(
+            "SELECT status, COUNT(*) AS count FROM jobs GROUP BY status"
+        ).fetchall()
+        return {row['status']: row['count'] for row in rows}
+
+    def requeue_stale(self, timeout_seconds=600, max_attempts=3):
+        """
+        Return jobs whose worker stopped sending heartbeats to the queue.
+
+        Args:
+            timeout_seconds (int): Heartbeat age after which a worker is presumed dead
+            max_attempts (int): Jobs claimed this many times are failed instead
+
+        Returns:
+            int: Number of jobs requeued or failed
+        """
+        connection = self._get_connection()
+        cutoff = time.time() - timeout_seconds
+        stale = connection.execute(
+            "SELECT job_id, attempts, claimed_by FROM jobs WHERE status = 'processing' AND heartbeat_at < ?",
+            (cutoff,)
+        ).fetchall()
+
+        for row in stale:
+            if row['attempts'] >= max_attempts:
+                new_status, error = 'failed', f"Worker {row['claimed_by']} stopped responding ({row['attempts']} attempts)"
+            else:
+                new_status, error = 'pending', None
+            connection.execute(
+                "UPDATE jobs SET status = ?, error = COALESCE(?, error), claimed_by = NULL, updated_at = ? "
+                "WHERE job_id = ? AND status = 'processing' AND heartbeat_at < ?",
+                (new_status, error, time.time(), row['job_id'], cutoff)
+            )
+            logger.warning(f"Job {row['job_id']} from {row['claimed_by']} was stale; now {new_status}")
+            self._refresh_mirror(row['job_id'])
+        return len(stale)
+
+    def archive_finished(self, older_than_seconds=7 * 86400):
+        """
+        Move finished jobs older than a cutoff to the archive table.
+
+        Their JSON mirrors move to <mirror_dir>/archive/ so directory scans
+        elsewhere stop growing with job history.
+
+        Args:
+            older_than_seconds (int): Minimum age since the last update
+
+        Returns:
+            int: Number of jobs archived
+        """
+        connection = self._get_connection()
+        cutoff = time.time() - older_than_seconds
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            rows = connection.execute(
+                "SELECT job_id FROM jobs WHERE status IN ('completed', 'failed', 'cancelled') AND updated_at < ?",
+                (cutoff,)
+            ).fetchall()
+            job_ids = [row['job_id'] for row in rows]
+            for job_id in job_ids:
+                connection.execute(
+                    "INSERT OR REPLACE INTO jobs_archive SELECT *, ? FROM jobs WHERE job_id = ?",
+                    (time.time(), job_id)
+                )
+                connection.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+        if self.mirror_dir:
+            archive_dir = self.mirror_dir / 'archive'
+            for job_id in job_ids:
+                source = self.mirror_dir / f"{job_id}.json"
+                if source.exists():
+                    archive_dir.mkdir(parents=True, exist_ok=True)
+                    try:
+                        os.replace(source, archive_dir / source.name)
+                    except OSError as e:
+                        logger.warning(f"Could not archive job file {source}: {e}")
+        if job_ids:
+            logger.info(f"Archived {len(job_ids)} finished transcription jobs")
+        return len(job_ids)
+
+    def remove(self, job_id):
+        """
+        Delete a finished job and its mirror file.
+
+        Args:
+            job_id (str): The job ID
+
+        Returns:
+            bool: True if a finished job was removed
+        """
+        cursor = self._get_connection().execute(
+            "DELETE FROM jobs WHERE job_id = ? AND status IN ('completed', 'failed', 'cancelled')", (job_id,)
+        )
+        if cursor.rowcount and self.mirror_dir:
+            mirror = self.mirror_dir / f"{job_id}.json"
+            if mirror.exists():
+                mirror.unlink()
+        return cursor.rowcount > 0
+
+    def clear(self):
+        """
+        Delete every job, live and archived, and their mirror files.
+
+        Returns:
+            int: Number of live jobs deleted
+        """
+        connection = self._get_connection()
+        job_ids = [row['job_id'] for row in connection.execute("SELECT job_id FROM jobs").fetchall()]
+        connection.execute("DELETE FROM jobs")
+        connection.execute("DELETE FROM jobs_archive")
+        if self.mirror_dir:
+            mirrors = [self.mirror_dir / f"{job_id}.json" for job_id in job_ids]
+            mirrors += (self.mirror_dir / 'archive').glob('*.json')
+            for mirror in mirrors:
+                if mirror.exists():
+                    mirror.unlink()
+        logger.info(f"Cleared {len(job_ids)} transcription jobs")
+        return len(job_ids)
+
+    def import_job_files(self, directory=None):
+        """
+        Load job files that are not in the database yet (one-off migration).
+
+        Video job files (*_video.json) are skipped.
+
+        Args:
+            directory (str, optional): Directory to scan (default: the mirror directory)
+
+        Returns:
+            int: Number of jobs imported
+        """
+        directory = Path(directory) if directory else self.mirror_dir
+        if not directory or not directory.exists():
+            return 0
+
+        connection = self._get_connection()
+        imported = 0
+        for job_file in directory.glob('*.json'):
+            if job_file.name.endswith('_video.json'):
+                continue
+            try:
+                with open(job_file, 'r') as f:
+                    job_data = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable job file {job_file}: {e}")
+                continue
+
+            job_id = job_data.get('job_id') or job_data.get('id') or job_file.stem
+            if not job_data.get('space_id'):
+                continue
+            if connection.execute("SELECT 1 FROM jobs WHERE job_id = ?", (job_id,)).fetchone():
+                continue
+
+            job_data['job_id'] = job_id
+            # A job that was mid-flight when the old worker stopped starts again
+            if job_data.get('status') in ('processing', 'in_progress'):
+                job_data['status'] = 'pending'
+            self.enqueue(job_data)
+            if job_data.get('result') or job_data.get('error'):
+                self.update(job_id, job_data['status'], result=job_data.get('result'), error=job_data.get('error'))
+            imported += 1
+
+        if imported:
+            logger.info(f"Imported {imported} transcription job files into the queue")
+        return imported
+
+
+# Global queue instance
+transcription_queue = TranscriptionQueue()
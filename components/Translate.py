@@ -3,11 +3,20 @@
 """Translation component for XSpace Downloader using AI providers."""
 
 import os
+import re
 import json
 import logging
 from typing import Dict, List, Optional, Union, Tuple
 from .AI import AI
 from .AICost import AICost
+from .TranslationMemory import join_segments, normalize_segment, split_segments, translation_memory
+from .Summarizer import Summarizer
+from .TranslationExecutor import get_translation_executor
+try:
+    from .TranscriptCache import TranscriptCache, transcript_cache
+except ImportError:
+    TranscriptCache = None
+    transcript_cache = None
 
 # Configure logging
 logging.basicConfig(
@@ -16,6 +25,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Matches the "[HH:MM:SS] text" lines of a segment batch sent to the provider
+_SEQUENCE_LINE = re.compile(r'^\[(\d{2}):(\d{2}):(\d{2})\]\s?(.*)$')
+_TIMECODE = re.compile(r'\[\d{2}:\d{2}:\d{2}\]')
+
+def _sequence_timecode(number: int) -> str:
+    """Number a segment with a timecode so the provider keeps segments on separate, ordered lines."""
+    return f"[{number // 3600 % 100:02d}:{number // 60 % 60:02d}:{number % 60:02d}]"
+
+def _get_summary_cache():
+    """Cache for section summaries, next to the transcript cache."""
+    if transcript_cache is None:
+        return None
+    return TranscriptCache(cache_dir=str(transcript_cache.cache_dir / 'summaries'),
+                           max_bytes=64 * 1024 * 1024)
+
 class Translate:
     """Translation component that uses AI providers for translation."""
     
@@ -30,6 +54,8 @@ class Translate:
         """
         self.config_file = config_file
         self.ai = None
+        self.memory = translation_memory  # Set to None to always translate whole texts
+        self.summary_cache = _get_summary_cache()  # Set to None to always summarize every section
         self.self_hosted = True  # Set to True to avoid API key warnings
         self.api_key = "configured"  # Fake value to avoid warnings
         self.api_url = "AI-powered translation"  # Descriptive value for web API
@@ -76,7 +102,8 @@ class Translate:
         """
         return self.available_languages
     
-    def translate(self, text: str, source_lang: str, target_lang: str, space_id: str = None, user_id: int = None) -> Tuple[bool, Union[str, Dict]]:
+    def translate(self, text: str, source_lang: str, target_lang: str, space_id: str = None, user_id: int = None,
+                  idempotency_key: str = None) -> Tuple[bool, Union[str, Dict]]:
         """
         Translate text from source language to target language.
         
@@ -86,6 +113,8 @@ class Translate:
             target_lang (str): The target language code (e.g., 'en', 'es')
             space_id (str, optional): Space ID for cost tracking
             user_id (int, optional): User ID for cost tracking
+            idempotency_key (str, optional): Stable key of the job's charge, so a
+                                             retried job is not charged twice
             
         Returns:
             Tuple[bool, Union[str, Dict]]: A tuple containing:
@@ -108,58 +137,28 @@ class Translate:
         problematic_languages = ['bn', 'ar', 'hi', 'th', 'ko', 'ja']
         
         try:
-            # Perform translation
-            success, result = self.ai.translate(source_lang, target_lang, text)
+            # Perform translation; segments already in the translation memory are not sent
+            success, result, sent_text = self._translate_with_memory(
+                self.ai.translate, self._memory_model(self.ai.get_provider_name(), getattr(self.ai.provider, 'model', None)),
+                source_lang, target_lang, text
+            )
             
-            # Track cost if space_id is provided and translation was successful
-            if success and space_id and self.ai_cost:
-                try:
-                    # Extract content and usage info
-                    if isinstance(result, dict) and 'content' in result:
-                        content = result['content']
-                        usage = result.get('usage', {})
-                        input_tokens = usage.get('input_tokens', 0)
-                        output_tokens = usage.get('output_tokens', 0)
-                    else:
-                        content = str(result)
-                        # Estimate tokens if no usage data
-                        input_tokens = self.ai_cost.estimate_tokens(text, is_input=True)
-                        output_tokens = self.ai_cost.estimate_tokens(content, is_input=False)
-                    
-                    # Get provider and model info
-                    provider = self.ai.get_provider_name().lower()
-                    model = getattr(self.ai.provider, 'model', 'unknown') if hasattr(self.ai, 'provider') else 'unknown'
-                    
-                    # Track cost
-                    cost_success, cost_message, cost = self.ai_cost.track_cost(
-                        space_id=space_id,
-                        action='translation',
-                        vendor=provider,
-                        model=model,
-                        input_tokens=input_tokens,
-                        output_tokens=output_tokens,
-                        user_id=user_id,
-                        source_language=source_lang,
-                        target_language=target_lang
-                    )
-                    
-                    if not cost_success:
-                        logger.warning(f"Cost tracking failed for translation: {cost_message}")
-                    
-                    # Return just the content, not the usage dict
-                    result = content
-                    
-                except Exception as cost_err:
-                    logger.warning(f"Error tracking translation cost: {cost_err}")
-                    # Continue with translation result even if cost tracking fails
+            if success:
+                provider = self.ai.get_provider_name().lower()
+                model = getattr(self.ai.provider, 'model', 'unknown') if hasattr(self.ai, 'provider') else 'unknown'
+                result = self._track_translation_cost(result, sent_text, provider, model, space_id, user_id,
+                                                      source_lang, target_lang, idempotency_key)
             
             # If translation failed or is for a problematic language, try with Claude if available
             if (not success or target_lang.lower() in problematic_languages) and hasattr(self, '_try_claude_fallback'):
                 logger.info(f"Attempting Claude fallback for {target_lang} translation")
-                claude_success, claude_result = self._try_claude_fallback(source_lang, target_lang, text)
+                claude_success, claude_result, claude_sent, claude_model = self._try_claude_fallback(
+                    source_lang, target_lang, text)
                 if claude_success:
                     logger.info(f"Claude fallback successful for {target_lang}")
-                    return True, claude_result
+                    return True, self._track_translation_cost(
+                        claude_result, claude_sent, 'claude', claude_model, space_id, user_id,
+                        source_lang, target_lang, f"{idempotency_key}:claude" if idempotency_key else None)
             
             return success, result
             
@@ -167,7 +166,154 @@ class Translate:
             logger.error(f"Translation error: {e}")
             return False, {"error": f"Translation error: {str(e)}"}
     
-    def _try_claude_fallback(self, source_lang: str, target_lang: str, text: str) -> Tuple[bool, Union[str, Dict]]:
+    def _track_translation_cost(self, result: Union[str, Dict], sent_text: str, vendor: str, model: str,
+                                space_id: Optional[str], user_id: Optional[int], source_lang: str,
+                                target_lang: str, idempotency_key: Optional[str]) -> str:
+        """
+        Record the cost of a successful translation and return its text.
+        
+        Args:
+            result (str or dict): Provider result, text or a dict with 'content' and 'usage'
+            sent_text (str): Text that was sent to the provider ('' if none was)
+            vendor (str): AI vendor
+            model (str): Model name
+            space_id (str, optional): Space ID; nothing is recorded without one
+            user_id (int, optional): User ID for cost tracking
+            source_lang (str): Source language code
+            target_lang (str): Target language code
+            idempotency_key (str, optional): Stable key of the charge
+            
+        Returns:
+            str: The translated text
+        """
+        content = result['content'] if isinstance(result, dict) else str(result)
+        if not (space_id and self.ai_cost and sent_text):
+            return content
+        
+        try:
+            usage = result.get('usage') if isinstance(result, dict) else None
+            if usage:
+                input_tokens = usage.get('input_tokens', 0)
+                output_tokens = usage.get('output_tokens', 0)
+            else:
+                # Estimate tokens if no usage data
+                input_tokens = self.ai_cost.estimate_tokens(sent_text, is_input=True)
+                output_tokens = self.ai_cost.estimate_tokens(content, is_input=False)
+            
+            cost_success, cost_message, cost = self.ai_cost.track_cost(
+                space_id=space_id,
+                action='translation',
+                vendor=vendor,
+                model=model,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                user_id=user_id,
+                source_language=source_lang,
+                target_language=target_lang,
+                idempotency_key=idempotency_key
+            )
+            if not cost_success:
+                logger.warning(f"Cost tracking failed for translation: {cost_message}")
+        except Exception as cost_err:
+            # Continue with translation result even if cost tracking fails
+            logger.warning(f"Error tracking translation cost: {cost_err}")
+        return content
+    
+    @staticmethod
+    def _memory_model(provider: str, model: Optional[str]) -> str:
+        """Name the provider and model that translation memory entries belong to."""
+        return f"{(provider or 'unknown').lower()}/{model or 'unknown'}"
+    
+    def _translate_with_memory(self, translate_fn, model: str, source_lang: str, target_lang: str,
+                               text: str) -> Tuple[bool, Union[str, Dict], str]:
+        """
+        Translate text segment by segment, sending only segments missing from the translation memory.
+        
+        Only timecoded transcripts use the memory. Their missing segments go to the
+        provider in one request as numbered "[HH:MM:SS] text" lines, which the provider's
+        timecode-preserving path already handles, and come back aligned. If the reply
+        cannot be matched back to the segments, the whole text is translated instead.
+        Plain text is translated as it is, so it keeps the provider's own prompts,
+        chunking and validation (e.g. for complex-script targets).
+        
+        Segments the provider left untranslated (reported in 'failed_lines', or returned
+        unchanged) are used for this result but not stored.
+        
+        Args:
+            translate_fn (callable): translate_fn(source_lang, target_lang, content) -> (success, result)
+            model (str): Provider and model the translations belong to
+            source_lang (str): Source language code
+            target_lang (str): Target language code
+            text (str): Text to translate
+            
+        Returns:
+            Tuple[bool, Union[str, Dict], str]: Success flag, translated text (or a dict with
+                'content' and 'usage') or error dict, and the text sent to the provider ('' if none)
+        """
+        if self.memory is None or not _TIMECODE.search(text):
+            success, result = translate_fn(source_lang, target_lang, text)
+            return success, result, text
+        
+        try:
+            segments = split_segments(text)
+            keys = [self.memory.make_key(segment.body, source_lang, target_lang, model) if segment.body.strip() else None
+                    for segment in segments]
+            found = self.memory.get_many([key for key in keys if key])
+        except Exception as e:
+            logger.warning(f"Translation memory unavailable, translating the whole text: {e}")
+            success, result = translate_fn(source_lang, target_lang, text)
+            return success, result, text
+        
+        # Each distinct missing segment is translated once
+        missing = {}
+        for segment, key in zip(segments, keys):
+            if key and key not in found and key not in missing:
+                missing[key] = normalize_segment(segment.body)
+        
+        total = sum(1 for key in keys if key)
+        logger.info(f"[TRANSLATION_MEMORY] {total - sum(1 for key in keys if key in missing)}/{total} segments "
+                    f"from memory, {len(missing)} to translate ({model}, {source_lang} -> {target_lang})")
+        
+        result = None
+        request = ''
+        if missing:
+            request = '\n'.join(f"{_sequence_timecode(number)} {body}" for number, body in enumerate(missing.values()))
+            success, result = translate_fn(source_lang, target_lang, request)
+            if not success:
+                return success, result, request
+            
+            lines = [line.strip() for line in (result['content'] if isinstance(result, dict) else str(result)).split('\n')
+                     if line.strip()]
+            matches = [_SEQUENCE_LINE.match(line) for line in lines]
+            if len(lines) != len(missing) or any(
+                    not match or f"[{match.group(1)}:{match.group(2)}:{match.group(3)}]" != _sequence_timecode(number)
+                    for number, match in enumerate(matches)):
+                logger.warning("[TRANSLATION_MEMORY] Segment reply did not line up, translating the whole text")
+                success, result = translate_fn(source_lang, target_lang, text)
+                return success, result, text
+            
+            translated = dict(zip(missing.keys(), (match.group(4).strip() for match in matches)))
+            found.update(translated)
+            
+            # Lines that failed keep their source text; storing them would serve it as a translation forever
+            failed = set(result.get('failed_lines') or []) if isinstance(result, dict) else set()
+            storable = [(key, translation) for number, (key, translation) in enumerate(translated.items())
+                        if number not in failed and normalize_segment(translation) != missing[key]]
+            if len(storable) < len(translated):
+                logger.warning(f"[TRANSLATION_MEMORY] Not storing {len(translated) - len(storable)} untranslated segments")
+            try:
+                self.memory.put_many(storable)
+            except Exception as e:
+                logger.warning(f"Could not store translated segments: {e}")
+        
+        content = join_segments(segments, [found.get(key, '') if key else segment.body
+                                           for segment, key in zip(segments, keys)])
+        if isinstance(result, dict) and result.get('usage'):
+            return True, {'content': content, 'usage': result['usage']}, request
+        return True, content, request
+    
+    def _try_claude_fallback(self, source_lang: str, target_lang: str,
+                             text: str) -> Tuple[bool, Union[str, Dict], str, Optional[str]]:
         """
         Try translation with Claude as fallback.
         
@@ -177,27 +323,37 @@ class Translate:
             text (str): Text to translate
             
         Returns:
-            Tuple[bool, Union[str, Dict]]: Success flag and result
+            Tuple[bool, Union[str, Dict], str, str]: Success flag, result (text, a dict with
+                'content' and 'usage', or an error dict), the text sent to Claude ('' if
+                none) and the Claude model
         """
         try:
-            from .Claude import Claude
-            import os
+            from .AI import get_shared_provider
+            from .AIGateway import ai_gateway
             
             # Check if Claude API key is available
             api_key = os.getenv('ANTHROPIC_API_KEY')
             if not api_key:
                 logger.warning("Claude fallback not available - no API key")
-                return False, {"error": "Claude API key not available"}
+                return False, {"error": "Claude API key not available"}, '', None
             
-            # Create Claude instance
-            claude = Claude(api_key)
+            # Reuse the shared Claude instance (and its pooled session)
+            claude = get_shared_provider('claude', api_key)
             
-            # Try translation with Claude
-            return claude.translate(source_lang, target_lang, text)
+            # Don't queue behind a provider whose circuit is open
+            if not ai_gateway.is_available('claude', claude.model):
+                logger.warning("Claude fallback skipped - circuit open")
+                return False, {"error": "Claude is temporarily unavailable", "circuit_open": True}, '', claude.model
+            
+            # Try translation with Claude, reusing its earlier segment translations
+            success, result, sent_text = self._translate_with_memory(
+                claude.translate, self._memory_model('claude', claude.model), source_lang, target_lang, text
+            )
+            return success, result, sent_text, claude.model
             
         except Exception as e:
             logger.error(f"Claude fallback error: {e}")
-            return False, {"error": f"Claude fallback error: {str(e)}"}
+            return False, {"error": f"Claude fallback error: {str(e)}"}, '', None
     
     def detect_language(self, text: str) -> Tuple[bool, Union[str, Dict]]:
         """
@@ -256,16 +412,29 @@ class Translate:
             logger.error(f"Language detection error: {e}")
             return False, {"error": f"Language detection error: {str(e)}"}
     
-    def summary(self, content: str, max_length: int = None, language: str = None, space_id: str = None, user_id: int = None) -> Tuple[bool, Union[str, Dict]]:
+    def _provider_summary(self, content: str, max_length: int = None, language: str = None) -> Tuple[bool, Union[str, Dict]]:
+        """Make one summary call to the AI provider, passing the language if it accepts one."""
+        import inspect
+        if 'language' in inspect.signature(self.ai.summary).parameters:
+            return self.ai.summary(content, max_length, language)
+        return self.ai.summary(content, max_length)
+    
+    def summary(self, content: str, max_length: int = None, language: str = None, space_id: str = None, user_id: int = None,
+                on_progress=None) -> Tuple[bool, Union[str, Dict]]:
         """
         Generate a summary of the given content using AI.
         
+        Long content is summarized section by section in parallel, then the section
+        summaries are combined (see Summarizer); section summaries are cached, so a
+        re-summary at another length or in another language only pays for the last step.
+        
         Args:
             content (str): Content to summarize
             max_length (int, optional): Maximum length of summary in words
             language (str, optional): Language for the summary output
             space_id (str, optional): Space ID for cost tracking
             user_id (int, optional): User ID for cost tracking
+            on_progress (callable, optional): on_progress(percent, stage) for background jobs
             
         Returns:
             Tuple[bool, Union[str, Dict]]: Success flag and summary or error dict
@@ -280,16 +449,13 @@ class Translate:
             return False, {"error": "No content provided for summarization"}
         
         try:
-            # Check if the AI provider's summary method accepts language parameter
-            import inspect
-            sig = inspect.signature(self.ai.summary)
-            params = sig.parameters
+            provider = self.ai.get_provider_name().lower()
+            model = getattr(self.ai.provider, 'model', 'unknown') if hasattr(self.ai, 'provider') else 'unknown'
+            summarizer = Summarizer(self._provider_summary, model=self._memory_model(provider, model),
+                                    executor=get_translation_executor(provider), cache=self.summary_cache)
             
             # Perform summarization
-            if 'language' in params:
-                success, result = self.ai.summary(content, max_length, language)
-            else:
-                success, result = self.ai.summary(content, max_length)
+            success, result = summarizer.summarize(content, max_length, language, on_progress=on_progress)
             
             # Track cost if space_id is provided and summarization was successful
             if success and space_id and self.ai_cost:
@@ -306,10 +472,6 @@ class Translate:
                         input_tokens = self.ai_cost.estimate_tokens(content, is_input=True)
                         output_tokens = self.ai_cost.estimate_tokens(summary_content, is_input=False)
                     
-                    # Get provider and model info
-                    provider = self.ai.get_provider_name().lower()
-                    model = getattr(self.ai.provider, 'model', 'unknown') if hasattr(self.ai, 'provider') else 'unknown'
-                    
                     # Track cost
                     cost_success, cost_message, cost = self.ai_cost.track_cost(
                         space_id=space_id,
@@ -331,6 +493,10 @@ class Translate:
                     logger.warning(f"Error tracking summary cost: {cost_err}")
                     # Continue with summary result even if cost tracking fails
             
+            # Always hand back plain text
+            if success and isinstance(result, dict) and 'content' in result:
+                result = result['content']
+            
             return success, result
         except Exception as e:
             logger.error(f"Summarization error: {e}")
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+# components/TranslationExecutor.py
+"""
+Translation Executor Component for XSpace Downloader
+
+Runs the chunks of a long translation concurrently and reassembles them in
+order, so a multi-hour transcript takes about as long as its slowest chunk
+rather than the sum of all of them.
+
+- Each provider (OpenAI, Claude) gets one shared executor with its own
+  request and token budgets, so concurrent translations of different spaces
+  and languages stay inside the provider's rate limits together
+- Failed chunks are retried individually with backoff; callers decide what
+  to do with a chunk that still fails
+- Timecoded transcripts are translated in batches of whole lines; a batch
+  whose reply does not keep every line's [HH:MM:SS] timecode is translated
+  again line by line, so timecode alignment is never lost
+
+Usage Examples:
+
+    from components.TranslationExecutor import get_translation_executor
+
+    executor = get_translation_executor('openai')
+    results = executor.run(chunks, lambda index, chunk: provider_call(chunk))
+"""
+
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from components.RateLimiter import TokenBucket, retry_with_backoff
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('translation_executor')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# Rough characters per token for sizing budgets and max_tokens
+CHARS_PER_TOKEN = 4
+
+# Per-provider concurrency and budgets (requests and tokens per minute)
+PROVIDER_LIMITS = {
+    'openai': {'max_workers': 8, 'requests_per_minute': 500, 'tokens_per_minute': 200000},
+    'claude': {'max_workers': 4, 'requests_per_minute': 50, 'tokens_per_minute': 40000},
+}
+DEFAULT_LIMITS = {'max_workers': 4, 'requests_per_minute': 60, 'tokens_per_minute': 60000}
+
+TIMECODE_LINE_PATTERN = re.compile(r'^(\[\d{2}:\d{2}:\d{2}\])\s*(.*)$')
+
+TranslationResult = Tuple[bool, Union[str, Dict]]
+
+
+class ChunkFailed(Exception):
+    """A chunk's provider call returned an error; carries the error result."""
+
+    def __init__(self, result):
+        super().__init__(result.get('error', result) if isinstance(result, dict) else result)
+        self.result = result
+
+
+def response_text(result: Union[str, Dict]) -> str:
+    """
+    Get the text from a provider result.
+
+    Args:
+        result: Provider result (plain text, or a dict with 'content' and 'usage')
+
+    Returns:
+        str: Response text
+    """
+    if isinstance(result, dict):
+        return result.get('content', '') or ''
+    return result or ''
+
+
+def merge_usage(results: Sequence[Union[str, Dict]]) -> Dict[str, int]:
+    """
+    Add up the token usage reported by several provider results.
+
+    Args:
+        results (list): Provider results; plain-text results carry no usage
+
+    Returns:
+        dict: input_tokens, output_tokens and total_tokens
+    """
+    usage = {'input_tokens': 0, 'output_tokens': 0, 'total_tokens': 0}
+    for result in results:
+        if isinstance(result, dict):
+            for key in usage:
+                usage[key] += int((result.get('usage') or {}).get(key, 0) or 0)
+    return usage
+
+
+def split_sentence_chunks(content: str, chunk_words: int) -> List[str]:
+    """
+    Group sentences into chunks of up to chunk_words words.
+
+    Args:
+        content (str): Text to split (newlines are treated as spaces)
+        chunk_words (int): Maximum words per chunk (a single longer sentence is kept whole)
+
+    Returns:
+        list: Chunks in text order
+    """
+    sentences = content.replace('\n', ' ').split('. ')
+    chunks = []
+    current_chunk = ""
+    for sentence in sentences:
+        if len(current_chunk.split()) + len(sentence.split()) > chunk_words:
+            if current_chunk:
+                chunks.append(current_chunk.strip())
+            current_chunk = sentence
+        else:
+            current_chunk += (". " if current_chunk else "") + sentence
+    if current_chunk:
+        chunks.append(current_chunk.strip())
+    return chunks
+
+
+def clean_translation(text: str) -> str:
+    """Remove segment markers and markdown emphasis a model may add to a line."""
+    text = re.sub(r'###SEGMENT_\d+###\s*', '', (text or '').strip())
+    text = re.sub(r'\*+.*?\*+', '', text)
+    return text.strip()
+
+
+def group_lines(lines: List[str], max_chars: int, max_lines: int) -> List[List[int]]:
+    """
+    Group lines into batches by size.
+
+    Args:
+        lines (list): Lines to group
+        max_chars (int): Target maximum characters per batch
+        max_lines (int): Maximum lines per batch
+
+    Returns:
+        list: Batches as lists of line indexes, in order
+    """
+    batches = []
+    current = []
+    current_chars = 0
+    for index, line in enumerate(lines):
+        if current and (current_chars + len(line) > max_chars or len(current) >= max_lines):
+            batches.append(current)
+            current = []
+            current_chars = 0
+        current.append(index)
+        current_chars += len(line) + 1
+    if current:
+        batches.append(current)
+    return batches
+
+
+def align_timecoded_lines(source_lines: List[str], reply: str) -> Optional[List[str]]:
+    """
+    Match a batch reply back to its source lines.
+
+    Args:
+        source_lines (list): Lines sent for translation
+        reply (str): Model reply
+
+    Returns:
+        list: Translated lines, one per source line with the source timecode restored,
+              or None if the reply lost, added, reordered or changed timecodes
+    """
+    reply_lines = [line.strip() for line in (reply or '').split('\n') if line.strip()]
+    if len(reply_lines) != len(source_lines):
+        return None
+
+    aligned = []
+    for source, translated in zip(source_lines, reply_lines):
+        source_match = TIMECODE_LINE_PATTERN.match(source)
+        translated_match = TIMECODE_LINE_PATTERN.match(translated)
+        if source_match:
+            if not translated_match or translated_match.group(1) != source_match.group(1):
+                return None
+            text = clean_translation(translated_match.group(2))
+            if not text:
+                return None
+            aligned.append(f"{source_match.group(1)} {text}")
+        else:
+            if translated_match:
+                return None
+            text = clean_translation(translated)
+            if not text:
+                return None
+            aligned.append(text)
+    return aligned
+
+
+class TranslationExecutor:
+    """Runs translation chunks concurrently under shared request and token budgets."""
+
+    def __init__(self, name: str = 'provider', max_workers: int = 4, requests_per_minute: float = 60,
+                 tokens_per_minute: Optional[float] = None, max_retries: int = 3):
+        """
+        Initialize the executor.
+
+        Args:
+            name (str): Provider name used in log messages
+            max_workers (int): Chunks in flight at the same time for one run
+            requests_per_minute (float): Request budget shared by every run
+            tokens_per_minute (float, optional): Token budget shared by every run (None for no limit)
+            max_retries (int): Attempts per chunk
+        """
+        self.name = name
+        self.max_workers = max(1, int(max_workers))
+        self.max_retries = max(1, int(max_retries))
+        self.requests = TokenBucket(rate_per_minute=requests_per_minute, burst=self.max_workers)
+        self.tokens = TokenBucket(rate_per_minute=tokens_per_minute, burst=int(tokens_per_minute)) \
+            if tokens_per_minute else None
+
+    def _acquire(self, tokens: int):
+        """Wait for a request slot and the chunk's share of the token budget."""
+        self.requests.acquire()
+        if self.tokens is not None and tokens > 0:
+            self.tokens.acquire(min(float(tokens), self.tokens.capacity))
+
+    def _run_one(self, index: int, count: int, item, translate: Callable, tokens: int,
+                 description: str) -> TranslationResult:
+        """Translate one chunk, retrying failures; never raises."""
+        def attempt():
+            success, result = translate(index, item)
+            if success:
+                return success, result
+            if isinstance(result, dict) and any(result.get(flag) for flag in
+                                                ('should_chunk', 'circuit_open', 'busy', 'attempts')):
+                # Too large, refused by the AI gateway, or already retried there
+                return success, result
+            raise ChunkFailed(result)
+
+        try:
+            return retry_with_backoff(attempt, attempts=self.max_retries, base_delay=2.0,
+                                      retry_on=(ChunkFailed,), before_attempt=lambda: self._acquire(tokens),
+                                      description=f"{description} {index + 1}/{count}")
+        except ChunkFailed as e:
+            logger.error(f"{description} {index + 1}/{count} failed after {self.max_retries} attempts: {e}")
+            return False, e.result
+        except Exception as e:
+            logger.error(f"{description} {index + 1}/{count} failed: {e}")
+            return False, {"error": f"Unexpected error: {str(e)}"}
+
+    def run(self, items: Sequence, translate: Callable[[int, object], TranslationResult],
+            estimate_tokens: Optional[Callable[[object], int]] = None,
+            description: str = '[TRANSLATE] Chunk') -> List[TranslationResult]:
+        """
+        Translate items concurrently.
+
+        Args:
+            items (list): Chunks to translate
+            translate (callable): translate(index, item) -> (success, result), one provider call
+            estimate_tokens (callable, optional): estimate_tokens(item) -> tokens the call will
+                                                  use (prompt and reply), charged to the token budget
+            description (str): Label used in log messages
+
+        Returns:
+            list: (success, result) for every item, in the order of items
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        costs = [int(estimate_tokens(item)) if estimate_tokens else 0 for item in items]
+        workers = min(self.max_workers, len(items))
+        logger.info(f"{description}: {len(items)} queued for {self.name} ({workers} concurrent)")
+
+        if workers == 1:
+            return [self._run_one(index, len(items), item, translate, costs[index], description)
+                    for index, item in enumerate(items)]
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(self._run_one, index, len(items), item, translate, costs[index], description)
+                       for index, item in enumerate(items)]
+            return [future.result() for future in futures]
+
+
+def translate_timecoded(executor: TranslationExecutor, content: str,
+                        translate_batch: Callable[[List[str]], TranslationResult],
+                        translate_line: Callable[[str], TranslationResult],
+                        recover_line: Optional[Callable[[str], TranslationResult]] = None,
+                        batch_chars: int = 6000, batch_lines: int = 60) -> Tuple[str, List[Union[str, Dict]], List[int]]:
+    """
+    Translate a timecoded transcript, keeping every line's timecode.
+
+    Lines are translated in concurrent batches. A batch that fails or whose reply
+    does not line up with its timecodes is translated again line by line
+    (concurrently); a line that still fails goes to recover_line if given, and
+    otherwise keeps its original text.
+
+    Args:
+        executor (TranslationExecutor): Provider executor
+        content (str): Transcript with "[HH:MM:SS] text" lines
+        translate_batch (callable): translate_batch(lines) -> (success, result) for a block of lines
+        translate_line (callable): translate_line(text) -> (success, result) for one line's text
+        recover_line (callable, optional): recover_line(text) -> (success, result), last resort
+        batch_chars (int): Target maximum characters per batch
+        batch_lines (int): Maximum lines per batch
+
+    Returns:
+        tuple: (translated transcript, provider results used for usage accounting,
+                indices of the transcript's non-empty lines left untranslated)
+    """
+    lines = [line.strip() for line in content.strip().split('\n') if line.strip()]
+    output = list(lines)
+    responses = []
+    failed = []
+
+    # Timecodes with no text are kept as they are and never sent
+    pending = []
+    for index, line in enumerate(lines):
+        match = TIMECODE_LINE_PATTERN.match(line)
+        if match and not match.group(2).strip():
+            output[index] = match.group(1)
+        else:
+            pending.append(index)
+
+    batches = [[pending[position] for position in batch]
+               for batch in group_lines([lines[index] for index in pending], batch_chars, batch_lines)]
+
+    def run_batch(_, batch):
+        source = [lines[index] for index in batch]
+        success, result = translate_batch(source)
+        if not success:
+            return success, result
+        aligned = align_timecoded_lines(source, response_text(result))
+        if aligned is None:
+            return False, {"error": "Translated batch did not keep its timecodes", "response": result}
+        return True, {'lines': aligned, 'response': result}
+
+    batch_results = executor.run(batches, run_batch,
+                                 estimate_tokens=lambda batch: sum(len(lines[i]) for i in batch) * 3 // CHARS_PER_TOKEN,
+                                 description='[TRANSLATE] Timecoded batch')
+
+    retry_indexes = []
+    for batch, (success, result) in zip(batches, batch_results):
+        if success:
+            for index, line in zip(batch, result['lines']):
+                output[index] = line
+            responses.append(result['response'])
+        else:
+            if isinstance(result, dict) and 'response' in result:
+                responses.append(result['response'])
+            retry_indexes.extend(batch)
+
+    if retry_indexes:
+        logger.warning(f"[TRANSLATE] {len(retry_indexes)} lines from failed batches will be translated one by one")
+
+        def split_line(index):
+            match = TIMECODE_LINE_PATTERN.match(lines[index])
+            return (match.group(1), match.group(2).strip()) if match else (None, lines[index])
+
+        line_results = executor.run(retry_indexes, lambda _, index: translate_line(split_line(index)[1]),
+                                    estimate_tokens=lambda index: len(lines[index]) * 3 // CHARS_PER_TOKEN,
+                                    description='[TRANSLATE] Line')
+
+        for index, (success, result) in zip(retry_indexes, line_results):
+            timecode, text = split_line(index)
+            if not success and recover_line:
+                logger.warning(f"[TRANSLATE] Recovering line {index + 1} with strict prompts")
+                success, result = recover_line(text)
+            translated = clean_translation(response_text(result)) if success else ''
+            if success:
+                responses.append(result)
+            if translated:
+                output[index] = f"{timecode} {translated}" if timecode else translated
+            else:
+                logger.warning(f"Failed to translate line: {lines[index]}")
+                failed.append(index)
+
+    return '\n'.join(output), responses, sorted(failed)
+
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def get_translation_executor(provider: str) -> TranslationExecutor:
+    """
+    Get the shared executor for a provider.
+
+    Args:
+        provider (str): Provider name ('openai', 'claude')
+
+    Returns:
+        TranslationExecutor: One instance per provider for the whole process
+    """
+    key = (provider or '').lower()
+    with _executors_lock:
+        if key not in _executors:
+            limits = PROVIDER_LIMITS.get(key, DEFAULT_LIMITS)
+            _executors[key] = TranslationExecutor(name=key or 'provider', **limits)
+        return _executors[key]
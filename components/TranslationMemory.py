@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# components/TranslationMemory.py
+"""
+Segment-level translation memory for XSpace Downloader.
+
+Keeps an SQLite sidecar database of translated segments so re-translating a
+corrected transcript, an overlapping clip or a summary only sends the parts
+that actually changed to the AI provider.
+
+- A transcript is cut into segments: one per line, and long untimed lines
+  are cut further into groups of sentences at content-defined boundaries, so
+  an edit only changes the segments around it
+- Segments are keyed by a hash of the normalised text, source and target
+  language and provider/model; values are compressed (zstd when the
+  zstandard package is installed, zlib otherwise)
+- Hit and miss counters are kept in the database, so the hit rate covers
+  the web app and the background workers together
+
+Usage:
+    from components.TranslationMemory import translation_memory, split_segments
+
+    segments = split_segments(transcript_text)
+    keys = [translation_memory.make_key(s.body, 'en', 'es', 'openai/gpt-4o-mini') for s in segments]
+    found = translation_memory.get_many(keys)
+"""
+
+import re
+import time
+import zlib
+import hashlib
+import logging
+import unicodedata
+from typing import NamedTuple
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+from components.SQLiteStore import SQLiteStore
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('translation_memory')
+except ImportError:
+    logger = logging.getLogger(__name__)
+
+# Default location of the sidecar database
+DEFAULT_MEMORY_PATH = './data/translation_memory.db'
+
+# Bump when segmentation or normalisation changes so old entries are not reused
+TRANSLATION_MEMORY_VERSION = 1
+
+# Untimed lines longer than this are cut into sentence groups
+SEGMENT_MAX_CHARS = 1200
+
+# Sentence groups are not cut before this many characters
+SEGMENT_MIN_CHARS = 300
+
+# Value codecs
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+
+# SQLite limits the number of bound parameters per statement
+_LOOKUP_BATCH = 500
+
+_TIMECODE_LINE = re.compile(r'^(\s*\[\d{1,2}:\d{2}:\d{2}\]\s*)(.*)$')
+_SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+')
+_WHITESPACE = re.compile(r'\s+')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS segments (
+    key BLOB PRIMARY KEY,
+    codec INTEGER NOT NULL,
+    value BLOB NOT NULL,
+    created_at REAL NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+class Segment(NamedTuple):
+    """One translatable piece of a text: prefix + body + joiner rebuilds the original."""
+    prefix: str
+    body: str
+    joiner: str
+
+
+def normalize_segment(text):
+    """
+    Normalise segment text for hashing.
+
+    Args:
+        text (str): Segment text
+
+    Returns:
+        str: NFC text with whitespace runs collapsed and ends trimmed
+    """
+    return _WHITESPACE.sub(' ', unicodedata.normalize('NFC', text or '')).strip()
+
+
+def _sentence_groups(text):
+    """Cut a long line into sentence groups at content-defined boundaries."""
+    groups = []
+    current = []
+    length = 0
+    for sentence in _SENTENCE_BREAK.split(text):
+        current.append(sentence)
+        length += len(sentence) + 1
+        # The boundary depends on the sentence itself, not its position, so an
+        # edit early in the line does not shift every later boundary
+        boundary = zlib.crc32(normalize_segment(sentence).encode('utf-8')) % 4 == 0
+        if length >= SEGMENT_MAX_CHARS or (length >= SEGMENT_MIN_CHARS and boundary):
+            groups.append(' '.join(current))
+            current = []
+            length = 0
+    if current:
+        groups.append(' '.join(current))
+    return groups
+
+
+def split_segments(text):
+    """
+    Cut a text into segments.
+
+    Every line is a segment; a "[HH:MM:SS]" timecode stays in the prefix so
+    only the words are translated. Untimed lines longer than SEGMENT_MAX_CHARS
+    are cut into sentence groups. Blank lines become segments with an empty body.
+
+    Args:
+        text (str): Transcript or other text
+
+    Returns:
+        list: Segments; ''.join(prefix + body + joiner) gives back the text
+    """
+    segments = []
+    lines = (text or '').split('\n')
+    for index, line in enumerate(lines):
+        end = '\n' if index < len(lines) - 1 else ''
+        match = _TIMECODE_LINE.match(line)
+        if match:
+            segments.append(Segment(match.group(1), match.group(2), end))
+        elif len(line) > SEGMENT_MAX_CHARS:
+            groups = _sentence_groups(line)
+            for position, group in enumerate(groups):
+                segments.append(Segment('', group, ' ' if position < len(groups) - 1 else end))
+        else:
+            segments.append(Segment('', line, end))
+    return segments
+
+
+def join_segments(segments, bodies):
+    """
+    Rebuild a text from segments with new bodies.
+
+    Args:
+        segments (list): Segments from split_segments()
+        bodies (list): One body per segment
+
+    Returns:
+        str: Rebuilt text
+    """
+    return ''.join(segment.prefix + body + segment.joiner for segment, body in zip(segments, bodies))
+
+
+def _compress(text):
+    """Compress a value, returning (codec, bytes)."""
+    data = text.encode('utf-8')
+    if len(data) < 64:
+        return CODEC_RAW, data
+    if ZSTD_AVAILABLE:
+        packed = zstandard.ZstdCompressor(level=9).compress(data)
+        codec = CODEC_ZSTD
+    else:
+        packed = zlib.compress(data, 9)
+        codec = CODEC_ZLIB
+    return (codec, packed) if len(packed) < len(data) else (CODEC_RAW, data)
+
+
+def _decompress(codec, data):
+    """Decompress a stored value."""
+    data = bytes(data)
+    if codec == CODEC_ZSTD:
+        if not ZSTD_AVAILABLE:
+            raise ValueError("zstandard is not installed")
+        data = zstandard.ZstdDecompressor().decompress(data)
+    elif codec == CODEC_ZLIB:
+        data = zlib.decompress(data)
+    return data.decode('utf-8')
+
+
+class TranslationMemory:
+    """Compressed, hash-keyed store of translated segments."""
+
+    def __init__(self, db_path=DEFAULT_MEMORY_PATH):
+        """
+        Initialize the translation memory.
+
+        Args:
+            db_path (str): Path to the SQLite sidecar database
+        """
+        self.db_path = str(db_path)
+        self._store = SQLiteStore(self.db_path, _SCHEMA, row_factory=False)
+
+    def _get_connection(self):
+        """Get this thread's SQLite connection."""
+        return self._store.connection()
+
+    @staticmethod
+    def make_key(text, source_lang, target_lang, model):
+        """
+        Build the memory key for a segment.
+
+        Args:
+            text (str): Segment text
+            source_lang (str): Source language code
+            target_lang (str): Target language code
+            model (str): Provider and model, e.g. 'openai/gpt-4o-mini'
+
+        Returns:
+            bytes: 16-byte key
+        """
+        material = '\x00'.join([str(TRANSLATION_MEMORY_VERSION), (source_lang or '').lower(),
+                                (target_lang or '').lower(), model or '', normalize_segment(text)])
+        return hashlib.sha256(material.encode('utf-8')).digest()[:16]
+
+    def _count(self, connection, hits, misses):
+        """Add to the persistent hit and miss counters."""
+        connection.executemany(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            [('hits', hits), ('misses', misses)]
+        )
+
+    def get_many(self, keys):
+        """
+        Look up segments, counting hits and misses.
+
+        Args:
+            keys (list): Keys from make_key()
+
+        Returns:
+            dict: {key: translated text} for the keys that were found
+        """
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return {}
+
+        connection = self._get_connection()
+        found = {}
+        for start in range(0, len(unique), _LOOKUP_BATCH):
+            batch = unique[start:start + _LOOKUP_BATCH]
+            placeholders = ','.join('?' * len(batch))
+            rows = connection.execute(
+                f"SELECT key, codec, value FROM segments WHERE key IN ({placeholders})", batch
+            ).fetchall()
+            for key, codec, value in rows:
+                try:
+                    found[bytes(key)] = _decompress(codec, value)
+                except Exception as e:
+                    logger.warning(f"Unreadable translation memory entry: {e}")
+
+        hits = sum(1 for key in keys if key in found)
+        with connection:
+            self._count(connection, hits, len(keys) - hits)
+        return found
+
+    def put_many(self, entries):
+        """
+        Store translated segments.
+
+        Args:
+            entries (iterable): (key, translated text) pairs
+        """
+        now = time.time()
+        rows = [(key,) + _compress(text) + (now,) for key, text in entries if text]
+        if not rows:
+            return
+        connection = self._get_connection()
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO segments (key, codec, value, created_at) VALUES (?, ?, ?, ?)", rows
+            )
+
+    def prune(self, older_than_days):
+        """
+        Delete entries stored more than older_than_days ago.
+
+        Args:
+            older_than_days (float): Age limit in days
+
+        Returns:
+            int: Entries deleted
+        """
+        connection = self._get_connection()
+        with connection:
+            cursor = connection.execute("DELETE FROM segments WHERE created_at < ?",
+                                        (time.time() - older_than_days * 86400,))
+        return cursor.rowcount
+
+    def get_stats(self):
+        """Get the entry count, stored bytes and lookup hit rate."""
+        connection = self._get_connection()
+        entries, stored_bytes = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(value)), 0) FROM segments"
+        ).fetchone()
+        counters = dict(connection.execute("SELECT name, value FROM counters").fetchall())
+        hits = counters.get('hits', 0)
+        misses = counters.get('misses', 0)
+        return {
+            'entries': entries,
+            'stored_bytes': stored_bytes,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            'codec': 'zstd' if ZSTD_AVAILABLE else 'zlib',
+            'path': self.db_path
+        }
+
+
+# Global translation memory instance
+translation_memory = TranslationMemory()
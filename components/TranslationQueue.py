@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+# components/TranslationQueue.py
+"""
+Translation job queue for XSpace Downloader.
+
+Queued transcript translations live in an indexed SQLite sidecar table
+shared by the web app (which enqueues) and the background translation
+workers (which claim and run jobs):
+
+- Jobs are claimed atomically, so any number of worker threads or processes
+  can pull from the same queue without running a job twice
+- Lower priority numbers run first (the download queue's 1 = Highest ...
+  5 = Lowest); paid users' jobs are queued at PRIORITY_PAID
+- A partial unique index allows only one pending or running job per
+  (space, target language), so identical requests share the job in flight
+- Jobs whose worker stopped sending heartbeats are put back in the queue;
+  every claim gets its own token, and heartbeats and outcomes only apply
+  while that claim still holds the job, so a worker thread that lost its job
+  cannot record a second result (even if another thread of the same process
+  claimed it again)
+
+Usage:
+    from components.TranslationQueue import translation_queue
+
+    job, created = translation_queue.enqueue(space_id, user_id, 'en', 'es-ES', text, provider='openai')
+    job = translation_queue.claim('worker-1', exclude_providers=['claude'])
+    translation_queue.complete(job['id'], job['claim_token'], {'language': 'es-ES'})
+"""
+
+import json
+import time
+import uuid
+import sqlite3
+import logging
+import datetime
+
+from components.SQLiteStore import SQLiteStore
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('translation_queue')
+except ImportError:
+    logger = logging.getLogger(__name__)
+
+# Default location of the sidecar database
+DEFAULT_QUEUE_PATH = './data/translation_queue.db'
+
+# Job priorities; lower runs first
+PRIORITY_PAID = 1
+PRIORITY_NORMAL = 3
+
+# Job states
+STATUS_PENDING = 'pending'
+STATUS_IN_PROGRESS = 'in_progress'
+STATUS_COMPLETED = 'completed'
+STATUS_FAILED = 'failed'
+ACTIVE_STATUSES = (STATUS_PENDING, STATUS_IN_PROGRESS)
+
+# A running job without a heartbeat for this long is put back in the queue
+STALE_AFTER_SECONDS = 15 * 60
+
+# Jobs whose worker died this many times are failed instead of retried
+MAX_ATTEMPTS = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    space_id TEXT NOT NULL,
+    user_id INTEGER,
+    source_lang TEXT NOT NULL,
+    target_lang TEXT NOT NULL,
+    provider TEXT NOT NULL DEFAULT '',
+    priority INTEGER NOT NULL DEFAULT 3,
+    status TEXT NOT NULL,
+    progress INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    claim_token TEXT,
+    transcript_text TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    heartbeat_at REAL
+);
+
+CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (status, priority, created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_space ON jobs (space_id, target_lang);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_in_flight ON jobs (space_id, target_lang)
+    WHERE status IN ('pending', 'in_progress');
+"""
+
+# Columns returned by list and get calls; the transcript text is left out
+_JOB_COLUMNS = ('id, space_id, user_id, source_lang, target_lang, provider, priority, status, progress, '
+                'attempts, worker, result, error, created_at, updated_at, heartbeat_at')
+
+
+def _iso(timestamp):
+    """Format an epoch timestamp like the old job files did."""
+    return datetime.datetime.fromtimestamp(timestamp).isoformat() if timestamp else None
+
+
+class TranslationQueue:
+    """Indexed, claimable queue of translation jobs."""
+
+    def __init__(self, db_path=DEFAULT_QUEUE_PATH):
+        """
+        Initialize the queue.
+
+        Args:
+            db_path (str): Path to the SQLite sidecar database
+        """
+        self.db_path = str(db_path)
+        self._store = SQLiteStore(self.db_path, _SCHEMA, autocommit=True)
+        self._columns_checked = False
+
+    def _get_connection(self):
+        """Get this thread's SQLite connection."""
+        connection = self._store.connection()
+        if not self._columns_checked:
+            # Tables created before claim tokens existed get the column added
+            columns = {row['name'] for row in connection.execute("PRAGMA table_info(jobs)")}
+            if 'claim_token' not in columns:
+                try:
+                    connection.execute("ALTER TABLE jobs ADD COLUMN claim_token TEXT")
+                except sqlite3.OperationalError:
+                    pass  # Added by another connection meanwhile
+            self._columns_checked = True
+        return connection
+
+    @staticmethod
+    def _to_dict(row):
+        """Turn a job row into the dict shape of the old job files."""
+        job = dict(row)
+        job['result'] = json.loads(job['result']) if job.get('result') else None
+        for field in ('created_at', 'updated_at', 'heartbeat_at'):
+            job[field] = _iso(job.get(field))
+        return job
+
+    def enqueue(self, space_id, user_id, source_lang, target_lang, transcript_text,
+                priority=PRIORITY_NORMAL, provider='', job_id=None):
+        """
+        Queue a translation, or return the job already queued or running for it.
+
+        Args:
+            space_id (str): Space ID
+            user_id (int): User who requested the translation
+            source_lang (str): Source language code ('auto' to detect)
+            target_lang (str): Target language code
+            transcript_text (str): Text to translate
+            priority (int): PRIORITY_PAID, PRIORITY_NORMAL, ... (lower runs first)
+            provider (str): AI provider the job will use, for per-provider worker caps
+            job_id (str, optional): Job ID to use instead of a new UUID
+
+        Returns:
+            tuple: (job dict, True if it was created or False if an identical job is in flight)
+        """
+        job_id = job_id or str(uuid.uuid4())
+        now = time.time()
+        connection = self._get_connection()
+        try:
+            connection.execute(
+                "INSERT INTO jobs (id, space_id, user_id, source_lang, target_lang, provider, priority, status, "
+                "transcript_text, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, space_id, user_id, source_lang or 'auto', target_lang, (provider or '').lower(),
+                 int(priority), STATUS_PENDING, transcript_text, now, now)
+            )
+        except sqlite3.IntegrityError:
+            row = connection.execute(
+                f"SELECT {_JOB_COLUMNS} FROM jobs WHERE space_id = ? AND target_lang = ? AND status IN (?, ?)",
+                (space_id, target_lang) + ACTIVE_STATUSES
+            ).fetchone()
+            if row is not None:
+                return self._to_dict(row), False
+            raise
+        logger.info(f"Queued translation job {job_id}: {space_id} -> {target_lang} (priority {priority})")
+        return self.get(job_id), True
+
+    def claim(self, worker, exclude_providers=()):
+        """
+        Atomically take the next pending job.
+
+        Args:
+            worker (str): Name of the claiming worker, shown on the queue pages
+            exclude_providers (iterable): Providers whose worker cap is full
+
+        Returns:
+            dict: The claimed job including transcript_text and the claim_token that
+                  heartbeat(), complete() and fail() require, or None if nothing is pending
+        """
+        excluded = [provider.lower() for provider in exclude_providers]
+        placeholders = ','.join('?' * len(excluded))
+        provider_filter = f"AND provider NOT IN ({placeholders})" if excluded else ''
+
+        connection = self._get_connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                f"SELECT id FROM jobs WHERE status = ? {provider_filter} ORDER BY priority, created_at LIMIT 1",
+                [STATUS_PENDING] + excluded
+            ).fetchone()
+            if row is None:
+                connection.execute("COMMIT")
+                return None
+            now = time.time()
+            connection.execute(
+                "UPDATE jobs SET status = ?, worker = ?, claim_token = ?, attempts = attempts + 1, progress = 10, "
+                "updated_at = ?, heartbeat_at = ? WHERE id = ?",
+                (STATUS_IN_PROGRESS, worker, uuid.uuid4().hex, now, now, row['id'])
+            )
+            job = connection.execute("SELECT * FROM jobs WHERE id = ?", (row['id'],)).fetchone()
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        return self._to_dict(job)
+
+    def _finish(self, job_id, claim_token, status, progress, result=None, error=None):
+        """Record the outcome of a job this claim still holds; returns False if it lost the job."""
+        now = time.time()
+        cursor = self._get_connection().execute(
+            "UPDATE jobs SET status = ?, progress = ?, result = ?, error = ?, updated_at = ?, heartbeat_at = ? "
+            "WHERE id = ? AND claim_token = ? AND status = ?",
+            (status, progress, json.dumps(result) if result is not None else None, error, now, now,
+             job_id, claim_token, STATUS_IN_PROGRESS)
+        )
+        if cursor.rowcount == 0:
+            logger.warning(f"Translation job {job_id} is no longer held by this claim; dropping its {status} outcome")
+            return False
+        return True
+
+    def heartbeat(self, job_id, claim_token, progress=None):
+        """
+        Mark a running job as alive, optionally updating its progress.
+
+        Args:
+            job_id (str): Job ID
+            claim_token (str): Token returned with the job by claim()
+            progress (int, optional): Progress in percent
+
+        Returns:
+            bool: True if the claim still holds the job, False if it was requeued
+                  or finished elsewhere
+        """
+        now = time.time()
+        cursor = self._get_connection().execute(
+            "UPDATE jobs SET progress = COALESCE(?, progress), updated_at = ?, heartbeat_at = ? "
+            "WHERE id = ? AND claim_token = ? AND status = ?",
+            (progress, now, now, job_id, claim_token, STATUS_IN_PROGRESS)
+        )
+        return cursor.rowcount > 0
+
+    def complete(self, job_id, claim_token, result=None):
+        """
+        Mark a job completed.
+
+        Args:
+            job_id (str): Job ID
+            claim_token (str): Token returned with the job by claim()
+            result (dict, optional): Result details shown on the queue pages
+
+        Returns:
+            bool: True if recorded, False if the claim no longer holds the job
+        """
+        return self._finish(job_id, claim_token, STATUS_COMPLETED, 100, result=result)
+
+    def fail(self, job_id, claim_token, error):
+        """
+        Mark a job failed.
+
+        Args:
+            job_id (str): Job ID
+            claim_token (str): Token returned with the job by claim()
+            error (str): Error message
+
+        Returns:
+            bool: True if recorded, False if the claim no longer holds the job
+        """
+        return self._finish(job_id, claim_token, STATUS_FAILED, 0, error=str(error))
+
+    def requeue_stale(self, stale_after=STALE_AFTER_SECONDS):
+        """
+        Put running jobs whose worker stopped sending heartbeats back in the queue.
+
+        Jobs that already used MAX_ATTEMPTS are failed instead.
+
+        Args:
+            stale_after (float): Seconds without a heartbeat
+
+        Returns:
+            int: Jobs put back in the queue
+        """
+        cutoff = time.time() - stale_after
+        connection = self._get_connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "UPDATE jobs SET status = ?, error = 'Worker stopped responding', updated_at = ? "
+                "WHERE status = ? AND heartbeat_at < ? AND attempts >= ?",
+                (STATUS_FAILED, time.time(), STATUS_IN_PROGRESS, cutoff, MAX_ATTEMPTS)
+            )
+            cursor = connection.execute(
+                "UPDATE jobs SET status = ?, worker = NULL, claim_token = NULL, progress = 0, updated_at = ? "
+                "WHERE status = ? AND heartbeat_at < ?",
+                (STATUS_PENDING, time.time(), STATUS_IN_PROGRESS, cutoff)
+            )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        if cursor.rowcount:
+            logger.warning(f"Requeued {cursor.rowcount} stale translation jobs")
+        return cursor.rowcount
+
+    def get(self, job_id):
+        """
+        Get a job without its transcript text.
+
+        Args:
+            job_id (str): Job ID
+
+        Returns:
+            dict: The job, or None if unknown
+        """
+        row = self._get_connection().execute(f"SELECT {_JOB_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row is not None else None
+
+    def list_jobs(self, statuses=ACTIVE_STATUSES, since=None, limit=500):
+        """
+        List jobs in queue order.
+
+        Args:
+            statuses (iterable): Job states to include
+            since (float, optional): Only jobs created after this epoch timestamp
+            limit (int): Maximum jobs returned
+
+        Returns:
+            list: Jobs without their transcript text
+        """
+        statuses = list(statuses)
+        query = f"SELECT {_JOB_COLUMNS} FROM jobs WHERE status IN ({','.join('?' * len(statuses))})"
+        params = statuses
+        if since is not None:
+            query += " AND created_at >= ?"
+            params = params + [since]
+        query += " ORDER BY priority, created_at LIMIT ?"
+        rows = self._get_connection().execute(query, params + [int(limit)]).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def prune(self, older_than_days=30):
+        """
+        Delete finished jobs older than older_than_days.
+
+        Args:
+            older_than_days (float): Age limit in days
+
+        Returns:
+            int: Jobs deleted
+        """
+        cursor = self._get_connection().execute(
+            "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+            (STATUS_COMPLETED, STATUS_FAILED, time.time() - older_than_days * 86400)
+        )
+        return cursor.rowcount
+
+    def get_stats(self):
+        """Get job counts by status and provider."""
+        rows = self._get_connection().execute(
+            "SELECT status, provider, COUNT(*) AS jobs FROM jobs GROUP BY status, provider"
+        ).fetchall()
+        stats = {'by_status': {}, 'by_provider': {}, 'path': self.db_path}
+        for row in rows:
+            stats['by_status'][row['status']] = stats['by_status'].get(row['status'], 0) + row['jobs']
+            if row['status'] in ACTIVE_STATUSES:
+                provider = row['provider'] or 'default'
+                stats['by_provider'][provider] = stats['by_provider'].get(provider, 0) + row['jobs']
+        return stats
+
+
+# Global translation queue instance
+translation_queue = TranslationQueue()
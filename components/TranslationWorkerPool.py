@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# components/TranslationWorkerPool.py
+"""
+Translation Worker Pool Component for XSpace Downloader
+
+Runs queued translation jobs on a pool of worker threads:
+
+- One dispatcher claims jobs from the TranslationQueue while a worker is
+  free, highest priority first
+- Each provider has its own cap on jobs running at once, so a slow provider
+  cannot take every worker; jobs for a provider at its cap stay queued while
+  other providers' jobs are claimed
+- Finished workers wake the dispatcher at once; an empty queue is polled
+- Each running job sends a heartbeat every HEARTBEAT_INTERVAL seconds from
+  a timer thread, so long translations are not mistaken for stale ones
+- Stale jobs (from a worker process that died) are put back in the queue
+
+Usage Examples:
+
+    from components.TranslationQueue import translation_queue
+    from components.TranslationWorkerPool import TranslationWorkerPool
+
+    pool = TranslationWorkerPool(translation_queue, process_job, max_workers=6,
+                                 provider_limits={'openai': 4, 'claude': 2})
+    pool.run()  # until pool.stop()
+"""
+
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('translation_worker_pool')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# Seconds between queue polls while idle
+POLL_INTERVAL = 2.0
+
+# Seconds between checks for jobs abandoned by a dead worker
+STALE_CHECK_INTERVAL = 60.0
+
+# Seconds between heartbeats of a running job (well under the queue's stale timeout)
+HEARTBEAT_INTERVAL = 60.0
+
+
+class TranslationWorkerPool:
+    """Claims queued translation jobs and runs them concurrently under per-provider caps."""
+
+    def __init__(self, queue, process: Callable[[Dict], None], max_workers: int = 4,
+                 provider_limits: Optional[Dict[str, int]] = None, poll_interval: float = POLL_INTERVAL):
+        """
+        Initialize the pool.
+
+        Args:
+            queue (TranslationQueue): Job queue to claim from
+            process (callable): process(job) runs one claimed job and records its outcome
+                                in the queue with job['claim_token']; exceptions fail the job
+            max_workers (int): Jobs running at once in this process
+            provider_limits (dict, optional): {provider: max jobs running at once}; providers
+                                              not listed are limited only by max_workers
+            poll_interval (float): Seconds between polls while the queue is empty
+        """
+        self.queue = queue
+        self.process = process
+        self.max_workers = max(1, int(max_workers))
+        self.provider_limits = {name.lower(): max(1, int(limit)) for name, limit in (provider_limits or {}).items()}
+        self.poll_interval = poll_interval
+        self.worker_name = f"{socket.gethostname()}:{os.getpid()}"
+        self.running = False
+        self._in_flight = {}
+        self._condition = threading.Condition()
+
+    def _full_providers(self):
+        """Providers whose cap is reached (call with the condition held)."""
+        return [provider for provider, limit in self.provider_limits.items()
+                if self._in_flight.get(provider, 0) >= limit]
+
+    def _send_heartbeats(self, job: Dict, done: threading.Event):
+        """Keep a running job's heartbeat fresh until done is set or the job is lost."""
+        while not done.wait(HEARTBEAT_INTERVAL):
+            try:
+                if not self.queue.heartbeat(job['id'], job['claim_token']):
+                    logger.warning(f"Translation job {job['id']} is no longer held by this worker")
+                    return
+            except Exception as e:
+                logger.warning(f"Heartbeat failed for translation job {job['id']}: {e}")
+
+    def _run_job(self, job: Dict):
+        """Run one job and free its slot."""
+        provider = job.get('provider') or ''
+        done = threading.Event()
+        heartbeat = threading.Thread(target=self._send_heartbeats, args=(job, done),
+                                     name=f"translate-heartbeat-{job['id'][:8]}", daemon=True)
+        heartbeat.start()
+        try:
+            self.process(job)
+        except Exception as e:
+            logger.error(f"Translation job {job['id']} failed: {e}", exc_info=True)
+            try:
+                self.queue.fail(job['id'], job['claim_token'], str(e))
+            except Exception as queue_error:
+                logger.error(f"Could not mark job {job['id']} failed: {queue_error}")
+        finally:
+            done.set()
+            with self._condition:
+                self._in_flight[provider] -= 1
+                self._condition.notify_all()
+
+    def run(self):
+        """Claim and run jobs until stop() is called."""
+        self.running = True
+        last_stale_check = 0.0
+        logger.info(f"Translation worker pool started: {self.max_workers} workers, "
+                    f"provider limits {self.provider_limits or 'none'}")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='translate-worker') as pool:
+            while self.running:
+                try:
+                    if time.monotonic() - last_stale_check >= STALE_CHECK_INTERVAL:
+                        self.queue.requeue_stale()
+                        last_stale_check = time.monotonic()
+
+                    with self._condition:
+                        # Wait for a free worker
+                        while self.running and sum(self._in_flight.values()) >= self.max_workers:
+                            self._condition.wait(self.poll_interval)
+                        if not self.running:
+                            break
+                        excluded = self._full_providers()
+
+                    job = self.queue.claim(self.worker_name, exclude_providers=excluded)
+                    if job is None:
+                        # Nothing claimable; wait for new jobs or for a provider slot to free up
+                        with self._condition:
+                            self._condition.wait(self.poll_interval)
+                        continue
+
+                    provider = job.get('provider') or ''
+                    with self._condition:
+                        self._in_flight[provider] = self._in_flight.get(provider, 0) + 1
+                    logger.info(f"Claimed translation job {job['id']} ({provider or 'default'}, "
+                                f"priority {job['priority']}): {job['space_id']} -> {job['target_lang']}")
+                    pool.submit(self._run_job, job)
+
+                except Exception as e:
+                    logger.error(f"Error in translation dispatcher: {e}", exc_info=True)
+                    time.sleep(self.poll_interval * 5)
+
+        logger.info("Translation worker pool stopped")
+
+    def stop(self):
+        """Stop claiming jobs; running jobs finish before run() returns."""
+        with self._condition:
+            self.running = False
+            self._condition.notify_all()
+
+    def get_stats(self) -> Dict:
+        """Jobs running in this process, per provider."""
+        with self._condition:
+            return {'max_workers': self.max_workers, 'provider_limits': dict(self.provider_limits),
+                    'in_flight': {provider: count for provider, count in self._in_flight.items() if count}}
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+# components/VoiceActivity.py
+"""
+Voice Activity Detection Component for XSpace Downloader
+
+Finds the speech in a recording so that long silences, music holds and
+"waiting for speakers" stretches are not sent to transcription.
+
+The recording is streamed from ffmpeg as 8 kHz mono PCM. Each 30 ms frame
+gets an RMS level and a zero-crossing rate. The energy threshold adapts to
+the recording's noise floor, and frames that are a bit quieter are still
+kept when their zero-crossing rate is high, so unvoiced consonants are not
+cut. Speech runs are padded and merged, then ffmpeg packs only those
+regions into one condensed file. SpeechTimeMap converts timestamps in the
+condensed file back to the original recording.
+
+Usage Examples:
+
+    from components.VoiceActivity import VoiceActivityDetector
+
+    detector = VoiceActivityDetector()
+    prepared = detector.condense_speech('downloads/abc.mp3', '/tmp/vad')
+    if prepared:
+        path, time_map = prepared
+        segments = time_map.remap_segments(transcribe(path)['segments'])
+"""
+
+import bisect
+import os
+import subprocess
+from typing import Dict, List, Optional, Tuple
+
+from components.AudioChunker import ANALYSIS_SAMPLE_RATE, NUMPY_AVAILABLE, probe_duration
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('voice_activity')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# Condensed audio is cut on a 10 ms grid so region lengths are exact
+GRID_SECONDS = 0.01
+
+
+class SpeechTimeMap:
+    """Maps times in condensed (speech-only) audio back to the original recording."""
+
+    def __init__(self, regions: List[Tuple[float, float]], original_duration: float):
+        """
+        Initialize the map.
+
+        Args:
+            regions (list): (start, end) speech regions in original seconds, in order
+            original_duration (float): Length of the original recording
+        """
+        self.regions = regions
+        self.original_duration = original_duration
+        self.condensed_starts = []
+        position = 0.0
+        for start, end in regions:
+            self.condensed_starts.append(position)
+            position += end - start
+        self.speech_seconds = position
+
+    @property
+    def removed_seconds(self) -> float:
+        """Seconds of the original recording that were skipped."""
+        return max(0.0, self.original_duration - self.speech_seconds)
+
+    def to_original(self, condensed_time: float, is_end: bool = False) -> float:
+        """
+        Convert a condensed-audio time to original-recording time.
+
+        A time exactly on the join between two regions maps to the end of
+        the earlier region when it ends a segment, and to the start of the
+        later one when it starts a segment.
+
+        Args:
+            condensed_time (float): Seconds into the condensed audio
+            is_end (bool): Whether the time is a segment end
+
+        Returns:
+            float: Seconds into the original recording
+        """
+        if not self.regions:
+            return condensed_time
+        if is_end:
+            index = bisect.bisect_left(self.condensed_starts, condensed_time) - 1
+        else:
+            index = bisect.bisect_right(self.condensed_starts, condensed_time) - 1
+        index = min(max(index, 0), len(self.regions) - 1)
+
+        start, end = self.regions[index]
+        return min(start + max(0.0, condensed_time - self.condensed_starts[index]), end)
+
+    def _remap_times(self, items: List[Dict]) -> List[Dict]:
+        """Copies of timed items (dicts or API objects) with start/end in original time."""
+        remapped = []
+        for item in items:
+            item = dict(item.model_dump() if hasattr(item, 'model_dump') else item)
+            start = self.to_original(item.get('start', 0))
+            item['end'] = max(start, self.to_original(item.get('end', 0), is_end=True))
+            item['start'] = start
+            remapped.append(item)
+        return remapped
+
+    def remap_words(self, words: List[Dict]) -> List[Dict]:
+        """
+        Return copies of word timestamps with start/end in original-recording time.
+
+        Args:
+            words (list): Words with condensed-audio 'start' and 'end'
+
+        Returns:
+            list: Remapped word dicts
+        """
+        return self._remap_times(words)
+
+    def remap_segments(self, segments: List[Dict]) -> List[Dict]:
+        """
+        Return copies of segments with start/end, and the times of any
+        word timestamps they carry, in original-recording time.
+
+        Args:
+            segments (list): Segments with condensed-audio 'start' and 'end'
+
+        Returns:
+            list: Remapped segment dicts
+        """
+        remapped = self._remap_times(segments)
+        for segment in remapped:
+            if segment.get('words'):
+                segment['words'] = self._remap_times(segment['words'])
+        return remapped
+
+
+class VoiceActivityDetector:
+    """Energy and zero-crossing voice activity detector."""
+
+    def __init__(self, frame_ms: int = 30, min_speech_ms: int = 250, min_silence_ms: int = 1000,
+                 padding_ms: int = 300, floor_offset_db: float = 12.0, zcr_threshold: float = 0.25,
+                 zcr_margin_db: float = 8.0):
+        """
+        Initialize the detector.
+
+        Args:
+            frame_ms (int): Analysis frame length (a multiple of 10 ms)
+            min_speech_ms (int): Shorter bursts are treated as noise
+            min_silence_ms (int): Shorter pauses are kept inside the speech region
+            padding_ms (int): Audio kept either side of each speech region
+            floor_offset_db (float): Speech threshold above the estimated noise floor
+            zcr_threshold (float): Zero-crossing rate marking unvoiced speech
+            zcr_margin_db (float): How far below the threshold high-ZCR frames still count
+        """
+        self.frame_ms = frame_ms
+        self.min_speech_ms = min_speech_ms
+        self.min_silence_ms = min_silence_ms
+        self.padding_ms = padding_ms
+        self.floor_offset_db = floor_offset_db
+        self.zcr_threshold = zcr_threshold
+        self.zcr_margin_db = zcr_margin_db
+
+    def analyse(self, audio_file: str):
+        """
+        Stream a recording through ffmpeg and measure every frame.
+
+        Args:
+            audio_file (str): Path to the audio file
+
+        Returns:
+            tuple: (level_db, zcr) float32 arrays, one value per frame
+        """
+        frame_length = ANALYSIS_SAMPLE_RATE * self.frame_ms // 1000
+        # About 10 minutes of audio per read keeps memory flat for long Spaces
+        block_bytes = frame_length * 2 * 20000
+
+        process = subprocess.Popen(
+            ['ffmpeg', '-v', 'error', '-nostdin', '-i', audio_file, '-vn', '-ac', '1',
+             '-ar', str(ANALYSIS_SAMPLE_RATE), '-f', 's16le', '-'],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        levels = []
+        rates = []
+        try:
+            while True:
+                data = process.stdout.read(block_bytes)
+                if not data:
+                    break
+                samples = np.frombuffer(data[:len(data) - len(data) % 2], dtype=np.int16)
+                frame_count = len(samples) // frame_length
+                if frame_count == 0:
+                    continue
+                frames = samples[:frame_count * frame_length].astype(np.float32).reshape(frame_count, frame_length)
+
+                rms = np.sqrt(np.mean(frames * frames, axis=1))
+                levels.append(20 * np.log10(np.maximum(rms, 1.0) / 32768.0))
+                signs = np.signbit(frames)
+                rates.append(np.mean(signs[:, 1:] != signs[:, :-1], axis=1))
+        finally:
+            process.stdout.close()
+            process.wait()
+
+        if process.returncode != 0:
+            raise RuntimeError(f"ffmpeg could not decode {audio_file}")
+        if not levels:
+            return np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.float32)
+        return np.concatenate(levels).astype(np.float32), np.concatenate(rates).astype(np.float32)
+
+    def classify_frames(self, level_db, zcr):
+        """
+        Mark frames as speech.
+
+        The threshold sits floor_offset_db above the quiet end of the level
+        distribution, but never more than 20 dB under the loud end, so a
+        recording that is speech throughout is not cut.
+
+        Args:
+            level_db (numpy.ndarray): Frame levels in dBFS
+            zcr (numpy.ndarray): Frame zero-crossing rates
+
+        Returns:
+            numpy.ndarray: Boolean speech mask
+        """
+        if len(level_db) == 0:
+            return np.zeros(0, dtype=bool)
+        noise_floor = float(np.percentile(level_db, 10))
+        speech_level = float(np.percentile(level_db, 90))
+        threshold = min(noise_floor + self.floor_offset_db, speech_level - 20.0)
+        threshold = max(threshold, -60.0)
+
+        voiced = level_db > threshold
+        unvoiced = (level_db > threshold - self.zcr_margin_db) & (zcr > self.zcr_threshold)
+        return voiced | unvoiced
+
+    def frames_to_regions(self, speech_mask, duration: float) -> List[Tuple[float, float]]:
+        """
+        Turn a frame mask into padded, merged speech regions.
+
+        Args:
+            speech_mask (numpy.ndarray): Boolean mask per frame
+            duration (float): Length of the recording in seconds
+
+        Returns:
+            list: (start, end) regions in seconds on the 10 ms grid
+        """
+        if len(speech_mask) == 0:
+            return []
+        edges = np.diff(np.concatenate(([0], speech_mask.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+
+        frame_seconds = self.frame_ms / 1000.0
+        min_frames = max(1, self.min_speech_ms // self.frame_ms)
+        padding = self.padding_ms / 1000.0
+        min_gap = self.min_silence_ms / 1000.0
+        end_limit = int(duration / GRID_SECONDS) * GRID_SECONDS
+
+        regions = []
+        for start_frame, end_frame in zip(starts.tolist(), ends.tolist()):
+            if end_frame - start_frame < min_frames:
+                continue
+            start = max(0.0, start_frame * frame_seconds - padding)
+            end = min(end_limit, end_frame * frame_seconds + padding)
+            if regions and start - regions[-1][1] < min_gap:
+                regions[-1] = (regions[-1][0], max(regions[-1][1], end))
+            else:
+                regions.append((start, end))
+
+        return [(round(start, 2), round(end, 2)) for start, end in regions if end > start]
+
+    def detect(self, audio_file: str, duration: Optional[float] = None) -> List[Tuple[float, float]]:
+        """
+        Find speech regions in a recording.
+
+        Args:
+            audio_file (str): Path to the audio file
+            duration (float, optional): Known duration (probed if omitted)
+
+        Returns:
+            list: (start, end) speech regions in seconds
+        """
+        if duration is None:
+            duration = probe_duration(audio_file)
+        level_db, zcr = self.analyse(audio_file)
+        if not duration:
+            duration = len(level_db) * self.frame_ms / 1000.0
+        return self.frames_to_regions(self.classify_frames(level_db, zcr), duration)
+
+    @staticmethod
+    def export_regions(audio_file: str, regions: List[Tuple[float, float]], output_path: str,
+                       format: str = 'wav', bitrate: Optional[str] = None, sample_rate: int = 16000) -> bool:
+        """
+        Write only the given regions of a recording, back to back, to one file.
+
+        The audio is decoded once and split into 10 ms frames, matching the
+        region grid; one aselect keeps the frames inside any region and asetpts
+        renumbers them, so each region keeps exactly its length and
+        SpeechTimeMap stays accurate to the end.
+
+        Args:
+            audio_file (str): Path to the audio file
+            regions (list): (start, end) regions on the 10 ms grid
+            output_path (str): Destination file
+            format (str): Output format ('wav', 'mp3', ...)
+            bitrate (str, optional): Audio bitrate, e.g. '64k'
+            sample_rate (int): Output sample rate
+
+        Returns:
+            bool: True if the file was written
+        """
+        if not regions:
+            return False
+        # Frames start on the grid, so comparing the frame start shifted by half
+        # a frame keeps a region's first frame and drops the one at its end
+        half_frame = 0.005
+        selection = '+'.join(f"between(t,{start - half_frame:.3f},{end - half_frame:.3f})"
+                             for start, end in regions)
+        filter_script = output_path + '.filter'
+        with open(filter_script, 'w') as f:
+            f.write(f"[0:a]aresample={sample_rate},asetnsamples=n={sample_rate // 100}:p=0,"
+                    f"aselect='{selection}',asetpts=N/SR/TB[speech]")
+
+        command = ['ffmpeg', '-v', 'error', '-nostdin', '-y', '-i', audio_file,
+                   '-filter_complex_script', filter_script, '-map', '[speech]',
+                   '-ac', '1', '-ar', str(sample_rate)]
+        if bitrate:
+            command += ['-b:a', bitrate]
+        if format == 'wav':
+            command += ['-c:a', 'pcm_s16le']
+        command += ['-f', format, output_path]
+
+        try:
+            result = subprocess.run(command, capture_output=True, timeout=3600)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.error(f"ffmpeg could not export speech regions of {audio_file}: {e}")
+            return False
+        finally:
+            if os.path.exists(filter_script):
+                os.unlink(filter_script)
+        if result.returncode != 0:
+            logger.error(f"ffmpeg could not export speech regions of {audio_file}: "
+                         f"{result.stderr.decode(errors='replace')[-300:]}")
+            return False
+        return os.path.exists(output_path) and os.path.getsize(output_path) > 0
+
+    def condense_speech(self, audio_file: str, output_dir: str, format: str = 'wav',
+                        bitrate: Optional[str] = None, sample_rate: int = 16000,
+                        min_savings: float = 0.05) -> Optional[Tuple[str, SpeechTimeMap]]:
+        """
+        Write a speech-only copy of a recording if enough of it is dead air.
+
+        Args:
+            audio_file (str): Path to the audio file
+            output_dir (str): Directory for the condensed file
+            format (str): Output format
+            bitrate (str, optional): Audio bitrate
+            sample_rate (int): Output sample rate
+            min_savings (float): Minimum fraction of the recording that must be
+                                 skippable (and at least 5 seconds)
+
+        Returns:
+            tuple: (condensed_path, SpeechTimeMap), or None to use the original file
+        """
+        duration = probe_duration(audio_file)
+        if not duration:
+            return None
+
+        regions = self.detect(audio_file, duration)
+        time_map = SpeechTimeMap(regions, duration)
+        removed = time_map.removed_seconds
+        logger.info(f"Voice activity: {time_map.speech_seconds:.1f}s speech in {len(regions)} regions, "
+                    f"{removed:.1f}s of {duration:.1f}s skippable")
+
+        # Very little "speech" usually means a misdetection; let the engine hear everything
+        if time_map.speech_seconds < duration * 0.01:
+            logger.warning(f"Voice activity found almost no speech in {audio_file}, using the whole file")
+            return None
+        if removed < max(duration * min_savings, 5.0):
+            return None
+
+        output_path = os.path.join(output_dir, f"speech.{format}")
+        if not self.export_regions(audio_file, regions, output_path, format, bitrate, sample_rate):
+            return None
+        return output_path, time_map
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# components/WhisperPool.py
+"""
+Parallel Local Whisper Component for XSpace Downloader
+
+Runs local Whisper transcription across CPU cores with a process pool.
+A single Whisper call only uses part of a many-core machine. This pool runs
+several calls side by side, each with its own small torch thread budget.
+
+Features:
+- Model loaded once per worker: inherited from the parent via fork when the
+  parent has already loaded it, otherwise loaded by the worker initializer
+- Per-worker torch thread limits so workers x threads matches the core count
+- Workers cut their own chunks with ffmpeg, so export runs in parallel too
+- Ordered streaming merge: results are yielded in timeline order while
+  later chunks are still being transcribed, with a bounded number in flight
+
+Usage Examples:
+
+    from components.WhisperPool import WhisperPool
+
+    pool = WhisperPool('base', workers=4, threads_per_worker=2)
+    pool.start()
+    for chunk, result in pool.map_chunks('downloads/abc.mp3', chunks, {'fp16': False}):
+        print(chunk['start_seconds'], result['text'])
+    pool.close()
+"""
+
+import multiprocessing
+import os
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import whisper
+    WHISPER_AVAILABLE = True
+except ImportError:
+    WHISPER_AVAILABLE = False
+    whisper = None
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
+try:
+    from components.AudioChunker import AudioChunker
+except ImportError:
+    AudioChunker = None
+
+try:
+    from components.Logger import get_logger
+    logger = get_logger('whisper_pool')
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# Model used by pool workers. Set in the parent before a fork so children
+# share its weights copy-on-write, or loaded by _init_worker otherwise.
+_worker_model = None
+
+
+def default_worker_layout(cpu_count: Optional[int] = None, workers: int = 0,
+                          threads_per_worker: int = 0) -> Tuple[int, int]:
+    """
+    Work out how many workers to run and how many torch threads each gets.
+
+    Whisper on CPU scales poorly past a few threads per call, so the default
+    is two threads per worker and as many workers as fill the cores.
+
+    Args:
+        cpu_count (int, optional): Cores available (default: os.cpu_count())
+        workers (int): Requested workers, 0 for automatic
+        threads_per_worker (int): Requested threads per worker, 0 for automatic
+
+    Returns:
+        tuple: (workers, threads_per_worker)
+    """
+    cpu_count = cpu_count or os.cpu_count() or 1
+    if workers <= 0:
+        threads = threads_per_worker if threads_per_worker > 0 else (2 if cpu_count >= 4 else 1)
+        workers = max(1, cpu_count // threads)
+    if threads_per_worker <= 0:
+        threads_per_worker = max(1, cpu_count // workers)
+    return workers, threads_per_worker
+
+
+def _init_worker(model_name: str, device: Optional[str], threads: int):
+    """Limit torch threads and make sure the worker has a model."""
+    global _worker_model
+    if torch is not None:
+        torch.set_num_threads(threads)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Already set (inherited state after fork)
+            pass
+    if _worker_model is None:
+        _worker_model = whisper.load_model(model_name, device=device)
+
+
+def _transcribe_file(audio_file: str, options: Dict) -> Dict:
+    """Transcribe a whole file in a worker."""
+    return _worker_model.transcribe(audio_file, **options)
+
+
+def _transcribe_chunk(audio_file: str, start: float, end: float, temp_dir: str,
+                      index: int, options: Dict) -> Dict:
+    """Cut one chunk with ffmpeg and transcribe it in a worker."""
+    path = os.path.join(temp_dir, f"chunk_{index:04d}.wav")
+    # Whisper resamples to 16 kHz mono anyway, so write that directly
+    if not AudioChunker.export_chunk(audio_file, start, end, path, format='wav',
+                                     sample_rate=16000, channels=1):
+        raise RuntimeError(f"Could not export chunk {index} of {audio_file}")
+    try:
+        return _worker_model.transcribe(path, **options)
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+class WhisperPool:
+    """Process pool running local Whisper transcriptions in parallel."""
+
+    def __init__(self, model_name: str, device: Optional[str] = None,
+                 workers: int = 0, threads_per_worker: int = 0, max_in_flight: Optional[int] = None):
+        """
+        Initialize the pool (workers are started by start()).
+
+        Args:
+            model_name (str): Whisper model name
+            device (str, optional): Torch device for worker-loaded models
+            workers (int): Worker processes, 0 for automatic
+            threads_per_worker (int): Torch threads per worker, 0 for automatic
+            max_in_flight (int, optional): Chunks submitted ahead of the merge
+                                           (default: twice the worker count)
+        """
+        self.model_name = model_name
+        self.device = device
+        self.workers, self.threads_per_worker = default_worker_layout(
+            workers=workers, threads_per_worker=threads_per_worker
+        )
+        self.max_in_flight = max_in_flight or self.workers * 2
+        self.start_method = None
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def start(self, model=None) -> bool:
+        """
+        Start the worker processes.
+
+        Args:
+            model: Already-loaded Whisper model. On platforms with fork the
+                   workers inherit it instead of loading their own copy.
+
+        Returns:
+            bool: True if the pool is running
+        """
+        global _worker_model
+        with self._lock:
+            if self._executor is not None:
+                return True
+            if model is None and not WHISPER_AVAILABLE:
+                logger.error("Whisper library not available for the transcription pool")
+                return False
+
+            if model is not None and 'fork' in multiprocessing.get_all_start_methods():
+                _worker_model = model
+                self.start_method = 'fork'
+            else:
+                self.start_method = 'spawn'
+
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(self.start_method),
+                initializer=_init_worker,
+                initargs=(self.model_name, self.device, self.threads_per_worker)
+            )
+            logger.info(f"Started Whisper pool: {self.workers} workers x {self.threads_per_worker} threads "
+                        f"({self.model_name}, {self.start_method})")
+            return True
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker processes have been started."""
+        return self._executor is not None
+
+    def transcribe_file(self, audio_file: str, options: Dict) -> Dict:
+        """
+        Transcribe a whole file on one worker.
+
+        Args:
+            audio_file (str): Path to the audio file
+            options (dict): Options for whisper's transcribe()
+
+        Returns:
+            dict: Whisper result
+        """
+        return self._executor.submit(_transcribe_file, audio_file, options).result()
+
+    def map_chunks(self, audio_file: str, chunks: List[Dict], options: Dict) -> Iterator[Tuple[Dict, Dict]]:
+        """
+        Transcribe chunks in parallel and yield them back in order.
+
+        Timestamps in each result are relative to its chunk; callers add
+        chunk['start_seconds'] when merging.
+
+        Args:
+            audio_file (str): Path to the audio file
+            chunks (list): Chunk plan from AudioChunker.plan_chunks()
+            options (dict): Options for whisper's transcribe()
+
+        Returns:
+            iterator: (chunk, result) pairs in chunk order
+        """
+        with tempfile.TemporaryDirectory(prefix='whisper_chunks_') as temp_dir:
+            in_flight = deque()
+            try:
+                for chunk in chunks:
+                    in_flight.append((chunk, self._executor.submit(
+                        _transcribe_chunk, audio_file, chunk['start_seconds'], chunk['end_seconds'],
+                        temp_dir, chunk['index'], options
+                    )))
+                    if len(in_flight) >= self.max_in_flight:
+                        chunk, future = in_flight.popleft()
+                        yield chunk, future.result()
+
+                while in_flight:
+                    chunk, future = in_flight.popleft()
+                    yield chunk, future.result()
+            finally:
+                # Stop queued work if the caller gave up early or a chunk failed
+                for _, future in in_flight:
+                    future.cancel()
+                for _, future in in_flight:
+                    if not future.cancelled():
+                        try:
+                            future.result()
+                        except Exception:
+                            pass
+
+    def close(self):
+        """Shut down the worker processes."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
@@ -55,7 +55,8 @@ DEFAULT_DATA = {
          [
             ('transcription_enabled', 'true', 'boolean', 'Enable/disable transcription service'),
             ('video_generation_enabled', 'true', 'boolean', 'Enable/disable video generation service'),
-            ('compute_cost_per_second', '0.001', 'decimal', 'Cost per second for compute operations in USD')
+            ('compute_cost_per_second', '0.001', 'decimal', 'Cost per second for compute operations in USD'),
+            ('ai_pricing_version', '1', 'integer', 'Incremented whenever AI or compute pricing changes')
          ])
     ]
 }
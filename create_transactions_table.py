@@ -36,8 +36,12 @@ def create_transactions_table():
                   `cost` decimal(10,6) NOT NULL COMMENT 'Total cost in credits',
                   `balance_before` decimal(10,2) DEFAULT NULL COMMENT 'User balance before transaction',
                   `balance_after` decimal(10,2) DEFAULT NULL COMMENT 'User balance after transaction',
+                  `source_language` varchar(10) DEFAULT NULL COMMENT 'Source language for translation',
+                  `target_language` varchar(10) DEFAULT NULL COMMENT 'Target language for translation',
+                  `idempotency_key` varchar(100) DEFAULT NULL COMMENT 'Unique key of the charge within its job batch',
                   `created_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP,
                   PRIMARY KEY (`id`),
+                  UNIQUE KEY `uniq_idempotency_key` (`idempotency_key`),
                   KEY `idx_user_id` (`user_id`),
                   KEY `idx_cookie_id` (`cookie_id`),
                   KEY `idx_space_id` (`space_id`),
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """
 Script to generate tags for spaces that have transcripts but no tags.
+
+Pass --keywords to tag from the corpus keyword index instead of the AI provider.
 """
 
 import json
@@ -8,6 +10,7 @@ import mysql.connector
 import sys
 import logging
 from components.Space import Space
+from components.KeywordIndex import keyword_index
 
 # Set up logging
 logging.basicConfig(
@@ -16,7 +19,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def main():
+def main(use_keywords=False):
     # Load database config
     with open('db_config.json', 'r') as f:
         config = json.load(f)
@@ -58,7 +61,10 @@ def main():
         
         try:
             # Generate tags
-            tags = space.generate_tags_from_transcript(transcript)
+            if use_keywords:
+                tags = keyword_index.suggest_tags(transcript, max_tags=8, space_id=space_id, language=language)
+            else:
+                tags = space.generate_tags_from_transcript(transcript)
             
             if tags:
                 # Add tags to space
@@ -75,4 +81,4 @@ def main():
     logger.info("Tag generation complete")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(use_keywords='--keywords' in sys.argv)
\ No newline at end of file
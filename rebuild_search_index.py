@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Script to rebuild the full-text search index and the keyword index from the database.
+
+The indexes are normally kept up to date as transcripts and tags are saved; run
+this once after deploying search, or whenever an index file is lost.
+"""
+
+import sys
+import json
+import mysql.connector
+from pathlib import Path
+
+# Add parent directory to path for importing components
+sys.path.append(str(Path(__file__).parent))
+
+from components.SearchIndex import search_index
+from components.KeywordIndex import keyword_index
+
+def rebuild_search_index():
+    """Rebuild the search index from all spaces and transcripts."""
+    connection = None
+    try:
+        # Load database config
+        with open("db_config.json", 'r') as f:
+            config = json.load(f)
+        
+        db_config = config["mysql"].copy()
+        if 'use_ssl' in db_config:
+            del db_config['use_ssl']
+        
+        # Connect to database
+        connection = mysql.connector.connect(**db_config)
+        
+        print(f"Rebuilding search index at {search_index.db_path}...")
+        counts = search_index.rebuild(connection)
+        print(f"Indexed {counts['spaces']} spaces and {counts['transcripts']} transcripts")
+        
+        stats = search_index.get_stats()
+        print(f"Index now holds {stats['passages']} transcript passages")
+        
+        print(f"Rebuilding keyword index at {keyword_index.db_path}...")
+        keyword_index.rebuild(connection)
+        stats = keyword_index.get_stats()
+        print(f"Keyword index holds {stats['terms']} terms from {stats['documents']} transcripts")
+        return True
+        
+    except Exception as e:
+        print(f"Error rebuilding search index: {e}")
+        return False
+    finally:
+        if connection:
+            connection.close()
+
+if __name__ == "__main__":
+    success = rebuild_search_index()
+    sys.exit(0 if success else 1)
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """
 Script to regenerate ALL tags for spaces with transcripts using AI.
+
+With --keywords, every indexed transcript is re-tagged from the corpus
+keyword index instead, in one batch and without AI calls.
 """
 
 import sys
@@ -12,6 +15,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent))
 
 from background_transcribe import generate_and_save_tags_with_ai
+from components.KeywordIndex import keyword_index
 from components.Tag import Tag
 
 def regenerate_all_tags():
@@ -99,5 +103,49 @@ def regenerate_all_tags():
         import traceback
         traceback.print_exc()
 
+def regenerate_all_tags_from_keywords(max_tags=8):
+    """Replace every indexed space's tags with TF-IDF tags from the keyword index."""
+    connection = None
+    try:
+        with open("db_config.json", 'r') as f:
+            config = json.load(f)
+        
+        db_config = config["mysql"].copy()
+        if 'use_ssl' in db_config:
+            del db_config['use_ssl']
+        
+        connection = mysql.connector.connect(**db_config)
+        cursor = connection.cursor()
+        tag_component = Tag(connection)
+        
+        stats = keyword_index.get_stats()
+        print(f"Scoring {stats['documents']} indexed transcripts against {stats['terms']} terms...")
+        
+        tagged = set()
+        for space_id, language, tags in keyword_index.tag_documents(max_tags=max_tags):
+            # One set of tags per space, from the first transcript that yields any
+            if space_id in tagged or not tags:
+                continue
+            tagged.add(space_id)
+            
+            cursor.execute("DELETE FROM space_tags WHERE space_id = %s", (space_id,))
+            connection.commit()
+            count = tag_component.add_tags_to_space(space_id, tags, user_id=0)
+            print(f"  {space_id} ({language}): {count} tags - {', '.join(tags)}")
+        
+        cursor.close()
+        print(f"Re-tagged {len(tagged)} spaces")
+        
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        if connection:
+            connection.close()
+
 if __name__ == "__main__":
-    regenerate_all_tags()
\ No newline at end of file
+    if '--keywords' in sys.argv:
+        regenerate_all_tags_from_keywords()
+    else:
+        regenerate_all_tags()
\ No newline at end of file
@@ -0,0 +1,4947 @@
+let currentPeriod = 'daily';
+let submissionsChart = null;
+let currentUsersPage = 1;
+let currentSpacesPage = 1;
+
+// Initialize on page load
+document.addEventListener('DOMContentLoaded', function() {
+    loadUsers();
+    loadSpaces();
+    loadStatistics('daily');
+    
+    // Add enter key support for search
+    document.getElementById('userSearch').addEventListener('keypress', function(e) {
+        if (e.key === 'Enter') searchUsers();
+    });
+    document.getElementById('spaceSearch').addEventListener('keypress', function(e) {
+        if (e.key === 'Enter') searchSpaces();
+    });
+    
+    // Check if settings tab is active on page load or via URL hash
+    if (document.getElementById('settings-tab').classList.contains('active') || 
+        window.location.hash === '#settings') {
+        // If hash is #settings, activate the tab
+        if (window.location.hash === '#settings') {
+            const settingsTab = new bootstrap.Tab(document.getElementById('settings-tab'));
+            settingsTab.show();
+        }
+        // Load settings content
+        setTimeout(() => {
+            loadTrackingConfig();
+            loadTranscriptionConfig();
+            loadBrandingConfig();
+            loadAdminSystemMessages();
+            loadServiceSettings();
+            loadStripeConfig();
+        }, 100);
+    }
+    
+    // Handle templates hash redirect
+    if (window.location.hash === '#templates') {
+        // Redirect to dedicated templates page
+        window.location.href = '/admin/templates';
+    }
+    
+    // Load tracking config when settings tab is shown
+    document.getElementById('settings-tab').addEventListener('shown.bs.tab', function() {
+        loadTrackingConfig();
+        loadTranscriptionConfig();
+        loadBrandingConfig();
+        loadAdminSystemMessages();
+        loadServiceSettings();
+        loadStripeConfig();
+    });
+
+});
+
+// User Management Functions
+function loadUsers(page = 1) {
+    currentUsersPage = page;
+    const search = document.getElementById('userSearch').value;
+    
+    fetch(`/admin/api/users?page=${page}&search=${encodeURIComponent(search)}`)
+        .then(response => response.json())
+        .then(data => {
+            displayUsers(data.users);
+            displayPagination('usersPagination', data.page, data.pages, loadUsers);
+        })
+        .catch(error => {
+            console.error('Error loading users:', error);
+            document.getElementById('usersList').innerHTML = 
+                '<tr><td colspan="9" class="text-danger text-center">Error loading users</td></tr>';
+        });
+}
+
+function displayUsers(users) {
+    const tbody = document.getElementById('usersList');
+    
+    if (users.length === 0) {
+        tbody.innerHTML = '<tr><td colspan="10" class="text-center">No users found</td></tr>';
+        return;
+    }
+    
+    tbody.innerHTML = users.map(user => `
+        <tr>
+            <td>${user.id}</td>
+            <td>${user.email}</td>
+            <td>
+                <span class="badge bg-${user.status === 1 ? 'success' : 'secondary'}">
+                    ${user.status === 1 ? 'Active' : 'Inactive'}
+                </span>
+            </td>
+            <td>
+                <input type="checkbox" class="form-check-input" 
+                       ${user.is_admin ? 'checked' : ''} 
+                       onchange="updateUser(${user.id}, 'is_admin', this.checked)">
+            </td>
+            <td>
+                <div class="input-group input-group-sm" style="width: 100px;">
+                    <input type="number" class="form-control" 
+                           value="${Math.round(user.credits || 0)}" 
+                           step="1" min="0"
+                           onblur="updateUserCredits(${user.id}, this.value)"
+                           onkeypress="if(event.key === 'Enter') updateUserCredits(${user.id}, this.value)">
+                </div>
+            </td>
+            <td>${user.country || '-'}</td>
+            <td>${user.login_count || 0}</td>
+            <td>${user.space_count || 0}</td>
+            <td>${user.last_logged_in ? new Date(user.last_logged_in).toLocaleString() : 'Never'}</td>
+            <td>
+                <div class="btn-group btn-group-sm" role="group">
+                    <button class="btn btn-warning" onclick="toggleUserStatus(${user.id}, ${user.status})">
+                        ${user.status === 1 ? 'Suspend' : 'Activate'}
+                    </button>
+                    <button class="btn btn-danger" onclick="deleteUser(${user.id}, '${user.email}')">
+                        <i class="bi bi-trash"></i>
+                    </button>
+                </div>
+            </td>
+        </tr>
+    `).join('');
+}
+
+function searchUsers() {
+    loadUsers(1);
+}
+
+function updateUser(userId, field, value) {
+    fetch(`/admin/api/users/${userId}`, {
+        method: 'PUT',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({[field]: value})
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (!data.success) {
+            alert('Error updating user');
+            loadUsers(currentUsersPage);
+        }
+    })
+    .catch(error => {
+        console.error('Error:', error);
+        alert('Error updating user');
+        loadUsers(currentUsersPage);
+    });
+}
+
+function toggleUserStatus(userId, currentStatus) {
+    const newStatus = currentStatus === 1 ? 0 : 1;
+    updateUser(userId, 'status', newStatus);
+    loadUsers(currentUsersPage);
+}
+
+function deleteUser(userId, email) {
+    if (!confirm(`Are you sure you want to delete user: ${email}?`)) return;
+    
+    fetch(`/admin/api/users/${userId}`, {method: 'DELETE'})
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                loadUsers(currentUsersPage);
+            } else {
+                alert(data.error || 'Error deleting user');
+            }
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            alert('Error deleting user');
+        });
+}
+
+// Space Management Functions
+function loadSpaces(page = 1) {
+    currentSpacesPage = page;
+    const search = document.getElementById('spaceSearch').value;
+    
+    fetch(`/admin/api/spaces?page=${page}&search=${encodeURIComponent(search)}`)
+        .then(response => response.json())
+        .then(data => {
+            displaySpaces(data.spaces);
+            displayPagination('spacesPagination', data.page, data.pages, loadSpaces);
+        })
+        .catch(error => {
+            console.error('Error loading spaces:', error);
+            document.getElementById('spacesList').innerHTML = 
+                '<tr><td colspan="7" class="text-danger text-center">Error loading spaces</td></tr>';
+        });
+}
+
+function displaySpaces(spaces) {
+    const tbody = document.getElementById('spacesList');
+    
+    if (spaces.length === 0) {
+        tbody.innerHTML = '<tr><td colspan="7" class="text-center">No spaces found</td></tr>';
+        return;
+    }
+    
+    tbody.innerHTML = spaces.map(space => `
+        <tr>
+            <td>
+                <a href="/spaces/${space.space_id}" target="_blank" class="text-decoration-none">
+                    ${space.title || 'Untitled Space'}
+                </a>
+                <br>
+                <small class="text-muted">${space.space_id}</small>
+            </td>
+            <td>
+                ${space.host_handle ? `
+                    <img src="https://unavatar.io/twitter/${space.host_handle.replace('@', '')}" 
+                         alt="${space.host_handle}" 
+                         class="rounded-circle" 
+                         style="width: 32px; height: 32px;"
+                         onerror="this.style.display='none'">
+                ` : '-'}
+            </td>
+            <td>
+                ${space.user_email ? `
+                    <img src="https://unavatar.io/${space.user_email}" 
+                         alt="${space.user_email}" 
+                         class="rounded-circle" 
+                         style="width: 32px; height: 32px;"
+                         onerror="this.src='https://ui-avatars.com/api/?name=${encodeURIComponent(space.user_email.split('@')[0])}&background=random'">
+                ` : 'Anonymous'}
+            </td>
+            <td>${space.download_cnt || 0}</td>
+            <td>${space.playback_cnt || 0}</td>
+            <td>${new Date(space.created_at).toLocaleDateString()}</td>
+            <td>
+                <div class="btn-group" role="group">
+                    <button class="btn btn-primary btn-sm" onclick="redoTags('${space.space_id}')" title="Regenerate tags from transcript">
+                        Redo <i class="bi bi-tags"></i>
+                    </button>
+                    <button class="btn btn-warning btn-sm" onclick="reTranscribe('${space.space_id}')" title="Re-transcribe with base model">
+                        <i class="bi bi-mic"></i> Base
+                    </button>
+                    <button class="btn btn-success btn-sm" onclick="showUploadModal('${space.space_id}')" title="Upload new audio/video file">
+                        <i class="bi bi-cloud-upload"></i>
+                    </button>
+                    <button class="btn btn-danger btn-sm" onclick="deleteSpace('${space.space_id}')" title="Delete space">
+                        <i class="bi bi-trash"></i>
+                    </button>
+                </div>
+            </td>
+        </tr>
+    `).join('');
+}
+
+function searchSpaces() {
+    loadSpaces(1);
+}
+
+function deleteSpace(spaceId) {
+    if (!confirm('Are you sure you want to delete this space? This action cannot be undone.')) return;
+    
+    fetch(`/admin/api/spaces/${spaceId}`, {method: 'DELETE'})
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                loadSpaces(currentSpacesPage);
+            } else {
+                alert(data.error || 'Error deleting space');
+            }
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            alert('Error deleting space');
+        });
+}
+
+function redoTags(spaceId) {
+    if (!confirm('Regenerate tags for this space using its transcript? This will replace all existing tags.')) return;
+    
+    // Show loading state
+    const button = event.target.closest('button');
+    const originalHtml = button.innerHTML;
+    button.innerHTML = '<i class="bi bi-arrow-clockwise spin"></i> Generating...';
+    button.disabled = true;
+    
+    fetch(`/admin/api/spaces/${spaceId}/redo-tags`, {method: 'POST'})
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                // Show success message with tags
+                const tagsText = data.tags.length > 0 ? 
+                    `\n\nGenerated tags: ${data.tags.join(', ')}` : 
+                    '\n\nNo tags generated.';
+                alert(`${data.message} for "${data.space_title}"${tagsText}`);
+                // Reload the spaces list to show updated data
+                loadSpaces(currentSpacesPage);
+            } else {
+                alert(data.error || 'Error regenerating tags');
+            }
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            alert('Error regenerating tags');
+        })
+        .finally(() => {
+            // Restore button state
+            button.innerHTML = originalHtml;
+            button.disabled = false;
+        });
+}
+
+function reTranscribe(spaceId) {
+    if (!confirm('Re-transcribe this space with the base model? This will overwrite the existing transcript.')) return;
+    
+    // Show loading state
+    const button = event.target.closest('button');
+    const originalHtml = button.innerHTML;
+    button.innerHTML = '<i class="bi bi-arrow-clockwise spin"></i> Transcribing...';
+    button.disabled = true;
+    
+    fetch(`/admin/api/spaces/${spaceId}/re-transcribe`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json'
+        },
+        body: JSON.stringify({
+            model: 'base',
+            overwrite: true
+        })
+    })
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                alert(`${data.message} for space ${spaceId}`);
+            } else {
+                alert(data.error || 'Error starting re-transcription');
+            }
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            alert('Error starting re-transcription');
+        })
+        .finally(() => {
+            // Restore button state
+            button.innerHTML = originalHtml;
+            button.disabled = false;
+        });
+}
+
+// Upload Functions
+let uploadAbortController = null;
+
+function showUploadModal(spaceId) {
+    document.getElementById('uploadSpaceId').value = spaceId;
+    
+    // Reset modal state
+    resetUploadModal();
+    
+    // Show modal
+    const modal = new bootstrap.Modal(document.getElementById('uploadModal'));
+    modal.show();
+}
+
+function resetUploadModal() {
+    // Clear file input
+    document.getElementById('uploadFile').value = '';
+    
+    // Hide all dynamic sections
+    document.getElementById('filePreview').style.display = 'none';
+    document.getElementById('uploadProgress').style.display = 'none';
+    document.getElementById('uploadResult').style.display = 'none';
+    
+    // Reset progress bar
+    const progressBar = document.getElementById('uploadProgressBar');
+    progressBar.style.width = '0%';
+    progressBar.textContent = '0%';
+    progressBar.className = 'progress-bar progress-bar-striped progress-bar-animated';
+    
+    // Reset buttons
+    document.getElementById('uploadSubmitBtn').style.display = 'inline-block';
+    document.getElementById('uploadCancelBtn').textContent = 'Cancel';
+    document.getElementById('uploadCancelBtn').innerHTML = '<i class="bi bi-x-circle"></i> Cancel';
+    
+    // Clear any existing abort controller
+    if (uploadAbortController) {
+        uploadAbortController.abort();
+        uploadAbortController = null;
+    }
+}
+
+// File selection handler
+document.getElementById('uploadFile').addEventListener('change', function(e) {
+    const file = e.target.files[0];
+    if (file) {
+        showFilePreview(file);
+    } else {
+        document.getElementById('filePreview').style.display = 'none';
+    }
+});
+
+function showFilePreview(file) {
+    const preview = document.getElementById('filePreview');
+    const fileName = document.getElementById('fileName');
+    const fileSize = document.getElementById('fileSize');
+    const fileType = document.getElementById('fileType');
+    
+    fileName.textContent = file.name;
+    fileSize.textContent = formatFileSize(file.size);
+    fileType.textContent = file.type || 'Unknown';
+    
+    preview.style.display = 'block';
+}
+
+function formatFileSize(bytes) {
+    if (bytes === 0) return '0 Bytes';
+    const k = 1024;
+    const sizes = ['Bytes', 'KB', 'MB', 'GB'];
+    const i = Math.floor(Math.log(bytes) / Math.log(k));
+    return parseFloat((bytes / Math.pow(k, i)).toFixed(2)) + ' ' + sizes[i];
+}
+
+function validateFile(file) {
+    const maxSize = 2 * 1024 * 1024 * 1024; // 2GB
+    const allowedTypes = ['audio/mpeg', 'audio/mp4', 'audio/wav', 'audio/x-wav', 'audio/webm', 'audio/ogg', 
+                         'video/mp4', 'video/webm', 'video/quicktime', 'video/x-msvideo'];
+    const allowedExtensions = ['.mp3', '.mp4', '.wav', '.m4a', '.webm', '.ogg', '.avi', '.mov'];
+    
+    // Check file size
+    if (file.size > maxSize) {
+        return 'File size too large. Maximum allowed size is 2GB.';
+    }
+    
+    // Check file extension
+    const fileExtension = '.' + file.name.split('.').pop().toLowerCase();
+    if (!allowedExtensions.includes(fileExtension)) {
+        return 'Invalid file type. Supported formats: MP3, MP4, WAV, M4A, WebM, OGG.';
+    }
+    
+    return null; // No error
+}
+
+function startUpload() {
+    const fileInput = document.getElementById('uploadFile');
+    const spaceId = document.getElementById('uploadSpaceId').value;
+    const file = fileInput.files[0];
+    
+    if (!file) {
+        alert('Please select a file to upload.');
+        return;
+    }
+    
+    // Validate file
+    const validationError = validateFile(file);
+    if (validationError) {
+        showUploadResult(false, validationError);
+        return;
+    }
+    
+    // Show progress section
+    document.getElementById('uploadProgress').style.display = 'block';
+    document.getElementById('uploadResult').style.display = 'none';
+    
+    // Disable upload button and change cancel button
+    document.getElementById('uploadSubmitBtn').style.display = 'none';
+    document.getElementById('uploadCancelBtn').innerHTML = '<i class="bi bi-x-circle"></i> Abort Upload';
+    
+    // Create FormData
+    const formData = new FormData();
+    formData.append('file', file);
+    formData.append('space_id', spaceId);
+    
+    // Create abort controller
+    uploadAbortController = new AbortController();
+    
+    // Create XMLHttpRequest for progress tracking
+    const xhr = new XMLHttpRequest();
+    
+    // Track upload progress
+    xhr.upload.addEventListener('progress', function(e) {
+        if (e.lengthComputable) {
+            const percentComplete = (e.loaded / e.total) * 100;
+            updateUploadProgress(percentComplete, 'Uploading...');
+        }
+    });
+    
+    // Handle successful response
+    xhr.addEventListener('load', function() {
+        if (xhr.status === 200) {
+            try {
+                const response = JSON.parse(xhr.responseText);
+                if (response.success) {
+                    showUploadResult(true, response.message || 'File uploaded successfully!');
+                    // Refresh spaces table after successful upload
+                    setTimeout(() => {
+                        loadSpaces(currentSpacesPage);
+                    }, 1500);
+                } else {
+                    showUploadResult(false, response.error || 'Upload failed');
+                }
+            } catch (e) {
+                showUploadResult(false, 'Invalid server response');
+            }
+        } else {
+            showUploadResult(false, `Upload failed with status: ${xhr.status}`);
+        }
+    });
+    
+    // Handle errors
+    xhr.addEventListener('error', function() {
+        showUploadResult(false, 'Upload failed due to network error');
+    });
+    
+    // Handle abort
+    xhr.addEventListener('abort', function() {
+        showUploadResult(false, 'Upload was cancelled');
+    });
+    
+    // Setup abort controller
+    uploadAbortController.signal.addEventListener('abort', function() {
+        xhr.abort();
+    });
+    
+    // Start upload
+    xhr.open('POST', '/admin/api/spaces/upload');
+    xhr.send(formData);
+    
+    updateUploadProgress(0, 'Starting upload...');
+}
+
+function updateUploadProgress(percent, status) {
+    const progressBar = document.getElementById('uploadProgressBar');
+    const statusText = document.getElementById('uploadStatus');
+    
+    progressBar.style.width = percent + '%';
+    progressBar.textContent = Math.round(percent) + '%';
+    statusText.textContent = status;
+    
+    if (percent >= 100) {
+        progressBar.className = 'progress-bar bg-success';
+        statusText.textContent = 'Processing upload...';
+    }
+}
+
+function showUploadResult(success, message) {
+    const resultDiv = document.getElementById('uploadResult');
+    const resultContent = document.getElementById('uploadResultContent');
+    
+    resultDiv.className = success ? 'alert alert-success' : 'alert alert-danger';
+    resultContent.innerHTML = `<i class="bi bi-${success ? 'check-circle' : 'exclamation-triangle'}"></i> ${message}`;
+    resultDiv.style.display = 'block';
+    
+    // Hide progress section
+    document.getElementById('uploadProgress').style.display = 'none';
+    
+    // Reset buttons
+    document.getElementById('uploadSubmitBtn').style.display = 'inline-block';
+    document.getElementById('uploadCancelBtn').innerHTML = '<i class="bi bi-x-circle"></i> Close';
+    
+    // Clear abort controller
+    uploadAbortController = null;
+}
+
+// Handle cancel/abort button
+document.getElementById('uploadCancelBtn').addEventListener('click', function() {
+    if (uploadAbortController) {
+        // Currently uploading, abort it
+        uploadAbortController.abort();
+    }
+});
+
+// Statistics Functions
+function changePeriod(period) {
+    currentPeriod = period;
+    
+    // Update button states
+    document.querySelectorAll('.btn-group button').forEach(btn => {
+        btn.classList.remove('active');
+    });
+    event.target.classList.add('active');
+    
+    loadStatistics(period);
+}
+
+function loadStatistics(period) {
+    // Load all statistics
+    loadSubmissionsChart(period);
+    loadPopularSpaces(period);
+    loadDownloadedSpaces(period);
+    loadActiveUsers(period);
+}
+
+function loadSubmissionsChart(period) {
+    fetch(`/admin/api/stats/submissions?period=${period}`)
+        .then(response => response.json())
+        .then(result => {
+            const ctx = document.getElementById('submissionsChart').getContext('2d');
+            
+            if (submissionsChart) {
+                submissionsChart.destroy();
+            }
+            
+            submissionsChart = new Chart(ctx, {
+                type: 'line',
+                data: {
+                    labels: result.data.map(d => new Date(d.date).toLocaleDateString()),
+                    datasets: [{
+                        label: 'Space Submissions',
+                        data: result.data.map(d => d.count),
+                        borderColor: 'rgb(75, 192, 192)',
+                        backgroundColor: 'rgba(75, 192, 192, 0.2)',
+                        tension: 0.1
+                    }]
+                },
+                options: {
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    scales: {
+                        y: {
+                            beginAtZero: true,
+                            ticks: {
+                                stepSize: 1
+                            }
+                        }
+                    }
+                }
+            });
+        })
+        .catch(error => console.error('Error loading submissions chart:', error));
+}
+
+function loadPopularSpaces(period) {
+    fetch(`/admin/api/stats/plays?period=${period}`)
+        .then(response => response.json())
+        .then(result => {
+            const list = document.getElementById('popularSpacesList');
+            
+            if (result.data.length === 0) {
+                list.innerHTML = '<div class="text-center text-muted">No data available</div>';
+                return;
+            }
+            
+            list.innerHTML = result.data.slice(0, 10).map((space, index) => `
+                <a href="/spaces/${space.space_id}" target="_blank" class="list-group-item list-group-item-action">
+                    <div class="d-flex justify-content-between align-items-center">
+                        <div>
+                            <strong>#${index + 1}</strong> ${space.title || 'Untitled'}
+                            <small class="text-muted d-block">${space.host || 'Unknown host'}</small>
+                        </div>
+                        <span class="badge bg-primary rounded-pill">${space.playback_cnt} plays</span>
+                    </div>
+                </a>
+            `).join('');
+        })
+        .catch(error => console.error('Error loading popular spaces:', error));
+}
+
+function loadDownloadedSpaces(period) {
+    fetch(`/admin/api/stats/downloads?period=${period}`)
+        .then(response => response.json())
+        .then(result => {
+            const list = document.getElementById('downloadedSpacesList');
+            
+            if (result.data.length === 0) {
+                list.innerHTML = '<div class="text-center text-muted">No data available</div>';
+                return;
+            }
+            
+            list.innerHTML = result.data.slice(0, 10).map((space, index) => `
+                <a href="/spaces/${space.space_id}" target="_blank" class="list-group-item list-group-item-action">
+                    <div class="d-flex justify-content-between align-items-center">
+                        <div>
+                            <strong>#${index + 1}</strong> ${space.title || 'Untitled'}
+                            <small class="text-muted d-block">${space.host || 'Unknown host'}</small>
+                        </div>
+                        <span class="badge bg-info rounded-pill">${space.download_cnt} downloads</span>
+                    </div>
+                </a>
+            `).join('');
+        })
+        .catch(error => console.error('Error loading downloaded spaces:', error));
+}
+
+function loadActiveUsers(period) {
+    fetch(`/admin/api/stats/active_users?period=${period}`)
+        .then(response => response.json())
+        .then(result => {
+            const tbody = document.getElementById('activeUsersList');
+            
+            if (result.data.length === 0) {
+                tbody.innerHTML = '<tr><td colspan="6" class="text-center text-muted">No data available</td></tr>';
+                return;
+            }
+            
+            tbody.innerHTML = result.data.map(user => `
+                <tr>
+                    <td>${user.email}</td>
+                    <td>${user.country || '-'}</td>
+                    <td>${user.login_count || 0}</td>
+                    <td>${user.space_count || 0}</td>
+                    <td>${user.total_downloads || 0}</td>
+                    <td>${user.total_plays || 0}</td>
+                </tr>
+            `).join('');
+        })
+        .catch(error => console.error('Error loading active users:', error));
+}
+
+// Pagination Helper
+function displayPagination(elementId, currentPage, totalPages, loadFunction) {
+    const pagination = document.getElementById(elementId);
+    
+    if (totalPages <= 1) {
+        pagination.innerHTML = '';
+        return;
+    }
+    
+    let html = '';
+    
+    // Previous button
+    html += `<li class="page-item ${currentPage === 1 ? 'disabled' : ''}">
+        <a class="page-link" href="#" onclick="event.preventDefault(); ${currentPage > 1 ? `${loadFunction.name}(${currentPage - 1})` : ''}">Previous</a>
+    </li>`;
+    
+    // Page numbers
+    for (let i = Math.max(1, currentPage - 2); i <= Math.min(totalPages, currentPage + 2); i++) {
+        html += `<li class="page-item ${i === currentPage ? 'active' : ''}">
+            <a class="page-link" href="#" onclick="event.preventDefault(); ${loadFunction.name}(${i})">${i}</a>
+        </li>`;
+    }
+    
+    // Next button
+    html += `<li class="page-item ${currentPage === totalPages ? 'disabled' : ''}">
+        <a class="page-link" href="#" onclick="event.preventDefault(); ${currentPage < totalPages ? `${loadFunction.name}(${currentPage + 1})` : ''}">Next</a>
+    </li>`;
+    
+    pagination.innerHTML = html;
+}
+
+// Rate Limit Settings
+document.getElementById('rateLimitForm').addEventListener('submit', async function(e) {
+    e.preventDefault();
+    
+    const messageDiv = document.getElementById('rateLimitMessage');
+    messageDiv.style.display = 'none';
+    
+    const data = {
+        daily_limit: parseInt(document.getElementById('dailyLimit').value),
+        hourly_limit: parseInt(document.getElementById('hourlyLimit').value),
+        enabled: document.getElementById('rateLimitEnabled').checked
+    };
+    
+    try {
+        const response = await fetch('/admin/api/update_rate_limits', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify(data)
+        });
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            messageDiv.className = 'alert alert-success mt-3';
+            messageDiv.textContent = result.message;
+            messageDiv.style.display = 'block';
+        } else {
+            messageDiv.className = 'alert alert-danger mt-3';
+            messageDiv.textContent = 'Error: ' + (result.error || 'Failed to update settings');
+            messageDiv.style.display = 'block';
+        }
+    } catch (error) {
+        messageDiv.className = 'alert alert-danger mt-3';
+        messageDiv.textContent = 'Error: ' + error.message;
+        messageDiv.style.display = 'block';
+    }
+});
+
+// Load tracking configuration on page load
+async function loadTrackingConfig() {
+    try {
+        const response = await fetch('/admin/api/tracking_config');
+        const result = await response.json();
+        
+        if (result.success && result.config) {
+            // Set form values
+            document.getElementById('playCooldownMinutes').value = result.config.play_cooldown_minutes || 30;
+            document.getElementById('playMinDuration').value = result.config.play_minimum_duration_seconds || 30;
+            document.getElementById('downloadDailyLimit').value = result.config.download_daily_limit || 1;
+            document.getElementById('downloadHourlyIpLimit').value = result.config.download_hourly_ip_limit || 10;
+            document.getElementById('playTrackingEnabled').checked = result.config.play_tracking_enabled !== 'false';
+            document.getElementById('downloadTrackingEnabled').checked = result.config.download_tracking_enabled !== 'false';
+        }
+    } catch (error) {
+        console.error('Error loading tracking config:', error);
+    }
+}
+
+// Save tracking configuration
+document.getElementById('trackingConfigForm').addEventListener('submit', async function(e) {
+    e.preventDefault();
+    
+    const messageDiv = document.getElementById('trackingConfigMessage');
+    messageDiv.style.display = 'none';
+    
+    const data = {
+        play_cooldown_minutes: document.getElementById('playCooldownMinutes').value,
+        play_minimum_duration_seconds: document.getElementById('playMinDuration').value,
+        download_daily_limit: document.getElementById('downloadDailyLimit').value,
+        download_hourly_ip_limit: document.getElementById('downloadHourlyIpLimit').value,
+        play_tracking_enabled: document.getElementById('playTrackingEnabled').checked ? 'true' : 'false',
+        download_tracking_enabled: document.getElementById('downloadTrackingEnabled').checked ? 'true' : 'false'
+    };
+    
+    try {
+        const response = await fetch('/admin/api/update_tracking_config', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify(data)
+        });
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            messageDiv.className = 'alert alert-success mt-3';
+            messageDiv.textContent = result.message || 'Tracking configuration updated successfully';
+            messageDiv.style.display = 'block';
+        } else {
+            messageDiv.className = 'alert alert-danger mt-3';
+            messageDiv.textContent = 'Error: ' + (result.error || 'Failed to update configuration');
+            messageDiv.style.display = 'block';
+        }
+    } catch (error) {
+        messageDiv.className = 'alert alert-danger mt-3';
+        messageDiv.textContent = 'Error: ' + error.message;
+        messageDiv.style.display = 'block';
+    }
+});
+
+
+// Transcription Configuration
+document.querySelectorAll('input[name="transcriptionProvider"]').forEach(radio => {
+    radio.addEventListener('change', function() {
+        const openaiSettings = document.getElementById('openaiApiSettings');
+        const localSettings = document.getElementById('localWhisperSettings');
+        
+        if (this.value === 'openai') {
+            openaiSettings.style.display = 'block';
+            localSettings.style.display = 'none';
+        } else {
+            openaiSettings.style.display = 'none';
+            localSettings.style.display = 'block';
+        }
+    });
+});
+
+async function loadTranscriptionConfig() {
+    try {
+        const response = await fetch('/admin/api/transcription_config');
+        if (response.ok) {
+            const result = await response.json();
+            
+            if (result.success && result.config) {
+                // Set provider
+                const provider = result.config.provider || 'local';
+                document.getElementById(provider === 'openai' ? 'openaiApi' : 'localWhisper').checked = true;
+                
+                // Trigger change event to show/hide sections
+                document.querySelector(`input[value="${provider}"]`).dispatchEvent(new Event('change'));
+                
+                // Set OpenAI settings
+                const apiKeyInput = document.getElementById('openaiApiKey');
+                const apiKeyStatus = document.getElementById('apiKeyStatus');
+                const keySource = result.config.openai_key_source || 'none';
+                
+                if (keySource === 'environment') {
+                    apiKeyInput.value = '***from_env***';
+                    apiKeyInput.placeholder = 'Using API key from environment variables';
+                    apiKeyInput.title = 'OpenAI API key is set in environment variables (.env file)';
+                    apiKeyStatus.innerHTML = '<i class="bi bi-check-circle text-success"></i> API key configured in environment variables (.env file).';
+                } else if (keySource === 'config') {
+                    apiKeyInput.value = '***hidden***';
+                    apiKeyInput.placeholder = 'Using API key from configuration';
+                    apiKeyInput.title = 'OpenAI API key is set in configuration file';
+                    apiKeyStatus.innerHTML = '<i class="bi bi-check-circle text-success"></i> API key configured in settings file.';
+                } else {
+                    apiKeyInput.value = '';
+                    apiKeyInput.placeholder = 'sk-...';
+                    apiKeyInput.title = 'Enter your OpenAI API key';
+                    apiKeyStatus.innerHTML = '<i class="bi bi-exclamation-triangle text-warning"></i> No API key configured. Enter one to use OpenAI transcription.';
+                }
+                
+                document.getElementById('openaiModel').value = result.config.openai_model || 'gpt-4o-mini-transcribe';
+                
+                // Set local Whisper settings
+                document.getElementById('defaultWhisperModel').value = result.config.default_model || 'tiny';
+                document.getElementById('whisperDevice').value = result.config.device || 'auto';
+                
+                // Set corrective filter settings
+                document.getElementById('enableCorrectiveFilter').checked = result.config.enable_corrective_filter !== false;
+                document.getElementById('correctionModel').value = result.config.correction_model || 'gpt-4o-mini';
+            }
+        }
+    } catch (error) {
+        console.error('Error loading transcription config:', error);
+    }
+}
+
+document.getElementById('transcriptionConfigForm').addEventListener('submit', async function(e) {
+    e.preventDefault();
+    
+    const messageDiv = document.getElementById('transcriptionConfigMessage');
+    messageDiv.style.display = 'none';
+    
+    const provider = document.querySelector('input[name="transcriptionProvider"]:checked').value;
+    
+    const data = {
+        provider: provider,
+        openai_api_key: document.getElementById('openaiApiKey').value,
+        openai_model: document.getElementById('openaiModel').value,
+        default_model: document.getElementById('defaultWhisperModel').value,
+        device: document.getElementById('whisperDevice').value,
+        enable_corrective_filter: document.getElementById('enableCorrectiveFilter').checked,
+        correction_model: document.getElementById('correctionModel').value
+    };
+    
+    try {
+        const response = await fetch('/admin/api/transcription_config', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify(data)
+        });
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            messageDiv.className = 'alert alert-success mt-3';
+            messageDiv.textContent = result.message || 'Transcription configuration updated successfully';
+            messageDiv.style.display = 'block';
+        } else {
+            messageDiv.className = 'alert alert-danger mt-3';
+            messageDiv.textContent = 'Error: ' + (result.error || 'Failed to update configuration');
+            messageDiv.style.display = 'block';
+        }
+    } catch (error) {
+        messageDiv.className = 'alert alert-danger mt-3';
+        messageDiv.textContent = 'Error: ' + error.message;
+        messageDiv.style.display = 'block';
+    }
+});
+
+// Old logs JavaScript removed - now using dynamic template loading
+
+// System Monitoring Variables
+let systemMonitoringActive = false;
+let systemMonitoringInterval = null;
+
+// System Monitoring Functions
+async function loadSystemStats() {
+    try {
+        const response = await fetch('/admin/api/system_stats');
+        const result = await response.json();
+        
+        if (result.success) {
+            updateSystemDisplay(result.stats);
+            document.getElementById('systemStatus').textContent = 'Live';
+            document.getElementById('systemStatus').className = 'badge bg-success ms-2';
+        } else {
+            console.error('Error loading system stats:', result.error);
+            document.getElementById('systemStatus').textContent = 'Error';
+            document.getElementById('systemStatus').className = 'badge bg-danger ms-2';
+        }
+    } catch (error) {
+        console.error('Error loading system stats:', error);
+        document.getElementById('systemStatus').textContent = 'Offline';
+        document.getElementById('systemStatus').className = 'badge bg-secondary ms-2';
+    }
+}
+
+function updateSystemDisplay(stats) {
+    // Update CPU
+    const cpuProgress = document.getElementById('cpuProgress');
+    const cpuDetails = document.getElementById('cpuDetails');
+    cpuProgress.style.width = `${stats.cpu.usage_percent}%`;
+    cpuProgress.textContent = `${stats.cpu.usage_percent}%`;
+    cpuProgress.className = `progress-bar ${getProgressBarColor(stats.cpu.usage_percent)}`;
+    cpuDetails.textContent = stats.cpu.details;
+    
+    // Update Memory
+    const memoryProgress = document.getElementById('memoryProgress');
+    const memoryDetails = document.getElementById('memoryDetails');
+    memoryProgress.style.width = `${stats.memory.usage_percent}%`;
+    memoryProgress.textContent = `${stats.memory.usage_percent}%`;
+    memoryProgress.className = `progress-bar ${getProgressBarColor(stats.memory.usage_percent)}`;
+    memoryDetails.textContent = stats.memory.details;
+    
+    // Update Disk
+    const diskProgress = document.getElementById('diskProgress');
+    const diskDetails = document.getElementById('diskDetails');
+    diskProgress.style.width = `${stats.disk.usage_percent}%`;
+    diskProgress.textContent = `${stats.disk.usage_percent}%`;
+    diskProgress.className = `progress-bar ${getProgressBarColor(stats.disk.usage_percent)}`;
+    diskDetails.textContent = stats.disk.details;
+    
+    // Update GPU
+    const gpuProgress = document.getElementById('gpuProgress');
+    const gpuDetails = document.getElementById('gpuDetails');
+    
+    if (stats.gpu.available !== false) {
+        const gpuUsage = stats.gpu.usage_percent || 0;
+        gpuProgress.style.width = `${gpuUsage}%`;
+        gpuProgress.textContent = `${gpuUsage}%`;
+        gpuProgress.className = `progress-bar ${getProgressBarColor(gpuUsage)}`;
+        gpuDetails.textContent = stats.gpu.details;
+    } else {
+        gpuProgress.style.width = '0%';
+        gpuProgress.textContent = 'N/A';
+        gpuProgress.className = 'progress-bar bg-secondary';
+        gpuDetails.textContent = stats.gpu.details;
+    }
+}
+
+function getProgressBarColor(percentage) {
+    if (percentage < 50) return 'bg-success';
+    if (percentage < 75) return 'bg-warning';
+    return 'bg-danger';
+}
+
+function startSystemMonitoring() {
+    if (!systemMonitoringActive) {
+        systemMonitoringActive = true;
+        // Load immediately
+        loadSystemStats();
+        // Set up 30-second interval
+        systemMonitoringInterval = setInterval(loadSystemStats, 30000);
+    }
+}
+
+function stopSystemMonitoring() {
+    if (systemMonitoringActive) {
+        systemMonitoringActive = false;
+        clearInterval(systemMonitoringInterval);
+        document.getElementById('systemStatus').textContent = 'Stopped';
+        document.getElementById('systemStatus').className = 'badge bg-secondary ms-2';
+    }
+}
+
+// Start system monitoring when the page loads
+document.addEventListener('DOMContentLoaded', function() {
+    startSystemMonitoring();
+});
+
+// Stop monitoring when the page is about to unload
+window.addEventListener('beforeunload', function() {
+    stopSystemMonitoring();
+});
+
+// Development Tab Functions (only available on localhost)
+function enableClearSpacesButton() {
+    const checkbox = document.getElementById('confirmClearSpaces');
+    const button = document.getElementById('clearSpacesBtn');
+    button.disabled = !checkbox.checked;
+}
+
+function enableClearUsersButton() {
+    const checkbox = document.getElementById('confirmClearUsers');
+    const button = document.getElementById('clearUsersBtn');
+    button.disabled = !checkbox.checked;
+}
+
+async function clearAllSpacesData() {
+    const confirmed = confirm(
+        "⚠️ FINAL WARNING ⚠️\n\n" +
+        "This will PERMANENTLY DELETE:\n" +
+        "• ALL spaces from database\n" +
+        "• ALL audio files (downloads/)\n" +
+        "• ALL transcript jobs\n\n" +
+        "This action CANNOT be undone!\n\n" +
+        "Type 'DELETE ALL SPACES' in the next dialog to proceed."
+    );
+    
+    if (!confirmed) return;
+    
+    const confirmText = prompt("Type 'DELETE ALL SPACES' to confirm:");
+    if (confirmText !== 'DELETE ALL SPACES') {
+        alert("Confirmation text did not match. Operation cancelled.");
+        return;
+    }
+    
+    const messageDiv = document.getElementById('clearSpacesMessage');
+    const button = document.getElementById('clearSpacesBtn');
+    
+    try {
+        button.disabled = true;
+        button.innerHTML = '<i class="bi bi-arrow-clockwise spin"></i> Clearing...';
+        
+        const response = await fetch('/admin/api/dev/clear_spaces_data', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ confirm: 'DELETE ALL SPACES' })
+        });
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            messageDiv.className = 'alert alert-success mt-3';
+            messageDiv.textContent = result.message;
+            messageDiv.style.display = 'block';
+            
+            // Uncheck the confirmation
+            document.getElementById('confirmClearSpaces').checked = false;
+            
+            // Refresh the page after a delay
+            setTimeout(() => {
+                window.location.reload();
+            }, 3000);
+        } else {
+            messageDiv.className = 'alert alert-danger mt-3';
+            messageDiv.textContent = 'Error: ' + (result.error || 'Failed to clear spaces data');
+            messageDiv.style.display = 'block';
+        }
+    } catch (error) {
+        messageDiv.className = 'alert alert-danger mt-3';
+        messageDiv.textContent = 'Error: ' + error.message;
+        messageDiv.style.display = 'block';
+    } finally {
+        button.disabled = false;
+        button.innerHTML = '<i class="bi bi-trash3-fill"></i> Clear All Spaces Data';
+    }
+}
+
+async function clearNonAdminUsers() {
+    const confirmed = confirm(
+        "⚠️ FINAL WARNING ⚠️\n\n" +
+        "This will PERMANENTLY DELETE all users except admins!\n\n" +
+        "Admin users (is_admin = 1) will be preserved.\n\n" +
+        "This action CANNOT be undone!\n\n" +
+        "Type 'DELETE NON ADMIN USERS' in the next dialog to proceed."
+    );
+    
+    if (!confirmed) return;
+    
+    const confirmText = prompt("Type 'DELETE NON ADMIN USERS' to confirm:");
+    if (confirmText !== 'DELETE NON ADMIN USERS') {
+        alert("Confirmation text did not match. Operation cancelled.");
+        return;
+    }
+    
+    const messageDiv = document.getElementById('clearUsersMessage');
+    const button = document.getElementById('clearUsersBtn');
+    
+    try {
+        button.disabled = true;
+        button.innerHTML = '<i class="bi bi-arrow-clockwise spin"></i> Clearing...';
+        
+        const response = await fetch('/admin/api/dev/clear_non_admin_users', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ confirm: 'DELETE NON ADMIN USERS' })
+        });
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            messageDiv.className = 'alert alert-success mt-3';
+            messageDiv.textContent = result.message;
+            messageDiv.style.display = 'block';
+            
+            // Uncheck the confirmation
+            document.getElementById('confirmClearUsers').checked = false;
+        } else {
+            messageDiv.className = 'alert alert-danger mt-3';
+            messageDiv.textContent = 'Error: ' + (result.error || 'Failed to clear users');
+            messageDiv.style.display = 'block';
+        }
+    } catch (error) {
+        messageDiv.className = 'alert alert-danger mt-3';
+        messageDiv.textContent = 'Error: ' + error.message;
+        messageDiv.style.display = 'block';
+    } finally {
+        button.disabled = false;
+        button.innerHTML = '<i class="bi bi-people-fill"></i> Clear Non-Admin Users';
+    }
+}
+
+// Add event listeners for development checkboxes when page loads
+document.addEventListener('DOMContentLoaded', function() {
+    // Only add listeners if development tab exists (localhost only)
+    const spacesCheckbox = document.getElementById('confirmClearSpaces');
+    const usersCheckbox = document.getElementById('confirmClearUsers');
+    
+    if (spacesCheckbox) {
+        spacesCheckbox.addEventListener('change', enableClearSpacesButton);
+    }
+    
+    if (usersCheckbox) {
+        usersCheckbox.addEventListener('change', enableClearUsersButton);
+    }
+    
+    // Initialize branding configuration
+    initializeBrandingConfig();
+});
+
+// Branding Configuration Functions
+function initializeBrandingConfig() {
+    // Set up color picker sync
+    const colorPicker = document.getElementById('brandingColor');
+    const colorHex = document.getElementById('brandingColorHex');
+    const backgroundColorPicker = document.getElementById('brandingBackgroundColor');
+    const backgroundColorHex = document.getElementById('brandingBackgroundColorHex');
+    
+    if (colorPicker && colorHex) {
+        colorPicker.addEventListener('input', function() {
+            colorHex.value = this.value;
+            updateBrandingPreview();
+        });
+        
+        colorHex.addEventListener('input', function() {
+            if (/^#[0-9A-F]{6}$/i.test(this.value)) {
+                colorPicker.value = this.value;
+                updateBrandingPreview();
+            }
+        });
+    }
+    
+    // Sync background color picker with hex input
+    if (backgroundColorPicker && backgroundColorHex) {
+        backgroundColorPicker.addEventListener('input', function() {
+            backgroundColorHex.value = this.value;
+            updateBrandingPreview();
+        });
+        
+        backgroundColorHex.addEventListener('input', function() {
+            if (/^#[0-9A-F]{6}$/i.test(this.value)) {
+                backgroundColorPicker.value = this.value;
+                updateBrandingPreview();
+            }
+        });
+    }
+    
+    // Set up real-time preview updates
+    const previewElements = [
+        'brandingTitle', 'brandingWatermark', 'brandingLogo', 
+        'brandingFont', 'brandingEnabled'
+    ];
+    
+    previewElements.forEach(id => {
+        const element = document.getElementById(id);
+        if (element) {
+            element.addEventListener('input', updateBrandingPreview);
+            element.addEventListener('change', updateBrandingPreview);
+        }
+    });
+    
+    // Set up form submit handler
+    const brandingForm = document.getElementById('brandingConfigForm');
+    if (brandingForm) {
+        brandingForm.addEventListener('submit', handleBrandingFormSubmit);
+    }
+    
+    // Initial preview update
+    updateBrandingPreview();
+}
+
+function updateBrandingPreview() {
+    const enabled = document.getElementById('brandingEnabled')?.checked ?? true;
+    const title = document.getElementById('brandingTitle')?.value || 'Your Brand Name';
+    const watermark = document.getElementById('brandingWatermark')?.value || 'yoursite.com';
+    const color = document.getElementById('brandingColor')?.value || '#007bff';
+    const backgroundColor = document.getElementById('brandingBackgroundColor')?.value || '#ffffff';
+    const logo = document.getElementById('brandingLogo')?.value;
+    const font = document.getElementById('brandingFont')?.value || 'Arial';
+    
+    // Update preview elements
+    const previewTitle = document.getElementById('brandingPreviewTitle');
+    const previewWatermark = document.getElementById('brandingPreviewWatermark');
+    const previewProgress = document.getElementById('brandingPreviewProgress');
+    const previewLogo = document.getElementById('brandingPreviewLogo');
+    const previewLogoImg = document.getElementById('brandingPreviewLogoImg');
+    const previewCard = document.querySelector('#brandingPreviewCard');
+    
+    if (!enabled) {
+        // Show disabled state
+        if (previewTitle) {
+            previewTitle.textContent = 'Sample Space Title (Branding Disabled)';
+            previewTitle.style.color = '#6c757d';
+            previewTitle.style.fontFamily = 'Arial';
+        }
+        if (previewWatermark) {
+            previewWatermark.textContent = '';
+        }
+        if (previewProgress) {
+            previewProgress.style.background = '#6c757d';
+        }
+        if (previewLogo) {
+            previewLogo.style.display = 'none';
+        }
+        if (previewCard) {
+            previewCard.style.setProperty('background-color', '#f8f9fa', 'important');
+        }
+        return;
+    }
+    
+    // Update title
+    if (previewTitle) {
+        previewTitle.textContent = `${title} - Sample Space Title`;
+        previewTitle.style.color = color;
+        previewTitle.style.fontFamily = font;
+    }
+    
+    // Update background color
+    if (previewCard) {
+        previewCard.style.setProperty('background-color', backgroundColor, 'important');
+    }
+    
+    // Update watermark
+    if (previewWatermark) {
+        previewWatermark.textContent = watermark;
+    }
+    
+    // Update progress bar color
+    if (previewProgress) {
+        previewProgress.style.background = color;
+    }
+    
+    // Update logo
+    if (previewLogo && previewLogoImg) {
+        if (logo && logo.trim()) {
+            previewLogoImg.src = logo;
+            previewLogo.style.display = 'block';
+            
+            // Handle logo load error
+            previewLogoImg.onerror = function() {
+                previewLogo.style.display = 'none';
+            };
+        } else {
+            previewLogo.style.display = 'none';
+        }
+    }
+}
+
+// Load branding configuration from server
+async function loadBrandingConfig() {
+    console.log('Loading branding configuration...');
+    try {
+        const response = await fetch('/admin/api/branding_config');
+        const result = await response.json();
+        console.log('Branding config response:', result);
+        
+        if (result.success && result.config) {
+            // Set form values
+            document.getElementById('brandingTitle').value = result.config.video_title_branding || '';
+            document.getElementById('brandingWatermark').value = result.config.video_watermark_text || '';
+            document.getElementById('brandingColor').value = result.config.brand_color || '#007bff';
+            document.getElementById('brandingColorHex').value = result.config.brand_color || '#007bff';
+            document.getElementById('brandingBackgroundColor').value = result.config.background_color || '#ffffff';
+            document.getElementById('brandingBackgroundColorHex').value = result.config.background_color || '#ffffff';
+            document.getElementById('brandingFont').value = result.config.font_family || 'Arial';
+            document.getElementById('brandingLogo').value = result.config.brand_logo_url || '';
+            document.getElementById('brandingEnabled').checked = result.config.branding_enabled !== false;
+            
+            // Update preview
+            updateBrandingPreview();
+        }
+    } catch (error) {
+        console.error('Error loading branding config:', error);
+    }
+}
+
+// Save branding configuration
+async function handleBrandingFormSubmit(e) {
+    e.preventDefault();
+    console.log('Saving branding configuration...');
+    
+    const messageDiv = document.getElementById('brandingConfigMessage');
+    messageDiv.style.display = 'none';
+    
+    const data = {
+        video_title_branding: document.getElementById('brandingTitle').value,
+        video_watermark_text: document.getElementById('brandingWatermark').value,
+        brand_color: document.getElementById('brandingColor').value,
+        background_color: document.getElementById('brandingBackgroundColor').value,
+        font_family: document.getElementById('brandingFont').value,
+        brand_logo_url: document.getElementById('brandingLogo').value,
+        branding_enabled: document.getElementById('brandingEnabled').checked
+    };
+    
+    console.log('Branding data to save:', data);
+    
+    try {
+        const response = await fetch('/admin/api/branding_config', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify(data)
+        });
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            messageDiv.className = 'alert alert-success mt-3';
+            messageDiv.textContent = result.message || 'Branding configuration updated successfully';
+            messageDiv.style.display = 'block';
+        } else {
+            messageDiv.className = 'alert alert-danger mt-3';
+            messageDiv.textContent = 'Error: ' + (result.error || 'Failed to update branding configuration');
+            messageDiv.style.display = 'block';
+        }
+    } catch (error) {
+        console.error('Error saving branding config:', error);
+        messageDiv.className = 'alert alert-danger mt-3';
+        messageDiv.textContent = 'Error: ' + error.message;
+        messageDiv.style.display = 'block';
+    }
+}
+
+// Reset branding to defaults
+function resetBrandingDefaults() {
+    if (!confirm('Reset all branding settings to default values?')) return;
+    
+    document.getElementById('brandingTitle').value = '';
+    document.getElementById('brandingWatermark').value = '';
+    document.getElementById('brandingColor').value = '#007bff';
+    document.getElementById('brandingColorHex').value = '#007bff';
+    document.getElementById('brandingBackgroundColor').value = '#ffffff';
+    document.getElementById('brandingBackgroundColorHex').value = '#ffffff';
+    document.getElementById('brandingFont').value = 'Arial';
+    document.getElementById('brandingLogo').value = '';
+    document.getElementById('brandingEnabled').checked = true;
+    
+    updateBrandingPreview();
+}
+
+// Queue Management Functions
+let allQueueData = {
+    download: { pending: [], in_progress: [], completed: [], failed: [], priorities: {} },
+    transcription: { pending: [], processing: [], completed: [], failed: [] },
+    translation: { pending: [], processing: [], completed: [] },
+    video: { pending: [], processing: [], completed: [] }
+};
+
+function refreshAllQueues() {
+    loadDownloadQueue();
+    loadTranscriptionQueue();
+    loadTranslationQueue();
+    loadVideoQueue();
+}
+
+function refreshQueue() {
+    // Backward compatibility
+    refreshAllQueues();
+}
+
+function loadDownloadQueue() {
+    fetch('/admin/api/queue/download')
+        .then(response => response.json())
+        .then(data => {
+            allQueueData.download = data;
+            displayDownloadQueue();
+            updateQueueBadges();
+        })
+        .catch(error => {
+            console.error('Error loading download queue:', error);
+            showQueueError('downloadPendingList', 'Error loading download queue');
+            showQueueError('downloadProgressList', 'Error loading download queue');
+        });
+}
+
+function loadTranscriptionQueue() {
+    fetch('/admin/api/queue/transcription')
+        .then(response => response.json())
+        .then(data => {
+            allQueueData.transcription = data;
+            displayTranscriptionQueue();
+            updateQueueBadges();
+        })
+        .catch(error => {
+            console.error('Error loading transcription queue:', error);
+            showQueueError('transcriptionJobsList', 'Error loading transcription queue');
+        });
+}
+
+function loadTranslationQueue() {
+    fetch('/admin/api/queue/translation')
+        .then(response => response.json())
+        .then(data => {
+            allQueueData.translation = data;
+            displayTranslationQueue();
+            updateQueueBadges();
+        })
+        .catch(error => {
+            console.error('Error loading translation queue:', error);
+            showQueueError('translationJobsList', 'Error loading translation queue');
+        });
+}
+
+function loadVideoQueue() {
+    fetch('/admin/api/queue/video')
+        .then(response => response.json())
+        .then(data => {
+            allQueueData.video = data;
+            displayVideoQueue();
+            updateQueueBadges();
+        })
+        .catch(error => {
+            console.error('Error loading video queue:', error);
+            showQueueError('videoJobsList', 'Error loading video queue');
+        });
+}
+
+function showQueueError(elementId, message) {
+    const element = document.getElementById(elementId);
+    if (element) {
+        const colspan = element.closest('table').querySelectorAll('thead th').length;
+        element.innerHTML = `<tr><td colspan="${colspan}" class="text-danger text-center">${message}</td></tr>`;
+    }
+}
+
+function updateQueueBadges() {
+    // Update tab badges with queue counts
+    const downloadTotal = (allQueueData.download.pending?.length || 0) + (allQueueData.download.in_progress?.length || 0);
+    const transcriptionTotal = (allQueueData.transcription.pending?.length || 0) + (allQueueData.transcription.processing?.length || 0);
+    const translationTotal = (allQueueData.translation.pending?.length || 0) + (allQueueData.translation.processing?.length || 0);
+    const videoTotal = (allQueueData.video.pending?.length || 0) + (allQueueData.video.processing?.length || 0);
+    
+    document.getElementById('downloadQueueBadge').textContent = downloadTotal;
+    document.getElementById('transcriptionQueueBadge').textContent = transcriptionTotal;
+    document.getElementById('translationQueueBadge').textContent = translationTotal;
+    document.getElementById('videoQueueBadge').textContent = videoTotal;
+    
+    // Update badge colors based on queue status
+    updateBadgeColor('downloadQueueBadge', downloadTotal);
+    updateBadgeColor('transcriptionQueueBadge', transcriptionTotal);
+    updateBadgeColor('translationQueueBadge', translationTotal);
+    updateBadgeColor('videoQueueBadge', videoTotal);
+}
+
+function updateBadgeColor(badgeId, count) {
+    const badge = document.getElementById(badgeId);
+    if (badge) {
+        badge.className = count > 0 ? 'badge bg-warning ms-1' : 'badge bg-secondary ms-1';
+    }
+}
+
+function loadQueue() {
+    // Backward compatibility - load download queue
+    loadDownloadQueue();
+}
+
+function displayDownloadQueue() {
+    const data = allQueueData.download;
+    
+    // Update counts
+    document.getElementById('downloadPendingCount').textContent = data.pending?.length || 0;
+    document.getElementById('downloadProgressCount').textContent = data.in_progress?.length || 0;
+    document.getElementById('downloadCompletedCount').textContent = data.completed?.length || 0;
+    document.getElementById('downloadFailedCount').textContent = data.failed?.length || 0;
+    
+    // Display pending jobs
+    const pendingTbody = document.getElementById('downloadPendingList');
+    if (!data.pending || data.pending.length === 0) {
+        pendingTbody.innerHTML = '<tr><td colspan="6" class="text-center">No pending jobs</td></tr>';
+    } else {
+        pendingTbody.innerHTML = data.pending.map(job => `
+            <tr>
+                <td><a href="/spaces/${job.space_id}" target="_blank" class="text-decoration-none"><code>${job.space_id}</code> <i class="bi bi-box-arrow-up-right small"></i></a></td>
+                <td>${job.user_id || 'Anonymous'}</td>
+                <td>
+                    <select class="form-select form-select-sm" onchange="updateJobPriority(${job.id}, this.value)" style="width: auto;">
+                        ${Object.entries(data.priorities || {}).map(([value, label]) => 
+                            `<option value="${value}" ${job.priority == value ? 'selected' : ''}>${label}</option>`
+                        ).join('')}
+                    </select>
+                    <span class="badge ${getPriorityBadgeClass(job.priority)} ms-2">${job.priority_label}</span>
+                </td>
+                <td><small class="text-muted">${formatDate(job.created_at)}</small></td>
+                <td><span class="badge bg-secondary">${job.file_type || 'mp3'}</span></td>
+                <td>
+                    <button class="btn btn-sm btn-outline-danger me-1" onclick="cancelDownloadJob(${job.id})" title="Cancel Job">
+                        <i class="bi bi-x-circle"></i>
+                    </button>
+                    <button class="btn btn-sm btn-outline-info" onclick="viewJobDetails(${job.id})" title="View Details">
+                        <i class="bi bi-info-circle"></i>
+                    </button>
+                </td>
+            </tr>
+        `).join('');
+    }
+    
+    // Display in-progress jobs
+    const progressTbody = document.getElementById('downloadProgressList');
+    if (!data.in_progress || data.in_progress.length === 0) {
+        progressTbody.innerHTML = '<tr><td colspan="6" class="text-center">No jobs in progress</td></tr>';
+    } else {
+        progressTbody.innerHTML = data.in_progress.map(job => `
+            <tr>
+                <td><a href="/spaces/${job.space_id}" target="_blank" class="text-decoration-none"><code>${job.space_id}</code> <i class="bi bi-box-arrow-up-right small"></i></a></td>
+                <td>${job.user_id || 'Anonymous'}</td>
+                <td><span class="badge ${getPriorityBadgeClass(job.priority)}">${job.priority_label}</span></td>
+                <td>
+                    <div class="progress" style="width: 100px;">
+                        <div class="progress-bar" role="progressbar" 
+                             style="width: ${job.progress_in_percent || 0}%" 
+                             title="${job.progress_in_percent || 0}%">
+                            ${job.progress_in_percent || 0}%
+                        </div>
+                    </div>
+                </td>
+                <td><small class="text-muted">${formatDate(job.start_time)}</small></td>
+                <td>
+                    <button class="btn btn-sm btn-outline-danger me-1" onclick="cancelDownloadJob(${job.id})" title="Cancel Download">
+                        <i class="bi bi-x-circle"></i>
+                    </button>
+                    <button class="btn btn-sm btn-outline-info" onclick="viewJobDetails(${job.id})" title="View Details">
+                        <i class="bi bi-info-circle"></i>
+                    </button>
+                </td>
+            </tr>
+        `).join('');
+    }
+    
+    // Display completed jobs (limit to 10 most recent)
+    const completedTbody = document.getElementById('downloadCompletedList');
+    if (!data.completed || data.completed.length === 0) {
+        completedTbody.innerHTML = '<tr><td colspan="6" class="text-center">No completed jobs</td></tr>';
+    } else {
+        const recentCompleted = data.completed.slice(0, 10);
+        completedTbody.innerHTML = recentCompleted.map(job => `
+            <tr>
+                <td><small>${job.id}</small></td>
+                <td><a href="/spaces/${job.space_id}" target="_blank" class="text-decoration-none"><code>${job.space_id}</code> <i class="bi bi-box-arrow-up-right small"></i></a></td>
+                <td><small class="text-muted">${formatDate(job.start_time)}</small></td>
+                <td><small class="text-muted">${formatDate(job.end_time)}</small></td>
+                <td><span class="badge bg-secondary">${job.file_type || 'mp3'}</span></td>
+                <td>
+                    <button class="btn btn-sm btn-outline-warning me-1" onclick="removeDownloadJob(${job.id})" title="Remove Record">
+                        <i class="bi bi-trash"></i>
+                    </button>
+                    <button class="btn btn-sm btn-outline-info" onclick="viewJobDetails(${job.id})" title="View Details">
+                        <i class="bi bi-info-circle"></i>
+                    </button>
+                </td>
+            </tr>
+        `).join('');
+    }
+    
+    // Display failed jobs (limit to 10 most recent)
+    const failedTbody = document.getElementById('downloadFailedList');
+    if (!data.failed || data.failed.length === 0) {
+        failedTbody.innerHTML = '<tr><td colspan="6" class="text-center">No failed jobs</td></tr>';
+    } else {
+        const recentFailed = data.failed.slice(0, 10);
+        failedTbody.innerHTML = recentFailed.map(job => `
+            <tr>
+                <td><small>${job.id}</small></td>
+                <td><a href="/spaces/${job.space_id}" target="_blank" class="text-decoration-none"><code>${job.space_id}</code> <i class="bi bi-box-arrow-up-right small"></i></a></td>
+                <td><small class="text-muted">${formatDate(job.start_time)}</small></td>
+                <td><small class="text-danger" title="${job.error_message || ''}">${(job.error_message || 'Unknown error').substring(0, 50)}${job.error_message && job.error_message.length > 50 ? '...' : ''}</small></td>
+                <td><span class="badge bg-secondary">${job.file_type || 'mp3'}</span></td>
+                <td>
+                    <button class="btn btn-sm btn-outline-warning me-1" onclick="removeDownloadJob(${job.id})" title="Remove Record">
+                        <i class="bi bi-trash"></i>
+                    </button>
+                    <button class="btn btn-sm btn-outline-info" onclick="viewJobDetails(${job.id})" title="View Details">
+                        <i class="bi bi-info-circle"></i>
+                    </button>
+                </td>
+            </tr>
+        `).join('');
+    }
+}
+
+function displayTranscriptionQueue() {
+    const data = allQueueData.transcription;
+    
+    // Update counts
+    document.getElementById('transcriptionPendingCount').textContent = data.pending?.length || 0;
+    document.getElementById('transcriptionProgressCount').textContent = data.processing?.length || 0;
+    document.getElementById('transcriptionCompletedCount').textContent = data.completed?.length || 0;
+    document.getElementById('transcriptionFailedCount').textContent = data.failed?.length || 0;
+    
+    // Combine all jobs for display
+    const allJobs = [
+        ...(data.pending || []).map(job => ({...job, status: 'pending'})),
+        ...(data.processing || []).map(job => ({...job, status: 'processing'})),
+        ...(data.completed || []).slice(0, 10).map(job => ({...job, status: 'completed'})),
+        ...(data.failed || []).slice(0, 5).map(job => ({...job, status: 'failed'}))
+    ];
+    
+    const tbody = document.getElementById('transcriptionJobsList');
+    if (allJobs.length === 0) {
+        tbody.innerHTML = '<tr><td colspan="8" class="text-center">No transcription jobs</td></tr>';
+    } else {
+        tbody.innerHTML = allJobs.map(job => `
+            <tr>
+                <td><code>${job.job_id || job.id}</code></td>
+                <td><a href="/spaces/${job.space_id}" target="_blank" class="text-decoration-none"><code>${job.space_id}</code> <i class="bi bi-box-arrow-up-right small"></i></a></td>
+                <td><span class="badge bg-info">${job.model || job.options?.model || 'Unknown'}</span></td>
+                <td><span class="badge bg-secondary">${job.language || job.options?.language || 'Auto'}</span></td>
+                <td><span class="badge ${getJobStatusBadgeClass(job.status)}">${job.status}</span></td>
+                <td>
+                    ${job.status === 'processing' ? 
+                        `<div class="progress" style="width: 80px;">
+                            <div class="progress-bar" style="width: ${job.progress || 0}%">${job.progress || 0}%</div>
+                        </div>` : 
+                        '-'
+                    }
+                </td>
+                <td><small class="text-muted">${formatDate(job.created_at)}</small></td>
+                <td>
+                    ${(job.status === 'pending' || job.status === 'processing') ? 
+                        `<button class="btn btn-sm btn-outline-danger me-1" onclick="cancelTranscriptionJob('${job.job_id || job.id}')" title="Cancel Job">
+                            <i class="bi bi-x-circle"></i>
+                        </button>
+                        <button class="btn btn-sm btn-outline-info" onclick="viewTranscriptionJobDetails('${job.job_id || job.id}')" title="View Details">
+                            <i class="bi bi-info-circle"></i>
+                        </button>` :
+                        `<button class="btn btn-sm btn-outline-warning me-1" onclick="removeTranscriptionJob('${job.job_id || job.id}')" title="Remove Record">
+                            <i class="bi bi-trash"></i>
+                        </button>
+                        <button class="btn btn-sm btn-outline-info" onclick="viewTranscriptionJobDetails('${job.job_id || job.id}')" title="View Details">
+                            <i class="bi bi-info-circle"></i>
+                        </button>`
+                    }
+                </td>
+            </tr>
+        `).join('');
+    }
+}
+
+function displayTranslationQueue() {
+    const data = allQueueData.translation;
+    
+    // Update counts
+    document.getElementById('translationPendingCount').textContent = data.pending?.length || 0;
+    document.getElementById('translationProgressCount').textContent = data.processing?.length || 0;
+    document.getElementById('translationCompletedCount').textContent = data.completed?.length || 0;
+    
+    // Combine all jobs for display
+    const allJobs = [
+        ...(data.pending || []).map(job => ({...job, status: 'pending'})),
+        ...(data.processing || []).map(job => ({...job, status: 'processing'})),
+        ...(data.completed || []).slice(0, 10).map(job => ({...job, status: 'completed'}))
+    ];
+    
+    const tbody = document.getElementById('translationJobsList');
+    if (allJobs.length === 0) {
+        tbody.innerHTML = '<tr><td colspan="8" class="text-center">No translation jobs</td></tr>';
+    } else {
+        tbody.innerHTML = allJobs.map(job => `
+            <tr>
+                <td><code>${job.job_id || job.id}</code></td>
+                <td><a href="/spaces/${job.space_id}" target="_blank" class="text-decoration-none"><code>${job.space_id}</code> <i class="bi bi-box-arrow-up-right small"></i></a></td>
+                <td><span class="badge bg-primary">${job.source_language || 'Auto'}</span></td>
+                <td><span class="badge bg-success">${job.target_language || job.options?.translate_to || 'en'}</span></td>
+                <td><span class="badge ${getJobStatusBadgeClass(job.status)}">${job.status}</span></td>
+                <td>
+                    ${job.status === 'processing' ? 
+                        `<div class="progress" style="width: 80px;">
+                            <div class="progress-bar" style="width: ${job.progress || 0}%">${job.progress || 0}%</div>
+                        </div>` : 
+                        '-'
+                    }
+                </td>
+                <td><small class="text-muted">${formatDate(job.created_at)}</small></td>
+                <td>
+                    ${(job.status === 'pending' || job.status === 'processing') ? 
+                        `<button class="btn btn-sm btn-outline-danger me-1" onclick="cancelTranslationJob('${job.job_id || job.id}')" title="Cancel Job">
+                            <i class="bi bi-x-circle"></i>
+                        </button>
+                        <button class="btn btn-sm btn-outline-info" onclick="viewTranslationJobDetails('${job.job_id || job.id}')" title="View Details">
+                            <i class="bi bi-info-circle"></i>
+                        </button>` :
+                        `<button class="btn btn-sm btn-outline-warning me-1" onclick="removeTranslationJob('${job.job_id || job.id}')" title="Remove Record">
+                            <i class="bi bi-trash"></i>
+                        </button>
+                        <button class="btn btn-sm btn-outline-info" onclick="viewTranslationJobDetails('${job.job_id || job.id}')" title="View Details">
+                            <i class="bi bi-info-circle"></i>
+                        </button>`
+                    }
+                </td>
+            </tr>
+        `).join('');
+    }
+}
+
+function displayVideoQueue() {
+    const data = allQueueData.video;
+    
+    // Update counts
+    document.getElementById('videoPendingCount').textContent = data.pending?.length || 0;
+    document.getElementById('videoProgressCount').textContent = data.processing?.length || 0;
+    document.getElementById('videoCompletedCount').textContent = data.completed?.length || 0;
+    
+    // Combine all jobs for display
+    const allJobs = [
+        ...(data.pending || []).map(job => ({...job, status: 'pending'})),
+        ...(data.processing || []).map(job => ({...job, status: 'processing'})),
+        ...(data.completed || []).slice(0, 10).map(job => ({...job, status: 'completed'}))
+    ];
+    
+    const tbody = document.getElementById('videoJobsList');
+    if (allJobs.length === 0) {
+        tbody.innerHTML = '<tr><td colspan="7" class="text-center">No video generation jobs</td></tr>';
+    } else {
+        tbody.innerHTML = allJobs.map(job => `
+            <tr>
+                <td><code>${job.job_id || job.id}</code></td>
+                <td><a href="/spaces/${job.space_id}" target="_blank" class="text-decoration-none"><code>${job.space_id}</code> <i class="bi bi-box-arrow-up-right small"></i></a></td>
+                <td>${job.user_id || 'Anonymous'}</td>
+                <td><span class="badge ${getJobStatusBadgeClass(job.status)}">${job.status}</span></td>
+                <td>
+                    ${job.status === 'processing' ? 
+                        `<div class="progress" style="width: 80px;">
+                            <div class="progress-bar" style="width: ${job.progress || 0}%">${job.progress || 0}%</div>
+                        </div>` : 
+                        '-'
+                    }
+                </td>
+                <td><small class="text-muted">${formatDate(job.created_at)}</small></td>
+                <td>
+                    ${(job.status === 'pending' || job.status === 'processing') ? 
+                        `<button class="btn btn-sm btn-outline-danger me-1" onclick="cancelVideoJob('${job.job_id || job.id}')" title="Cancel Job">
+                            <i class="bi bi-x-circle"></i>
+                        </button>
+                        <button class="btn btn-sm btn-outline-info" onclick="viewVideoJobDetails('${job.job_id || job.id}')" title="View Details">
+                            <i class="bi bi-info-circle"></i>
+                        </button>` :
+                        `<button class="btn btn-sm btn-outline-warning me-1" onclick="removeVideoJob('${job.job_id || job.id}')" title="Remove Record">
+                            <i class="bi bi-trash"></i>
+                        </button>
+                        <button class="btn btn-sm btn-outline-info" onclick="viewVideoJobDetails('${job.job_id || job.id}')" title="View Details">
+                            <i class="bi bi-info-circle"></i>
+                        </button>`
+                    }
+                </td>
+            </tr>
+        `).join('');
+    }
+}
+
+function getJobStatusBadgeClass(status) {
+    switch (status) {
+        case 'pending': return 'bg-warning text-dark';
+        case 'processing': return 'bg-info';
+        case 'completed': return 'bg-success';
+        case 'failed': return 'bg-danger';
+        default: return 'bg-secondary';
+    }
+}
+
+function displayQueue() {
+    // Backward compatibility - display download queue
+    displayDownloadQueue();
+}
+
+function getPriorityBadgeClass(priority) {
+    switch (priority) {
+        case 1: return 'bg-danger';
+        case 2: return 'bg-warning';
+        case 3: return 'bg-secondary';
+        case 4: return 'bg-info';
+        case 5: return 'bg-success';
+        default: return 'bg-secondary';
+    }
+}
+
+function updateJobPriority(jobId, newPriority) {
+    fetch(`/admin/api/jobs/${jobId}/priority`, {
+        method: 'PUT',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({ priority: parseInt(newPriority) })
+    })
+    .then(response => response.json())
+    .then(result => {
+        if (result.success) {
+            // Show success message
+            showToast('Priority updated successfully', 'success');
+            // Refresh queue to show new order
+            setTimeout(loadQueue, 500);
+        } else {
+            showToast('Error: ' + result.error, 'error');
+            // Revert the select value
+            loadQueue();
+        }
+    })
+    .catch(error => {
+        console.error('Error updating priority:', error);
+        showToast('Error updating priority', 'error');
+        loadQueue();
+    });
+}
+
+function cancelJob(jobId) {
+    // Delegate to the existing cancelDownloadJob function
+    cancelDownloadJob(jobId);
+}
+
+function viewJobDetails(jobId) {
+    // Show the modal
+    const modal = new bootstrap.Modal(document.getElementById('jobDetailsModal'));
+    modal.show();
+    
+    // Reset content to loading state
+    const content = document.getElementById('jobDetailsContent');
+    content.innerHTML = `
+        <div class="text-center">
+            <div class="spinner-border text-primary" role="status">
+                <span class="visually-hidden">Loading...</span>
+            </div>
+            <p class="mt-2">Loading job details...</p>
+        </div>
+    `;
+    
+    // Fetch job details
+    fetch(`/api/downloads/${jobId}`)
+        .then(response => response.json())
+        .then(data => {
+            if (data.error) {
+                content.innerHTML = `
+                    <div class="alert alert-danger">
+                        <i class="bi bi-exclamation-triangle"></i> Error loading job details: ${data.error}
+                    </div>
+                `;
+                return;
+            }
+            
+            const job = data.job;
+            const statusClass = getStatusClass(job.status);
+            const statusIcon = getStatusIcon(job.status);
+            
+            content.innerHTML = `
+                <div class="row">
+                    <div class="col-md-6">
+                        <div class="card mb-3">
+                            <div class="card-header">
+                                <h6 class="mb-0"><i class="bi bi-info-circle"></i> Basic Information</h6>
+                            </div>
+                            <div class="card-body">
+                                <table class="table table-sm">
+                                    <tr>
+                                        <td><strong>Job ID:</strong></td>
+                                        <td>${job.id}</td>
+                                    </tr>
+                                    <tr>
+                                        <td><strong>Space ID:</strong></td>
+                                        <td><a href="/spaces/${job.space_id}" target="_blank" class="text-decoration-none"><code>${job.space_id}</code> <i class="bi bi-box-arrow-up-right small"></i></a></td>
+                                    </tr>
+                                    <tr>
+                                        <td><strong>Status:</strong></td>
+                                        <td><span class="badge bg-${statusClass}">${statusIcon} ${job.status}</span></td>
+                                    </tr>
+                                    <tr>
+                                        <td><strong>File Type:</strong></td>
+                                        <td>${job.file_type || 'N/A'}</td>
+                                    </tr>
+                                    <tr>
+                                        <td><strong>User ID:</strong></td>
+                                        <td>${job.user_id || 'Anonymous'}</td>
+                                    </tr>
+                                </table>
+                            </div>
+                        </div>
+                    </div>
+                    <div class="col-md-6">
+                        <div class="card mb-3">
+                            <div class="card-header">
+                                <h6 class="mb-0"><i class="bi bi-clock"></i> Timing Information</h6>
+                            </div>
+                            <div class="card-body">
+                                <table class="table table-sm">
+                                    <tr>
+                                        <td><strong>Created:</strong></td>
+                                        <td>${formatDate(job.created_at)}</td>
+                                    </tr>
+                                    <tr>
+                                        <td><strong>Updated:</strong></td>
+                                        <td>${formatDate(job.updated_at)}</td>
+                                    </tr>
+                                    <tr>
+                                        <td><strong>Start Time:</strong></td>
+                                        <td>${formatDate(job.start_time)}</td>
+                                    </tr>
+                                    <tr>
+                                        <td><strong>End Time:</strong></td>
+                                        <td>${formatDate(job.end_time)}</td>
+                                    </tr>
+                                    <tr>
+                                        <td><strong>Duration:</strong></td>
+                                        <td>${calculateDuration(job.start_time, job.end_time)}</td>
+                                    </tr>
+                                </table>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+                
+                ${job.progress_in_size || job.progress_in_percent ? `
+                <div class="card mb-3">
+                    <div class="card-header">
+                        <h6 class="mb-0"><i class="bi bi-bar-chart"></i> Progress Information</h6>
+                    </div>
+                    <div class="card-body">
+                        ${job.progress_in_percent ? `
+                            <div class="mb-2">
+                                <label class="form-label">Progress: ${job.progress_in_percent}%</label>
+                                <div class="progress">
+                                    <div class="progress-bar" style="width: ${job.progress_in_percent}%"></div>
+                                </div>
+                            </div>
+                        ` : ''}
+                        ${job.progress_in_size ? `
+                            <p><strong>Downloaded Size:</strong> ${(job.progress_in_size / 1024 / 1024).toFixed(2)} MB</p>
+                        ` : ''}
+                        ${job.process_id ? `
+                            <p><strong>Process ID:</strong> ${job.process_id}</p>
+                        ` : ''}
+                    </div>
+                </div>
+                ` : ''}
+                
+                ${job.error_message ? `
+                <div class="card mb-3">
+                    <div class="card-header">
+                        <h6 class="mb-0"><i class="bi bi-exclamation-triangle text-danger"></i> Error Information</h6>
+                    </div>
+                    <div class="card-body">
+                        <div class="alert alert-danger">
+                            <code>${job.error_message}</code>
+                        </div>
+                    </div>
+                </div>
+                ` : ''}
+                
+                <div class="text-center mt-3">
+                    <a href="/spaces/${job.space_id}" class="btn btn-primary btn-sm" target="_blank">
+                        <i class="bi bi-eye"></i> View Space
+                    </a>
+                    ${job.status === 'completed' ? `
+                        <a href="/download/${job.space_id}?attachment=1" class="btn btn-success btn-sm" target="_blank">
+                            <i class="bi bi-download"></i> Download File
+                        </a>
+                    ` : ''}
+                </div>
+            `;
+        })
+        .catch(error => {
+            console.error('Error fetching job details:', error);
+            content.innerHTML = `
+                <div class="alert alert-danger">
+                    <i class="bi bi-exclamation-triangle"></i> Failed to load job details. Please try again.
+                </div>
+            `;
+        });
+}
+
+function getStatusClass(status) {
+    switch(status) {
+        case 'completed': return 'success';
+        case 'failed': return 'danger';
+        case 'in_progress': case 'downloading': return 'info';
+        case 'pending': return 'warning';
+        default: return 'secondary';
+    }
+}
+
+function getStatusIcon(status) {
+    switch(status) {
+        case 'completed': return '<i class="bi bi-check-circle"></i>';
+        case 'failed': return '<i class="bi bi-x-circle"></i>';
+        case 'in_progress': case 'downloading': return '<i class="bi bi-arrow-clockwise"></i>';
+        case 'pending': return '<i class="bi bi-clock"></i>';
+        default: return '<i class="bi bi-question-circle"></i>';
+    }
+}
+
+function calculateDuration(startTime, endTime) {
+    if (!startTime || !endTime) return 'N/A';
+    
+    const start = new Date(startTime);
+    const end = new Date(endTime);
+    const durationMs = end - start;
+    
+    if (durationMs < 0) return 'N/A';
+    
+    const seconds = Math.floor(durationMs / 1000);
+    const minutes = Math.floor(seconds / 60);
+    const hours = Math.floor(minutes / 60);
+    
+    if (hours > 0) {
+        return `${hours}h ${minutes % 60}m ${seconds % 60}s`;
+    } else if (minutes > 0) {
+        return `${minutes}m ${seconds % 60}s`;
+    } else {
+        return `${seconds}s`;
+    }
+}
+
+function formatDate(dateString) {
+    if (!dateString) return 'N/A';
+    const date = new Date(dateString);
+    return date.toLocaleString();
+}
+
+function clearAllCaches() {
+    if (!confirm('Are you sure you want to clear all caches? This will force a reload of all data from the database.')) {
+        return;
+    }
+    
+    // Show loading state
+    const cacheMessage = document.getElementById('cacheMessage');
+    cacheMessage.className = 'alert alert-info mt-3';
+    cacheMessage.innerHTML = '<i class="bi bi-hourglass-split spin"></i> Clearing caches...';
+    cacheMessage.style.display = 'block';
+    
+    fetch('/admin/api/cache/clear', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        }
+    })
+    .then(response => response.json())
+    .then(result => {
+        if (result.success) {
+            cacheMessage.className = 'alert alert-success mt-3';
+            cacheMessage.innerHTML = '<i class="bi bi-check-circle"></i> ' + result.message;
+            
+            // Show toast notification
+            showToast('All caches have been cleared successfully', 'success');
+            
+            // Hide message after 5 seconds
+            setTimeout(() => {
+                cacheMessage.style.display = 'none';
+            }, 5000);
+            
+            // Refresh any active data displays
+            if (window.location.hash === '#queue' || document.querySelector('#queue-tab.active')) {
+                refreshAllQueues();
+            }
+            
+            // Reload cache status
+            setTimeout(loadCacheStatus, 1000);
+        } else {
+            cacheMessage.className = 'alert alert-danger mt-3';
+            cacheMessage.innerHTML = '<i class="bi bi-x-circle"></i> Error: ' + (result.error || 'Failed to clear caches');
+            showToast('Error clearing caches', 'error');
+        }
+    })
+    .catch(error => {
+        console.error('Error clearing caches:', error);
+        cacheMessage.className = 'alert alert-danger mt-3';
+        cacheMessage.innerHTML = '<i class="bi bi-x-circle"></i> Error clearing caches';
+        showToast('Error clearing caches', 'error');
+    });
+}
+
+function showToast(message, type = 'info') {
+    // Simple toast notification
+    const toast = document.createElement('div');
+    toast.className = `alert alert-${type === 'error' ? 'danger' : type} position-fixed`;
+    toast.style.cssText = 'top: 20px; right: 20px; z-index: 9999; min-width: 300px;';
+    toast.innerHTML = `
+        ${message}
+        <button type="button" class="btn-close" onclick="this.parentElement.remove()"></button>
+    `;
+    document.body.appendChild(toast);
+    
+    // Auto-remove after 3 seconds
+    setTimeout(() => {
+        if (toast.parentElement) {
+            toast.remove();
+        }
+    }, 3000);
+}
+
+// Queue management action functions
+function cancelTranscriptionJob(jobId) {
+    if (!confirm('Are you sure you want to cancel this transcription job?')) return;
+    
+    fetch(`/admin/api/transcription/${jobId}/cancel`, {
+        method: 'DELETE',
+        headers: {
+            'Content-Type': 'application/json',
+        }
+    })
+    .then(response => response.json())
+    .then(result => {
+        if (result.success) {
+            showToast('Transcription job cancelled', 'success');
+            loadTranscriptionQueue();
+        } else {
+            showToast('Error: ' + result.error, 'error');
+        }
+    })
+    .catch(error => {
+        console.error('Error cancelling transcription job:', error);
+        showToast('Error cancelling transcription job', 'error');
+    });
+}
+
+function cancelTranslationJob(jobId) {
+    if (!confirm('Are you sure you want to cancel this translation job?')) return;
+    
+    fetch(`/admin/api/translation/${jobId}/cancel`, {
+        method: 'DELETE',
+        headers: {
+            'Content-Type': 'application/json',
+        }
+    })
+    .then(response => response.json())
+    .then(result => {
+        if (result.success) {
+            showToast('Translation job cancelled', 'success');
+            loadTranslationQueue();
+        } else {
+            showToast('Error: ' + result.error, 'error');
+        }
+    })
+    .catch(error => {
+        console.error('Error cancelling translation job:', error);
+        showToast('Error cancelling translation job', 'error');
+    });
+}
+
+function cancelVideoJob(jobId) {
+    if (!confirm('Are you sure you want to cancel this video generation job?')) return;
+    
+    fetch(`/admin/api/video/${jobId}/cancel`, {
+        method: 'DELETE',
+        headers: {
+            'Content-Type': 'application/json',
+        }
+    })
+    .then(response => response.json())
+    .then(result => {
+        if (result.success) {
+            showToast('Video job cancelled', 'success');
+            loadVideoQueue();
+        } else {
+            showToast('Error: ' + result.error, 'error');
+        }
+    })
+    .catch(error => {
+        console.error('Error cancelling video job:', error);
+        showToast('Error cancelling video job', 'error');
+    });
+}
+
+function cancelDownloadJob(jobId) {
+    if (!confirm('Are you sure you want to cancel this download job? This will stop the download process.')) return;
+    
+    fetch(`/admin/api/download/${jobId}/cancel`, {
+        method: 'DELETE',
+        headers: {
+            'Content-Type': 'application/json',
+        }
+    })
+    .then(response => response.json())
+    .then(result => {
+        if (result.success) {
+            const message = result.process_killed ? 
+                'Download job cancelled and process terminated' : 
+                'Download job cancelled';
+            showToast(message, 'success');
+            loadDownloadQueue();
+        } else {
+            showToast('Error: ' + result.error, 'error');
+        }
+    })
+    .catch(error => {
+        console.error('Error cancelling download job:', error);
+        showToast('Error cancelling download job', 'error');
+    });
+}
+
+function removeDownloadJob(jobId) {
+    if (!confirm('Are you sure you want to remove this job record? This action cannot be undone.')) return;
+    
+    fetch(`/admin/api/download/${jobId}/remove`, {
+        method: 'DELETE',
+        headers: {
+            'Content-Type': 'application/json',
+        }
+    })
+    .then(response => response.json())
+    .then(result => {
+        if (result.success) {
+            showToast('Download job record removed', 'success');
+            loadDownloadQueue();
+        } else {
+            showToast('Error: ' + result.error, 'error');
+        }
+    })
+    .catch(error => {
+        console.error('Error removing download job:', error);
+        showToast('Error removing download job', 'error');
+    });
+}
+
+function removeTranscriptionJob(jobId) {
+    if (!confirm('Are you sure you want to remove this job record? This action cannot be undone.')) return;
+    
+    fetch(`/admin/api/transcription/${jobId}/remove`, {
+        method: 'DELETE',
+        headers: {
+            'Content-Type': 'application/json',
+        }
+    })
+    .then(response => response.json())
+    .then(result => {
+        if (result.success) {
+            showToast('Transcription job record removed', 'success');
+            loadTranscriptionQueue();
+        } else {
+            showToast('Error: ' + result.error, 'error');
+        }
+    })
+    .catch(error => {
+        console.error('Error removing transcription job:', error);
+        showToast('Error removing transcription job', 'error');
+    });
+}
+
+function removeTranslationJob(jobId) {
+    if (!confirm('Are you sure you want to remove this job record? This action cannot be undone.')) return;
+    
+    fetch(`/admin/api/translation/${jobId}/remove`, {
+        method: 'DELETE',
+        headers: {
+            'Content-Type': 'application/json',
+        }
+    })
+    .then(response => response.json())
+    .then(result => {
+        if (result.success) {
+            showToast('Translation job record removed', 'success');
+            loadTranslationQueue();
+        } else {
+            showToast('Error: ' + result.error, 'error');
+        }
+    })
+    .catch(error => {
+        console.error('Error removing translation job:', error);
+        showToast('Error removing translation job', 'error');
+    });
+}
+
+function removeVideoJob(jobId) {
+    if (!confirm('Are you sure you want to remove this job record? This action cannot be undone.')) return;
+    
+    fetch(`/admin/api/video/${jobId}/remove`, {
+        method: 'DELETE',
+        headers: {
+            'Content-Type': 'application/json',
+        }
+    })
+    .then(response => response.json())
+    .then(result => {
+        if (result.success) {
+            showToast('Video job record removed', 'success');
+            loadVideoQueue();
+        } else {
+            showToast('Error: ' + result.error, 'error');
+        }
+    })
+    .catch(error => {
+        console.error('Error removing video job:', error);
+        showToast('Error removing video job', 'error');
+    });
+}
+
+function viewTranscriptionJobDetails(jobId) {
+    fetch(`/admin/api/transcription/${jobId}`)
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                const job = data.job;
+                let details = `Job ID: ${jobId}\n`;
+                details += `Space ID: ${job.space_id}\n`;
+                details += `Status: ${job.status}\n`;
+                details += `Progress: ${job.progress || 0}%\n`;
+                details += `Model: ${job.model || job.options?.model || 'Unknown'}\n`;
+                details += `Language: ${job.language || job.options?.language || 'Auto'}\n`;
+                
+                if (job.options?.translate_to) {
+                    details += `Translate to: ${job.options.translate_to}\n`;
+                }
+                
+                details += `Created: ${formatDate(job.created_at)}\n`;
+                
+                if (job.updated_at) {
+                    details += `Updated: ${formatDate(job.updated_at)}\n`;
+                }
+                
+                if (job.error) {
+                    details += `\nError: ${job.error}`;
+                }
+                
+                if (job.result) {
+                    details += `\nResult: Transcript generated (${job.result.text_sample || 'No preview available'})`;
+                }
+                
+                alert(details);
+            } else {
+                showToast('Error: ' + (data.error || 'Job not found'), 'error');
+            }
+        })
+        .catch(error => {
+            console.error('Error loading transcription job details:', error);
+            showToast('Error loading job details', 'error');
+        });
+}
+
+function viewTranslationJobDetails(jobId) {
+    fetch(`/admin/api/translation/${jobId}`)
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                alert(`Job ID: ${jobId}\nSpace: ${data.job.space_id}\nFrom: ${data.job.source_language}\nTo: ${data.job.target_language}\nStatus: ${data.job.status}`);
+            } else {
+                showToast('Error loading job details', 'error');
+            }
+        })
+        .catch(error => {
+            console.error('Error loading translation job details:', error);
+            showToast('Error loading job details', 'error');
+        });
+}
+
+function viewVideoJobDetails(jobId) {
+    fetch(`/admin/api/video/${jobId}`)
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                alert(`Job ID: ${jobId}\nSpace: ${data.job.space_id}\nUser: ${data.job.user_id}\nStatus: ${data.job.status}\nProgress: ${data.job.progress}%`);
+            } else {
+                showToast('Error loading job details', 'error');
+            }
+        })
+        .catch(error => {
+            console.error('Error loading video job details:', error);
+            showToast('Error loading job details', 'error');
+        });
+}
+
+// Cache Management Functions
+function loadCacheStatus() {
+    fetch('/admin/api/cache/status')
+        .then(response => response.json())
+        .then(data => {
+            const statusDiv = document.getElementById('cacheStatusInfo');
+            let html = '<ul class="mb-0">';
+            
+            // Spaces Cache
+            if (data.spaces_cache.active) {
+                const age = Math.round(data.spaces_cache.age_seconds);
+                const expires = Math.round(data.spaces_cache.expires_in_seconds);
+                html += `<li><strong>Spaces Cache:</strong> 
+                    <span class="badge bg-success">Active</span>
+                    <small class="text-muted">(Age: ${formatDuration(age)}, Expires in: ${formatDuration(expires)})</small>
+                </li>`;
+            } else {
+                html += `<li><strong>Spaces Cache:</strong> 
+                    <span class="badge bg-secondary">Empty</span>
+                    <small class="text-muted">(TTL: ${data.spaces_cache.ttl}s)</small>
+                </li>`;
+            }
+            
+            // Index Cache
+            if (data.index_cache.active) {
+                const age = Math.round(data.index_cache.age_seconds);
+                const expires = Math.round(data.index_cache.expires_in_seconds);
+                html += `<li><strong>Index Cache:</strong> 
+                    <span class="badge bg-success">Active</span>
+                    <small class="text-muted">(Age: ${formatDuration(age)}, Expires in: ${formatDuration(expires)})</small>
+                </li>`;
+            } else {
+                html += `<li><strong>Index Cache:</strong> 
+                    <span class="badge bg-secondary">Empty</span>
+                    <small class="text-muted">(TTL: ${data.index_cache.ttl}s)</small>
+                </li>`;
+            }
+            
+            html += '</ul>';
+            statusDiv.innerHTML = html;
+        })
+        .catch(error => {
+            console.error('Error loading cache status:', error);
+            document.getElementById('cacheStatusInfo').innerHTML = 
+                '<div class="text-danger">Error loading cache status</div>';
+        });
+}
+
+function formatDuration(seconds) {
+    if (seconds < 60) return `${seconds}s`;
+    const minutes = Math.floor(seconds / 60);
+    const remainingSeconds = seconds % 60;
+    return `${minutes}m ${remainingSeconds}s`;
+}
+
+// Load queue when queue tab is shown
+document.addEventListener('DOMContentLoaded', function() {
+    const queueTab = document.getElementById('queue-tab');
+    if (queueTab) {
+        queueTab.addEventListener('shown.bs.tab', function() {
+            refreshAllQueues();
+        });
+    }
+    
+    // Load all queues on page load if we're on the queue tab
+    if (window.location.hash === '#queue' || document.querySelector('#queue-tab.active')) {
+        refreshAllQueues();
+    }
+    
+    // Load cache status when settings tab is shown
+    const settingsTab = document.getElementById('settings-tab');
+    if (settingsTab) {
+        settingsTab.addEventListener('shown.bs.tab', function() {
+            loadCacheStatus();
+        });
+    }
+    
+    // Load cache status on page load if we're on the settings tab
+    if (window.location.hash === '#settings' || document.querySelector('#settings-tab.active')) {
+        loadCacheStatus();
+    }
+});
+
+// SQL Logging Functions
+let sqlLogData = [];
+let sqlLogStatus = false;
+
+function toggleSQLLogging() {
+    const action = sqlLogStatus ? 'disable' : 'enable';
+    
+    fetch(`/admin/api/sql-logging/${action}`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        }
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            sqlLogStatus = !sqlLogStatus;
+            updateSQLLogStatus();
+            showToast(`SQL logging ${action}d successfully`, 'success');
+            if (sqlLogStatus) {
+                document.getElementById('sqlPerformanceWarning').style.display = 'block';
+                refreshSQLLogs();
+            } else {
+                document.getElementById('sqlPerformanceWarning').style.display = 'none';
+            }
+        } else {
+            showToast('Error: ' + data.error, 'error');
+        }
+    })
+    .catch(error => {
+        console.error('Error toggling SQL logging:', error);
+        showToast('Error toggling SQL logging', 'error');
+    });
+}
+
+function updateSQLLogStatus() {
+    const statusBadge = document.getElementById('sqlLogStatus');
+    const toggleIcon = document.getElementById('sqlToggleIcon');
+    const toggleText = document.getElementById('sqlToggleText');
+    
+    if (sqlLogStatus) {
+        statusBadge.className = 'badge bg-success';
+        statusBadge.textContent = 'Enabled';
+        toggleIcon.className = 'bi bi-power';
+        toggleText.textContent = 'Disable';
+    } else {
+        statusBadge.className = 'badge bg-secondary';
+        statusBadge.textContent = 'Disabled';
+        toggleIcon.className = 'bi bi-play';
+        toggleText.textContent = 'Enable';
+    }
+}
+
+function refreshSQLLogs() {
+    fetch('/admin/api/sql-logs')
+        .then(response => response.json())
+        .then(data => {
+            if (data.error) {
+                showToast('Error loading SQL logs: ' + data.error, 'error');
+            } else {
+                sqlLogData = data.logs || [];
+                sqlLogStatus = data.enabled || false;
+                updateSQLLogStatus();
+                displaySQLLogs();
+                calculateSQLStats();
+            }
+        })
+        .catch(error => {
+            console.error('Error loading SQL logs:', error);
+            showToast('Error loading SQL logs', 'error');
+        });
+}
+
+function displaySQLLogs() {
+    const container = document.getElementById('sqlContainer');
+    const componentFilter = document.getElementById('sqlComponentFilter').value;
+    const statusFilter = document.getElementById('sqlStatusFilter').value;
+    const searchFilter = document.getElementById('sqlSearchFilter').value.toLowerCase();
+    
+    let filteredLogs = sqlLogData;
+    
+    // Apply filters
+    if (componentFilter) {
+        filteredLogs = filteredLogs.filter(log => log.message.includes(`[${componentFilter}]`));
+    }
+    
+    if (statusFilter) {
+        filteredLogs = filteredLogs.filter(log => log.message.includes(statusFilter));
+    }
+    
+    if (searchFilter) {
+        filteredLogs = filteredLogs.filter(log => 
+            log.message.toLowerCase().includes(searchFilter)
+        );
+    }
+    
+    document.getElementById('sqlLogCount').textContent = filteredLogs.length;
+    
+    if (filteredLogs.length === 0) {
+        container.innerHTML = `
+            <div class="text-center text-muted">
+                <i class="bi bi-database fs-1"></i>
+                <p class="mt-2">No SQL logs found matching current filters.</p>
+                <p class="small">Clear filters or enable SQL logging to see queries.</p>
+            </div>
+        `;
+        return;
+    }
+    
+    let html = '';
+    filteredLogs.forEach(log => {
+        const isError = log.level === 'ERROR';
+        const timeColor = isError ? '#ff6b6b' : '#4ecdc4';
+        const levelColor = isError ? '#ff4757' : '#20bf6b';
+        
+        html += `
+            <div class="mb-2 p-2 border-start border-3" style="border-color: ${levelColor} !important;">
+                <div class="d-flex justify-content-between align-items-start mb-1">
+                    <span class="badge" style="background-color: ${levelColor}; font-size: 0.7rem;">
+                        ${log.level}
+                    </span>
+                    <small style="color: #888;">${log.timestamp}</small>
+                </div>
+                <div style="color: ${timeColor}; font-size: 0.85rem; word-break: break-all;">
+                    ${escapeHtml(log.message)}
+                </div>
+            </div>
+        `;
+    });
+    
+    container.innerHTML = html;
+    container.scrollTop = container.scrollHeight;
+}
+
+function calculateSQLStats() {
+    const timeRegex = /\((\d+\.?\d*)ms\)/g;
+    const times = [];
+    let errorCount = 0;
+    
+    sqlLogData.forEach(log => {
+        if (log.level === 'ERROR') {
+            errorCount++;
+        }
+        
+        const match = timeRegex.exec(log.message);
+        if (match) {
+            times.push(parseFloat(match[1]));
+        }
+        timeRegex.lastIndex = 0; // Reset regex
+    });
+    
+    if (times.length > 0) {
+        const avgTime = times.reduce((a, b) => a + b, 0) / times.length;
+        const minTime = Math.min(...times);
+        const maxTime = Math.max(...times);
+        
+        document.getElementById('sqlAvgTime').textContent = avgTime.toFixed(2);
+        document.getElementById('sqlFastestTime').textContent = minTime.toFixed(2);
+        document.getElementById('sqlSlowestTime').textContent = maxTime.toFixed(2);
+    } else {
+        document.getElementById('sqlAvgTime').textContent = '-';
+        document.getElementById('sqlFastestTime').textContent = '-';
+        document.getElementById('sqlSlowestTime').textContent = '-';
+    }
+    
+    document.getElementById('sqlErrorCount').textContent = errorCount;
+}
+
+function clearSQLLogs() {
+    if (!confirm('Are you sure you want to clear all SQL logs? This action cannot be undone.')) {
+        return;
+    }
+    
+    fetch('/admin/api/sql-logs/clear', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        }
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            sqlLogData = [];
+            displaySQLLogs();
+            calculateSQLStats();
+            showToast('SQL logs cleared successfully', 'success');
+        } else {
+            showToast('Error clearing SQL logs: ' + data.error, 'error');
+        }
+    })
+    .catch(error => {
+        console.error('Error clearing SQL logs:', error);
+        showToast('Error clearing SQL logs', 'error');
+    });
+}
+
+function copySQLLogs() {
+    if (!currentSQLLogs || currentSQLLogs.length === 0) {
+        showToast('No logs to copy', 'warning');
+        return;
+    }
+    
+    // Format logs as plain text
+    let logText = '';
+    currentSQLLogs.forEach(log => {
+        logText += `[${log.timestamp}] ${log.level}: ${log.message}\n`;
+    });
+    
+    // Copy to clipboard
+    navigator.clipboard.writeText(logText).then(() => {
+        showToast('SQL logs copied to clipboard', 'success');
+    }).catch(err => {
+        console.error('Failed to copy logs:', err);
+        // Fallback for older browsers
+        const textArea = document.createElement('textarea');
+        textArea.value = logText;
+        document.body.appendChild(textArea);
+        textArea.select();
+        try {
+            document.execCommand('copy');
+            showToast('SQL logs copied to clipboard', 'success');
+        } catch (err) {
+            showToast('Failed to copy logs', 'error');
+        }
+        document.body.removeChild(textArea);
+    });
+}
+
+function clearSQLFilters() {
+    document.getElementById('sqlComponentFilter').value = '';
+    document.getElementById('sqlStatusFilter').value = '';
+    document.getElementById('sqlSearchFilter').value = '';
+    displaySQLLogs();
+}
+
+function escapeHtml(text) {
+    const div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+}
+
+// Initialize SQL tab when shown
+document.addEventListener('DOMContentLoaded', function() {
+    const sqlTab = document.getElementById('sql-tab');
+    if (sqlTab) {
+        sqlTab.addEventListener('shown.bs.tab', function() {
+            refreshSQLLogs();
+        });
+    }
+    
+    // Filter event listeners
+    const filters = ['sqlComponentFilter', 'sqlStatusFilter', 'sqlSearchFilter'];
+    filters.forEach(filterId => {
+        const element = document.getElementById(filterId);
+        if (element) {
+            element.addEventListener('change', displaySQLLogs);
+            element.addEventListener('input', displaySQLLogs);
+        }
+    });
+});
+
+// System Status functionality
+let systemStatusAutoRefresh = false;
+let systemStatusInterval = null;
+
+function loadSystemStatus() {
+    const contentDiv = document.getElementById('systemStatusContent');
+    if (!contentDiv) return;
+    
+    // Show loading spinner
+    contentDiv.innerHTML = `
+        <div class="text-center py-5">
+            <div class="spinner-border text-primary" role="status">
+                <span class="visually-hidden">Loading...</span>
+            </div>
+            <p class="mt-2">Loading system status...</p>
+        </div>
+    `;
+    
+    fetch('/admin/api/system_status')
+        .then(response => response.json())
+        .then(data => {
+            if (data.error) {
+                contentDiv.innerHTML = `
+                    <div class="alert alert-danger">
+                        <h6>Error loading system status:</h6>
+                        <p class="mb-0">${data.error}</p>
+                    </div>
+                `;
+                return;
+            }
+            
+            displaySystemStatus(data);
+        })
+        .catch(error => {
+            console.error('Error loading system status:', error);
+            contentDiv.innerHTML = `
+                <div class="alert alert-danger">
+                    <h6>Failed to load system status</h6>
+                    <p class="mb-0">Please check the console for details.</p>
+                </div>
+            `;
+        });
+}
+
+function displaySystemStatus(data) {
+    const contentDiv = document.getElementById('systemStatusContent');
+    if (!contentDiv) return;
+    
+    const formatUptime = (uptime) => uptime || 'Unknown';
+    const formatMemory = (mb) => mb ? `${mb} MB` : 'Unknown';
+    const getStatusBadge = (isRunning, status = null) => {
+        if (isRunning === true || status === 'active') {
+            return '<span class="badge bg-success">Running</span>';
+        } else if (isRunning === false || status === 'inactive') {
+            return '<span class="badge bg-danger">Stopped</span>';
+        } else {
+            return '<span class="badge bg-warning">Unknown</span>';
+        }
+    };
+    
+    let html = `
+        <div class="row">
+            <!-- System Information -->
+            <div class="col-md-6 mb-4">
+                <div class="card h-100">
+                    <div class="card-header">
+                        <h6 class="mb-0"><i class="bi bi-info-circle"></i> System Information</h6>
+                    </div>
+                    <div class="card-body">
+                        <table class="table table-sm">
+                            <tr><td><strong>Hostname:</strong></td><td>${data.system_info?.hostname || 'Unknown'}</td></tr>
+                            <tr><td><strong>Platform:</strong></td><td>${data.system_info?.platform || 'Unknown'}</td></tr>
+                            <tr><td><strong>Architecture:</strong></td><td>${data.system_info?.architecture || 'Unknown'}</td></tr>
+                            <tr><td><strong>Python:</strong></td><td>${data.system_info?.python_version || 'Unknown'}</td></tr>
+                            <tr><td><strong>CPU Cores:</strong></td><td>${data.system_info?.cpu_count || 'Unknown'}</td></tr>
+                            <tr><td><strong>Boot Time:</strong></td><td>${data.system_info?.boot_time || 'Unknown'}</td></tr>
+                            <tr><td><strong>Uptime:</strong></td><td>${formatUptime(data.system_info?.uptime)}</td></tr>
+                        </table>
+                    </div>
+                </div>
+            </div>
+            
+            <!-- Port Information -->
+            <div class="col-md-6 mb-4">
+                <div class="card h-100">
+                    <div class="card-header">
+                        <h6 class="mb-0"><i class="bi bi-diagram-3"></i> Network Ports</h6>
+                    </div>
+                    <div class="card-body">
+                        ${data.port_info?.main_app ? `
+                            <div class="alert alert-success">
+                                <strong>Main Application:</strong> Port ${data.port_info.main_app.port} 
+                                (PID: ${data.port_info.main_app.pid})
+                            </div>
+                        ` : '<div class="alert alert-warning">Main application port not detected</div>'}
+                        
+                        <h6 class="mt-3">Active Ports:</h6>
+                        <div style="max-height: 150px; overflow-y: auto;">
+                            ${data.port_info?.listening_ports?.length ? 
+                                data.port_info.listening_ports.map(port => `
+                                    <small class="d-block">
+                                        ${port.address}:${port.port} - ${port.process_name || 'Unknown'} 
+                                        ${port.pid ? `(PID: ${port.pid})` : ''}
+                                    </small>
+                                `).join('') 
+                                : '<small class="text-muted">No listening ports detected</small>'
+                            }
+                        </div>
+                    </div>
+                </div>
+            </div>
+        </div>
+        
+        <div class="row">
+            <!-- Gunicorn Status -->
+            <div class="col-md-6 mb-4">
+                <div class="card">
+                    <div class="card-header">
+                        <h6 class="mb-0"><i class="bi bi-server"></i> Gunicorn Application Server</h6>
+                    </div>
+                    <div class="card-body">
+                        <div class="d-flex justify-content-between align-items-center mb-2">
+                            <span><strong>Status:</strong></span>
+                            ${getStatusBadge(data.gunicorn_status?.status === 'running')}
+                        </div>
+                        ${data.gunicorn_status?.master_pid ? `
+                            <p><strong>Master PID:</strong> ${data.gunicorn_status.master_pid}</p>
+                            <p><strong>Uptime:</strong> ${formatUptime(data.gunicorn_status.master_uptime)}</p>
+                        ` : ''}
+                        <p><strong>Workers:</strong> ${data.gunicorn_status?.worker_count || 0}</p>
+                        ${data.gunicorn_status?.total_memory_mb ? `
+                            <p><strong>Total Memory:</strong> ${formatMemory(data.gunicorn_status.total_memory_mb)}</p>
+                        ` : ''}
+                        
+                        ${data.gunicorn_status?.workers?.length ? `
+                            <details class="mt-2">
+                                <summary><small>Worker Details</small></summary>
+                                <div class="mt-2">
+                                    ${data.gunicorn_status.workers.map(worker => `
+                                        <small class="d-block">
+                                            PID ${worker.pid}: ${formatMemory(worker.memory_mb)}, 
+                                            Uptime: ${formatUptime(worker.uptime)}
+                                        </small>
+                                    `).join('')}
+                                </div>
+                            </details>
+                        ` : ''}
+                    </div>
+                </div>
+            </div>
+            
+            <!-- Background Processes -->
+            <div class="col-md-6 mb-4">
+                <div class="card">
+                    <div class="card-header">
+                        <h6 class="mb-0"><i class="bi bi-gear"></i> Background Processes</h6>
+                    </div>
+                    <div class="card-body">
+                        <div class="alert alert-info">
+                            <small><i class="bi bi-info-circle"></i> Background processes are managed by shell scripts (bg_downloader.sh, run_transcribe_worker.sh, run_progress_watcher.sh), not systemd services.</small>
+                        </div>
+                        
+                        <div class="mb-3">
+                            <div class="d-flex justify-content-between align-items-center">
+                                <span><strong>Downloader (bg_downloader.py):</strong></span>
+                                ${getStatusBadge(data.background_processes?.bg_downloader?.length > 0)}
+                            </div>
+                            <small class="text-muted">
+                                ${data.background_processes?.bg_downloader?.length || 0} process(es) running
+                                ${data.background_processes?.bg_downloader?.length > 0 ? 
+                                    `<br>PIDs: ${data.background_processes.bg_downloader.map(p => p.pid).join(', ')}` : ''}
+                            </small>
+                        </div>
+                        
+                        <div class="mb-3">
+                            <div class="d-flex justify-content-between align-items-center">
+                                <span><strong>Transcriber (background_transcribe.py):</strong></span>
+                                ${getStatusBadge(data.background_processes?.background_transcribe?.length > 0)}
+                            </div>
+                            <small class="text-muted">
+                                ${data.background_processes?.background_transcribe?.length || 0} process(es) running
+                                ${data.background_processes?.background_transcribe?.length > 0 ? 
+                                    `<br>PIDs: ${data.background_processes.background_transcribe.map(p => p.pid).join(', ')}` : ''}
+                            </small>
+                        </div>
+                        
+                        <div class="mb-3">
+                            <div class="d-flex justify-content-between align-items-center">
+                                <span><strong>Progress Watcher (bg_progress_watcher.py):</strong></span>
+                                ${getStatusBadge(data.background_processes?.bg_progress_watcher?.length > 0)}
+                            </div>
+                            <small class="text-muted">
+                                ${data.background_processes?.bg_progress_watcher?.length || 0} process(es) running
+                                ${data.background_processes?.bg_progress_watcher?.length > 0 ? 
+                                    `<br>PIDs: ${data.background_processes.bg_progress_watcher.map(p => p.pid).join(', ')}` : ''}
+                            </small>
+                        </div>
+                        
+                        <!-- Process Details -->
+                        ${Object.entries(data.background_processes || {}).some(([key, processes]) => processes.length > 0) ? `
+                            <details class="mt-3">
+                                <summary><small>Process Details</small></summary>
+                                <div class="mt-2" style="max-height: 200px; overflow-y: auto;">
+                                    ${Object.entries(data.background_processes || {}).map(([processType, processes]) => 
+                                        processes.map(proc => `
+                                            <div class="border-bottom pb-1 mb-1">
+                                                <small><strong>${processType}:</strong> PID ${proc.pid}</small><br>
+                                                <small>Memory: ${formatMemory(proc.memory_mb)}, Uptime: ${formatUptime(proc.uptime)}</small><br>
+                                                <small class="text-muted">Started: ${proc.started}</small>
+                                            </div>
+                                        `).join('')
+                                    ).join('')}
+                                </div>
+                            </details>
+                        ` : ''}
+                    </div>
+                </div>
+            </div>
+        </div>
+        
+        <div class="row">
+            <!-- System Services -->
+            <div class="col-md-6 mb-4">
+                <div class="card">
+                    <div class="card-header">
+                        <h6 class="mb-0"><i class="bi bi-list-check"></i> System Services</h6>
+                    </div>
+                    <div class="card-body">
+                        ${Object.entries(data.systemd_services || {}).map(([serviceName, service]) => `
+                            <div class="d-flex justify-content-between align-items-center mb-2">
+                                <span><strong>${serviceName}:</strong></span>
+                                ${getStatusBadge(service.active, service.status)}
+                            </div>
+                            <small class="text-muted d-block mb-2">
+                                ${service.enabled ? 
+                                    '<i class="bi bi-check-circle text-success" title="Service starts automatically on boot"></i> Auto-start enabled' : 
+                                    '<i class="bi bi-x-circle text-warning" title="Service must be started manually"></i> Auto-start disabled'}
+                                ${service.main_pid ? ` | PID: ${service.main_pid}` : ''}
+                                ${service.memory ? ` | Memory: ${service.memory}` : ''}
+                            </small>
+                        `).join('')}
+                        
+                        <!-- MySQL Database Status -->
+                        ${data.mysql_status ? `
+                            <hr class="my-3">
+                            <div class="d-flex justify-content-between align-items-center mb-2">
+                                <span><strong>MySQL Database:</strong></span>
+                                ${getStatusBadge(data.mysql_status.active, data.mysql_status.status)}
+                            </div>
+                            <small class="text-muted d-block">
+                                ${data.mysql_status.message || 'Unknown'}
+                                ${data.mysql_status.database ? ` | DB: ${data.mysql_status.database}` : ''}
+                            </small>
+                        ` : ''}
+                    </div>
+                </div>
+            </div>
+            
+            <!-- Disk Usage -->
+            <div class="col-md-6 mb-4">
+                <div class="card">
+                    <div class="card-header d-flex justify-content-between align-items-center">
+                        <h6 class="mb-0"><i class="bi bi-hdd"></i> Disk Usage</h6>
+                        ${data.disk_usage?.disk_total?.free_gb ? `
+                            <span class="badge bg-info">${data.disk_usage.disk_total.free_gb} GB Free</span>
+                        ` : ''}
+                    </div>
+                    <div class="card-body">
+                        ${data.disk_usage?.disk_total ? `
+                            <div class="mb-3">
+                                <div class="d-flex justify-content-between">
+                                    <span><strong>System Disk:</strong></span>
+                                    <span>${data.disk_usage.disk_total.percent_used}%</span>
+                                </div>
+                                <div class="progress" style="height: 10px;">
+                                    <div class="progress-bar ${data.disk_usage.disk_total.percent_used > 90 ? 'bg-danger' : data.disk_usage.disk_total.percent_used > 70 ? 'bg-warning' : 'bg-success'}" 
+                                         style="width: ${data.disk_usage.disk_total.percent_used}%"></div>
+                                </div>
+                                <small class="text-muted">
+                                    ${data.disk_usage.disk_total.used_gb} GB / ${data.disk_usage.disk_total.total_gb} GB used
+                                </small>
+                            </div>
+                            <hr>
+                        ` : ''}
+                        
+                        ${data.disk_usage?.app_total_gb !== undefined ? `
+                            <div class="mb-2">
+                                <strong>Application Total: ${data.disk_usage.app_total_gb} GB</strong>
+                            </div>
+                        ` : ''}
+                        
+                        ${data.disk_usage?.directories ? Object.entries(data.disk_usage.directories).map(([name, dir]) => `
+                            <div class="mb-2">
+                                <div class="d-flex justify-content-between">
+                                    <span>${name}:</span>
+                                    <span>${dir.error ? 'Error' : 
+                                        dir.exists === false ? 'Not found' :
+                                        `${dir.size_gb} GB (${dir.percent_of_app}%)`}</span>
+                                </div>
+                                ${!dir.error && dir.exists !== false && dir.percent_of_app > 0 ? `
+                                    <div class="progress" style="height: 6px;">
+                                        <div class="progress-bar bg-primary" 
+                                             style="width: ${dir.percent_of_app}%"></div>
+                                    </div>
+                                ` : ''}
+                            </div>
+                        `).join('') : 'No directory information available'}
+                    </div>
+                </div>
+            </div>
+        </div>
+        
+        <div class="text-end">
+            <small class="text-muted">Last updated: ${new Date(data.timestamp).toLocaleString()}</small>
+        </div>
+    `;
+    
+    contentDiv.innerHTML = html;
+}
+
+function toggleAutoRefresh() {
+    const btn = document.getElementById('autoRefreshBtn');
+    if (!btn) return;
+    
+    if (systemStatusAutoRefresh) {
+        // Stop auto refresh
+        systemStatusAutoRefresh = false;
+        if (systemStatusInterval) {
+            clearInterval(systemStatusInterval);
+            systemStatusInterval = null;
+        }
+        btn.innerHTML = '<i class="bi bi-play"></i> Auto Refresh';
+        btn.classList.remove('btn-outline-danger');
+        btn.classList.add('btn-outline-secondary');
+    } else {
+        // Start auto refresh (every 10 seconds)
+        systemStatusAutoRefresh = true;
+        systemStatusInterval = setInterval(loadSystemStatus, 10000);
+        btn.innerHTML = '<i class="bi bi-stop"></i> Stop Auto Refresh';
+        btn.classList.remove('btn-outline-secondary');
+        btn.classList.add('btn-outline-danger');
+        loadSystemStatus(); // Load immediately
+    }
+}
+
+// Load system status when the tab is shown
+document.addEventListener('DOMContentLoaded', function() {
+    const statusTab = document.getElementById('status-tab');
+    if (statusTab) {
+        statusTab.addEventListener('shown.bs.tab', function() {
+            loadSystemStatus();
+        });
+    }
+    
+    // Load administrator guide when help tab is shown
+    const helpTab = document.getElementById('help-tab');
+    if (helpTab) {
+        helpTab.addEventListener('shown.bs.tab', function() {
+            loadAdministratorGuide();
+        });
+    }
+});
+
+// Load administrator guide content
+function loadAdministratorGuide() {
+    const content = document.getElementById('administrator-guide-content');
+    if (!content) return;
+    
+    // Show loading state
+    content.innerHTML = `
+        <div class="text-center p-5">
+            <div class="spinner-border text-primary" role="status">
+                <span class="visually-hidden">Loading guide...</span>
+            </div>
+            <p class="mt-3">Loading Administrator's Guide...</p>
+        </div>
+    `;
+    
+    // Fetch guide content
+    fetch('/admin/api/administrator-guide')
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+            }
+            return response.text();
+        })
+        .then(html => {
+            content.innerHTML = `<div class="p-4">${html}</div>`;
+            
+            // Add table of contents navigation
+            addTableOfContents();
+            
+            // Style the content
+            styleGuideContent();
+        })
+        .catch(error => {
+            console.error('Error loading administrator guide:', error);
+            content.innerHTML = `
+                <div class="alert alert-danger m-4">
+                    <h5><i class="bi bi-exclamation-triangle"></i> Error Loading Guide</h5>
+                    <p>Failed to load the Administrator's Guide: ${error.message}</p>
+                    <p>Please try refreshing the page or contact technical support.</p>
+                </div>
+            `;
+        });
+}
+
+// Add table of contents with jump links
+function addTableOfContents() {
+    const content = document.getElementById('administrator-guide-content');
+    const headings = content.querySelectorAll('h2, h3');
+    
+    if (headings.length === 0) return;
+    
+    // Create TOC container
+    const tocHtml = `
+        <div class="card mb-4" id="table-of-contents">
+            <div class="card-header">
+                <h6 class="mb-0"><i class="bi bi-list-ol"></i> Table of Contents</h6>
+            </div>
+            <div class="card-body">
+                <div class="row">
+                    ${Array.from(headings).map((heading, index) => {
+                        const id = `section-${index}`;
+                        heading.id = id;
+                        const level = heading.tagName === 'H2' ? 'fw-bold' : 'ms-3';
+                        return `
+                            <div class="col-md-6 mb-2">
+                                <a href="#${id}" class="text-decoration-none ${level}" onclick="scrollToSection('${id}')">
+                                    ${heading.textContent}
+                                </a>
+                            </div>
+                        `;
+                    }).join('')}
+                </div>
+            </div>
+        </div>
+    `;
+    
+    const firstChild = content.querySelector('.p-4').firstElementChild;
+    if (firstChild) {
+        firstChild.insertAdjacentHTML('afterend', tocHtml);
+    }
+}
+
+// Scroll to specific section
+function scrollToSection(sectionId) {
+    const element = document.getElementById(sectionId);
+    if (element) {
+        const content = document.getElementById('administrator-guide-content');
+        const elementTop = element.offsetTop - content.offsetTop;
+        content.scrollTo({
+            top: elementTop - 20,
+            behavior: 'smooth'
+        });
+    }
+}
+
+// Style the guide content for better readability
+function styleGuideContent() {
+    const content = document.getElementById('administrator-guide-content');
+    
+    // Style code blocks
+    content.querySelectorAll('code').forEach(code => {
+        if (!code.parentElement.tagName === 'PRE') {
+            code.classList.add('bg-light', 'p-1', 'rounded');
+        }
+    });
+    
+    // Style pre blocks
+    content.querySelectorAll('pre').forEach(pre => {
+        pre.classList.add('bg-dark', 'text-light', 'p-3', 'rounded', 'overflow-auto');
+        const code = pre.querySelector('code');
+        if (code) {
+            code.classList.remove('bg-light', 'p-1');
+        }
+    });
+    
+    // Style tables
+    content.querySelectorAll('table').forEach(table => {
+        table.classList.add('table', 'table-striped', 'table-hover');
+        const wrapper = document.createElement('div');
+        wrapper.classList.add('table-responsive', 'my-3');
+        table.parentNode.insertBefore(wrapper, table);
+        wrapper.appendChild(table);
+    });
+    
+    // Style blockquotes
+    content.querySelectorAll('blockquote').forEach(blockquote => {
+        blockquote.classList.add('border-start', 'border-4', 'border-primary', 'ps-3', 'my-3');
+    });
+    
+    // Add copy buttons to code blocks
+    content.querySelectorAll('pre code').forEach((code, index) => {
+        const copyId = `copy-code-${index}`;
+        const copyBtn = `
+            <button class="btn btn-sm btn-outline-secondary position-absolute" 
+                    style="top: 10px; right: 10px;" 
+                    onclick="copyCodeBlock('${copyId}')"
+                    title="Copy code">
+                <i class="bi bi-clipboard"></i>
+            </button>
+        `;
+        code.id = copyId;
+        const pre = code.parentElement;
+        pre.style.position = 'relative';
+        pre.insertAdjacentHTML('beforeend', copyBtn);
+    });
+}
+
+// Copy code block to clipboard
+function copyCodeBlock(codeId) {
+    const codeElement = document.getElementById(codeId);
+    if (!codeElement) return;
+    
+    navigator.clipboard.writeText(codeElement.textContent).then(() => {
+        showToast('Code copied to clipboard', 'success');
+    }).catch(err => {
+        console.error('Failed to copy code:', err);
+        showToast('Failed to copy code', 'error');
+    });
+}
+
+// Print the administrator guide
+function printGuide() {
+    const content = document.getElementById('administrator-guide-content');
+    if (!content) {
+        showToast('No content to print', 'warning');
+        return;
+    }
+    
+    // Create a new window for printing
+    const printWindow = window.open('', '_blank');
+    const guideContent = content.innerHTML;
+    
+    printWindow.document.write(`
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>XSpace Downloader - Administrator's Guide</title>
+            <style>
+                body { 
+                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+                    line-height: 1.6;
+                    color: #333;
+                    max-width: 800px;
+                    margin: 0 auto;
+                    padding: 20px;
+                }
+                h1, h2, h3, h4, h5, h6 { 
+                    color: #2c3e50;
+                    margin-top: 30px;
+                    margin-bottom: 15px;
+                }
+                h1 { border-bottom: 3px solid #3498db; padding-bottom: 10px; }
+                h2 { border-bottom: 1px solid #ecf0f1; padding-bottom: 5px; }
+                code { 
+                    background: #f8f9fa;
+                    padding: 2px 6px;
+                    border-radius: 3px;
+                    font-family: 'Monaco', 'Menlo', monospace;
+                }
+                pre { 
+                    background: #2c3e50;
+                    color: #ecf0f1;
+                    padding: 15px;
+                    border-radius: 5px;
+                    overflow-x: auto;
+                }
+                pre code { 
+                    background: none;
+                    padding: 0;
+                    color: inherit;
+                }
+                table { 
+                    width: 100%;
+                    border-collapse: collapse;
+                    margin: 15px 0;
+                }
+                th, td { 
+                    border: 1px solid #ddd;
+                    padding: 8px 12px;
+                    text-align: left;
+                }
+                th { 
+                    background: #f8f9fa;
+                    font-weight: bold;
+                }
+                .alert { 
+                    padding: 12px;
+                    margin: 15px 0;
+                    border-radius: 4px;
+                    border-left: 4px solid #3498db;
+                    background: #f8f9fa;
+                }
+                blockquote {
+                    border-left: 4px solid #3498db;
+                    padding-left: 15px;
+                    margin: 15px 0;
+                    color: #666;
+                }
+                @media print {
+                    body { margin: 0; padding: 15px; }
+                    h1 { page-break-before: always; }
+                    h1:first-child { page-break-before: auto; }
+                    pre, blockquote { page-break-inside: avoid; }
+                }
+            </style>
+        </head>
+        <body>
+            ${guideContent}
+            <footer style="margin-top: 50px; padding-top: 20px; border-top: 1px solid #ddd; text-align: center; color: #666;">
+                <p>XSpace Downloader - Administrator's Guide</p>
+                <p>Generated on ${new Date().toLocaleDateString()}</p>
+            </footer>
+        </body>
+        </html>
+    `);
+    
+    printWindow.document.close();
+    printWindow.onload = function() {
+        printWindow.print();
+        printWindow.close();
+    };
+}
+
+// Service Settings Functions
+async function loadServiceSettings() {
+    try {
+        const response = await fetch('/admin/api/service_settings');
+        const result = await response.json();
+        
+        if (result.settings) {
+            document.getElementById('transcriptionEnabled').checked = result.settings.transcription_enabled?.value || false;
+            document.getElementById('videoGenerationEnabled').checked = result.settings.video_generation_enabled?.value || false;
+        }
+    } catch (error) {
+        console.error('Error loading service settings:', error);
+    }
+}
+
+document.getElementById('serviceSettingsForm').addEventListener('submit', async function(e) {
+    e.preventDefault();
+    
+    const messageDiv = document.getElementById('serviceSettingsMessage');
+    messageDiv.style.display = 'none';
+    
+    const data = {
+        transcription_enabled: document.getElementById('transcriptionEnabled').checked,
+        video_generation_enabled: document.getElementById('videoGenerationEnabled').checked
+    };
+    
+    try {
+        const response = await fetch('/admin/api/service_settings', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify(data)
+        });
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            messageDiv.className = 'alert alert-success mt-3';
+            messageDiv.innerHTML = `<i class="bi bi-check-circle"></i> ${result.message}`;
+        } else {
+            messageDiv.className = 'alert alert-danger mt-3';
+            messageDiv.innerHTML = `<i class="bi bi-exclamation-triangle"></i> Error: ${result.error}`;
+        }
+        
+        messageDiv.style.display = 'block';
+        
+        setTimeout(() => {
+            messageDiv.style.display = 'none';
+        }, 5000);
+        
+    } catch (error) {
+        console.error('Error saving service settings:', error);
+        messageDiv.className = 'alert alert-danger mt-3';
+        messageDiv.innerHTML = `<i class="bi bi-exclamation-triangle"></i> Error saving settings: ${error.message}`;
+        messageDiv.style.display = 'block';
+    }
+});
+
+// System Messages Functions
+let systemMessagesList; // Global variable for list.js instance
+
+async function loadAdminSystemMessages() {
+    console.log('Loading system messages...');
+    console.log('Function called at:', new Date().toISOString());
+    
+    const tableDiv = document.getElementById('systemMessagesTable');
+    console.log('Table div found:', tableDiv ? 'Yes' : 'No');
+    
+    if (!tableDiv) {
+        console.error('systemMessagesTable element not found!');
+        return;
+    }
+    
+    try {
+        console.log('Fetching from /admin/api/system_messages...');
+        const response = await fetch('/admin/api/system_messages');
+        console.log('Response status:', response.status);
+        
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        
+        const result = await response.json();
+        console.log('System messages response:', result);
+        console.log('Number of messages:', result.messages ? result.messages.length : 0);
+        
+        if (result.messages && result.messages.length > 0) {
+            // Create the table structure with list.js requirements
+            let tableHTML = `
+                <div id="systemMessagesList">
+                    <div class="table-responsive">
+                        <table class="table table-striped table-hover">
+                            <thead>
+                                <tr>
+                                    <th class="sort" data-sort="message">Message <i class="bi bi-arrow-down-up"></i></th>
+                                    <th class="sort" data-sort="start_date">Start Date <i class="bi bi-arrow-down-up"></i></th>
+                                    <th class="sort" data-sort="end_date">End Date <i class="bi bi-arrow-down-up"></i></th>
+                                    <th class="sort" data-sort="status">Status <i class="bi bi-arrow-down-up"></i></th>
+                                    <th>Actions</th>
+                                </tr>
+                            </thead>
+                            <tbody class="list">
+            `;
+            
+            result.messages.forEach((msg, index) => {
+                console.log(`Processing message ${index + 1}:`, msg);
+                
+                // Check if message is currently visible (active and within date range)
+                const now = new Date();
+                const startDate = msg.start_date ? new Date(msg.start_date) : null;
+                const endDate = msg.end_date ? new Date(msg.end_date) : null;
+                const isWithinDateRange = startDate && endDate ? (now >= startDate && now <= endDate) : false;
+                const isCurrentlyVisible = msg.status === 1 && isWithinDateRange;
+                
+                let statusBadge = '';
+                let statusText = '';
+                if (msg.status === undefined) {
+                    // Handle case where status is missing
+                    statusBadge = '<span class="badge bg-warning">Unknown Status</span>';
+                    statusText = 'Unknown';
+                } else if (msg.status === 1) {
+                    if (!startDate || !endDate) {
+                        statusBadge = '<span class="badge bg-info">Active (No Dates)</span>';
+                        statusText = 'Active (No Dates)';
+                    } else if (isWithinDateRange) {
+                        statusBadge = '<span class="badge bg-success">Active & Visible</span>';
+                        statusText = 'Active & Visible';
+                    } else if (now < startDate) {
+                        statusBadge = '<span class="badge bg-warning">Active (Future)</span>';
+                        statusText = 'Active (Future)';
+                    } else {
+                        statusBadge = '<span class="badge bg-secondary">Active (Expired)</span>';
+                        statusText = 'Active (Expired)';
+                    }
+                } else {
+                    statusBadge = '<span class="badge bg-secondary">Inactive</span>';
+                    statusText = 'Inactive';
+                }
+                
+                // Format dates in m/d/y h:i A format
+                const formatDate = (date) => {
+                    if (!date) return 'Not Available';
+                    const month = date.getMonth() + 1;
+                    const day = date.getDate();
+                    const year = date.getFullYear();
+                    let hours = date.getHours();
+                    const minutes = date.getMinutes().toString().padStart(2, '0');
+                    const ampm = hours >= 12 ? 'PM' : 'AM';
+                    hours = hours % 12;
+                    hours = hours ? hours : 12; // 0 should be 12
+                    return `${month}/${day}/${year} ${hours}:${minutes} ${ampm}`;
+                };
+                
+                const startDateStr = formatDate(startDate);
+                const endDateStr = formatDate(endDate);
+                console.log(`Dates - Start: ${startDateStr}, End: ${endDateStr}`);
+                
+                tableHTML += `
+                    <tr${isCurrentlyVisible ? ' class="table-success"' : ''}>
+                        <td class="message">${msg.message}</td>
+                        <td class="start_date" data-timestamp="${startDate ? startDate.getTime() : 0}">${startDateStr}</td>
+                        <td class="end_date" data-timestamp="${endDate ? endDate.getTime() : 0}">${endDateStr}</td>
+                        <td class="status" data-status="${statusText}">${statusBadge}</td>
+                        <td>
+                            ${msg.status !== undefined ? 
+                                (msg.status === 0 ? 
+                                    `<button class="btn btn-sm btn-outline-success me-1" onclick="toggleSystemMessage(${msg.id}, 1)" title="Activate">
+                                        <i class="bi bi-check-circle"></i>
+                                    </button>` : 
+                                    `<button class="btn btn-sm btn-outline-warning me-1" onclick="toggleSystemMessage(${msg.id}, 0)" title="Deactivate">
+                                        <i class="bi bi-pause-circle"></i>
+                                    </button>`) :
+                                '<span class="text-muted">No actions available</span>'
+                            }
+                            <button class="btn btn-sm btn-outline-danger" onclick="deleteSystemMessage(${msg.id})" title="Delete">
+                                <i class="bi bi-trash"></i>
+                            </button>
+                        </td>
+                    </tr>
+                `;
+            });
+            
+            tableHTML += `
+                            </tbody>
+                        </table>
+                    </div>
+                    <div class="d-flex justify-content-between align-items-center mt-3">
+                        <div>
+                            <small class="text-muted">Showing <span class="list-count"></span> of ${result.messages.length} messages</small>
+                        </div>
+                        <ul class="pagination pagination-sm mb-0"></ul>
+                    </div>
+                </div>
+            `;
+            
+            console.log('Setting table HTML, length:', tableHTML.length);
+            tableDiv.innerHTML = tableHTML;
+            console.log('Table HTML set successfully');
+            
+            // Initialize list.js with pagination
+            const options = {
+                valueNames: ['message', 'start_date', 'end_date', 'status'],
+                page: 10,
+                pagination: true,
+                searchClass: 'search',
+                sortClass: 'sort'
+            };
+            
+            // If systemMessagesList exists, destroy it first
+            if (systemMessagesList) {
+                systemMessagesList = null;
+            }
+            
+            // Create new list.js instance
+            systemMessagesList = new List('messagesCollapse', options);
+            
+            // Update count display
+            systemMessagesList.on('updated', function(list) {
+                document.querySelector('.list-count').textContent = list.matchingItems.length;
+            });
+            
+            // Initial count update
+            document.querySelector('.list-count').textContent = systemMessagesList.matchingItems.length;
+            
+        } else {
+            tableDiv.innerHTML = `
+                <div class="text-center py-4 text-muted">
+                    <i class="bi bi-inbox fs-1"></i>
+                    <p class="mt-2">No system messages found.</p>
+                </div>
+            `;
+        }
+    } catch (error) {
+        console.error('Error loading system messages:', error);
+        document.getElementById('systemMessagesTable').innerHTML = `
+            <div class="alert alert-danger">
+                <i class="bi bi-exclamation-triangle"></i> Error loading system messages: ${error.message}
+            </div>
+        `;
+    }
+}
+
+async function saveSystemMessage() {
+    const message = document.getElementById('systemMessageText').value.trim();
+    const startDate = document.getElementById('systemMessageStartDate').value;
+    const endDate = document.getElementById('systemMessageEndDate').value;
+    
+    if (!message || !startDate || !endDate) {
+        alert('Please fill in all fields.');
+        return;
+    }
+    
+    if (new Date(endDate) <= new Date(startDate)) {
+        alert('End date must be after start date.');
+        return;
+    }
+    
+    try {
+        const response = await fetch('/admin/api/system_messages', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                message: message,
+                start_date: startDate,
+                end_date: endDate
+            })
+        });
+        
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        
+        const result = await response.json();
+        console.log('Save system message response:', result);
+        
+        if (result.success) {
+            // Close modal
+            const modal = bootstrap.Modal.getInstance(document.getElementById('addSystemMessageModal'));
+            modal.hide();
+            
+            // Reset form
+            document.getElementById('addSystemMessageForm').reset();
+            
+            // Reload messages
+            loadAdminSystemMessages();
+            
+            // Show success message using showToast if available
+            if (typeof showToast === 'function') {
+                showToast('System message created successfully!', 'success');
+            } else {
+                const alert = document.createElement('div');
+                alert.className = 'alert alert-success alert-dismissible fade show';
+                alert.innerHTML = `
+                    <i class="bi bi-check-circle"></i> System message created successfully!
+                    <button type="button" class="btn-close" data-bs-dismiss="alert" aria-label="Close"></button>
+                `;
+                
+                document.querySelector('#systemMessagesTable').parentNode.insertBefore(alert, document.querySelector('#systemMessagesTable'));
+            }
+            
+            setTimeout(() => {
+                if (alert.parentNode) {
+                    alert.parentNode.removeChild(alert);
+                }
+            }, 5000);
+            
+        } else {
+            const errorMsg = result.error || 'Failed to save system message';
+            console.error('Save failed:', errorMsg);
+            if (typeof showToast === 'function') {
+                showToast('Error: ' + errorMsg, 'danger');
+            } else {
+                alert('Error: ' + errorMsg);
+            }
+        }
+        
+    } catch (error) {
+        console.error('Error saving system message:', error);
+        if (typeof showToast === 'function') {
+            showToast('Error saving system message: ' + error.message, 'danger');
+        } else {
+            alert('Error saving system message: ' + error.message);
+        }
+    }
+}
+
+async function deleteSystemMessage(messageId) {
+    if (!confirm('Are you sure you want to delete this system message?')) {
+        return;
+    }
+    
+    try {
+        const response = await fetch(`/admin/api/system_messages/${messageId}`, {
+            method: 'DELETE'
+        });
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            loadAdminSystemMessages();
+        } else {
+            alert('Error: ' + result.error);
+        }
+        
+    } catch (error) {
+        console.error('Error deleting system message:', error);
+        alert('Error deleting system message: ' + error.message);
+    }
+}
+
+async function toggleSystemMessage(messageId, newStatus) {
+    const action = newStatus === 1 ? 'activate' : 'deactivate';
+    if (!confirm(`Are you sure you want to ${action} this system message?`)) {
+        return;
+    }
+    
+    try {
+        const response = await fetch(`/admin/api/system_messages/${messageId}`, {
+            method: 'PUT',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({
+                status: newStatus
+            })
+        });
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            loadAdminSystemMessages();  // Refresh the list
+        } else {
+            alert('Error: ' + result.error);
+        }
+        
+    } catch (error) {
+        console.error('Error toggling system message:', error);
+        alert('Error toggling system message: ' + error.message);
+    }
+}
+
+// Cost Management Functions
+function updateUserCredits(userId, newCredits) {
+    fetch(`/admin/api/users/${userId}`, {
+        method: 'PUT',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({credits: Math.round(parseFloat(newCredits))})
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            showToast('Credits updated successfully', 'success');
+        } else {
+            showToast('Failed to update credits: ' + (data.error || 'Unknown error'), 'danger');
+            loadUsers(currentPage); // Reload to show correct value
+        }
+    })
+    .catch(error => {
+        console.error('Error updating credits:', error);
+        showToast('Error updating credits', 'danger');
+        loadUsers(currentPage); // Reload to show correct value
+    });
+}
+
+async function loadCostSettings() {
+    try {
+        // Load compute cost
+        const computeResponse = await fetch('/admin/api/compute_cost');
+        const computeData = await computeResponse.json();
+        if (computeData.cost_per_second) {
+            document.getElementById('computeCostPerSecond').value = computeData.cost_per_second;
+        }
+        
+        // Load AI costs
+        loadAICosts();
+        
+        // Load credit statistics
+        loadCreditStats();
+        
+    } catch (error) {
+        console.error('Error loading cost settings:', error);
+    }
+}
+
+// Global variable for list.js instance
+let aiCostsList = null;
+
+async function loadAICosts() {
+    try {
+        const response = await fetch('/admin/api/ai_costs');
+        const data = await response.json();
+        
+        const tbody = document.querySelector('#aiCostsTable tbody');
+        
+        // Check if response contains error
+        if (data.error) {
+            console.error('API Error:', data.error);
+            tbody.innerHTML = '<tr><td colspan="6" class="text-center text-danger">Error loading AI costs: ' + data.error + '</td></tr>';
+            return;
+        }
+        
+        if (data.costs && data.costs.length > 0) {
+            // Generate HTML rows for the table
+            tbody.innerHTML = data.costs.map(cost => `
+                <tr>
+                    <td class="vendor">${cost.vendor || 'Unknown'}</td>
+                    <td class="model">${cost.model || 'Unknown'}</td>
+                    <td class="input-cost">$${typeof cost.input_token_cost_per_million_tokens === 'number' ? cost.input_token_cost_per_million_tokens.toFixed(6) : '0.000000'}</td>
+                    <td class="output-cost">$${typeof cost.output_token_cost_per_million_tokens === 'number' ? cost.output_token_cost_per_million_tokens.toFixed(6) : '0.000000'}</td>
+                    <td class="updated">${cost.updated_at ? new Date(cost.updated_at).toLocaleDateString() : 'Unknown'}</td>
+                    <td class="actions">
+                        <button class="btn btn-sm btn-primary" onclick="editAICost(${cost.id})">
+                            <i class="bi bi-pencil"></i>
+                        </button>
+                        <button class="btn btn-sm btn-danger" onclick="deleteAICost(${cost.id})">
+                            <i class="bi bi-trash"></i>
+                        </button>
+                    </td>
+                </tr>
+            `).join('');
+            
+            // Initialize or reinitialize list.js
+            if (aiCostsList) {
+                aiCostsList.reIndex();
+            } else {
+                // Initialize list.js for the first time
+                const options = {
+                    valueNames: ['vendor', 'model', 'input-cost', 'output-cost', 'updated'],
+                    page: 10, // Show 10 items per page
+                    pagination: true
+                };
+                
+                aiCostsList = new List('aiCostsList', options);
+                
+                // Update pagination styling after initialization
+                setTimeout(() => {
+                    updateListInfo();
+                    // Listen for search and pagination events
+                    aiCostsList.on('searchComplete', updateListInfo);
+                    aiCostsList.on('updated', updateListInfo);
+                }, 100);
+            }
+            
+            // Update the info display
+            updateListInfo();
+            
+        } else {
+            tbody.innerHTML = '<tr><td colspan="6" class="text-center">No AI costs configured</td></tr>';
+            if (aiCostsList) {
+                aiCostsList.clear();
+            }
+        }
+    } catch (error) {
+        console.error('Error loading AI costs:', error);
+        const tbody = document.querySelector('#aiCostsTable tbody');
+        if (tbody) {
+            tbody.innerHTML = '<tr><td colspan="6" class="text-center text-danger">Error loading AI costs</td></tr>';
+        }
+    }
+}
+
+function updateListInfo() {
+    if (aiCostsList) {
+        const showing = aiCostsList.visibleItems.length;
+        const total = aiCostsList.size();
+        
+        document.querySelector('.list-showing').textContent = showing;
+        document.querySelector('.list-total').textContent = total;
+    }
+}
+
+async function loadCreditStats() {
+    try {
+        const response = await fetch('/admin/api/credit_stats');
+        const data = await response.json();
+        
+        // Check if response contains error
+        if (data.error) {
+            console.error('API Error:', data.error);
+            document.getElementById('totalCredits').textContent = 'Error loading';
+            document.getElementById('avgCredits').textContent = 'Error loading';
+            document.getElementById('weeklyCreditsAdded').textContent = 'Error loading';
+            return;
+        }
+        
+        // Safely handle potentially undefined values
+        const totalCredits = typeof data.total_credits === 'number' ? data.total_credits : 0;
+        const avgCredits = typeof data.avg_credits === 'number' ? data.avg_credits : 0;
+        const userCount = typeof data.user_count === 'number' ? data.user_count : 0;
+        
+        document.getElementById('totalCredits').textContent = `${Math.round(totalCredits)}`;
+        document.getElementById('avgCredits').textContent = `${Math.round(avgCredits)}`;
+        document.getElementById('weeklyCreditsAdded').textContent = `${userCount * 5}`;
+        
+        // Load cost charts if available
+        if (data.cost_by_type && typeof data.cost_by_type === 'object') {
+            renderCostByTypeChart(data.cost_by_type);
+        }
+        if (data.cost_by_vendor && typeof data.cost_by_vendor === 'object') {
+            renderCostByVendorChart(data.cost_by_vendor);
+        }
+        
+    } catch (error) {
+        console.error('Error loading credit stats:', error);
+        document.getElementById('totalCredits').textContent = 'Error loading';
+        document.getElementById('avgCredits').textContent = 'Error loading';
+        document.getElementById('weeklyCreditsAdded').textContent = 'Error loading';
+    }
+}
+
+// Compute cost form submission
+document.getElementById('computeCostForm')?.addEventListener('submit', async (e) => {
+    e.preventDefault();
+    
+    const costPerSecond = document.getElementById('computeCostPerSecond').value;
+    
+    try {
+        const response = await fetch('/admin/api/compute_cost', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({cost_per_second: parseFloat(costPerSecond)})
+        });
+        
+        const data = await response.json();
+        if (data.success) {
+            showToast('Compute cost updated successfully', 'success');
+        } else {
+            showToast('Failed to update compute cost: ' + (data.error || 'Unknown error'), 'danger');
+        }
+    } catch (error) {
+        console.error('Error updating compute cost:', error);
+        showToast('Error updating compute cost', 'danger');
+    }
+});
+
+async function updateOpenAIPricing() {
+    const btn = event.target;
+    btn.disabled = true;
+    btn.innerHTML = '<i class="bi bi-arrow-clockwise spinner-border spinner-border-sm"></i> Updating...';
+    
+    try {
+        const response = await fetch('/admin/api/update_openai_pricing', {
+            method: 'POST'
+        });
+        
+        const data = await response.json();
+        if (data.success) {
+            showToast('OpenAI pricing updated successfully', 'success');
+            loadAICosts(); // Reload the table
+        } else {
+            showToast('Failed to update pricing: ' + (data.error || 'Unknown error'), 'danger');
+        }
+    } catch (error) {
+        console.error('Error updating OpenAI pricing:', error);
+        showToast('Error updating OpenAI pricing', 'danger');
+    } finally {
+        btn.disabled = false;
+        btn.innerHTML = '<i class="bi bi-arrow-clockwise"></i> Update OpenAI Pricing';
+    }
+}
+
+async function addWeeklyCredits() {
+    if (!confirm('Add $5.00 credits to all active users?')) {
+        return;
+    }
+    
+    try {
+        const response = await fetch('/admin/api/add_weekly_credits', {
+            method: 'POST'
+        });
+        
+        const data = await response.json();
+        if (data.success) {
+            showToast(`Added 5 credits to ${data.users_updated} users`, 'success');
+            loadCreditStats(); // Reload stats
+            loadUsers(currentPage); // Reload user list
+        } else {
+            showToast('Failed to add credits: ' + (data.error || 'Unknown error'), 'danger');
+        }
+    } catch (error) {
+        console.error('Error adding weekly credits:', error);
+        showToast('Error adding weekly credits', 'danger');
+    }
+}
+
+async function deleteAICost(id) {
+    if (!confirm('Are you sure you want to delete this AI model cost?')) {
+        return;
+    }
+    
+    try {
+        const response = await fetch(`/admin/api/ai_costs/${id}`, {
+            method: 'DELETE'
+        });
+        
+        const data = await response.json();
+        if (data.success) {
+            showToast('AI model cost deleted successfully', 'success');
+            loadAICosts(); // Reload the table
+        } else {
+            showToast('Failed to delete AI model cost: ' + (data.error || 'Unknown error'), 'danger');
+        }
+    } catch (error) {
+        console.error('Error deleting AI model cost:', error);
+        showToast('Error deleting AI model cost', 'danger');
+    }
+}
+
+function openAddAICostModal() {
+    // Reset the form for new entry
+    document.getElementById('aiCostForm').reset();
+    document.getElementById('aiCostId').value = '';
+    
+    // Show the modal
+    const modal = new bootstrap.Modal(document.getElementById('addAICostModal'));
+    modal.show();
+}
+
+async function editAICost(id) {
+    try {
+        const response = await fetch(`/admin/api/ai_costs/${id}`);
+        const data = await response.json();
+        
+        if (data.cost) {
+            // Populate the form with existing data
+            document.getElementById('aiCostId').value = data.cost.id;
+            document.getElementById('aiVendor').value = data.cost.vendor || '';
+            document.getElementById('aiModel').value = data.cost.model || '';
+            document.getElementById('inputCost').value = data.cost.input_token_cost_per_million_tokens || 0;
+            document.getElementById('outputCost').value = data.cost.output_token_cost_per_million_tokens || 0;
+            
+            // Show the modal
+            const modal = new bootstrap.Modal(document.getElementById('addAICostModal'));
+            modal.show();
+        } else {
+            showToast('Failed to load AI model cost details', 'danger');
+        }
+    } catch (error) {
+        console.error('Error loading AI model cost:', error);
+        showToast('Error loading AI model cost details', 'danger');
+    }
+}
+
+async function saveAICost() {
+    const id = document.getElementById('aiCostId').value;
+    const vendor = document.getElementById('aiVendor').value;
+    const model = document.getElementById('aiModel').value;
+    const inputCost = parseFloat(document.getElementById('inputCost').value);
+    const outputCost = parseFloat(document.getElementById('outputCost').value);
+    
+    if (!vendor || !model || isNaN(inputCost) || isNaN(outputCost)) {
+        showToast('Please fill in all fields with valid values', 'danger');
+        return;
+    }
+    
+    try {
+        const method = id ? 'PUT' : 'POST';
+        const url = id ? `/admin/api/ai_costs/${id}` : '/admin/api/ai_costs';
+        
+        const response = await fetch(url, {
+            method: method,
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({
+                vendor: vendor,
+                model: model,
+                input_token_cost_per_million_tokens: inputCost,
+                output_token_cost_per_million_tokens: outputCost
+            })
+        });
+        
+        const data = await response.json();
+        if (data.success) {
+            showToast(`AI model cost ${id ? 'updated' : 'created'} successfully`, 'success');
+            
+            // Hide the modal
+            const modal = bootstrap.Modal.getInstance(document.getElementById('addAICostModal'));
+            modal.hide();
+            
+            // Reset the form
+            document.getElementById('aiCostForm').reset();
+            document.getElementById('aiCostId').value = '';
+            
+            // Reload the table
+            loadAICosts();
+        } else {
+            showToast(`Failed to ${id ? 'update' : 'create'} AI model cost: ` + (data.error || 'Unknown error'), 'danger');
+        }
+    } catch (error) {
+        console.error('Error saving AI model cost:', error);
+        showToast('Error saving AI model cost', 'danger');
+    }
+}
+
+function renderCostByTypeChart(data) {
+    const ctx = document.getElementById('costByTypeChart').getContext('2d');
+    new Chart(ctx, {
+        type: 'doughnut',
+        data: {
+            labels: Object.keys(data),
+            datasets: [{
+                data: Object.values(data),
+                backgroundColor: [
+                    '#007bff',
+                    '#28a745',
+                    '#ffc107',
+                    '#dc3545'
+                ]
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                title: {
+                    display: true,
+                    text: 'Costs by Type'
+                }
+            }
+        }
+    });
+}
+
+function renderCostByVendorChart(data) {
+    const ctx = document.getElementById('costByVendorChart').getContext('2d');
+    new Chart(ctx, {
+        type: 'bar',
+        data: {
+            labels: Object.keys(data),
+            datasets: [{
+                label: 'Total Cost ($)',
+                data: Object.values(data),
+                backgroundColor: '#007bff'
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                title: {
+                    display: true,
+                    text: 'Costs by AI Vendor'
+                }
+            }
+        }
+    });
+}
+
+// Stripe Configuration Functions
+async function loadStripeConfig() {
+    try {
+        const response = await fetch('/admin/api/stripe_config');
+        const result = await response.json();
+        
+        if (result.success && result.config) {
+            // Set current mode
+            const currentMode = result.config.mode || 'test';
+            document.querySelector(`input[name="stripeMode"][value="${currentMode}"]`).checked = true;
+            
+            // Don't populate input fields with truncated previews - leave them empty
+            // Users must enter complete keys manually to avoid saving truncated versions
+            
+            // Clear all input fields to prevent accidental saving of truncated keys
+            document.getElementById('testPublishableKey').value = '';
+            document.getElementById('testSecretKey').value = '';
+            document.getElementById('testWebhookSecret').value = '';
+            document.getElementById('livePublishableKey').value = '';
+            document.getElementById('liveSecretKey').value = '';
+            document.getElementById('liveWebhookSecret').value = '';
+            
+            // Update key visibility status based on whether keys exist
+            updateStripeKeyStatus('testPublishableKey', result.config.test.has_publishable_key);
+            updateStripeKeyStatus('testSecretKey', result.config.test.has_secret_key);
+            updateStripeKeyStatus('testWebhookSecret', result.config.test.has_webhook_secret);
+            
+            // Update key visibility status for live keys
+            updateStripeKeyStatus('livePublishableKey', result.config.live.has_publishable_key);
+            updateStripeKeyStatus('liveSecretKey', result.config.live.has_secret_key);
+            updateStripeKeyStatus('liveWebhookSecret', result.config.live.has_webhook_secret);
+            
+            // Add placeholder text to indicate keys are configured but hidden for security
+            if (result.config.test.has_publishable_key) {
+                document.getElementById('testPublishableKey').placeholder = 'Key configured - enter new key to update';
+            }
+            if (result.config.test.has_secret_key) {
+                document.getElementById('testSecretKey').placeholder = 'Key configured - enter new key to update';
+            }
+            if (result.config.test.has_webhook_secret) {
+                document.getElementById('testWebhookSecret').placeholder = 'Key configured - enter new key to update';
+            }
+            if (result.config.live.has_publishable_key) {
+                document.getElementById('livePublishableKey').placeholder = 'Key configured - enter new key to update';
+            }
+            if (result.config.live.has_secret_key) {
+                document.getElementById('liveSecretKey').placeholder = 'Key configured - enter new key to update';
+            }
+            if (result.config.live.has_webhook_secret) {
+                document.getElementById('liveWebhookSecret').placeholder = 'Key configured - enter new key to update';
+            }
+            
+            // Update mode indicator
+            updateModeIndicator(currentMode);
+        }
+    } catch (error) {
+        console.error('Error loading Stripe config:', error);
+        showToast('Error loading Stripe configuration', 'danger');
+    }
+}
+
+function updateStripeKeyStatus(fieldId, value) {
+    const field = document.getElementById(fieldId);
+    const statusIcon = field.parentElement.querySelector('.input-group-text i');
+    
+    if (value) {
+        // Key is set
+        field.classList.remove('is-invalid');
+        field.classList.add('is-valid');
+        if (statusIcon) {
+            statusIcon.className = 'bi bi-check-circle text-success';
+        }
+    } else {
+        // Key is not set
+        field.classList.remove('is-valid');
+        field.classList.add('is-invalid');
+        if (statusIcon) {
+            statusIcon.className = 'bi bi-x-circle text-danger';
+        }
+    }
+}
+
+function updateModeIndicator(mode) {
+    // Get current configuration via API to update status badges
+    fetch('/admin/api/stripe_config')
+        .then(response => response.json())
+        .then(result => {
+            if (result.success && result.config) {
+                // Update live status badge
+                const liveStatus = document.getElementById('liveStatus');
+                const liveIsConfigured = result.config.live.has_publishable_key && 
+                                       result.config.live.has_secret_key && 
+                                       result.config.live.has_webhook_secret;
+                
+                if (liveIsConfigured) {
+                    liveStatus.textContent = 'Configured';
+                    liveStatus.className = 'badge bg-success ms-2';
+                } else {
+                    liveStatus.textContent = 'Not Configured';
+                    liveStatus.className = 'badge bg-light text-danger ms-2';
+                }
+                
+                // Update test status badge
+                const testStatus = document.getElementById('testStatus');
+                const testIsConfigured = result.config.test.has_publishable_key && 
+                                        result.config.test.has_secret_key && 
+                                        result.config.test.has_webhook_secret;
+                
+                if (testIsConfigured) {
+                    testStatus.textContent = 'Configured';
+                    testStatus.className = 'badge bg-success ms-2';
+                } else {
+                    testStatus.textContent = 'Not Configured';
+                    testStatus.className = 'badge bg-light text-warning ms-2';
+                }
+                
+                // Update mode display
+                const currentMode = result.config.mode || 'test';
+                const modeText = currentMode === 'live' ? 'LIVE' : 'TEST';
+                console.log(`Stripe mode indicator updated: ${modeText} mode`);
+            }
+        })
+        .catch(error => {
+            console.error('Error updating mode indicator:', error);
+        });
+}
+
+function toggleKeyVisibility(fieldId) {
+    const field = document.getElementById(fieldId);
+    const button = field.parentElement.querySelector('button');
+    const icon = button.querySelector('i');
+    
+    if (field.type === 'password') {
+        field.type = 'text';
+        icon.className = 'bi bi-eye-slash';
+    } else {
+        field.type = 'password';
+        icon.className = 'bi bi-eye';
+    }
+}
+
+
+// Add event listeners for mode changes
+document.addEventListener('DOMContentLoaded', function() {
+    // Listen for mode changes - save to server immediately
+    document.querySelectorAll('input[name="stripeMode"]').forEach(radio => {
+        radio.addEventListener('change', async function() {
+            if (this.checked) {
+                const modeText = this.value === 'live' ? 'LIVE' : 'TEST';
+                console.log(`Stripe mode changed to: ${modeText}`);
+                
+                try {
+                    const response = await fetch('/admin/api/stripe_config', {
+                        method: 'POST',
+                        headers: {
+                            'Content-Type': 'application/json',
+                        },
+                        body: JSON.stringify({
+                            mode: this.value
+                        })
+                    });
+                    
+                    const result = await response.json();
+                    
+                    if (result.success) {
+                        showToast(`Stripe mode updated to ${modeText}`, 'success');
+                        updateModeIndicator(this.value);
+                    } else {
+                        showToast('Error: ' + (result.error || 'Failed to update Stripe mode'), 'danger');
+                        // Revert the radio button
+                        loadStripeConfig();
+                    }
+                } catch (error) {
+                    console.error('Error updating Stripe mode:', error);
+                    showToast('Error updating Stripe mode: ' + error.message, 'danger');
+                    // Revert the radio button
+                    loadStripeConfig();
+                }
+            }
+        });
+    });
+});
+
+// Stripe configuration form submission
+document.getElementById('stripeConfigForm')?.addEventListener('submit', async function(e) {
+    e.preventDefault();
+    
+    // Get selected mode
+    const selectedMode = document.querySelector('input[name="stripeMode"]:checked').value;
+    
+    // Get test keys
+    const testKeys = {
+        publishable_key: document.getElementById('testPublishableKey').value.trim(),
+        secret_key: document.getElementById('testSecretKey').value.trim(),
+        webhook_secret: document.getElementById('testWebhookSecret').value.trim()
+    };
+    
+    // Get live keys
+    const liveKeys = {
+        publishable_key: document.getElementById('livePublishableKey').value.trim(),
+        secret_key: document.getElementById('liveSecretKey').value.trim(),
+        webhook_secret: document.getElementById('liveWebhookSecret').value.trim()
+    };
+    
+    // Check if at least one key is provided
+    const hasTestKeys = testKeys.publishable_key || testKeys.secret_key || testKeys.webhook_secret;
+    const hasLiveKeys = liveKeys.publishable_key || liveKeys.secret_key || liveKeys.webhook_secret;
+    
+    if (!hasTestKeys && !hasLiveKeys) {
+        showToast('Please provide at least one Stripe API key to update the configuration', 'warning');
+        return;
+    }
+    
+    // Validate test keys format
+    if (testKeys.publishable_key && !testKeys.publishable_key.startsWith('pk_test_')) {
+        showToast('Invalid test publishable key format. Must start with pk_test_', 'danger');
+        return;
+    }
+    
+    if (testKeys.secret_key && !testKeys.secret_key.startsWith('sk_test_')) {
+        showToast('Invalid test secret key format. Must start with sk_test_', 'danger');
+        return;
+    }
+    
+    if (testKeys.webhook_secret && !testKeys.webhook_secret.startsWith('whsec_')) {
+        showToast('Invalid test webhook secret format. Must start with whsec_', 'danger');
+        return;
+    }
+    
+    // Validate live keys format
+    if (liveKeys.publishable_key && !liveKeys.publishable_key.startsWith('pk_live_')) {
+        showToast('Invalid live publishable key format. Must start with pk_live_', 'danger');
+        return;
+    }
+    
+    if (liveKeys.secret_key && !liveKeys.secret_key.startsWith('sk_live_')) {
+        showToast('Invalid live secret key format. Must start with sk_live_', 'danger');
+        return;
+    }
+    
+    if (liveKeys.webhook_secret && !liveKeys.webhook_secret.startsWith('whsec_')) {
+        showToast('Invalid live webhook secret format. Must start with whsec_', 'danger');
+        return;
+    }
+    
+    const data = {
+        mode: selectedMode,
+        test_keys: testKeys,
+        live_keys: liveKeys
+    };
+    
+    try {
+        const response = await fetch('/admin/api/stripe_config', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify(data)
+        });
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            const modeText = selectedMode === 'live' ? 'LIVE' : 'TEST';
+            const message = result.message || `Stripe configuration updated successfully (${modeText} mode)`;
+            showToast(message, 'success');
+            
+            // Update field status indicators for test keys
+            updateStripeKeyStatus('testPublishableKey', testKeys.publishable_key);
+            updateStripeKeyStatus('testSecretKey', testKeys.secret_key);
+            updateStripeKeyStatus('testWebhookSecret', testKeys.webhook_secret);
+            
+            // Update field status indicators for live keys
+            updateStripeKeyStatus('livePublishableKey', liveKeys.publishable_key);
+            updateStripeKeyStatus('liveSecretKey', liveKeys.secret_key);
+            updateStripeKeyStatus('liveWebhookSecret', liveKeys.webhook_secret);
+            
+            // Update mode indicator
+            updateModeIndicator(selectedMode);
+        } else {
+            showToast('Error: ' + (result.error || 'Failed to update Stripe configuration'), 'danger');
+        }
+    } catch (error) {
+        console.error('Error updating Stripe config:', error);
+        showToast('Error: ' + error.message, 'danger');
+    }
+});
+
+// Load data when settings tab is shown
+document.addEventListener('DOMContentLoaded', function() {
+    // Load service settings when settings tab is shown
+    // Note: loadSystemMessages is already called in the other settings-tab listener
+    
+    // Load cost settings when costs tab is shown
+    document.getElementById('costs-tab').addEventListener('shown.bs.tab', function() {
+        loadCostSettings();
+    });
+    
+    // Set default dates for new messages (start: now, end: 1 week from now)
+    const now = new Date();
+    const nextWeek = new Date(now.getTime() + 7 * 24 * 60 * 60 * 1000);
+    
+    // Format for datetime-local input
+    const formatForInput = (date) => {
+        const year = date.getFullYear();
+        const month = String(date.getMonth() + 1).padStart(2, '0');
+        const day = String(date.getDate()).padStart(2, '0');
+        const hours = String(date.getHours()).padStart(2, '0');
+        const minutes = String(date.getMinutes()).padStart(2, '0');
+        return `${year}-${month}-${day}T${hours}:${minutes}`;
+    };
+    
+    document.getElementById('systemMessageStartDate').value = formatForInput(now);
+    document.getElementById('systemMessageEndDate').value = formatForInput(nextWeek);
+});
+
+// Dynamic tab loading
+const loadedTabs = new Set();
+
+// Debug function to force reload a tab
+window.forceReloadTab = function(tabId) {
+    console.log(`Force reloading tab: ${tabId}`);
+    loadedTabs.delete(tabId);
+    const contentDiv = document.getElementById(tabId + 'Content');
+    if (contentDiv) {
+        contentDiv.innerHTML = '<div class="text-center py-5"><div class="spinner-border text-primary" role="status"><span class="visually-hidden">Loading...</span></div><p class="mt-2">Loading...</p></div>';
+    }
+    
+    const urls = {
+        'logs': '/admin/templates/logs',
+        'sql': '/admin/templates/sql', 
+        'status': '/admin/templates/system-status'
+    };
+    
+    if (urls[tabId]) {
+        loadTabContent(tabId, urls[tabId]);
+    }
+};
+
+// Debug function to check tab visibility
+window.debugTabVisibility = function(tabId) {
+    const tabPane = document.getElementById(tabId);
+    const contentDiv = document.getElementById(tabId + 'Content');
+    const tabButton = document.getElementById(tabId + '-tab');
+    
+    console.log(`=== Tab Visibility Debug for: ${tabId} ===`);
+    console.log('Tab pane:', tabPane);
+    console.log('Tab pane classes:', tabPane ? tabPane.className : 'NOT FOUND');
+    console.log('Tab pane style.display:', tabPane ? tabPane.style.display : 'NOT FOUND');
+    console.log('Tab pane computed style:', tabPane ? window.getComputedStyle(tabPane).display : 'NOT FOUND');
+    console.log('Content div:', contentDiv);
+    console.log('Content div innerHTML length:', contentDiv ? contentDiv.innerHTML.length : 'NOT FOUND');
+    console.log('Content div visible:', contentDiv ? contentDiv.offsetParent !== null : 'NOT FOUND');
+    
+    if (contentDiv) {
+        const computedStyle = window.getComputedStyle(contentDiv);
+        console.log('Content div computed styles:');
+        console.log('  display:', computedStyle.display);
+        console.log('  visibility:', computedStyle.visibility);
+        console.log('  opacity:', computedStyle.opacity);
+        console.log('  height:', computedStyle.height);
+        console.log('  overflow:', computedStyle.overflow);
+        console.log('  position:', computedStyle.position);
+        console.log('Content div bounding rect:', contentDiv.getBoundingClientRect());
+    }
+    
+    console.log('Tab button:', tabButton);
+    console.log('Tab button classes:', tabButton ? tabButton.className : 'NOT FOUND');
+    console.log('Tab button aria-selected:', tabButton ? tabButton.getAttribute('aria-selected') : 'NOT FOUND');
+    
+    // Check if Bootstrap tab is actually active
+    const activeTab = document.querySelector('#adminTabs .nav-link.active');
+    console.log('Currently active tab:', activeTab ? activeTab.id : 'NONE');
+    
+    return {
+        tabPane,
+        contentDiv,
+        tabButton,
+        isVisible: tabPane ? tabPane.offsetParent !== null : false,
+        hasContent: contentDiv ? contentDiv.innerHTML.length > 100 : false
+    };
+};
+
+// Quick fix function to try making content visible
+window.fixTabVisibility = function(tabId) {
+    const contentDiv = document.getElementById(tabId + 'Content');
+    if (contentDiv) {
+        console.log(`Attempting to fix visibility for: ${tabId}`);
+        contentDiv.style.display = 'block';
+        contentDiv.style.visibility = 'visible';
+        contentDiv.style.opacity = '1';
+        contentDiv.style.height = 'auto';
+        console.log('Applied visibility fixes');
+        return debugTabVisibility(tabId);
+    }
+};
+
+// Debug CSS styles for logs specifically
+window.debugLogsCSS = function() {
+    const logContainer = document.getElementById('logContainer');
+    const logsContent = document.getElementById('logsContent');
+    const logsTabPane = document.getElementById('logs');
+    
+    console.log('=== CSS Debug for Logs ===');
+    
+    if (logContainer) {
+        const style = window.getComputedStyle(logContainer);
+        console.log('logContainer computed styles:');
+        console.log('  display:', style.display);
+        console.log('  visibility:', style.visibility);
+        console.log('  opacity:', style.opacity);
+        console.log('  height:', style.height);
+        console.log('  background-color:', style.backgroundColor);
+        console.log('  color:', style.color);
+        console.log('  z-index:', style.zIndex);
+        console.log('  position:', style.position);
+        console.log('  overflow:', style.overflow);
+        console.log('  innerHTML length:', logContainer.innerHTML.length);
+        console.log('  scrollHeight:', logContainer.scrollHeight);
+        console.log('  clientHeight:', logContainer.clientHeight);
+        console.log('  children count:', logContainer.children.length);
+        
+        // Check if any log lines exist
+        const logLines = logContainer.querySelectorAll('.log-line');
+        console.log('  log-line elements:', logLines.length);
+        if (logLines.length > 0) {
+            const firstLine = logLines[0];
+            const lineStyle = window.getComputedStyle(firstLine);
+            console.log('  first log-line styles:');
+            console.log('    display:', lineStyle.display);
+            console.log('    visibility:', lineStyle.visibility);
+            console.log('    color:', lineStyle.color);
+            console.log('    innerHTML:', firstLine.innerHTML);
+        }
+    }
+    
+    if (logsContent) {
+        const style = window.getComputedStyle(logsContent);
+        console.log('logsContent computed styles:');
+        console.log('  display:', style.display);
+        console.log('  visibility:', style.visibility);
+        console.log('  opacity:', style.opacity);
+    }
+    
+    if (logsTabPane) {
+        const style = window.getComputedStyle(logsTabPane);
+        console.log('logs tab pane computed styles:');
+        console.log('  display:', style.display);
+        console.log('  visibility:', style.visibility);
+        console.log('  opacity:', style.opacity);
+    }
+};
+
+// Force fix logs visibility with contrast
+window.forceFixLogs = function() {
+    const logContainer = document.getElementById('logContainer');
+    if (logContainer) {
+        // Force visibility and contrast
+        logContainer.style.display = 'block';
+        logContainer.style.visibility = 'visible';
+        logContainer.style.opacity = '1';
+        logContainer.style.backgroundColor = '#000000';  // Black background
+        logContainer.style.color = '#ffffff';            // White text
+        logContainer.style.border = '2px solid red';     // Debug border
+        logContainer.style.minHeight = '200px';
+        logContainer.style.padding = '10px';
+        
+        // Force all log lines to be visible
+        const logLines = logContainer.querySelectorAll('.log-line');
+        logLines.forEach(line => {
+            line.style.display = 'block';
+            line.style.visibility = 'visible';
+            line.style.color = '#ffffff';
+            line.style.backgroundColor = '#333333';
+            line.style.padding = '5px';
+            line.style.margin = '2px 0';
+            line.style.border = '1px solid yellow';  // Debug border
+        });
+        
+        console.log('Applied force fix to logs with', logLines.length, 'lines');
+        return logContainer;
+    }
+};
+
+// Simple test to show something in the logs tab
+window.testLogsTab = function() {
+    const logsContent = document.getElementById('logsContent');
+    if (logsContent) {
+        logsContent.innerHTML = `
+            <div style="background: red; color: white; padding: 20px; border: 5px solid yellow; font-size: 20px; font-weight: bold;">
+                TEST: If you can see this, the tab loading works!
+                <br>Current time: ${new Date().toLocaleString()}
+                <br>Tab is visible and functional.
+            </div>
+        `;
+        console.log('Test content added to logsContent');
+        return true;
+    } else {
+        console.error('logsContent div not found');
+        return false;
+    }
+};
+
+// Full DOM structure debugging
+window.debugTabStructure = function() {
+    console.log('=== Full Tab Structure Debug ===');
+    
+    const logsTab = document.getElementById('logs');
+    const logsContent = document.getElementById('logsContent');
+    const logContainer = document.getElementById('logContainer');
+    const adminTabs = document.getElementById('adminTabs');
+    
+    console.log('Admin tabs container:', adminTabs);
+    console.log('Logs tab pane:', logsTab);
+    console.log('Logs content div:', logsContent);
+    console.log('Log container:', logContainer);
+    
+    if (logsTab) {
+        console.log('Logs tab pane HTML length:', logsTab.innerHTML.length);
+        console.log('Logs tab pane classes:', logsTab.className);
+        console.log('Logs tab pane offsetHeight:', logsTab.offsetHeight);
+        console.log('Logs tab pane scrollHeight:', logsTab.scrollHeight);
+        
+        // Check if tab pane is actually visible
+        const rect = logsTab.getBoundingClientRect();
+        console.log('Logs tab pane bounding rect:', rect);
+        console.log('Logs tab pane on screen:', rect.width > 0 && rect.height > 0);
+    }
+    
+    if (logsContent) {
+        console.log('Logs content HTML length:', logsContent.innerHTML.length);
+        console.log('Logs content offsetHeight:', logsContent.offsetHeight);
+        console.log('Logs content scrollHeight:', logsContent.scrollHeight);
+        
+        const rect = logsContent.getBoundingClientRect();
+        console.log('Logs content bounding rect:', rect);
+        console.log('Logs content on screen:', rect.width > 0 && rect.height > 0);
+    }
+    
+    // Check what's currently active
+    const activeTab = document.querySelector('#adminTabs .nav-link.active');
+    const activePane = document.querySelector('.tab-pane.active.show');
+    
+    console.log('Currently active tab button:', activeTab ? activeTab.id : 'none');
+    console.log('Currently active tab pane:', activePane ? activePane.id : 'none');
+};
+
+function loadTabContent(tabId, templateUrl) {
+    console.log(`Loading tab content for: ${tabId} from ${templateUrl}`);
+    
+    const contentDivId = tabId + 'Content';
+    const contentDiv = document.getElementById(contentDivId);
+    
+    // Check if already loaded AND content still exists
+    if (loadedTabs.has(tabId) && contentDiv && contentDiv.innerHTML.includes('card')) {
+        console.log(`Tab ${tabId} already loaded and content exists, skipping`);
+        // Make sure the tab pane is visible
+        ensureTabPaneVisible(tabId);
+        // Trigger initialization for already loaded content
+        setTimeout(() => {
+            initializeTabContent(tabId);
+        }, 100);
+        return;
+    }
+    
+    if (loadedTabs.has(tabId)) {
+        console.log(`Tab ${tabId} was marked as loaded but content missing, reloading...`);
+        loadedTabs.delete(tabId); // Remove from loaded set so we can reload
+    }
+    
+    console.log(`Looking for content div: ${contentDivId}`, contentDiv);
+    
+    if (!contentDiv) {
+        console.error('Content div not found for tab:', tabId, 'Expected ID:', contentDivId);
+        return;
+    }
+    
+    console.log(`Fetching template from: ${templateUrl}`);
+    fetch(templateUrl)
+        .then(response => {
+            console.log(`Fetch response for ${tabId}:`, response.status, response.statusText);
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+            }
+            return response.text();
+        })
+        .then(html => {
+            console.log(`Template HTML received for ${tabId}, length:`, html.length);
+            console.log(`HTML preview:`, html.substring(0, 200) + '...');
+            contentDiv.innerHTML = html;
+            loadedTabs.add(tabId);
+            console.log(`Tab ${tabId} loaded successfully and marked as loaded`);
+            
+            // Ensure tab pane is visible
+            ensureTabPaneVisible(tabId);
+            
+            // Initialize the loaded content after ensuring visibility
+            setTimeout(() => {
+                initializeTabContent(tabId);
+            }, 200);
+        })
+        .catch(error => {
+            console.error(`Error loading tab ${tabId}:`, error);
+            contentDiv.innerHTML = `
+                <div class="alert alert-danger">
+                    <i class="bi bi-exclamation-triangle"></i>
+                    <strong>Error loading content:</strong> ${error.message}
+                    <br><small>Tab: ${tabId}, URL: ${templateUrl}</small>
+                </div>
+            `;
+        });
+}
+
+// Ensure the Bootstrap tab pane is visible
+function ensureTabPaneVisible(tabId) {
+    const tabPane = document.getElementById(tabId);
+    if (tabPane) {
+        // Make sure the tab pane has the right classes to be visible
+        if (!tabPane.classList.contains('show')) {
+            console.log(`Making tab pane ${tabId} visible`);
+            tabPane.classList.add('show', 'active');
+        }
+        
+        // Also ensure the parent tab content container is visible
+        const tabContent = tabPane.closest('.tab-content');
+        if (tabContent) {
+            tabContent.style.display = 'block';
+        }
+        
+        console.log(`Tab pane ${tabId} classes:`, tabPane.className);
+        console.log(`Tab pane ${tabId} computed display:`, window.getComputedStyle(tabPane).display);
+    } else {
+        console.error(`Tab pane with ID '${tabId}' not found`);
+    }
+}
+
+// Initialize tab-specific functionality after content is loaded
+function initializeTabContent(tabId) {
+    console.log(`Initializing content for tab: ${tabId}`);
+    
+    try {
+        switch(tabId) {
+            case 'logs':
+                // Initialize logs functionality
+                console.log('Checking for logs initialization functions...');
+                if (typeof window.initializeLogs === 'function') {
+                    console.log('Calling window.initializeLogs()');
+                    window.initializeLogs();
+                } else if (typeof window.loadLogs === 'function') {
+                    console.log('Calling window.loadLogs()');
+                    window.loadLogs();
+                } else {
+                    console.log('No logs initialization function found, trying direct call...');
+                    // Try to trigger the logs script initialization manually
+                    const scripts = document.querySelectorAll('#logsContent script');
+                    if (scripts.length > 0) {
+                        console.log(`Found ${scripts.length} script(s) in logs content, executing...`);
+                        scripts.forEach((script, index) => {
+                            try {
+                                eval(script.textContent);
+                                console.log(`Executed script ${index + 1}`);
+                            } catch (e) {
+                                console.warn(`Error executing script ${index + 1}:`, e);
+                            }
+                        });
+                    }
+                }
+                break;
+            case 'sql':
+                // Initialize SQL functionality
+                console.log('Checking for SQL initialization functions...');
+                if (typeof window.loadSQLTab === 'function') {
+                    console.log('Calling window.loadSQLTab()');
+                    window.loadSQLTab();
+                } else {
+                    console.log('loadSQLTab function not found');
+                }
+                break;
+            case 'status':
+                // Initialize system status functionality
+                console.log('Checking for status initialization functions...');
+                if (typeof window.loadSystemStatus === 'function') {
+                    console.log('Calling window.loadSystemStatus()');
+                    window.loadSystemStatus();
+                } else {
+                    console.log('loadSystemStatus function not found');
+                }
+                break;
+        }
+    } catch (error) {
+        console.error(`Error initializing ${tabId} tab:`, error);
+    }
+}
+
+// Templates tab redirect - we moved template editor to dedicated page
+// Handle templates hash redirect
+if (window.location.hash === '#templates') {
+    // Redirect to dedicated templates page
+    window.location.href = '/admin/templates';
+}
+
+
+// Tab event listeners
+document.addEventListener('DOMContentLoaded', function() {
+    console.log('DOM loaded, setting up dynamic tab loading...');
+    
+    // Add event listeners for the three problematic tabs
+    const tabButtons = {
+        'logs-tab': { tabId: 'logs', url: '/admin/templates/logs' },
+        'sql-tab': { tabId: 'sql', url: '/admin/templates/sql' },
+        'status-tab': { tabId: 'status', url: '/admin/templates/system-status' }
+    };
+    
+    console.log('Tab button configuration:', tabButtons);
+    
+    Object.keys(tabButtons).forEach(buttonId => {
+        const button = document.getElementById(buttonId);
+        console.log(`Checking for button: ${buttonId}`, button);
+        
+        if (button) {
+            // Only use the shown.bs.tab event - this is the proper Bootstrap event
+            button.addEventListener('shown.bs.tab', function(event) {
+                console.log(`Tab event fired for: ${buttonId}`, event);
+                const config = tabButtons[buttonId];
+                console.log(`Loading config:`, config);
+                loadTabContent(config.tabId, config.url);
+            });
+            
+            console.log(`Event listeners added for: ${buttonId}`);
+        } else {
+            console.warn(`Tab button ${buttonId} not found`);
+        }
+    });
+    
+    console.log('Dynamic tab loading initialized');
+});
@@ -0,0 +1,265 @@
+        document.addEventListener('DOMContentLoaded', function() {
+            // Get theme system elements
+            const themeSelectorBtn = document.getElementById('theme-selector-btn');
+            const themeDropdown = document.getElementById('theme-dropdown');
+            const lightModeToggle = document.getElementById('light-mode-toggle');
+            const darkModeToggle = document.getElementById('dark-mode-toggle');
+            const themeOptions = document.querySelectorAll('.theme-option');
+            
+            let currentColorTheme = 'default';
+            let currentMode = 'light';
+            
+            // Function to set color theme
+            function setColorTheme(colorTheme) {
+                currentColorTheme = colorTheme;
+                document.documentElement.setAttribute('data-theme', colorTheme);
+                localStorage.setItem('colorTheme', colorTheme);
+                
+                // Update active state in dropdown
+                themeOptions.forEach(option => {
+                    option.classList.remove('active');
+                    if (option.dataset.theme === colorTheme) {
+                        option.classList.add('active');
+                    }
+                });
+            }
+            
+            // Function to set light/dark mode
+            function setMode(mode) {
+                currentMode = mode;
+                document.documentElement.setAttribute('data-bs-theme', mode);
+                localStorage.setItem('mode', mode);
+                
+                // Show/hide appropriate toggle buttons
+                if (mode === 'dark') {
+                    lightModeToggle.style.display = 'block';
+                    darkModeToggle.style.display = 'none';
+                } else {
+                    lightModeToggle.style.display = 'none';
+                    darkModeToggle.style.display = 'block';
+                }
+            }
+            
+            // Initialize theme system
+            function initializeTheme() {
+                // Load saved color theme
+                const savedColorTheme = localStorage.getItem('colorTheme');
+                if (savedColorTheme) {
+                    setColorTheme(savedColorTheme);
+                } else {
+                    setColorTheme('default');
+                }
+                
+                // Load saved mode or detect system preference
+                const savedMode = localStorage.getItem('mode');
+                if (savedMode) {
+                    setMode(savedMode);
+                } else {
+                    const prefersDark = window.matchMedia && window.matchMedia('(prefers-color-scheme: dark)').matches;
+                    setMode(prefersDark ? 'dark' : 'light');
+                }
+            }
+            
+            // Theme selector dropdown toggle
+            themeSelectorBtn.addEventListener('click', function(e) {
+                e.stopPropagation();
+                themeDropdown.classList.toggle('show');
+            });
+            
+            // Close dropdown when clicking outside
+            document.addEventListener('click', function(e) {
+                if (!themeSelectorBtn.contains(e.target) && !themeDropdown.contains(e.target)) {
+                    themeDropdown.classList.remove('show');
+                }
+            });
+            
+            // Theme option selection
+            themeOptions.forEach(option => {
+                option.addEventListener('click', function(e) {
+                    e.stopPropagation();
+                    const selectedTheme = this.dataset.theme;
+                    setColorTheme(selectedTheme);
+                });
+            });
+            
+            // Light/dark mode toggles
+            lightModeToggle.addEventListener('click', (e) => {
+                e.stopPropagation();
+                setMode('light');
+            });
+            
+            darkModeToggle.addEventListener('click', (e) => {
+                e.stopPropagation();
+                setMode('dark');
+            });
+            
+            // Listen for changes in system preference
+            window.matchMedia('(prefers-color-scheme: dark)').addEventListener('change', e => {
+                if (!localStorage.getItem('mode')) {
+                    setMode(e.matches ? 'dark' : 'light');
+                }
+            });
+            
+            // Initialize the theme system
+            initializeTheme();
+        });
+        
+        // System Messages and Service Status
+        let serviceStatus = {
+            transcription_enabled: true,
+            video_generation_enabled: true,
+            translation_enabled: true
+        };
+        
+        // Function to load service status
+        function loadServiceStatus() {
+            fetch('/api/service_status')
+                .then(response => response.json())
+                .then(data => {
+                    serviceStatus = data;
+                    updateServiceButtons();
+                })
+                .catch(error => {
+                    console.error('Error loading service status:', error);
+                });
+        }
+        
+        // Function to update service buttons based on status
+        function updateServiceButtons() {
+            // Transcribe buttons
+            const transcribeButtons = document.querySelectorAll('[data-service="transcription"]');
+            transcribeButtons.forEach(btn => {
+                if (!serviceStatus.transcription_enabled) {
+                    btn.disabled = true;
+                    btn.title = 'Transcription service is temporarily disabled';
+                    if (btn.classList.contains('btn-primary')) {
+                        btn.classList.remove('btn-primary');
+                        btn.classList.add('btn-secondary');
+                    }
+                } else {
+                    btn.disabled = false;
+                    btn.title = '';
+                    if (btn.classList.contains('btn-secondary') && btn.dataset.originalClass) {
+                        btn.classList.remove('btn-secondary');
+                        btn.classList.add(btn.dataset.originalClass);
+                    }
+                }
+            });
+            
+            // Video generation buttons
+            const videoButtons = document.querySelectorAll('[data-service="video"]');
+            videoButtons.forEach(btn => {
+                if (!serviceStatus.video_generation_enabled) {
+                    btn.disabled = true;
+                    btn.title = 'Video generation service is temporarily disabled';
+                    if (btn.classList.contains('btn-primary')) {
+                        btn.classList.remove('btn-primary');
+                        btn.classList.add('btn-secondary');
+                    }
+                } else {
+                    btn.disabled = false;
+                    btn.title = '';
+                    if (btn.classList.contains('btn-secondary') && btn.dataset.originalClass) {
+                        btn.classList.remove('btn-secondary');
+                        btn.classList.add(btn.dataset.originalClass);
+                    }
+                }
+            });
+            
+            // Translation buttons
+            const translateButtons = document.querySelectorAll('[data-service="translation"]');
+            translateButtons.forEach(btn => {
+                if (!serviceStatus.translation_enabled) {
+                    btn.disabled = true;
+                    btn.title = 'Translation service is temporarily disabled';
+                    if (btn.classList.contains('btn-primary')) {
+                        btn.classList.remove('btn-primary');
+                        btn.classList.add('btn-secondary');
+                    }
+                } else {
+                    btn.disabled = false;
+                    btn.title = '';
+                    if (btn.classList.contains('btn-secondary') && btn.dataset.originalClass) {
+                        btn.classList.remove('btn-secondary');
+                        btn.classList.add(btn.dataset.originalClass);
+                    }
+                }
+            });
+        }
+        
+        // Function to load and display system messages
+        function loadSystemMessages() {
+            fetch('/api/system_messages')
+                .then(response => response.json())
+                .then(data => {
+                    if (data.messages && data.messages.length > 0) {
+                        displaySystemMessage(data.messages[0]); // Show first active message
+                    }
+                })
+                .catch(error => {
+                    console.error('Error loading system messages:', error);
+                });
+        }
+        
+        // Function to display system message
+        function displaySystemMessage(message) {
+            const cookieName = `system_message_dismissed_${message.id}`;
+            const isDismissed = getCookie(cookieName);
+            
+            if (!isDismissed) {
+                const banner = document.getElementById('system-message-banner');
+                const text = document.getElementById('system-message-text');
+                const dismissBtn = document.getElementById('dismiss-system-message');
+                
+                text.textContent = message.message;
+                banner.classList.remove('hide');
+                banner.classList.add('show');
+                document.body.classList.add('has-system-message');
+                
+                // Handle dismiss button
+                dismissBtn.onclick = function() {
+                    dismissSystemMessage(message.id);
+                };
+            }
+        }
+        
+        // Function to dismiss system message
+        function dismissSystemMessage(messageId) {
+            const cookieName = `system_message_dismissed_${messageId}`;
+            setCookie(cookieName, 'true', 30); // Remember for 30 days
+            
+            const banner = document.getElementById('system-message-banner');
+            banner.classList.remove('show');
+            banner.classList.add('hide');
+            document.body.classList.remove('has-system-message');
+        }
+        
+        // Cookie helper functions
+        function setCookie(name, value, days) {
+            const expires = new Date();
+            expires.setTime(expires.getTime() + (days * 24 * 60 * 60 * 1000));
+            document.cookie = `${name}=${value};expires=${expires.toUTCString()};path=/`;
+        }
+        
+        function getCookie(name) {
+            const nameEQ = name + "=";
+            const ca = document.cookie.split(';');
+            for (let i = 0; i < ca.length; i++) {
+                let c = ca[i];
+                while (c.charAt(0) === ' ') c = c.substring(1, c.length);
+                if (c.indexOf(nameEQ) === 0) return c.substring(nameEQ.length, c.length);
+            }
+            return null;
+        }
+        
+        // Initialize system on page load
+        document.addEventListener('DOMContentLoaded', function() {
+            loadServiceStatus();
+            loadSystemMessages();
+            
+            // Refresh service status every 30 seconds
+            setInterval(loadServiceStatus, 30000);
+            
+            // Refresh system messages every 5 minutes
+            setInterval(loadSystemMessages, 300000);
+        });
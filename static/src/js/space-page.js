@@ -0,0 +1,1185 @@
+    // Notes functionality
+    $(document).ready(function() {
+        // Simple toast function for notes (in case the main one isn't loaded yet)
+        function showToast(message, type = 'info') {
+            // Create toast element
+            const toastId = 'toast-' + Date.now();
+            const toastHtml = `
+                <div id="${toastId}" class="toast align-items-center text-white bg-${type === 'success' ? 'success' : type === 'danger' ? 'danger' : 'primary'} border-0" role="alert" aria-live="assertive" aria-atomic="true">
+                    <div class="d-flex">
+                        <div class="toast-body">
+                            ${message}
+                        </div>
+                        <button type="button" class="btn-close btn-close-white me-2 m-auto" data-bs-dismiss="toast" aria-label="Close"></button>
+                    </div>
+                </div>
+            `;
+            
+            // Add to container or create one
+            let container = document.getElementById('toast-container');
+            if (!container) {
+                container = document.createElement('div');
+                container.id = 'toast-container';
+                container.className = 'toast-container position-fixed bottom-0 end-0 p-3';
+                container.style.zIndex = '11';
+                document.body.appendChild(container);
+            }
+            
+            container.insertAdjacentHTML('beforeend', toastHtml);
+            
+            // Initialize and show toast
+            const toastElement = document.getElementById(toastId);
+            const toast = new bootstrap.Toast(toastElement);
+            toast.show();
+            
+            // Remove after hidden
+            toastElement.addEventListener('hidden.bs.toast', () => {
+                toastElement.remove();
+            });
+        }
+        
+        const spaceId = window.spaceId || SPACE_PAGE.spaceId;
+        let currentNoteId = null;
+        
+        // Function to get or create cookie ID
+        
+        // Initialize SummerNote
+        $('#note-editor').summernote({
+            placeholder: 'Write your notes here...',
+            tabsize: 2,
+            height: 300,
+            toolbar: [
+                ['style', ['style']],
+                ['font', ['bold', 'underline', 'clear']],
+                ['color', ['color']],
+                ['para', ['ul', 'ol', 'paragraph']],
+                ['table', ['table']],
+                ['insert', ['link', 'picture', 'video']],
+                ['view', ['fullscreen', 'codeview']]
+            ],
+            callbacks: {
+                onPaste: function(e) {
+                    const clipboardData = e.originalEvent.clipboardData;
+                    if (clipboardData && clipboardData.getData) {
+                        const pastedData = clipboardData.getData('Text');
+                        
+                        // Check if it's a YouTube URL
+                        const youtubeRegex = /^(?:https?:\/\/)?(?:www\.)?(?:youtube\.com\/watch\?v=|youtu\.be\/)([a-zA-Z0-9_-]{11})$/;
+                        const match = pastedData.trim().match(youtubeRegex);
+                        
+                        if (match) {
+                            e.preventDefault();
+                            const videoId = match[1];
+                            const embedHtml = `
+                                <div class="youtube-embed" style="margin-bottom: 1rem;">
+                                    <a href="https://www.youtube.com/watch?v=${videoId}" target="_blank">
+                                        <img src="https://img.youtube.com/vi/${videoId}/maxresdefault.jpg" 
+                                             alt="YouTube Video" 
+                                             style="max-width: 100%; height: auto; cursor: pointer;"
+                                             onerror="this.src='https://img.youtube.com/vi/${videoId}/hqdefault.jpg'">
+                                    </a>
+                                    <p><a href="https://www.youtube.com/watch?v=${videoId}" target="_blank">Watch on YouTube</a></p>
+                                </div>`;
+                            $('#note-editor').summernote('pasteHTML', embedHtml);
+                        }
+                    }
+                }
+            }
+        });
+        
+        // Load notes
+        function loadNotes() {
+            const cookieId = window.getCookieId();
+            window.bootstrapFetch('notes', `/api/spaces/${spaceId}/notes?cookie_id=${cookieId}`)
+                .then(response => response.json())
+                .then(data => {
+                    const container = document.getElementById('notes-container');
+                    if (data.notes && data.notes.length > 0) {
+                        let notesHtml = '';
+                        data.notes.forEach(note => {
+                            notesHtml += `
+                                <div class="note-item mb-3 p-3 border rounded" data-note-id="${note.id}">
+                                    <div class="note-content">${note.notes}</div>
+                                    <div class="note-meta mt-2 d-flex justify-content-between align-items-center">
+                                        <small class="text-muted">
+                                            by <strong>${note.author}</strong> • 
+                                            Last updated: ${new Date(note.updated_at).toLocaleString()}
+                                        </small>
+                                        ${note.can_edit ? `
+                                        <div>
+                                            <button class="btn btn-sm btn-outline-primary edit-note-btn" data-note-id="${note.id}" title="Edit note">
+                                                <i class="bi bi-pencil"></i>
+                                            </button>
+                                            <button class="btn btn-sm btn-outline-danger delete-note-btn" data-note-id="${note.id}" title="Delete note">
+                                                <i class="bi bi-trash"></i>
+                                            </button>
+                                        </div>` : ''}
+                                    </div>
+                                </div>`;
+                        });
+                        container.innerHTML = notesHtml;
+                        
+                        // Attach event listeners
+                        attachNoteEventListeners();
+                    } else {
+                        container.innerHTML = '<p class="text-muted text-center">No notes yet. Click "Add Note" to create your first note.</p>';
+                    }
+                })
+                .catch(error => {
+                    console.error('Error loading notes:', error);
+                    document.getElementById('notes-container').innerHTML = '<p class="text-danger">Error loading notes.</p>';
+                });
+        }
+        
+        // Attach event listeners to note buttons
+        function attachNoteEventListeners() {
+            // Edit buttons
+            document.querySelectorAll('.edit-note-btn').forEach(btn => {
+                btn.addEventListener('click', function() {
+                    const noteId = this.getAttribute('data-note-id');
+                    const noteItem = document.querySelector(`.note-item[data-note-id="${noteId}"]`);
+                    const noteContent = noteItem.querySelector('.note-content').innerHTML;
+                    
+                    currentNoteId = noteId;
+                    $('#note-editor').summernote('code', noteContent);
+                    document.getElementById('note-editor-container').style.display = 'block';
+                    document.getElementById('add-note-btn').style.display = 'none';
+                });
+            });
+            
+            // Delete buttons
+            document.querySelectorAll('.delete-note-btn').forEach(btn => {
+                btn.addEventListener('click', function() {
+                    if (confirm('Are you sure you want to delete this note?')) {
+                        const noteId = this.getAttribute('data-note-id');
+                        deleteNote(noteId);
+                    }
+                });
+            });
+        }
+        
+        // Save note
+        function saveNote() {
+            const content = $('#note-editor').summernote('code');
+            if (!content || !content.trim() || content === '<p><br></p>') {
+                showToast('Please enter some content', 'warning');
+                return;
+            }
+            
+            const cookieId = window.getCookieId();
+            const url = currentNoteId 
+                ? `/api/spaces/${spaceId}/notes/${currentNoteId}`
+                : `/api/spaces/${spaceId}/notes`;
+            const method = currentNoteId ? 'PUT' : 'POST';
+            
+            fetch(url, {
+                method: method,
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify({
+                    notes: content,
+                    cookie_id: cookieId
+                })
+            })
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) {
+                    showToast('Note saved successfully', 'success');
+                    $('#note-editor').summernote('code', '');
+                    document.getElementById('note-editor-container').style.display = 'none';
+                    document.getElementById('add-note-btn').style.display = 'block';
+                    currentNoteId = null;
+                    loadNotes();
+                } else {
+                    showToast('Failed to save note', 'danger');
+                }
+            })
+            .catch(error => {
+                console.error('Error saving note:', error);
+                showToast('Error saving note', 'danger');
+            });
+        }
+        
+        // Delete note
+        function deleteNote(noteId) {
+            const cookieId = window.getCookieId();
+            fetch(`/api/spaces/${spaceId}/notes/${noteId}?cookie_id=${cookieId}`, {
+                method: 'DELETE'
+            })
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) {
+                    showToast('Note deleted successfully', 'success');
+                    loadNotes();
+                } else {
+                    showToast('Failed to delete note', 'danger');
+                }
+            })
+            .catch(error => {
+                console.error('Error deleting note:', error);
+                showToast('Error deleting note', 'danger');
+            });
+        }
+        
+        // Event listeners
+        const addNoteBtn = document.getElementById('add-note-btn');
+        const saveNoteBtn = document.getElementById('save-note-btn');
+        const cancelNoteBtn = document.getElementById('cancel-note-btn');
+        
+        if (addNoteBtn) {
+            addNoteBtn.addEventListener('click', function() {
+                currentNoteId = null;
+                $('#note-editor').summernote('code', '');
+                document.getElementById('note-editor-container').style.display = 'block';
+                this.style.display = 'none';
+            });
+        }
+        
+        if (saveNoteBtn) {
+            saveNoteBtn.addEventListener('click', saveNote);
+        }
+        
+        if (cancelNoteBtn) {
+            cancelNoteBtn.addEventListener('click', function() {
+                $('#note-editor').summernote('code', '');
+                document.getElementById('note-editor-container').style.display = 'none';
+                if (addNoteBtn) addNoteBtn.style.display = 'block';
+                currentNoteId = null;
+            });
+        }
+        
+        // Load notes on page load
+        loadNotes();
+        
+        // Trim Audio Functionality
+        const trimStartMin = document.getElementById('trim-start-min');
+        const trimStartSec = document.getElementById('trim-start-sec');
+        const trimEndMin = document.getElementById('trim-end-min');
+        const trimEndSec = document.getElementById('trim-end-sec');
+        const trimDuration = document.getElementById('trim-duration');
+        const trimRange = document.getElementById('trim-range');
+        const applyTrimBtn = document.getElementById('apply-trim-btn');
+        const setCurrentStartBtn = document.getElementById('set-current-start');
+        const setCurrentEndBtn = document.getElementById('set-current-end');
+        
+        // Format time for display
+        function formatTime(seconds) {
+            const mins = Math.floor(seconds / 60);
+            const secs = Math.floor(seconds % 60);
+            return `${mins}:${secs.toString().padStart(2, '0')}`;
+        }
+        
+        // Update trim info display
+        function updateTrimInfo() {
+            const startTime = parseInt(trimStartMin.value || 0) * 60 + parseInt(trimStartSec.value || 0);
+            const endTime = parseInt(trimEndMin.value || 0) * 60 + parseInt(trimEndSec.value || 0);
+            
+            if (trimPlayer && trimPlayer.duration) {
+                const duration = trimPlayer.duration;
+                const actualEndTime = (endTime === 0) ? duration : Math.min(endTime, duration);
+                
+                if (startTime < actualEndTime) {
+                    const trimmedDuration = actualEndTime - startTime;
+                    trimDuration.textContent = formatTime(trimmedDuration);
+                    trimRange.textContent = `${formatTime(startTime)} to ${formatTime(actualEndTime)}`;
+                } else {
+                    trimDuration.textContent = 'Invalid range';
+                    trimRange.textContent = 'Invalid range';
+                }
+            }
+        }
+        
+        // Set current time buttons
+        if (setCurrentStartBtn) {
+            setCurrentStartBtn.addEventListener('click', function() {
+                if (trimPlayer && trimPlayer.currentTime) {
+                    const time = Math.floor(trimPlayer.currentTime);
+                    trimStartMin.value = Math.floor(time / 60);
+                    trimStartSec.value = time % 60;
+                    updateTrimInfo();
+                }
+            });
+        }
+        
+        if (setCurrentEndBtn) {
+            setCurrentEndBtn.addEventListener('click', function() {
+                if (trimPlayer && trimPlayer.currentTime) {
+                    const time = Math.floor(trimPlayer.currentTime);
+                    trimEndMin.value = Math.floor(time / 60);
+                    trimEndSec.value = time % 60;
+                    updateTrimInfo();
+                }
+            });
+        }
+        
+        // Update info when values change
+        [trimStartMin, trimStartSec, trimEndMin, trimEndSec].forEach(input => {
+            if (input) {
+                input.addEventListener('input', updateTrimInfo);
+            }
+        });
+        
+        // Set end time to duration when modal opens
+        const trimModal = document.getElementById('trimModal');
+        if (trimModal) {
+            trimModal.addEventListener('show.bs.modal', function() {
+                // Wait for audio to load
+                setTimeout(() => {
+                    if (trimPlayer && trimPlayer.duration) {
+                        const duration = Math.floor(trimPlayer.duration);
+                        trimEndMin.value = Math.floor(duration / 60);
+                        trimEndSec.value = duration % 60;
+                        updateTrimInfo();
+                    }
+                }, 500);
+            });
+        }
+        
+        // Apply trim
+        if (applyTrimBtn) {
+            applyTrimBtn.addEventListener('click', function() {
+                const startTime = parseInt(trimStartMin.value || 0) * 60 + parseInt(trimStartSec.value || 0);
+                const endTime = parseInt(trimEndMin.value || 0) * 60 + parseInt(trimEndSec.value || 0);
+                
+                if (startTime >= endTime && endTime !== 0) {
+                    showToast('End time must be after start time', 'warning');
+                    return;
+                }
+                
+                // Confirm action
+                if (!confirm('This will permanently modify the audio file. Are you sure you want to continue?')) {
+                    return;
+                }
+                
+                // Disable button and show loading
+                applyTrimBtn.disabled = true;
+                applyTrimBtn.innerHTML = '<i class="bi bi-hourglass-split"></i> Trimming...';
+                
+                // Send trim request
+                const cookieId = window.getCookieId();
+                fetch(`/api/spaces/${spaceId}/trim`, {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                    },
+                    body: JSON.stringify({
+                        start_time: startTime,
+                        end_time: endTime || null,  // null means end of file
+                        cookie_id: cookieId
+                    })
+                })
+                .then(response => response.json())
+                .then(data => {
+                    if (data.success) {
+                        showToast('Audio trimmed successfully', 'success');
+                        // Close modal
+                        const modalInstance = bootstrap.Modal.getInstance(trimModal);
+                        if (modalInstance) modalInstance.hide();
+                        // Reload page to refresh audio
+                        setTimeout(() => {
+                            window.location.reload();
+                        }, 1500);
+                    } else {
+                        showToast(data.error || 'Failed to trim audio', 'danger');
+                        applyTrimBtn.disabled = false;
+                        applyTrimBtn.innerHTML = '<i class="bi bi-scissors"></i> Apply Trim';
+                    }
+                })
+                .catch(error => {
+                    console.error('Error trimming audio:', error);
+                    showToast('Error trimming audio', 'danger');
+                    applyTrimBtn.disabled = false;
+                    applyTrimBtn.innerHTML = '<i class="bi bi-scissors"></i> Apply Trim';
+                });
+            });
+        }
+        
+        // Share functionality
+        const shareBtn = document.getElementById('share-btn');
+        const shareModal = document.getElementById('shareModal');
+        const copyShareBtn = document.getElementById('copy-share-btn');
+        const shareMessage = document.getElementById('share-message');
+        const shareTypeSelector = document.getElementById('share-type-selector');
+        
+        if (shareBtn && shareModal) {
+            // Initialize share modal
+            const shareModalInstance = new bootstrap.Modal(shareModal);
+            
+            // Store original share message
+            const originalShareMessage = shareMessage.value;
+            
+            // Check if video exists
+            function checkVideoExists() {
+                const videoPath = `/downloads/${SPACE_PAGE.spaceId}.mp4`;
+                return fetch(videoPath, { method: 'HEAD' })
+                    .then(response => response.ok)
+                    .catch(() => false);
+            }
+            
+            // Update share message based on type
+            function updateShareMessage(shareType) {
+                if (shareType === 'video') {
+                    const videoUrl = `${window.location.origin}/downloads/${SPACE_PAGE.spaceId}.mp4`;
+                    shareMessage.value = `Watch "${SPACE_PAGE.shareTitle}" by ${SPACE_PAGE.shareHost}
+
+${videoUrl}`;
+                } else {
+                    shareMessage.value = originalShareMessage;
+                }
+                
+                // Update share links
+                updateShareLinks();
+            }
+            
+            // Update share links based on current message
+            function updateShareLinks() {
+                const message = shareMessage.value;
+                const lines = message.split('\n\n');
+                const url = lines[lines.length - 1]; // Last line is the URL
+                const text = lines.slice(0, -1).join(' '); // Everything except URL
+                
+                const encodedMessage = encodeURIComponent(message);
+                const encodedUrl = encodeURIComponent(url);
+                const encodedText = encodeURIComponent(text);
+                
+                // Twitter/X
+                document.getElementById('share-twitter').href = 
+                    `https://twitter.com/intent/tweet?text=${encodedMessage}`;
+                
+                // Facebook
+                document.getElementById('share-facebook').href = 
+                    `https://www.facebook.com/sharer/sharer.php?u=${encodedUrl}&quote=${encodedText}`;
+                
+                // WhatsApp
+                document.getElementById('share-whatsapp').href = 
+                    `https://wa.me/?text=${encodedMessage}`;
+                
+                // Telegram
+                document.getElementById('share-telegram').href = 
+                    `https://t.me/share/url?url=${encodedUrl}&text=${text}`;
+            }
+            
+            // Handle share type change
+            document.querySelectorAll('input[name="shareType"]').forEach(radio => {
+                radio.addEventListener('change', function() {
+                    updateShareMessage(this.value);
+                });
+            });
+            
+            shareBtn.addEventListener('click', async function() {
+                // Check if video exists
+                const videoExists = await checkVideoExists();
+                
+                if (videoExists) {
+                    // Show share type selector
+                    shareTypeSelector.style.display = 'block';
+                } else {
+                    // Hide share type selector
+                    shareTypeSelector.style.display = 'none';
+                }
+                
+                // Reset to space sharing by default
+                document.getElementById('shareSpace').checked = true;
+                updateShareMessage('space');
+                
+                // Show modal
+                shareModalInstance.show();
+            });
+            
+            // Copy to clipboard
+            if (copyShareBtn) {
+                copyShareBtn.addEventListener('click', function() {
+                    shareMessage.select();
+                    shareMessage.setSelectionRange(0, 99999); // For mobile devices
+                    
+                    try {
+                        document.execCommand('copy');
+                        
+                        // Change button text temporarily
+                        const originalHTML = this.innerHTML;
+                        this.innerHTML = '<i class="bi bi-check"></i> Copied!';
+                        this.classList.remove('btn-primary');
+                        this.classList.add('btn-success');
+                        
+                        setTimeout(() => {
+                            this.innerHTML = originalHTML;
+                            this.classList.remove('btn-success');
+                            this.classList.add('btn-primary');
+                        }, 2000);
+                        
+                        showToast('Share message copied to clipboard!', 'success');
+                    } catch (err) {
+                        console.error('Failed to copy text: ', err);
+                        showToast('Failed to copy to clipboard', 'danger');
+                    }
+                });
+            }
+        }
+        
+        // Reviews functionality
+        let currentReviewId = null;
+        let selectedRating = 0;
+        
+        // Star rating interaction
+        const starRating = document.getElementById('star-rating');
+        const reviewRating = document.getElementById('review-rating');
+        const stars = starRating ? starRating.querySelectorAll('i') : [];
+        
+        stars.forEach((star, index) => {
+            star.addEventListener('click', function() {
+                selectedRating = index + 1;
+                reviewRating.value = selectedRating;
+                updateStarDisplay();
+            });
+            
+            star.addEventListener('mouseenter', function() {
+                // Show hover state
+                stars.forEach((s, i) => {
+                    if (i <= index) {
+                        s.classList.remove('bi-star');
+                        s.classList.add('bi-star-fill');
+                    } else {
+                        s.classList.remove('bi-star-fill');
+                        s.classList.add('bi-star');
+                    }
+                });
+            });
+        });
+        
+        if (starRating) {
+            starRating.addEventListener('mouseleave', function() {
+                updateStarDisplay();
+            });
+        }
+        
+        function updateStarDisplay() {
+            stars.forEach((star, index) => {
+                if (index < selectedRating) {
+                    star.classList.remove('bi-star');
+                    star.classList.add('bi-star-fill');
+                } else {
+                    star.classList.remove('bi-star-fill');
+                    star.classList.add('bi-star');
+                }
+            });
+        }
+        
+        // Load reviews
+        function loadReviews() {
+            const cookieId = window.getCookieId();
+            window.bootstrapFetch('reviews', `/api/spaces/${spaceId}/reviews?cookie_id=${cookieId}`)
+                .then(response => response.json())
+                .then(data => {
+                    if (data.success) {
+                        // Update summary
+                        document.getElementById('average-rating').textContent = data.average_rating.toFixed(1);
+                        document.getElementById('total-reviews').textContent = data.total_reviews;
+                        
+                        // Display average stars
+                        const avgStarsContainer = document.getElementById('average-stars');
+                        avgStarsContainer.innerHTML = '';
+                        for (let i = 1; i <= 5; i++) {
+                            if (i <= Math.floor(data.average_rating)) {
+                                avgStarsContainer.innerHTML += '<i class="bi bi-star-fill"></i>';
+                            } else if (i - 0.5 <= data.average_rating) {
+                                avgStarsContainer.innerHTML += '<i class="bi bi-star-half"></i>';
+                            } else {
+                                avgStarsContainer.innerHTML += '<i class="bi bi-star"></i>';
+                            }
+                        }
+                        
+                        // Display reviews
+                        const container = document.getElementById('reviews-container');
+                        if (data.reviews && data.reviews.length > 0) {
+                            let reviewsHtml = '';
+                            data.reviews.forEach(review => {
+                                reviewsHtml += `
+                                    <div class="review-item" data-review-id="${review.id}">
+                                        <div class="d-flex justify-content-between align-items-start">
+                                            <div class="flex-grow-1">
+                                                <div class="d-flex align-items-center gap-2 mb-1">
+                                                    <strong>${review.author}</strong>
+                                                    <div class="review-stars">
+                                                        ${Array(5).fill('').map((_, i) => 
+                                                            i < review.rating ? '<i class="bi bi-star-fill"></i>' : '<i class="bi bi-star"></i>'
+                                                        ).join('')}
+                                                    </div>
+                                                </div>
+                                                ${review.review ? `<p class="mb-1">${review.review}</p>` : ''}
+                                                <small class="text-muted">
+                                                    ${new Date(review.created_at).toLocaleDateString()}
+                                                    ${review.updated_at !== review.created_at ? ' (edited)' : ''}
+                                                </small>
+                                            </div>
+                                            ${review.can_edit || review.can_delete ? `
+                                                <div class="dropdown">
+                                                    <button class="btn btn-link btn-sm" type="button" data-bs-toggle="dropdown">
+                                                        <i class="bi bi-three-dots-vertical"></i>
+                                                    </button>
+                                                    <ul class="dropdown-menu dropdown-menu-end">
+                                                        ${review.can_edit ? `
+                                                            <li><a class="dropdown-item edit-review" href="#" data-review-id="${review.id}" data-rating="${review.rating}" data-review="${review.review || ''}">
+                                                                <i class="bi bi-pencil"></i> Edit
+                                                            </a></li>
+                                                        ` : ''}
+                                                        ${review.can_delete ? `
+                                                            <li><a class="dropdown-item delete-review text-danger" href="#" data-review-id="${review.id}">
+                                                                <i class="bi bi-trash"></i> Delete
+                                                            </a></li>
+                                                        ` : ''}
+                                                    </ul>
+                                                </div>
+                                            ` : ''}
+                                        </div>
+                                    </div>
+                                `;
+                            });
+                            container.innerHTML = reviewsHtml;
+                            
+                            // Attach event listeners
+                            container.querySelectorAll('.edit-review').forEach(btn => {
+                                btn.addEventListener('click', editReview);
+                            });
+                            container.querySelectorAll('.delete-review').forEach(btn => {
+                                btn.addEventListener('click', deleteReview);
+                            });
+                        } else {
+                            container.innerHTML = '<p class="text-muted">No reviews yet. Be the first to review this space!</p>';
+                        }
+                        
+                        // Check if user already reviewed
+                        const hasReviewed = data.reviews.some(r => r.can_edit);
+                        const addReviewBtn = document.getElementById('add-review-btn');
+                        if (addReviewBtn) {
+                            addReviewBtn.style.display = hasReviewed ? 'none' : 'block';
+                        }
+                    }
+                })
+                .catch(error => {
+                    console.error('Error loading reviews:', error);
+                    showToast('Error loading reviews', 'danger');
+                });
+        }
+        
+        // Add review button
+        const addReviewBtn = document.getElementById('add-review-btn');
+        if (addReviewBtn) {
+            addReviewBtn.addEventListener('click', function() {
+                currentReviewId = null;
+                selectedRating = 0;
+                reviewRating.value = 0;
+                document.getElementById('review-text').value = '';
+                document.getElementById('review-editor-title').textContent = 'Write a Review';
+                updateStarDisplay();
+                
+                document.getElementById('review-editor-container').style.display = 'block';
+                this.style.display = 'none';
+            });
+        }
+        
+        // Save review
+        const saveReviewBtn = document.getElementById('save-review-btn');
+        if (saveReviewBtn) {
+            saveReviewBtn.addEventListener('click', function() {
+                const rating = parseInt(reviewRating.value);
+                const reviewText = document.getElementById('review-text').value.trim();
+                const cookieId = window.getCookieId();
+                
+                if (rating === 0) {
+                    showToast('Please select a rating', 'warning');
+                    return;
+                }
+                
+                const url = currentReviewId 
+                    ? `/api/spaces/${spaceId}/reviews/${currentReviewId}`
+                    : `/api/spaces/${spaceId}/reviews`;
+                    
+                const method = currentReviewId ? 'PUT' : 'POST';
+                
+                fetch(url, {
+                    method: method,
+                    headers: {
+                        'Content-Type': 'application/json',
+                    },
+                    body: JSON.stringify({
+                        rating: rating,
+                        review: reviewText,
+                        cookie_id: cookieId
+                    })
+                })
+                .then(response => response.json())
+                .then(data => {
+                    if (data.success || data.review_id) {
+                        showToast(currentReviewId ? 'Review updated successfully' : 'Review added successfully', 'success');
+                        document.getElementById('review-editor-container').style.display = 'none';
+                        if (addReviewBtn) addReviewBtn.style.display = 'block';
+                        loadReviews();
+                    } else {
+                        showToast(data.error || 'Failed to save review', 'danger');
+                    }
+                })
+                .catch(error => {
+                    console.error('Error saving review:', error);
+                    showToast('Error saving review', 'danger');
+                });
+            });
+        }
+        
+        // Cancel review
+        const cancelReviewBtn = document.getElementById('cancel-review-btn');
+        if (cancelReviewBtn) {
+            cancelReviewBtn.addEventListener('click', function() {
+                document.getElementById('review-editor-container').style.display = 'none';
+                if (addReviewBtn && !currentReviewId) {
+                    addReviewBtn.style.display = 'block';
+                }
+                currentReviewId = null;
+            });
+        }
+        
+        // Edit review
+        function editReview(e) {
+            e.preventDefault();
+            const reviewId = this.dataset.reviewId;
+            const rating = parseInt(this.dataset.rating);
+            const reviewText = this.dataset.review;
+            
+            currentReviewId = reviewId;
+            selectedRating = rating;
+            reviewRating.value = rating;
+            document.getElementById('review-text').value = reviewText;
+            document.getElementById('review-editor-title').textContent = 'Edit Review';
+            updateStarDisplay();
+            
+            document.getElementById('review-editor-container').style.display = 'block';
+            if (addReviewBtn) addReviewBtn.style.display = 'none';
+            
+            // Scroll to editor
+            document.getElementById('review-editor-container').scrollIntoView({ behavior: 'smooth' });
+        }
+        
+        // Delete review
+        function deleteReview(e) {
+            e.preventDefault();
+            const reviewId = this.dataset.reviewId;
+            
+            if (!confirm('Are you sure you want to delete this review?')) {
+                return;
+            }
+            
+            const cookieId = window.getCookieId();
+            fetch(`/api/spaces/${spaceId}/reviews/${reviewId}?cookie_id=${cookieId}`, {
+                method: 'DELETE'
+            })
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) {
+                    showToast('Review deleted successfully', 'success');
+                    loadReviews();
+                } else {
+                    showToast(data.error || 'Failed to delete review', 'danger');
+                }
+            })
+            .catch(error => {
+                console.error('Error deleting review:', error);
+                showToast('Error deleting review', 'danger');
+            });
+        }
+        
+        // Load reviews on page load
+        loadReviews();
+        
+        // Favorite button functionality
+        const favoriteBtn = document.getElementById('favorite-btn');
+        if (favoriteBtn) {
+            favoriteBtn.addEventListener('click', function() {
+                const cookieId = window.getCookieId();
+                const isCurrentlyFavorite = this.classList.contains('btn-warning');
+                
+                // Disable button during request
+                this.disabled = true;
+                
+                fetch(`/api/spaces/${spaceId}/favorite`, {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                    },
+                    body: JSON.stringify({ cookie_id: cookieId })
+                })
+                .then(response => response.json())
+                .then(data => {
+                    if (data.success) {
+                        // Update button appearance
+                        if (data.is_favorite) {
+                            this.classList.remove('btn-outline-warning');
+                            this.classList.add('btn-warning');
+                            this.querySelector('i').classList.remove('bi-star');
+                            this.querySelector('i').classList.add('bi-star-fill');
+                            this.title = 'Remove from favorites';
+                            showToast('Added to favorites!', 'success');
+                        } else {
+                            this.classList.remove('btn-warning');
+                            this.classList.add('btn-outline-warning');
+                            this.querySelector('i').classList.remove('bi-star-fill');
+                            this.querySelector('i').classList.add('bi-star');
+                            this.title = 'Add to favorites';
+                            showToast('Removed from favorites', 'info');
+                        }
+                    } else {
+                        showToast(data.error || 'Failed to update favorite', 'danger');
+                    }
+                })
+                .catch(error => {
+                    console.error('Error toggling favorite:', error);
+                    showToast('Error updating favorite', 'danger');
+                })
+                .finally(() => {
+                    this.disabled = false;
+                });
+            });
+        }
+        
+        // Initialize smart download button
+        initializeSmartDownloadButton();
+        
+        // Initialize video generation button
+        initializeVideoGeneration();
+        
+        // Video generation functionality
+        let currentVideoPollingInterval = null;
+        
+        function initializeVideoGeneration() {
+            const generateBtn = document.getElementById('generate-video-btn');
+            const spaceId = window.spaceId || SPACE_PAGE.spaceId;
+            
+            if (generateBtn) {
+                // Check if video already exists
+                checkExistingVideo(spaceId, generateBtn);
+                
+                generateBtn.addEventListener('click', function() {
+                    // Only generate if button is not in "ready" state
+                    if (!generateBtn.classList.contains('btn-success')) {
+                        generateVideo(spaceId);
+                    }
+                });
+            }
+        }
+
+        function checkExistingVideo(spaceId, generateBtn) {
+            fetch(`/api/spaces/${spaceId}/available-formats`)
+                .then(response => response.json())
+                .then(data => {
+                    if (data.success && data.formats) {
+                        const hasMP4 = data.formats.some(format => format.format === 'mp4');
+                        if (hasMP4) {
+                            // Video already exists, update button to show it's ready
+                            generateBtn.innerHTML = '<i class="bi bi-camera-video-fill"></i> <span class="d-none d-sm-inline">Video Ready</span>';
+                            generateBtn.className = 'btn btn-success btn-sm';
+                            generateBtn.title = 'Video is ready! Use the download button to get your MP4.';
+                            generateBtn.disabled = false;
+                        }
+                    }
+                })
+                .catch(error => {
+                    console.debug('Error checking existing video:', error);
+                });
+        }
+
+        function generateVideo(spaceId) {
+            const generateBtn = document.getElementById('generate-video-btn');
+            const originalHTML = generateBtn.innerHTML;
+            
+            // Clear any existing polling interval
+            if (currentVideoPollingInterval) {
+                clearInterval(currentVideoPollingInterval);
+                currentVideoPollingInterval = null;
+            }
+            
+            // Disable button and show loading
+            generateBtn.disabled = true;
+            generateBtn.innerHTML = '<i class="bi bi-hourglass-split"></i> <span class="d-none d-sm-inline">Generating...</span>';
+            
+            fetch(`/api/spaces/${spaceId}/generate-video`, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                }
+            })
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) {
+                    showToast('Video generation started! This may take a few minutes.', 'success');
+                    
+                    // Start polling for completion
+                    pollVideoStatus(spaceId, data.job_id);
+                } else {
+                    showToast(`Error: ${data.error}`, 'danger');
+                    generateBtn.disabled = false;
+                    generateBtn.innerHTML = originalHTML;
+                }
+            })
+            .catch(error => {
+                console.error('Error generating video:', error);
+                showToast('Error starting video generation', 'danger');
+                generateBtn.disabled = false;
+                generateBtn.innerHTML = originalHTML;
+            });
+        }
+
+        function pollVideoStatus(spaceId, jobId) {
+            const generateBtn = document.getElementById('generate-video-btn');
+            
+            // Clear any existing interval
+            if (currentVideoPollingInterval) {
+                clearInterval(currentVideoPollingInterval);
+            }
+            
+            currentVideoPollingInterval = setInterval(() => {
+                fetch(`/api/spaces/${spaceId}/video-status/${jobId}`)
+                    .then(response => response.json())
+                    .then(data => {
+                        console.log('Video status response:', data); // Debug logging
+                        
+                        // Check if we have job data (the response structure from your example)
+                        if (data && data.status) {
+                            console.log('Processing status:', data.status); // Debug logging
+                            
+                            if (data.status === 'completed') {
+                                console.log('Video completed, clearing interval'); // Debug logging
+                                clearInterval(currentVideoPollingInterval);
+                                currentVideoPollingInterval = null;
+                                showToast('Video generated successfully!', 'success');
+                                
+                                // Update button to show download option
+                                generateBtn.innerHTML = '<i class="bi bi-camera-video-fill"></i> <span class="d-none d-sm-inline">Video Ready</span>';
+                                generateBtn.disabled = false;
+                                generateBtn.className = 'btn btn-success btn-sm';
+                                generateBtn.title = 'Video is ready! Use the download button to get your MP4.';
+                                
+                                // Force refresh download button to show MP4 option
+                                console.log('Refreshing download button'); // Debug logging
+                                setTimeout(() => {
+                                    initializeSmartDownloadButton();
+                                }, 500);
+                                
+                                return; // Exit after handling completion
+                                
+                            } else if (data.status === 'failed') {
+                                clearInterval(currentVideoPollingInterval);
+                                currentVideoPollingInterval = null;
+                                showToast(`Video generation failed: ${data.error || 'Unknown error'}`, 'danger');
+                                
+                                // Reset button
+                                generateBtn.disabled = false;
+                                generateBtn.innerHTML = '<i class="bi bi-camera-video"></i> <span class="d-none d-sm-inline">Generate Video</span>';
+                                generateBtn.className = 'btn btn-secondary btn-sm';
+                                
+                                return; // Exit after handling failure
+                                
+                            } else if (data.status === 'processing') {
+                                // Update button with progress
+                                const progress = data.progress || 0;
+                                generateBtn.innerHTML = `<i class="bi bi-hourglass-split"></i> <span class="d-none d-sm-inline">${progress}%</span>`;
+                                return; // Exit after handling processing
+                            }
+                        } else {
+                            console.error('Unexpected response structure:', data);
+                        }
+                    })
+                    .catch(error => {
+                        console.error('Error polling video status:', error);
+                    });
+            }, 2000); // Poll every 2 seconds
+            
+            // Stop polling after 10 minutes
+            setTimeout(() => {
+                if (currentVideoPollingInterval) {
+                    clearInterval(currentVideoPollingInterval);
+                    currentVideoPollingInterval = null;
+                }
+            }, 600000);
+        }
+    });
+
+    
+    // Function to check transcription status
+    function checkTranscriptionStatus() {
+        const transcribeBtn = document.getElementById('transcribe-btn');
+        if (!transcribeBtn) return;
+        
+        window.bootstrapFetch('transcription_status', `/api/transcribe/${spaceId}/status`)
+            .then(response => response.json())
+            .then(data => {
+                if (data.has_pending_job) {
+                    // Disable button and show status
+                    transcribeBtn.disabled = true;
+                    transcribeBtn.innerHTML = '<i class="bi bi-hourglass-split"></i> <span class="d-none d-sm-inline">Transcribing...</span>';
+                    transcribeBtn.setAttribute('title', `Transcription ${data.status} (Job: ${data.job_id})`);
+                    
+                    // Update tooltip
+                    const tooltip = bootstrap.Tooltip.getInstance(transcribeBtn);
+                    if (tooltip) {
+                        tooltip.setContent({ '.tooltip-inner': `Transcription ${data.status}` });
+                    }
+                } else if (!transcribeBtn.getAttribute('data-has-transcript')) {
+                    // Re-enable button if no job and no transcript exists
+                    transcribeBtn.disabled = false;
+                    transcribeBtn.innerHTML = '<i class="bi bi-mic"></i> <span class="d-none d-sm-inline">Transcribe</span>';
+                    transcribeBtn.setAttribute('title', 'Generate transcript from audio');
+                    
+                    // Update tooltip
+                    const tooltip = bootstrap.Tooltip.getInstance(transcribeBtn);
+                    if (tooltip) {
+                        tooltip.setContent({ '.tooltip-inner': 'Generate transcript from audio' });
+                    }
+                }
+            })
+            .catch(error => {
+                console.error('Error checking transcription status:', error);
+            });
+    }
+    
+    // Check transcription status on page load
+    checkTranscriptionStatus();
+    
+    // Poll transcription status every 10 seconds
+    setInterval(checkTranscriptionStatus, 10000);
+    
+    // Text-to-Speech (TTS) functionality
+    document.addEventListener('DOMContentLoaded', function() {
+        const ttsBtn = document.getElementById('tts-btn');
+        const languageSelector = document.getElementById('language-selector');
+        const transcriptContent = document.getElementById('transcript-content');
+        
+        // Show TTS button when transcript is available
+        function updateTTSButtonVisibility() {
+            if (transcriptContent && transcriptContent.innerText.trim() && languageSelector) {
+                const selectedOption = languageSelector.selectedOptions[0];
+                if (selectedOption && ttsBtn) {
+                    ttsBtn.style.display = 'inline-block';
+                }
+            }
+        }
+        
+        // Monitor transcript content changes
+        if (transcriptContent) {
+            const observer = new MutationObserver(updateTTSButtonVisibility);
+            observer.observe(transcriptContent, { childList: true, subtree: true });
+            
+            // Initial check
+            setTimeout(updateTTSButtonVisibility, 1000);
+        }
+        
+        // Language selector change event
+        if (languageSelector) {
+            languageSelector.addEventListener('change', function() {
+                setTimeout(updateTTSButtonVisibility, 500);
+            });
+        }
+        
+        // TTS button click handler
+        if (ttsBtn) {
+            ttsBtn.addEventListener('click', function() {
+                const transcriptText = transcriptContent.innerText.trim();
+                const selectedOption = languageSelector.selectedOptions[0];
+                const language = selectedOption ? selectedOption.getAttribute('data-language') : 'en';
+                
+                if (!transcriptText) {
+                    showToast('No transcript text available for TTS generation', 'warning');
+                    return;
+                }
+                
+                if (transcriptText.length < 10) {
+                    showToast('Transcript text is too short for TTS generation', 'warning');
+                    return;
+                }
+                
+                // Disable button and show loading state
+                ttsBtn.disabled = true;
+                ttsBtn.innerHTML = '<i class="bi bi-hourglass-split"></i> Processing...';
+                
+                // Make TTS generation request
+                fetch('/api/tts/generate', {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                    },
+                    body: JSON.stringify({
+                        space_id: SPACE_PAGE.spaceId,
+                        language: language,
+                        transcript_id: selectedOption ? selectedOption.value : null
+                    })
+                })
+                .then(response => response.json())
+                .then(data => {
+                    if (data.job_id) {
+                        showToast(`TTS generation started! Estimated cost: ${data.estimated_cost} credits`, 'success');
+                        
+                        // Start polling for job status
+                        pollTTSStatus(data.job_id);
+                    } else if (data.error) {
+                        if (data.error.includes('already exists') || data.error.includes('already in progress')) {
+                            showToast('TTS already exists or is being generated for this transcript', 'info');
+                            if (data.job_id) {
+                                pollTTSStatus(data.job_id);
+                            }
+                        } else if (data.error.includes('Insufficient credits')) {
+                            showToast(`Insufficient credits. Required: ${data.required}, Available: ${data.available}`, 'warning');
+                        } else {
+                            showToast('Error: ' + data.error, 'danger');
+                        }
+                    }
+                })
+                .catch(error => {
+                    console.error('Error generating TTS:', error);
+                    showToast('Error generating TTS audio', 'danger');
+                })
+                .finally(() => {
+                    // Reset button
+                    ttsBtn.disabled = false;
+                    ttsBtn.innerHTML = '<i class="bi bi-volume-up"></i>';
+                });
+            });
+        }
+        
+        // Poll TTS job status
+        function pollTTSStatus(jobId) {
+            const pollInterval = setInterval(() => {
+                fetch(`/api/tts/status/${jobId}`)
+                .then(response => response.json())
+                .then(data => {
+                    if (data.status === 'completed') {
+                        clearInterval(pollInterval);
+                        showToast('TTS generation completed! Click to download MP3', 'success');
+                        
+                        // Create download link
+                        const downloadLink = document.createElement('a');
+                        downloadLink.href = `/api/tts/download/${jobId}`;
+                        downloadLink.download = `tts_${SPACE_PAGE.spaceId}_${data.space_id || 'audio'}.mp3`;
+                        downloadLink.style.display = 'none';
+                        document.body.appendChild(downloadLink);
+                        downloadLink.click();
+                        document.body.removeChild(downloadLink);
+                        
+                    } else if (data.status === 'failed') {
+                        clearInterval(pollInterval);
+                        showToast('TTS generation failed: ' + (data.error_message || 'Unknown error'), 'danger');
+                        
+                    } else if (data.status === 'in_progress') {
+                        const progress = data.progress || 0;
+                        showToast(`TTS generation in progress... ${progress}%`, 'info');
+                    }
+                })
+                .catch(error => {
+                    console.error('Error checking TTS status:', error);
+                    clearInterval(pollInterval);
+                });
+            }, 3000); // Poll every 3 seconds
+            
+            // Stop polling after 5 minutes
+            setTimeout(() => {
+                clearInterval(pollInterval);
+            }, 300000);
+        }
+    });
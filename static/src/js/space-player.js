@@ -0,0 +1,165 @@
+    // Wait for Plyr to load
+    function initializePlyrPlayers() {
+        if (typeof Plyr === 'undefined') {
+            console.log('Waiting for Plyr to load...');
+            setTimeout(initializePlyrPlayers, 100);
+            return;
+        }
+        
+        console.log('Plyr loaded, initializing players...');
+        
+        // Initialize main audio player
+        const mainAudioElement = document.getElementById('audio-player');
+        console.log('Main audio element found:', !!mainAudioElement);
+        
+        if (mainAudioElement && typeof Plyr !== 'undefined') {
+            try {
+                // Different controls for mobile vs desktop
+                const isMobile = window.innerWidth <= 768;
+                const controls = isMobile ? [
+                    'play-large',
+                    'play',
+                    'progress',
+                    'current-time',
+                    'duration',
+                    'mute',
+                    'settings'
+                ] : [
+                    'play-large',
+                    'restart',
+                    'play',
+                    'progress',
+                    'current-time',
+                    'duration',
+                    'mute',
+                    'volume',
+                    'settings',
+                    'fullscreen'
+                ];
+                
+                window.mainPlayer = new Plyr(mainAudioElement, {
+                controls: controls,
+                settings: ['speed', 'loop'],
+                speed: { selected: 1, options: [0.5, 0.75, 1, 1.25, 1.5, 1.75, 2] },
+                hideControls: false,
+                clickToPlay: true,
+                keyboard: { focused: true, global: false },
+                tooltips: { controls: true, seek: true },
+                // Reduce buffer to prevent excessive range requests
+                mediaMetadata: {
+                    title: SPACE_PAGE.playerTitle
+                },
+                // Optimize for streaming
+                invertTime: false,
+                seekTime: 10
+            });
+            
+            // Add custom styling
+            window.mainPlayer.on('ready', function() {
+                // updatePlayerInfo function is in the other script block
+                if (typeof updatePlayerInfo === 'function') {
+                    updatePlayerInfo();
+                }
+            });
+            
+            window.mainPlayer.on('timeupdate', function() {
+                // updateTimeDisplay function is in the other script block
+                if (typeof updateTimeDisplay === 'function') {
+                    updateTimeDisplay();
+                }
+            });
+            
+            // Track play events for play count
+            let playStartTime = null;
+            window.mainPlayer.on('play', function() {
+                playStartTime = Date.now();
+                console.log('Play started');
+            });
+            
+            window.mainPlayer.on('pause', function() {
+                if (playStartTime) {
+                    const duration = Math.floor((Date.now() - playStartTime) / 1000);
+                    trackPlayEvent(duration);
+                    playStartTime = null;
+                }
+            });
+            
+            window.mainPlayer.on('ended', function() {
+                if (playStartTime) {
+                    const duration = Math.floor((Date.now() - playStartTime) / 1000);
+                    trackPlayEvent(duration);
+                    playStartTime = null;
+                }
+            });
+            
+            // Function to track play events
+            function trackPlayEvent(duration) {
+                if (duration < 5) return; // Don't track very short plays
+                
+                fetch(`/api/track_play/${SPACE_PAGE.spaceId}`, {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                    },
+                    body: JSON.stringify({
+                        duration: duration
+                    })
+                })
+                .then(response => response.json())
+                .then(data => {
+                    if (data.success && data.counted) {
+                        console.log('Play tracked successfully');
+                    }
+                })
+                .catch(error => {
+                    console.error('Error tracking play:', error);
+                });
+            }
+            
+            console.log('Main Plyr player initialized successfully');
+            } catch (error) {
+                console.error('Error initializing main Plyr player:', error);
+            }
+        } else if (!mainAudioElement) {
+            console.warn('Main audio element not found');
+        } else if (typeof Plyr === 'undefined') {
+            console.error('Plyr library not loaded');
+        }
+        
+        // Initialize trim modal audio player
+        const trimAudioElement = document.getElementById('trim-audio-preview');
+        if (trimAudioElement && typeof Plyr !== 'undefined') {
+            try {
+                window.trimPlayer = new Plyr(trimAudioElement, {
+                controls: [
+                    'play',
+                    'progress',
+                    'current-time',
+                    'duration',
+                    'mute',
+                    'volume'
+                ],
+                hideControls: false,
+                clickToPlay: true,
+                keyboard: { focused: true, global: false },
+                tooltips: { controls: true, seek: true }
+            });
+                console.log('Trim Plyr player initialized successfully');
+            } catch (error) {
+                console.error('Error initializing trim Plyr player:', error);
+            }
+        }
+    }
+    
+    // Initialize on DOMContentLoaded
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', initializePlyrPlayers);
+    } else {
+        // DOM already loaded
+        initializePlyrPlayers();
+    }
+    
+    // Helper function to get the actual media element
+    window.getMediaElement = function(player) {
+        return player ? player.media : null;
+    }
@@ -0,0 +1,202 @@
+    // Tag management for users who can edit this space
+    
+    // Show/hide delete buttons on hover
+    document.addEventListener('DOMContentLoaded', function() {
+        const tagItems = document.querySelectorAll('.tag-item');
+        
+        tagItems.forEach(item => {
+            const deleteBtn = item.querySelector('.tag-delete-btn');
+            if (deleteBtn) {
+                item.addEventListener('mouseenter', function() {
+                    deleteBtn.style.display = 'block';
+                });
+                
+                item.addEventListener('mouseleave', function() {
+                    deleteBtn.style.display = 'none';
+                });
+            }
+        });
+    });
+    
+    // Variables for tag removal
+    let tagToRemoveId = null;
+    let tagToRemoveName = null;
+    
+    // Show add tag modal
+    function showAddTagModal() {
+        const modal = new bootstrap.Modal(document.getElementById('addTagModal'));
+        document.getElementById('tag-name').value = '';
+        modal.show();
+        
+        // Focus on input when modal is shown
+        document.getElementById('addTagModal').addEventListener('shown.bs.modal', function() {
+            document.getElementById('tag-name').focus();
+        });
+    }
+    
+    // Add tag function
+    function addTag() {
+        const tagName = document.getElementById('tag-name').value.trim();
+        
+        if (!tagName) {
+            showToast('Please enter a tag name', 'warning');
+            return;
+        }
+        
+        if (tagName.length > 50) {
+            showToast('Tag name must be 50 characters or less', 'warning');
+            return;
+        }
+        
+        // Check if tag already exists
+        const existingTags = Array.from(document.querySelectorAll('.tag-item')).map(item => 
+            item.getAttribute('data-tag-name').toLowerCase()
+        );
+        
+        if (existingTags.includes(tagName.toLowerCase())) {
+            showToast('This tag already exists on this space', 'warning');
+            return;
+        }
+        
+        // Send request to add tag
+        fetch(`/api/spaces/${SPACE_PAGE.spaceId}/tags`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                tag_name: tagName
+            })
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                // Add tag to UI
+                addTagToUI(data.tag);
+                
+                // Close modal
+                const modal = bootstrap.Modal.getInstance(document.getElementById('addTagModal'));
+                modal.hide();
+                
+                showToast('Tag added successfully', 'success');
+            } else {
+                showToast(data.error || 'Failed to add tag', 'danger');
+            }
+        })
+        .catch(error => {
+            console.error('Error adding tag:', error);
+            showToast('Error adding tag', 'danger');
+        });
+    }
+    
+    // Add tag to UI
+    function addTagToUI(tag) {
+        const container = document.getElementById('tags-container');
+        
+        // Remove "no tags" message if it exists
+        const noTagsMsg = container.querySelector('.text-muted');
+        if (noTagsMsg) {
+            noTagsMsg.remove();
+        }
+        
+        // Create new tag element
+        const tagElement = document.createElement('div');
+        tagElement.className = 'tag-item position-relative';
+        tagElement.setAttribute('data-tag-id', tag.id);
+        tagElement.setAttribute('data-tag-name', tag.tag_name);
+        
+        tagElement.innerHTML = `
+            <a href="/spaces/tag/${tag.tag_slug}" 
+               class="badge bg-secondary text-decoration-none fs-6 px-3 py-2 tag-link">
+                <i class="bi bi-tag"></i> ${tag.tag_name}
+            </a>
+            <button class="btn btn-sm btn-danger tag-delete-btn position-absolute top-0 end-0 translate-middle rounded-circle p-1" 
+                    style="display: none; width: 20px; height: 20px; font-size: 10px;"
+                    onclick="confirmRemoveTag(${tag.id}, '${tag.tag_name}', event)"
+                    title="Remove tag">
+                <i class="bi bi-x"></i>
+            </button>
+        `;
+        
+        container.appendChild(tagElement);
+        
+        // Add hover events to new tag
+        const deleteBtn = tagElement.querySelector('.tag-delete-btn');
+        tagElement.addEventListener('mouseenter', function() {
+            deleteBtn.style.display = 'block';
+        });
+        
+        tagElement.addEventListener('mouseleave', function() {
+            deleteBtn.style.display = 'none';
+        });
+    }
+    
+    // Show confirmation modal for tag removal
+    function confirmRemoveTag(tagId, tagName, event) {
+        event.preventDefault();
+        event.stopPropagation();
+        
+        tagToRemoveId = tagId;
+        tagToRemoveName = tagName;
+        
+        document.getElementById('tag-to-remove-name').textContent = tagName;
+        
+        const modal = new bootstrap.Modal(document.getElementById('confirmRemoveTagModal'));
+        modal.show();
+    }
+    
+    // Remove tag function
+    function removeTag() {
+        if (!tagToRemoveId) {
+            return;
+        }
+        
+        // Send request to remove tag
+        fetch(`/api/spaces/${SPACE_PAGE.spaceId}/tags/${tagToRemoveId}`, {
+            method: 'DELETE',
+            headers: {
+                'Content-Type': 'application/json',
+            }
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                // Remove tag from UI
+                const tagElement = document.querySelector(`[data-tag-id="${tagToRemoveId}"]`);
+                if (tagElement) {
+                    tagElement.remove();
+                }
+                
+                // Check if no tags left
+                const container = document.getElementById('tags-container');
+                const remainingTags = container.querySelectorAll('.tag-item');
+                if (remainingTags.length === 0) {
+                    container.innerHTML = '<p class="text-muted mb-0">No tags yet. Click "Add Tag" to add some!</p>';
+                }
+                
+                // Close modal
+                const modal = bootstrap.Modal.getInstance(document.getElementById('confirmRemoveTagModal'));
+                modal.hide();
+                
+                showToast('Tag removed successfully', 'success');
+            } else {
+                showToast(data.error || 'Failed to remove tag', 'danger');
+            }
+        })
+        .catch(error => {
+            console.error('Error removing tag:', error);
+            showToast('Error removing tag', 'danger');
+        })
+        .finally(() => {
+            tagToRemoveId = null;
+            tagToRemoveName = null;
+        });
+    }
+    
+    // Handle Enter key in add tag modal
+    document.getElementById('tag-name').addEventListener('keypress', function(e) {
+        if (e.key === 'Enter') {
+            e.preventDefault();
+            addTag();
+        }
+    });
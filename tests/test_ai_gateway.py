@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# tests/test_ai_gateway.py
+
+import unittest
+import os
+import sys
+import threading
+import time
+from unittest import mock
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import components.AIGateway as gateway_module
+from components.AIGateway import AIGateway, CircuitBreaker, is_transient
+
+class TestAIGateway(unittest.TestCase):
+    """Test case for the shared AI gateway."""
+
+    def setUp(self):
+        """Create a gateway with fast retries."""
+        self.gateway = AIGateway({'test': {'requests_per_minute': 6000, 'max_concurrent': 2}})
+        patcher = mock.patch.object(gateway_module, 'RETRY_BASE_DELAY', 0.01)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_is_transient(self):
+        """Test which error results are worth retrying."""
+        self.assertTrue(is_transient({'error': 'x', 'status_code': 429}))
+        self.assertTrue(is_transient({'error': 'x', 'status_code': 503}))
+        self.assertTrue(is_transient({'error': 'x', 'network_error': True}))
+        self.assertFalse(is_transient({'error': 'x', 'status_code': 400}))
+        self.assertFalse(is_transient('plain error'))
+
+    def test_transient_errors_are_retried(self):
+        """Test that a 503 is retried and a 400 is returned at once."""
+        calls = []
+
+        def flaky():
+            calls.append('flaky')
+            if len(calls) < 3:
+                return False, {'error': 'unavailable', 'status_code': 503}, None
+            return True, 'ok', {'input_tokens': 7, 'output_tokens': 3}
+
+        self.assertEqual(self.gateway.call('test', 'm', flaky), (True, 'ok'))
+        self.assertEqual(len(calls), 3)
+
+        bad_calls = []
+
+        def bad_request():
+            bad_calls.append('bad')
+            return False, {'error': 'bad request', 'status_code': 400}, None
+
+        success, result = self.gateway.call('test', 'm', bad_request)
+        self.assertFalse(success)
+        self.assertEqual(len(bad_calls), 1)
+
+        metrics = self.gateway.get_metrics()['test/m']
+        self.assertEqual((metrics['calls'], metrics['successes'], metrics['failures'], metrics['retries']),
+                         (2, 1, 1, 2))
+        self.assertEqual((metrics['input_tokens'], metrics['output_tokens']), (7, 3))
+        self.assertEqual(metrics['circuit'], 'closed')
+
+    def test_circuit_opens_and_rejects_fast(self):
+        """Test that repeated transient failures open the circuit and later calls fail fast."""
+        calls = []
+
+        def down():
+            calls.append('down')
+            return False, {'error': 'down', 'network_error': True}, None
+
+        for _ in range(gateway_module.FAILURE_THRESHOLD):
+            success, result = self.gateway.call('test', 'm', down, attempts=1)
+            self.assertEqual(result.get('attempts'), 1)
+
+        self.assertFalse(self.gateway.is_available('test', 'm'))
+        success, result = self.gateway.call('test', 'm', down)
+        self.assertFalse(success)
+        self.assertTrue(result['circuit_open'])
+        self.assertEqual(len(calls), gateway_module.FAILURE_THRESHOLD)
+        self.assertEqual(self.gateway.get_metrics()['test/m']['rejected'], 1)
+
+    def test_half_open_trial_closes_circuit(self):
+        """Test that one trial call is let through after the cooldown."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        self.assertFalse(breaker.allow())
+        time.sleep(0.06)
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+        breaker.record_success()
+        self.assertTrue(breaker.allow())
+
+    def test_concurrency_cap_and_busy_timeout(self):
+        """Test that calls beyond the cap wait and give up after the queue timeout."""
+        release = threading.Event()
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+
+        def slow():
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            release.wait(2)
+            with lock:
+                state['active'] -= 1
+            return True, 'done', None
+
+        threads = [threading.Thread(target=self.gateway.call, args=('test', 'm', slow)) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+
+        success, result = self.gateway.call('test', 'm', slow, queue_timeout=0.05)
+        self.assertFalse(success)
+        self.assertTrue(result['busy'])
+
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(state['peak'], 2)
+        self.assertTrue(self.gateway.is_available('test', 'm'))
+
+if __name__ == '__main__':
+    unittest.main()
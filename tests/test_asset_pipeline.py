@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# tests/test_asset_pipeline.py
+
+import unittest
+import os
+import sys
+import gzip
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.AssetPipeline import AssetPipeline
+
+class TestAssetPipeline(unittest.TestCase):
+    """Test case for the AssetPipeline component."""
+
+    def setUp(self):
+        """Create a static folder with one script and one stylesheet."""
+        self.static_dir = Path(tempfile.mkdtemp())
+        (self.static_dir / 'src' / 'js').mkdir(parents=True)
+        (self.static_dir / 'src' / 'css').mkdir(parents=True)
+        (self.static_dir / 'src' / 'js' / 'page.js').write_text("console.log('v1');\n")
+        (self.static_dir / 'src' / 'css' / 'page.css').write_text("body { color: red; }\n")
+        self.pipeline = AssetPipeline(static_dir=str(self.static_dir))
+
+    def tearDown(self):
+        """Remove the temporary static folder."""
+        shutil.rmtree(self.static_dir)
+
+    def test_falls_back_to_sources_without_build(self):
+        """Test that unbuilt assets resolve to their source files."""
+        self.assertEqual(self.pipeline.url_path('js/page.js'), 'src/js/page.js')
+
+    def test_build_fingerprints_and_compresses(self):
+        """Test content-hash names, gzip variants and manifest lookups."""
+        manifest = self.pipeline.build()
+        hashed = manifest['js/page.js']
+        self.assertRegex(hashed, r'^js/page\.[0-9a-f]{12}\.js$')
+        self.assertEqual(self.pipeline.url_path('js/page.js'), f'dist/{hashed}')
+
+        built = self.static_dir / 'dist' / hashed
+        self.assertEqual(built.read_text(), "console.log('v1');\n")
+        self.assertEqual(gzip.decompress((built.parent / (built.name + '.gz')).read_bytes()),
+                         built.read_bytes())
+
+        path, encoding = self.pipeline.resolve_precompressed(hashed, 'gzip, deflate')
+        self.assertEqual(encoding, 'gzip')
+        self.assertTrue(path.name.endswith('.gz'))
+        path, encoding = self.pipeline.resolve_precompressed(hashed, '')
+        self.assertIsNone(encoding)
+        self.assertEqual(path, built.resolve())
+        self.assertEqual(self.pipeline.resolve_precompressed('../src/js/page.js', 'gzip'), (None, None))
+
+    def test_rebuild_replaces_stale_outputs(self):
+        """Test that changed sources get new names and outputs older than keep_builds are removed."""
+        self.pipeline.keep_builds = 2
+        built = []
+        for version in ('v1', 'v2', 'v2', 'v3'):
+            (self.static_dir / 'src' / 'js' / 'page.js').write_text(f"console.log('{version}');\n")
+            built.append(self.pipeline.build()['js/page.js'])
+        old, previous, _, new = built
+
+        self.assertEqual(len({old, previous, new}), 3)
+        # The previous build stays for pages cached before the deploy; a repeat build is not a new one
+        self.assertTrue((self.static_dir / 'dist' / previous).exists())
+        self.assertTrue((self.static_dir / 'dist' / (previous + '.gz')).exists())
+        self.assertFalse((self.static_dir / 'dist' / old).exists())
+        self.assertFalse((self.static_dir / 'dist' / (old + '.gz')).exists())
+        self.assertTrue((self.static_dir / 'dist' / new).exists())
+
+        # Another process sees the rebuilt manifest
+        other = AssetPipeline(static_dir=str(self.static_dir))
+        self.assertEqual(other.url_path('js/page.js'), f'dist/{new}')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# tests/test_audio_chunker.py
+
+import unittest
+import os
+import sys
+from unittest.mock import patch
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.AudioChunker import AudioChunker, NUMPY_AVAILABLE
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+    from components.AudioChunker import frame_rms, find_silence_runs, ANALYSIS_SAMPLE_RATE
+
+class TestAudioChunker(unittest.TestCase):
+    """Test case for the AudioChunker component."""
+
+    def test_plan_chunks_uses_break_points(self):
+        """Test that cuts move to silences and a short tail is folded in."""
+        chunker = AudioChunker(search_seconds=30)
+        with patch.object(chunker, 'find_break_point', side_effect=[590.0, None]) as mock_break:
+            chunks = chunker.plan_chunks('space.mp3', chunk_seconds=600, duration=1200)
+
+        self.assertEqual([(c['start_seconds'], c['end_seconds']) for c in chunks], [(0.0, 590.0), (590.0, 1200)])
+        # Only the last 30 seconds before each cut are searched
+        mock_break.assert_any_call('space.mp3', 570, 600)
+        mock_break.assert_any_call('space.mp3', 1160.0, 1190.0)
+
+    def test_plan_chunks_fixed_grid(self):
+        """Test fixed-length planning without silence search."""
+        chunker = AudioChunker()
+        with patch.object(chunker, 'find_break_point') as mock_break:
+            chunks = chunker.plan_chunks('space.mp3', chunk_seconds=30, min_chunk_seconds=0,
+                                         duration=75, find_breaks=False)
+        mock_break.assert_not_called()
+        self.assertEqual([c['start_seconds'] for c in chunks], [0.0, 30.0, 60.0])
+        self.assertAlmostEqual(chunks[-1]['duration_seconds'], 15.0)
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+    def test_silence_runs_from_energy(self):
+        """Test vectorised RMS and silence-run detection."""
+        rate = ANALYSIS_SAMPLE_RATE
+        tone = (np.sin(np.arange(rate) / 5.0) * 8000).astype(np.int16)
+        samples = np.concatenate([tone, np.zeros(rate // 2, dtype=np.int16), tone])
+
+        rms = frame_rms(samples, rate // 50)
+        self.assertEqual(len(rms), 125)
+        runs = find_silence_runs(rms, threshold=100.0, min_frames=10)
+        self.assertEqual(runs, [(50, 75)])
+        self.assertEqual(find_silence_runs(rms, threshold=100.0, min_frames=30), [])
+
+if __name__ == '__main__':
+    unittest.main()
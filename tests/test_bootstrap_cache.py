@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# tests/test_bootstrap_cache.py
+
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.BootstrapCache import BootstrapCache
+
+class TestBootstrapCache(unittest.TestCase):
+    """Test case for the BootstrapCache component."""
+
+    def setUp(self):
+        """Create two caches sharing one versions database, like two web workers."""
+        self.temp_dir = tempfile.mkdtemp()
+        db_path = os.path.join(self.temp_dir, 'bootstrap_cache.db')
+        self.worker_a = BootstrapCache(db_path)
+        self.worker_b = BootstrapCache(db_path)
+        self.loads = []
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def loader(self, value):
+        """Build a loader that records each call."""
+        def load():
+            self.loads.append(value)
+            return value
+        return load
+
+    def test_cached_until_invalidated_by_another_instance(self):
+        """Test that an invalidation in one instance makes the other reload."""
+        self.assertEqual(self.worker_b.get('space1', 'notes', self.loader('old')), 'old')
+        self.assertEqual(self.worker_b.get('space1', 'notes', self.loader('new')), 'old')
+        self.assertEqual(self.loads, ['old'])
+
+        self.worker_a.invalidate('space1', 'notes')
+        self.assertEqual(self.worker_b.get('space1', 'notes', self.loader('new')), 'new')
+        self.assertEqual(self.worker_b.get('space1', 'notes', self.loader('newer')), 'new')
+
+    def test_space_and_global_invalidation(self):
+        """Test that whole-space and global invalidations reach the other instance."""
+        self.worker_b.get('space1', 'notes', self.loader('notes'))
+        self.worker_b.get('space1', 'reviews', self.loader('reviews'))
+        self.worker_b.get('space2', 'notes', self.loader('other'))
+
+        self.worker_a.invalidate('space1')
+        self.worker_b.get('space1', 'notes', self.loader('notes'))
+        self.worker_b.get('space1', 'reviews', self.loader('reviews'))
+        self.worker_b.get('space2', 'notes', self.loader('other'))
+        self.assertEqual(self.loads, ['notes', 'reviews', 'other', 'notes', 'reviews'])
+
+        self.worker_a.invalidate()
+        self.worker_b.get('space2', 'notes', self.loader('other'))
+        self.assertEqual(self.loads[-1], 'other')
+        self.assertEqual(len(self.loads), 6)
+
+    def test_expired_entries_reload(self):
+        """Test that entries older than the TTL are loaded again."""
+        self.worker_b.ttl = 0
+        self.worker_b.get('space1', 'notes', self.loader('first'))
+        self.worker_b.get('space1', 'notes', self.loader('second'))
+        self.assertEqual(self.loads, ['first', 'second'])
+
+if __name__ == '__main__':
+    unittest.main()
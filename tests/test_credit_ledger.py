@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# tests/test_credit_ledger.py
+
+import unittest
+import os
+import re
+import sys
+from contextlib import contextmanager
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.CreditLedger import CreditLedger, space_cost_column
+
+class FakeConnection:
+    """Runs the ledger's statements against in-memory tables; writes apply on commit."""
+
+    def __init__(self, db):
+        self.db = db
+        self.staged = []
+        self.rows = []
+
+    def cursor(self):
+        return self
+
+    def execute(self, query, params=()):
+        query = ' '.join(query.split())
+        self.db.queries.append(query)
+        params = list(params or ())
+        if query.startswith('SELECT credits FROM users'):
+            credits = self.db.users.get(params[0])
+            self.rows = [(credits,)] if credits is not None else []
+        elif query.startswith('SHOW COLUMNS'):
+            self.rows = [('idempotency_key',)] if self.db.key_column else []
+        elif query.startswith('SELECT idempotency_key'):
+            keys = {row.get('idempotency_key') for row in self.db.transactions}
+            self.rows = [(key,) for key in params if key in keys]
+        elif query.startswith(('UPDATE users', 'INSERT INTO transactions', 'INSERT INTO space_cost')):
+            self.staged.append((query, params))
+        else:
+            raise AssertionError(f"unexpected query: {query}")
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def close(self):
+        pass
+
+    def rollback(self):
+        self.staged = []
+
+    def commit(self):
+        for query, params in self.staged:
+            if query.startswith('UPDATE users'):
+                self.db.users[params[1]] = max(0.0, self.db.users[params[1]] - params[0])
+            elif query.startswith('INSERT INTO transactions'):
+                columns = re.search(r'\((.*?)\)', query).group(1).split(', ')
+                for start in range(0, len(params), len(columns)):
+                    self.db.transactions.append(dict(zip(columns, params[start:start + len(columns)])))
+            else:
+                column = re.search(r'space_id, (\w+)\)', query).group(1)
+                for space_id, cost in zip(params[::2], params[1::2]):
+                    self.db.space_cost[(space_id, column)] = self.db.space_cost.get((space_id, column), 0.0) + cost
+        self.staged = []
+        if self.db.lose_commit_ack:
+            self.db.lose_commit_ack = False
+            raise ConnectionError("connection lost after commit")
+
+class FakeDatabase:
+    """Stands in for DatabaseManager with users, transactions and space_cost tables."""
+
+    def __init__(self):
+        self.users = {1: 100.0}
+        self.transactions = []
+        self.space_cost = {}
+        self.queries = []
+        self.key_column = True
+        self.lose_commit_ack = False
+
+    @contextmanager
+    def get_connection(self):
+        yield FakeConnection(self)
+
+class TestCreditLedger(unittest.TestCase):
+    """Test case for batched, idempotent credit charges."""
+
+    def setUp(self):
+        """Create a ledger over a fake database."""
+        self.db = FakeDatabase()
+        self.ledger = CreditLedger(db=self.db)
+
+    def charges(self, count, cost=2.0):
+        return [self.ledger.make_charge('space1' if index % 2 else 'space2', 'translation (en -> es)',
+                                        'openai/gpt-4o-mini', 100, 50, cost)
+                for index in range(count)]
+
+    def writes(self):
+        return [query for query in self.db.queries if query.startswith(('UPDATE', 'INSERT'))]
+
+    def test_batch_is_one_update_and_one_insert(self):
+        """Test that a job's charges are applied with one debit and one multi-row insert."""
+        success, message, result = self.ledger.apply(1, 'cookie', self.charges(10), job_key='job1')
+        self.assertTrue(success, message)
+        self.assertEqual((result['cost'], result['balance_before'], result['balance_after']), (20.0, 100.0, 80.0))
+        self.assertEqual(self.db.users[1], 80.0)
+        self.assertEqual(len(self.writes()), 3)
+        self.assertEqual(len(self.db.transactions), 10)
+        self.assertEqual([row['balance_after'] for row in self.db.transactions[:3]], [98.0, 96.0, 94.0])
+        self.assertEqual(self.db.transactions[0]['idempotency_key'], 'job1:0')
+        self.assertEqual(self.db.space_cost, {('space1', 'translation_cost'): 10.0, ('space2', 'translation_cost'): 10.0})
+
+    def test_insufficient_credits_write_nothing(self):
+        """Test that a batch larger than the balance is rejected as a whole."""
+        success, message, _ = self.ledger.apply(1, None, self.charges(3, cost=40.0))
+        self.assertFalse(success)
+        self.assertIn('Insufficient credits', message)
+        self.assertEqual((self.db.users[1], self.db.transactions), (100.0, []))
+
+    def test_retries_and_repeats_are_not_charged_twice(self):
+        """Test that a batch retried after a lost commit, or applied again, is charged once."""
+        self.db.lose_commit_ack = True
+        success, _, result = self.ledger.apply(1, None, self.charges(4), job_key='job2')
+        self.assertTrue(success)
+        self.assertEqual(result['duplicates'], 4)
+        self.assertEqual((self.db.users[1], len(self.db.transactions)), (92.0, 4))
+
+        success, message, result = self.ledger.apply(1, None, self.charges(5), job_key='job2')
+        self.assertTrue(success)
+        self.assertEqual((result['charges'], result['duplicates']), (1, 4))
+        self.assertEqual((self.db.users[1], len(self.db.transactions)), (90.0, 5))
+
+    def test_record_without_deducting(self):
+        """Test that deduct=False records the charges and leaves the balance alone."""
+        success, _, result = self.ledger.apply(1, None, self.charges(2), deduct=False)
+        self.assertTrue(success)
+        self.assertEqual((self.db.users[1], result['balance_after']), (100.0, 100.0))
+        self.assertEqual(len(self.db.transactions), 2)
+
+    def test_missing_key_column_still_charges(self):
+        """Test that charges are recorded without keys before the migration is applied."""
+        self.db.key_column = False
+        self.assertTrue(self.ledger.apply(1, None, self.charges(2))[0])
+        self.assertNotIn('idempotency_key', self.db.transactions[0])
+        self.assertEqual(self.db.users[1], 96.0)
+
+    def test_key_column_is_checked_again(self):
+        """Test that keys are used once the migration is applied, without a restart."""
+        self.db.key_column = False
+        self.assertTrue(self.ledger.apply(1, None, self.charges(1), job_key='job3')[0])
+        self.db.key_column = True
+        self.assertTrue(self.ledger.apply(1, None, self.charges(1), job_key='job4')[0])
+        self.assertNotIn('idempotency_key', self.db.transactions[1])
+
+        self.ledger.key_column_check_interval = 0
+        self.assertTrue(self.ledger.apply(1, None, self.charges(1), job_key='job5')[0])
+        self.assertEqual(self.db.transactions[2]['idempotency_key'], 'job5:0')
+
+    def test_balance_cache(self):
+        """Test that balances are served from cache, kept current by apply() and invalidated on demand."""
+        self.assertEqual(self.ledger.get_balance(1), 100.0)
+        self.db.users[1] = 150.0
+        self.assertEqual(self.ledger.get_balance(1), 100.0)
+        self.assertEqual(self.ledger.get_balance(1, max_age=0), 150.0)
+
+        self.ledger.apply(1, None, self.charges(1))
+        reads = len(self.db.queries)
+        self.assertEqual(self.ledger.get_balance(1), 148.0)
+        self.assertEqual(len(self.db.queries), reads)
+
+        self.db.users[1] = 500.0
+        self.ledger.invalidate_balance(1)
+        self.assertEqual(self.ledger.get_balance(1), 500.0)
+        self.assertEqual(self.ledger.get_balance(42), 0.0)
+
+    def test_space_cost_column(self):
+        """Test the action to space_cost column mapping."""
+        self.assertEqual(space_cost_column('translation (en -> es)'), 'translation_cost')
+        self.assertEqual(space_cost_column('tag_generation'), 'transcription_cost')
+        self.assertIsNone(space_cost_column('mp3_download'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# tests/test_keyword_index.py
+
+import unittest
+import os
+import sys
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components import KeywordIndex as keyword_module
+from components.KeywordIndex import KeywordIndex, extract_terms, score_terms
+
+FILLER = ("[00:00:00] Welcome to the community call. We have a question from the community.\n"
+          "[00:00:10] The community question is about the weekly update.\n") * 3
+
+class TestKeywordIndex(unittest.TestCase):
+    """Test case for the KeywordIndex component."""
+
+    def setUp(self):
+        """Set up an in-memory index with a small corpus of transcripts."""
+        self.index = KeywordIndex(':memory:')
+        for number in range(12):
+            self.index.index_document(f'filler_{number}', 'en', FILLER + f"Gardening with tomatoes {number}. "
+                                      "Tomatoes like sun. Tomatoes like water.")
+        self.topic = FILLER + ("Today Elon Musk talked about Tesla batteries. Elon Musk said Tesla "
+                               "batteries keep getting cheaper. Later Elon Musk compared Tesla with BYD.")
+
+    def test_extract_terms(self):
+        """Test that stop words and timecodes are skipped and proper nouns keep their spelling."""
+        counts, display = extract_terms(self.topic)
+        self.assertEqual(counts['elon musk'], 3)
+        self.assertEqual(counts['tesla batteries'], 2)
+        self.assertNotIn('the', counts)
+        self.assertNotIn('00', counts)
+        self.assertEqual(display['elon musk'], 'Elon Musk')
+        self.assertNotIn('batteries', display)
+
+    def test_suggest_tags_prefers_distinctive_terms(self):
+        """Test that corpus-wide words lose to the subjects of this transcript."""
+        tags = self.index.suggest_tags(self.topic, max_tags=3)
+        self.assertEqual(tags[0], 'Elon Musk')
+        self.assertIn('Tesla', tags)
+        self.assertNotIn('community', [tag.lower() for tag in tags])
+        # Overlapping terms are not repeated
+        self.assertNotIn('Elon', tags)
+
+    def test_frequencies_follow_updates(self):
+        """Test that replacing and removing transcripts keeps document frequencies exact."""
+        self.assertEqual(self.index.get_frequencies(['tomatoes'])['tomatoes'], 12)
+        self.index.index_document('filler_0', 'en', self.topic)
+        self.assertEqual(self.index.get_frequencies(['tomatoes'])['tomatoes'], 11)
+        self.assertEqual(self.index.get_frequencies(['tesla'])['tesla'], 1)
+
+        self.index.remove_document('filler_0')
+        self.assertEqual(self.index.get_frequencies(['tesla']), {})
+        self.assertEqual(self.index.get_stats()['documents'], 11)
+
+    def test_tag_documents_and_common_terms(self):
+        """Test batch tagging of the indexed corpus and detection of common words."""
+        self.index.index_document('space_topic', 'en', self.topic)
+        results = {space_id: tags for space_id, _, tags in self.index.tag_documents(max_tags=3)}
+        self.assertEqual(len(results), 13)
+        self.assertEqual(results['space_topic'][0], 'Elon Musk')
+        self.assertEqual(results['filler_3'], [])
+
+        common = self.index.common_terms(min_ratio=0.5)
+        self.assertIn('community', common)
+        self.assertNotIn('tesla', common)
+        self.assertEqual(KeywordIndex(':memory:').common_terms(), [])
+
+    def test_scoring_without_numpy(self):
+        """Test that the pure Python scorer ranks like the vectorised one."""
+        counts, display = extract_terms(self.topic)
+        frequencies = self.index.get_frequencies(counts)
+        expected = score_terms(counts, display, frequencies, 13, max_tags=5)
+
+        original = keyword_module.NUMPY_AVAILABLE
+        keyword_module.NUMPY_AVAILABLE = False
+        try:
+            self.assertEqual(score_terms(counts, display, frequencies, 13, max_tags=5), expected)
+        finally:
+            keyword_module.NUMPY_AVAILABLE = original
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# tests/test_language_identifier.py
+
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.LanguageIdentifier import LanguageIdentifier, combine_votes, sample_window_starts
+from components.TranscriptCache import TranscriptCache
+
+class TestLanguageIdentifier(unittest.TestCase):
+    """Test case for the LanguageIdentifier component."""
+
+    def setUp(self):
+        """Create a temporary audio file and cache directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.audio_file = os.path.join(self.temp_dir, 'space.mp3')
+        with open(self.audio_file, 'wb') as f:
+            f.write(b'fake audio contents' * 100)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_window_sampling(self):
+        """Test that windows are spread through the recording and stay inside it."""
+        self.assertEqual(sample_window_starts(None), [0.0])
+        self.assertEqual(sample_window_starts(20.0), [0.0])
+        self.assertEqual(sample_window_starts(3600.0, windows=3, window_seconds=30.0), [885.0, 1785.0, 2685.0])
+        self.assertEqual(sample_window_starts(600.0, windows=1, window_seconds=30.0), [285.0])
+
+        starts = sample_window_starts(40.0, windows=5, window_seconds=30.0)
+        self.assertTrue(all(0.0 <= start <= 10.0 for start in starts))
+        self.assertEqual(len(starts), len(set(starts)))
+
+    def test_combine_votes(self):
+        """Test that probabilities are summed across windows and empty windows ignored."""
+        votes = [{'en': 0.6, 'es': 0.4}, None, {'en': 0.2, 'es': 0.8}, {'es': 0.9, 'en': 0.1}]
+        language, confidence = combine_votes(votes)
+        self.assertEqual(language, 'es')
+        self.assertAlmostEqual(confidence, 0.7)
+        self.assertEqual(combine_votes([None, {}]), (None, 0.0))
+
+    def test_identify_caches_by_fingerprint(self):
+        """Test that a second identification of the same audio does not sample again."""
+        calls = []
+
+        def detect_window(audio_file, start, seconds):
+            calls.append(start)
+            return {'fr': 0.9, 'en': 0.1}
+
+        cache = TranscriptCache(cache_dir=os.path.join(self.temp_dir, 'cache'))
+        identifier = LanguageIdentifier(windows=3, cache=cache)
+
+        self.assertEqual(identifier.identify(self.audio_file, 3600.0, detect_window, method='test'), ('fr', 0.9))
+        self.assertEqual(len(calls), 3)
+
+        self.assertEqual(identifier.identify(self.audio_file, 3600.0, detect_window, method='test'), ('fr', 0.9))
+        self.assertEqual(len(calls), 3)
+
+        # The confidence is kept in the entry's metadata, not in the result fields
+        key = cache.make_key(self.audio_file, 'language-id', 'test', None, {'windows': 3, 'window_seconds': 30.0})
+        self.assertEqual(cache.get(key)['duration'], 0)
+        self.assertEqual(cache.get_entry(key)['metadata']['confidence'], 0.9)
+
+        # Another engine or window count is a separate answer
+        LanguageIdentifier(windows=2, cache=cache).identify(self.audio_file, 3600.0, detect_window, method='test')
+        self.assertEqual(len(calls), 5)
+
+    def test_failed_windows(self):
+        """Test that failing windows are skipped and nothing is cached when all fail."""
+        def detect_window(audio_file, start, seconds):
+            if start > 1000:
+                raise RuntimeError('decode failed')
+            return {'de': 0.8}
+
+        cache = TranscriptCache(cache_dir=os.path.join(self.temp_dir, 'cache'))
+        identifier = LanguageIdentifier(windows=3, cache=cache)
+        self.assertEqual(identifier.identify(self.audio_file, 3600.0, detect_window, method='partial'), ('de', 0.8))
+
+        failing = LanguageIdentifier(windows=3, cache=cache)
+        self.assertEqual(failing.identify(self.audio_file, 3600.0, lambda *args: None, method='none'), (None, 0.0))
+        self.assertEqual(cache.get_stats()['entries'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# tests/test_log_reader.py
+
+import unittest
+import os
+import re
+import sys
+import shutil
+import tempfile
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.LogReader import LogReader, parse_log_line
+
+class TestLogReader(unittest.TestCase):
+    """Test case for the LogReader component."""
+
+    def setUp(self):
+        """Create log files and a reader with tiny blocks to exercise block boundaries."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.app_log = os.path.join(self.temp_dir, 'app.log')
+        self.space_log = os.path.join(self.temp_dir, 'space.log')
+        self.reader = LogReader(block_size=64, checkpoint_interval=10)
+
+        with open(self.app_log, 'w') as f:
+            for number in range(100):
+                level = 'ERROR' if number % 10 == 0 else 'INFO'
+                f.write(f"2025-01-01 00:00:{number % 60:02d},{number:03d} - webapp - {level} - message {number}\n")
+                if number == 50:
+                    f.write("Traceback (most recent call last):\n  File \"app.py\", line 1\n")
+
+    def tearDown(self):
+        """Remove temporary log files."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_parse_log_line_formats(self):
+        """Test parsing the component and SQL log formats."""
+        entry = parse_log_line("2025-01-01 10:00:00 - space_component - WARNING - a - b", 'space')
+        self.assertEqual(entry['component'], 'space_component')
+        self.assertEqual(entry['level'], 'WARNING')
+        self.assertEqual(entry['message'], 'a - b')
+
+        entry = parse_log_line("2025-01-01 10:00:00 - ERROR - [Space] ERROR (1.00ms) - SELECT 1", 'sql_queries')
+        self.assertEqual(entry['component'], 'sql_queries')
+        self.assertEqual(entry['level'], 'ERROR')
+        self.assertEqual(entry['message'], '[Space] ERROR (1.00ms) - SELECT 1')
+
+        self.assertIsNone(parse_log_line("  File \"app.py\", line 1", 'app'))
+
+    def test_pages_newest_first_with_tracebacks(self):
+        """Test paging across block boundaries and folding continuation lines."""
+        first = self.reader.read_entries(self.app_log, offset=0, limit=5)
+        self.assertEqual([e['message'] for e in first['entries']],
+                         [f'message {n}' for n in range(99, 94, -1)])
+        self.assertTrue(first['has_more'])
+        self.assertEqual(first['next_offset'], 5)
+
+        page = self.reader.read_entries(self.app_log, offset=49, limit=1)
+        self.assertTrue(page['entries'][0]['message'].startswith('message 50\nTraceback'))
+
+        last = self.reader.read_entries(self.app_log, offset=95, limit=10)
+        self.assertEqual(len(last['entries']), 5)
+        self.assertEqual(last['entries'][-1]['message'], 'message 0')
+        self.assertFalse(last['has_more'])
+
+    def test_checkpoints_survive_appends(self):
+        """Test that the sparse index is reused and shifted when the file grows."""
+        self.reader.read_entries(self.app_log, offset=0, limit=100)
+        index = next(iter(self.reader._indexes.values()))
+        self.assertIn(50, index['checkpoints'])
+
+        with open(self.app_log, 'a') as f:
+            f.write("2025-01-01 00:01:40,100 - webapp - INFO - message 100\n")
+            f.write("2025-01-01 00:01:41,101 - webapp - INFO - message 101\n")
+
+        page = self.reader.read_entries(self.app_log, offset=52, limit=2)
+        self.assertEqual([e['message'].split('\n')[0] for e in page['entries']], ['message 49', 'message 48'])
+        index = next(iter(self.reader._indexes.values()))
+        self.assertIn(52, index['checkpoints'])
+
+    def test_level_and_component_filters(self):
+        """Test filtering while streaming."""
+        errors = self.reader.read_entries(self.app_log, limit=100, levels=['error'])
+        self.assertEqual(len(errors['entries']), 10)
+        self.assertTrue(all(e['level'] == 'ERROR' for e in errors['entries']))
+
+        self.assertEqual(self.reader.read_entries(self.app_log, component='nomatch')['entries'], [])
+        self.assertEqual(len(self.reader.read_entries(self.app_log, limit=3, component='WEB')['entries']), 3)
+
+    def test_message_pattern_pages_seek_from_checkpoints(self):
+        """Test that a message filter counts only matching entries and gets its own checkpoints."""
+        pattern = r'message \d*[05]\b'
+        matching = self.reader.read_entries(self.app_log, limit=100, message_pattern=pattern)
+        self.assertEqual(len(matching['entries']), 20)
+        self.assertEqual(matching['total'], 20)
+        index = self.reader._indexes[(self.app_log, (None, None, re.compile(pattern)))]
+        self.assertIn(10, index['checkpoints'])
+
+        page = self.reader.read_entries(self.app_log, offset=12, limit=2, message_pattern=pattern)
+        self.assertEqual([e['message'] for e in page['entries']], ['message 35', 'message 30'])
+
+    def test_read_merged_orders_by_timestamp(self):
+        """Test merging several files by timestamp."""
+        with open(self.space_log, 'w') as f:
+            f.write("2025-01-01 00:00:59,500 - space_component - INFO - space late\n")
+            f.write("2025-01-02 00:00:00 - space_component - INFO - space newest\n")
+
+        merged = self.reader.read_merged([self.app_log, self.space_log], offset=0, limit=3)
+        messages = [e['message'] for e in merged['entries']]
+        self.assertEqual(messages[0], 'space newest')
+        self.assertEqual(merged['entries'][0]['source'], 'space')
+        self.assertIn('space late', messages[1:])
+        self.assertTrue(merged['has_more'])
+
+        missing = self.reader.read_merged([os.path.join(self.temp_dir, 'missing.log'), self.space_log], limit=10)
+        self.assertEqual(len(missing['entries']), 2)
+        self.assertFalse(missing['has_more'])
+
+    def test_totals_come_from_the_index(self):
+        """Test that totals are unknown until a read reaches the start, then follow appends."""
+        self.assertIsNone(self.reader.read_entries(self.app_log, limit=5)['total'])
+        self.assertEqual(self.reader.read_entries(self.app_log, offset=95, limit=10)['total'], 100)
+
+        with open(self.app_log, 'a') as f:
+            f.write("2025-01-01 00:01:40,100 - webapp - ERROR - message 100\n")
+        self.assertEqual(self.reader.read_entries(self.app_log, limit=5)['total'], 101)
+        self.assertIsNone(self.reader.read_entries(self.app_log, limit=5, levels=['ERROR'])['total'])
+
+    def test_read_merged_resumes_from_checkpoints(self):
+        """Test that deep merged pages match a full merge and reuse the merged index."""
+        with open(self.space_log, 'w') as f:
+            for number in range(100):
+                f.write(f"2025-01-01 00:00:{number % 60:02d},{number:03d}5 - space_component - INFO - space {number}\n")
+        paths = [self.app_log, self.space_log]
+        expected = [e['message'] for e in self.reader.iter_merged(paths)]
+
+        first = self.reader.read_merged(paths, offset=0, limit=200)
+        self.assertEqual([e['message'] for e in first['entries']], expected)
+        self.assertEqual(first['total'], 200)
+        index = self.reader._indexes[(tuple(paths), (None, None, None))]
+        self.assertIn(150, index['checkpoints'])
+
+        # A deep page starts from a checkpoint instead of the end of both files
+        page = self.reader.read_merged(paths, offset=155, limit=10)
+        self.assertEqual([e['message'] for e in page['entries']], expected[155:165])
+
+        with open(self.space_log, 'a') as f:
+            f.write("2025-01-02 00:00:00 - space_component - INFO - space newest\n")
+        page = self.reader.read_merged(paths, offset=156, limit=10)
+        self.assertEqual([e['message'] for e in page['entries']], expected[155:165])
+        self.assertEqual(page['total'], 201)
+
+if __name__ == '__main__':
+    unittest.main()
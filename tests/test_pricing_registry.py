@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# tests/test_pricing_registry.py
+
+import unittest
+import os
+import sys
+from contextlib import contextmanager
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.PricingRegistry import PricingRegistry
+
+class FakeCursor:
+    """Answers the registry's queries from in-memory tables."""
+
+    def __init__(self, db):
+        self.db = db
+        self.rows = []
+
+    def execute(self, query, params=None):
+        self.db.queries.append(' '.join(query.split()))
+        if 'FROM ai_api_cost' in query:
+            self.rows = [(vendor, model, costs[0], costs[1]) for (vendor, model), costs in self.db.prices.items()]
+        elif 'INSERT INTO app_settings' in query:
+            self.db.settings[params[0]] = str(int(self.db.settings.get(params[0], 0)) + 1)
+        else:
+            value = self.db.settings.get(params[0])
+            self.rows = [(value,)] if value is not None else []
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def close(self):
+        pass
+
+class FakeDatabase:
+    """Stands in for DatabaseManager; counts queries and can be taken down."""
+
+    def __init__(self):
+        self.prices = {('openai', 'gpt-4o-mini'): (0.15, 0.60)}
+        self.settings = {'ai_pricing_version': '1', 'compute_cost_per_second': '0.002'}
+        self.queries = []
+        self.down = False
+
+    @contextmanager
+    def get_connection(self):
+        if self.down:
+            raise ConnectionError("database unavailable")
+        yield self
+
+    def cursor(self):
+        return FakeCursor(self)
+
+class TestPricingRegistry(unittest.TestCase):
+    """Test case for the in-memory AI pricing registry."""
+
+    def setUp(self):
+        """Create a registry over a fake database."""
+        self.db = FakeDatabase()
+        self.registry = PricingRegistry(db=self.db, check_interval=60)
+
+    def test_prices_are_loaded_once(self):
+        """Test that repeated lookups are answered from memory."""
+        for _ in range(50):
+            self.assertEqual(self.registry.get_model_costs('OpenAI', 'gpt-4o-mini'),
+                             {'input_cost_per_million': 0.15, 'output_cost_per_million': 0.60})
+            self.assertEqual(self.registry.get_compute_cost_per_second(), 0.002)
+        self.assertIsNone(self.registry.get_model_costs('openai', 'unknown-model'))
+        self.assertEqual(len(self.db.queries), 3)
+        self.assertEqual(self.registry.get_stats()['loads'], 1)
+
+    def test_version_bump_reloads_prices(self):
+        """Test that a writer's version bump is picked up at the next check."""
+        self.registry.check_interval = 0
+        self.registry.get_model_costs('openai', 'gpt-4o-mini')
+        self.registry.get_model_costs('openai', 'gpt-4o-mini')
+        self.assertEqual(self.registry.get_stats()['loads'], 1)
+
+        self.db.prices[('openai', 'gpt-4o-mini')] = (0.30, 1.20)
+        self.registry.bump_version(self.db.cursor())
+        self.assertEqual(self.db.settings['ai_pricing_version'], '2')
+        self.assertEqual(self.registry.get_model_costs('openai', 'gpt-4o-mini')['input_cost_per_million'], 0.30)
+        self.assertEqual(self.registry.get_stats()['loads'], 2)
+
+    def test_invalidate_reloads_this_process(self):
+        """Test that invalidate() reloads at once, before the check interval passes."""
+        self.assertEqual(self.registry.get_compute_cost_per_second(), 0.002)
+        self.db.settings['compute_cost_per_second'] = '0.005'
+        self.assertEqual(self.registry.get_compute_cost_per_second(), 0.002)
+        self.registry.invalidate()
+        self.assertEqual(self.registry.get_compute_cost_per_second(), 0.005)
+
+    def test_outage_keeps_prices_and_backs_off(self):
+        """Test that a database outage keeps loaded prices and is not retried on every call."""
+        self.registry.get_model_costs('openai', 'gpt-4o-mini')
+        self.db.down = True
+        self.registry.invalidate()
+        for _ in range(10):
+            self.assertEqual(self.registry.get_model_costs('openai', 'gpt-4o-mini')['output_cost_per_million'], 0.60)
+        self.assertEqual(self.registry.get_stats()['errors'], 1)
+
+        empty = PricingRegistry(db=self.db)
+        self.assertIsNone(empty.get_model_costs('openai', 'gpt-4o-mini'))
+        self.assertEqual(empty.get_compute_cost_per_second(), 0.001)
+        self.assertEqual(empty.get_stats()['errors'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# tests/test_query_stats.py
+
+import unittest
+import os
+import sys
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.QueryStats import QueryStats, fingerprint_query, OTHER_FINGERPRINT
+
+class TestQueryStats(unittest.TestCase):
+    """Test case for the QueryStats component."""
+
+    def test_fingerprint_normalises_literals(self):
+        """Test that queries differing only in literals share a fingerprint."""
+        first = fingerprint_query("SELECT * FROM spaces WHERE space_id = 'abc' AND views > 10")
+        second = fingerprint_query("SELECT *  FROM spaces\n WHERE space_id = %s AND views > %s")
+        self.assertEqual(first, second)
+        self.assertEqual(first, "SELECT * FROM spaces WHERE space_id = ? AND views > ?")
+
+        self.assertEqual(fingerprint_query("DELETE FROM t1 WHERE id IN (1, 2, 3)"),
+                         "DELETE FROM t1 WHERE id IN (?+)")
+        self.assertEqual(fingerprint_query("INSERT INTO tags (name) VALUES (%s), (%s)"),
+                         "INSERT INTO tags (name) VALUES (?+)")
+
+    def test_percentiles_and_rows(self):
+        """Test histogram percentiles, row counts and errors."""
+        stats = QueryStats()
+        for _ in range(98):
+            stats.record('SELECT ?', 1.0, rows=2, component='Space')
+        stats.record('SELECT ?', 50.0, rows=10)
+        stats.record('SELECT ?', 900.0, error=True)
+
+        summary = stats.snapshot()[0]
+        self.assertEqual(summary['count'], 100)
+        self.assertEqual(summary['errors'], 1)
+        self.assertLessEqual(summary['p50_ms'], 1.6)
+        self.assertGreaterEqual(summary['p50_ms'], 1.0)
+        self.assertLessEqual(summary['p95_ms'], 1.6)
+        self.assertGreaterEqual(summary['p99_ms'], 50.0)
+        self.assertEqual(summary['max_ms'], 900.0)
+        self.assertEqual(summary['rows'], 206)
+        self.assertEqual(summary['max_rows'], 10)
+        self.assertEqual(summary['components'], ['Space'])
+
+    def test_fingerprint_cap_and_sorting(self):
+        """Test that new fingerprints beyond the cap are folded together."""
+        stats = QueryStats(max_fingerprints=2)
+        stats.record('A', 5.0)
+        stats.record('B', 1.0)
+        stats.record('C', 1.0)
+        stats.record('D', 1.0)
+
+        self.assertEqual(len(stats), 3)
+        by_count = stats.snapshot(sort='count')
+        self.assertEqual(by_count[0]['fingerprint'], OTHER_FINGERPRINT)
+        self.assertEqual(by_count[0]['count'], 2)
+        self.assertEqual(stats.snapshot(sort='max_ms', limit=1)[0]['fingerprint'], 'A')
+
+        stats.reset()
+        self.assertEqual(stats.snapshot(), [])
+
+if __name__ == '__main__':
+    unittest.main()
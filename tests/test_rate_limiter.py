@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# tests/test_rate_limiter.py
+
+import unittest
+import os
+import sys
+from unittest import mock
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.RateLimiter import TokenBucket, retry_with_backoff
+
+class TestRateLimiter(unittest.TestCase):
+    """Test case for the RateLimiter helpers."""
+
+    def test_token_bucket_burst_and_refill(self):
+        """Test that the bucket allows a burst and then refills at the configured rate."""
+        bucket = TokenBucket(rate_per_minute=600, burst=3)
+        self.assertTrue(all(bucket.try_acquire() for _ in range(3)))
+        self.assertFalse(bucket.try_acquire())
+
+        # 600 per minute is one token every 0.1 seconds
+        self.assertTrue(bucket.acquire(timeout=0.5))
+        self.assertFalse(bucket.acquire(tokens=3, timeout=0.05))
+
+    def test_retry_succeeds_after_failures(self):
+        """Test retrying with a hook before every attempt."""
+        calls = []
+        attempts = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ConnectionError('temporary')
+            return 'ok'
+
+        with mock.patch('components.RateLimiter.time.sleep') as sleep:
+            result = retry_with_backoff(flaky, attempts=3, base_delay=1.0,
+                                        before_attempt=lambda: attempts.append(1))
+
+        self.assertEqual(result, 'ok')
+        self.assertEqual(len(attempts), 3)
+        delays = [call.args[0] for call in sleep.call_args_list]
+        self.assertEqual(len(delays), 2)
+        self.assertTrue(0.5 <= delays[0] <= 1.0)
+        self.assertTrue(1.0 <= delays[1] <= 2.0)
+
+    def test_retry_gives_up_and_respects_retry_on(self):
+        """Test that the last error is raised and other errors are not retried."""
+        with mock.patch('components.RateLimiter.time.sleep'):
+            with self.assertRaises(ConnectionError):
+                retry_with_backoff(mock.Mock(side_effect=ConnectionError('down')), attempts=2)
+
+            func = mock.Mock(side_effect=ValueError('bad request'))
+            with self.assertRaises(ValueError):
+                retry_with_backoff(func, attempts=3, retry_on=(ConnectionError,))
+            self.assertEqual(func.call_count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
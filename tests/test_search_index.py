@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# tests/test_search_index.py
+
+import unittest
+import os
+import sys
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.SearchIndex import (
+    SearchIndex, build_match_query, split_transcript_into_passages
+)
+
+class TestSearchIndex(unittest.TestCase):
+    """Test case for the SearchIndex component."""
+
+    def setUp(self):
+        """Set up an in-memory index with a small corpus of spaces."""
+        self.index = SearchIndex(':memory:')
+        self.index.index_space('space_a', 'Bitcoin ETF approval', 'Alice @alice', ['crypto', 'finance'])
+        self.index.index_space('space_b', 'Gardening chat', 'Bob @bob', ['plants'])
+        # Filler spaces so term statistics resemble a real corpus
+        for number in range(10):
+            self.index.index_space(f'filler_{number}', f'Weekly community call {number}', 'Host', ['community'])
+
+        lines = []
+        for minute in range(60):
+            if minute == 42:
+                lines.append(f"[00:{minute:02d}:00] We finally talked about bitcoin <b>mining</b>")
+            else:
+                lines.append(f"[00:{minute:02d}:00] Tomatoes need plenty of sun and water, minute {minute}")
+        self.index.index_transcript('space_b', 'en-US', "\n".join(lines))
+
+    def test_build_match_query(self):
+        """Test converting raw queries into FTS5 expressions."""
+        self.assertEqual(build_match_query('bitcoin'), '"bitcoin"*')
+        self.assertEqual(build_match_query('bitcoin etf '), '"bitcoin" "etf"')
+        self.assertEqual(build_match_query('"spot etf" sec'), '"spot etf" "sec"*')
+        self.assertIsNone(build_match_query('  '))
+        self.assertIsNone(build_match_query('"" *'))
+
+    def test_split_transcript_keeps_timecodes(self):
+        """Test that passages start at the timecode of their first line."""
+        text = "\n".join(f"[01:00:{second:02d}] " + "word " * 40 for second in range(10))
+        passages = split_transcript_into_passages(text, target_chars=400)
+        self.assertGreater(len(passages), 1)
+        self.assertEqual(passages[0][0], 3600)
+        for start, passage in passages:
+            self.assertIsNotNone(start)
+            self.assertNotIn('[01:', passage)
+
+    def test_search_ranks_title_and_transcript_hits(self):
+        """Test ranking, highlighting and timecode hits."""
+        results = self.index.search('bitcoin')
+        self.assertEqual(results['total'], 2)
+        space_ids = [result['space_id'] for result in results['results']]
+        self.assertEqual(space_ids[0], 'space_a')
+        self.assertIn('<mark>Bitcoin</mark>', results['results'][0]['title'])
+
+        transcript_result = results['results'][1]
+        self.assertEqual(transcript_result['transcript_hit_count'], 1)
+        hit = transcript_result['transcript_hits'][0]
+        self.assertEqual(hit['language'], 'en-US')
+        self.assertLessEqual(hit['start_seconds'], 42 * 60)
+        self.assertIn('<mark>bitcoin</mark>', hit['snippet'])
+        # Transcript text is escaped before highlighting
+        self.assertIn('&lt;b&gt;mining&lt;/b&gt;', hit['snippet'])
+
+    def test_search_pagination_and_language_filter(self):
+        """Test paging and filtering transcripts by language."""
+        page = self.index.search('bitcoin', page=2, per_page=1)
+        self.assertEqual(page['pages'], 2)
+        self.assertEqual(len(page['results']), 1)
+        self.assertEqual(page['results'][0]['space_id'], 'space_b')
+
+        self.assertEqual(self.index.search('tomatoes', language='fr')['total'], 0)
+        self.assertEqual(self.index.search('tomatoes', language='en-US')['total'], 1)
+
+    def test_incremental_updates(self):
+        """Test that re-indexing and removal replace previous documents."""
+        self.index.index_space('space_a', 'Ethereum merge', 'Alice @alice', ['crypto'])
+        self.assertEqual(self.index.search('etf')['total'], 0)
+        self.assertEqual(self.index.search('ethereum')['total'], 1)
+
+        self.index.index_transcript('space_b', 'en-US', "[00:00:05] Only cucumbers now")
+        self.assertEqual(self.index.search('tomatoes')['total'], 0)
+        self.assertEqual(self.index.search('cucumbers')['results'][0]['transcript_hits'][0]['timecode'], '00:00:05')
+
+        self.index.remove_space('space_b')
+        self.assertEqual(self.index.search('cucumbers')['total'], 0)
+        self.assertEqual(self.index.get_stats()['spaces'], 11)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# tests/test_speech_model_cache.py
+
+import unittest
+import os
+import sys
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.SpeechModelCache import SpeechModelCache
+
+class FakeSpeechToText:
+    """Records loads and closes instead of loading Whisper."""
+
+    loads = []
+
+    def __init__(self, model_name):
+        self.model_name = model_name
+        self.provider = 'local'
+        self.model = None
+        self.closed = False
+
+    def load_model(self):
+        FakeSpeechToText.loads.append(self.model_name)
+        return self.model_name != 'broken'
+
+    def close(self):
+        self.closed = True
+
+class TestSpeechModelCache(unittest.TestCase):
+    """Test case for the SpeechModelCache component."""
+
+    def setUp(self):
+        """Reset the load log."""
+        FakeSpeechToText.loads = []
+
+    def test_reuses_models_and_evicts_least_recent(self):
+        """Test that alternating models are loaded once and the LRU one is evicted."""
+        cache = SpeechModelCache(factory=FakeSpeechToText, max_models=2)
+        tiny = cache.get('tiny')
+        for _ in range(3):
+            self.assertIs(cache.get('tiny'), tiny)
+            cache.get('base')
+        self.assertEqual(FakeSpeechToText.loads, ['tiny', 'base'])
+        self.assertEqual(cache.most_recent(), 'base')
+
+        cache.get('tiny')
+        cache.get('small')
+        self.assertNotIn('base', cache)
+        self.assertIn('tiny', cache)
+        self.assertEqual([m['model'] for m in cache.loaded_models()], ['small', 'tiny'])
+        self.assertEqual(cache.loaded_models()[1]['hits'], 4)
+
+    def test_memory_budget_and_failures(self):
+        """Test eviction by estimated memory and that failed loads are not cached."""
+        cache = SpeechModelCache(factory=FakeSpeechToText, max_models=5, memory_budget_mb=1000)
+        base = cache.get('base')
+        cache.get('small')
+        self.assertNotIn('base', cache)
+        self.assertTrue(base.closed)
+
+        # The most recent model is kept even when it alone exceeds the budget
+        cache.get('medium')
+        self.assertEqual([m['model'] for m in cache.loaded_models()], ['medium'])
+
+        self.assertIsNone(cache.get('broken'))
+        self.assertNotIn('broken', cache)
+
+        cache.clear()
+        self.assertEqual(cache.loaded_models(), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# tests/test_sqlite_store.py
+
+import unittest
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+import threading
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.SQLiteStore import SQLiteStore
+
+SCHEMA = "CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, name TEXT);"
+
+class TestSQLiteStore(unittest.TestCase):
+    """Test case for the SQLiteStore component."""
+
+    def setUp(self):
+        """Create a temporary directory for the database."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'nested', 'store.db')
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_one_connection_per_thread(self):
+        """Test that a thread reuses its connection and other threads get their own."""
+        store = SQLiteStore(self.db_path, SCHEMA)
+        connection = store.connection()
+        self.assertIs(store.connection(), connection)
+        self.assertEqual(connection.execute("PRAGMA journal_mode").fetchone()[0], 'wal')
+
+        others = []
+        thread = threading.Thread(target=lambda: others.append(store.connection()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(others[0], connection)
+
+    def test_schema_and_options(self):
+        """Test that the schema is created and row factory and autocommit follow the options."""
+        store = SQLiteStore(self.db_path, SCHEMA, autocommit=True)
+        connection = store.connection()
+        self.assertIsNone(connection.isolation_level)
+        connection.execute("INSERT INTO items (name) VALUES ('first')")
+        self.assertEqual(connection.execute("SELECT name FROM items").fetchone()['name'], 'first')
+
+        plain = SQLiteStore(self.db_path, SCHEMA, row_factory=False).connection()
+        self.assertEqual(plain.execute("SELECT name FROM items").fetchone(), ('first',))
+
+        memory = SQLiteStore(':memory:', SCHEMA).connection()
+        self.assertEqual(memory.execute("SELECT COUNT(*) FROM items").fetchone()[0], 0)
+        self.assertIsInstance(memory, sqlite3.Connection)
+
+if __name__ == '__main__':
+    unittest.main()
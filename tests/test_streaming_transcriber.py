@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# tests/test_streaming_transcriber.py
+
+import unittest
+import os
+import sys
+import math
+import shutil
+import struct
+import tempfile
+import threading
+import time
+import wave
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.StreamingTranscriber import StreamingTranscriber, format_timecoded, load_live_transcript
+
+def write_tone(path, seconds, rate=16000):
+    """Write a mono 16-bit sine tone WAV file."""
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(b''.join(struct.pack('<h', int(8000 * math.sin(2 * math.pi * 440 * i / rate)))
+                                 for i in range(int(seconds * rate))))
+
+class TestStreamingTranscriber(unittest.TestCase):
+    """Test case for the StreamingTranscriber component."""
+
+    def setUp(self):
+        """Create a temporary working directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.live_dir = os.path.join(self.temp_dir, 'live')
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_format_timecoded(self):
+        """Test that segments become [HH:MM:SS] lines and empty text is skipped."""
+        text = format_timecoded([
+            {'start': 0.4, 'end': 2, 'text': ' Hello '},
+            {'start': 3725.9, 'end': 3730, 'text': 'later'},
+            {'start': 3800, 'end': 3801, 'text': ''}
+        ])
+        self.assertEqual(text, "[00:00:00] Hello\n[01:02:05] later")
+
+    @unittest.skipUnless(shutil.which('ffmpeg'), "ffmpeg not installed")
+    def test_transcribes_growing_file_in_order(self):
+        """Test that segments of a growing download are transcribed in order and aligned."""
+        source = os.path.join(self.temp_dir, 'source.wav')
+        write_tone(source, 7.0)
+        with open(source, 'rb') as f:
+            data = f.read()
+
+        calls = []
+
+        def transcribe(path, language):
+            with wave.open(path, 'rb') as wav:
+                duration = wav.getnframes() / wav.getframerate()
+            calls.append(language)
+            return {'text': f'part {len(calls)}', 'language': 'en',
+                    'segments': [{'start': 0.0, 'end': duration, 'text': f'part {len(calls)}'}]}
+
+        part_file = os.path.join(self.temp_dir, 'space.m4a.part')
+        streamer = StreamingTranscriber('space', [os.path.join(self.temp_dir, 'space.mp3.part'), part_file],
+                                        transcribe, segment_seconds=2, max_workers=2,
+                                        live_dir=self.live_dir, poll_interval=0.05)
+        self.assertTrue(streamer.start())
+
+        def download():
+            with open(part_file, 'wb') as f:
+                for start in range(0, len(data), 16000):
+                    f.write(data[start:start + 16000])
+                    f.flush()
+                    time.sleep(0.02)
+
+        writer = threading.Thread(target=download)
+        writer.start()
+        writer.join()
+        streamer.finish_input()
+        result = streamer.finalise(offset_seconds=1.0, timeout=30)
+
+        self.assertEqual(calls[0], None)
+        self.assertTrue(all(language == 'en' for language in calls[1:]))
+        self.assertEqual([segment['text'] for segment in result['segments']],
+                         [f'part {index}' for index in range(1, len(calls) + 1)])
+        self.assertAlmostEqual(result['duration'], 6.0, delta=0.1)
+        self.assertEqual(result['segments'][0]['start'], 0.0)
+        self.assertAlmostEqual(result['segments'][1]['start'], 1.0, delta=0.05)
+
+        live = load_live_transcript('space', self.live_dir)
+        self.assertEqual(live['status'], 'completed')
+        self.assertTrue(live['text'].startswith('[00:00:00] part 1'))
+
+    def test_failed_segment_is_retried_at_finalise(self):
+        """Test that a segment that failed while streaming is transcribed again before finalising."""
+        failed_path = os.path.join(self.temp_dir, 'segment_00001.wav')
+        write_tone(failed_path, 2.0)
+        attempts = []
+
+        def transcribe(path, language):
+            attempts.append(path)
+            if len(attempts) == 1:
+                raise RuntimeError("rate limited")
+            return {'text': 'middle', 'segments': [{'start': 0.0, 'end': 2.0, 'text': 'middle'}]}
+
+        streamer = StreamingTranscriber('space', [], transcribe, live_dir=self.live_dir)
+        streamer.segments = [{'start': 0.0, 'end': 2.0, 'text': 'first'},
+                             {'start': 4.0, 'end': 6.0, 'text': 'last'}]
+        streamer.audio_seconds = 6.0
+        streamer._failed = [(failed_path, 2.0)]
+        self.assertIsNone(streamer.finalise(timeout=5))
+        self.assertIn('rate limited', streamer.error)
+
+        streamer = StreamingTranscriber('space', [], transcribe, live_dir=self.live_dir)
+        streamer.segments = [{'start': 0.0, 'end': 2.0, 'text': 'first'},
+                             {'start': 4.0, 'end': 6.0, 'text': 'last'}]
+        streamer.audio_seconds = 6.0
+        streamer._failed = [(failed_path, 2.0)]
+        result = streamer.finalise(timeout=5)
+        self.assertEqual([segment['text'] for segment in result['segments']], ['first', 'middle', 'last'])
+        self.assertEqual(result['segments'][1]['start'], 2.0)
+
+    def test_finalise_times_out(self):
+        """Test that finalise() gives up after its timeout instead of waiting for the stream."""
+        streamer = StreamingTranscriber('space', [], lambda path, language: None,
+                                        live_dir=self.live_dir, finalise_timeout=0.05)
+        streamer.segments = [{'start': 0.0, 'end': 2.0, 'text': 'first'}]
+        streamer._transcribe_thread = threading.Thread(target=streamer._stopped.wait, args=(5,))
+        streamer._transcribe_thread.start()
+        started = time.monotonic()
+        self.assertIsNone(streamer.finalise())
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertTrue(streamer._stopped.is_set())
+        streamer._transcribe_thread.join()
+        self.assertEqual(load_live_transcript('space', self.live_dir)['status'], 'failed')
+
+    def test_stop_publishes_failure(self):
+        """Test that an abandoned stream is published as failed."""
+        streamer = StreamingTranscriber('space', [], lambda path, language: None, live_dir=self.live_dir)
+        streamer.stop('Download failed')
+        live = load_live_transcript('space', self.live_dir)
+        self.assertEqual(live['status'], 'failed')
+        self.assertEqual(live['error'], 'Download failed')
+        self.assertIsNone(streamer.finalise())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# tests/test_summarizer.py
+
+import unittest
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.Summarizer import Summarizer, split_sections
+from components.SummaryJobs import SummaryJobs
+from components.TranscriptCache import TranscriptCache
+from components.TranslationExecutor import TranslationExecutor
+
+def transcript(lines):
+    return '\n'.join(f"[00:{index // 60:02d}:{index % 60:02d}] Speaker talks about subject {index} in some detail."
+                     for index in range(lines))
+
+class FakeProvider:
+    """Summarizes by keeping the first words; records every call."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def summary(self, content, max_length=None, language=None):
+        with self.lock:
+            self.calls.append((len(content), max_length, language))
+        time.sleep(self.delay)
+        words = content.split()[:max_length or 50]
+        return True, {'content': ' '.join(words), 'usage': {'input_tokens': 10, 'output_tokens': 5, 'total_tokens': 15}}
+
+class TestSummarizer(unittest.TestCase):
+    """Test case for map-reduce transcript summarization."""
+
+    def setUp(self):
+        """Create a fast executor and a temporary section cache."""
+        self.executor = TranslationExecutor(max_workers=4, requests_per_minute=60000)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.cache = TranscriptCache(cache_dir=self.temp_dir.name)
+
+    def test_split_sections(self):
+        """Test that sections end at line breaks and stay under the budget."""
+        text = transcript(100)
+        sections = split_sections(text, 1000)
+        self.assertGreater(len(sections), 5)
+        self.assertTrue(all(len(section) <= 1000 for section in sections))
+        self.assertEqual('\n'.join(sections), text)
+        self.assertEqual(split_sections("word " * 500, 1000)[0].split()[-1], 'word')
+
+    def test_short_text_is_one_call(self):
+        """Test that a transcript fitting into one section is summarized directly."""
+        provider = FakeProvider()
+        summarizer = Summarizer(provider.summary, model='fake', executor=self.executor)
+        success, result = summarizer.summarize(transcript(5), max_length=30, language='es')
+        self.assertTrue(success)
+        self.assertEqual(provider.calls, [(len(transcript(5)), 30, 'es')])
+        self.assertEqual(result['sections'], 1)
+
+    def test_map_reduce_is_parallel_and_hierarchical(self):
+        """Test that sections run concurrently and are reduced in levels before the final call."""
+        provider = FakeProvider(delay=0.02)
+        summarizer = Summarizer(provider.summary, model='fake', executor=self.executor,
+                                section_tokens=500, section_words=60)
+        progress = []
+        start = time.time()
+        success, result = summarizer.summarize(transcript(1200), max_length=100, language='fr',
+                                               on_progress=lambda percent, stage: progress.append(percent))
+        elapsed = time.time() - start
+
+        self.assertTrue(success)
+        self.assertGreater(result['sections'], 20)
+        section_calls = [call for call in provider.calls if call[1] == 60]
+        self.assertGreater(len(section_calls), result['sections'])
+        self.assertEqual(provider.calls[-1][1:], (100, 'fr'))
+        self.assertLess(elapsed, 0.02 * len(provider.calls))
+        self.assertEqual(result['usage']['total_tokens'], 15 * len(provider.calls))
+        self.assertEqual(progress[-1], 100)
+
+    def test_section_summaries_are_reused(self):
+        """Test that a re-summary at another length only makes the final call."""
+        provider = FakeProvider()
+        summarizer = Summarizer(provider.summary, model='fake', executor=self.executor,
+                                section_tokens=500, cache=self.cache)
+        text = transcript(200)
+        self.assertTrue(summarizer.summarize(text, max_length=200)[0])
+        first_calls = len(provider.calls)
+
+        success, result = summarizer.summarize(text, max_length=50, language='de')
+        self.assertTrue(success)
+        self.assertEqual(len(provider.calls), first_calls + 1)
+        self.assertEqual(result['cached_sections'], result['sections'])
+
+    def test_failed_section_fails_summary(self):
+        """Test that a section failing after retries fails the whole summary."""
+        def summary(content, max_length=None, language=None):
+            if 'subject 150 ' in content:
+                return False, {'error': 'bad request'}
+            return True, 'ok'
+
+        summarizer = Summarizer(summary, executor=TranslationExecutor(requests_per_minute=60000, max_retries=1),
+                                section_tokens=500)
+        success, result = summarizer.summarize(transcript(200))
+        self.assertFalse(success)
+        self.assertIn('error', result)
+
+class TestSummaryJobs(unittest.TestCase):
+    """Test case for background summary jobs."""
+
+    def setUp(self):
+        """Create a job runner in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.jobs = SummaryJobs(jobs_dir=self.temp_dir.name)
+
+    def wait(self, job_id):
+        for _ in range(200):
+            job = self.jobs.get(job_id)
+            if job['status'] in ('completed', 'failed'):
+                return job
+            time.sleep(0.01)
+        self.fail("job did not finish")
+
+    def test_job_reports_progress_and_result(self):
+        """Test that a job runs in the background and duplicates share it."""
+        release = threading.Event()
+
+        def run(on_progress):
+            on_progress(40, 'sections')
+            release.wait(2)
+            return {'summary': 'done'}
+
+        job = self.jobs.submit('transcript:1:200', run, {'transcript_id': 1})
+        duplicate = self.jobs.submit('transcript:1:200', run)
+        self.assertEqual(duplicate['job_id'], job['job_id'])
+
+        release.set()
+        finished = self.wait(job['job_id'])
+        self.assertEqual(finished['status'], 'completed')
+        self.assertEqual((finished['progress'], finished['result'], finished['transcript_id']), (100, {'summary': 'done'}, 1))
+
+    def test_failed_job_and_unknown_ids(self):
+        """Test that errors are recorded and bad job IDs are rejected."""
+        def run(on_progress):
+            raise RuntimeError("provider down")
+
+        job = self.jobs.submit('transcript:2:200', run)
+        finished = self.wait(job['job_id'])
+        self.assertEqual((finished['status'], finished['error']), ('failed', 'provider down'))
+        self.assertIsNone(self.jobs.get('../../etc/passwd'))
+        self.assertIsNone(self.jobs.get('0' * 32))
+
+    def test_duplicates_are_shared_across_processes(self):
+        """Test that a second runner on the same directory (another worker process) reuses the job."""
+        release = threading.Event()
+
+        def run(on_progress):
+            release.wait(2)
+            return {'summary': 'done'}
+
+        job = self.jobs.submit('transcript:3:200', run)
+        other_process = SummaryJobs(jobs_dir=self.temp_dir.name)
+        self.assertEqual(other_process.submit('transcript:3:200', run)['job_id'], job['job_id'])
+        release.set()
+        self.wait(job['job_id'])
+
+        again = other_process.submit('transcript:3:200', lambda on_progress: {'summary': 'again'})
+        self.assertNotEqual(again['job_id'], job['job_id'])
+        other_process._pool.shutdown(wait=True)
+
+    def test_jobs_without_heartbeat_fail(self):
+        """Test that a job left behind by a recycled worker is failed instead of polled forever."""
+        release = threading.Event()
+        job = self.jobs.submit('transcript:4:200', lambda on_progress: release.wait(2) and {'summary': 'late'})
+        self.assertIn(self.jobs.get(job['job_id'])['status'], ('pending', 'processing'))
+
+        # Another process sees the job's heartbeat age past stale_after
+        other_process = SummaryJobs(jobs_dir=self.temp_dir.name, stale_after=0)
+        time.sleep(0.01)
+        abandoned = other_process.get(job['job_id'])
+        self.assertEqual(abandoned['status'], 'failed')
+        self.assertIn('stopped responding', abandoned['error'])
+
+        replacement = other_process.submit('transcript:4:200', lambda on_progress: {'summary': 'new'})
+        self.assertNotEqual(replacement['job_id'], job['job_id'])
+        release.set()
+        self.jobs._pool.shutdown(wait=True)
+        other_process._pool.shutdown(wait=True)
+
+    def test_heartbeats_keep_queued_jobs_alive(self):
+        """Test that jobs held by a live process keep a fresh heartbeat."""
+        jobs = SummaryJobs(jobs_dir=self.temp_dir.name, heartbeat_interval=0.02)
+        release = threading.Event()
+        job = jobs.submit('transcript:5:200', lambda on_progress: release.wait(2) and {'summary': 'ok'})
+        first = jobs.get(job['job_id'])['heartbeat_at']
+        time.sleep(0.1)
+        self.assertGreater(jobs.get(job['job_id'])['heartbeat_at'], first)
+        heartbeat = jobs._heartbeat
+        release.set()
+        jobs._pool.shutdown(wait=True)
+        heartbeat.join(1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# tests/test_tag_bulk.py
+
+import unittest
+import os
+import sys
+import sqlite3
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components import Tag as tag_module
+from components.Tag import bulk_add_tags, forget_tag_ids, normalize_tag_name, resolve_tag_ids
+
+class CountingCursor:
+    """Runs MySQL-style statements on SQLite and counts round-trips."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.cursor = connection.db.cursor()
+        self.rowcount = 0
+
+    def execute(self, query, params=()):
+        self.connection.statements.append(' '.join(query.split()))
+        params = list(params)
+        if query.startswith('INSERT IGNORE'):
+            # Like MySQL, skip rows that break any constraint (including foreign keys)
+            head, rows = query.split(' VALUES ', 1)
+            width = rows.split('),')[0].count('%s')
+            self.rowcount = 0
+            for start in range(0, len(params), width):
+                try:
+                    self.cursor.execute(f"{head.replace('IGNORE ', '')} VALUES ({', '.join('?' * width)})",
+                                        params[start:start + width])
+                    self.rowcount += 1
+                except sqlite3.IntegrityError:
+                    pass
+            return
+        self.cursor.execute(query.replace('%s', '?'), params)
+        self.rowcount = self.cursor.rowcount
+
+    def fetchall(self):
+        return self.cursor.fetchall()
+
+    def fetchone(self):
+        return self.cursor.fetchone()
+
+    def close(self):
+        self.cursor.close()
+
+class CountingConnection:
+    """Minimal connection with the tags and space_tags tables."""
+
+    def __init__(self):
+        self.db = sqlite3.connect(':memory:')
+        self.db.execute("PRAGMA foreign_keys = ON")
+        self.db.execute("CREATE TABLE tags (id INTEGER PRIMARY KEY, name TEXT UNIQUE COLLATE NOCASE)")
+        self.db.execute("""
+            CREATE TABLE space_tags (
+                id INTEGER PRIMARY KEY, space_id TEXT, tag_id INTEGER REFERENCES tags(id),
+                user_id INTEGER DEFAULT 0, UNIQUE (space_id, tag_id, user_id)
+            )
+        """)
+        self.statements = []
+
+    def cursor(self):
+        return CountingCursor(self)
+
+    def commit(self):
+        self.db.commit()
+
+class TestTagBulk(unittest.TestCase):
+    """Test case for bulk tag resolution and linking."""
+
+    def setUp(self):
+        """Start each test with an empty database and tag id cache."""
+        forget_tag_ids()
+        self.connection = CountingConnection()
+
+    def test_normalize_tag_name(self):
+        """Test that names are lowercased, whitespace collapsed and length capped."""
+        self.assertEqual(normalize_tag_name('  Machine   Learning '), 'machine learning')
+        self.assertEqual(normalize_tag_name('   '), '')
+        self.assertEqual(len(normalize_tag_name('x' * 300)), tag_module.MAX_TAG_NAME_LENGTH)
+
+    def test_resolve_uses_two_statements_then_cache(self):
+        """Test that unknown names cost one insert and one select, cached names nothing."""
+        ids = resolve_tag_ids(self.connection, ['Bitcoin', 'bitcoin', 'ETF', ' '])
+        self.assertEqual(sorted(ids), ['bitcoin', 'etf'])
+        self.assertEqual(len(self.connection.statements), 2)
+
+        self.assertEqual(resolve_tag_ids(self.connection, ['ETF', 'Bitcoin']), ids)
+        self.assertEqual(len(self.connection.statements), 2)
+
+    def test_bulk_add_skips_existing_links(self):
+        """Test that one call links every new tag and reports only those."""
+        added = bulk_add_tags(self.connection, 'space_a', ['Bitcoin', 'ETF', 'bitcoin'])
+        self.assertEqual([(original, name) for original, name, _ in added],
+                         [('Bitcoin', 'bitcoin'), ('ETF', 'etf')])
+        self.assertEqual(len(self.connection.statements), 4)
+
+        self.connection.statements = []
+        added = bulk_add_tags(self.connection, 'space_a', ['etf', 'SEC'])
+        self.assertEqual([name for _, name, _ in added], ['sec'])
+        count = self.connection.db.execute("SELECT COUNT(*) FROM space_tags").fetchone()[0]
+        self.assertEqual(count, 3)
+        self.assertEqual(len(self.connection.statements), 4)
+
+    def test_stale_cached_ids_are_refreshed(self):
+        """Test that a tag deleted behind the cache's back is recreated and linked."""
+        resolve_tag_ids(self.connection, ['bitcoin', 'etf'])
+        self.connection.db.execute("DELETE FROM tags WHERE name = 'bitcoin'")
+
+        added = bulk_add_tags(self.connection, 'space_b', ['Bitcoin', 'ETF'])
+        self.assertEqual(sorted(name for _, name, _ in added), ['bitcoin', 'etf'])
+        linked = self.connection.db.execute(
+            "SELECT t.name FROM space_tags st JOIN tags t ON t.id = st.tag_id ORDER BY t.name"
+        ).fetchall()
+        self.assertEqual([row[0] for row in linked], ['bitcoin', 'etf'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# tests/test_tag_extractor.py
+
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import time
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.TagExtractor import TagExtractor, plan_chunks, score_tags
+from components.TranscriptCache import TranscriptCache
+
+def transcript(chars):
+    words = []
+    length = 0
+    index = 0
+    while length < chars:
+        word = f"word{index}"
+        words.append(word)
+        length += len(word) + 1
+        index += 1
+    return ' '.join(words)
+
+class FakeProvider:
+    """Stands in for AI.generate_text, recording calls and concurrency."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.prompts = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def generate_text(self, prompt, max_tokens=150):
+        with self.lock:
+            self.prompts.append(prompt)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        if prompt.startswith('From these candidate tags'):
+            return {'success': True, 'text': 'OpenAI, Dhaka, machine learning'}
+        return {'success': True, 'text': 'OpenAI, "Dhaka", machine learning, people, 2024, Elon Musk'}
+
+class TestTagExtractor(unittest.TestCase):
+    """Test case for the TagExtractor component."""
+
+    def setUp(self):
+        """Create a temporary cache directory."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_plan_chunks_samples_long_transcripts(self):
+        """Test that chunks cover short transcripts and are sampled evenly for long ones."""
+        text = transcript(30000)
+        chunks = plan_chunks(text, 12000, 8)
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(' '.join(chunks), text)
+
+        long_text = transcript(200000)
+        sampled = plan_chunks(long_text, 12000, 8)
+        self.assertEqual(len(sampled), 8)
+        positions = [long_text.index(chunk) for chunk in sampled]
+        self.assertEqual(positions, sorted(positions))
+        self.assertGreater(positions[-1], len(long_text) * 0.8)
+
+    def test_score_tags(self):
+        """Test that generic words and numbers are dropped and case variants merged."""
+        scored = score_tags(['openai', 'OpenAI', 'OpenAI', 'people', '2024', 'x', 'machine learning'])
+        tags = [tag for tag, _ in scored]
+        self.assertEqual(tags, ['OpenAI', 'machine learning'])
+
+    def test_map_reduce_runs_concurrently(self):
+        """Test that map calls overlap and a single reduce call picks the tags."""
+        provider = FakeProvider(delay=0.05)
+        extractor = TagExtractor(provider.generate_text, chunk_tokens=3000, max_chunks=8,
+                                 max_workers=4, requests_per_minute=6000)
+        responses = []
+        tags = extractor.extract(transcript(100000), max_tags=3,
+                                 on_response=lambda prompt, reply: responses.append(reply))
+
+        self.assertEqual(tags, ['OpenAI', 'Dhaka', 'machine learning'])
+        self.assertEqual(len(provider.prompts), 9)
+        self.assertEqual(len(responses), 9)
+        self.assertGreater(provider.peak, 1)
+
+    def test_chunk_outputs_are_cached(self):
+        """Test that re-tagging the same transcript only repeats the reduce call."""
+        cache = TranscriptCache(cache_dir=os.path.join(self.temp_dir, 'tags'))
+        provider = FakeProvider()
+        extractor = TagExtractor(provider.generate_text, model='test', cache=cache, requests_per_minute=6000)
+        text = transcript(50000)
+
+        first = extractor.extract(text, max_tags=3)
+        calls = len(provider.prompts)
+        second = extractor.extract(text, max_tags=3)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(provider.prompts), calls + 1)
+
+    def test_all_failures_return_none(self):
+        """Test that None is returned when the provider never answers."""
+        extractor = TagExtractor(lambda prompt, max_tokens: {'success': False, 'error': 'down'},
+                                 requests_per_minute=6000)
+        self.assertIsNone(extractor.extract(transcript(5000), max_tags=3))
+        self.assertEqual(extractor.extract('   ', max_tags=3), [])
+
+    def test_rate_limit_spans_calls(self):
+        """Test that one rate limit covers every extract() call of an extractor."""
+        provider = FakeProvider()
+        extractor = TagExtractor(provider.generate_text, max_workers=2, requests_per_minute=60)
+        extractor.extract(transcript(100), max_tags=5)
+        extractor.extract(transcript(200), max_tags=5)
+        # Two map calls used the whole burst; a third must wait for a refill
+        self.assertEqual(len(provider.prompts), 2)
+        self.assertFalse(extractor.rate_limiter.try_acquire())
+
+if __name__ == '__main__':
+    unittest.main()
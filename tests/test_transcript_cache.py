@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# tests/test_transcript_cache.py
+
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.TranscriptCache import TranscriptCache
+
+class TestTranscriptCache(unittest.TestCase):
+    """Test case for the TranscriptCache component."""
+
+    def setUp(self):
+        """Create a cache directory and two copies of the same audio."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = TranscriptCache(cache_dir=os.path.join(self.temp_dir, 'cache'))
+        self.audio = os.path.join(self.temp_dir, 'space_a.mp3')
+        self.copy = os.path.join(self.temp_dir, 'space_b.mp3')
+        for path in (self.audio, self.copy):
+            with open(path, 'wb') as f:
+                f.write(b'ID3' + bytes(range(256)) * 100)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_keys_follow_content_and_settings(self):
+        """Test that identical audio shares a key and settings change it."""
+        key = self.cache.make_key(self.audio, 'openai', 'gpt-4o-mini-transcribe', 'en', {'task': 'transcribe'})
+        self.assertEqual(key, self.cache.make_key(self.copy, 'openai', 'gpt-4o-mini-transcribe', 'en',
+                                                  {'task': 'transcribe'}))
+        self.assertNotEqual(key, self.cache.make_key(self.audio, 'openai', 'gpt-4o-mini-transcribe', 'de',
+                                                     {'task': 'transcribe'}))
+        self.assertNotEqual(key, self.cache.make_key(self.audio, 'local', 'base', 'en', {'task': 'transcribe'}))
+
+        with open(self.copy, 'ab') as f:
+            f.write(b'\x00')
+        self.assertNotEqual(key, self.cache.make_key(self.copy, 'openai', 'gpt-4o-mini-transcribe', 'en',
+                                                     {'task': 'transcribe'}))
+
+    def test_round_trip_keeps_slim_segments(self):
+        """Test storing a result and reading back compact segments."""
+        key = self.cache.make_key(self.audio, 'local', 'base', None)
+        self.assertIsNone(self.cache.get(key))
+
+        self.cache.put(key, {
+            'text': 'Hello there. General Kenobi.',
+            'language': 'en',
+            'duration': 12.5,
+            'segments': [{'id': 0, 'start': 0.0, 'end': 2.0, 'text': 'Hello there.', 'tokens': [1, 2, 3]},
+                         {'id': 1, 'start': 2.0, 'end': 4.5, 'text': 'General Kenobi.', 'tokens': [4]}]
+        })
+
+        cached = self.cache.get(key)
+        self.assertEqual(cached['text'], 'Hello there. General Kenobi.')
+        self.assertEqual(cached['segments'][1], {'start': 2.0, 'end': 4.5, 'text': 'General Kenobi.'})
+        self.assertEqual(self.cache.get_stats()['entries'], 1)
+
+    def test_prune_drops_least_recently_used(self):
+        """Test the size limit."""
+        self.cache.max_bytes = 1
+        keys = [self.cache.make_key(self.audio, 'local', model, None) for model in ('tiny', 'base')]
+        for key in keys:
+            self.cache.put(key, {'text': 'x' * 100, 'segments': []})
+        self.assertIsNone(self.cache.get(keys[0]))
+        self.assertEqual(self.cache.get_stats()['entries'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# tests/test_transcript_corrector.py
+
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import time
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.TranscriptCorrector import TranscriptCorrector, split_transcript
+from components.TranscriptCache import TranscriptCache
+
+def timecoded(lines):
+    return '\n'.join(f"[00:{index // 60:02d}:{index % 60:02d}] line {index} teh text" for index in range(lines))
+
+def body_of(message):
+    """Extract the chunk to correct from a user message."""
+    body = message.split('Please correct this transcript:\n\n', 1)[1]
+    return body.split('\n\nContext after (do not return):', 1)[0]
+
+class TestTranscriptCorrector(unittest.TestCase):
+    """Test case for the TranscriptCorrector component."""
+
+    def setUp(self):
+        """Create a temporary cache directory."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_split_keeps_lines_whole(self):
+        """Test that timecoded transcripts split on line boundaries."""
+        text = timecoded(200)
+        chunks, separator = split_transcript(text, 1000)
+        self.assertEqual(separator, '\n')
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(separator.join(chunk)) <= 1000 for chunk in chunks))
+        self.assertEqual('\n'.join(separator.join(chunk) for chunk in chunks), text)
+
+    def test_split_plain_text(self):
+        """Test that plain text splits on sentences and long runs on spaces."""
+        text = ' '.join(f"Sentence number {index} is here." for index in range(100))
+        chunks, separator = split_transcript(text, 600)
+        self.assertEqual(separator, ' ')
+        self.assertEqual(' '.join(' '.join(chunk) for chunk in chunks), text)
+
+        chunks, _ = split_transcript('word ' * 500, 600)
+        self.assertTrue(all(len(' '.join(chunk)) <= 600 for chunk in chunks))
+
+    def test_corrects_long_transcript_concurrently_in_order(self):
+        """Test that every chunk is corrected, in parallel, and stitched in order."""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def complete(system_prompt, message):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+            return body_of(message).replace('teh', 'the')
+
+        text = timecoded(600)
+        corrector = TranscriptCorrector(complete, max_chars=2000, max_workers=4, requests_per_minute=60000)
+        corrected = corrector.correct(text, 'en')
+
+        self.assertEqual(corrected, text.replace('teh', 'the'))
+        self.assertGreater(max(peak), 1)
+
+    def test_invalid_chunks_keep_original(self):
+        """Test that chunks with lost timecodes or failed calls are left as they were."""
+        calls = []
+
+        def complete(system_prompt, message):
+            body = body_of(message)
+            calls.append(body)
+            if len(calls) == 1:
+                return body.replace('[00:00:00] ', '')
+            raise RuntimeError('API down')
+
+        text = timecoded(5)
+        corrector = TranscriptCorrector(complete, max_chars=10000, max_retries=1, requests_per_minute=60000)
+        self.assertEqual(corrector.correct(text), text)
+        self.assertEqual(corrector.correct(text), text)
+        self.assertEqual(len(calls), 2)
+
+    def test_chunks_are_cached(self):
+        """Test that unchanged chunks are not sent again."""
+        calls = []
+
+        def complete(system_prompt, message):
+            calls.append(message)
+            return body_of(message).replace('teh', 'the')
+
+        cache = TranscriptCache(cache_dir=os.path.join(self.temp_dir, 'corrections'))
+        corrector = TranscriptCorrector(complete, max_chars=1000, requests_per_minute=60000, cache=cache)
+        text = timecoded(100)
+        first = corrector.correct(text, 'en')
+        sent = len(calls)
+
+        self.assertEqual(corrector.correct(text, 'en'), first)
+        self.assertEqual(len(calls), sent)
+
+    def test_rate_limit_spans_calls(self):
+        """Test that one rate limit covers every correct() call of a corrector."""
+        corrector = TranscriptCorrector(lambda system, message: body_of(message), max_chars=10000,
+                                        max_workers=2, requests_per_minute=60)
+        text = timecoded(5)
+        corrector.correct(text)
+        corrector.correct(text)
+        # Two requests used the whole burst; a third must wait for a refill
+        self.assertFalse(corrector.rate_limiter.try_acquire())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# tests/test_transcription_queue.py
+
+import unittest
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.TranscriptionQueue import TranscriptionQueue
+
+class TestTranscriptionQueue(unittest.TestCase):
+    """Test case for the TranscriptionQueue component."""
+
+    def setUp(self):
+        """Create a queue database and mirror directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.mirror_dir = Path(self.temp_dir) / 'transcript_jobs'
+        self.queue = TranscriptionQueue(db_path=os.path.join(self.temp_dir, 'queue.db'),
+                                        mirror_dir=self.mirror_dir)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def enqueue(self, job_id, space_id='space', model='base', created_at='2026-01-01T00:00:00'):
+        return self.queue.enqueue({'id': job_id, 'space_id': space_id, 'created_at': created_at,
+                                   'options': {'model': model}, 'status': 'pending'})
+
+    def test_enqueue_writes_mirror(self):
+        """Test that jobs are readable from the queue and the JSON mirror."""
+        self.enqueue('job1', space_id='abc')
+        job = self.queue.get('job1')
+        self.assertEqual(job['job_id'], 'job1')
+        self.assertEqual(job['status'], 'pending')
+        self.assertEqual(self.queue.find_active('abc')['job_id'], 'job1')
+
+        with open(self.mirror_dir / 'job1.json') as f:
+            self.assertEqual(json.load(f)['space_id'], 'abc')
+
+    def test_claim_order_and_model_preference(self):
+        """Test that the oldest job is claimed unless a loaded model has work."""
+        self.enqueue('old', model='small', created_at='2026-01-01T00:00:00')
+        self.enqueue('new', model='base', created_at='2026-01-02T00:00:00')
+
+        job = self.queue.claim('worker-a', prefer_model='base')
+        self.assertEqual(job['job_id'], 'new')
+        self.assertEqual(job['status'], 'processing')
+        self.assertEqual(self.queue.claim('worker-a', prefer_model='base')['job_id'], 'old')
+        self.assertIsNone(self.queue.claim('worker-a'))
+
+    def test_concurrent_claims_are_exclusive(self):
+        """Test that each job goes to exactly one of several workers."""
+        for index in range(20):
+            self.enqueue(f'job{index:02d}', created_at=f'2026-01-01T00:00:{index:02d}')
+
+        claimed = []
+        lock = threading.Lock()
+
+        def worker(name):
+            while True:
+                job = self.queue.claim(name)
+                if job is None:
+                    return
+                with lock:
+                    claimed.append(job['job_id'])
+
+        threads = [threading.Thread(target=worker, args=(f'w{i}',)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(claimed), [f'job{index:02d}' for index in range(20)])
+
+    def test_cancel(self):
+        """Test that cancelling sticks and is visible to the worker."""
+        self.enqueue('job1')
+        self.queue.claim('worker-a')
+        self.assertFalse(self.queue.heartbeat('job1', 'worker-a'))
+
+        self.assertTrue(self.queue.request_cancel('job1'))
+        self.assertTrue(self.queue.heartbeat('job1', 'worker-a'))
+        self.assertFalse(self.queue.update('job1', 'processing', progress=50))
+        self.assertEqual(self.queue.get('job1')['status'], 'cancelled')
+        self.assertFalse(self.queue.request_cancel('job1'))
+
+    def test_requeue_stale(self):
+        """Test that jobs without heartbeats return to the queue, then fail."""
+        self.enqueue('job1')
+        self.queue.claim('worker-a')
+        self.assertEqual(self.queue.requeue_stale(timeout_seconds=60), 0)
+
+        time.sleep(0.05)
+        self.assertEqual(self.queue.requeue_stale(timeout_seconds=0, max_attempts=2), 1)
+        self.assertEqual(self.queue.get('job1')['status'], 'pending')
+
+        self.queue.claim('worker-b')
+        time.sleep(0.05)
+        self.queue.requeue_stale(timeout_seconds=0, max_attempts=2)
+        job = self.queue.get('job1')
+        self.assertEqual(job['status'], 'failed')
+        self.assertIn('worker-b', job['error'])
+
+    def test_requeued_job_ignores_its_old_worker(self):
+        """Test that a worker whose job was requeued can no longer update it."""
+        self.enqueue('job1')
+        self.queue.claim('worker-a')
+        self.assertTrue(self.queue.update('job1', 'processing', progress=40, worker_id='worker-a'))
+        time.sleep(0.05)
+        self.queue.requeue_stale(timeout_seconds=0)
+        self.queue.claim('worker-b')
+
+        self.assertTrue(self.queue.heartbeat('job1', 'worker-a'))
+        self.assertFalse(self.queue.update('job1', 'completed', progress=100, worker_id='worker-a'))
+        self.assertEqual(self.queue.get('job1')['claimed_by'], 'worker-b')
+        self.assertTrue(self.queue.update('job1', 'completed', progress=100, worker_id='worker-b'))
+        self.assertFalse(self.queue.update('job1', 'failed', error='late', worker_id='worker-b'))
+        self.assertEqual(self.queue.get('job1')['status'], 'completed')
+
+    def test_keep_alive(self):
+        """Test that keep_alive() refreshes the heartbeat while its block runs."""
+        self.enqueue('job1')
+        self.queue.claim('worker-a')
+        with self.queue.keep_alive('job1', 'worker-a', interval=0.02):
+            time.sleep(0.2)
+            self.assertEqual(self.queue.requeue_stale(timeout_seconds=0.1), 0)
+        self.assertEqual(self.queue.get('job1')['status'], 'processing')
+
+    def test_archive_finished(self):
+        """Test that finished jobs move out of the live table and directory."""
+        self.enqueue('done')
+        self.enqueue('waiting')
+        self.queue.update('done', 'completed', progress=100, result={'transcript_id': 7})
+
+        time.sleep(0.05)
+        self.assertEqual(self.queue.archive_finished(older_than_seconds=0), 1)
+        self.assertEqual(self.queue.counts(), {'pending': 1})
+        self.assertEqual(self.queue.get('done')['result'], {'transcript_id': 7})
+        self.assertFalse((self.mirror_dir / 'done.json').exists())
+        self.assertTrue((self.mirror_dir / 'archive' / 'done.json').exists())
+
+    def test_clear(self):
+        """Test that clearing removes live and archived jobs and their mirrors."""
+        self.enqueue('done')
+        self.enqueue('waiting')
+        self.queue.update('done', 'completed', progress=100)
+        time.sleep(0.05)
+        self.queue.archive_finished(older_than_seconds=0)
+
+        self.assertEqual(self.queue.clear(), 1)
+        self.assertEqual(self.queue.counts(), {})
+        self.assertIsNone(self.queue.get('done'))
+        self.assertEqual(list(self.mirror_dir.rglob('*.json')), [])
+
+    def test_import_job_files(self):
+        """Test that existing job files are imported once, skipping video jobs."""
+        legacy_dir = Path(self.temp_dir) / 'legacy'
+        legacy_dir.mkdir()
+        jobs = {
+            'a.json': {'id': 'a', 'space_id': 's1', 'status': 'pending'},
+            'b.json': {'job_id': 'b', 'space_id': 's2', 'status': 'processing'},
+            'c.json': {'job_id': 'c', 'space_id': 's3', 'status': 'completed', 'result': {'x': 1}},
+            'a_video.json': {'job_id': 'a_video', 'space_id': 's1', 'status': 'pending'}
+        }
+        for name, data in jobs.items():
+            with open(legacy_dir / name, 'w') as f:
+                json.dump(data, f)
+
+        self.assertEqual(self.queue.import_job_files(legacy_dir), 3)
+        self.assertEqual(self.queue.import_job_files(legacy_dir), 0)
+        self.assertEqual(self.queue.get('b')['status'], 'pending')
+        self.assertEqual(self.queue.get('c')['result'], {'x': 1})
+        self.assertIsNone(self.queue.get('a_video'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# tests/test_translation_executor.py
+
+import unittest
+import os
+import sys
+import threading
+import time
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.TranslationExecutor import (TranslationExecutor, align_timecoded_lines, merge_usage,
+                                            split_sentence_chunks, translate_timecoded)
+
+class TestTranslationExecutor(unittest.TestCase):
+    """Test case for concurrent, order-preserving chunk translation."""
+
+    def test_run_is_concurrent_and_ordered(self):
+        """Test that chunks run in parallel and come back in input order."""
+        executor = TranslationExecutor(max_workers=4, requests_per_minute=6000)
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+
+        def translate(index, item):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            # Earlier chunks finish last
+            time.sleep(0.05 * (4 - index))
+            with lock:
+                state['active'] -= 1
+            return True, {'content': item.upper(), 'usage': {'input_tokens': 1, 'output_tokens': 2, 'total_tokens': 3}}
+
+        start = time.time()
+        results = executor.run(['a', 'b', 'c', 'd'], translate)
+        elapsed = time.time() - start
+
+        self.assertEqual([result['content'] for _, result in results], ['A', 'B', 'C', 'D'])
+        self.assertEqual(state['peak'], 4)
+        self.assertLess(elapsed, 0.35)
+        self.assertEqual(merge_usage([result for _, result in results])['total_tokens'], 12)
+
+    def test_failed_chunks_are_retried_individually(self):
+        """Test that only the failing chunk is retried and oversized requests are not."""
+        executor = TranslationExecutor(max_workers=3, requests_per_minute=6000, max_retries=2)
+        calls = []
+        lock = threading.Lock()
+
+        def translate(index, item):
+            with lock:
+                calls.append(item)
+                first_call = calls.count(item) == 1
+            if item == 'flaky' and first_call:
+                return False, {'error': 'OpenAI API error: 500'}
+            if item == 'huge':
+                return False, {'error': 'too long', 'should_chunk': True}
+            return True, item
+
+        results = executor.run(['ok', 'flaky', 'huge'], translate)
+        self.assertEqual(results[0], (True, 'ok'))
+        self.assertEqual(results[1], (True, 'flaky'))
+        self.assertFalse(results[2][0])
+        self.assertEqual(sorted(calls), ['flaky', 'flaky', 'huge', 'ok'])
+
+    def test_token_budget_larger_than_bucket_does_not_block(self):
+        """Test that a chunk estimated above the whole budget still runs."""
+        executor = TranslationExecutor(max_workers=1, requests_per_minute=6000, tokens_per_minute=100)
+        results = executor.run(['x'], lambda index, item: (True, item), estimate_tokens=lambda item: 10000)
+        self.assertEqual(results, [(True, 'x')])
+
+    def test_split_sentence_chunks(self):
+        """Test that chunks hold whole sentences up to the word limit."""
+        content = "One two three. Four five six. Seven eight nine.\nTen eleven"
+        self.assertEqual(split_sentence_chunks(content, 6),
+                         ["One two three. Four five six", "Seven eight nine. Ten eleven"])
+
+    def test_align_timecoded_lines(self):
+        """Test that replies must keep every timecode in order."""
+        source = ["[00:00:01] Hello", "no timecode", "[00:00:05] Bye"]
+        self.assertEqual(align_timecoded_lines(source, "[00:00:01] Hola\nsin código\n[00:00:05] **x** Adiós"),
+                         ["[00:00:01] Hola", "sin código", "[00:00:05] Adiós"])
+        self.assertIsNone(align_timecoded_lines(source, "[00:00:01] Hola sin código\n[00:00:05] Adiós"))
+        self.assertIsNone(align_timecoded_lines(source, "[00:00:01] Hola\nsin código\n[00:00:06] Adiós"))
+
+    def test_translate_timecoded_falls_back_line_by_line(self):
+        """Test that a misaligned batch is redone per line and timecodes survive."""
+        executor = TranslationExecutor(max_workers=4, requests_per_minute=6000, max_retries=1)
+        content = "\n".join(["[00:00:01] one", "[00:00:02]", "[00:00:03] two", "[00:00:04] three",
+                             "[00:00:05] four"])
+        batches = []
+
+        def translate_batch(lines):
+            batches.append(lines)
+            if any('three' in line for line in lines):
+                # Drops a line, so the batch cannot be aligned
+                return True, "\n".join(line.upper() for line in lines[:-1])
+            return True, {'content': "\n".join(line.upper() for line in lines),
+                          'usage': {'input_tokens': 5, 'output_tokens': 5, 'total_tokens': 10}}
+
+        def translate_line(text):
+            if text == 'four':
+                return False, {'error': 'failed'}
+            return True, text.upper()
+
+        translated, responses, failed = translate_timecoded(executor, content, translate_batch, translate_line,
+                                                            recover_line=lambda text: (True, f"strict {text}"),
+                                                            batch_chars=40, batch_lines=2)
+
+        self.assertEqual(translated.split("\n"), ["[00:00:01] ONE", "[00:00:02]", "[00:00:03] TWO",
+                                                  "[00:00:04] THREE", "[00:00:05] strict four"])
+        self.assertEqual(batches, [["[00:00:01] one", "[00:00:03] two"], ["[00:00:04] three", "[00:00:05] four"]])
+        self.assertEqual(merge_usage(responses)['total_tokens'], 10)
+        self.assertEqual(failed, [])
+
+        # Without a recovery step the line keeps its source text and is reported
+        translated, _, failed = translate_timecoded(executor, content, translate_batch, translate_line,
+                                                    batch_chars=40, batch_lines=2)
+        self.assertEqual(translated.split("\n")[-1], "[00:00:05] four")
+        self.assertEqual(failed, [4])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# tests/test_translation_memory.py
+
+import unittest
+import os
+import sys
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.TranslationMemory import TranslationMemory, join_segments, split_segments
+
+def long_line(first_sentence):
+    sentences = [first_sentence] + [f"Sentence number {index} talks about topic {index * 7} at length." for index in range(1, 80)]
+    return ' '.join(sentences)
+
+class FakeProvider:
+    """Uppercases every "[HH:MM:SS] text" line it is asked to translate."""
+
+    def __init__(self):
+        self.requests = []
+
+    def translate(self, from_lang, to_lang, content):
+        self.requests.append(content)
+        lines = []
+        for line in content.split('\n'):
+            timecode, text = line.split(' ', 1)
+            lines.append(f"{timecode} {text.upper()}")
+        return True, {'content': '\n'.join(lines), 'usage': {'input_tokens': 10, 'output_tokens': 10, 'total_tokens': 20}}
+
+class TestTranslationMemory(unittest.TestCase):
+    """Test case for the segment-level translation memory."""
+
+    def setUp(self):
+        """Create an in-memory translation memory."""
+        self.memory = TranslationMemory(':memory:')
+
+    def test_split_and_join_round_trip(self):
+        """Test that segments rebuild the original text exactly."""
+        text = "[00:00:01] Hello there\n\n[00:01:02]  Second line\nplain line\n" + long_line("Start here.")
+        segments = split_segments(text)
+        self.assertEqual(join_segments(segments, [segment.body for segment in segments]), text)
+        self.assertEqual(segments[0].prefix, "[00:00:01] ")
+        self.assertEqual(segments[0].body, "Hello there")
+        self.assertGreater(len(segments), 5)
+
+    def test_edit_keeps_later_segments(self):
+        """Test that editing the start of a long line leaves later segments unchanged."""
+        before = [segment.body for segment in split_segments(long_line("Teh first sentence."))]
+        after = [segment.body for segment in split_segments(long_line("The first sentence, corrected."))]
+        self.assertGreater(len(before), 3)
+        self.assertEqual(before[1:], after[1:])
+
+    def test_put_get_and_hit_rate(self):
+        """Test that stored segments are found, compressed and counted."""
+        key = self.memory.make_key("Hello   world", 'en', 'es', 'openai/gpt-4o-mini')
+        self.assertEqual(key, self.memory.make_key(" Hello world ", 'EN', 'es', 'openai/gpt-4o-mini'))
+        self.assertNotEqual(key, self.memory.make_key("Hello world", 'en', 'fr', 'openai/gpt-4o-mini'))
+
+        other = self.memory.make_key("Goodbye", 'en', 'es', 'openai/gpt-4o-mini')
+        translation = "Hola mundo. " * 50
+        self.memory.put_many([(key, translation)])
+        self.assertEqual(self.memory.get_many([key, other]), {key: translation})
+
+        stats = self.memory.get_stats()
+        self.assertEqual(stats['entries'], 1)
+        self.assertLess(stats['stored_bytes'], len(translation))
+        self.assertEqual((stats['hits'], stats['misses'], stats['hit_rate']), (1, 1, 0.5))
+
+    def test_translate_sends_only_missing_segments(self):
+        """Test that a re-translation after an edit only sends the changed segment."""
+        from components.Translate import Translate
+
+        translator = Translate.__new__(Translate)
+        translator.memory = self.memory
+        provider = FakeProvider()
+        text = "[00:00:01] first line\n[00:00:05] second line\n[00:00:09] first line"
+
+        success, result, sent = translator._translate_with_memory(provider.translate, 'fake/model', 'en', 'es', text)
+        self.assertTrue(success)
+        self.assertEqual(result['content'], "[00:00:01] FIRST LINE\n[00:00:05] SECOND LINE\n[00:00:09] FIRST LINE")
+        self.assertEqual(sent, "[00:00:00] first line\n[00:00:01] second line")
+
+        edited = text.replace("second line", "second line, corrected")
+        success, result, sent = translator._translate_with_memory(provider.translate, 'fake/model', 'en', 'es', edited)
+        self.assertEqual(result['content'], "[00:00:01] FIRST LINE\n[00:00:05] SECOND LINE, CORRECTED\n[00:00:09] FIRST LINE")
+        self.assertEqual(sent, "[00:00:00] second line, corrected")
+
+        success, result, sent = translator._translate_with_memory(provider.translate, 'fake/model', 'en', 'es', edited)
+        self.assertEqual(sent, '')
+        self.assertEqual(len(provider.requests), 2)
+
+    def test_untranslated_segments_are_not_stored(self):
+        """Test that failed or unchanged lines are used once but never stored, and plain text skips the memory."""
+        from components.Translate import Translate
+
+        translator = Translate.__new__(Translate)
+        translator.memory = self.memory
+        requests = []
+
+        def translate(from_lang, to_lang, content):
+            requests.append(content)
+            lines = content.split('\n')
+            if len(lines) == 1 and not lines[0].startswith('['):
+                return True, content.upper()
+            # The second line failed and kept its text; the third came back unchanged
+            out = [lines[0].upper(), lines[1], lines[2]]
+            return True, {'content': '\n'.join(out), 'failed_lines': [1]}
+
+        text = "[00:00:01] good line\n[00:00:05] failed line\n[00:00:09] Bitcoin"
+        success, result, _ = translator._translate_with_memory(translate, 'fake/model', 'en', 'es', text)
+        self.assertTrue(success)
+        self.assertEqual(result, "[00:00:01] GOOD LINE\n[00:00:05] failed line\n[00:00:09] Bitcoin")
+        self.assertEqual(self.memory.get_stats()['entries'], 1)
+
+        success, result, sent = translator._translate_with_memory(translate, 'fake/model', 'en', 'es', "plain words")
+        self.assertEqual((result, sent), ("PLAIN WORDS", "plain words"))
+        self.assertEqual(self.memory.get_stats()['entries'], 1)
+
+    def test_claude_fallback_returns_text_and_records_usage(self):
+        """Test that a timecoded translation to a complex-script language returns text, not a usage dict."""
+        from unittest import mock
+        from components.Translate import Translate
+
+        class FakeAI:
+            provider = mock.Mock(model='gpt-4o-mini')
+
+            def __init__(self):
+                self.translate = FakeProvider().translate
+
+            def get_provider_name(self):
+                return 'OpenAI'
+
+        claude = FakeProvider()
+        claude.model = 'claude-3-haiku'
+        tracked = []
+        translator = Translate.__new__(Translate)
+        translator.memory = self.memory
+        translator.ai = FakeAI()
+        translator.ai_cost = mock.Mock()
+        translator.ai_cost.track_cost.side_effect = lambda **charge: tracked.append(charge) or (True, "ok", 1.0)
+
+        text = "[00:00:01] first line\n[00:00:05] second line"
+        with mock.patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}), \
+                mock.patch('components.AI.get_shared_provider', return_value=claude), \
+                mock.patch('components.AIGateway.ai_gateway.is_available', return_value=True):
+            success, result = translator.translate(text, 'en', 'bn', space_id='space1', user_id=7,
+                                                   idempotency_key='translation-job:1')
+
+        self.assertTrue(success)
+        self.assertEqual(result, "[00:00:01] FIRST LINE\n[00:00:05] SECOND LINE")
+        self.assertEqual(result[:10], "[00:00:01]")
+        self.assertEqual([(charge['vendor'], charge['input_tokens'], charge['idempotency_key']) for charge in tracked],
+                         [('openai', 10, 'translation-job:1'), ('claude', 10, 'translation-job:1:claude')])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# tests/test_translation_queue.py
+
+import unittest
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.TranslationQueue import PRIORITY_NORMAL, PRIORITY_PAID, TranslationQueue
+from components.TranslationWorkerPool import TranslationWorkerPool
+
+class TestTranslationQueue(unittest.TestCase):
+    """Test case for the translation job table and worker pool."""
+
+    def setUp(self):
+        """Create a queue in a temporary database file shared by threads."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.queue = TranslationQueue(os.path.join(self.temp_dir.name, 'queue.db'))
+
+    def test_identical_requests_share_the_job_in_flight(self):
+        """Test that a second request for the same space and language returns the first job."""
+        job, created = self.queue.enqueue('space1', 1, 'en', 'es-ES', 'hello', provider='openai')
+        duplicate, duplicate_created = self.queue.enqueue('space1', 2, 'en', 'es-ES', 'hello')
+        self.assertTrue(created)
+        self.assertFalse(duplicate_created)
+        self.assertEqual(duplicate['id'], job['id'])
+
+        other, other_created = self.queue.enqueue('space1', 1, 'en', 'fr-FR', 'hello')
+        self.assertTrue(other_created)
+
+        # Once finished, the same translation can be queued again
+        claimed = self.queue.claim('w')
+        self.queue.complete(claimed['id'], claimed['claim_token'])
+        again, again_created = self.queue.enqueue('space1', 1, 'en', 'es-ES', 'hello')
+        self.assertTrue(again_created)
+        self.assertNotEqual(again['id'], job['id'])
+
+    def test_claim_order_and_provider_filter(self):
+        """Test that paid jobs go first and providers at their cap are skipped."""
+        self.queue.enqueue('a', 1, 'en', 'es', 'text', priority=PRIORITY_NORMAL, provider='openai')
+        time.sleep(0.01)
+        self.queue.enqueue('b', 2, 'en', 'es', 'text', priority=PRIORITY_PAID, provider='openai')
+        time.sleep(0.01)
+        self.queue.enqueue('c', 3, 'en', 'es', 'text', priority=PRIORITY_NORMAL, provider='claude')
+
+        first = self.queue.claim('w1')
+        self.assertEqual((first['space_id'], first['status'], first['transcript_text']), ('b', 'in_progress', 'text'))
+        self.assertEqual(self.queue.claim('w1', exclude_providers=['openai'])['space_id'], 'c')
+        self.assertIsNone(self.queue.claim('w1', exclude_providers=['openai']))
+        self.assertEqual(self.queue.claim('w1')['space_id'], 'a')
+        self.assertIsNone(self.queue.claim('w1'))
+
+    def test_concurrent_claims_never_share_a_job(self):
+        """Test that threads claiming at the same time each get different jobs."""
+        for index in range(40):
+            self.queue.enqueue(f"space{index}", 1, 'en', 'es', 'text')
+        claimed = []
+        lock = threading.Lock()
+
+        def worker(name):
+            while True:
+                job = self.queue.claim(name)
+                if job is None:
+                    return
+                with lock:
+                    claimed.append(job['id'])
+
+        threads = [threading.Thread(target=worker, args=(f"w{index}",)) for index in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(claimed), 40)
+        self.assertEqual(len(set(claimed)), 40)
+
+    def test_stale_jobs_are_requeued(self):
+        """Test that a job whose worker stopped is put back in the queue."""
+        job, _ = self.queue.enqueue('space1', 1, 'en', 'es', 'text')
+        self.queue.claim('dead-worker')
+        self.assertEqual(self.queue.requeue_stale(stale_after=60), 0)
+        self.assertEqual(self.queue.requeue_stale(stale_after=-1), 1)
+        self.assertEqual(self.queue.get(job['id'])['status'], 'pending')
+        self.assertEqual(self.queue.claim('w')['attempts'], 2)
+
+    def test_requeued_job_ignores_its_old_claim(self):
+        """Test that a claim whose job was requeued can neither heartbeat nor finish it."""
+        job, _ = self.queue.enqueue('space1', 1, 'en', 'es', 'text')
+        # Both claims come from the same process, so they share the worker name
+        old = self.queue.claim('host:1')
+        self.assertTrue(self.queue.heartbeat(job['id'], old['claim_token'], progress=50))
+        self.queue.requeue_stale(stale_after=-1)
+        new = self.queue.claim('host:1')
+        self.assertNotEqual(new['claim_token'], old['claim_token'])
+
+        self.assertFalse(self.queue.heartbeat(job['id'], old['claim_token']))
+        self.assertFalse(self.queue.complete(job['id'], old['claim_token'], {'language': 'es'}))
+        self.assertFalse(self.queue.fail(job['id'], old['claim_token'], 'late error'))
+        self.assertEqual(self.queue.get(job['id'])['status'], 'in_progress')
+
+        self.assertTrue(self.queue.complete(job['id'], new['claim_token']))
+        self.assertFalse(self.queue.complete(job['id'], new['claim_token']))
+        self.assertEqual(self.queue.get(job['id'])['status'], 'completed')
+
+    def test_claim_token_column_is_added_to_old_tables(self):
+        """Test that a database created before claim tokens gets the column."""
+        db_path = os.path.join(self.temp_dir.name, 'old.db')
+        connection = sqlite3.connect(db_path)
+        connection.execute("CREATE TABLE jobs (id TEXT PRIMARY KEY, space_id TEXT NOT NULL, user_id INTEGER, "
+                           "source_lang TEXT NOT NULL, target_lang TEXT NOT NULL, provider TEXT NOT NULL DEFAULT '', "
+                           "priority INTEGER NOT NULL DEFAULT 3, status TEXT NOT NULL, "
+                           "progress INTEGER NOT NULL DEFAULT 0, attempts INTEGER NOT NULL DEFAULT 0, worker TEXT, "
+                           "transcript_text TEXT NOT NULL, result TEXT, error TEXT, created_at REAL NOT NULL, "
+                           "updated_at REAL NOT NULL, heartbeat_at REAL)")
+        connection.commit()
+        connection.close()
+
+        queue = TranslationQueue(db_path)
+        job, _ = queue.enqueue('space1', 1, 'en', 'es', 'text')
+        claimed = queue.claim('w')
+        self.assertTrue(queue.complete(job['id'], claimed['claim_token']))
+
+    def test_pool_runs_jobs_concurrently_under_provider_caps(self):
+        """Test that the pool fills its workers but keeps each provider under its cap."""
+        for index in range(6):
+            self.queue.enqueue(f"open{index}", 1, 'en', 'es', 'text', provider='openai')
+            self.queue.enqueue(f"claude{index}", 1, 'en', 'es', 'text', provider='claude')
+
+        lock = threading.Lock()
+        running = {'openai': 0, 'claude': 0}
+        peaks = {'openai': 0, 'claude': 0, 'total': 0}
+
+        def process(job):
+            with lock:
+                running[job['provider']] += 1
+                peaks[job['provider']] = max(peaks[job['provider']], running[job['provider']])
+                peaks['total'] = max(peaks['total'], sum(running.values()))
+            time.sleep(0.05)
+            with lock:
+                running[job['provider']] -= 1
+            if job['space_id'] == 'claude5':
+                raise RuntimeError("provider error")
+            self.queue.complete(job['id'], job['claim_token'])
+
+        pool = TranslationWorkerPool(self.queue, process, max_workers=5,
+                                     provider_limits={'openai': 3, 'claude': 1}, poll_interval=0.02)
+        thread = threading.Thread(target=pool.run)
+        thread.start()
+        for _ in range(200):
+            if not self.queue.list_jobs():
+                break
+            time.sleep(0.02)
+        pool.stop()
+        thread.join()
+
+        self.assertEqual(peaks['openai'], 3)
+        self.assertEqual(peaks['claude'], 1)
+        self.assertEqual(peaks['total'], 4)
+        stats = self.queue.get_stats()['by_status']
+        self.assertEqual((stats['completed'], stats['failed']), (11, 1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# tests/test_voice_activity.py
+
+import unittest
+import os
+import sys
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.AudioChunker import NUMPY_AVAILABLE
+from components.VoiceActivity import SpeechTimeMap, VoiceActivityDetector
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+class TestVoiceActivity(unittest.TestCase):
+    """Test case for the VoiceActivity component."""
+
+    def test_time_map_round_trip(self):
+        """Test mapping condensed times and segments back to the recording."""
+        time_map = SpeechTimeMap([(10.0, 20.0), (50.0, 55.0), (100.0, 130.0)], original_duration=140.0)
+        self.assertEqual(time_map.speech_seconds, 45.0)
+        self.assertEqual(time_map.removed_seconds, 95.0)
+
+        self.assertEqual(time_map.to_original(0.0), 10.0)
+        self.assertEqual(time_map.to_original(12.5), 52.5)
+        self.assertEqual(time_map.to_original(10.0), 50.0)
+        self.assertEqual(time_map.to_original(10.0, is_end=True), 20.0)
+        self.assertEqual(time_map.to_original(99.0, is_end=True), 130.0)
+
+        segments = time_map.remap_segments([{'start': 9.0, 'end': 15.0, 'text': 'across a join', 'id': 3}])
+        self.assertEqual(segments, [{'start': 19.0, 'end': 55.0, 'text': 'across a join', 'id': 3}])
+
+        words = [{'word': 'across', 'start': 9.0, 'end': 10.0}, {'word': 'join', 'start': 10.0, 'end': 15.0}]
+        segments = time_map.remap_segments([{'start': 9.0, 'end': 15.0, 'text': 'across join', 'words': words}])
+        self.assertEqual(segments[0]['words'], [{'word': 'across', 'start': 19.0, 'end': 20.0},
+                                                {'word': 'join', 'start': 50.0, 'end': 55.0}])
+        self.assertEqual(time_map.remap_words(words), segments[0]['words'])
+        self.assertEqual(words[0]['start'], 9.0)
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "NumPy not installed")
+    def test_classify_and_merge_regions(self):
+        """Test the adaptive threshold, unvoiced frames, padding and merging."""
+        detector = VoiceActivityDetector(frame_ms=30, min_speech_ms=90, min_silence_ms=1000, padding_ms=300)
+        level = np.full(400, -70.0, dtype=np.float32)
+        zcr = np.full(400, 0.05, dtype=np.float32)
+        level[100:150] = -20.0   # speech at 3.0-4.5s
+        level[160:200] = -20.0   # 0.3s pause, merged
+        level[200:205] = -55.0   # quiet fricative kept by its zero-crossing rate
+        zcr[200:205] = 0.4
+        level[300:302] = -20.0   # 60ms click, dropped
+        level[350:399] = -20.0   # speech near the end, padding clamped
+
+        mask = detector.classify_frames(level, zcr)
+        self.assertTrue(mask[202])
+        regions = detector.frames_to_regions(mask, duration=11.995)
+        self.assertEqual(regions, [(2.7, 6.45), (10.2, 11.99)])
+
+        # A recording that is speech throughout is not cut
+        steady = np.random.default_rng(0).normal(-25.0, 3.0, 500).astype(np.float32)
+        self.assertTrue(detector.classify_frames(steady, np.zeros(500, dtype=np.float32)).all())
+
+if __name__ == '__main__':
+    unittest.main()
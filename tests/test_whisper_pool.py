@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# tests/test_whisper_pool.py
+
+import unittest
+import multiprocessing
+import os
+import sys
+import time
+from unittest import mock
+
+# Add parent directory to path to import components
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components.AudioChunker import AudioChunker
+from components.WhisperPool import WhisperPool, default_worker_layout
+
+class FakeModel:
+    """Stands in for a Whisper model; later chunks finish first."""
+
+    def transcribe(self, path, **options):
+        name = os.path.basename(path)
+        if name.startswith('chunk_'):
+            index = int(name[6:10])
+            time.sleep(0.05 * (3 - index % 4))
+        return {'text': name, 'language': options.get('language', 'en'), 'pid': os.getpid(),
+                'segments': [{'start': 0.0, 'end': 1.0, 'text': name}]}
+
+def fake_export(audio_file, start, end, output_path, **kwargs):
+    """Write a placeholder chunk instead of running ffmpeg."""
+    with open(output_path, 'w') as f:
+        f.write(f"{start}-{end}")
+    return True
+
+@unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), "fork start method required")
+class TestWhisperPool(unittest.TestCase):
+    """Test case for the WhisperPool component."""
+
+    def test_default_worker_layout(self):
+        """Test splitting cores between workers and torch threads."""
+        self.assertEqual(default_worker_layout(16), (8, 2))
+        self.assertEqual(default_worker_layout(2), (2, 1))
+        self.assertEqual(default_worker_layout(16, workers=3), (3, 5))
+        self.assertEqual(default_worker_layout(16, threads_per_worker=4), (4, 4))
+
+    def test_workers_inherit_model_and_merge_in_order(self):
+        """Test fork-after-load workers and the ordered streaming merge."""
+        chunks = [{'index': i, 'start_seconds': i * 30.0, 'end_seconds': (i + 1) * 30.0,
+                   'duration_seconds': 30.0} for i in range(8)]
+
+        with mock.patch.object(AudioChunker, 'export_chunk', staticmethod(fake_export)):
+            pool = WhisperPool('base', workers=3, threads_per_worker=1, max_in_flight=4)
+            try:
+                self.assertTrue(pool.start(model=FakeModel()))
+                self.assertEqual(pool.start_method, 'fork')
+
+                results = list(pool.map_chunks('input.mp3', chunks, {'language': 'de'}))
+                whole = pool.transcribe_file('whole.wav', {})
+            finally:
+                pool.close()
+
+        self.assertEqual([chunk['index'] for chunk, _ in results], list(range(8)))
+        self.assertEqual([result['text'] for _, result in results],
+                         [f"chunk_{i:04d}.wav" for i in range(8)])
+        self.assertTrue(all(result['language'] == 'de' for _, result in results))
+        self.assertGreater(len({result['pid'] for _, result in results}), 1)
+        self.assertNotIn(os.getpid(), {result['pid'] for _, result in results})
+        self.assertEqual(whole['text'], 'whole.wav')
+        self.assertFalse(pool.running)
+
+if __name__ == '__main__':
+    unittest.main()
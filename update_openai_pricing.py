@@ -13,6 +13,7 @@ import sys
 import os
 from datetime import datetime
 from components.DatabaseManager import DatabaseManager
+from components.PricingRegistry import pricing_registry
 
 # Setup logging
 def setup_logging():
@@ -189,6 +190,9 @@ def update_pricing_database(pricing_data):
                 logger.error("No models found in pricing data")
                 return False
             
+            # Bump the pricing version so running processes reload their prices
+            pricing_registry.bump_version(cursor)
+            
             # Commit all changes
             connection.commit()
             cursor.close()